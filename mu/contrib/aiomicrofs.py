@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains asyncio versions of the file system operations in
+microfs, so a device running MicroPython can be driven without blocking an
+event loop (or starting threads). For example::
+
+    import asyncio
+    from mu.contrib import aiomicrofs
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS() as device:
+            await device.put('foo.py', timeout=10)
+            print(await device.ls())
+
+    asyncio.get_event_loop().run_until_complete(main())
+
+Several AsyncMicroFS objects (one per device) can be used concurrently from
+the same loop, while operations on the same device are queued one after the
+other.
+
+The serial port is never read unless bytes are already waiting, so the only
+requirement of the loop is asyncio.sleep. This means it works the same with
+the standard loops on every platform and with a Qt integrated loop (such as
+qasync's).
+
+Every operation takes an optional timeout in seconds, after which it raises
+asyncio.TimeoutError. If an operation is cancelled (or times out) part way
+through, the command running on the device is interrupted and raw mode is
+entered afresh by the next operation.
+
+Unlike microfs, this module needs Python 3.5 or later.
+"""
+import ast
+import asyncio
+import os
+import struct
+from mu.contrib import microfs
+from mu.contrib.microfs import DEFAULT_ENCODING, clean_error
+
+
+__all__ = ['ls', 'rm', 'put', 'get', 'execute', 'AsyncMicroFS']
+
+
+#: Seconds to wait between checks of the serial port for incoming bytes.
+POLL_INTERVAL = 0.005
+
+
+#: The prompt printed by the device once in raw mode.
+RAW_BANNER = b'raw REPL; CTRL-B to exit\r\n>'
+
+
+class AsyncSerial(object):
+    """
+    Non-blocking reads from a pyserial compatible object. Only the bytes the
+    port says are waiting are ever read, and control returns to the event
+    loop while nothing has arrived.
+    """
+
+    def __init__(self, serial, poll_interval=POLL_INTERVAL):
+        self.serial = serial
+        self.poll_interval = poll_interval
+        self.buffer = bytearray()
+
+    async def fill(self):
+        """
+        Waits for at least one more byte to arrive and buffers everything
+        that's waiting.
+        """
+        while True:
+            waiting = self.serial.in_waiting
+            if waiting:
+                self.buffer.extend(self.serial.read(waiting))
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    @property
+    def waiting(self):
+        """
+        True if there are received bytes yet to be read.
+        """
+        return bool(self.buffer) or bool(self.serial.in_waiting)
+
+    def take(self, size):
+        """
+        Returns (and removes) up to size bytes from the buffer.
+        """
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    async def read(self, size):
+        """
+        Returns exactly size bytes.
+        """
+        while len(self.buffer) < size:
+            await self.fill()
+        return self.take(size)
+
+    async def read_until(self, expected):
+        """
+        Returns everything up to and including the expected bytes.
+        """
+        start = 0
+        while True:
+            end = self.buffer.find(expected, start)
+            if end > -1:
+                return self.take(end + len(expected))
+            start = max(0, len(self.buffer) - len(expected) + 1)
+            await self.fill()
+
+    def write(self, data):
+        self.serial.write(data)
+
+    def reset(self):
+        """
+        Discards anything received but not yet read.
+        """
+        del self.buffer[:]
+        self.serial.reset_input_buffer()
+
+
+async def raw_on(port):
+    """
+    Puts the device into raw mode (see microfs.raw_on).
+
+    Returns whatever the device printed up to and including the banner.
+    """
+    port.write(b'\r\x03')
+    port.write(b'\r\x01')
+    return await port.read_until(RAW_BANNER)
+
+
+async def raw_paste_write(port, command_bytes, device=None):
+    """
+    Submits the command bytes using raw-paste mode (see
+    microfs.raw_paste_write). While the paste is under way the device's
+    pasting attribute is True, so an interrupted paste can be ended.
+
+    Returns False if the firmware doesn't support raw-paste mode.
+    """
+    port.write(b'\x05A\x01')
+    reply = await port.read(2)
+    if reply == b'R\x00':
+        return False
+    if reply != b'R\x01':
+        await port.read_until(RAW_BANNER[2:])
+        return False
+    if device is not None:
+        device.pasting = True
+    window_size = struct.unpack('<H', await port.read(2))[0]
+    window_remain = window_size
+    i = 0
+    while i < len(command_bytes):
+        while window_remain == 0 or port.waiting:
+            flag = await port.read(1)
+            if flag == b'\x01':
+                window_remain += window_size
+            elif flag == b'\x04':
+                port.write(b'\x04')
+                if device is not None:
+                    device.pasting = False
+                return True
+            else:
+                raise IOError('Unexpected reply during raw paste.')
+        chunk = command_bytes[i:i + window_remain]
+        port.write(chunk)
+        window_remain -= len(chunk)
+        i += len(chunk)
+    port.write(b'\x04')
+    # The paste is over once it's ended, even if the device is slow to say so.
+    if device is not None:
+        device.pasting = False
+    await port.read_until(b'\x04')
+    return True
+
+
+async def paced_write(port, command_bytes):
+    """
+    Submits the command bytes in small bursts (see microfs.paced_write),
+    yielding to the event loop between each.
+    """
+    size = microfs.WRITE_CHUNK_SIZE
+    for i in range(0, len(command_bytes), size):
+        port.write(command_bytes[i:i + size])
+        await asyncio.sleep(microfs.WRITE_DELAY)
+    port.write(b'\x04')
+
+
+async def submit(port, command_bytes, raw_paste=None, device=None):
+    """
+    Submits a single command to a device already in raw mode.
+
+    Returns a tuple of the header that will precede the response and whether
+    raw-paste mode was used.
+    """
+    if raw_paste is not False and await raw_paste_write(port, command_bytes,
+                                                        device):
+        return b'', True
+    await paced_write(port, command_bytes)
+    return b'OK', False
+
+
+async def read_response(port, header=b'OK'):
+    """
+    Reads the response to a submitted command.
+
+    Returns a tuple of the stdout and stderr bytes from the device.
+    """
+    response = await port.read_until(b'\x04>')
+    out, err = response[len(header):-2].split(b'\x04', 1)
+    return out, err
+
+
+async def read_stream(port, on_data, header=b'OK'):
+    """
+    Reads the response to a submitted command, calling on_data with each
+    piece of stdout as it arrives.
+
+    Raises an IOError if the command wrote anything to stderr.
+    """
+    await port.read(len(header))
+    while True:
+        if not port.buffer:
+            await port.fill()
+        end = port.buffer.find(b'\x04')
+        if end > -1:
+            data = port.take(end)
+            port.take(1)
+            if data:
+                on_data(data)
+            break
+        on_data(port.take(len(port.buffer)))
+    err = (await port.read_until(b'\x04>'))[:-2]
+    if err:
+        raise IOError(clean_error(err))
+
+
+class AsyncMicroFS(object):
+    """
+    An asyncio connection to a device, opened and put into raw mode on first
+    use and left that way until closed. If no serial object is passed in the
+    device is found with microfs.get_serial, otherwise the caller remains
+    responsible for closing it.
+    """
+
+    def __init__(self, serial=None, poll_interval=POLL_INTERVAL):
+        self.serial = serial
+        self.owns_serial = serial is None
+        self.poll_interval = poll_interval
+        self.port = None
+        self.raw = False
+        self.raw_paste = None
+        self.ubinascii = None
+        self.pasting = False
+        self._lock = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    @property
+    def lock(self):
+        """
+        Queues operations on this device. Created on first use so it belongs
+        to the running loop.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def open(self):
+        """
+        Opens the port (if needed) and puts the device into raw mode unless
+        that's already been done.
+        """
+        if self.serial is None:
+            self.serial = microfs.get_serial()
+        if self.port is None:
+            self.port = AsyncSerial(self.serial, self.poll_interval)
+        if not self.raw:
+            await raw_on(self.port)
+            self.raw = True
+
+    def close(self):
+        """
+        Takes the device out of raw mode and releases the port.
+        """
+        if self.serial is None:
+            return
+        if self.raw:
+            microfs.raw_off(self.serial)
+            self.raw = False
+        if self.owns_serial:
+            self.serial.close()
+            self.serial = None
+            self.port = None
+
+    def interrupt(self):
+        """
+        Recovers from an operation that stopped part way through: ends any
+        unfinished paste, interrupts whatever is running with CTRL-C and
+        forgets about raw mode, so the next operation starts afresh.
+        """
+        if self.serial is None:
+            return
+        if self.pasting:
+            # The device treats CTRL-C as data while pasting.
+            self.serial.write(b'\x04')
+            self.pasting = False
+        self.serial.write(b'\r\x03')
+        self.raw = False
+        self.port.reset()
+
+    async def guard(self, coroutine, timeout=None):
+        """
+        Runs the coroutine once this device is free and in raw mode, giving
+        up with an asyncio.TimeoutError after timeout seconds (if given).
+        The device is interrupted if the coroutine is cancelled part way
+        through.
+        """
+        async def locked():
+            async with self.lock:
+                try:
+                    await self.open()
+                    return await coroutine
+                except asyncio.CancelledError:
+                    self.interrupt()
+                    raise
+        try:
+            return await asyncio.wait_for(locked(), timeout)
+        finally:
+            # Never started if cancelled while waiting for the lock.
+            coroutine.close()
+
+    async def run_commands(self, commands):
+        """
+        Sends each command to the device, stopping at the first error.
+
+        Returns a tuple of the combined stdout and the stderr output.
+        """
+        result = b''
+        err = b''
+        for command in commands:
+            header, self.raw_paste = await submit(
+                self.port, command.encode('utf-8'), self.raw_paste, self)
+            out, err = await read_response(self.port, header)
+            result += out
+            if err:
+                return b'', err
+        return result, err
+
+    async def run_stream(self, command, on_data):
+        """
+        Sends a single command to the device, passing its stdout to on_data
+        as it arrives.
+        """
+        header, self.raw_paste = await submit(
+            self.port, command.encode('utf-8'), self.raw_paste, self)
+        await read_stream(self.port, on_data, header)
+
+    async def execute(self, commands, timeout=None):
+        """
+        Runs the commands on the device.
+
+        Returns the stdout and stderr output from the device.
+        """
+        return await self.guard(self.run_commands(commands), timeout)
+
+    async def ls(self, timeout=None):
+        """
+        Returns a list of the files on the device (bar microfs's helper
+        module) or raises an IOError if there's a problem.
+        """
+        out, err = await self.execute([
+            'import os',
+            'print(os.listdir())',
+        ], timeout)
+        if err:
+            raise IOError(clean_error(err))
+        return [name for name in ast.literal_eval(out.decode('utf-8'))
+                if name != microfs.HELPER_NAME]
+
+    async def rm(self, filename, timeout=None):
+        """
+        Removes the referenced file on the device.
+
+        Returns True for success or raises an IOError if there's a problem.
+        """
+        out, err = await self.execute([
+            'import os',
+            "os.remove('{}')".format(filename),
+        ], timeout)
+        if err:
+            raise IOError(clean_error(err))
+        return True
+
+    async def put(self, filename, encoding=DEFAULT_ENCODING, timeout=None):
+        """
+        Puts the referenced file on the LOCAL file system onto the device
+        (see microfs.put).
+
+        Returns True for success or raises an IOError if there's a problem.
+        """
+        if not os.path.isfile(filename):
+            raise IOError('No such file.')
+        with open(filename, 'rb') as local:
+            content = local.read()
+        if self.ubinascii is False:
+            encoding = 'repr'
+        commands = microfs.put_commands(os.path.basename(filename), content,
+                                        encoding)
+        out, err = await self.execute(commands, timeout)
+        if err and b'ImportError' in err and encoding != 'repr':
+            self.ubinascii = False
+            return await self.put(filename, 'repr', timeout)
+        if err:
+            raise IOError(clean_error(err))
+        return True
+
+    async def get(self, filename, target=None, callback=None,
+                  encoding=DEFAULT_ENCODING, timeout=None):
+        """
+        Gets the referenced file on the device and copies it to the target
+        (or current working directory if unspecified) as it arrives (see
+        microfs.get).
+
+        Returns True for success or raises an IOError if there's a problem.
+        """
+        if target is None:
+            target = filename
+        if self.ubinascii is False:
+            encoding = 'repr'
+        command = microfs.get_command(filename, encoding)
+        received = [0]
+        pending = [b'']
+        try:
+            with microfs.replacing(target) as f:
+
+                def on_data(data):
+                    lines = (pending[0] + data).split(b'\n')
+                    pending[0] = lines.pop()
+                    for line in lines:
+                        block = microfs.decode_line(line, encoding)
+                        f.write(block)
+                        received[0] += len(block)
+                        if callback:
+                            callback(filename, received[0])
+
+                await self.guard(self.run_stream(command, on_data), timeout)
+        except IOError as ex:
+            if 'ImportError' in str(ex) and encoding != 'repr':
+                self.ubinascii = False
+                return await self.get(filename, target, callback, 'repr',
+                                      timeout)
+            raise
+        return True
+
+
+async def call(serial, name, *args, **kwargs):
+    """
+    Calls the named AsyncMicroFS method on serial if it's an AsyncMicroFS,
+    otherwise on a new one using the serial object (or the connected device
+    if None) for just this call.
+    """
+    if isinstance(serial, AsyncMicroFS):
+        return await getattr(serial, name)(*args, **kwargs)
+    device = AsyncMicroFS(serial)
+    try:
+        return await getattr(device, name)(*args, **kwargs)
+    finally:
+        device.close()
+
+
+async def execute(commands, serial=None, timeout=None):
+    """
+    Sends the commands to the device and returns its stdout and stderr.
+    """
+    return await call(serial, 'execute', commands, timeout)
+
+
+async def ls(serial=None, timeout=None):
+    """
+    Returns a list of the files on the device.
+    """
+    return await call(serial, 'ls', timeout)
+
+
+async def rm(serial, filename, timeout=None):
+    """
+    Removes the referenced file on the device.
+    """
+    return await call(serial, 'rm', filename, timeout)
+
+
+async def put(serial, filename, encoding=DEFAULT_ENCODING, timeout=None):
+    """
+    Puts the referenced local file onto the device.
+    """
+    return await call(serial, 'put', filename, encoding, timeout)
+
+
+async def get(serial, filename, target=None, callback=None,
+              encoding=DEFAULT_ENCODING, timeout=None):
+    """
+    Gets the referenced file on the device and copies it to the target.
+    """
+    return await call(serial, 'get', filename, target, callback, encoding,
+                      timeout)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+This module shares a single connection to a device between the REPL, which
+streams everything the device says to a listener, and file system
+operations, which need the device to themselves in raw mode.
+
+A SerialBroker is a MicroFSSession, so file system operations are used just
+as they are on a session. While one is under way the REPL is paused; once it
+is done the device leaves raw mode and the REPL carries on where it was. For
+example::
+
+    from mu.contrib.broker import SerialBroker
+
+    broker = SerialBroker()
+    broker.listen(print)
+    broker.write(b'print(1 + 1)\\r')
+    broker.put('foo.py')  # The REPL's output stops until this is done.
+    broker.close()
+
+The listener is called from the broker's reading thread, so a Qt application
+should hand the data over to the main thread (e.g. by emitting a signal).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from mu.contrib import microfs, transports
+
+
+__all__ = ['SerialBroker']
+
+
+#: Seconds the reading thread waits between checks for data from the device.
+POLL_INTERVAL = 0.02
+
+
+class SerialBroker(microfs.MicroFSSession):
+    """
+    A MicroFSSession that owns the port to the device and, while there's a
+    listener, passes it everything the device says outside of file system
+    operations. The port stays open until close is called, so moving between
+    the REPL and file operations never reconnects to the device.
+
+    Everything that uses the port holds the broker's lock, so it's safe to
+    use from any thread.
+    """
+
+    def __init__(self, serial=None, timeout=None, helper=True, budget=None,
+                 baudrate=transports.BAUDRATE):
+        self.lock = threading.RLock()
+        self.listener = None
+        self.reader = None
+        super(SerialBroker, self).__init__(serial, timeout, helper, budget,
+                                           baudrate)
+
+    @property
+    def baudrate(self):
+        """
+        The baud rate the port is (or will be) opened at. Changing it also
+        changes the rate of a port that's already open.
+        """
+        return self._baudrate
+
+    @baudrate.setter
+    def baudrate(self, baudrate):
+        self._baudrate = baudrate
+        with self.lock:
+            if not self.owns_serial:
+                return
+            if getattr(self.serial, 'baudrate', None) not in (None, baudrate):
+                self.serial.baudrate = baudrate
+
+    def connect(self):
+        """
+        Opens the port, unless it's already open, without entering raw mode,
+        and starts the reading thread if there's a listener without one.
+        """
+        super(SerialBroker, self).connect()
+        if self.listener is not None and self.reader is None:
+            self.reader = threading.Thread(target=self.stream)
+            self.reader.daemon = True
+            self.reader.start()
+
+    def leave_raw(self):
+        """
+        Takes the device out of raw mode (if this broker put it there) so it
+        goes back to its interactive REPL.
+        """
+        if self.raw:
+            microfs.raw_off(self.serial)
+            self.raw = False
+
+    def listen(self, listener):
+        """
+        Opens the port if need be and calls listener with the bytes the device
+        sends from now on (other than the responses to file system
+        operations), until unlisten or close is called.
+        """
+        with self.lock:
+            self.listener = listener
+            self.connect()
+            self.leave_raw()
+
+    def unlisten(self):
+        """
+        Stops passing the device's output to the listener. The port is left
+        open.
+        """
+        with self.lock:
+            self.listener = None
+
+    def drain(self):
+        """
+        Passes whatever the device has sent to the listener.
+        """
+        if self.listener is None or self.serial is None:
+            return
+        waiting = self.serial.in_waiting
+        if waiting:
+            self.listener(self.serial.read(waiting))
+
+    def stream(self):
+        """
+        Run by the reading thread: drains the port until there's no listener,
+        or the port fails. In that case the port is released and the listener
+        is kept, so reading starts again once the port is reconnected.
+        """
+        while True:
+            with self.lock:
+                if self.listener is None:
+                    self.reader = None
+                    return
+                try:
+                    self.drain()
+                except (IOError, OSError):
+                    self.reader = None
+                    self.disconnect()
+                    return
+            time.sleep(POLL_INTERVAL)
+
+    def write(self, data):
+        """
+        Sends the data (such as a key press) to the device's REPL. Whatever
+        it runs may change the device's files, so the cached listing is
+        forgotten. If the port has failed it's opened again.
+        """
+        with self.lock:
+            self.connect()
+            try:
+                self.leave_raw()
+                self.invalidate()
+                self.serial.write(data)
+            except (IOError, OSError):
+                self.disconnect()
+                raise
+
+    @contextmanager
+    def limit(self, deadline=None):
+        """
+        As MicroFSSession.limit, but the outermost block also pauses the REPL
+        (once it's been given what the device already sent) and resumes it
+        afterwards.
+        """
+        with self.lock:
+            if self.deadline is not None:
+                with super(SerialBroker, self).limit(deadline) as deadline:
+                    yield deadline
+                return
+            if self.listener is not None:
+                self.drain()
+            try:
+                with super(SerialBroker, self).limit(deadline) as deadline:
+                    yield deadline
+            finally:
+                if self.listener is not None and self.serial is not None:
+                    try:
+                        self.leave_raw()
+                    except (IOError, OSError):
+                        # The operation's own error says what went wrong.
+                        pass
+
+    def close(self):
+        """
+        Stops listening, takes the device out of raw mode and releases the
+        port.
+        """
+        with self.lock:
+            self.listener = None
+            super(SerialBroker, self).close()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+This module finds the serial ports of connected BBC micro:bits, for use by
+both the editor and microfs.
+
+Serial ports are only enumerated when something may have changed: on Linux
+when the modification time of /dev changes (as it does whenever a device is
+plugged in or out), elsewhere once the last enumeration is CACHE_TIMEOUT
+seconds old. The device used last is remembered by its USB serial number,
+so the same board is found again even if its port changes. For example::
+
+    from mu.contrib import discovery
+
+    port = discovery.find_device()
+
+Listeners may also be told whenever a device is added or removed::
+
+    def changed(event, device):
+        print(event, device.port)
+
+    discovery.default.add_listener(changed)
+    discovery.default.start()
+
+A listener runs on whichever thread noticed the change: the watching thread
+started by start, or any caller of devices, find_devices or find_device. It
+should return quickly, since that thread waits for it.
+"""
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from serial.tools.list_ports import comports as list_serial_ports
+
+
+__all__ = ['find_device', 'find_devices', 'DeviceDiscovery', 'Device']
+
+
+#: USB product ID.
+MICROBIT_PID = 516
+
+
+#: USB vendor ID.
+MICROBIT_VID = 3368
+
+
+#: The (vendor ID, product ID) pairs of the devices to be found.
+DEVICE_IDS = ((MICROBIT_VID, MICROBIT_PID), )
+
+
+#: Seconds an enumeration is trusted for where there's no cheaper way to tell
+#: that a device has been plugged in or out.
+CACHE_TIMEOUT = 2.0
+
+
+#: Seconds between checks for new or removed devices when watching.
+WATCH_INTERVAL = 1.0
+
+
+#: The directory that gains or loses an entry whenever a device is plugged in
+#: or out on Linux.
+DEV_DIRECTORY = '/dev'
+
+
+#: A connected device.
+Device = namedtuple('Device', ['port', 'serial_number', 'vid', 'pid',
+                               'description'])
+
+
+class DeviceDiscovery(object):
+    """
+    Finds, caches and watches the connected devices whose USB vendor and
+    product IDs are in ids.
+    """
+
+    def __init__(self, ids=DEVICE_IDS, cache_timeout=CACHE_TIMEOUT):
+        self.ids = ids
+        self.cache_timeout = cache_timeout
+        self.cache = None
+        self.stamp = None
+        self.preferred = None
+        self.listeners = []
+        self.lock = threading.Lock()
+        self.watcher = None
+        self.watching = threading.Event()
+
+    def get_stamp(self):
+        """
+        Returns a value that changes whenever the cached devices may be out
+        of date.
+        """
+        if sys.platform.startswith('linux') and os.path.isdir(DEV_DIRECTORY):
+            return os.stat(DEV_DIRECTORY).st_mtime
+        return time.time() // self.cache_timeout
+
+    def enumerate(self):
+        """
+        Returns a list of the matching devices, found by enumerating every
+        serial port.
+        """
+        found = []
+        for port in list_serial_ports():
+            if (port.vid, port.pid) in self.ids:
+                found.append(Device(port.device, port.serial_number,
+                                    port.vid, port.pid, port.description))
+        return found
+
+    def devices(self, refresh=False):
+        """
+        Returns a list of the connected devices, enumerating them again only
+        if refresh is True or they may have changed. Listeners are told about
+        any device added or removed since the last enumeration.
+        """
+        with self.lock:
+            stamp = self.get_stamp()
+            if not (refresh or self.cache is None or stamp != self.stamp):
+                return list(self.cache)
+            old = self.cache or []
+            self.cache = self.enumerate()
+            self.stamp = stamp
+            devices = list(self.cache)
+        for device in old:
+            if device not in devices:
+                self.notify('removed', device)
+        for device in devices:
+            if device not in old:
+                self.notify('added', device)
+        return devices
+
+    def find(self, serial_number=None):
+        """
+        Returns the port of the device with the referenced USB serial number,
+        or None if it isn't connected. If no serial number is given the
+        device found last time is used again (even if its port has changed)
+        or, failing that, the first device found.
+        """
+        implicit = serial_number is None
+        if implicit:
+            serial_number = self.preferred
+        devices = self.devices()
+        for device in devices:
+            if device.serial_number == serial_number:
+                return device.port
+        if implicit and devices:
+            self.preferred = devices[0].serial_number
+            return devices[0].port
+        return None
+
+    def add_listener(self, listener):
+        """
+        Calls listener(event, device) whenever a device is 'added' or
+        'removed'.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def notify(self, event, device):
+        for listener in list(self.listeners):
+            listener(event, device)
+
+    def start(self, interval=WATCH_INTERVAL):
+        """
+        Starts a background thread that checks for devices being added or
+        removed every interval seconds.
+        """
+        if self.watcher is not None:
+            return
+        self.watching.clear()
+
+        def watch():
+            while not self.watching.wait(interval):
+                self.devices()
+
+        self.watcher = threading.Thread(target=watch)
+        self.watcher.daemon = True
+        self.watcher.start()
+
+    def stop(self):
+        """
+        Stops the background thread started by start.
+        """
+        if self.watcher is None:
+            return
+        self.watching.set()
+        self.watcher.join()
+        self.watcher = None
+
+
+#: The discovery service shared by the editor and microfs.
+default = DeviceDiscovery()
+
+
+def find_devices(refresh=False):
+    """
+    Returns a list of the ports of all the connected micro:bits.
+    """
+    return [device.port for device in default.devices(refresh)]
+
+
+def find_device(serial_number=None):
+    """
+    Returns the port of a connected micro:bit (see DeviceDiscovery.find) or
+    None.
+    """
+    return default.find(serial_number)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains a benchmark suite for the link between the host and a
+device running MicroPython, as used by microfs.
+
+It times the raw mode handshake, execute, ls, put, get and rm against either
+a real device or a SimulatedDevice from microsim, sweeping through file sizes
+and chunk sizes. For each measurement it reports the wall clock time, the
+throughput in bytes per second and the CPU time used on the host. For
+example::
+
+    from mu.contrib import microbench, microsim
+
+    results = microbench.run(microsim.SimulatedDevice(baudrate=115200))
+    print(microbench.report(results))
+
+It's also available from the command line as 'ufs bench' (add --simulate to
+benchmark the simulated device).
+"""
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import time
+from collections import namedtuple
+from mu.contrib import microfs
+
+
+try:
+    cpu_time = time.process_time
+except AttributeError:  # pragma: no cover
+    # Python 2.
+    cpu_time = time.clock
+
+
+__all__ = ['run', 'report', 'Result']
+
+
+#: The sizes, in bytes, of the files transferred.
+DEFAULT_SIZES = (128, 1024, 8192)
+
+
+#: The chunk sizes, in bytes, swept through for put (the content of each
+#: command) and get (the size of each block read on the device).
+DEFAULT_CHUNK_SIZES = (64, 192, 384)
+
+
+#: How many times each latency measurement is repeated.
+DEFAULT_REPEAT = 5
+
+
+#: The name of the file used on the device.
+BENCH_FILENAME = 'bench.bin'
+
+
+#: A single measurement. Operations that don't transfer a file have a size
+#: and chunk_size of None and a bytes_per_second of None.
+Result = namedtuple('Result', ['operation', 'size', 'chunk_size', 'seconds',
+                               'bytes_per_second', 'cpu_seconds'])
+
+
+def timed(operation, size=None, chunk_size=None, repeat=1):
+    """
+    Calls operation repeat times and returns a Result with the average wall
+    clock and host CPU time per call.
+    """
+    start_cpu = cpu_time()
+    start = time.time()
+    for _ in range(repeat):
+        operation()
+    seconds = (time.time() - start) / repeat
+    cpu_seconds = (cpu_time() - start_cpu) / repeat
+    rate = None
+    if size is not None and seconds:
+        rate = size / seconds
+    return Result(operation.__name__, size, chunk_size, seconds, rate,
+                  cpu_seconds)
+
+
+def run(serial, sizes=DEFAULT_SIZES, chunk_sizes=DEFAULT_CHUNK_SIZES,
+        repeat=DEFAULT_REPEAT, encoding=microfs.DEFAULT_ENCODING):
+    """
+    Benchmarks the device connected via the serial object (or simulated
+    device) and returns a list of Results.
+
+    Raises an IOError if a file doesn't survive the round trip intact.
+    """
+    results = []
+    workspace = tempfile.mkdtemp()
+    local = os.path.join(workspace, BENCH_FILENAME)
+    copy = os.path.join(workspace, 'copy.bin')
+
+    def handshake():
+        microfs.execute([], serial)
+
+    results.append(timed(handshake, repeat=repeat))
+    session = microfs.MicroFSSession(serial)
+    try:
+        def execute():
+            session.execute(['pass'])
+
+        def ls():
+            session.ls(refresh=True)
+
+        # Enter raw mode and install the helper up front, so neither is
+        # counted in the first timings.
+        session.ls(refresh=True)
+        results.append(timed(execute, repeat=repeat))
+        results.append(timed(ls, repeat=repeat))
+        for size in sizes:
+            with open(local, 'wb') as f:
+                f.write(os.urandom(size))
+            for chunk_size in chunk_sizes:
+                def put():
+                    session.put(local, encoding, chunk_size=chunk_size)
+
+                def get():
+                    with open(copy, 'wb') as f:
+                        for block in session.get_iter(BENCH_FILENAME,
+                                                      encoding, chunk_size):
+                            f.write(block)
+
+                def rm():
+                    session.rm(BENCH_FILENAME)
+
+                results.append(timed(put, size, chunk_size))
+                results.append(timed(get, size, chunk_size))
+                with open(local, 'rb') as original, open(copy, 'rb') as f:
+                    if original.read() != f.read():
+                        raise IOError('Round trip of {} bytes failed.'.format(
+                            size))
+                results.append(timed(rm))
+    finally:
+        session.close()
+        shutil.rmtree(workspace)
+    return results
+
+
+def report(results):
+    """
+    Returns a table of the results suitable for printing.
+    """
+    rows = [('operation', 'size', 'chunk', 'ms', 'bytes/s', 'cpu ms')]
+    for result in results:
+        rows.append((
+            result.operation,
+            '' if result.size is None else str(result.size),
+            '' if result.chunk_size is None else str(result.chunk_size),
+            '{:.1f}'.format(result.seconds * 1000),
+            '' if result.bytes_per_second is None else
+            '{:.0f}'.format(result.bytes_per_second),
+            '{:.1f}'.format(result.cpu_seconds * 1000),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return '\n'.join('  '.join(cell.rjust(width) for cell, width in
+                               zip(row, widths)) for row in rows)
@@ -9,22 +9,92 @@ You may:
 * rm - remove a named file on the device. Based on the Unix command.
 * put - copy a named local file onto the device a la equivalent FTP command.
 * get - copy a named file from the device to the local file system a la FTP.
+
+Each also has a batch variant (ls aside) that handles a list of files in a
+single raw mode session.
+
+* sync - copy only the files in a local directory that differ from those on
+  the device, optionally removing files that aren't in the directory.
+* bench - measure the speed of the link to the device (see microbench).
+
+The fleet function runs any of these on every connected device at once.
+Devices are usually reached over USB serial, but any transport (TCP, a
+pseudo terminal or a simulated device) will do (see transports).
+
+A MicroFSSession installs a small helper module (_mu.py) on the device the
+first time it's needed, so each operation is then a short call to one of its
+functions rather than a routine compiled afresh by the device every time.
 """
 from __future__ import print_function
 import ast
 import argparse
+import binascii
+from bisect import bisect
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+import errno
 import sys
 import os
+import random
+import re
+import struct
 import time
+import zlib
 import os.path
-from serial.tools.list_ports import comports as list_serial_ports
-from serial import Serial
+from mu.contrib import discovery, transports
 
 
 PY2 = sys.version_info < (3,)
 
 
-__all__ = ['ls', 'rm', 'put', 'get', 'get_serial']
+__all__ = ['ls', 'rm', 'put', 'get', 'rm_many', 'put_many', 'get_many',
+           'sync', 'fleet', 'get_serial', 'MicroFSSession', 'Deadline',
+           'OperationAborted', 'OperationTimeout', 'OperationCancelled',
+           'DeviceError']
+
+
+#: The transfer encodings understood by put. Each maps to the statement run on
+#: the device to bind the decoder "u" (None means no decoding is needed).
+ENCODINGS = {
+    'repr': None,
+    'hex': 'from ubinascii import unhexlify as u',
+    'base64': 'from ubinascii import a2b_base64 as u',
+}
+
+
+#: The number of bytes of file content sent in each command, per encoding.
+CHUNK_SIZES = {
+    'repr': 64,
+    'hex': 256,
+    'base64': 384,
+}
+
+
+#: The encoding used by put and get unless told otherwise.
+DEFAULT_ENCODING = 'base64'
+
+
+#: The statement run on the device to bind the encoder "e" used by get. Each
+#: encoder returns bytes, which are printed as one bytes literal per line.
+GET_ENCODERS = {
+    'repr': 'e = bytes',
+    'hex': 'from ubinascii import hexlify as e',
+    'base64': 'from ubinascii import b2a_base64 as e',
+}
+
+
+#: The number of bytes of file content read on the device per line of output
+#: when getting a file.
+GET_BLOCK_SIZE = 256
+
+
+#: Bytes written per burst when raw-paste mode isn't available.
+WRITE_CHUNK_SIZE = 32
+
+
+#: Seconds to pause between bursts when raw-paste mode isn't available.
+WRITE_DELAY = 0.01
 
 
 #: The help text to be shown when requested.
@@ -35,31 +105,416 @@ You may use the following commands:
 'ls' - list files on the device (based on the equivalent Unix command);
 'rm' - remove a named file on the device (based on the Unix command);
 'put' - copy a named local file onto the device just like the FTP command; and,
-'get' - copy a named file from the device to the local file system a la FTP.
+'get' - copy a named file from the device to the local file system a la FTP;
+'sync' - copy only the changed files in a directory (default: the current one)
+onto the device, with --delete removing device files not in the directory.
+'bench' - measure transfer speeds and latency, with --simulate using a
+simulated device instead of a connected one.
+
+With --all, any command except 'bench' runs on every connected device at once.
+With --port, use that device instead: a serial port or the URL of another
+transport (socket://host:port, loop:// or pty:command). Give it more than once
+to run the command on each.
+'probe' - find the fastest baud rate the device answers at.
+With --baudrate, talk to serial ports at that rate (default 115200).
+With --verify, 'put' checks each file on the device once it's written.
+With --timeout, give up (and interrupt the device) after that many seconds.
 
 For example, 'ufs ls' will list the files on a connected BBC micro:bit.
+The 'rm', 'put' and 'get' commands accept several filenames at once.
+"""
+
+
+#: Device side function "h" that returns a (name, b, a, size) tuple for the
+#: named file, where b and a are the two halves of its Adler-32 checksum. The
+#: sums are reduced once per 256 byte block, which keeps every value a small
+#: int on the device.
+HASH_FUNCTION = """def h(n):
+    a, b, l = 1, 0, 0
+    f = open(n, 'rb')
+    while True:
+        d = f.read(256)
+        if not d:
+            break
+        l += len(d)
+        for c in d:
+            a += c
+            b += a
+        a %= 65521
+        b %= 65521
+    f.close()
+    return (n, b, a, l)
+"""
+
+
+#: Device side routine that prints the checksum of every file as a list of
+#: tuples from HASH_FUNCTION.
+HASH_COMMAND = """import os
+""" + HASH_FUNCTION + """print([h(n) for n in os.listdir()])
+"""
+
+
+#: Device side routine that prints the HASH_FUNCTION tuple for the file named
+#: by the placeholder, or None if there's no such file.
+FILE_HASH_COMMAND = HASH_FUNCTION + """try:
+    print(h('{}'))
+except OSError:
+    print(None)
+"""
+
+
+#: Device side function "w" used by put to write each chunk to the open
+#: file's "f" write function, once the chunk matches the two halves of its
+#: Adler-32 checksum. "n" counts the bytes written so far (from the offset
+#: in the placeholder), which is where a failed transfer resumes from.
+WRITER = """n = {}
+def w(d, cb, ca):
+    global n
+    a, b = 1, 0
+    for c in d:
+        a += c
+        b += a
+    if (b % 65521, a % 65521) != (cb, ca):
+        raise ValueError('bad chunk at', n)
+    f(d)
+    n += len(d)
+"""
+
+
+#: How many times in a row put sends a chunk again after the device rejects
+#: it before giving up.
+RETRIES = 3
+
+
+#: The smallest chunk put falls back to after a chunk is rejected.
+MIN_CHUNK_SIZE = 16
+
+
+#: Device side routine that prints a list of (name, size) tuples for every
+#: file along with the free space in bytes (or None if it can't be found).
+#: The micro:bit has os.size, other MicroPython ports os.stat/os.statvfs.
+DETAILS_COMMAND = """import os
+try:
+    s = os.size
+except AttributeError:
+    s = lambda n: os.stat(n)[6]
+try:
+    v = os.statvfs('/')
+    r = v[0] * v[3]
+except (AttributeError, OSError):
+    r = None
+print(([(n, s(n)) for n in os.listdir()], r))
+"""
+
+
+#: The name of the helper module installed on the device by MicroFSSession.
+#: It's left out of file listings.
+HELPER_NAME = '_mu.py'
+
+
+#: The body of the helper module. Once imported, each operation is a short
+#: call such as "_mu.ls()" instead of a routine that has to be sent and
+#: compiled by the device every time. Writing mirrors WRITER: "o" opens the
+#: file (appending from offset k if it isn't zero) and binds the decoder for
+#: the encoding, "w" checks and writes each chunk, and "c" closes the file.
+HELPER_BODY = """import os
+n = 0
+f = None
+u = None
+def o(p, k, e):
+    global n, f, u
+    u = None
+    if e == 'base64':
+        from ubinascii import a2b_base64 as u
+    elif e == 'hex':
+        from ubinascii import unhexlify as u
+    f = open(p, 'ab' if k else 'wb')
+    n = k
+def w(d, cb, ca):
+    global n
+    if u:
+        d = u(d)
+    a, b = 1, 0
+    for c in d:
+        a += c
+        b += a
+    if (b % 65521, a % 65521) != (cb, ca):
+        raise ValueError('bad chunk at', n)
+    f.write(d)
+    n += len(d)
+def c():
+    f.close()
+def ls():
+    print(os.listdir())
+def s(p):
+    try:
+        return os.size(p)
+    except AttributeError:
+        return os.stat(p)[6]
+def d():
+    try:
+        v = os.statvfs('/')
+        r = v[0] * v[3]
+    except (AttributeError, OSError):
+        r = None
+    print(([(p, s(p)) for p in os.listdir()], r))
+def rm(p):
+    os.remove(p)
+def rmm(ps):
+    r = []
+    for p in ps:
+        try:
+            os.remove(p)
+        except OSError:
+            r.append(p)
+    print(r)
+def g(p, e, k):
+    if e == 'base64':
+        from ubinascii import b2a_base64 as x
+    elif e == 'hex':
+        from ubinascii import hexlify as x
+    else:
+        x = bytes
+    f = open(p, 'rb')
+    while True:
+        b = f.read(k)
+        if not b:
+            break
+        print(x(b))
+    f.close()
+""" + HASH_FUNCTION + """def hs():
+    print([h(p) for p in os.listdir()])
+def hf(p):
+    try:
+        print(h(p))
+    except OSError:
+        print(None)
 """
 
 
+#: The version of the helper module, which changes whenever its body does.
+HELPER_VERSION = zlib.adler32(HELPER_BODY.encode('utf-8')) & 0xffffffff
+
+
+#: The source of the helper module as installed on the device.
+HELPER_SOURCE = 'V = {}\n'.format(HELPER_VERSION) + HELPER_BODY
+
+
+#: Device side routine that imports the latest helper module (discarding an
+#: older one already imported) and prints its version.
+HELPER_IMPORT = """import sys
+try:
+    del sys.modules['_mu']
+except (AttributeError, KeyError):
+    pass
+import _mu
+print(_mu.V)
+"""
+
+
+#: Seconds probe_baudrate waits for the device to echo PROBE_TEXT at a baud
+#: rate it has already answered the handshake at.
+PROBE_TIMEOUT = 0.5
+
+
+#: Seconds probe_baudrate waits for the raw mode banner at each baud rate,
+#: which is all a wrong rate costs.
+HANDSHAKE_TIMEOUT = 0.1
+
+
+#: Echoed by the device for probe_baudrate. It has every printable character
+#: (bar the quote and backslash) so that garbling is spotted.
+PROBE_TEXT = ''.join(chr(c) for c in range(32, 127) if chr(c) not in '\'\\')
+
+
+#: Output that shows the device has (soft or hard) rebooted.
+REBOOT_MARKERS = (b'soft reboot', b'MicroPython v')
+
+
+#: Matches the error from a compact command once the device has forgotten
+#: the helper module (because it was reset since the module was imported).
+HELPER_LOST = re.compile(br"NameError: name '_mu' is(n't| not) defined")
+
+
+#: The most bytes of what the device last sent that are kept, for the output
+#: of an OperationAborted, while an operation is under way.
+OUTPUT_SIZE = 1024
+
+
+#: Files whose commands come to less than this many bytes are packed together
+#: into a single submission by put_many.
+PACK_SIZE = 1024
+
+
+#: The most bytes of consecutive commands execute joins into a single
+#: submission, which the device has to hold and compile in one go. Zero sends
+#: every command on its own.
+COALESCE_SIZE = 1024
+
+
+#: Matches the line number of each frame of code submitted to the device in
+#: a traceback. Code that failed to compile has no ", in ..." part.
+STDIN_FRAME = re.compile(br'File "<stdin>", line (\d+)(, in )?')
+
+
+#: The outcome of an operation run on one device by fleet: whatever the
+#: operation returned (or the exception it raised) and how long it took.
+DeviceResult = namedtuple('DeviceResult', ['result', 'seconds'])
+
+
+class OperationAborted(IOError):
+    """
+    Raised when an operation on the device stops before it's finished. The
+    output attribute holds the last of what the device had sent by then (up
+    to OUTPUT_SIZE bytes).
+    """
+
+    def __init__(self, message, output=b''):
+        super(OperationAborted, self).__init__(message)
+        self.output = bytes(output)
+
+
+class OperationTimeout(OperationAborted):
+    """
+    Raised when an operation on the device runs past its deadline.
+    """
+
+
+class OperationCancelled(OperationAborted):
+    """
+    Raised when an operation on the device is cancelled.
+    """
+
+
+class DeviceError(IOError):
+    """
+    Raised when a command wrote to stderr on the device. The link to the
+    device is fine, unlike with other IOErrors raised while talking to it.
+    """
+
+
+class Deadline(object):
+    """
+    The time by which an operation must finish (never if timeout is None),
+    which also serves as a token for cancelling it, from any thread, with
+    cancel. Both take effect within the serial object's timeout.
+    """
+
+    def __init__(self, timeout=None):
+        self.expires = None if timeout is None else time.time() + timeout
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def remaining(self):
+        """
+        Returns the seconds left (or None if there's no time limit).
+        """
+        if self.expires is None:
+            return None
+        return max(0, self.expires - time.time())
+
+    def check(self, output=b''):
+        """
+        Raises OperationCancelled or OperationTimeout, with the last
+        OUTPUT_SIZE bytes of the output received so far, if the operation
+        should stop.
+        """
+        output = output[-OUTPUT_SIZE:]
+        if self.cancelled:
+            raise OperationCancelled('Cancelled.', output)
+        if self.expires is not None and time.time() >= self.expires:
+            raise OperationTimeout('Timed out waiting for the device.',
+                                   output)
+
+
+class DeadlineSerial(object):
+    """
+    Wraps a serial object so that reads stop once the deadline passes or is
+    cancelled. Reads never block for longer than the time remaining (or the
+    serial object's timeout, if that's shorter) and only the last of what's
+    read (at least OUTPUT_SIZE bytes) is kept in received.
+    """
+
+    def __init__(self, serial, deadline):
+        self.serial = serial
+        self.deadline = deadline
+        self.received = bytearray()
+
+    def __getattr__(self, name):
+        return getattr(self.serial, name)
+
+    def read(self, size=1):
+        self.deadline.check(self.received)
+        remaining = self.deadline.remaining()
+        timeout = getattr(self.serial, 'timeout', None)
+        if remaining is None or (timeout is not None and timeout <= remaining):
+            data = self.serial.read(size)
+        else:
+            # Setting a serial port's timeout reconfigures the port, so it's
+            # only put back if the read left it changed.
+            self.serial.timeout = remaining
+            try:
+                data = self.serial.read(size)
+            finally:
+                if getattr(self.serial, 'timeout', None) != timeout:
+                    self.serial.timeout = timeout
+        self.received.extend(data)
+        if len(self.received) > 2 * OUTPUT_SIZE:
+            # Trimmed now and then, rather than after every read.
+            del self.received[:-OUTPUT_SIZE]
+        return data
+
+    def read_until(self, expected=b'\n', size=None):
+        """
+        Reads up to and including expected (or size bytes). Until the
+        deadline passes a read that times out is tried again but, with no
+        time limit, whatever arrived by then is returned (as pyserial does).
+        """
+        data = bytearray()
+        while not data.endswith(expected):
+            if size is not None and len(data) >= size:
+                break
+            byte = self.read(1)
+            if not byte and self.deadline.remaining() is None:
+                break
+            data.extend(byte)
+        return bytes(data)
+
+
+def find_upython_devices():
+    """
+    Finds all the ports to which devices are connected.
+    """
+    return discovery.find_devices()
+
+
 def find_upython_device():
     """
     Finds the port to which the device is connected.
     """
-    ports = list_serial_ports()
-    for port in ports:
-        #if "VID:PID=0D28:0204" in port[2].upper():
-            return port[0]
-    return None
+    return discovery.find_device()
 
 
 def raw_on(serial):
     """
     Puts the device into raw mode.
+
+    This works whether the device is running a script, sitting at the normal
+    REPL or already in raw mode (in which case CTRL-A simply re-prints the
+    raw mode banner), so only a single wait for the banner is needed.
+
+    Returns whatever the device printed up to and including the banner, or
+    raises an IOError if the banner never arrives.
     """
-    serial.write(b'\x03')  # Send CTRL-C to break out of loop.
-    serial.read_until(b'\n>')  # Flush buffer until prompt.
-    serial.write(b'\x01')  # Go into raw mode.
-    serial.read_until(b'\r\n>OK')  # Flush buffer until raw mode prompt.
+    serial.write(b'\r\x03')  # Send CTRL-C to break out of loop.
+    serial.write(b'\r\x01')  # Go into raw mode.
+    # Flush until prompt.
+    banner = serial.read_until(b'raw REPL; CTRL-B to exit\r\n>')
+    if not banner.endswith(b'raw REPL; CTRL-B to exit\r\n>'):
+        raise IOError('Could not enter raw mode.')
+    return banner
 
 
 def raw_off(serial):
@@ -69,47 +524,348 @@ def raw_off(serial):
     serial.write(b'\x02')  # Send CTRL-B to get out of raw mode.
 
 
-def get_serial():
+def get_serial(port=None, baudrate=transports.BAUDRATE):
     """
-    Detect if a micro:bit is connected and return a serial object to talk to
-    it.
+    Detect if a micro:bit is connected (unless the port is given) and return a
+    serial object to talk to it at the baud rate.
+
+    The port may also be the URL of any other transport, such as
+    socket://host:port (see transports.connect).
     """
-    port = find_upython_device()
+    if port is None:
+        port = find_upython_device()
     if port is None:
         raise IOError('Could not find micro:bit.')
-    return Serial(port, 115200, timeout=1, parity='N')
+    return transports.connect(port, baudrate=baudrate)
+
+
+def probe_baudrate(port, rates=transports.BAUDRATES, timeout=PROBE_TIMEOUT,
+                   connect=transports.connect, preferred=None,
+                   handshake=HANDSHAKE_TIMEOUT):
+    """
+    Returns the first of the baud rates (fastest first, though preferred,
+    such as the rate found last time, is tried before the rest) at which the
+    device on the serial port reliably runs a command that echoes
+    PROBE_TEXT, or None if it doesn't at any of them.
+
+    The port is opened once, with connect(port, timeout, rate), and only its
+    rate is changed from then on. At each rate the device has handshake
+    seconds to enter raw mode, so a wrong rate is passed over quickly, and
+    the echo is only checked once it has. A link with no baud rate to set
+    (such as a socket or loop://) isn't probed: the rate it was opened at is
+    returned.
+
+    Only the host's end of the link is changed, so this finds the rate the
+    device's REPL already runs at: its default, or whatever a script changed
+    it to (on the micro:bit, with uart.init).
+    """
+    if preferred in rates:
+        rates = [preferred] + [rate for rate in rates if rate != preferred]
+    opened_at = preferred or transports.BAUDRATE
+    command = "print('{}')".format(PROBE_TEXT)
+    expected = PROBE_TEXT.encode('ascii') + b'\r\n'
+    try:
+        serial = connect(port, timeout, opened_at)
+    except (IOError, ValueError):
+        return None
+    try:
+        if getattr(serial, 'baudrate', None) is None:
+            return opened_at
+        for rate in rates:
+            try:
+                serial.baudrate = rate
+            except (IOError, ValueError):
+                continue
+            if serial.baudrate != rate:
+                # The port can't do it.
+                continue
+            if hasattr(serial, 'reset_input_buffer'):
+                serial.reset_input_buffer()
+            link = DeadlineSerial(serial, Deadline(handshake))
+            try:
+                raw_on(link)
+                link.deadline = Deadline(timeout)
+                out, err = run_commands([command], link)[:2]
+            except IOError:
+                continue
+            finally:
+                raw_off(serial)
+            if not err and out == expected:
+                return rate
+        return None
+    finally:
+        serial.close()
+
+
+def read_response(serial, terminator=b'\x04>', header=b'OK'):
+    """
+    Reads the device's response to a command submitted in raw mode, up to and
+    including the terminating prompt.
+
+    Each read blocks on the port (for at most the serial object's timeout)
+    until at least one byte arrives and then takes whatever else is waiting,
+    so no CPU is burned while the device is busy. Only the newly arrived
+    bytes (plus enough of the old ones to catch a split terminator) are
+    searched for the terminator.
+
+    Returns a tuple of the stdout and stderr bytes from the device.
+    """
+    response = bytearray()
+    while True:
+        start = max(0, len(response) - len(terminator) + 1)
+        response.extend(serial.read(max(1, serial.in_waiting)))
+        end = response.find(terminator, start)
+        if end > -1:
+            break
+    # Strip the leading header and split stdout from stderr.
+    out, err = response[len(header):end].split(b'\x04', 1)
+    return bytes(out), bytes(err)
+
+
+def raw_paste_write(serial, command_bytes):
+    """
+    Submits the command bytes using MicroPython's flow controlled raw-paste
+    mode, sending as much as the device says it has room for rather than
+    pausing for a fixed time.
+
+    Returns False if the firmware doesn't support raw-paste mode, in which
+    case nothing was submitted and the device is still in raw mode.
+    """
+    serial.write(b'\x05A\x01')
+    reply = serial.read(2)
+    if reply == b'R\x00':
+        # Understood, but refused by the device.
+        return False
+    if reply != b'R\x01':
+        # Older firmware ignores the request and re-prints the raw prompt
+        # (the first two bytes of which have already been read).
+        serial.read_until(b'w REPL; CTRL-B to exit\r\n>')
+        return False
+    window_size = struct.unpack('<H', serial.read(2))[0]
+    window_remain = window_size
+    i = 0
+    while i < len(command_bytes):
+        while window_remain == 0 or serial.in_waiting:
+            flag = serial.read(1)
+            if flag == b'\x01':
+                # The device has room for another window of data.
+                window_remain += window_size
+            elif flag == b'\x04':
+                # The device wants to stop early, so acknowledge and finish.
+                serial.write(b'\x04')
+                return True
+            else:
+                raise IOError('Unexpected reply during raw paste.')
+        chunk = command_bytes[i:i + window_remain]
+        serial.write(chunk)
+        window_remain -= len(chunk)
+        i += len(chunk)
+    serial.write(b'\x04')  # Indicate the end of the data.
+    if not serial.read_until(b'\x04').endswith(b'\x04'):
+        raise IOError('Could not complete raw paste.')
+    return True
+
+
+def paced_write(serial, command_bytes):
+    """
+    Submits the command bytes in small bursts with a pause between each, so
+    devices without raw-paste mode don't overflow their UART buffer.
+    """
+    for i in range(0, len(command_bytes), WRITE_CHUNK_SIZE):
+        serial.write(command_bytes[i:i + WRITE_CHUNK_SIZE])
+        time.sleep(WRITE_DELAY)
+    serial.write(b'\x04')
+
+
+def submit(serial, command_bytes, raw_paste=None):
+    """
+    Submits a single command to a device that is already in raw mode, using
+    raw-paste mode unless raw_paste is False or the firmware lacks it.
+
+    Returns a tuple of the header that will precede the response and whether
+    raw-paste mode was used.
+    """
+    if raw_paste is not False and raw_paste_write(serial, command_bytes):
+        return b'', True
+    paced_write(serial, command_bytes)
+    return b'OK', False
 
 
-def execute(commands, serial=None):
+def iter_response(serial, header=b'OK', terminator=b'\x04>'):
+    """
+    Generates the stdout of a command submitted in raw mode in pieces, as
+    they arrive from the device, rather than waiting for all of it.
+
+    Raises a DeviceError if the command wrote anything to stderr.
+    """
+    skipped = 0
+    while skipped < len(header):
+        skipped += len(serial.read(len(header) - skipped))
+    while True:
+        data = serial.read(max(1, serial.in_waiting))
+        end = data.find(b'\x04')
+        if end > -1:
+            break
+        if data:
+            yield data
+    if end:
+        yield data[:end]
+    # Whatever follows is stderr, up to the terminating prompt.
+    response = bytearray(data[end + 1:])
+    while True:
+        err_end = response.find(terminator)
+        if err_end > -1:
+            break
+        response.extend(serial.read(max(1, serial.in_waiting)))
+    if err_end:
+        raise DeviceError(clean_error(bytes(response[:err_end])))
+
+
+def coalesce(commands, budget):
+    """
+    Generates lists of consecutive commands that come to no more than budget
+    bytes each (bar a single command that's bigger on its own).
+    """
+    batch = []
+    size = 0
+    for command in commands:
+        length = len(command.encode('utf-8')) + 1
+        if batch and size + length > budget:
+            yield batch
+            batch = []
+            size = 0
+        batch.append(command)
+        size += length
+    if batch:
+        yield batch
+
+
+def attribute(err, commands):
+    """
+    Works out which of the commands, submitted joined by newlines, caused the
+    error reported on stderr.
+
+    Returns a tuple of the index of the command and the error, with each line
+    number changed to the one it would have had if that command were sent on
+    its own.
+    """
+    starts = []
+    line = 1
+    for command in commands:
+        starts.append(line)
+        line += command.count('\n') + 1
+    frame = STDIN_FRAME.search(err)
+    if frame is None:
+        return 0, err
+
+    def relative(match):
+        number = int(match.group(1))
+        start = starts[bisect(starts, number) - 1]
+        return match.group(0).replace(match.group(1),
+                                      str(number - start + 1).encode('ascii'))
+
+    index = bisect(starts, int(frame.group(1))) - 1
+    return index, STDIN_FRAME.sub(relative, err)
+
+
+def run_commands(commands, serial, raw_paste=None, budget=None):
+    """
+    Sends each command to a device that is already in raw mode.
+
+    Consecutive commands are joined into submissions of up to budget bytes
+    (COALESCE_SIZE if None) to save a round trip per command. If a joined
+    submission fails to compile nothing in it ran, so its commands are sent
+    again one at a time. Commands are uploaded with raw-paste mode when the
+    device supports it (raw_paste is None means find out, False means don't
+    try) and with the paced fallback otherwise.
+
+    Returns a tuple of the combined stdout and the stderr output from the
+    micro:bit, what was learned about raw-paste support, and the index of
+    the command that reported an error (or None). Stops at the first command
+    to report an error, and the error reads as if that command had been sent
+    on its own.
+    """
+    if budget is None:
+        budget = COALESCE_SIZE
+    result = b''
+    index = 0
+    for batch in coalesce(commands, budget):
+        header, raw_paste = submit(serial, '\n'.join(batch).encode('utf-8'),
+                                   raw_paste)
+        out, err = read_response(serial, header=header)
+        if err:
+            frame = STDIN_FRAME.search(err)
+            if len(batch) > 1 and not (frame and frame.group(2)):
+                out, err, raw_paste, failed = run_commands(batch, serial,
+                                                           raw_paste, 0)
+            else:
+                failed, err = attribute(err, batch)
+            if err:
+                return b'', err, raw_paste, index + failed
+        result += out
+        index += len(batch)
+    return result, b'', raw_paste, None
+
+
+def execute(commands, serial=None, deadline=None):
     """
     Sends the command to the connected micro:bit via serial and returns the
     result.
 
     For this to work correctly, a particular sequence of commands needs to be
     sent to put the device into a good state to process the incoming command.
+    If serial is a MicroFSSession the device is already in raw mode and is
+    left there afterwards.
+
+    If a Deadline is given and passes (or is cancelled) before the device
+    responds, the command is interrupted and OperationTimeout (or
+    OperationCancelled) is raised.
 
     Returns the stdout and stderr output from the micro:bit.
     """
+    if isinstance(serial, MicroFSSession):
+        with serial.limit(deadline):
+            return serial.execute(commands)
     if serial is None:
         serial = get_serial()
-    result = b''
-    raw_on(serial)
-    # Write the actual command and send CTRL-D to evaluate.
-    for command in commands:
-        command_bytes = command.encode('utf-8')
-        for i in range(0, len(command_bytes), 32):
-            serial.write(command_bytes[i:min(i + 32, len(command_bytes))])
-            time.sleep(0.01)
-        serial.write(b'\x04')
-        response = bytearray()
-        while not response.endswith(b'\x04>'):  # Read until prompt.
-            response.extend(serial.read_all())
-        out, err = response[2:-2].split(b'\x04', 1)  # Split stdout, stderr
-        result += out
-        if err:
-            return b'', err
-    raw_off(serial)
-    return result, err
+    if deadline is not None:
+        serial = DeadlineSerial(serial, deadline)
+    try:
+        raw_on(serial)
+        return run_commands(commands, serial)[:2]
+    except OperationAborted:
+        serial.write(b'\r\x03')
+        raise
+    finally:
+        raw_off(serial)
+
+
+def execute_iter(command, serial=None, deadline=None):
+    """
+    Sends a single command to the connected micro:bit and generates its
+    stdout in pieces as they arrive. The deadline works as for execute.
+
+    Raises an IOError if the command wrote anything to stderr.
+    """
+    if isinstance(serial, MicroFSSession):
+        with serial.limit(deadline):
+            for data in serial.execute_iter(command):
+                yield data
+        return
+    if serial is None:
+        serial = get_serial()
+    if deadline is not None:
+        serial = DeadlineSerial(serial, deadline)
+    try:
+        raw_on(serial)
+        header, _ = submit(serial, command.encode('utf-8'))
+        for data in iter_response(serial, header):
+            yield data
+    except OperationAborted:
+        serial.write(b'\r\x03')
+        raise
+    finally:
+        raw_off(serial)
 
 
 def clean_error(err):
@@ -131,13 +887,32 @@ def ls(serial):
     Returns a list of the files on the connected device or raises an IOError if
     there's a problem.
     """
-    out, err = execute([
-        'import os',
-        'print(os.listdir())',
-    ], serial)
+    if use_helper(serial):
+        commands = ['_mu.ls()']
+    else:
+        commands = ['import os', 'print(os.listdir())']
+    out, err = execute(commands, serial)
     if err:
         raise IOError(clean_error(err))
-    return ast.literal_eval(out.decode('utf-8'))
+    return [name for name in ast.literal_eval(out.decode('utf-8'))
+            if name != HELPER_NAME]
+
+
+def ls_details(serial):
+    """
+    Returns a tuple of an OrderedDict mapping the name of each file on the
+    connected device to its size in bytes, and the free space on the device
+    in bytes (or None if unknown). Both come from a single command.
+
+    Raises an IOError if there's a problem.
+    """
+    command = '_mu.d()' if use_helper(serial) else DETAILS_COMMAND
+    out, err = execute([command], serial)
+    if err:
+        raise IOError(clean_error(err))
+    files, free = ast.literal_eval(out.decode('utf-8'))
+    return OrderedDict((name, size) for name, size in files
+                       if name != HELPER_NAME), free
 
 
 def rm(serial, filename):
@@ -146,71 +921,1092 @@ def rm(serial, filename):
 
     Returns True for success or raises an IOError if there's a problem.
     """
-    commands = [
-        "import os",
-        "os.remove('{}')".format(filename),
-    ]
+    if use_helper(serial):
+        commands = ["_mu.rm('{}')".format(filename)]
+    else:
+        commands = [
+            "import os",
+            "os.remove('{}')".format(filename),
+        ]
     out, err = execute(commands, serial)
     if err:
         raise IOError(clean_error(err))
+    if isinstance(serial, MicroFSSession):
+        serial.update_listing(filename, None)
     return True
 
 
-def put(serial, filename):
+def encode_chunk(chunk, encoding=DEFAULT_ENCODING, compact=False):
+    """
+    Returns the device side command that checks and writes the chunk (a
+    memoryview) with the writer "w" from WRITER, using the referenced
+    encoding. If compact is True the helper module's writer is used instead,
+    which does the decoding itself.
+    """
+    checksum = zlib.adler32(chunk) & 0xffffffff
+    if encoding in ('base64', 'hex'):
+        if encoding == 'base64':
+            encoded = binascii.b2a_base64(chunk).strip()
+        else:
+            encoded = binascii.hexlify(chunk)
+        data = 'b\'' + encoded.decode('ascii') + '\''
+        if not compact:
+            data = 'u(' + data + ')'
+    elif PY2:
+        data = 'b' + repr(chunk.tobytes())
+    else:
+        data = repr(chunk.tobytes())
+    return '{}w({}, {}, {})'.format('_mu.' if compact else '', data,
+                                    checksum >> 16, checksum & 0xffff)
+
+
+def encode_chunks(content, encoding=DEFAULT_ENCODING, offset=0,
+                  compact=False):
+    """
+    Generates the device side commands needed to check and write the given
+    content (from offset onwards) to an open file using the referenced
+    encoding.
+
+    Slicing is done via a memoryview so the content is never copied on the
+    host.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError('Unknown encoding: {}'.format(encoding))
+    size = CHUNK_SIZES[encoding]
+    view = memoryview(content)
+    for i in range(offset, len(view), size):
+        yield encode_chunk(view[i:i + size], encoding, compact)
+
+
+def put_header(filename, encoding=DEFAULT_ENCODING, offset=0, compact=False):
+    """
+    Returns the list of device side commands that set up the decoder and
+    writer, and open the named file on the device for writing. If offset
+    isn't zero the file is appended to. If compact is True the helper module
+    does all of this.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError('Unknown encoding: {}'.format(encoding))
+    if compact:
+        return ["_mu.o('{}', {}, '{}')".format(filename, offset, encoding)]
+    commands = []
+    if ENCODINGS.get(encoding):
+        commands.append(ENCODINGS[encoding])
+    commands.extend([
+        WRITER.format(offset),
+        "fd = open('{}', '{}')".format(filename, 'ab' if offset else 'wb'),
+        "f = fd.write",
+    ])
+    return commands
+
+
+def put_commands(filename, content, encoding=DEFAULT_ENCODING,
+                 compact=False):
+    """
+    Returns the list of device side commands that write the content to the
+    named file on the device using the referenced encoding (and the helper
+    module, if compact is True).
+    """
+    commands = put_header(filename, encoding, compact=compact)
+    commands.extend(encode_chunks(content, encoding, compact=compact))
+    commands.append('_mu.c()' if compact else 'fd.close()')
+    return commands
+
+
+def file_checksum(serial, filename):
+    """
+    Returns a tuple of the size and Adler-32 checksum of the named file, as
+    computed on the device, or None if there's no such file.
+    """
+    if use_helper(serial):
+        command = "_mu.hf('{}')".format(filename)
+    else:
+        command = FILE_HASH_COMMAND.format(filename)
+    out, err = execute([command], serial)
+    if err:
+        raise IOError(clean_error(err))
+    found = ast.literal_eval(out.decode('utf-8'))
+    if found is None:
+        return None
+    name, b, a, size = found
+    return size, (b << 16) | a
+
+
+def resume_offset(serial, filename, content):
+    """
+    Returns how many bytes at the start of the content are already in the
+    named file on the device (left there by a put that failed part way
+    through), or 0 if the file doesn't start the same way.
+    """
+    found = file_checksum(serial, filename)
+    if found:
+        size, checksum = found
+        if size <= len(content) and \
+                zlib.adler32(content[:size]) & 0xffffffff == checksum:
+            return size
+    return 0
+
+
+def write_file(session, filename, content, encoding=DEFAULT_ENCODING,
+               offset=0, chunk_size=None):
+    """
+    Writes the content, from offset onwards, to the named file on the device
+    a checksummed chunk of up to chunk_size bytes (CHUNK_SIZES for the
+    encoding if None) at a time. The header, chunks and closing command
+    are all passed to a single execute, which joins them into as few
+    submissions as it can.
+
+    A rejected command is sent again (along with everything after it), from
+    the offset the device reached, up to RETRIES times in a row without
+    progress. Any error is taken to mean the command was garbled on the way,
+    bar the device lacking ubinascii or failing to open the file. Once the
+    header has failed it's sent a command at a time before the chunks, and
+    chunks are halved in size after each rejection and grow back as they
+    succeed. If the file can't be appended to (the micro:bit's file system
+    rejects the mode with a ValueError) it's written afresh.
+
+    Returns the stderr output of the command that failed, if any.
+    """
+    compact = use_helper(session)
+    header = put_header(filename, encoding, offset, compact)
+    close = '_mu.c()' if compact else 'fd.close()'
+    view = memoryview(content)
+    max_size = size = chunk_size or CHUNK_SIZES[encoding]
+    failures = 0
+
+    def chunks(offset, size):
+        while offset < len(view):
+            yield encode_chunk(view[offset:offset + size], encoding, compact)
+            offset += size
+            size = min(max_size, size * 2)
+
+    while True:
+        if header and failures:
+            # Less is garbled in shorter submissions.
+            out, err, failed = session.run(header, 0)
+            if not err:
+                header = []
+                failures = 0
+                continue
+        else:
+            commands = header + list(chunks(offset, size)) + [close]
+            out, err, failed = session.run(commands)
+            if not err:
+                return None
+        failures += 1
+        if failed < len(header):
+            # The file isn't open.
+            if b"no module named 'ubinascii'" in err:
+                return err
+            if b'OSError' in err or b'ValueError' in err:
+                if offset:
+                    return write_file(session, filename, content, encoding,
+                                      chunk_size=chunk_size)
+                return err
+            if failures > RETRIES:
+                return err
+            continue
+        header = []
+        if b'OSError' in err:
+            return err
+        out, problem = session.execute(['print(_mu.n)' if compact else
+                                        'print(n)'])
+        if problem:
+            return problem
+        reached = int(out)
+        if reached > offset:
+            failures = 1
+        if failures > RETRIES:
+            return err
+        # Shorter commands are less likely to be garbled again.
+        size = max(MIN_CHUNK_SIZE, size // 2)
+        offset = reached
+
+
+def put(serial, filename, encoding=DEFAULT_ENCODING, verify=False,
+        resume=False, chunk_size=None):
     """
     Puts a referenced file on the LOCAL file system onto the
     file system on the BBC micro:bit.
 
+    The encoding ('base64', 'hex' or 'repr') determines how the content is
+    represented on the wire. The first two are decoded on the device with
+    ubinascii and are far more compact for binary data. If the firmware has
+    no ubinascii module the transfer falls back to 'repr' (and a session
+    remembers to use 'repr' from then on).
+
+    The device checks each chunk against its checksum before writing it, and
+    a chunk that arrives garbled is sent again (see write_file). If resume is
+    True and the device already has the start of the file, from an earlier
+    put that failed, only the rest is sent. If verify is True the checksum of
+    the whole file is checked on the device once it's written. Each chunk
+    holds up to chunk_size bytes (CHUNK_SIZES for the encoding if None).
+
     Returns True for success or raises an IOError if there's a problem.
     """
     if not os.path.isfile(filename):
         raise IOError('No such file.')
     with open(filename, 'rb') as local:
         content = local.read()
-    filename = os.path.basename(filename)
-    commands = [
-        "fd = open('{}', 'wb')".format(filename),
-        "f = fd.write",
-    ]
-    while content:
-        line = content[:64]
+    name = os.path.basename(filename)
+    session = use_session(serial)
+    encoding = transfer_encoding(session, encoding)
+    try:
+        offset = resume_offset(session, name, content) if resume else 0
+        err = write_file(session, name, content, encoding, offset,
+                         chunk_size)
+        if err and b'ImportError' in err and encoding != 'repr':
+            # No ubinascii on the device, so fall back to the slow but safe
+            # way (with chunks sized for it) from now on.
+            session.ubinascii = False
+            return put(session, filename, 'repr', verify, resume)
+        if err:
+            raise IOError(clean_error(err))
+        if encoding != 'repr':
+            session.ubinascii = True
+        session.update_listing(name, len(content))
+        if verify:
+            expected = (len(content), zlib.adler32(content) & 0xffffffff)
+            if file_checksum(session, name) != expected:
+                raise IOError('Verification of {} failed.'.format(name))
+    finally:
+        if session is not serial:
+            session.close()
+    return True
+
+
+def get_command(filename, encoding=DEFAULT_ENCODING,
+                block_size=GET_BLOCK_SIZE, compact=False):
+    """
+    Returns the device side command that prints the content of the named file
+    as one encoded bytes literal per block of at most block_size bytes. If
+    compact is True the helper module does the work.
+    """
+    if encoding not in GET_ENCODERS:
+        raise ValueError('Unknown encoding: {}'.format(encoding))
+    if compact:
+        return "_mu.g('{}', '{}', {})".format(filename, encoding, block_size)
+    return '\n'.join([
+        GET_ENCODERS[encoding],
+        "f = open('{}', 'rb')".format(filename),
+        "r = f.read",
+        "while True:",
+        "    b = r({})".format(block_size),
+        "    if not b:",
+        "        break",
+        "    print(e(b))",
+        "f.close()",
+    ])
+
+
+def decode_line(line, encoding=DEFAULT_ENCODING):
+    """
+    Returns the block of file content represented by a line of output from
+    the command built by get_command.
+    """
+    line = ast.literal_eval(line.strip().decode('ascii'))
+    if encoding == 'base64':
+        return binascii.a2b_base64(line)
+    elif encoding == 'hex':
+        return binascii.unhexlify(line)
+    return line
+
+
+def get_iter(serial, filename, encoding=DEFAULT_ENCODING,
+             block_size=GET_BLOCK_SIZE):
+    """
+    Generates the content of a referenced file on the device's file system in
+    blocks of at most block_size bytes, for piping into other consumers.
+
+    On the device each block is encoded ('base64', 'hex' or 'repr') and
+    printed as a line of its own, so binary content can't be confused with
+    the raw mode framing. Only one line is ever held in memory. If the
+    firmware has no ubinascii module the transfer falls back to 'repr' (and a
+    session remembers to use 'repr' from then on).
+
+    Raises an IOError if there's a problem.
+    """
+    encoding = transfer_encoding(serial, encoding)
+    command = get_command(filename, encoding, block_size,
+                          use_helper(serial))
+    pending = b''
+    try:
+        for data in execute_iter(command, serial):
+            lines = (pending + data).split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield decode_line(line, encoding)
+        if encoding != 'repr' and isinstance(serial, MicroFSSession):
+            serial.ubinascii = True
+    except IOError as ex:
+        if 'ImportError' not in str(ex) or encoding == 'repr':
+            raise
+        # No ubinascii on the device, so fall back to the slow but safe way.
+        if isinstance(serial, MicroFSSession):
+            serial.ubinascii = False
+        for block in get_iter(serial, filename, 'repr', block_size):
+            yield block
+
+
+@contextmanager
+def replacing(target):
+    """
+    Yields a file, open for writing bytes, whose content replaces the target
+    once the with block finishes. It's written to a temporary file in the
+    target's directory, so if the block raises an exception only the
+    temporary file is removed and any existing target is left as it was.
+    """
+    directory, name = os.path.split(os.path.abspath(target))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temporary = os.path.join(directory, '.{}.{:08x}.part'.format(
+            name, random.getrandbits(32)))
+        try:
+            fd = os.open(temporary, flags, 0o666)
+            break
+        except OSError as ex:
+            if ex.errno != errno.EEXIST:
+                raise
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
         if PY2:
-            commands.append('f(b' + repr(line) + ')')
+            if os.path.exists(target):
+                os.remove(target)
+            os.rename(temporary, target)
         else:
-            commands.append('f(' + repr(line) + ')')
-        content = content[64:]
-    commands.append('fd.close()')
-    out, err = execute(commands, serial)
-    if err:
-        raise IOError(clean_error(err))
-    return True
+            os.replace(temporary, target)
+    except BaseException:
+        os.remove(temporary)
+        raise
 
 
-def get(serial, filename, target=None):
+def get(serial, filename, target=None, callback=None,
+        encoding=DEFAULT_ENCODING):
     """
     Gets a referenced file on the device's file system and copies it to the
     target (or current working directory if unspecified).
 
+    The file is written as it arrives, to a temporary file that replaces the
+    target once it's complete (see replacing), so an error leaves any
+    existing target as it was. If given, callback is called with the
+    filename and the number of bytes received so far after each block.
+
     Returns True for success or raises an IOError if there's a problem.
     """
     if target is None:
         target = filename
-    commands = [
-        "from microbit import uart",
-        "f = open('{}', 'rb')".format(filename),
-        "r = f.read",
-        "result = True",
-        "while result:\n    result = r(32)\n    if result:\n        "
-        "uart.write(result)\n",
-        "f.close()",
-    ]
+    received = 0
+    with replacing(target) as f:
+        for block in get_iter(serial, filename, encoding):
+            f.write(block)
+            received += len(block)
+            if callback:
+                callback(filename, received)
+    return True
+
+
+def use_helper(serial):
+    """
+    Returns True if serial is a MicroFSSession with the helper module loaded
+    on its device, so operations can use the compact commands.
+    """
+    return isinstance(serial, MicroFSSession) and serial.has_helper()
+
+
+def transfer_encoding(serial, encoding):
+    """
+    Returns the encoding to use for a transfer through serial: 'repr' if
+    serial is a MicroFSSession whose device is known to lack ubinascii,
+    otherwise the encoding asked for.
+    """
+    if isinstance(serial, MicroFSSession) and serial.ubinascii is False:
+        return 'repr'
+    return encoding
+
+
+def load_helper(session):
+    """
+    Imports the helper module on the session's device, first installing it
+    (or replacing an old version) if need be. The module's version is checked
+    with a single short command, so this costs next to nothing once it's
+    installed.
+
+    Returns True if the helper module is ready to use.
+    """
+    expected = str(HELPER_VERSION).encode('ascii')
+    out, err = session.execute(['import _mu\nprint(_mu.V)'])
+    if not err and out.strip() == expected:
+        return True
+    content = HELPER_SOURCE.encode('utf-8')
+    checksum = (len(content), zlib.adler32(content) & 0xffffffff)
+    if file_checksum(session, HELPER_NAME) != checksum:
+        encoding = transfer_encoding(session, DEFAULT_ENCODING)
+        err = write_file(session, HELPER_NAME, content, encoding)
+        if err and b'ImportError' in err and encoding != 'repr':
+            session.ubinascii = False
+            err = write_file(session, HELPER_NAME, content, 'repr')
+        if err:
+            return False
+        # The helper takes up space the cached listing doesn't know about.
+        session.invalidate()
+    out, err = session.execute([HELPER_IMPORT])
+    return not err and out.strip() == expected
+
+
+def use_session(serial):
+    """
+    Returns serial if it's already a MicroFSSession, otherwise a new session
+    using it (which the caller must close once finished).
+    """
+    if isinstance(serial, MicroFSSession):
+        return serial
+    return MicroFSSession(serial)
+
+
+def batch(serial, operation, items):
+    """
+    Calls operation(session, item) for each item using a single raw mode
+    session on the referenced serial object (which may itself be a session).
+
+    Returns an OrderedDict mapping each item to the operation's result, or to
+    the IOError it raised.
+    """
+    session = use_session(serial)
+    results = OrderedDict()
+    try:
+        for item in items:
+            try:
+                results[item] = operation(session, item)
+            except IOError as ex:
+                results[item] = ex
+    finally:
+        if session is not serial:
+            session.close()
+    return results
+
+
+def rm_many(serial, filenames):
+    """
+    Removes each of the referenced files on the micro:bit with a single
+    command.
+
+    Returns an OrderedDict mapping each filename to True for success or to
+    an IOError describing the problem.
+    """
+    names = ', '.join("'{}'".format(f) for f in filenames)
+    if use_helper(serial):
+        commands = ['_mu.rmm([{}])'.format(names)]
+    else:
+        commands = [
+            "import os",
+            "r = []",
+            "for n in [{}]:\n"
+            "    try:\n"
+            "        os.remove(n)\n"
+            "    except OSError:\n"
+            "        r.append(n)\n".format(names),
+            "print(r)",
+        ]
     out, err = execute(commands, serial)
     if err:
         raise IOError(clean_error(err))
-    # Recombine the bytes while removing "b'" from start and "'" from end.
-    with open(target, 'wb') as f:
-        f.write(out)
-    return True
+    failed = ast.literal_eval(out.decode('utf-8'))
+    results = OrderedDict()
+    for filename in filenames:
+        if filename in failed:
+            results[filename] = IOError('Could not remove {}.'.format(
+                filename))
+        else:
+            results[filename] = True
+            if isinstance(serial, MicroFSSession):
+                serial.update_listing(filename, None)
+    return results
+
+
+def pack(filenames, encoding=DEFAULT_ENCODING, compact=False):
+    """
+    Groups the referenced LOCAL files for put_many. Consecutive files whose
+    commands come to less than PACK_SIZE bytes share a group, and any other
+    file (too big, or missing) has a group of its own with commands of None.
+
+    Returns a tuple of the list of (filenames, commands) groups and a dict
+    mapping each file found to its size and Adler-32 checksum.
+    """
+    groups = []
+    group_size = PACK_SIZE
+    checksums = {}
+    for filename in filenames:
+        commands = None
+        if os.path.isfile(filename):
+            with open(filename, 'rb') as local:
+                content = local.read()
+            checksums[filename] = (len(content),
+                                   zlib.adler32(content) & 0xffffffff)
+            commands = put_commands(os.path.basename(filename), content,
+                                    encoding, compact)
+        size = sum(len(c) for c in commands) if commands else PACK_SIZE
+        if group_size + size < PACK_SIZE:
+            groups[-1][0].append(filename)
+            groups[-1][1].extend(commands)
+            group_size += size
+        elif size < PACK_SIZE:
+            groups.append(([filename], commands))
+            group_size = size
+        else:
+            # Too big to pack (or missing), so it gets a group of its own.
+            groups.append(([filename], None))
+            group_size = PACK_SIZE
+    return groups, checksums
+
+
+def put_many(serial, filenames, encoding=DEFAULT_ENCODING, verify=False):
+    """
+    Puts each of the referenced files on the LOCAL file system onto the
+    device in a single raw mode session. If verify is True the checksum of
+    each file is checked on the device once it's written.
+
+    Consecutive files whose commands come to less than PACK_SIZE bytes are
+    packed into a single submission (see pack). If a packed group fails its
+    files are retried one at a time so the problem is attributed to the right
+    file. Whether the device has ubinascii is found out before the files are
+    packed, so no group is sent in an encoding it can't decode.
+
+    Returns an OrderedDict mapping each filename to True for success or to
+    an IOError describing the problem.
+    """
+    session = use_session(serial)
+    try:
+        compact = use_helper(session)
+        if encoding != 'repr' and not session.has_ubinascii():
+            encoding = 'repr'
+        groups, checksums = pack(filenames, encoding, compact)
+
+        def put_group(session, index):
+            names, commands = groups[index]
+            if commands is not None:
+                out, err = session.execute(['\n'.join(commands)])
+                if not err:
+                    results = []
+                    for name in names:
+                        basename = os.path.basename(name)
+                        session.update_listing(basename, checksums[name][0])
+                        result = True
+                        if verify and file_checksum(session, basename) != \
+                                checksums[name]:
+                            result = IOError(
+                                'Verification of {} failed.'.format(basename))
+                        results.append((name, result))
+                    return results
+            return batch(session,
+                         lambda s, name: put(s, name, encoding, verify),
+                         names).items()
+
+        group_results = batch(session, put_group, range(len(groups)))
+    finally:
+        if session is not serial:
+            session.close()
+    results = OrderedDict()
+    for index, result in group_results.items():
+        if isinstance(result, IOError):
+            for name in groups[index][0]:
+                results[name] = result
+        else:
+            results.update(result)
+    return results
+
+
+def get_many(serial, filenames, target=None, callback=None,
+             encoding=DEFAULT_ENCODING):
+    """
+    Gets each of the referenced files on the device's file system in a single
+    raw mode session and copies them into the target directory (or current
+    working directory if unspecified).
+
+    Returns an OrderedDict mapping each filename to True for success or to
+    an IOError describing the problem.
+    """
+    def get_file(session, filename):
+        local = filename
+        if target is not None:
+            local = os.path.join(target, filename)
+        return get(session, filename, local, callback, encoding)
+
+    return batch(serial, get_file, filenames)
+
+
+def hashes(serial):
+    """
+    Returns a dict mapping the name of each file on the device to its
+    Adler-32 checksum, as computed on the device itself.
+    """
+    command = '_mu.hs()' if use_helper(serial) else HASH_COMMAND
+    out, err = execute([command], serial)
+    if err:
+        raise IOError(clean_error(err))
+    return dict((name, (b << 16) | a) for name, b, a, size in
+                ast.literal_eval(out.decode('utf-8')) if name != HELPER_NAME)
+
+
+def sync(serial, directory, delete=False, encoding=DEFAULT_ENCODING):
+    """
+    Makes the files on the device match those in the referenced LOCAL
+    directory. Checksums of the device's files are compared with those of the
+    local ones so only new or changed files are copied over. If delete is
+    True, files on the device that aren't in the directory are removed.
+
+    Returns an OrderedDict mapping the name of each file copied or removed to
+    True for success or to an IOError describing the problem.
+    """
+    local = OrderedDict()
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                local[name] = zlib.adler32(f.read()) & 0xffffffff
+    session = use_session(serial)
+    results = OrderedDict()
+    try:
+        remote = hashes(session)
+        changed = [name for name, checksum in local.items()
+                   if remote.get(name) != checksum]
+        paths = [os.path.join(directory, name) for name in changed]
+        for name, result in zip(changed, put_many(session, paths,
+                                                  encoding).values()):
+            results[name] = result
+        if delete:
+            orphans = sorted(name for name in remote if name not in local)
+            if orphans:
+                results.update(rm_many(session, orphans))
+    finally:
+        if session is not serial:
+            session.close()
+    return results
+
+
+def run_session(operation, serial, timeout=None):
+    """
+    Calls operation(session) with a MicroFSSession using the serial object,
+    within a deadline of timeout seconds (if given), and returns the result.
+    """
+    session = MicroFSSession(serial)
+    try:
+        with session.limit(Deadline(timeout)):
+            return operation(session)
+    finally:
+        session.close()
+
+
+def fleet(operation, ports=None, workers=None, connect=get_serial,
+          timeout=None):
+    """
+    Calls operation(session) for every connected device (or each of the
+    referenced ports) at the same time, with a MicroFSSession per port. For
+    example::
+
+        fleet(lambda session: put_many(session, ['main.py']))
+
+    A pool of worker threads (by default one per port) does the work, and
+    each port is opened with connect(port). Each device must finish within
+    timeout seconds (if given). Whatever goes wrong with one device is
+    recorded in its result and doesn't affect the others.
+
+    Returns an OrderedDict mapping each port to a DeviceResult.
+    """
+    if ports is None:
+        ports = find_upython_devices()
+    if not ports:
+        raise IOError('Could not find micro:bit.')
+
+    def work(port):
+        start = time.time()
+        try:
+            serial = connect(port)
+            try:
+                result = run_session(operation, serial, timeout)
+            finally:
+                serial.close()
+        except Exception as ex:
+            result = ex
+        return DeviceResult(result, time.time() - start)
+
+    pool = ThreadPool(workers or len(ports))
+    try:
+        results = pool.map(work, ports)
+    finally:
+        pool.close()
+        pool.join()
+    return OrderedDict(zip(ports, results))
+
+
+class MicroFSSession(object):
+    """
+    A connection to a device that is opened, and put into raw mode, only once
+    and then reused for any number of file system operations. The port and
+    raw mode are set up lazily on first use. For example::
+
+        with MicroFSSession() as session:
+            session.put('foo.py')
+            print(session.ls())
+
+    If a serial object is passed in the caller remains responsible for
+    closing it.
+
+    If the link to the device fails the port is released (see disconnect)
+    and the next operation connects afresh. If the device is reset while in
+    raw mode, the command that notices is sent again once raw mode has been
+    re-entered (see restart).
+
+    Each operation through the session must finish within timeout seconds
+    (if given), and the one under way can be stopped with cancel. In either
+    case the device is interrupted and taken out of raw mode, and the
+    operation raises OperationTimeout or OperationCancelled. Several
+    operations can share one Deadline with limit.
+
+    Unless helper is False, the helper module (see HELPER_BODY) is installed
+    on the device if need be and used to keep the commands short. Commands
+    are joined into submissions of up to budget bytes (COALESCE_SIZE if
+    None). A port the session opens itself is set to baudrate.
+    """
+
+    def __init__(self, serial=None, timeout=None, helper=True, budget=None,
+                 baudrate=transports.BAUDRATE):
+        self.serial = serial
+        self.owns_serial = serial is None
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.helper = helper
+        self.budget = budget
+        self.helper_ready = None
+        self.deadline = None
+        self.raw = False
+        self.raw_paste = None
+        self.ubinascii = None
+        self.device = None
+        self.invalidate()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def port(self):
+        """
+        The name of the port used by this session (or None if not yet open).
+        """
+        return self.serial.port if self.serial is not None else None
+
+    def connect(self):
+        """
+        Opens the port, unless it's already open, without entering raw mode.
+        """
+        if self.serial is None:
+            self.serial = get_serial(baudrate=self.baudrate)
+
+    def open(self):
+        """
+        Opens the port (if needed) and puts the device into raw mode unless
+        this session already did so.
+        """
+        self.connect()
+        if not self.raw:
+            banner = raw_on(self.link())
+            self.raw = True
+            # A reboot forgets the imported helper module.
+            self.helper_ready = None
+            rebooted = any(marker in banner for marker in REBOOT_MARKERS)
+            if rebooted or self.serial.port != self.device:
+                # The cached listing may no longer describe this device.
+                self.invalidate()
+                self.raw_paste = None
+                self.ubinascii = None
+            self.device = self.serial.port
+
+    def close(self):
+        """
+        Takes the device out of raw mode and releases the port. The cached
+        listing is kept, and is checked again when the port is next opened.
+        """
+        if self.serial is None:
+            return
+        if self.raw:
+            raw_off(self.serial)
+            self.raw = False
+        if self.owns_serial:
+            self.serial.close()
+            self.serial = None
+
+    def link(self):
+        """
+        Returns the serial object to use, wrapped to observe the deadline if
+        there is one.
+        """
+        if self.deadline is None:
+            return self.serial
+        return DeadlineSerial(self.serial, self.deadline)
+
+    @contextmanager
+    def limit(self, deadline=None):
+        """
+        Applies the Deadline (or, if None, a new one of timeout seconds) to
+        everything done through this session within the with block. Nested
+        blocks keep the outermost deadline.
+        """
+        if self.deadline is not None:
+            yield self.deadline
+            return
+        self.deadline = deadline or Deadline(self.timeout)
+        try:
+            yield self.deadline
+        finally:
+            self.deadline = None
+
+    def cancel(self):
+        """
+        Cancels the operation under way, if any. Safe to call from any
+        thread.
+        """
+        deadline = self.deadline
+        if deadline is not None:
+            deadline.cancel()
+
+    def recover(self):
+        """
+        Returns the device to a known state after an operation was stopped
+        part way through, by interrupting it and leaving raw mode.
+        """
+        self.serial.write(b'\r\x03')
+        raw_off(self.serial)
+        self.raw = False
+        self.helper_ready = None
+        if hasattr(self.serial, 'reset_input_buffer'):
+            self.serial.reset_input_buffer()
+
+    def disconnect(self):
+        """
+        Gives up on a port that failed: releases it (if this session opened
+        it) without talking to the device, and forgets everything known about
+        the device, so the next operation connects and enters raw mode again.
+        """
+        self.raw = False
+        self.helper_ready = None
+        self.raw_paste = None
+        self.ubinascii = None
+        self.device = None
+        self.invalidate()
+        if self.owns_serial and self.serial is not None:
+            try:
+                self.serial.close()
+            except (IOError, OSError):
+                pass
+            self.serial = None
+
+    def run(self, commands, budget=None):
+        """
+        Runs the commands on the device (without leaving raw mode), joined
+        into submissions of up to budget bytes (the session's budget if
+        None).
+
+        Returns a tuple of the stdout and stderr output and the index of the
+        command that failed (or None).
+        """
+        if budget is None:
+            budget = self.budget
+        with self.limit():
+            try:
+                self.open()
+                out, err, self.raw_paste, failed = run_commands(
+                    commands, self.link(), self.raw_paste, budget)
+                if self.lost_state(out + err):
+                    self.restart()
+                    out, err, self.raw_paste, failed = run_commands(
+                        commands, self.link(), self.raw_paste, budget)
+            except OperationAborted:
+                self.recover()
+                raise
+            except IOError:
+                self.disconnect()
+                raise
+        return out, err, failed
+
+    def execute(self, commands):
+        """
+        Runs the commands on the device (without leaving raw mode) and
+        returns the stdout and stderr output.
+        """
+        return self.run(commands)[:2]
+
+    def execute_iter(self, command):
+        """
+        Runs a single command on the device (without leaving raw mode) and
+        generates its stdout in pieces as they arrive.
+        """
+        with self.limit():
+            try:
+                for attempt in range(2):
+                    self.open()
+                    serial = self.link()
+                    header, self.raw_paste = submit(serial,
+                                                    command.encode('utf-8'),
+                                                    self.raw_paste)
+                    try:
+                        for data in iter_response(serial, header):
+                            yield data
+                        return
+                    except DeviceError as ex:
+                        # A compact command fails before it prints anything.
+                        if attempt or not self.lost_state(
+                                str(ex).encode('utf-8')):
+                            raise
+                    self.restart()
+            except OperationAborted:
+                self.recover()
+                raise
+            except DeviceError:
+                raise
+            except IOError:
+                self.disconnect()
+                raise
+
+    def lost_state(self, output):
+        """
+        Returns True if the output of a command shows the device was reset
+        while in raw mode: it mentions a reboot, or the helper module this
+        session imported is no longer defined.
+        """
+        if any(marker in output for marker in REBOOT_MARKERS):
+            return True
+        return bool(self.helper_ready and HELPER_LOST.search(output))
+
+    def restart(self):
+        """
+        Forgets everything known about a device that was reset (raw mode, the
+        imported helper module and the cached listing), then enters raw mode
+        again and, if it was in use, loads the helper module again.
+        """
+        helper_ready = self.helper_ready
+        self.raw = False
+        self.helper_ready = None
+        self.invalidate()
+        self.open()
+        if helper_ready:
+            self.has_helper()
+
+    def has_helper(self):
+        """
+        Returns True if the helper module is ready to use on the device,
+        loading it (see load_helper) the first time it's asked for after
+        entering raw mode. If it can't be loaded the verbose commands are used
+        instead.
+        """
+        if not self.helper:
+            return False
+        with self.limit():
+            try:
+                self.open()
+                if self.helper_ready is None:
+                    # Loading uses the verbose commands.
+                    self.helper_ready = False
+                    self.helper_ready = load_helper(self)
+            except OperationAborted:
+                raise
+            except IOError:
+                pass
+        return bool(self.helper_ready)
+
+    def has_ubinascii(self):
+        """
+        Returns True if the device has the ubinascii module, asking it (with
+        a single short command) only if no transfer has found out yet.
+        """
+        if self.ubinascii is None:
+            out, err = self.execute(['import ubinascii'])
+            self.ubinascii = not err
+        return self.ubinascii
+
+    def invalidate(self):
+        """
+        Forgets the cached listing of the device's files.
+        """
+        self.files = None
+        self.free = None
+
+    def details(self, refresh=False):
+        """
+        Returns a tuple of an OrderedDict mapping the name of each file on the
+        device to its size, and the device's free space (or None if unknown).
+
+        The result is cached, and kept up to date as files are put and
+        removed through this session, so the device is only asked when
+        nothing is cached or refresh is True.
+        """
+        if refresh or self.files is None:
+            with self.limit():
+                self.files, self.free = ls_details(self)
+        return self.files, self.free
+
+    def update_listing(self, filename, size):
+        """
+        Optimistically updates the cached listing after the named file was
+        written with size bytes (or removed, if size is None).
+        """
+        if self.files is None:
+            return
+        old_size = self.files.pop(filename, 0)
+        if size is not None:
+            self.files[filename] = size
+        if self.free is not None:
+            self.free = max(0, self.free + old_size - (size or 0))
+
+    def ls(self, refresh=False):
+        """
+        Returns a list of the files on the device.
+        """
+        return list(self.details(refresh)[0])
+
+    def rm(self, filename):
+        """
+        Removes the referenced file from the device.
+        """
+        with self.limit():
+            return rm(self, filename)
+
+    def put(self, filename, encoding=DEFAULT_ENCODING, verify=False,
+            resume=False, chunk_size=None):
+        """
+        Copies the referenced local file onto the device.
+        """
+        with self.limit():
+            return put(self, filename, encoding, verify, resume, chunk_size)
+
+    def get(self, filename, target=None, callback=None,
+            encoding=DEFAULT_ENCODING):
+        """
+        Copies the referenced file on the device to the local file system.
+        """
+        with self.limit():
+            return get(self, filename, target, callback, encoding)
+
+    def get_iter(self, filename, encoding=DEFAULT_ENCODING,
+                 block_size=GET_BLOCK_SIZE):
+        """
+        Generates the content of the referenced file on the device in blocks.
+        """
+        with self.limit():
+            for block in get_iter(self, filename, encoding, block_size):
+                yield block
+
+
+def print_results(results):
+    """
+    Prints the problems, if any, reported by one of the batch operations.
+    """
+    for filename, result in results.items():
+        if result is not True:
+            print('{}: {}'.format(filename, result))
 
 
 def main(argv=None):
@@ -226,36 +2022,112 @@ def main(argv=None):
     try:
         parser = argparse.ArgumentParser(description=_HELP_TEXT)
         parser.add_argument('command', nargs='?', default=None,
-                            help="One of 'ls', 'rm', 'put' or 'get'.")
-        parser.add_argument('path', nargs='?', default=None,
-                            help="Use when a file needs referencing.")
+                            help="One of 'ls', 'rm', 'put', 'get', 'sync', "
+                                 "'bench' or 'probe'.")
+        parser.add_argument('path', nargs='*', default=None,
+                            help="Use when one or more files need "
+                                 "referencing.")
+        parser.add_argument('--delete', action='store_true',
+                            help="With 'sync', remove files on the device "
+                                 "that aren't in the directory.")
+        parser.add_argument('--verify', action='store_true',
+                            help="With 'put', check each file on the device "
+                                 "once written.")
+        parser.add_argument('--timeout', type=float, default=None,
+                            help="Give up after this many seconds.")
+        parser.add_argument('--all', action='store_true',
+                            help="Run the command on every connected "
+                                 "device (or every --port) at once.")
+        parser.add_argument('--port', action='append', default=None,
+                            help="The device to use: a serial port or a URL "
+                                 "such as socket://host:port, loop:// or "
+                                 "pty:command.")
+        parser.add_argument('--simulate', action='store_true',
+                            help="With 'bench', use a simulated device.")
+        parser.add_argument('--baudrate', type=int,
+                            default=transports.BAUDRATE,
+                            help="The baud rate of serial ports.")
         args = parser.parse_args(argv)
+
+        def connect(port=None):
+            return get_serial(port, args.baudrate)
+
         if args.command == 'ls':
-            with get_serial() as serial:
-                list_of_files = ls(serial)
+            operation = ls
+
+            def show(list_of_files):
                 if list_of_files:
                     print(' '.join(list_of_files))
         elif args.command == 'rm':
-            if args.path:
-                with get_serial() as serial:
-                    rm(serial, args.path)
-            else:
+            if not args.path:
                 print('rm: missing filename. (e.g. "ufs rm foo.txt")')
+                return
+
+            def operation(serial):
+                return rm_many(serial, args.path)
+            show = print_results
         elif args.command == 'put':
-            if args.path:
-                with get_serial() as serial:
-                    put(serial, args.path)
-            else:
+            if not args.path:
                 print('put: missing filename. (e.g. "ufs put foo.txt")')
+                return
+
+            def operation(serial):
+                return put_many(serial, args.path, verify=args.verify)
+            show = print_results
         elif args.command == 'get':
-            if args.path:
-                with get_serial() as serial:
-                    get(serial, args.path)
-            else:
+            if not args.path:
                 print('get: missing filename. (e.g. "ufs get foo.txt")')
+                return
+
+            def operation(serial):
+                target = None
+                if args.all:
+                    # Keep each device's copies apart.
+                    target = os.path.basename(serial.port)
+                    if not os.path.isdir(target):
+                        os.makedirs(target)
+                return get_many(serial, args.path, target)
+            show = print_results
+        elif args.command == 'sync':
+            directory = args.path[0] if args.path else '.'
+
+            def operation(serial):
+                return sync(serial, directory, args.delete)
+
+            def show(results):
+                for filename, result in results.items():
+                    if result is True:
+                        print(filename)
+                print_results(results)
+        elif args.command == 'bench':
+            from mu.contrib import microbench, microsim
+            if args.simulate:
+                serial = microsim.SimulatedDevice(baudrate=args.baudrate)
+            else:
+                serial = connect(args.port[0] if args.port else None)
+            with serial:
+                print(microbench.report(microbench.run(serial)))
+            return
+        elif args.command == 'probe':
+            for port in args.port or find_upython_devices():
+                print('{}: {}'.format(port, probe_baudrate(port)))
+            return
         else:
             # Display some help.
             parser.print_help()
+            return
+        if args.all or args.port and len(args.port) > 1:
+            results = fleet(operation, args.port, connect=connect,
+                            timeout=args.timeout)
+            for port, (result, seconds) in results.items():
+                print('{} ({:.2f}s):'.format(port, seconds))
+                if isinstance(result, Exception):
+                    print(result)
+                else:
+                    show(result)
+        else:
+            with connect(args.port[0] if args.port else None) as serial:
+                show(run_session(operation, serial, args.timeout))
     except Exception as ex:
         # The exception of no return. Print exception information.
         print(ex)
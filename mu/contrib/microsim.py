@@ -0,0 +1,580 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains a simulated MicroPython device for exercising microfs
+(and anything else that speaks the raw REPL protocol) without a physical
+BBC micro:bit attached.
+
+A SimulatedDevice is an in-process stand-in for a pyserial Serial object. It
+implements the normal and raw REPL (CTRL-A/B/C/D, the "OK" and \\x04 framing
+and flow controlled raw-paste mode) and runs each submitted command in
+CPython against a sandboxed in-memory file system. For example::
+
+    from mu.contrib import microfs, microsim
+
+    device = microsim.SimulatedDevice(files={'main.py': b'print(1)'})
+    with microfs.MicroFSSession(device) as session:
+        print(session.ls())
+
+Baud rate throttling and a small UART receive buffer (with a per byte
+processing time on the device) can be configured to model a real link,
+including data lost to buffer overflows.
+"""
+from __future__ import print_function
+import binascii
+import errno
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+import types
+from collections import deque
+
+
+__all__ = ['SimulatedDevice']
+
+
+#: The banner printed when the device starts (or leaves raw mode).
+BANNER = (b'MicroPython v1.9.2 on 2017-09-01; simulated BBC micro:bit with '
+          b'CPython\r\nType "help()" for more information.\r\n')
+
+
+#: Printed when raw mode is entered.
+RAW_BANNER = b'raw REPL; CTRL-B to exit\r\n>'
+
+
+#: The size of the window used by raw-paste flow control.
+RAW_PASTE_WINDOW = 128
+
+
+#: The size in bytes of a block in the simulated file system.
+BLOCK_SIZE = 128
+
+
+#: Maps each byte to what arrives when the two ends of the link disagree
+#: about the baud rate.
+GARBLED = bytes(bytearray(b ^ 0x5a for b in range(256)))
+
+
+#: Seconds main waits for input before checking for output again.
+POLL_INTERVAL = 0.01
+
+
+class SimulatedFile(object):
+    """
+    A file opened on the simulated device's file system.
+    """
+
+    def __init__(self, device, name, mode):
+        self.device = device
+        self.name = name
+        if 'a' in mode and not device.append:
+            # The micro:bit's file system can't append to files.
+            raise ValueError('illegal mode')
+        self.binary = 'b' in mode
+        self.writable = 'w' in mode or 'a' in mode
+        self.position = 0
+        if 'w' in mode or ('a' in mode and name not in device.files):
+            self.device.store(name, b'')
+        elif name not in device.files:
+            raise OSError(errno.ENOENT, 'ENOENT')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        line = self.readline()
+        while line:
+            yield line
+            line = self.readline()
+
+    def read(self, size=-1):
+        content = self.device.files[self.name]
+        if size is None or size < 0:
+            size = len(content) - self.position
+        data = content[self.position:self.position + size]
+        self.position += len(data)
+        return data if self.binary else data.decode('utf-8')
+
+    def readline(self):
+        content = self.device.files[self.name]
+        end = content.find(b'\n', self.position)
+        end = len(content) if end < 0 else end + 1
+        data = content[self.position:end]
+        self.position = end
+        return data if self.binary else data.decode('utf-8')
+
+    def write(self, data):
+        if not self.writable:
+            raise OSError(errno.EBADF, 'EBADF')
+        if not isinstance(data, (bytes, bytearray)):
+            data = data.encode('utf-8')
+        self.device.store(self.name, self.device.files[self.name] + data)
+        return len(data)
+
+    def close(self):
+        pass
+
+
+class SimulatedOS(object):
+    """
+    The os module as seen by code running on the simulated device. It has
+    both the micro:bit's os.size and the os.stat / os.statvfs of other
+    MicroPython ports.
+    """
+
+    def __init__(self, device):
+        self.device = device
+
+    def listdir(self, path=''):
+        return list(self.device.files)
+
+    def remove(self, name):
+        if name not in self.device.files:
+            raise OSError(errno.ENOENT, 'ENOENT')
+        del self.device.files[name]
+
+    def size(self, name):
+        if name not in self.device.files:
+            raise OSError(errno.ENOENT, 'ENOENT')
+        return len(self.device.files[name])
+
+    def stat(self, name):
+        return (0x8000, 0, 0, 0, 0, 0, self.size(name), 0, 0, 0)
+
+    def statvfs(self, path):
+        blocks = self.device.capacity // BLOCK_SIZE
+        free = blocks - self.device.used_blocks()
+        return (BLOCK_SIZE, BLOCK_SIZE, blocks, free, free, 0, 0, 0, 0, 255)
+
+    def uname(self):
+        return ('microbit', 'microbit', '1.9.2', 'simulated', 'simulated')
+
+
+class SimulatedUART(object):
+    """
+    The microbit.uart object, writing straight to the device's stdout.
+    """
+
+    def __init__(self, device):
+        self.device = device
+
+    def init(self, baudrate=9600, **kwargs):
+        # The REPL shares the UART, so it changes speed too.
+        self.device.uart_baudrate = baudrate
+
+    def write(self, data):
+        if not isinstance(data, (bytes, bytearray)):
+            data = data.encode('utf-8')
+        self.device.stdout.extend(data)
+
+
+class SimulatedModule(object):
+    """
+    A bare namespace standing in for a module on the simulated device.
+    """
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class SimulatedDevice(object):
+    """
+    An in-process stand-in for a serial connection to a MicroPython device.
+
+    * files - the initial content of the file system (name -> bytes).
+    * baudrate - if given, reads and writes take as long as they would on a
+      real link at this rate.
+    * uart_buffer - if given, the number of bytes the device can buffer
+      before further incoming bytes are lost.
+    * char_time - the time, in seconds, the device takes to consume each
+      byte from its buffer (only meaningful with uart_buffer).
+    * raw_paste - whether the firmware supports raw-paste mode.
+    * ubinascii - whether the firmware has the ubinascii module.
+    * append - whether files can be opened for appending (the micro:bit's
+      file system can't).
+    * capacity - the size of the file system in bytes.
+    * uart_baudrate - if given, the baud rate of the device's end of the
+      link. Everything is garbled while the host's baudrate differs.
+    """
+
+    def __init__(self, files=None, baudrate=None, uart_buffer=None,
+                 char_time=0.0, raw_paste=True, ubinascii=True,
+                 capacity=30 * 1024, timeout=1, port='sim',
+                 uart_baudrate=None, append=False):
+        self.files = dict(files or {})
+        self.baudrate = baudrate
+        self.uart_baudrate = uart_baudrate
+        self.uart_buffer = uart_buffer
+        self.char_time = char_time
+        self.raw_paste = raw_paste
+        self.ubinascii = ubinascii
+        self.append = append
+        self.capacity = capacity
+        self.timeout = timeout
+        self.port = port
+        self.is_open = True
+        #: Bytes lost to UART buffer overflows.
+        self.overflows = 0
+        #: Bytes received from, and sent to, the host.
+        self.bytes_in = 0
+        self.bytes_out = 0
+        #: Commands executed.
+        self.commands = 0
+        self.output = bytearray()
+        self.scheduled = deque()
+        self.stdout = bytearray()
+        self.line = bytearray()
+        self.mode = 'friendly'
+        self.pending = deque()
+        self.paste_count = 0
+        self.window = min(RAW_PASTE_WINDOW, uart_buffer or RAW_PASTE_WINDOW)
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # The host side, pyserial compatible API.
+
+    @property
+    def in_waiting(self):
+        self.release()
+        return len(self.output)
+
+    def write(self, data):
+        """
+        Sends data from the host to the device. Each byte is processed (as
+        the device would) as soon as it arrives.
+        """
+        data = bytes(data)
+        if self.garbled:
+            data = data.translate(GARBLED)
+        now = time.time()
+        byte_time = 10.0 / self.baudrate if self.baudrate else 0.0
+        for i in range(len(data)):
+            if self.uart_buffer is not None:
+                arrival = now + i * byte_time
+                while self.pending and self.pending[0] <= arrival:
+                    self.pending.popleft()
+                if len(self.pending) >= self.uart_buffer:
+                    self.overflows += 1
+                    continue
+                done = max(arrival, self.pending[-1] if self.pending else 0)
+                self.pending.append(done + self.char_time)
+            self.receive(data[i:i + 1])
+        self.bytes_in += len(data)
+        if byte_time:
+            time.sleep(len(data) * byte_time)
+        return len(data)
+
+    def read(self, size=1):
+        """
+        Reads up to size bytes sent by the device, waiting for the timeout if
+        nothing is available.
+        """
+        if not self.in_waiting:
+            self.wait()
+        data = bytes(self.output[:size])
+        del self.output[:size]
+        return self.sent(data)
+
+    def read_all(self):
+        self.release()
+        data = bytes(self.output)
+        del self.output[:]
+        return self.sent(data)
+
+    def read_until(self, expected=b'\n', size=None):
+        """
+        Reads up to and including expected (or size bytes), or whatever is
+        available once the timeout passes.
+        """
+        self.release()
+        end = self.output.find(expected)
+        while end < 0 and self.scheduled:
+            self.wait()
+            end = self.output.find(expected)
+        if end < 0:
+            self.wait()
+            end = len(self.output)
+        else:
+            end += len(expected)
+        if size is not None:
+            end = min(end, size)
+        data = bytes(self.output[:end])
+        del self.output[:end]
+        return self.sent(data)
+
+    def reset_input_buffer(self):
+        self.release()
+        del self.output[:]
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+    def wait(self):
+        """
+        Waits for the next scheduled output from the device or, if nothing is
+        coming, behaves like a read timing out.
+        """
+        if self.scheduled:
+            time.sleep(max(0, self.scheduled[0][0] - time.time()))
+        elif self.timeout:
+            time.sleep(self.timeout)
+        self.release()
+
+    def release(self):
+        """
+        Makes output whose scheduled time has come available to the host.
+        """
+        now = time.time()
+        while self.scheduled and self.scheduled[0][0] <= now:
+            self.output.extend(self.scheduled.popleft()[1])
+
+    def sent(self, data):
+        """
+        Accounts for (and throttles) data sent from the device to the host.
+        """
+        self.bytes_out += len(data)
+        if self.baudrate and data:
+            time.sleep(len(data) * 10.0 / self.baudrate)
+        return data
+
+    # The device side.
+
+    def reset(self):
+        """
+        Soft reboots the device, clearing its Python state.
+        """
+        self.globals = {'__name__': '__main__'}
+        self.imported = {}
+        self.line = bytearray()
+
+    def emit(self, data):
+        """
+        Sends data from the device to the host. It arrives once the device
+        has consumed the byte that caused it (and never ahead of anything
+        sent before it).
+        """
+        at = self.pending[-1] if self.pending else 0
+        if self.scheduled:
+            at = max(at, self.scheduled[-1][0])
+        data = bytes(data)
+        if self.garbled:
+            data = data.translate(GARBLED)
+        self.scheduled.append((at, data))
+
+    @property
+    def garbled(self):
+        """
+        True if the two ends of the link are at different baud rates.
+        """
+        return self.uart_baudrate is not None and \
+            self.baudrate != self.uart_baudrate
+
+    def store(self, name, content):
+        """
+        Sets the content of a file, raising ENOSPC if it won't fit.
+        """
+        old = self.files.get(name, b'')
+        self.files[name] = content
+        if self.used_blocks() * BLOCK_SIZE > self.capacity:
+            self.files[name] = old
+            raise OSError(errno.ENOSPC, 'ENOSPC')
+
+    def used_blocks(self):
+        return sum(len(c) // BLOCK_SIZE + 1 for c in self.files.values())
+
+    def receive(self, char):
+        """
+        Handles a single byte arriving at the device's REPL.
+        """
+        if self.mode == 'paste':
+            if char == b'\x03':
+                # Abandon the paste, as the firmware does.
+                self.line = bytearray()
+                self.emit(b'\x04\x04Traceback (most recent call last):\r\n'
+                          b'KeyboardInterrupt: \r\n\x04>')
+                self.mode = 'raw'
+            elif char == b'\x04':
+                self.emit(b'\x04')
+                self.run(header=b'')
+                self.mode = 'raw'
+            else:
+                self.line.extend(char)
+                self.paste_count += 1
+                if self.paste_count % self.window == 0:
+                    self.emit(b'\x01')
+            return
+        if self.mode == 'friendly':
+            if char == b'\x01':
+                self.mode = 'raw'
+                self.line = bytearray()
+                self.emit(b'\r\n' + RAW_BANNER)
+            elif char == b'\x03':
+                self.line = bytearray()
+                self.emit(b'\r\n>>> ')
+            elif char == b'\x04':
+                self.reset()
+                self.emit(b'MPY: soft reboot\r\n' + BANNER + b'>>> ')
+            elif char == b'\r':
+                self.line = bytearray()
+                self.emit(b'\r\n>>> ')
+            else:
+                self.line.extend(char)
+                self.emit(char)
+            return
+        # Raw mode.
+        if self.raw_paste and char == b'\x01' and self.line[-2:] == b'\x05A':
+            self.mode = 'paste'
+            self.line = bytearray()
+            self.paste_count = 0
+            self.emit(b'R\x01' + struct.pack('<H', self.window))
+        elif char == b'\x01':
+            self.line = bytearray()
+            self.emit(RAW_BANNER)
+        elif char == b'\x02':
+            self.mode = 'friendly'
+            self.line = bytearray()
+            self.emit(b'\r\n' + BANNER + b'>>> ')
+        elif char == b'\x03':
+            self.line = bytearray()
+        elif char == b'\x04':
+            if not self.line:
+                self.reset()
+                self.emit(b'OK\r\nMPY: soft reboot\r\n' + RAW_BANNER)
+            else:
+                self.run()
+        else:
+            self.line.extend(char)
+
+    def run(self, header=b'OK'):
+        """
+        Executes the current line as a command and sends the response.
+        """
+        source = bytes(self.line).decode('utf-8', 'replace')
+        self.line = bytearray()
+        self.commands += 1
+        self.stdout = bytearray()
+        self.emit(header)
+        err = b''
+        try:
+            code = compile(source, '<stdin>', 'exec')
+            exec(code, self.sandbox())
+        except Exception as ex:
+            err = self.format_error(ex)
+        self.emit(bytes(self.stdout) + b'\x04' + err + b'\x04>')
+
+    def format_error(self, ex):
+        """
+        Formats an exception the way MicroPython reports it on stderr.
+        """
+        if isinstance(ex, SyntaxError):
+            # Nothing ran, so there's no function to name.
+            frames = ['  File "<stdin>", line {}'.format(ex.lineno or 1)]
+        else:
+            frames = []
+            for frame, frame_line in traceback.walk_tb(
+                    sys.exc_info()[2]):
+                filename = frame.f_code.co_filename
+                if filename == '<stdin>' or filename in self.files:
+                    frames.append('  File "{}", line {}, in {}'.format(
+                        filename, frame_line, frame.f_code.co_name))
+        if isinstance(ex, OSError) and ex.errno:
+            name, message = 'OSError', '[Errno {}] {}'.format(
+                ex.errno, errno.errorcode.get(ex.errno, ''))
+        else:
+            name, message = type(ex).__name__, str(ex)
+        lines = [
+            'Traceback (most recent call last):',
+        ] + frames + [
+            '{}: {}'.format(name, message) if message else name,
+            '',
+        ]
+        return '\r\n'.join(lines).encode('utf-8')
+
+    def sandbox(self):
+        """
+        Returns the globals used to run commands, with builtins restricted to
+        the modules and file system of the simulated device.
+        """
+        try:
+            import builtins
+        except ImportError:
+            import __builtin__ as builtins
+        modules = {
+            'os': SimulatedOS(self),
+            'gc': SimulatedModule(collect=lambda: None,
+                                  mem_free=lambda: 8 * 1024),
+            'microbit': SimulatedModule(uart=SimulatedUART(self)),
+            'time': time,
+            'sys': SimulatedModule(modules=self.imported),
+        }
+        modules['uos'] = modules['os']
+        modules['utime'] = modules['time']
+        if self.ubinascii:
+            modules['ubinascii'] = binascii
+
+        def simulated_import(name, globals=None, locals=None, fromlist=(),
+                             level=0):
+            if name in modules:
+                return modules[name]
+            if name not in self.imported:
+                filename = name + '.py'
+                if filename not in self.files:
+                    raise ImportError("no module named '{}'".format(name))
+                # Modules on the file system are imported once, until they're
+                # removed from sys.modules or the device reboots.
+                module = types.ModuleType(name)
+                module.__dict__['__builtins__'] = sandboxed
+                source = self.files[filename].decode('utf-8')
+                exec(compile(source, filename, 'exec'), module.__dict__)
+                self.imported[name] = module
+            return self.imported[name]
+
+        def simulated_print(*args, **kwargs):
+            text = kwargs.get('sep', ' ').join(str(a) for a in args)
+            text += kwargs.get('end', '\n')
+            self.stdout.extend(text.encode('utf-8').replace(b'\n', b'\r\n'))
+
+        sandboxed = dict(vars(builtins))
+        sandboxed.update({
+            '__import__': simulated_import,
+            'open': lambda name, mode='r': SimulatedFile(self, name, mode),
+            'print': simulated_print,
+        })
+        self.globals['__builtins__'] = sandboxed
+        return self.globals
+
+
+def main():
+    """
+    Runs a SimulatedDevice on the standard input and output, so it can stand
+    in for a board behind any link (for example, as the command of the
+    "pty:" transport). POSIX only.
+    """
+    device = SimulatedDevice(timeout=0)
+    stdin, stdout = sys.stdin.fileno(), sys.stdout.fileno()
+    while True:
+        if select.select([stdin], [], [], POLL_INTERVAL)[0]:
+            data = os.read(stdin, 4096)
+            if not data:
+                return
+            device.write(data)
+        waiting = device.in_waiting
+        if waiting:
+            os.write(stdout, device.read(waiting))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the links microfs can use to reach a device running
+MicroPython. Every transport behaves like a pyserial Serial object (read,
+read_until, write, in_waiting, reset_input_buffer, close and a timeout that
+can be changed between reads), so one can be passed anywhere microfs expects
+a serial object.
+
+A transport is opened from a URL with connect:
+
+* /dev/ttyACM0, COM3 or serial:///dev/ttyACM0 - a serial port.
+* socket://host:port - a raw TCP connection to a board (or a bridge) that
+  exposes its REPL over the network.
+* loop:// - an in-memory link to a simulated device (see microsim).
+* pty:command - a command (such as "python -m mu.contrib.microsim") run
+  attached to a new pseudo terminal. POSIX only.
+
+For example::
+
+    from mu.contrib import microfs, transports
+
+    with transports.connect('socket://192.168.4.1:23') as link:
+        print(microfs.ls(link))
+
+Everything that has arrived is buffered by the transport, so reads are
+served from memory wherever possible rather than a byte at a time from the
+link. A TransportPool keeps connections open between uses::
+
+    pool = transports.TransportPool()
+    microfs.fleet(microfs.ls, ['socket://a:23', 'socket://b:23'],
+                  connect=pool.connect)
+"""
+import errno
+import os
+import select
+import shlex
+import socket
+import threading
+import time
+
+
+__all__ = ['connect', 'Transport', 'SerialTransport', 'SocketTransport',
+           'LoopbackTransport', 'PtyTransport', 'TransportPool']
+
+
+#: The baud rate used for serial ports unless told otherwise (and the one
+#: the micro:bit's REPL runs at).
+BAUDRATE = 115200
+
+
+#: The baud rates a serial port may be set to, fastest first.
+BAUDRATES = (1000000, 921600, 460800, 230400, 115200, 57600, 38400, 19200,
+             9600)
+
+
+#: Seconds a read waits for data to arrive before giving up.
+DEFAULT_TIMEOUT = 1
+
+
+#: Seconds each read of a pyserial compatible stream waits for data. This
+#: is the stream's own timeout, set once since changing it reconfigures a
+#: serial port, and the transport's timeout is enforced by reading again.
+POLL_INTERVAL = 0.05
+
+
+#: Seconds to wait for a TCP connection to be made.
+CONNECT_TIMEOUT = 5
+
+
+#: The most bytes taken from a socket or pseudo terminal at once.
+RECEIVE_SIZE = 4096
+
+
+def check_baudrate(baudrate):
+    """
+    Returns the baud rate if it's one of BAUDRATES, otherwise BAUDRATE.
+    """
+    return baudrate if baudrate in BAUDRATES else BAUDRATE
+
+
+class Transport(object):
+    """
+    A buffered link to a device. Subclasses supply receive, send and
+    disconnect. The url is the one the transport was opened with, and port
+    names the device for display.
+    """
+
+    def __init__(self, url, port=None, timeout=DEFAULT_TIMEOUT):
+        self.url = url
+        self.port = port or url
+        self.timeout = timeout
+        self.buffer = bytearray()
+        self.is_open = True
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def receive(self, timeout):
+        """
+        Returns whatever arrives within timeout seconds (None waits for ever
+        and 0 doesn't wait at all), or no bytes if nothing does.
+        """
+        raise NotImplementedError()
+
+    def send(self, data):
+        """
+        Sends all of the data.
+        """
+        raise NotImplementedError()
+
+    def disconnect(self):
+        """
+        Closes the link for good.
+        """
+        raise NotImplementedError()
+
+    def fill(self, timeout):
+        """
+        Buffers whatever arrives within timeout seconds.
+        """
+        self.buffer.extend(self.receive(timeout))
+
+    def take(self, size):
+        """
+        Returns (and removes) up to size bytes from the buffer.
+        """
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def remaining(self, end):
+        """
+        Returns the seconds left before end (None for never), but never less
+        than zero.
+        """
+        if end is None:
+            return None
+        return max(0, end - time.time())
+
+    @property
+    def in_waiting(self):
+        """
+        The number of received bytes yet to be read.
+        """
+        self.fill(0)
+        return len(self.buffer)
+
+    def read(self, size=1):
+        """
+        Returns size bytes, or fewer if the timeout passes first.
+        """
+        end = None if self.timeout is None else time.time() + self.timeout
+        while len(self.buffer) < size:
+            remaining = self.remaining(end)
+            if remaining == 0:
+                break
+            self.fill(remaining)
+        return self.take(size)
+
+    def read_until(self, expected=b'\n', size=None):
+        """
+        Returns everything up to and including the expected bytes, or up to
+        size bytes, or whatever arrived before the timeout passed.
+        """
+        end = None if self.timeout is None else time.time() + self.timeout
+        start = 0
+        while True:
+            found = self.buffer.find(expected, start)
+            end_of_match = found + len(expected)
+            if found > -1 and (size is None or end_of_match <= size):
+                return self.take(end_of_match)
+            if size is not None and len(self.buffer) >= size:
+                return self.take(size)
+            start = max(0, len(self.buffer) - len(expected) + 1)
+            remaining = self.remaining(end)
+            if remaining == 0:
+                return self.take(len(self.buffer))
+            self.fill(remaining)
+
+    def write(self, data):
+        data = bytes(data)
+        self.send(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        """
+        Discards everything received but not yet read.
+        """
+        del self.buffer[:]
+        while self.receive(0):
+            pass
+
+    def close(self):
+        """
+        Closes the transport, or hands it back to the TransportPool it came
+        from so it can be used again.
+        """
+        if not self.is_open:
+            return
+        self.is_open = False
+        if self.pool is not None:
+            self.pool.release(self)
+        else:
+            self.disconnect()
+
+
+class StreamTransport(Transport):
+    """
+    A transport over a pyserial compatible stream. Everything the stream
+    says is waiting is taken at once. The stream's timeout is set to
+    POLL_INTERVAL once and left alone.
+    """
+
+    def __init__(self, url, stream, port=None, timeout=DEFAULT_TIMEOUT):
+        super(StreamTransport, self).__init__(url, port, timeout)
+        self.stream = stream
+        if getattr(stream, 'timeout', None) != POLL_INTERVAL:
+            stream.timeout = POLL_INTERVAL
+
+    def receive(self, timeout):
+        waiting = self.stream.in_waiting
+        if waiting:
+            return self.stream.read(waiting)
+        if timeout == 0:
+            return b''
+        end = None if timeout is None else time.time() + timeout
+        while True:
+            data = self.stream.read(1)
+            if data:
+                return data + self.stream.read(self.stream.in_waiting)
+            if end is not None and time.time() >= end:
+                return b''
+
+    def send(self, data):
+        self.stream.write(data)
+
+    def disconnect(self):
+        self.stream.close()
+
+    @property
+    def baudrate(self):
+        return getattr(self.stream, 'baudrate', None)
+
+    @baudrate.setter
+    def baudrate(self, baudrate):
+        self.stream.baudrate = baudrate
+
+
+class SerialTransport(StreamTransport):
+    """
+    A serial port, such as the micro:bit's USB serial port. If the baud rate
+    isn't one of BAUDRATES, or the port won't take it, BAUDRATE is used
+    instead.
+    """
+
+    def __init__(self, port, baudrate=BAUDRATE, timeout=DEFAULT_TIMEOUT,
+                 url=None):
+        from serial import Serial
+        baudrate = check_baudrate(baudrate)
+        try:
+            stream = Serial(port, baudrate, timeout=POLL_INTERVAL,
+                            parity='N')
+        except (ValueError, IOError):
+            if baudrate == BAUDRATE:
+                raise
+            # The driver (or USB bridge) can't do it.
+            stream = Serial(port, BAUDRATE, timeout=POLL_INTERVAL,
+                            parity='N')
+        super(SerialTransport, self).__init__(url or port, stream, port,
+                                              timeout)
+
+
+class LoopbackTransport(StreamTransport):
+    """
+    An in-memory link to a simulated device (a new microsim.SimulatedDevice
+    if none is given), for trying things out without a board attached.
+    """
+
+    def __init__(self, device=None, timeout=DEFAULT_TIMEOUT, url='loop://'):
+        if device is None:
+            from mu.contrib import microsim
+            device = microsim.SimulatedDevice()
+        super(LoopbackTransport, self).__init__(url, device, device.port,
+                                                timeout)
+
+
+class SocketTransport(Transport):
+    """
+    A raw TCP connection to a device's REPL.
+    """
+
+    def __init__(self, host, port, timeout=DEFAULT_TIMEOUT, url=None):
+        name = '{}:{}'.format(host, port)
+        super(SocketTransport, self).__init__(url or 'socket://' + name, name,
+                                              timeout)
+        self.socket = socket.create_connection((host, port), CONNECT_TIMEOUT)
+        # The REPL protocol is made of small writes that each wait for a
+        # reply, so don't hold them back.
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def receive(self, timeout):
+        self.socket.settimeout(timeout)
+        try:
+            data = self.socket.recv(RECEIVE_SIZE)
+        except socket.timeout:
+            return b''
+        except socket.error as ex:
+            if ex.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return b''
+            raise
+        if not data:
+            raise IOError('Connection to {} closed.'.format(self.port))
+        return data
+
+    def send(self, data):
+        self.socket.settimeout(None)
+        self.socket.sendall(data)
+
+    def disconnect(self):
+        self.socket.close()
+
+
+class PtyTransport(Transport):
+    """
+    A command run attached to a new pseudo terminal, which it uses as its
+    REPL. The command is stopped when the transport is disconnected.
+    """
+
+    def __init__(self, command, timeout=DEFAULT_TIMEOUT, url=None):
+        import pty
+        import subprocess
+        import tty
+        super(PtyTransport, self).__init__(url or 'pty:' + command, command,
+                                           timeout)
+        master, slave = pty.openpty()
+        # The REPL does its own echoing and line editing.
+        tty.setraw(slave)
+        self.process = subprocess.Popen(shlex.split(command), stdin=slave,
+                                        stdout=slave, stderr=slave,
+                                        close_fds=True)
+        os.close(slave)
+        self.fd = master
+
+    def receive(self, timeout):
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return b''
+        try:
+            data = os.read(self.fd, RECEIVE_SIZE)
+        except OSError:
+            # EIO once the command has exited.
+            data = b''
+        if not data:
+            raise IOError('{} has exited.'.format(self.port))
+        return data
+
+    def send(self, data):
+        while data:
+            data = data[os.write(self.fd, data):]
+
+    def disconnect(self):
+        os.close(self.fd)
+        self.process.terminate()
+        self.process.wait()
+
+
+def connect(url, timeout=DEFAULT_TIMEOUT, baudrate=BAUDRATE):
+    """
+    Returns a new transport to the device at the URL (see the module's
+    documentation). A URL without a scheme is the name of a serial port.
+
+    Raises a ValueError if the URL isn't understood.
+    """
+    scheme, separator, rest = url.partition('://')
+    if url.startswith('pty:'):
+        return PtyTransport(url[len('pty:'):], timeout, url)
+    if not separator:
+        return SerialTransport(url, baudrate, timeout)
+    if scheme == 'serial':
+        return SerialTransport(rest, baudrate, timeout, url)
+    if scheme == 'loop':
+        return LoopbackTransport(timeout=timeout, url=url)
+    if scheme == 'socket':
+        host, _, port = rest.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError('Expected socket://host:port, not {}'.format(
+                url))
+        return SocketTransport(host, int(port), timeout, url)
+    raise ValueError('Unknown transport: {}'.format(url))
+
+
+class TransportPool(object):
+    """
+    Keeps transports open for reuse, keyed by URL. A transport from connect
+    goes back to the pool when it's closed, and clear closes them for good.
+    """
+
+    def __init__(self):
+        self.idle = {}
+        self.lock = threading.Lock()
+
+    def connect(self, url, **kwargs):
+        """
+        Returns an idle transport to the URL from the pool, or a new one
+        (from connect, with the keyword arguments) if there isn't one.
+        """
+        with self.lock:
+            idle = self.idle.get(url)
+            transport = idle.pop() if idle else None
+        if transport is None:
+            transport = connect(url, **kwargs)
+            transport.pool = self
+        else:
+            transport.is_open = True
+            transport.reset_input_buffer()
+        return transport
+
+    def release(self, transport):
+        with self.lock:
+            self.idle.setdefault(transport.url, []).append(transport)
+
+    def clear(self):
+        """
+        Closes every idle transport for good.
+        """
+        with self.lock:
+            idle = [t for ts in self.idle.values() for t in ts]
+            self.idle = {}
+        for transport in idle:
+            transport.disconnect()
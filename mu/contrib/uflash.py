@@ -9,13 +9,54 @@ import os
 import struct
 import binascii
 import ctypes
+import gzip
+import hashlib
+import logging
+import shutil
+import tempfile
+from collections import namedtuple, OrderedDict
 from subprocess import check_output
+from mu.contrib import appdirs
+
+
+logger = logging.getLogger(__name__)
 
 
 #: The magic start address in flash memory for a Python script.
 _SCRIPT_ADDR = 0x3e000
 
 
+#: The most bytes of script (with its header and padding) that fit in flash.
+_SCRIPT_SIZE = 0x2000
+
+
+#: The start of each data record of a script (its length, address and type),
+#: in hex, with the sum of those bytes for its checksum, in address order.
+_SCRIPT_RECORDS = tuple(
+    ('10{:04X}00'.format(addr & 0xffff),
+     16 + ((addr >> 8) & 0xff) + (addr & 0xff))
+    for addr in range(_SCRIPT_ADDR, _SCRIPT_ADDR + _SCRIPT_SIZE, 16))
+
+
+#: The extended linear address record that comes before a script.
+_SCRIPT_MARKER = ':020000040003F7'
+
+
+#: Intel HEX record types.
+_DATA_RECORD = 0
+_EXTENDED_SEGMENT_RECORD = 2
+_EXTENDED_LINEAR_RECORD = 4
+
+
+#: A record of an Intel HEX file: its type, the absolute address of its data
+#: (taking into account any extended address records before it) and its data.
+HexRecord = namedtuple('HexRecord', ['type', 'address', 'data'])
+
+
+#: Each byte value as two hex digits.
+_HEX_BYTES = tuple('{:02X}'.format(i) for i in range(256))
+
+
 #: The help text to be shown when requested.
 _HELP_TEXT = """
 Flash Python onto the BBC micro:bit or extract Python from a .hex file.
@@ -26,10 +67,44 @@ will flash the unmodified MicroPython firmware onto the device. Use the -e flag
 to recover a Python script from a hex file. Use the -r flag to specify a custom
 version of the MicroPython runtime.
 
+Hex files are cached, so flashing the same script again is quick. Use the
+--no-cache flag to always build the hex file from scratch.
+
 Documentation is here: http://uflash.readthedocs.org/en/latest/
 """
 
 
+#: The gzipped MicroPython runtime hex, found next to this module.
+_RUNTIME_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'micropython.hex.gz')
+
+
+#: The runtime hex once get_runtime has loaded it.
+_runtime = None
+
+
+#: Runtimes already split by parse_runtime, keyed by their hex.
+_parsed_runtimes = OrderedDict()
+
+
+#: How many parsed runtimes to keep.
+_PARSED_RUNTIMES_SIZE = 4
+
+
+#: Runtime files already read by read_runtime, keyed by path, as tuples of
+#: their modification time and hex.
+_runtime_files = {}
+
+
+#: The directory the command line tool caches built hex files in (within
+#: Mu's data directory).
+_CACHE_DIR = os.path.join(appdirs.user_data_dir('mu', 'python'), 'hex_cache')
+
+
+#: The most bytes of built hex files a HexCache keeps by default.
+_CACHE_SIZE = 32 * 1024 * 1024
+
+
 #: MAJOR, MINOR, RELEASE, STATUS [alpha, beta, final], VERSION
 _VERSION = (1, 0, 3, )
 
@@ -41,6 +116,65 @@ def get_version():
     return '.'.join([str(i) for i in _VERSION])
 
 
+def get_runtime():
+    """
+    Returns a string representation of the built in MicroPython runtime hex.
+
+    It's only read (and decompressed) from _RUNTIME_FILE the first time it's
+    needed, so importing this module stays cheap.
+    """
+    global _runtime
+    if _runtime is None:
+        with gzip.open(_RUNTIME_FILE, 'rb') as runtime_file:
+            _runtime = runtime_file.read().decode('ascii')
+    return _runtime
+
+
+def read_runtime(path):
+    """
+    Returns the content of the MicroPython runtime hex file at the path. The
+    file is only read again if it's been modified since last time, so the same
+    string is returned (and parse_runtime doesn't need to split it again).
+    """
+    mtime = os.path.getmtime(path)
+    cached = _runtime_files.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path) as runtime_file:
+            cached = (mtime, runtime_file.read())
+        _runtime_files[path] = cached
+    return cached[1]
+
+
+def parse_runtime(runtime_hex):
+    """
+    Returns a tuple of the runtime hex's records before and after the place
+    where a script is embedded (two records from the end), each as a string
+    of newline terminated records.
+
+    The last few runtimes parsed are remembered, so a runtime is only split
+    once however many scripts are embedded into it.
+    """
+    parsed = _parsed_runtimes.get(runtime_hex)
+    if parsed is None:
+        records = runtime_hex.split()
+        parsed = (''.join(r + '\n' for r in records[:-2]),
+                  ''.join(r + '\n' for r in records[-2:]))
+        _parsed_runtimes[runtime_hex] = parsed
+        if len(_parsed_runtimes) > _PARSED_RUNTIMES_SIZE:
+            _parsed_runtimes.popitem(last=False)
+    return parsed
+
+
+def __getattr__(name):
+    """
+    Keeps the old _RUNTIME attribute working (on Python 3.7 and later).
+    """
+    if name == '_RUNTIME':
+        return get_runtime()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__,
+                                                                    name))
+
+
 def strfunc(raw):
     """
     Compatibility for 2 & 3 str()
@@ -64,18 +198,17 @@ def hexlify(script):
     data = b'MP' + struct.pack('<H', len(script)) + script
     # Padding with null bytes in a 2/3 compatible way
     data = data + (b'\x00' * (16 - len(data) % 16))
-    assert len(data) <= 0x2000
-    # Convert to .hex format.
+    assert len(data) <= _SCRIPT_SIZE
+    # Convert to .hex format, hexlifying all of the data at once. Each record
+    # is a whole 16 bytes, so only the checksum needs working out.
+    hex_data = strfunc(binascii.hexlify(data)).upper()
+    values = bytearray(data)
     output = [':020000040003F7']  # extended linear address, 0x0003.
-    addr = _SCRIPT_ADDR
-    for i in range(0, len(data), 16):
-        chunk = data[i:min(i + 16, len(data))]
-        chunk = struct.pack('>BHB', len(chunk), addr & 0xffff, 0) + chunk
-        checksum = (-(sum(bytearray(chunk)))) & 0xff
-        hexline = ':%s%02X' % (strfunc(binascii.hexlify(chunk)).upper(),
-                               checksum)
-        output.append(hexline)
-        addr += 16
+    output.extend(
+        ':' + header + hex_data[2 * i:2 * i + 32] +
+        _HEX_BYTES[-(header_sum + sum(values[i:i + 16])) & 0xff]
+        for (header, header_sum), i in zip(_SCRIPT_RECORDS,
+                                           range(0, len(data), 16)))
     return '\n'.join(output)
 
 
@@ -83,16 +216,17 @@ def unhexlify(blob):
     """
     Takes a hexlified script and turns it back into a string of Python code.
     """
-    lines = blob.split('\n')[1:]
-    output = []
-    for line in lines:
-        # Discard the address, length etc. and reverse the hexlification
-        output.append(binascii.unhexlify(line[9:-2]))
-    # Strip off "MP<size>" from the start
-    output[0] = output[0][4:]
-    # and strip any null bytes from the end
-    output[-1] = output[-1].strip(b'\x00')
-    script = b''.join(output)
+    # Discard the address, length etc. and reverse the hexlification of all
+    # the records at once.
+    records = [line[9:-2] for line in blob.split('\n')[1:]]
+    data = binascii.unhexlify(''.join(records))
+    # Strip off "MP<size>" from the start and any null bytes from the last
+    # record.
+    last = len(data) - len(records[-1]) // 2
+    if len(records) == 1:
+        script = data[4:].strip(b'\x00')
+    else:
+        script = data[4:last] + data[last:].strip(b'\x00')
     try:
         result = script.decode('utf-8')
         return result
@@ -118,15 +252,64 @@ def embed_hex(runtime_hex, python_hex=None):
         raise ValueError('MicroPython runtime hex required.')
     if not python_hex:
         return runtime_hex
-    py_list = python_hex.split()
-    runtime_list = runtime_hex.split()
-    embedded_list = []
-    # The embedded list should be the original runtime with the Python based
+    prefix, suffix = parse_runtime(runtime_hex)
+    # The embedded hex should be the original runtime with the Python based
     # hex embedded two lines from the end.
-    embedded_list.extend(runtime_list[:-2])
-    embedded_list.extend(py_list)
-    embedded_list.extend(runtime_list[-2:])
-    return '\n'.join(embedded_list) + '\n'
+    script = ''.join(r + '\n' for r in python_hex.split())
+    return prefix + script + suffix
+
+
+def parse_records(lines, base=0):
+    """
+    Generates a HexRecord for each of the lines of Intel HEX (skipping blank
+    ones), where base is the address extended address records would have set
+    before the first line.
+
+    Raises a ValueError if a record is malformed or its checksum is wrong.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith(':'):
+            raise ValueError('Not an Intel HEX record: {}'.format(line))
+        raw = bytearray(binascii.unhexlify(line[1:]))
+        if len(raw) < 5 or len(raw) != raw[0] + 5 or sum(raw) & 0xff:
+            raise ValueError('Bad Intel HEX record: {}'.format(line))
+        record_type = raw[3]
+        if record_type == _EXTENDED_LINEAR_RECORD:
+            base = ((raw[4] << 8) | raw[5]) << 16
+        elif record_type == _EXTENDED_SEGMENT_RECORD:
+            base = ((raw[4] << 8) | raw[5]) << 4
+        yield HexRecord(record_type, base + ((raw[1] << 8) | raw[2]),
+                        bytes(raw[4:-1]))
+
+
+def index_hex(lines, base=0):
+    """
+    Returns an OrderedDict mapping the address of each data record in the
+    lines of Intel HEX (see parse_records) to its data, in one pass.
+    """
+    return OrderedDict((record.address, record.data)
+                       for record in parse_records(lines, base)
+                       if record.type == _DATA_RECORD)
+
+
+def read_range(address_map, start, end):
+    """
+    Returns the bytes from start up to (at most) end in the address map (see
+    index_hex), stopping at the first gap.
+    """
+    addresses = sorted(a for a in address_map if start <= a < end)
+    output = []
+    address = start
+    for record_address in addresses:
+        if record_address != address:
+            break
+        data = address_map[record_address]
+        output.append(data)
+        address += len(data)
+    return b''.join(output)[:end - start]
 
 
 def extract_script(embedded_hex):
@@ -134,22 +317,114 @@ def extract_script(embedded_hex):
     Given a hex file containing the MicroPython runtime and an embedded Python
     script, will extract the original Python script.
 
-    Returns a string containing the original embedded script.
+    Returns a string containing the original embedded script, or an empty
+    string if there isn't one (or the hex is malformed).
     """
-    hex_lines = embedded_hex.split('\n')
-    # Blob will hold the extracted hex values representing the embedded script.
-    blob = ''
-    # Find the marker in the hex that comes just before the script
-    if ':020000040003F7' in hex_lines:
-        start_line = max(loc for loc, val in enumerate(hex_lines)
-                         if val == ':020000040003F7')
-        # Recombine the lines after that, but leave out the last 3 lines
-        blob = '\n'.join(hex_lines[start_line:-3])
-    if blob == '':
-        # If the result is the empty string, there was no embedded script
+    # The script usually comes after the last extended linear address record
+    # for its part of flash, close to the end, so only the records from there
+    # on need parsing. Otherwise it could be anywhere.
+    start = embedded_hex.rfind(_SCRIPT_MARKER)
+    if start > -1:
+        lines = embedded_hex[start:].splitlines()
+    else:
+        lines = embedded_hex.splitlines()
+    try:
+        address_map = index_hex(lines)
+    except ValueError:
+        return ''
+    data = read_range(address_map, _SCRIPT_ADDR, _SCRIPT_ADDR + _SCRIPT_SIZE)
+    if len(data) < 4 or data[:2] != b'MP':
+        # There's no embedded script.
         return ''
-    # Pass the extracted hex through unhexlify
-    return unhexlify(blob)
+    size = struct.unpack('<H', data[2:4])[0]
+    try:
+        return data[4:4 + size].decode('utf-8')
+    except UnicodeDecodeError:
+        return ''
+
+
+class HexCache(object):
+    """
+    Built hex files kept in a directory, named by a hash of the script and
+    the runtime they were built from, so the same script needn't be encoded
+    again. Once the files add up to more than max_size bytes the least
+    recently used are removed.
+    """
+
+    def __init__(self, directory=_CACHE_DIR, max_size=_CACHE_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+
+    def key(self, script, path_to_runtime=None):
+        """
+        Returns the key of the hex built from the script (bytes) and the
+        runtime at the path (or the built in runtime). The runtime is
+        identified by its file's path, size and modification time, so it
+        needn't be read.
+        """
+        path = os.path.abspath(path_to_runtime or _RUNTIME_FILE)
+        stat = os.stat(path)
+        runtime = '{}:{}:{}'.format(path, stat.st_size, stat.st_mtime)
+        digest = hashlib.sha1(runtime.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(script)
+        return digest.hexdigest()
+
+    def path(self, key):
+        """
+        Returns the path of the cached hex file with the key.
+        """
+        return os.path.join(self.directory, key + '.hex')
+
+    def get(self, key):
+        """
+        Returns the path of the cached hex file with the key (marking it as
+        recently used), or None if it isn't cached.
+        """
+        path = self.path(key)
+        try:
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, hex_file):
+        """
+        Caches the string representation of a hex file with the key, then
+        removes the least recently used files if the cache is too big.
+        """
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        # Write to a temporary file first, so a half written file is never
+        # found in the cache.
+        handle, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                output.write(hex_file.encode('ascii'))
+            # Python 2 has no os.replace (and os.rename won't overwrite on
+            # Windows).
+            getattr(os, 'replace', os.rename)(temp_path, self.path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used hex files until they add up to no
+        more than max_size bytes.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.hex'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_size:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
 
 
 def find_microbit():
@@ -215,7 +490,22 @@ def save_hex(hex_file, path):
         output.write(hex_file.encode('ascii'))
 
 
-def flash(path_to_python=None, path_to_microbit=None, path_to_runtime=None):
+def save_hex_file(hex_path, path):
+    """
+    Copies the hex file at hex_path to the specified path, streaming it
+    straight from disk, thus causing the device mounted at that point to be
+    flashed.
+
+    If the filename at the end of the path does not end in '.hex' it will raise
+    a ValueError.
+    """
+    if not path.endswith('.hex'):
+        raise ValueError('The path to flash must be for a .hex file.')
+    shutil.copyfile(hex_path, path)
+
+
+def flash(path_to_python=None, path_to_microbit=None, path_to_runtime=None,
+          cache=None):
     """
     Given a path to a Python file will attempt to create a hex file and then
     flash it onto the referenced BBC micro:bit.
@@ -230,6 +520,11 @@ def flash(path_to_python=None, path_to_microbit=None, path_to_runtime=None):
     the MicroPython runtime. This feature is useful if a custom build of
     MicroPython is available.
 
+    If a HexCache is given, a hex file already built from the same script and
+    runtime is copied from it (and a new one is added to it once it's been
+    flashed) instead of being built from scratch. A cache that can't be
+    written to is logged and otherwise ignored.
+
     If the automatic discovery fails, then it will raise an IOError.
     """
     # Check for the correct version of Python.
@@ -237,29 +532,37 @@ def flash(path_to_python=None, path_to_microbit=None, path_to_runtime=None):
             (sys.version_info[0] == 2 and sys.version_info[1] >= 7)):
         raise RuntimeError('Will only run on Python 2.7, or 3.3 and later.')
     # Grab the Python script (if needed).
-    python_hex = ''
+    script = b''
     if path_to_python:
         if not path_to_python.endswith('.py'):
             raise ValueError('Python files must end in ".py".')
         with open(path_to_python, 'rb') as python_script:
-            python_hex = hexlify(python_script.read())
-    runtime = _RUNTIME
-    # Load the hex for the runtime.
-    if path_to_runtime:
-        with open(path_to_runtime) as runtime_file:
-            runtime = runtime_file.read()
-    # Generate the resulting hex file.
-    micropython_hex = embed_hex(runtime, python_hex)
+            script = python_script.read()
     # Find the micro:bit.
     if not path_to_microbit:
         path_to_microbit = find_microbit()
-    # Attempt to write the hex file to the micro:bit.
-    if path_to_microbit:
-        hex_path = os.path.join(path_to_microbit, 'micropython.hex')
-        print('Flashing Python to: {}'.format(hex_path))
-        save_hex(micropython_hex, hex_path)
-    else:
+    if not path_to_microbit:
         raise IOError('Unable to find micro:bit. Is it plugged in?')
+    hex_path = os.path.join(path_to_microbit, 'micropython.hex')
+    key = cache.key(script, path_to_runtime) if cache else None
+    cached_path = cache.get(key) if cache else None
+    print('Flashing Python to: {}'.format(hex_path))
+    if cached_path:
+        save_hex_file(cached_path, hex_path)
+        return
+    # Load the hex for the runtime.
+    if path_to_runtime:
+        runtime = read_runtime(path_to_runtime)
+    else:
+        runtime = get_runtime()
+    # Generate the resulting hex file and write it to the micro:bit.
+    micropython_hex = embed_hex(runtime, hexlify(script))
+    save_hex(micropython_hex, hex_path)
+    if cache:
+        try:
+            cache.put(key, micropython_hex)
+        except OSError as ex:
+            logger.warning('Unable to cache the hex file: {}'.format(ex))
 
 
 def extract(path_to_hex, output_path=None):
@@ -301,15162 +604,16 @@ def main(argv=None):
                             action='store_true',
                             help=("Extract python source from a hex file"
                                   " instead of creating the hex file."), )
+        parser.add_argument('--no-cache', action='store_true',
+                            help="Always build the hex file from scratch.")
         args = parser.parse_args(argv)
 
         if args.extract:
             extract(args.source, args.target)
         else:
+            cache = None if args.no_cache else HexCache()
             flash(path_to_python=args.source, path_to_microbit=args.target,
-                  path_to_runtime=args.runtime)
+                  path_to_runtime=args.runtime, cache=cache)
     except Exception as ex:
         # The exception of no return. Print the exception information.
         print(ex)
-
-
-#: A string representation of the MicroPython runtime hex.
-_RUNTIME = """:020000040000FA
-:100000000040002089530100C5530100C75301007F
-:1000100000000000000000000000000000000000E0
-:10002000000000000000000000000000C9530100B3
-:100030000000000000000000CB530100CD53010080
-:10004000CF53010009440100815D0100CF5301003D
-:10005000CF5301000000000091970100CF53010031
-:10006000153E0000CF530100F1930100CF53010072
-:10007000CF530100CF530100CF530100CF530100F4
-:10008000CF5301006D5A0100CF530100CF5301003F
-:10009000CF53010015910100F19001005D3F000078
-:1000A0006D3F0000CF530100000000000000000081
-:1000B0000000000000000000000000000000000040
-:1000C00008B5054B054803331B1A062B03D9044B0F
-:1000D000002B00D0984708BD2801002028010020EF
-:1000E000000000000648074908B5091A8910CB0F1F
-:1000F0005918491003D0044B002B00D0984708BD75
-:1001000028010020280100200000000010B5074C45
-:100110002378002B09D1FFF7D3FF054B002B02D02A
-:10012000044800E000BF0123237010BD2801002017
-:1001300000000000D4B0030008B5094B002B03D029
-:100140000848094900E000BF08480368002B02D1B5
-:10015000FFF7C8FF08BD064B002BF9D09847F7E71B
-:1001600000000000D4B003002C0100202801002072
-:1001700000000000144B002B00D1124B9D46402282
-:1001800092029A1A924600218B460F461148124A53
-:10019000121A2BF01CF80D4B002B00D098470C4B7B
-:1001A000002B00D098470020002104000D000B48D0
-:1001B0002AF0E6FE20F006FF2000290028F0FDFCD2
-:1001C00020F04CFC0000080000400020000000006F
-:1001D0000000000028010020D82F0020750D02002B
-:1001E000C4600561466187614146C161494601625B
-:1001F00051464162594681626946C16271468160D9
-:10020000124B1A6802601860002070470F4B1A6882
-:1002100012681A6070470D4B1A68002A01D122F04B
-:1002200028FD506010681860D46815695669976990
-:10023000D1698846116A8946516A8A46916A8B4615
-:10024000D16A8D4691688E4601207047902E00201D
-:100250007FB54B680E1C5C106846211C26F05CFCC8
-:10026000029D0021281C221C2AF0B1FF01213068C8
-:10027000014004D1221C2B1C27F090FC08E0042C28
-:1002800000D9042443100021201C2A1C23F01DF94E
-:100290006946024802F09CF904B070BD44C20200F5
-:1002A000F0B5002585B0081C0C1C1E1C111C009507
-:1002B0002A1C022304F088F90120AC423FD084427A
-:1002C00028D1306820423AD103230340AB4203D106
-:1002D0001C4A0168914232D01B4A0240062A06D0CD
-:1002E000002B0BD103689A69184B9A4206D103A9D7
-:1002F00002F05CFE00220399131C18E00323021C89
-:100300001A40022A16D1FF22D2058018984311F014
-:10031000CFF814E003A9306802F048FE071C7068AB
-:10032000039C00F089FC211C021C2B1C381C08F0CB
-:1003300085FF04E000F080FC01234000184305B075
-:10034000F0BDC0464CB90200070080FF8D350000AB
-:10035000F0B58DB0099214AA1278041C0B9215AA5C
-:1003600012780F1C0892DA0700D494E0181C00F0F1
-:1003700063FC002305900793002803DA43420593AA
-:100380002D230793129B0026023B1E2B16D8524B9F
-:10039000129A2020995C19F02DFB089BC5B2B3423C
-:1003A00004D0681C032119F025FB061C13980028B3
-:1003B00001D02BF011F80335AE1936183B689E4278
-:1003C00004D9301C25F042F820603E6023689F1954
-:1003D000069300237D1E2B70059B002B03D1023F4B
-:1003E00030333B7033E00A950598129919F078FC88
-:1003F0000F1C0598129919F08DFB3B1C05903033AA
-:10040000092F02DD0B9B0A3BFB186F1E3B70089BFC
-:10041000002B16D0059B002B19D0069B9F4216D9A6
-:100420000A9BDB1B032B01D03D1CDDE76B46202222
-:100430009B181B78AF1E3B70069B9F4207D90A97FB
-:10044000F2E7069B9F4202D9059B002BECD1139B40
-:10045000002B0ED0181C2AF0BFFF069B381A9842BA
-:1004600007D90023139AD25C002A2ED0C25401333C
-:10047000F8E7079B002B06D0069B9F4203D96B46EB
-:100480001B7F013F3B702368381C9E19F61B099B9C
-:10049000013E1E601EE09A0710D1104A1968914271
-:1004A0000CD1129A391C0092139A01920B9A029263
-:1004B000089A0392099A27F048FB0BE00023226870
-:1004C0001370099A2068136004E0079B071C002B37
-:1004D000D5D1D8E70DB0F0BDEC2303004CB9020034
-:1004E00010B50C1C1449031C8A4202D1211C0122A4
-:1004F0001EE012498A4202D1211C032218E000208A
-:10050000072B17D10E4B1340062B0ED0930711D19A
-:1005100013680C498B4208D00B498B4205D00B491C
-:100520008B4202D00A498B4204D1111C0720221CA5
-:1005300007F034F910BDC046A0C302005CC302003E
-:10054000070080FF40EC020044C2020070CF0200AE
-:10055000FCD10200F0B585B000AF7A601D1C7B684D
-:10056000C26BCB18061C0C1CFB60934204D02B49B9
-:100570002B480BF0ABFB3BE0FB68994245D09A005F
-:10058000131C69460E33DB08DB00CB1A9D46181C92
-:100590000021BB602AF01BFE0023A200934204D07E
-:1005A000E858B968C8500433F8E7F9687A688C46A7
-:1005B00062447A60ED1803E06A6802341A60083514
-:1005C0007B689C4220D2286802F05AF80021021C65
-:1005D000F36B3B603B68994206D08B00F018006CCF
-:1005E000904207D1013107D10D480E490BF06EFB47
-:1005F000FFF711FE0131EDE7B968CB181968002942
-:10060000DAD007480849F1E7BD68F868291C04F00A
-:1006100049FFBD46066005B0F0BDC0460D2403008D
-:10062000C8EA0200462403006724030038B50C1C06
-:10063000051C0B6805495A6824F0E3F92168281C59
-:100640004031221C01F0C0FA38BDC046A43403007A
-:10065000F0B585B00C1C032502F012F82540071CEC
-:10066000002D03D11E4B22689A4205D01D491E4819
-:1006700024F0B8FEFFF7CFFD201C02A903AA23F047
-:100680006DFA029E039B301C10308000019324F011
-:10069000DDFE041C291C3C222AF099FD134B6760E7
-:1006A0002360134BE663A360124BE360124B63615C
-:1006B000124BA361124BE361124B2362124B636234
-:1006C000124B6363B54208D0019BAF00D85901F0CB
-:1006D000D7FFE71938640135F4E7201C05B0F0BDF9
-:1006E000FCD1020096240300C8EA0200A4BE020066
-:1006F0002D0600005505000025540000E9540000B7
-:1007000011070000E155000081540000ACB902005F
-:10071000136870B5002B11D10568EE6BB34213D08E
-:100720009C002C19246C8C4201D00133F6E7591C33
-:100730000AD002339B001B58136005E003490448AC
-:1007400024F050FEFFF767FD70BDC046A4240300EF
-:10075000FCE8020000237F2803D8034B1B5C9B07A7
-:10076000DB0F181C7047C046B824030000237F2805
-:1007700003D8034B1B5C1B07DB0F181C7047C046DC
-:10078000B824030000237F2803D8034B1B5C5B07BE
-:10079000DB0F181C7047C046B824030000237F28D5
-:1007A00003D8034B1B5C5B06DB0F181C7047C0466D
-:1007B000B824030000227F2808D8054B0132195CB9
-:1007C0000C23194202D15F3842424241101C70474B
-:1007D000B824030000237F2803D8034B1B5CDB06EF
-:1007E000DB0F181C7047C046B824030000237F2885
-:1007F00003D8034B1B5C9B06DB0F181C7047C046DD
-:10080000B8240300F0B5456887B00393AB6805A82A
-:100810000F1C0292059324F06AFB061C05A824F025
-:1008200066FB0323321C584309321018800024F061
-:100830000DFE041C094BAA6803606B68291C436009
-:10084000059B06629B1AC360039B083000933A1C09
-:10085000029B07F035FD201C07B0F0BD0CBA02006A
-:1008600038B5051C88680C1C27F004F90349021CE4
-:10087000231C281C24F0C5F838BDC04638250300C9
-:1008800010B5041C082024F0E1FD024B4460036015
-:1008900010BDC046C4B90200F8B5041CC0680E1CE7
-:1008A000002801D118602FE0201C111C6269203043
-:1008B0001D1C824208D1154A964206D0144915489B
-:1008C00024F090FDFFF7A7FC1660201C124E636811
-:1008D0000830776873600AF0A3F97760012806D0C2
-:1008E0000023E360022809D063691B680BE0636999
-:1008F0001B682B60002B07D1E36005E0236A0733F8
-:100900009B00E41863682B60F8BDC04694BA0200EF
-:1009100056250300C8EA0200882E002013B501AB5B
-:10092000141CFFF7B9FF01280DD0184C02281CD069
-:10093000019BA34228D0002B26D0012101AA1448F4
-:1009400024F03DFD0DE0002C0DD0201C00F08AF8B5
-:10095000104901F0F1FC002805D00F480F4924F0A0
-:1009600041FDFFF758FC01980FE0019800F07AF87C
-:10097000074901F0E1FC002801D10198F1E7019855
-:100980000BF084F9A042F8D1002016BD94BA020001
-:1009900084E802007CEB020014E602008C250300D0
-:1009A00010B50C1C022801D1486800E0886807F0E7
-:1009B0002FFB0649021C2068FFF7B0FF002804D176
-:1009C000034824F002FDFFF726FC10BD94BA020094
-:1009D00084E8020008B50022FFF7A0FF002804D138
-:1009E000024824F0F2FCFFF716FC08BD84E8020080
-:1009F00008B502490022FFF791FF08BD94BA020032
-:100A000013B5124C124A211C01ABFFF745FF012818
-:100A100002D0022805D017E00E490F4824F0E2FC6E
-:100A200010E0019800F01EF80C4901F085FC002848
-:100A30000AD1019800F016F8094901F07DFC002860
-:100A400002D10198FFF7E7FB201C16BD94BA020003
-:100A500094E602008C25030014E602007CEB020001
-:100A600084E80200084BC2070BD4084A084B024036
-:100A7000062A06D003230340022B01D1054B00E0D8
-:100A80000368181C7047C0464CB90200070080FF7D
-:100A900040EC0200A4CD0200F8B50D1C041C161C8D
-:100AA00003F0BAFA281CFFF7DDFF8768031C201C3F
-:100AB000002F03D0291C321CB84703E002495A68B2
-:100AC00023F09FFFF8BDC046AC25030008B5031C0A
-:100AD0000A1C0248191CFFF7DFFF08BD3CD30200C7
-:100AE000F7B5051C081C0E1C24F080FC00282AD039
-:100AF000301C694601AA0BF08FF9009B002B22D015
-:100B0000281C164923F0B1FE009C154BE71EE41883
-:100B1000A400002F17DB019A281C13195B681259D7
-:100B2000104923F06EFF019B281C1B199A68002AAC
-:100B300003D10D4923F099FE02E00C4923F061FF37
-:100B4000033F0C3CE5E7281C311C0222FFF7A4FF01
-:100B5000281C054923F089FEF7BDC046B1250300D6
-:100B6000FDFFFF3FD525030027430300EA250300CF
-:100B700010B5041CFFF776FF054B0069984203D0BF
-:100B8000431E9841C0B202E0201C22F091F910BD32
-:100B90003D21000038B5051C0C1C01208D4241D0C0
-:100BA000214B9D4201D100203CE09942FBD0012322
-:100BB0001D4204D01942F6D12B1C0D1C1C1C2A1CF2
-:100BC0001A4B1A40062A05D0AA0711D1184A2968DB
-:100BD00091420DD12340062B05D0A307E3D1144B3E
-:100BE00022689A42DFD1281C211C02F08FF919E0FB
-:100BF0002340062BD7D0A30703D10D4B22689A427E
-:100C0000D1D0281CFFF72EFF8369002BCBD01B20EF
-:100C1000291C221C98470028C5D0064BC01A424206
-:100C20004241D0B238BDC04694BA0200070080FFEE
-:100C300040EC02005CC3020008B5104B984219D08A
-:100C40000F4A0123904217D0184201D0184114E0F6
-:100C5000830706D10B4B02689A4202D110F056FC72
-:100C60000BE021F040FF0849021C08480BF02EF869
-:100C7000FFF7D1FA002000E0181C08BDA0C3020055
-:100C80005CC302004CB90200F3250300C8EA02006D
-:100C900008B5C30705D4830706D1054B02689A42FD
-:100CA00002D126F0E0FF01E0FFF7C6FF08BDC04615
-:100CB0004CB9020038B50F4B0124984202D10023F1
-:100CC0000B6014E00C4B984201D10C600FE0031C48
-:100CD000234002D04010086009E0820708D1074A8B
-:100CE0000568954204D10D1C10F010FC2860231CEF
-:100CF000181C38BDA0C302005CC302004CB902003E
-:100D000008B5184B984228D0174B984227D0C307F4
-:100D100003D5401019F05CFF23E00323184206D1ED
-:100D2000124A0168914202D126F0A6FF19E0034061
-:100D3000022B09D10E4B0340062B05D0FF23DB0508
-:100D4000C018032398430CE021F0CDFE0949021C92
-:100D500009480AF0BBFFFFF75EFA002001E0FE2021
-:100D6000800508BDA0C302005CC302004CB90200AC
-:100D7000070080FF0B260300C8EA020010B58307B6
-:100D80000CD103680A4CA34202D122F039FC0EE0D8
-:100D9000084CA34202D122F0E1FE08E021F0A3FEBC
-:100DA0000549021C05480AF091FFFFF734FA10BD0F
-:100DB00070CF0200FCD1020025260300C8EA020021
-:100DC00013B50C1C01A9FFF7D9FF019BA34206D064
-:100DD0000349221C03480AF079FFFFF71CFA13BDF0
-:100DE00048260300D8E50200F7B5051C0C1C171CAB
-:100DF0001E1CD30702D55710019710E0101C01A943
-:100E0000FFF758FF00280AD1381C6C6821F06BFEF0
-:100E10001349031C221C13480AF058FF1BE0019BD6
-:100E2000002B08DA1B190193002E0AD0002B04DADC
-:100E30000023019311E0002E03D0A3420DD90194A9
-:100E40000BE0019B002B01DBA34206D306480749B8
-:100E50006A680AF03BFFFFF7DEF90198FEBDC04665
-:100E600075260300C8EA020034E702009926030051
-:100E700010B5041C830710D10D4B02689A420CD1A7
-:100E80000C4B0340062B03D1C00824F003F900E00B
-:100E9000806801234000184308E0201CFFF7E2FDB2
-:100EA0004369181E02D00120211C984710BDC0467E
-:100EB00044C20200070080FF174A70B50023904229
-:100EC00027D0164CA04201D1012322E0144A00236E
-:100ED00090421ED0012606409E4201D0401015E0EF
-:100EE000051CFFF7BFFD4369002B09D0301C291CEE
-:100EF0009847002804D0031B58424341DBB208E066
-:100F0000281CFFF7B5FF0028DED00138431E9841AA
-:100F1000C3B2181C70BDC046A0C302005CC302006F
-:100F200094BA020010B5041CFFF7A2FF002809D1F3
-:100F3000201C21F0D8FD0449021C04480AF0C6FE1A
-:100F4000FFF769F910BDC046AF260300C8EA0200EA
-:100F500070B5041C0D1C161CFFF784FD036A002BE2
-:100F600005D0201C291C321C984700281AD10E4D90
-:100F7000201C002E05D121F0B6FD0C49021C281CB6
-:100F800006E0042E08D121F0AEFD021C281C084901
-:100F90000AF09CFEFFF73FF921F0A5FD0549021C70
-:100FA000281CF5E770BDC046C8EA0200D026030041
-:100FB000FB2603001C27030008B521F0AAFD00282A
-:100FC00005D10349034824F00DFAFFF724F908BDC1
-:100FD00049270300C8EA0200054B002805D000237A
-:100FE000022802D101224B001343181C7047C0464F
-:100FF000A0C3020008B5024923F037FC08BDC04673
-:101000003149030038B5051C0C200C1C24F01EFAD5
-:10101000024B45600360846038BDC046D4BA02000C
-:1010200008B5FFF76DFE1BF04FFC0022074B1AF0CE
-:10103000C5FD074B074A1AF083F91BF099FC0323FF
-:101040009843013B1843044BC01808BD008066401C
-:10105000FB210940182D44540000808008B5FFF79B
-:101060004FFE1BF031FC084A084B1AF0A7FD084B55
-:1010700000221AF065F91BF07BFC03239843013B27
-:101080001843044BC01808BD182D4454FB210940D7
-:10109000008066400000808008B5FFF731FE034BFA
-:1010A000184002231843024BC01808BDFCFFFF7F05
-:1010B0000000808008B5FFF723FE1CF0B1F8034B59
-:1010C000002800D0024B181C08BDC0465CC30200BB
-:1010D000A0C3020008B5FFF713FE1CF0A1F8034BF4
-:1010E000012800D0024B181C08BDC0465CC302009A
-:1010F000A0C3020008B5FFF703FE1CF091F8034BF4
-:10110000012800D8024B181C08BDC0465CC3020071
-:10111000A0C302001FB500230193FFF7F1FD01A951
-:101120001CF0EEF80322031C0220934306490343FC
-:101130005B180293019B934303435B1802A903933B
-:1011400004F0B0F905B000BD0000808038B50D1C7A
-:10115000FFF7D6FD041C281CFFF7D2FD19F018FD7F
-:10116000011C201C1CF0A8F803239843013B1843E2
-:10117000014BC01838BDC046000080801FB5002359
-:101180000193FFF7BDFD01A91CF06AF803230224B7
-:101190009843074B2043C0180290019826F026FD83
-:1011A00002A90390201C04F07DF904B010BDC046D4
-:1011B0000000808038B50D1CFFF7A2FD041C281C20
-:1011C000FFF79EFD011C201C1CF026FB0323984307
-:1011D000013B1843014BC01838BDC0460000808059
-:1011E00038B50D1CFFF78CFD041C281CFFF788FD8B
-:1011F000C00FC30760004008184303239843013B16
-:101200001843014BC01838BD0000808038B50D1C54
-:10121000FFF776FD041C281CFFF772FD011C201C43
-:101220001CF082FA03239843013B1843014BC0187A
-:1012300038BDC0460000808008B5FFF761FD1BF097
-:10124000F5FD03239843013B1843014BC01808BD2B
-:101250000000808008B5FFF753FD1CF013FA03234C
-:101260009843013B1843014BC01808BD0000808023
-:1012700008B5FFF745FD1CF0B3F903239843013B84
-:101280001843014BC01808BD0000808008B5FFF767
-:1012900037FD1CF021F903239843013B1843014B10
-:1012A000C01808BD0000808008B5FFF729FD1CF0BC
-:1012B000D1F803239843013B1843014BC01808BDE4
-:1012C0000000808008B5FFF71BFD1BF017FF03230C
-:1012D0009843013B1843014BC01808BD00008080B3
-:1012E00008B5034903480AF0F1FCFEF794FFC04635
-:1012F0006E270300D8E5020070B5061C08680D1CB7
-:10130000FFF7FEFC0021041C18F050FD002801D05E
-:10131000FFF7E6FF201C1CF0E1FA041C012E06D1A9
-:10132000032302209C430D4B0443E01815E068683A
-:10133000FFF7E6FC0021051C18F038FD0028E7D176
-:10134000281C1CF0CBFA011C201C18F07FFF032383
-:1013500002249843014B2043C01870BD00008080D8
-:1013600008B5FFF7CDFC1CF0E3F903239843013BDC
-:101370001843014BC01808BD0000808038B50D1C13
-:10138000FFF7BEFC041C281CFFF7BAFC011C201C44
-:101390001CF022FB03239843013B1843014BC01868
-:1013A00038BDC0460000808010B5FFF7A9FC0021C1
-:1013B000041C18F0F1FC002801D0FFF791FF201C5D
-:1013C0001CF0B2FC03239843013B1843014BC018A7
-:1013D00010BDC0460000808008B50B1C02495A6849
-:1013E00023F00FFB08BDC046A434030073B501A968
-:1013F00001F0DCFD019B061C502B02D9184819494D
-:101400001CE08020400024F021F8174C051C231C10
-:10141000883318600023019A934203D0F15CE954A9
-:101420000133F9E75B22281CEA5408F01DFF2B1C4E
-:10143000002807D1883420600C49094823F0D2FFE6
-:10144000FEF7E9FE5A1B0133591E09789B29F9D191
-:10145000291C074821F08DFD00238834236076BDC8
-:10146000D8E5020080270300882E00208F27030084
-:1014700040EC0200F0B58BB0061C10A80778344889
-:1014800005AD00900195081C111C1A1C052303F0E2
-:10149000CDF89120000123F0D9FF2E4B04A918604C
-:1014A000059B476043702B792B4F03702B7A041CEC
-:1014B00083702B7BC3702B7C301C3B6001F076FD6E
-:1014C0000025264B03900C201D6023F0BFFF244B0A
-:1014D000061C036011F0A4FAB06011F0A1FA214BD0
-:1014E00021491860214B70601D70214B301C1D700C
-:1014F000204B0A1C1D602B1C11F0A0F9201C039925
-:10150000049A25F05CFC201C0FF076F81A4C194E5A
-:10151000154D002808D10F4B1860184B1848196852
-:1015200023F060FFFEF777FE0122164B1A7011F0D0
-:1015300071FA0028FBD13B6888342060002B03D06F
-:101540001148316820F002FA281C0BB0F0BDC046EB
-:1015500094BD0200102F0020482700204C010020DD
-:10156000D0BD02004801002094BA0200F72D0020EF
-:10157000F82D002050010020882E00201C000020A3
-:10158000D8E50200F62D0020A627030000220D4911
-:1015900010B50B78DBB2934212D10B4A1478002CB1
-:1015A00002D001240C701370084B1B78002B06D05E
-:1015B000074A136820331360064B1A6800E08268FC
-:1015C000101C10BDF82D0020F62D0020F72D002056
-:1015D0004C01002048010020D2235B005843134AED
-:1015E00030B51368000C834206D9114C23680133CF
-:1015F00023601368203B13601F23051C14689D4360
-:10160000A54203D901240B4B1C70F5E703401A1DBA
-:10161000202A00D92022084C2468934203D2E518DE
-:1016200029710133F9E7054B186030BD4C010020EA
-:1016300050010020F72D0020480100204401002027
-:1016400010B588B0694601AA041C0AF0E5FB009BAE
-:10165000022B2AD904A8322102AA0DF097FF019B80
-:1016600013495A6802A823F0CCF9201CFFF7FAF9B5
-:10167000104BC2689A4210D1236802A85A680E49DA
-:1016800023F0BFF9E368002B07D05A68002A04D082
-:1016900002A899680022FFF7FFF904A825F09FFA35
-:1016A00012F0DCFA04A825F04AFA08B010BDC046D2
-:1016B000B5270300B5BB0000BE27030070B5051CAD
-:1016C00090B0002803D11F4820F012FA38E004A897
-:1016D000FEF786FD041E19D12E6801A8291C0122DF
-:1016E00005F0B8FB221C231C311C01A80DF09CFB4B
-:1016F000041C032012F036FA201C23F060FB0120AA
-:10170000404212F02FFAFEF781FD19E0012040421D
-:1017100012F028FA05990C48FFF7E2F90598FFF74F
-:10172000A1F90A49041C00F007FE002808D1201C7A
-:10173000074900F001FE002802D10598FFF780FF5D
-:1017400010B070BDC22703003CD30200F8E60200CF
-:1017500090E5020037B5294B01AA1A6002F036FC69
-:10176000E120C00002F046FC254B2648C11807F0D6
-:101770008DFF05F075FD12F0D3F90DF031FD11F07C
-:1017800017FE0023204CA367204B1A781D1C012A4A
-:101790001FD1F8239B021A784D2A07D15A78502A74
-:1017A00004D159881A4821F044FA12E0002219485D
-:1017B0000721131C0EF022F9002802D021F044FA70
-:1017C00007E04C2014490122FF3006F03FFC23F0D3
-:1017D0001EFB2B78002B0ED103F04CF90028F8D01B
-:1017E0000E4826F054FD00230D4A536013606367D2
-:1017F00023F0E1FA37BD03F099F9EFE73027002035
-:10180000DC25000054010020882E00200601002065
-:1018100004E00300EF270300ACCF0200F72703002A
-:10182000F42E002007B507F0BDFF054B01A819688D
-:10183000091A890807F070FF07F0C8FF07BDC04606
-:1018400030270020F8B5041C03780020834200D123
-:101850009AE0402B01D1012528E0201C4B4921F0C2
-:1018600009FA0028F7D1201C494921F003FA002881
-:10187000F1D1201C474921F0FDF90028EBD1201CB3
-:10188000454921F0F7F90028E5D1201C434921F012
-:10189000F1F90028DFD1201C414921F0EBF90028A3
-:1018A000D9D1201C3F4921F0E5F9051C0023191C62
-:1018B0001E1C1F1C2278002A51D0272A10D1002B71
-:1018C00001D0032B08D16278272A05D1A278272AD4
-:1018D00002D10234243A16E00122012B3DD812E055
-:1018E000222A12D1181C1E3A904309D1607822286E
-:1018F00004D1A078222801D1023404E0002B01D0C9
-:10190000022B2AD10222D31A27E05C2A09D160785F
-:10191000272801D0222804D11A1C501E8241A41865
-:101920001BE0002B19D15B2A12D006D8282A0DD033
-:10193000293A50424241BF1A0FE07B2A0AD07D2A41
-:101940000AD05D3A50424241B61A06E0013704E03F
-:10195000013602E0013100E001390134AAE701203B
-:10196000002F11DC002E0FDC00290DDC033B83422D
-:101970000AD9013C23785C2B06D0101C002D03D023
-:101980000A3B581E8341D8B2F8BDC04639750300E2
-:10199000052803000B2803000F280300C74C030091
-:1019A000B4AF030070290300F0B5051C8BB04618D6
-:1019B000049207930296029B5C1EAC4210D32078DF
-:1019C000FEF7D4FE002809D12078FEF7DBFE0028C0
-:1019D00004D123785F2B01D02E2B02D10294EAE7A9
-:1019E0000295724B1D68029CB44209D3029BE31A14
-:1019F0000193B44209D30024261C271C039448E019
-:101A000023782E2BF2D00134EEE70027AB689F42FB
-:101A10001CD2FB000393039AEB689858002817D058
-:101A2000042815D009A901F0C1FA019B099A011CEB
-:101A300093420DD102981A1C29F0D5FC002807D139
-:101A4000EB68039A9B185868002803D10020AAE08D
-:101A50000137DBE783070AD10368554A934203D174
-:101A600021F084FF051C0BE0524A934201D0FEF79F
-:101A7000F9FF856B002DE9D04F4B2A689A42E5D1DA
-:101A8000631C0293AFE7EA68E3009858002804D18A
-:101A90000134AB689C42F6D329E00428F8D009A9A8
-:101AA00001F084FA099B05900693069A019B9342E4
-:101AB000EED8029805991A1C29F095FC0028E7D168
-:101AC000019B002F0BD0B3420DD8069A93420AD83F
-:101AD000059AF95CD25C914204D10133F3E7069E8A
-:101AE000059F00E01E1C039B01330393D0E7039B7B
-:101AF000002BABD0012B02D0019B9E4206D9019B4B
-:101B0000079AFB181360019BF01A4CE00023402653
-:101B10000393039BAA6893423FD2039BEA68DB00CE
-:101B20009858002835D0042833D009A901F03EFA8E
-:101B3000099F019B0590BB422BD8029805991A1C5E
-:101B400029F051FC002824D1331C0F33DC17240F5B
-:101B5000E41824112401A41B012C00DC10343319D7
-:101B6000DB190027402B0ED80498A74204DA13494A
-:101B700022F07BFE0137F7E7059922F076FE099BFC
-:101B8000F618361905E004980D49059A22F039FF38
-:101B9000099E039B01330393BBE70498094922F094
-:101BA00064FE012040420BB0F0BDC046882E0020EC
-:101BB000D0CF0200A4BE0200C4F602007AAA03003D
-:101BC0001328030027430300F7B501911149041CB2
-:101BD000171C002522F049FE7B689D4214D2002D7F
-:101BE00003D0201C0C4922F040FE019BAE009A5904
-:101BF0000A49201CBE1922F004FF201CB1680122F2
-:101C0000FEF74AFF0135E7E7201C054922F02DFECB
-:101C1000F7BDC04616760300172803001A280300F4
-:101C2000CE260300F8B5041C0D1CA368002B0AD0B7
-:101C3000334AE968914206D0EB58002B03D00422C6
-:101C4000E3681A605AE0A86B002820D00621636878
-:101C50000430DB001943002208F034FE031E16D0C6
-:101C6000227C002A02D0002021680BE02068002896
-:101C700007D0234AE968914203D0224A954200D016
-:101C80000069291C5A68E36805F03CFC36E02368CB
-:101C9000002B03D16E6B002E14D12FE0227C002A82
-:101CA000F8D1174AE9689142F4D0164A9542F1D02A
-:101CB00018696168E26805F067FCE3681B68002B3F
-:101CC000E8D01BE075680836002D17D000276B1E82
-:101CD0000C4A9F420CD2BB00F158914206D0201C06
-:101CE000FFF7A0FFE3681B68002B07D10137EEE781
-:101CF000054BED18AD00AD59954296D1F8BDC046E3
-:101D0000B91F00004CED0200FFFFFF3FF0B5146863
-:101D100089B0002C1FD143685E6B002E1BD0171CAE
-:101D2000736803AD01938368083603936960AC6000
-:101D3000EA602C74019B9C4209D0A300F158281C36
-:101D4000FFF770FF3B68002B05D10134F2E7281C38
-:101D50000249FFF767FF09B0F0BDC0464CED020035
-:101D600008B50B1C02495A6822F04BFE08BDC0465C
-:101D70001E28030070B50E1C00218AB0041C151C1F
-:101D800005A814220091019129F021FA202307933C
-:101D90006B46059408931C23002D02D0042D07D117
-:101DA0001A23216805A80693FFF73CFF022106E0ED
-:101DB0001B23216805A80693FFF734FF0321009831
-:101DC000042805D12069311C2A1CFFF7C1F80DE059
-:101DD00000280BD002AB002202940396049505F074
-:101DE00055FB031C0248042D00D1181C0AB070BD1D
-:101DF00094BA0200F0B5204B82008BB0D25805AEE9
-:101E0000002372601422019003AF05910D1C301C59
-:101E1000096803937B60B260F7603374FFF702FFD9
-:101E2000039C042C05D10198296905F0C5FA041C0E
-:101E30001EE0002C0DD0201C291C22F0C7FF019BA6
-:101E4000041C022B14D1FEF723FF0124400004439D
-:101E50000EE0019B022B0BD12433301C29687360E8
-:101E6000FFF7E0FE3B68002B02D101246D002C43FC
-:101E7000201C0BB0F0BDC04628C00200F0B5161CF7
-:101E80007242724189B00C1C1F3200230492082256
-:101E900001A903AD0691071C2168281C0193029338
-:101EA0002B7403940592FFF7BDFE019B002B08D114
-:101EB000002E06D11F33281C21686B60AE60FFF72F
-:101EC000B1FE0198042819D12069FEF7CBFD164B0D
-:101ED000C2689A420ED1002E07D02368586823F0BA
-:101EE000DEF8011C381C22F0C0FC8022381C324372
-:101EF00021690BE0381C2169321C07E0002808D05A
-:101F0000211C22F063FF0022011C381CFEF7C4FDD7
-:101F100008E0201C20F0E7FD0449021C231C381CAB
-:101F200022F06FFD09B0F0BDB5BB00002B28030007
-:101F300038B5041C0D1C0B4922F097FC6968201C65
-:101F40000022FEF7A9FD201C074922F08EFCA9689B
-:101F5000201C0022FEF7A0FD201C044922F085FC75
-:101F600038BDC0463D28030017280300BD310300DB
-:101F7000F7B50025436808300F1C061C2C1C019384
-:101F8000019B9D4212D0AB00F358094A93420BD0FB
-:101F9000084AD968914202D03B60013404E0586B92
-:101FA000391CFFF7E5FF24180135E9E7201CFEBDC9
-:101FB0004CED0200B91F0000F0B58FB0051C0F1CDE
-:101FC000406B05A901920293FFF7D2FF061DB600F0
-:101FD000301C23F03BFA041C002120C023F0D6F86B
-:101FE000321C201C103A1030002129F0F0F8012F8B
-:101FF00005D1029B1B680393042B00D183E00922C7
-:10200000002309A8426007AE0332291C8260C66023
-:102010000374079373600993FFF704FE079804287D
-:1020200007D10598391CC668019A029BB047206108
-:1020300023E0002821D0019A3A4306D1012106ABC2
-:10204000069505F023FA041C17E0019B5C003C197F
-:102050000134A400201C23F0F9F9221F03900299F7
-:1020600020C029F097F8791C3068019A039B05F08D
-:102070000DFA041C039823F010FA201CFEF7F2FC62
-:10208000A84240D10023082209A8291C08930793DD
-:102090000B9309940A92FFF7C5FD079B002B32D0E2
-:1020A0000199394305D1081C07AA22F097FE061CA6
-:1020B0001CE0019B5E00BE190236B600301C23F006
-:1020C000C5F9321C051C079B083A03600393089B63
-:1020D00002994360083029F05DF8381C01992A1CE8
-:1020E00022F07CFE061C281C23F0D7F9074B9E42E9
-:1020F00009D0301C20F0F7FC0549021C054809F006
-:10210000E5FDFEF788F8201C0FB0F0BD94BA020080
-:1021100046280300C8EA020038B5C568041C002D33
-:1021200006D104496268044809F0D0FDFEF773F84F
-:10213000A84738BD6E280300C8EA0200F8B5041CA1
-:102140000F1C161C1D1C20F0D1FD002809D1201CDD
-:1021500020F0C9FC0949021C094809F0B7FDFEF747
-:102160005AF8042801D1206902E0211CFEF74AFF39
-:10217000391C321C2B1C05F089F9F8BD8B28030093
-:10218000C8EA0200F0B5154B89B0161C8200D5587C
-:102190000C1C0C220021071C684629F018F8182393
-:1021A00003A84560836000256B462168C360057401
-:1021B0000394FFF737FD0098042805D1381C2169E6
-:1021C000321C05F0EBFA07E0002805D00120291C9D
-:1021D0006A46029622F002FE09B0F0BDE0BE02009F
-:1021E000F0B585B0071C0D1C081C161C01A902AA1D
-:1021F00021F006FA0023019902988B420CD09A0034
-:102200008258D468002C05D123495268234809F02C
-:102210005DFD26E00133F0E73C2023F029F9204B57
-:10222000041C03601F4B476083601F4B4563C36002
-:102230001E4B866303611E4B03A943611D4B8361E3
-:102240001D4BC3611D4B03621D4B43621D4BC3629B
-:10225000281CFFF78DFE012805D910481A4923F0E4
-:10226000C1F8FDF7D8FFA36B4E21181D002208F01E
-:1022700029FB051E0DD0032243681A4009D11B68B3
-:102280005B68F22B05D1031D0121104820F089FD68
-:102290006860201C05B0F0BDA7280300C8EA020052
-:1022A000A4BE02007D1E0000B91F00003D210000F9
-:1022B000F51D000085210000172D0200751D00008E
-:1022C000672E0200232E0200D0280300E0BF020088
-:1022D00037B51C1C00230D1C0093081C0333111C74
-:1022E000012202F071F9012D09D0032D0BD12068D4
-:1022F00000F0C6F96168A268FFF772FF09E0206884
-:10230000FEF7B0FB05E00349034823F06BF8FDF747
-:1023100082FF3EBDFE280300C8EA020038B5051C56
-:102320000C200C1C23F092F8024B45600360846083
-:1023300038BDC04668BF0200F8B50F1CB8421ED0B9
-:10234000032404401DD1134B02689A421BD1466BF3
-:10235000002E1AD075680836002D18D06B1E9C42CE
-:1023600008D2A300F058391CFFF7E6FF00280FD170
-:102370000134F3E7084BED18AD00A859DEE7012062
-:1023800006E0002004E0201C02E0301C00E0281CD5
-:10239000F8BDC046A4BE0200FFFFFF3FF0B585B008
-:1023A000051C0191081C8B0710D10B68154A93423C
-:1023B00004D10123029301AB03930DE0124A93422F
-:1023C00004D102A903AA21F01BF905E00F49104826
-:1023D00023F008F8FDF71FFF0024029E039FB4427C
-:1023E0000BD0A300F9580B4B994208D0281CFFF7DB
-:1023F000A3FF002803D10134F1E7074800E00748B4
-:1024000005B0F0BDA4BE020070CF02001A2903007F
-:10241000C8EA02004CED0200A0C302005CC3020047
-:1024200008B5830703D1064B02689A4205D00549D7
-:10243000054822F0D7FFFDF7EEFEFFF7AFFF08BD1E
-:10244000A4BE020053290300C8EA0200032210B50B
-:1024500002400121002A04D10A4C03688C46A342A1
-:102460000ED00B1C03409C4608D1002A08D10368FB
-:1024700005481B1A5A425A41944601E001239C46E2
-:10248000604610BD64C302004CB9020010B5041CC4
-:10249000FFF7DCFF0123002809D10322031C22409F
-:1024A000022A04D1034B2340063B581E83410120DE
-:1024B000184010BD070080FF08B520F014FB034949
-:1024C000021C034809F002FCFDF7A5FE7D2903006C
-:1024D000C8EA020010B5041C102022F0B7FF044B1C
-:1024E00084600360034B43600023C36010BDC0469B
-:1024F000D8C30200E3310200F7B50E1C0193041C9F
-:102500008B180A1C00210093009B9A420ED213786C
-:10251000272B04D0223B58424341DBB201E0002389
-:1025200001210132002BEFD0272503E027250029C8
-:1025300000D0053D1F4F201C391C2A1C22F061FAD7
-:10254000009B9E422FD23278AA4203D1201C1A4906
-:102550002A1C24E05C2A02D1201C18491AE01F2AF8
-:102560000AD97F2A19D0019B002B02D053B2002B2D
-:102570000CDB201C391C12E00A2A02D1201C104955
-:1025800008E00D2A02D1201C0E4903E0092A04D1DB
-:10259000201C0D4922F069F903E0201C0B4922F0B0
-:1025A00030FA0136CCE7391C2A1C201C22F029FA0B
-:1025B000F7BDC046AA290300A9290300AD290300DD
-:1025C000B0290300B3290300B6290300B929030089
-:1025D000194B70B5061C0D1C98420ED188684968CD
-:1025E00007F0FCFC041E08D0281C24F0A8FA0023E5
-:1025F0000620E4002B6020431DE0102022F026FF7F
-:102600006968041C81600660A86807F0C9FC6B68F3
-:102610006060591C2B68994202D1AB68E36003E00B
-:10262000A86822F029FFE0600023201CE268A1686E
-:102630005354AB602B6070BD40EC020038B5051CF4
-:102640000C1C002A02D007F0FFFC03E007F0C6FCD8
-:10265000002803D00623C000184304E00248291CC8
-:10266000221C20F086FC38BD40EC020008B5031C9B
-:102670000A1C0248191C20F07CFC08BD44C2020060
-:1026800008B50B4B0340062B01D1C0080EE0031C1C
-:10269000820708D1074A0168914204D19968C0684D
-:1026A00007F0D2FC02E0181CFFF706FF08BDC04689
-:1026B000070080FF40EC020008B5064B0340062BE4
-:1026C00003D1C00822F0F0FC02E08368C0680B6010
-:1026D00008BDC046070080FFF0B5002689B0051C84
-:1026E0000F1C081C1C1C111C0096321C032301F03B
-:1026F0006BFF0E20B74237D0012F0ED104A802AADB
-:1027000010210CF043FF02A82168321CFEF7C4F927
-:10271000281C04A9FFF75CFF26E0206804A98307B2
-:102720001AD1124B02689A4216D1FFF7C5FF104B1F
-:10273000061C20680340062B04D1C00822F0A5FC2B
-:10274000041C00E044681020049F22F07FFE056016
-:102750008760C660446007E00122FEF72DFC049804
-:1027600005990022FFF76AFF09B0F0BD44C20200DC
-:10277000070080FFF0B58BB0049008680D1C06922E
-:102780000793FEF76FF9041C6868FEF76BF9061EE5
-:10279000A64202D06868FFF78FFE08A92868FFF7F5
-:1027A0008BFF041C09A96868FFF786FF089A05904B
-:1027B000A3180393049B271C022B19D9AB681F494C
-:1027C0008B4206D00121301C0091211C09F0F6FB40
-:1027D000071C049B032B0BD0EB68184A934207D0CD
-:1027E0000122301C0092211C089A09F0E7FB03909B
-:1027F000039B381CD91B069B059A0093099B20F06C
-:1028000099FB011E0AD10120079B4042002B12D0E8
-:102810000B490C4822F0E6FDFDF7FDFC0A4B9E42F9
-:1028200005D1201C20F024F90121400002E0001B0A
-:102830004100012008430BB0F0BDC04694BA02002D
-:10284000C0290300D8E5020040EC0200F0B58DB0CD
-:10285000041C0391FEF706F904A9061C201CFFF7CF
-:102860002BFF0190039883070BD10368314A9342F1
-:1028700004D105A906AA20F0C3FE10E02E4A934217
-:1028800008D02D480121C36800220293029C03ABAB
-:10289000A0470390039805A906AA21F05FF9002438
-:1028A000251C059B9C421ED2069BA700D859FEF70B
-:1028B000D9F8B04205D02149214822F093FDFDF717
-:1028C000AAFC002C01D0049BED18069BD8591D4B87
-:1028D0000340062B03D1C00822F0DCFB00E0806837
-:1028E0002D180134DDE7291C002508A824F014F96F
-:1028F0000A9C059B9D4217D2002D06D0201C0199F1
-:10290000049A28F047FC049BE418069AAB009858F8
-:1029100007A9FFF7D1FE079A011C201C28F03AFCFA
-:10292000079B0135E418E4E7301C08A9FFF750FEC7
-:102930000DB0F0BD70CF0200FCD10200D42903001D
-:10294000C8EA0200070080FFF0B5071C87B00868DE
-:102950000D1CFEF787F804A9061C2868FFF7ACFEDB
-:1029600005A9041C6868FFF7A7FE0390201C022F2E
-:1029700007D90123301C0093211C049AAB6809F08D
-:102980001DFB059A041B0499A418064B8C4206D81B
-:10299000039928F0F0FB044B002800D0014B181CD1
-:1029A00007B0F0BDA0C302005CC3020073B50D1CEC
-:1029B000061C08686946FFF77FFE01A9041C6868C9
-:1029C000FFF77AFE011C022E02D9084805F006FC2A
-:1029D000019A009B06489A4207D8981A201828F0B6
-:1029E000CAFB031E034800D0014876BD192A030024
-:1029F000A0C302005CC30200F0B58FB0079010685E
-:102A00000C1C171CFEF72EF80690012C10D07868CD
-:102A1000FEF728F8069B984202D07868FFF74CFD35
-:102A200078680DA9FFF748FE0D9B0890099303E015
-:102A3000072309932C4B089338680DA9FFF73CFE38
-:102A40000D9B0B900493079B012B05D1049B5D1EEE
-:102A500001235B420A9302E0012300250A9300242C
-:102A6000261C049B03940593059B002B22D00B9BF3
-:102A700008985A1901230999009320F05BFA00285D
-:102A800012D1039B002B0ED1079B002B03D1049B7B
-:102A90002E1C5D1E19E0079B012B15D001232C1C59
-:102AA0002E1C039300E02C1C0A9BED18059B013B98
-:102AB0000593D9E7039B002B08D10C4B069A0E20F7
-:102AC0009A420FD00A480DE0039E2C1C049B01344F
-:102AD000A21B9A4201D1386804E00B9B0698991911
-:102AE00020F047FA0FB0F0BD7629030040EC020059
-:102AF00050C00200F0B589B0049008680D1CFDF7C5
-:102B0000B1FF041C6868FDF7ADFF071EA74202D0A5
-:102B10006868FFF7D1FC06A92868FFF7CDFD061C01
-:102B200007A96868FFF7C8FD069A0590B3180393D4
-:102B3000049B341C022B19D9AB681F498B4206D069
-:102B40000121381C0091311C09F038FA041C049B47
-:102B5000032B0BD0EB68184A934207D00122381C94
-:102B60000092311C069A09F029FA0390079B002570
-:102B7000002B10D1039B201C191B1FF088FF013074
-:102B80004000012514E0201C059928F0F4FA0028E3
-:102B900007D10135341C079A039BA6189E42F2D92F
-:102BA00004E0201C1FF05DFF061CF3E701206D0010
-:102BB000284309B0F0BDC04694BA0200F0B58BB00E
-:102BC0000E1C071C0392FDF74DFF041C301CFDF783
-:102BD00049FF844202D0301CFFF76EFC05A9381C67
-:102BE000FFF76AFD06A9051C301CFFF765FD069B73
-:102BF000021C002B05D11A491A4822F0F3FBFDF7FD
-:102C00000AFB19498C4201D10E2100E017490791B6
-:102C1000089109910399002901DD079700E00997C0
-:102C20000399281C0091059920F084F9002811D0FF
-:102C3000471B3A1C291C201C20F09BF9069A059B77
-:102C4000B918DF1B07906918BA1A201C089620F0E3
-:102C500090F9099007A9032002F024FC0BB0F0BD05
-:102C60002B2A0300D8E5020040EC020050C002000D
-:102C700008B5011C014820F093FA08BDAF2A0200F4
-:102C800008B5011C014820F08BFA08BDC32A0200D8
-:102C9000F7B5061C081C01A9FFF70EFD019B051CDA
-:102CA000002B01D1144826E0144B041C9E4201D194
-:102CB000002712E0124B9E42FAD0019A631B934206
-:102CC00018D22078B04701340028F6D1EAE72078FE
-:102CD000FDF74CFD002805D10134019A631B934296
-:102CE000F5D305E02078B0470028DBD00127F3E7D3
-:102CF000002FD7D00348FEBDA0C30200D5070000B7
-:102D0000ED0700005CC3020008B5011C0148FFF795
-:102D1000BFFF08BD5507000008B5011C0148FFF7BB
-:102D2000B7FF08BD6D07000008B5011C0148FFF79B
-:102D3000AFFF08BD8507000008B5011C0148FFF77B
-:102D4000A7FF08BDD507000008B5011C0148FFF723
-:102D50009FFF08BDED070000F0B585B0041C0D1CF9
-:102D6000171CFDF77FFE6946061C201CFFF7A4FC1C
-:102D7000041C042F22D1AB0715D1124B2A689A42AA
-:102D800011D10098291C01AA02F0A4FC002802D14C
-:102D90000D4805F023FA019B029AE118D21A301C63
-:102DA00020F0E7F80BE00023301C00992A1CFEF706
-:102DB0001BF80123205C4000184300E0002005B010
-:102DC000F0BDC046B0F202003B2A030070B58AB0E5
-:102DD00000296BD018681C1C031C364D2B40062B99
-:102DE00005D083071ED1344B02689A421AD10239AA
-:102DF000012955D806A9FFF75FFC061C206805408D
-:102E0000062D04D1C00822F040F9041C00E04468FB
-:102E10001020069D22F01AFB284B85600360C660D7
-:102E2000446044E001293BD8012210420CD04410F8
-:102E3000211C06A823F070FE089B0021181C221CF0
-:102E4000019328F0C4F926E003A91FF062FE0028D0
-:102E500005D00399049A194820F08BF827E02068E0
-:102E6000FEF706F8002802D106A8102101E0411063
-:102E700006A823F03AFE206804F002FC041C201C83
-:102E800004F04CFC002806D0FDF7D6FEC1B206A81F
-:102E900023F0B8FEF3E706A90848FFF799FB06E020
-:102EA0000749084822F09EFAFDF7B5F906480AB02E
-:102EB00070BDC046070080FF40EC020044C2020023
-:102EC0006C2A0300C8EA020050C0020073B5041C5B
-:102ED000081C01A9161CFFF7EFFB051C201C042E83
-:102EE00005D10849019A2B1C21F08BFD08E0064909
-:102EF00021F0BBFC201C291C019A0123FFF7FCFADE
-:102F000073BDC046862A0300C0460300F7B5021C05
-:102F10001A4B051C0C1C1A401E1C062A08D10B401B
-:102F2000401A062B26D0E80822F0AFF8071C00E074
-:102F300047682640062E03D1E00822F0A6F800E0FC
-:102F40006068002F05D0002803D0874201D0002000
-:102F500013E0281C6946FFF7AFFB01A9051C201CE4
-:102F6000FFF7AAFB009A019B011C9A42EFD1281C93
-:102F700028F001F944426041C0B2FEBD070080FF65
-:102F8000084B07B50340062B08D0830704D103681C
-:102F90009A69054B9A4201D0FFF78EFA01A9FFF713
-:102FA0008BFB0EBD070080FF8D3500000A4B13B56B
-:102FB00003400C1C062B08D0830704D103689A69D0
-:102FC000064B9A4201D0FFF777FA01A9FFF774FB8D
-:102FD000019B236016BDC046070080FF8D350000B1
-:102FE000F0B59BB00B900C1C079212A810210EAAF2
-:102FF00009930CF0CBFA079B9C4200D3ACE22178FA
-:103000007D2909D1079B671C9F4202D261787D29E7
-:1030100010D0BE48BE493EE07B2904D012A823F060
-:10302000F1FD271C87E2079B671C9F4254D2617801
-:103030007B2903D112A823F0E5FD7CE27D2916D07F
-:10304000212914D03D1C3A2911D02B787D2B08D092
-:10305000212B06D03A2B04D0079B01359D42F4D199
-:1030600040E0079B9D423DD23C1C2F1C01E0002507
-:103070002C1C3B78212B12D1079A7B1C9A4208D931
-:103080007E78331C723B012B03D8BB1C934208D3C0
-:1030900028E09E489F4922F0A5F9FDF7BCF83B1CAB
-:1030A00000261A7800273A2A00D048E25F1C5B7895
-:1030B0007D2B14D03B1C393A07998B4212D21978D8
-:1030C0007B2901D1013205E07D2903D1013A002A93
-:1030D00000D134E20133EFE70026351C341C079B96
-:1030E0009F4202D389488C49D5E7002305933B785A
-:1030F0007D2B02D085488949CDE7002C47D000239D
-:1031000020781693FDF73EFB211C002822D0099B56
-:103110001B680493002B02DD7C488149BBE716AA9B
-:10312000201C291C1FF0EEFE209A169B013A0690E7
-:10313000934237D2219A01339B009B58099A0493FA
-:1031400001235B4213601CE00B782E2B04D05B2B19
-:1031500002D00131A942F7D30691201C091B01229C
-:10316000FFF76CFA041C00222298211C07F0AAFB2E
-:10317000002804D1211C6B4822F02DF98DE743680B
-:103180000493069BAB4217D2674805F027F8099BCA
-:103190001B68002B02DA5D4864497CE7209A013AFB
-:1031A000934202D36248634975E7013321999A003B
-:1031B00052580492099A1360059B002B03D1002EEC
-:1031C00000D1BAE101E0002E12D016A8102110AAF9
-:1031D0000CF0DCF9321C733A531E9A4110A8D2B29B
-:1031E0000499FDF759FC544816A9FFF7F1F904902A
-:1031F00001235B420D931093059B002B00D1A3E0AC
-:1032000000F00AFF209B16A80093219B05990193CB
-:10321000229B3A1C0293099BFFF7E2FE16A823F0BB
-:10322000DEFC179B0678C3180A930023041C059341
-:103230009E4216D0414D311C281C28F0B5F80028BC
-:1032400000D07FE163780593002B09D0281C191C5E
-:1032500028F0AAF8002800D078E10590061C00E0CC
-:10326000059E237808932B2B05D02D2B05D0042504
-:10327000202B05D102E0022500E00025013401E009
-:10328000002508952378232B02D1133B1D430134DD
-:103290002378302B07D1059B002B01D13D330593BB
-:1032A000002E00D13036201C0A990DAA1FF02AFEEC
-:1032B000037806902C2B04D10C3B1D43031C0133D7
-:1032C0000693069B1B782E2B06D106980A9901308F
-:1032D00010AA1FF017FE0690069B1C78002C07D042
-:1032E0001748211C28F060F8002800D030E1041CA9
-:1032F000069B1B78002B02D004481249CBE616A887
-:1033000023F01DFC059B002B2BD121E0D8E502000A
-:103310008B2A0300B32A0300CC2A0300E42A03000B
-:10332000082B0300B8EB02006B2B0300882B030073
-:1033300034E70200522B030040EC0200D22B0300C2
-:10334000D72B0300E72B0300059D2C1C2E1C089592
-:103350000498FFF79BF83E230593002801D1023B18
-:103360000593002E00D12036089B002B09D0732C2A
-:1033700002D17E487E498EE6632C02D17B487D498E
-:1033800089E6059B3D2B05D05E2B05D03C2B05D156
-:103390003B3B02E0402300E080231D430498FFF7FD
-:1033A00055F800285FD0632C23D016D8472C06D8B8
-:1033B000452C58D2002C27D0252C54D04CE0582C2A
-:1033C0003CD0622C48D10D9B0095029300230196BE
-:1033D00003930EA8049902222EE0672C02D8652CD4
-:1033E00012D340E06F2C19D0782C27D06E2C33D11B
-:1033F0000AE00498FDF720FC0D9B16A90870012235
-:10340000009601930EA889E00D9B0095029300237E
-:10341000019603930EA804990A220DE0EB0602D54B
-:1034200080239B001D430D9B0822029300230499D7
-:103430000095019603930EA861330AE00D9A231CB0
-:103440000292002204990392173B009501960EA860
-:10345000103203F057F96EE004981FF044FB464920
-:10346000031C424863E00498FFF710F8002838D0A6
-:10347000002C1FD06E2C1DD0472C15D8452C1AD2ED
-:10348000252C27D10498FDF73BFC3C4917F0D0F8D8
-:1034900080230D9A5B000192109A011C02922B432B
-:1034A00000960EA8662212E0231C653BDBB2022BBD
-:1034B00010D800E067240498FDF722FC0D9B221C25
-:1034C0000193109B011C02932B1C00960EA821F067
-:1034D00049FA30E004981FF006FB2949031C2348F1
-:1034E00025E0059B3D2B02D120482649D3E50498D1
-:1034F000002C01D0732C15D116A9FFF757FD109B96
-:10350000011C169A002B00DA1092109B9A4200D9E7
-:1035100016930D9B169A009601930EA82B1C03F090
-:1035200093F808E01FF0DFFA1749031C0F48221C2C
-:1035300008F0CCFBB1E57C1C5DE5732645E60597FC
-:103540001F1CD4E50596013400268AE6023488E67D
-:10355000069B01330693CBE60B9A12AB13CB13C237
-:103560001B6813600B981BB0F0BDC046D8E5020085
-:10357000002C03002C2C03005F2C03000000C84229
-:10358000902C0300C42C0300F92C0300F0B5A1B06B
-:10359000041C0D1C0D920A2800D0E6E1073C06929F
-:1035A000144010D11368B94A934206D1069810A965
-:1035B0000FAA20F025F806940BE0B54A934202D1F9
-:1035C0000F94109405E00DAB0F930123109300238B
-:1035D0000693109B281C08930F9B11A90A93FFF7D1
-:1035E0006BF800230B900C93AB0705D1A94A2B680D
-:1035F0009B1A5A425A410C9214AA18A810210BF097
-:10360000C5FF119A002794460B9B0B9C63440593BE
-:10361000059B9C4200D39BE12178252903D018A863
-:1036200023F0F0FA92E1059B661C9E4202D39A4871
-:103630009A4916E06178252904D118A823F0E2FA06
-:10364000341C83E10025282919D1A01C061C00E0A8
-:1036500001363378292B08D0059B9E42F8D38E483B
-:103660008F4921F0BFFEFCF7D6FD311A0122FEF78B
-:10367000E5FF011C06980DF02DFA051C013600230C
-:10368000341C0026099320330793059B9C4211D2DA
-:1036900023782D2B01D12C3B06E02B2B01D1293B8C
-:1036A00002E0202B02D11C3B1E430FE0232B0BD04A
-:1036B000302B05D000231293059B9C4208D320E0B9
-:1036C00040220793164301E0102309930134DCE7FD
-:1036D00023782A2B0FD1089A3B1E934202D37148BC
-:1036E0007149BEE70A9A9B009858FDF7A5FA013781
-:1036F0001290013405E0201C059912AA1FF002FC6B
-:10370000041C01235B421393059B9C428FD22378B8
-:103710002E2B1ED1059B601C984288D263782A2BE1
-:103720000CD1089A3B1E9342D9D20A9A9B00985812
-:10373000FDF782FA01371390023406E00023059961
-:1037400013AA13931FF0DEFB041C059B9C4200D3BD
-:103750006DE7002D07D1089A3B1E9342BFD20A9A0B
-:103760009B009D5801372378672B0FD8652B6AD2B1
-:10377000582B00D1D1E004D81A1C453A022A62D94C
-:10378000DBE0632B12D0642B42D0D6E0732B07D83A
-:10379000722B00D392E0692B3AD06F2B63D0CCE030
-:1037A000752B35D0782B00D1B7E0C6E03F4B2B40CE
-:1037B000062B05D0AB0714D13D4B2A689A4210D195
-:1037C0001CA9281CFFF7F2FB1C9A011C012A02D03D
-:1037D0003448384945E720230093129B14A80193ED
-:1037E0000FE0281CFEF732FE00280ED0281CFDF743
-:1037F00023FA202301221CA908700093129B14A80D
-:103800000193331C02F020FFA0E026482A4928E754
-:1038100003222B1C291C1340022B0AD1234B2B40C3
-:10382000062B06D0FF23DB05E81890430DF040FE81
-:10383000011C079B00960193129B14A80293139BF3
-:103840000A2203931FE0281CFDF75AFA079B2278EF
-:103850000093129B011C0193139B14A80293331C29
-:1038600021F080F872E0099B002B02D084239B009A
-:103870001E43291C0822079B00960193129B14A843
-:103880000293139B0393612354E0C04670CF020060
-:10389000C4F6020044C20200D8E502002B2D03004A
-:1038A0003D2D0300C8EA0200532D0300070080FFEE
-:1038B00040EC02007A2D0300932D030016AA1CA8E9
-:1038C00010210BF063FE23780122722B0BD0002213
-:1038D0000C9B934207D0AB0705D12B68644A9A1A18
-:1038E000514251418A0016A8291CFDF7D5F8139AB8
-:1038F0001D9B002A00DA1393139A9A4200D91A1CCE
-:1039000020230093129B14A801931E99331C02F0EC
-:103910009BFE1CA823F013F918E0099A291C1643F2
-:10392000079A173B0192129A00960292139A14A8D2
-:103930000392102202F0E6FE08E00B9A4D49A41A09
-:1039400000941A1C4C4808F0C1F98CE601345FE67B
-:10395000089B9F4202D04948494982E60C9B444853
-:10396000002B00D1474818A96EE0081CFDF77AF833
-:1039700016A9061C281CFEF79FFE071C0D98072C95
-:103980001DD118A9FDF796F90025A8426DD0189908
-:10399000A94205DC3B4B0E359E4266D03A4D64E0B1
-:1039A000169B1CA8594323F0B7F81E9B381C05939F
-:1039B00000930121169A189B1FF02BFE42E0FDF7A1
-:1039C00051F8864206D10D981CA9FEF775FE1C9D84
-:1039D00005900DE0264B00259E4246D10D981CA96E
-:1039E00001221FF096F8A8423FD01C9B1D9D059315
-:1039F0001D2C06D8192C2BD2052C0DD0122C0BD037
-:103A000032E01F2C30D10123381C00931699059AFF
-:103A10002B1C1FF08FFA22E0169B1CA8E91823F03C
-:103A20007BF81E9B391C181C169A069327F0B2FBD4
-:103A3000169A1E9B944606936344181C05992A1CEB
-:103A400027F0A8FB301C1CA9FEF7C2FD051C0CE0EA
-:103A50000095201C391C169A059B1FF00EFE0B4D7D
-:103A6000002802D10A4D00E00025281C21B0F0BD3D
-:103A700044C20200A42D0300D8E50200C8EA0200F7
-:103A8000D92D030040EC020050C002005CC30200CC
-:103A9000A0C3020070B58AB0061C0C1C086804A9FB
-:103AA000151CFEF709FE00230593049B011CC21898
-:103AB000009606A805AB01940295FFF791FA06A9B6
-:103AC0000248FEF785FD0AB070BDC04640EC02001A
-:103AD000F0B5071C87B008680D1CFCF7C3FF019008
-:103AE000012F07D96C68022F05D0A868FDF7A4F84C
-:103AF000071C02E0444C01277F420020011C20F0FB
-:103B000015F804A900902868FEF7D6FD049B051C53
-:103B1000C6183D4B9C4238D1B54229D22878FCF7D3
-:103B200019FE002824D00135F6E7002F23D02C1CE5
-:103B30002078FCF70FFE002802D10134B442F7D1FF
-:103B4000291C621B01981FF014FA011C009802F056
-:103B500079F8B44255D2251C2878FCF7FBFD0028E3
-:103B600002D00135B542F7D1FB17DB1BDB0FFF1A83
-:103B7000B542DAD345E0291C721B01981FF0F9F910
-:103B8000011C009802F05EF83BE0201CFCF76AFF85
-:103B9000019A0290031C201C934201D0FEF78CFC7A
-:103BA00005A9FFF703FA059B0390002B25D11749C0
-:103BB000174821F017FCFCF72EFB019BE3189E42EF
-:103BC00009D3201C0399019A27F0D5FA002803D0C5
-:103BD0000134002FF1D1341C291C621B02981FF004
-:103BE000C8F9011C009802F02DF8B44209D2059BD7
-:103BF000E518FB17DB1BDB0FFF1A059B2C1C019341
-:103C0000E7E7009807B0F0BD94BA02002B2A030042
-:103C1000D8E50200F0B50C1C8BB0022802D8FFF7E3
-:103C200057FF7EE00868FCF71DFF08A90490206894
-:103C30006668FEF741FD0090A068FCF7FDFF431C9D
-:103C4000051C0021181C05931FF070FF364B041C47
-:103C50009E4202D1354804F0C1FA301C09A9FFF791
-:103C6000A5F9099B0690002B05D13149314821F077
-:103C7000B9FBFCF7D0FA089A2F1C9446009B6344CA
-:103C80000293AB000393099B0193019A029B9E1A36
-:103C9000002D0BD0009B9E4208D3301C0699019A40
-:103CA00027F069FA002822D0013EF1E7E368BD0061
-:103CB0005E19009A029B04989A1A00991FF059F90C
-:103CC0003060002F11D0059BDF1BE368BE0059193F
-:103CD000181C321C27F067FA63680021DA1BE368BE
-:103CE0009200981927F073FAA760201C19E0039A34
-:103CF000E368944663440793019B0498F118029B80
-:103D0000013F9A1B019BD21A1FF033F9079B0296C1
-:103D10001860EB175B1BDB0FED1A039B043B03934F
-:103D2000B1E70BB0F0BDC04694BA02000E2E0300FE
-:103D30002B2A0300D8E502008022044B52001A60AF
-:103D40000123034A1360034A1360704700E100E057
-:103D50000C8C0040008000408022054B5200DA6746
-:103D6000044BFF3A5A600022034B1A607047C0466A
-:103D700004E100E0008000400C8C004038B50125D3
-:103D80001D4B1E4C18601E4BE550C046FFF7E4FF6C
-:103D90001C4A1D4BE560E250002302211B4AC22051
-:103DA000A3500432A15049180832A1508021C122E9
-:103DB00009039200A150053AFF21FF3AA350402485
-:103DC000134B80001A588A43224380241A500C3027
-:103DD0001A5824061202120A22431A5004301A58A2
-:103DE0008A433F390A431A50802212041A60802203
-:103DF00052041A6038BDC0463427002000800040BD
-:103E0000FC0F0000701700004C05000004050000C6
-:103E100000E100E038B5224C224D636C002B0AD043
-:103E200000236364204B1B689847A822D200AB583C
-:103E30000001C018A850A36C1A4D002B0AD0002214
-:103E4000174B9A64184B5B689847184A0001AB58A7
-:103E5000C018A850E36C134D002B0BD00022104B60
-:103E6000DA64114B9B689847A922D200AB58000135
-:103E7000C018A850236D0B49002B0FD00022084B0F
-:103E80000B481A650B4A8B581B188B500A4A13684B
-:103E9000063313608022094B12045A6038BDC046B5
-:103EA000FC80004000800040040000204405000029
-:103EB000701700004C050000FC2C0020FCE100E025
-:103EC000F7B50191032824D8134B8000C758C223AB
-:103ED0000125124C9B00E75003191D64A825ED0035
-:103EE0005E59B4460E4EA659921B6244D117090F73
-:103EF0008C4662441211013200920A49019A4250E2
-:103F0000C121009A89001201B618675000205E5145
-:103F100001E001204042FEBD8CC202000080004052
-:103F20004C0500000400002003280BD8074B80003C
-:103F3000C158C223064A9B00D150064A064BC250C4
-:103F4000002001E0012040427047C0468CC20200C0
-:103F500000800040093202000400002008B5024B36
-:103F60001B68984708BDC0463427002010B50024C0
-:103F7000054AA358002B02D00021A15098470434D1
-:103F8000102CF5D110BDC04638270020074A890003
-:103F90008B58002B06D188508021054A4904516076
-:103FA000181C01E0012040427047C046382700201D
-:103FB000FCE100E008B503480968FCF791FD024800
-:103FC00008BDC0463CD3020094BA0200034B82B045
-:103FD00001AA98331A6002B07047C046882E0020AC
-:103FE000034B82B098331B6801A8181A02B07047BF
-:103FF000882E0020014B9C3318607047882E0020CB
-:1040000008B50349034821F0E6F9FCF704F9C04676
-:104010002609000014E60200064B07B51A1C9C3363
-:10402000983212681B6801A9521A9A4201D3FFF70D
-:10403000E7FF07BD882E002008B50B790349002B48
-:1040400000D1034920F011FC08BDC04640490300DF
-:104050003849030037B51D1C0023081C00930C1CB5
-:10406000111C1A1C013300F0AFFA064B002C06D0CD
-:104070002868FCF721FF044B002800D1014B181CD5
-:104080003EBDC046A0C302005CC30200F0B58BB0C9
-:10409000079310AB80CB041C01911B78062A11D822
-:1040A000012A05D93F230B700B1C0133019301E05A
-:1040B000002A02D0002301990B7001239342AD41E5
-:1040C00068423BE2002809DA019B01990133009321
-:1040D0002D230B7080231B06C41807E00199009163
-:1040E000002B03D00131009101990B70FF21C9050C
-:1040F000081C019B20400993231C88421FD12023C8
-:10410000079A00991A40131C64024E22CD1C002C01
-:1041100009D100985A4049214270462259405340E3
-:104120000170837007E000991A430A7041214B40E7
-:1041300000994B708A7000232B70019BD0E1002FF7
-:1041400000DA0627551E0099019A521AAD1820224E
-:10415000079911430291672903D1002F12D101273A
-:1041600010E0002B1DD1029B662B0DD17B1CAB42B6
-:1041700000DBAF1E6623039300237D1C049305938D
-:104180001E1CE9E0002B0CD17B1DAB4200DBAF1FF6
-:10419000029B652B00D0CDE003933A3B00250493AE
-:1041A000CCE0B64A934271D8201CB54915F012FEF6
-:1041B000431E984100262023303005900493039637
-:1041C000B04B211CF05815F0FBFD00280AD0049AD2
-:1041D000039B944663440393AB4B201CF15816F0A9
-:1041E00027FA041C049B04365B100493182EE7D1B5
-:1041F0002D230493A14B039EA34213D3201CA0495B
-:1042000015F0E8FD002804D0002E09D12B230493DB
-:1042100006E0201C9D4916F00BFA0136041C01E053
-:10422000FE24A405029B662B03D0672B24D1042E09
-:1042300022DC6A46009B127D1A70029B672B01D11B
-:10424000731EFF187B1CAB4200DBAF1E002F00D19A
-:1042500055E12E23009A3D1C5370131C0233013E7E
-:104260000093002E6DD0002D04D03022013D1A7035
-:104270000133F4E7049565E06B1FBB4200DD48E1C4
-:10428000029A672A63D0AF1F131C62E00026202326
-:10429000039604937C4B211CF05815F087FD0028F1
-:1042A0000AD0049A039B944663440393754B201CE5
-:1042B000F15816F0BDF9041C049B04365B100493FE
-:1042C000182EE7D1201C7149039E15F083FD0028AC
-:1042D00005D0201C6E4916F0ABF90136041C029B78
-:1042E000662B0AD1AE420BDAF3190133AB421ADB6B
-:1042F000AD1BAF1E17D56F1E15E0029B652B05D1B8
-:104300006B1FBB4200DDEDE0AF1FEBE0029B672BB4
-:1043100000D00CE13B1DAB4200DB6F1FBE4200DB57
-:10432000E7E0F343FF180023BD1904930135059618
-:104330006633DCE00025029B0495039305952E1C53
-:104340000AE0049601235B4205936733CFE01F1C0C
-:10435000029B002503930595FB43DB171F40039B3E
-:10436000652B01D17D1C06E0039B672B03D13D1E0D
-:1043700001D101252F1C00230693069BAB4225DAB1
-:10438000201C16F005FC009B009A01330893031CC7
-:1043900030331370059B069A934207D1002F05D046
-:1043A000009B009A023308932E23537016F010FCE2
-:1043B000011C201C16F06EFA344916F039F9069BE0
-:1043C000041C01330693089B0093D6E7029B009DD3
-:1043D000662B02D1012E62DCA1E0201C2D4915F0D4
-:1043E000F9FC00283FD0009B013B1A782E2AFBD015
-:1043F000111C3039092902D9013301930AE0392A05
-:1044000003D0013201931A7004E030221A70019A2D
-:104410009342E9D1019B1B78302B1CD1019A527831
-:104420002E2A0BD10399662908D001994B70049B61
-:104430000A702D2B01D1013E00E00136009D0135AF
-:104440002B1C019A934204D95A1E11781970131C1F
-:10445000F7E731231370094B9C4204D8039B663B5A
-:104460005A425341FF1A029B672B18D1002F16DDC9
-:104470006B1E1A78302A0FD11D1CF9E7FFFF7F3F12
-:10448000F8FF7F3FC0C30200A8C302000000204124
-:10449000CDCCCC3D0000A0402E2A00D11D1C049B99
-:1044A000002B1AD02023079A0A211A40131C4522F8
-:1044B00013432B706B461B7C301C6B7015F02AFB72
-:1044C0000A2115F00DFC3031A970301C0A2115F0BD
-:1044D00007FC2C1D3031E970251C00232B70099B33
-:1044E000E81A2BE02B230025049305953A33039318
-:1044F00032E7672303933C3B002504932BE7009BA3
-:1045000004970133009301235B42059367330393C0
-:1045100003E0029B03930023059300251FE7201C63
-:10452000074915F057FC002800D05CE7B7E7029B6D
-:10453000002503932B230595049310E70BB0F0BDE2
-:104540000000A04070B5061C0D1C002811DD0029DC
-:1045500006DD154815F0DEFA0124864213DC11E071
-:10456000C020311C000615F0D5FA012485420ADB73
-:1045700008E0002909DDC020000615F0CBFA01246F
-:10458000864200DB0024E4B20BE00024A04208D005
-:104590000548311C15F0BEFA0123854200DB231CBF
-:1045A000DCB2201C70BDC046FFFFFF3F10B5041CED
-:1045B0000C2020F04BFF034B4460036001235B425F
-:1045C000836010BD14C4020010B5041C02A800785A
-:1045D000002906D0002804D10F49104820F002FF1E
-:1045E00008E09A4208D1944214D00C480C49231C8C
-:1045F00007F06CFBFBF70FFE944205D2121B094932
-:10460000064807F063FBF5E79C4203D903480649D7
-:104610001A1CECE710BDC046232E0300C8EA0200B6
-:104620000D2403004C2E03007E2E0300F0B5002560
-:10463000171C87B00C9C0D9E039004910593029566
-:104640000195059B9D4239D0039B9D4209D2636829
-:104650009B0537D4019B049A01330193AB00D058DA
-:1046600019E006212368381CDB001943002206F0FC
-:1046700029F900280BD16368DB0505D519492268A3
-:10468000194807F023FB21E0A368336012E0029B86
-:104690004068013302932379012B03D1FCF70CFC12
-:1046A000307007E0022B02D1FCF7C6FA01E0032BC1
-:1046B00000D1306001350C340436C2E7019B039A07
-:1046C000934205D20848094920F08CFEFBF7A3FD70
-:1046D0003B68029ADB089A4202D203480449F3E796
-:1046E00007B0F0BDAD2E0300C8EA0200C42E0300DF
-:1046F000E52E0300FF2310B50324DB05CB18A343ED
-:10470000021C181CA24213D0042A09D00021002A3E
-:104710000ED115F03BFB0749002809D0064907E0F8
-:104720008022022012069B18A343044A03439918CF
-:10473000081C10BD5CC30200A0C302000000808002
-:10474000FF23DB0510B5041CC818032386B098436B
-:1047500004330093002302A9019310226733FFF76B
-:1047600095FC02A9201C20F080F802A82E2126F03A
-:104770001BFE00280FD102A8652126F015FE002897
-:1047800009D102A86E2126F00FFE002803D1201CBB
-:10479000024920F06AF806B010BDC046F6310300A9
-:1047A00030B51D1C002385B00C1C0093081C111C87
-:1047B0001A1C0133FFF708FF002C21D02868124B88
-:1047C0000340062B06D0032318420DD10F4A01687F
-:1047D000914209D103A9FEF7E9FB00230399009355
-:1047E0001A1C04F0B7FD0CE00340022B09D0FCF7C3
-:1047F00087FA03239843013B1843054BC01800E098
-:10480000044805B030BDC046070080FF40EC020000
-:10481000000080800200808070B5051C86B0101CEE
-:104820000191FCF76DFA041C0390681F182800D949
-:10483000B0E015F0C1F80D10161B2C37686DAFAF46
-:10484000AFAFAF0D10161B2C3768898E93989D0063
-:104850000198211C54E00198211C16F01BF80190CE
-:104860008FE00198211C15F0E3FEF8E7201C0021E1
-:1048700015F08CFA002805D04849494820F0B2FDCF
-:10488000FBF7C9FC01A803A91EF07FFD79E0201CFD
-:10489000002115F07BFA0028EED10198211C15F0BB
-:1048A000D5FCDCE7201C002115F070FA0028E3D1CC
-:1048B000211C019818F0B0FF0021051C019015F093
-:1048C00065FA002807D0039A0023002A01DA802322
-:1048D0001B06019355E00021281C15F05DFA431ECC
-:1048E00098410124039E404204400021301C15F0F1
-:1048F00053FA431E9841E4B2844242D0281C311C32
-:1049000015F028FBABE70198211C19F065F8A6E724
-:10491000201C002115F03AFA0028ADD101A803A906
-:104920001EF033FD03220220019B1E4993430343E3
-:104930005B180493039B934303435B1804A90593FB
-:1049400000F0B0FD031C26E00198211C15F024FAAC
-:1049500012E00198211C15F033FA0DE00198211C9A
-:1049600015F014FA08E00198211C15F01FFA03E075
-:104970000198211C15F02EFA0B4B00280BD10B4B84
-:1049800009E00323019A02209A43131C054A0343BA
-:104990009B1800E00023181C06B070BD032F030015
-:1049A00034EA0200000080805CC30200A0C3020061
-:1049B00010B5041C082020F049FD024B4460036040
-:1049C00010BDC046E0CD0200F0B593B0061C06A8AD
-:1049D0000F1C141CFBF704FC051E23D13368311C8B
-:1049E000012603A83A1C019302F034FAA3082A1CFA
-:1049F0003340019903A80AF017FA051C03200FF0B1
-:104A0000B1F8281C20F0DBF9012040420FF0AAF891
-:104A1000FBF7FCFB344203D01348311C0FF0D6F8EF
-:104A2000012518E0012040420FF09CF801210C42C2
-:104A300002D00D480FF0CAF80798FCF713F80B499D
-:104A4000FDF77AFC051E04D109480799FCF748F8E0
-:104A500001E080256D0001210C4202D002480FF0D8
-:104A6000B5F8281C13B0F0BD3F2F0300F8E6020094
-:104A70003CD302001FB52021684622F036F82548B5
-:104A800023F005FC684622F065F8234823F0FFFB7D
-:104A90000FF084F80128F2D002280AD11F4823F031
-:104AA000F6FB684622F04BF801221D4B00201A70DD
-:104AB0002DE0032803D1684622F04CF8E8E70428EB
-:104AC00004D0C1B2684622F09DF8E1E7154823F012
-:104AD000DEFB019A002A08D1104823F0D8FB684673
-:104AE00022F02DF88020400011E09620029940002D
-:104AF000002300F0EDFB002803D10B481CF026FF3B
-:104B0000C0E701210A1CFFF75FFFC305BAD505B056
-:104B100000BDC046142F0300BD310300264303002F
-:104B2000060100202F2F0300322F030030B587B07D
-:104B300002A8202121F0D9FF444823F0A8FB4448D3
-:104B400023F0A5FB02A822F005F802A8414921F0B4
-:104B50007FFF012809D1404823F099FB02A821F0EA
-:104B6000EEFF00203D4B18706EE0022803D13A485A
-:104B700023F08DFBE0E703281AD0042808D136483B
-:104B800023F085FB02A821F0DAFF802040005BE0E3
-:104B9000052825D1324823F07AFB02A821F0DAFF5C
-:104BA0000EF0FCFF6B46C1B2DC1D2170032901D160
-:104BB0002948C5E7042904D1274823F068FB0124CC
-:104BC00027E002A822F01EF823780D2B03D12548F8
-:104BD00023F05DFBE4E7201C01210EF0F7FFDFE787
-:104BE00002A821F0CAFF0028ACD002A821F0F7FFEC
-:104BF000FCF728FE00280BD002A80A2122F002F8B8
-:104C000002A8194921F024FF0328D1D00428ECD1AF
-:104C1000002402A821F0AAFF051C02A821F0ADFF84
-:104C2000021C9620291C4000002300F051FB0028A4
-:104C300003D10E481CF05CFF84E7211C0622FFF71D
-:104C4000C3FEC30500D47DE707B030BD412F03008C
-:104C5000862F0300AC2F030026430300060100202B
-:104C6000B12F0300E12F0300E82F03006D4803007C
-:104C70003E2803D0402809D03C280ED14239C9B281
-:104C80002F290AD8084B585C012308E0712904D861
-:104C9000064B585C064B5B5601E001230020002ABE
-:104CA00000D013607047C046F73003001330030094
-:104CB0008530030008B5512836D00FD8492827D0B1
-:104CC00006D842281CD048281FD000284BD117E016
-:104CD0004F2840D042D84C281AD044E0682811D040
-:104CE00007D864282AD0662825D062283BD1885668
-:104CF0003AE06C2832D071280FD0692833D12DE0EA
-:104D0000885C31E05200505E2EE05200505A2BE099
-:104D10009200505822F085FF29E0D2008A181068CE
-:104D2000516822F054FF22E0D2008A1810685168BE
-:104D300022F068FF1BE09200505805E0D2008A186C
-:104D40001068516817F014FE03239843013B184381
-:104D5000074BC0180BE09200505808E092005058E2
-:104D600022F044FF03E0002001234000184308BD67
-:104D700000008080F7B5161C156801AA041C0F1CE2
-:104D8000FFF776FF402C05D1019B043C5A1EAD185D
-:104D90005B421D402B183360221C5A263E3ABE420D
-:104DA000B6415442624176422B1CD2B2311C1EF0F5
-:104DB00063FB041C0D1C4F2F3ED0532F08D1201C29
-:104DC00026F00AFB0022011C201CFDF737FC33E013
-:104DD000662F06D1032302209C43184B0443E0189E
-:104DE0002AE0642F09D1201C17F0C2FD03230224FE
-:104DF0009843124B2043C0181EE0002E10D0802292
-:104E00000023D20512196B41201C002B04D1002A6B
-:104E100002DB22F0EBFE0FE0291C22F0D8FE0BE0B3
-:104E2000201C002905D1064B9C4202D822F0F9FE35
-:104E300002E0291C22F0E6FEFEBDC0460000808094
-:104E4000FFFFFF3FF0B587B0141C03AA071C0E1C20
-:104E500001931D68FFF70CFF0090402F05D1039BC5
-:104E6000043F5A1EAD185B421D40009B019AEB188F
-:104E700013603E3F642E09D0662E02D04F2E22D101
-:104E800040E0201CFBF73CFF041C3BE0201CFBF730
-:104E900037FF7C427C4117F017FDE4B20490059186
-:104EA000A30006AAD318083B211C2A1C1B68042057
-:104EB0001EF00BFB01235C40A40006AB1C19083C50
-:104EC000043524681EE0A3070CD1154B22689A42D2
-:104ED00008D179427941201CC9B2009A2B1C22F0DA
-:104EE0005DFE1AE0201CFBF7A7FE009B041C042BB0
-:104EF00008D95A2E06D9002804DA281D1A1FFF21C6
-:104F000026F065F90098042800D9042079427941F7
-:104F10002A1CC9B2231C1EF0D8FA07B0F0BDC04647
-:104F20004CB9020070B5061C0D1C141C181C642E14
-:104F30000CD0662E04D04F2E11D19400635127E07F
-:104F400094000D19FBF7DCFE286021E0D4000D1958
-:104F5000FBF7D6FE17F0B8FC2860696018E0202344
-:104F60003343712B0CD10321014009D1094B026855
-:104F70009A4205D1E4002B19082222F00FFE07E027
-:104F8000FBF75AFE291C031C221C301C1EF0B0FA31
-:104F900070BDC0464CB9020070B5061C081C21F05B
-:104FA0001EFE051C21F0F8FE041E06D108492A1C2D
-:104FB000084806F08BFEFBF72EF9301C1EF0D6FCDD
-:104FC000031C0121201C1A1C03F0BEF870BDC04652
-:104FD0002731030080E9020010B5041C21F0FFFD19
-:104FE0001DF03AFE031C012083420CD00649201C10
-:104FF00021F011FE201C21F0F2FD1DF02DFE0238E3
-:1050000043425841400010BD78310300F0B59DB0D7
-:1050100000AF0C68032807D9CB680025FB60042883
-:1050200005D00D696D1002E00025A24BFB601C232A
-:10503000201CF918FDF7BAFF7861002D56D09E4C60
-:105040006E2160680BF046FD061C60689621002208
-:10505000043005F037FC1823FA18D118041C301C52
-:10506000FDF7A4FF3B6B011C013DC018002C0CD1C7
-:1050700088420AD9013803782E2BF9D105E08842FD
-:1050800003D9013803782E2BF9D1013DF7D2FE69FF
-:10509000441A251C002E01D0751C2D192B1C6A46A4
-:1050A0000E33DB08DB00D31A9D46181C221C3B6123
-:1050B00026F070F8002E08D02E233A69796913552E
-:1050C00001341019321C26F065F83869291C04F0E7
-:1050D000BBFF012804D17949794820F083F95FE0CA
-:1050E00006243B69C0000443FD617B61201CFDF781
-:1050F000C7FA00F051FC051E15D02E21786926F064
-:1051000053F9011C281C002900D1D0E0694BFA6832
-:105110009A4200D0CBE07B69C91A181C04F094FFB6
-:1051200000F03AFCC3E018220823BA18D018103354
-:10513000FA184021D21821F0F7FC0126BD603D612C
-:105140002C1C04E07B699B5D2E2B05D00136FB698E
-:105150009E4200D9A5E0F5D1311C786904F074FFB6
-:1051600018220823BA183860D01821F006FD18223A
-:105170000823BA18002815D1D018321C796921F0FB
-:1051800093FC18220823BA18D018FFF725FF78607F
-:105190007B68002B13D14A484A493A6806F096FDCD
-:1051A000FBF739F8D0182F210AF0FCF97B693A692E
-:1051B0001820991808233818B21AC018DFE7386881
-:1051C00000F0EAFB041E57D1386800F0ABFBFB6926
-:1051D000041C9E4208D13C4BFA689A4204D1806874
-:1051E0006E215E2221F00DFF7B68012B3DD118223C
-:1051F0000733BA18D01821F0B9FC18220823BA18BE
-:105200007860D01821F0B9FC0022011C7868FDF705
-:1052100015FA1221021C201C02F00EFA1822082393
-:10522000BA18D0182F210AF0BDF918220823BA188D
-:10523000D018264921F0EFFC18220823BA18D018FC
-:1052400021F0CDFC1DF008FD022806D1182208230C
-:10525000BA18201CD118FFF79FFE18220823BA188D
-:10526000D0180C2121F016FD06E018220823BA18E8
-:10527000201CD118FFF790FE002D0AD03A697B69F7
-:10528000B11A981804F0E0FE221C011C281C02F040
-:10529000D3F9BB68002B00D1BC60731C3B61251C9B
-:1052A00054E7044BFA68201C9A4200D1B868BD4606
-:1052B0001DB0F0BD94BA0200882E00203C310300DE
-:1052C00080E902005B310300A0C3020070310300DB
-:1052D000F8B5061C10200D1C141C1F1C20F0C3F870
-:1052E000011E09D02C190F604D608D60CC60301C00
-:1052F000024A034B20F005FAF8BDC0469135020082
-:10530000A7350200C3790248002B00D1014870473D
-:105310005CC30200A0C3020008B50AF01BFA0148F2
-:1053200008BDC04694BA020008B508680AF012FA2F
-:10533000004808BD94BA020073B50D1C022823D1A1
-:105340000126486801A9FDF731FE7642341C019B15
-:10535000C31898421BD00178722901D0772905D152
-:10536000621C0ED172394C424C4108E0622901D0D6
-:10537000742906D1721C04D174394E424E41013059
-:10538000E7E70E480E4913E001267642341C01A9D6
-:105390002868FDF70BFE7342734162426241DBB243
-:1053A000D2B201990AF02AFB002805D10548064926
-:1053B00020F018F8FAF72FFF76BDC046D8E50200B6
-:1053C0007C31030088E702008931030070B50E1CB0
-:1053D0001049041C00251FF048FA73689D420ED244
-:1053E000002D03D0201C0C491FF03FFAAB00F3182E
-:1053F000201C99680122FBF74FFB0135EDE7012BDB
-:1054000003D1201C05491FF030FA201C04491FF06D
-:105410002CFA70BD1676030017280300983103009C
-:10542000CE26030070B501281ED0002805D0022822
-:105430001ED10D1C0F4C002605E04B680E48002BBA
-:1054400017D10E4815E06B689E4209D2B300EB18E5
-:105450000220996801F0B0FF401024180136F2E7ED
-:1054600001206400204304E04B685B00184300E027
-:10547000002070BDACCF02005CC30200A0C30200DC
-:1054800010B5041C10201FF0E1FF044B8460036082
-:10549000034B43600023C36010BDC046D8C3020065
-:1054A000BF35020070B50E4A002816D0841CA40037
-:1054B000061C201C0D1C1FF0C9FF0A4A4660026032
-:1054C000021C002D09D00022083CA24204D0AB5897
-:1054D00081188B600432F8E7021C101C70BDC046B6
-:1054E000ACCF020070CF02007FB5041C0E1C151C4F
-:1054F000072829D002D8052805D062E0031C193BF3
-:10550000042B3ED95DE0101CFBF7ACFA2F49FCF7E9
-:1055100013FF011E56D06B68726800219818FFF7C0
-:10552000C1FF311C7368041C9A000831083025F053
-:1055300031FE291C70686B680230800020189A00C8
-:10554000083125F027FE18E003A9101CFBF7B2FB79
-:105550000021884236D00398884210DD7368584392
-:10556000FFF7A0FF041C231C301C083300930830F5
-:1055700004217268039B1EF04CF8211C22E01449A0
-:1055800020E0081CFBF76EFA281CFBF76BFA114BA6
-:10559000426A9A4206D0281C0C491DF0A6FC0E490E
-:1055A000051E0FD0311C2B1C6A680831009208338D
-:1055B000201C726800F0C8F80849002802D106498A
-:1055C00000E00021081C04B070BDC04670CF02008E
-:1055D000ACCF020081540000A0C302005CC30200F3
-:1055E00030B585B0042A2DD103240A1C051C0C40BB
-:1055F0001FD1164B096899421BD1111C406801AAA2
-:1056000000F068F8002802D1114802F0E7FD019B84
-:105610000298211CC01AFFF745FF041C636808307C
-:105620009A00019B991C8900691825F0B3FD201C84
-:1056300009E0286869680023FBF7D6FB0230800088
-:10564000405900E0002005B030BDC046B0F2020075
-:105650003B2A0300F0B51D1C002385B0081C0093F5
-:105660000C1C111C1A1C0133FEF7AEFF1748002C4E
-:105670002AD02868830703D1154B02689A4223D0A9
-:1056800010201FF0E3FE041C286801F0F9FF00253C
-:1056900004260390039802F041F8071E0BD0B54290
-:1056A00005D3F100201C1FF0E7FE041C7600AB00C0
-:1056B0001F510135EEE7281C211CFFF7F3FE051CE6
-:1056C000201C1FF0EAFE281C05B0F0BDACCF020084
-:1056D00070CF020030B585B003AB051C141C081C4C
-:1056E00002AA01A920F009F9019A164900238A4269
-:1056F00000D0531002984210884200D12A1C002B7F
-:1057000004DA5B19D843C017034002E0AB4200D96A
-:105710002B1C002A01DA521902E0AA4200D92A1CE5
-:1057200023609A4200DA1A1C039B62608B4205D008
-:10573000032B03D05B10A360002001E00120A060D8
-:1057400005B030BD94BA0200F0B587B0061C151C38
-:105750000C9F1B2803D1BA4212D000203FE0192829
-:1057600008D01C280CD13D1C171C0A1C1D26191C16
-:10577000131C05E03D1C171C0A1C1A26191C131CBF
-:105780000397AF4200D903951C1C0023029101939B
-:10579000019B039A93421BD0029B0594049301CB77
-:1057A00002CC0293FBF7F6F9002802D0019B0133EB
-:1057B000EDE71B2ED1D0049B301C1968059B1A689D
-:1057C00001F0ECFF074BC01A43425841C0B206E05B
-:1057D000BD4201D002D2C0E71A2EBED0012007B0D0
-:1057E000F0BDC0465CC30200F0B51E1C85B003903E
-:1057F00018680D1C171CFBF735F9736801900293AC
-:105800000024022F18D9291CB2680123FBF7ECFAF7
-:10581000041C032F10D0291C0198F2680123FBF708
-:10582000E3FA051C08E0039AA300D0580299FBF79D
-:10583000B1F9002808D10134AC42F4D30549064837
-:105840001FF0D0FDFAF7E7FC01206400204305B00B
-:10585000F0BDC0469A310300D8E5020070B5051CC2
-:1058600000290CDB032905D8081C002414F0A4F837
-:105870000808050501238C1E9C43FE2601E0002438
-:10588000F226B52109023143281C1DF0A4FF002C8B
-:1058900004D00449281C21431DF09DFFEE612C62B9
-:1058A00070BDC04680B0000008B50B1C02495A68A4
-:1058B0001FF0A7F808BDC046B131030070B5151C34
-:1058C00012680C1C8368002A09D1CC000621181D1F
-:1058D000214304F0F7FF00281ED043681BE01A792B
-:1058E000181C92070BD50D4A934215D10C4E736CC0
-:1058F000002B03D1012021F04BFB7064706C06215A
-:105900006A68E4002143002A02D121F084FB01E00F
-:1059100021F077FB00232B6070BDC04640F20200EF
-:10592000882E0020F8B50625C3001D43071C291C3E
-:105930000C48012204F0C6FF061C4068002810D164
-:105940000C301FF083FD084B041C036047600120EE
-:1059500021F01EFB6E21A0602A1C21F052FB201CAE
-:105960007460F8BDAC2E0020D0CF020008B502480C
-:1059700003210BF0C3F808BDA82E002010B50C1CA5
-:105980000621C00001430122024804F09BFF44604D
-:1059900010BDC046AC2E002073B50625C3001D43C4
-:1059A000061C291C0F48002204F08CFF041E17D18E
-:1059B000221C0D48291C04F085FF041E11D06068CC
-:1059C00008216A4601F0E0FD009B002B08D0002072
-:1059D0006A46011C1FF002FA301C6168FFF7CEFF17
-:1059E000606876BDAC2E00200CD0020000487047E5
-:1059F00008D10200F0B500240E1C85B0071C0393EB
-:105A0000081C0D4B111C0094221CFEF7DDFDB01C80
-:105A100080001FF01BFD051C07604660B44208D0E3
-:105A2000039BA700D85901F02BFEEF19B860013491
-:105A3000F4E7281C05B0F0BDFFFF0000A0200B4AD2
-:105A40000B49D36F30B5C0058B4201D1094C01E041
-:105A5000A124E4001D68055118895B68D3671B8980
-:105A6000181A002801DC0B89C01830BD882E0020D0
-:105A7000100000200C05000008B5044A044B022069
-:105A8000DA6704497822FEF71BFA08BD10000020EF
-:105A9000882E00203D5A0000F8B5144BC218144B54
-:105AA0009A421FD8134B051118681E1C002801D1FB
-:105AB0001D8119E01DF07FFFA0220F4B3168D20538
-:105AC000D15037897468B44207D02089391C6843A3
-:105AD00014F020F820816468F5E72581FFF7CCFFFA
-:105AE000002001E001204042F8BDC04618FCFFFF45
-:105AF000583E0F00100000200C050000014B1889D3
-:105B00000001704710000020334BF7B5051C994287
-:105B10005ED80120314AA840161C5368B34205D014
-:105B20001F68074204D11A1C5B68F7E7002310E0E6
-:105B3000C44327401F60A0270194294CFF0538511A
-:105B40003068019C0440346018680028EED1586821
-:105B50005060002081423DD0204A49001489013123
-:105B60006143C912814200D10121081B47424741CC
-:105B70006DB2C91B641A291CA0200326C131FF3154
-:105B80008900C0050E500120A840051C161C106895
-:105B900051682843A4B210600889914204D0A04201
-:105BA00002D20E1C4968F7E7A04203D10B681D43DF
-:105BB0000D600BE0002B04D1191C0C2003F0B6FE85
-:105BC000031C72681D605A601C817360002001E034
-:105BD00001204042FEBDC046FF030000100000202F
-:105BE0000C050000002805D0012809D18B685B0056
-:105BF000184306E08B680348002B02D1024800E0FE
-:105C0000002070475CC30200A0C302000021F0B571
-:105C10008568EA0F5219521091420DDA074BC66897
-:105C2000EB185B1A8C009B003419F6582768266025
-:105C3000C4680131E750EFE70148F0BDFFFFFF3FC7
-:105C400094BA020038B50D1C83684168041C8B426D
-:105C500012D3C900C0681FF00FFC63680A495A00DC
-:105C6000A3686260D21A013352189B00E060920070
-:105C7000C018002125F0ABFAA368E268591C9B000C
-:105C8000A16002489D5038BDFFFFFF3F94BA02005B
-:105C9000F8B5071C161C4C10836803D5E418E243C2
-:105CA000D21714409C4200D91C1C0C4D381C291CD6
-:105CB000FFF7C8FFAC46BB6809495A1E5B189B003A
-:105CC0001D1FF968A24204DD4859013AC8502B1C37
-:105CD000F6E7A4000E516046F8BDC04694BA020033
-:105CE000FFFFFF3F38B50025041C85601021C06808
-:105CF0001FF0C2FB0423291CE0606360102225F022
-:105D000066FA014838BDC04694BA02007FB50C1C43
-:105D1000114B02AD04310093013802230195FEF7C7
-:105D200085FC23680D4C9968012911D9D868029A1D
-:105D30000B4B2D79C918131B5E1EB34189005B42C2
-:105D40001A404118074B002D00D1074B1DF047FEAC
-:105D5000201C04B070BDC04638D2020094BA0200C4
-:105D6000FFFFFF3FA0C302005CC3020070B50C68D8
-:105D7000021CA368002B05D11A491B481FF032FBF7
-:105D8000FAF749FA2068012A01D04A6801E00122A5
-:105D90005242191C0023FBF727F8E268A368810030
-:105DA0005618013B043151181A1A35689200A36045
-:105DB000301C25F0F8F90021A368E0689A00115022
-:105DC000616804290BD95B00994208D94908890008
-:105DD000E0681FF051FB6368E0605B086360281CAB
-:105DE00070BDC046F931030034E7020007B50090EA
-:105DF0000191022069461DF054FE6946019002207F
-:105E0000FFF7B4FF00480EBD94BA020070B50E1C37
-:105E10000D49051C00241EF028FDB3689C420ED2DB
-:105E2000002C03D0281C09491EF01FFDF268A300B6
-:105E30009958281C0122FAF72FFE0134EDE7281C9F
-:105E400003491EF012FD70BDCD4103001728030069
-:105E5000C8AF030070B50326041C0D1C0E4028D1EA
-:105E6000174B0A689A4224D18B6882689918436854
-:105E7000994210D904318900C0681FF0FDFAAB685F
-:105E8000A268E0609B181A1D9B006260C018311C5C
-:105E9000102225F09CF9A368E9689800E3681818B7
-:105EA000AB689A0025F076F9AB68A268D318A360B6
-:105EB00003E0201C291C1DF0FDFD024870BDC046FA
-:105EC000FCD1020094BA020010B5041C10201FF08F
-:105ED000BDFA044B84600360034B43600023C3603E
-:105EE00010BDC046D8C30200C139020038B50B4B03
-:105EF000051C03600C1C081E042800D204206860E6
-:105F0000AC6080001FF0A2FA6A68E860121BA4006F
-:105F100092000019002125F05AF938BDFCD1020089
-:105F20007FB50D1C161C12282AD004D8052807D0CE
-:105F300007282BD058E0031C193B042B41D953E010
-:105F40000322002332409A424FD1131C3168284A61
-:105F500091424AD1B368AA6898181DF0C4FD041C88
-:105F6000AB68E9689A00C06825F014F9A868E3688E
-:105F700080001818B368F1689A0025F00BF91EE04C
-:105F8000081C111CFFF766FF2B1C2EE0101C03A938
-:105F9000FAF790FE0023984227D0039A9A4200DA3B
-:105FA0000393039BA86858431DF09DFDC368041C20
-:105FB0000093E8680421AA68039B1DF02AFB231CB8
-:105FC00013E00C4BB20710D1094A316891420CD151
-:105FD000B368E9680093AA68F368FFF7B5FB064B5E
-:105FE000002802D1034B00E00023181C04B070BD50
-:105FF000FCD10200A0C302005CC30200F0B50B1C80
-:1060000087B0041C171C0326002A16D10E400DD1A0
-:10601000524A0968914209D1191C03AA8068FFF706
-:1060200059FB0398049AE368851A78E003A90220D3
-:1060300003940493FFF79AFE8DE0042A2DD1314298
-:1060400021D1464A096891421DD18068191C03AAD2
-:10605000FFF740FB002805D1A068E16803AA1DF006
-:10606000EBFA79E0039B0498C01A1DF03CFD051C77
-:106070008368E1689A00039BC0689B00C91825F0FB
-:1060800089F8281C68E01A1C20680023A168FAF728
-:10609000ABFEE3688000C0585EE00E4056D12F4A48
-:1060A0000968914252D1191C03AA8068FFF712FBBC
-:1060B000BA680398049B85180193ED1A002D22DD20
-:1060C000A368E9186368994207D98900E0681FF05E
-:1060D000D3F9A368E060EB186360039AE368A8183B
-:1060E0009100800059181818A3689A1A920025F098
-:1060F0005AF8039BF9689800E3681818BB689A007F
-:1061000025F048F81EE0E368800018189200F9684E
-:1061100025F040F8B8680399E368049A40189100A4
-:10612000800059181818A3689A1A920025F03BF8B5
-:10613000A3686A42E818E368800092001818311CCE
-:1061400025F045F8A3685D19A56004E0201C191C22
-:106150003A1C1DF00AFD024807B0F0BDB0F2020083
-:1061600094BA0200F0B50E1C496885B0041C151CD9
-:10617000002901D0002A04D1201C311C1DF029FE69
-:1061800058E00F321309591800931DF092FD0F22A9
-:10619000A368B16870682A4000D11032009D264F74
-:1061A0002D18EF197F00DB190393234B0190C318BF
-:1061B0005B00CB189C46039B029300230199102798
-:1061C000002913D061460988BF1A0B43191CF940F6
-:1061D0000F1C02991B040F8001990139019102994A
-:1061E00002390291022149428C44E7E7BF1AFB4081
-:1061F00003994000081A104903808C46009B0199BE
-:106200005F00C71B023763445A00381C24F0DFFFCD
-:10621000002D06D06B00023BFB5A002B01D1013D43
-:10622000F6E70121656033780B401A1C23788B4315
-:106230001343237005B0F0BDFFFFFF7FF0B54B683F
-:10624000151C526887B0061C0C1C934201D22C1CF2
-:106250000D1C0123227861681A4201D12A7813406B
-:106260005918301C1DF025FDB36829789C46A36899
-:106270000F1C0193636820780093AB68474002933A
-:106280006B68059301231A1C1F408B430493009BEA
-:106290008243591E6346101C03934B1C27D0019B5D
-:1062A0001F4A1B889B181818009A059B9B1A5B189D
-:1062B0008B4207D8029B1A4A1B889B18029A02320B
-:1062C000029200E0164B049A0139D3181A1C42407E
-:1062D00092B2D719039A1B0C0493131C0233039335
-:1062E000019B17800233000C3F0C0193D5E7009B04
-:1062F00059006144002F02D001230B800231604617
-:106300001DF0C2FC0121706022782B7853400B40B5
-:106310001A1C33788B431343337007B0F0BDC0466B
-:10632000FFFF0000F0B55C6891B0002C02D1446022
-:106330004C6049E1051C0B9353680E1C591C0692D6
-:1063400001931DF0B6FC069B00215B68A8685A1CEF
-:106350005200019324F03BFF00236B60069B301C2E
-:106360005B68591C01931DF0A4FC301C06991DF0BC
-:1063700030FDB368776802930B9B9B6803930B9B7C
-:106380005B680593AB680893059B9F420ED310D8BA
-:106390000298391C039A1DF0D2FC002804D1012375
-:1063A000089A7060138002E0002802DA00236B6014
-:1063B000FFE00021059B854A9A18039B52009B1819
-:1063C00004931B88019119B2002905DB01995B0038
-:1063D00001319BB289B2F5E7931C0C930C9A039B95
-:1063E0009B1800229C46039B63450BD21988019899
-:1063F0000C1C844022431A801022121A11410233CD
-:106400008AB2F1E700227C00029BA01C1A531B18E1
-:1064100001370993029B77600792099A93420FD242
-:106420001988019A081C9040021C079810431022FA
-:10643000188001980233121A11418AB20792ECE7D0
-:10644000049B1B880F93029B1C19059BFF1A5F4B33
-:106450006F60FF18089B7F00DB1909937368059A2A
-:106460000A93934260D9A31E20880E931B880004D0
-:1064700018430F9913F0BEFA0C9B0022E31A191C63
-:10648000039F07900D93A1421AD207983B8843437C
-:1064900008888446834202D2C01A90420AD86046D5
-:1064A0001B1A9A1853420B80130C92B2501E824151
-:1064B000D21802E0821A0A80002202310237E2E793
-:1064C00023889A4208D3D31A5A42190C9BB22280CD
-:1064D0005A1E93415A180BE09A1A2280002207E0B4
-:1064E0002388C018079B2080013B000C121A0793D9
-:1064F000002A0ED00020039F0D99A142F0D20B88F4
-:106500009C463B880237634418180880000C02310F
-:10651000F3E76A46099B928B023B5A8009930A9BD8
-:106520000E9C013B736099E70023049A03998A4209
-:106530000FD3049A01981288111C01410B4304994E
-:106540000B8010231B1A9A4093B2049A023A0492C9
-:10655000EBE71E4A0A9B9446029A63445B00D318F9
-:10656000002202998B4214D31988019C081C2041F7
-:1065700002431A801022121B9140023B8AB2F0E7BC
-:10658000124A08999A185200525A002A0ED1013B19
-:106590006B606B68002BF3D108E00C4A02999A18E3
-:1065A0005200525A002A04D1013B73607368002BD9
-:1065B000F3D101210B9B1A78069B1B785A400A42A3
-:1065C00002D02B780B432B7011B0F0BDFFFFFF7F83
-:1065D000436830B55A0000238468A218944207D259
-:1065E000084D023AAB420AD815881B042B43F5E745
-:1065F0000278D20700D55B420B60012000E000204A
-:1066000030BDC046FF7F0000F8B58D1E00241E2D52
-:1066100016D81F1C40680B4B0001595C151C13F069
-:10662000E9F9061CA74204D00130032113F0E2F976
-:10663000041C281E01D024F0CFFE03363419241880
-:10664000201CF8BD0D320300F0B587B00392059110
-:106650000D9A0399051C541A0CAA12782021101CBB
-:10666000884305D0302A05D00CAA0292012204E00A
-:10667000224A00E0224A02921022019280221A400D
-:1066800005D0E30F1B195B10E71A1C1C03E0012166
-:106690000B4012D11F1C002C12DD261C019B0496FE
-:1066A0009E4200DD04936B6828680299049A98471B
-:1066B000049BF61A002EF1DC03E0271C141C00E0FA
-:1066C0000024039B002B06D01A1C28686B680599D0
-:1066D0009847039BE418002F0DDDE419019B3E1E33
-:1066E0009E4200DD1E1C28680299321C6B68984788
-:1066F000BF1B002FF2DC201C07B0F0BD513203009D
-:1067000040320300F0B593B01F1C18AB10CB0590BE
-:106710001B780D1C161C0793CB070BD48B0703D1DA
-:10672000814B0A689A4205D0281CFAF785FA0125A0
-:106730004000054381231C4209D1079B302B06D121
-:106740001A9B1B9A934200DA1A9200231B93281C6F
-:1067500021F029FA0AAA131C00280DDDA30703D58E
-:106760002B231370123B05E0131C620704D5202273
-:106770001A70192304AA9B18E20618D5022E03D119
-:1067800030221A707A1C10E0082E08D130221A70BC
-:10679000A20501D401330AE03A1C0E3205E0102EA6
-:1067A00005D130221A703A1C17325A700233002277
-:1067B0000AA91A705B1A0693A30600D52C320EABF9
-:1067C0000B9310230C9300231B990D93012901DDDA
-:1067D00040210C4304A9CB75FBB20096610614D589
-:1067E00000210293019103922B1C0BA80CA90DAA66
-:1067F000F9F7AEFD0378061C2D2B15D104AAD3752D
-:106800000D9B0136013B0D930EE00AA90191029305
-:1068100003922B1C0BA80CA90DAAF9F799FD1B9B41
-:10682000061C012B4BDC02E01B9B012B6ADC0027C2
-:106830003D1C630621D5172104ABC9180B78002B2A
-:106840000AD000230122009301920598FFF7FCFE75
-:106850001A9B2D18013B1A93069B002B0DD0002389
-:106860000122009301920598069A0AA9FFF7ECFE0F
-:106870001A9B069A2D189B1A1A931B9B012B00DD5D
-:106880001A93079B059800931A9B311C01930D9A4C
-:10689000231CFFF7D9FE2D18002F09D0202300223A
-:1068A0000093019705982149131CFFF7CDFE2D1881
-:1068B0000B980EAB984234D01EF0EFFD31E00D9AEC
-:1068C0001B9B93421CDB1A9A934206DA0127D51AC6
-:1068D000274004D02F1C002501E000273D1C012388
-:1068E0009C43002D09D000221F3300930195059889
-:1068F0000E49131CFFF7A8FE051C3023079398E7E9
-:10690000131CE0E70D9A1B9B934200DA131C17221D
-:1069100004A952181278511E8A419B18069A9B1896
-:10692000D1E7281C13B0F0BD4CB90200402F030082
-:10693000F0B5071C00248DB005920D1C2B78002BA0
-:1069400009D18D420BD96E1A3868321C7B68984782
-:10695000A419291C03E0252BF3D00135EEE70B78B1
-:10696000002B00D134E120230026013109930B785C
-:10697000002B12D02D2B01D12C3B02E02B2B02D16E
-:10698000293B1E430FE0202B01D11C3BF9E7212BB3
-:1069900001D1193BF5E7302B02D00023069304E028
-:1069A0004022099316430131E1E70B781A1C303A73
-:1069B000092A07D80A22069801314243D318303BEE
-:1069C0000693F2E708912E2B27D14B782A2B05D07E
-:1069D0000B1C01330893002307930CE0089B023340
-:1069E0000893059B1D1D1B680793DB43079ADB1764
-:1069F0001A40079215E0089B1B781A1C303A092AA6
-:106A000009D80A2207994A43D318303B0793089BB9
-:106A100001330893EFE7059D03E00123059D5B42E9
-:106A20000793089B1B786C3B59425941089B5B18A4
-:106A300008931B780493002B00D1C9E0642B00D18C
-:106A400087E013D8502B00D191E004D8453B022BAE
-:106A500000D89CE0B2E0049B622B1AD032D8582BAD
-:106A600000D0ABE02B1D0593412383E0049B712BE9
-:106A700034D005D8672B00D889E0702B77D09DE003
-:106A8000049B752B58D0782B71D0732B00D095E0D8
-:106A900036E02B1D05932B68002B07D0099B381C73
-:106AA0000093069B4C490193042206E0381C052202
-:106AB000099B4A490093069B0193331CFFF7C4FDD1
-:106AC000241882E02B1D05932B680BA90B70099BE2
-:106AD000381C0093069B01220193EEE72B1D0BA9A6
-:106AE000286805931EF0E0FA079B011C013301D1D1
-:106AF0000B9B0793099B381C0093069B019311E0A5
-:106B00002B1D2D680593002D0ED0079B013303D15B
-:106B1000281C24F061FC0790381C291C099B009359
-:106B2000069B0193079AC8E7099B381C0093069BB4
-:106B30002B4901930622C0E72B1D05936123009387
-:106B4000099B01960293069B381C03932968002237
-:106B50000BE02B1D05936123381C01220093099B38
-:106B600001960293069B039329680A230CE02B1DD0
-:106B7000059361230093099B381C0293069B002216
-:106B800003931023019629681DF07DFE98E70723E3
-:106B900007359D432B1C286869680833059315F059
-:106BA000E7FE099B011C0093069B381C0193079B81
-:106BB000049A0293331C1DF0D5FE81E738680899CA
-:106BC00001227B6898470134059508990131B4E6A4
-:106BD000201C0DB0F0BDC0462E320300333203003E
-:106BE0003932030030B58DB0051C6846F9F7F8FA64
-:106BF000011E0ED12A1D01201EF0F0F80122EB68C3
-:106C0000041C5B1001335B001343EB60F9F7FEFAE1
-:106C10000AE00198064A03680024934204D0054A1A
-:106C2000934201D0F9F7F7FA201C0DB030BDC046F1
-:106C300084E8020034E7020010B5041C10201EF0A6
-:106C400005FC044B03602368436063688360012391
-:106C5000C36010BD44D30200002313B5046A00933F
-:106C60000A05A16B024C920C12591DF029FF13BDAD
-:106C700080D30200F0B51C7887B07C2C06D18568E3
-:106C80006D5C002D02D09A2D00D0DEE00393231C12
-:106C90006B3B02920091071C022B29D884687D6807
-:106CA00060180378032B00D0ACE004A91DF0FBFFB3
-:106CB0006319984200D19EE00378032B00D0A1E035
-:106CC00005A91DF0F0FF039B1B786B2B03D1049BE0
-:106CD000059A13430AE06C2B03D1049B059A534099
-:106CE00004E06D2BE4D1059B049A13400493DFE785
-:106CF0006E2C04D00223221C9A43702A63D1009B7D
-:106D0000BE68F0187B6801930378032B7AD104A93D
-:106D10001DF0C9FF051C019BF3189D426BD0AB7899
-:106D2000A81C6C78032B6DD105A91DF0BCFF051CB8
-:106D3000372C0ED1059A1F2A64DC4549049B11416A
-:106D40008B425FDCC021090611418B425ADB934024
-:106D500009E0392C09D1059B1F2B01DD1F23059369
-:106D6000049B059A1341049328E02F2C03D1049B24
-:106D7000059A9B18F7E7302C03D1049B059A9B1AC0
-:106D8000F1E7312C09D104980599FDF7DBFB0028C8
-:106D900038D1059B049A5343E5E7332C32D005994B
-:106DA000352C05D100292DD004981CF04EFA04E0B2
-:106DB000002927D004981CF058FA0490049B5A002C
-:106DC0005340A8D51EE0752C1CD18368009A9818F2
-:106DD00083784478032B15D102301DF073FF2F2CDC
-:106DE00008D0302C05D1404243000490584002D5D1
-:106DF00008E0C0430490009B381C7B6004991DF0A0
-:106E00008FFE22E000267B68009A029C9D1A0136C4
-:106E1000E409FCD12B1C0134DB09FCD1731C1A19C9
-:106E2000381C009901931FF002FF071C039B311CC3
-:106E30001B78029A1A33037001301DF0EDFD019B9F
-:106E4000211CF8182A1C1DF0E7FD07B0F0BDC04654
-:106E5000FFFFFF3FF0B597B00990C0200025402309
-:106E60000AAC80000F1C161C25706360A5601EF024
-:106E7000FAFA2561E0606561A561E5612762E56276
-:106E8000A84202D1BF48C049C0E1331E03D0042349
-:106E9000022E00D0033B0026BC4A9B000096201C1B
-:106EA000B96B9A58331C1DF00BFE10201EF0CEFA61
-:106EB0001021041C1FF019FE0AADAB68002B00D195
-:106EC00081E12A78002A00D07DE1013B0C32AB60E1
-:106ED0005343EA68AD49D318DA785D689200525896
-:106EE00003921A689B681202120A0493039B06928B
-:106EF0005B7807930F23079A1A400592002D01D162
-:106F0000636804933023079A1340102B02D0202B80
-:106F100040D0F4E0002D03D0002E01D10026CBE7B5
-:106F2000039B6A009A18059B9D4231D25388190B26
-:106F3000012916D1391C403109781B0502321B0D7D
-:106F4000994221D10AA8211C1DF01FFE0028E5D17D
-:106F50003B1C40331B78062B00D04CE18C488D49FC
-:106F600054E1059A6B1C934206D2049A0AA8009237
-:106F70000699039A1DF0A4FD039B6D005D196988B5
-:106F80000AA8FFF769FEC9E70135CCE7012DDFD874
-:106F9000012691E7002E0BD0039A6B009B5A1B0B26
-:106FA000032BF3D1201C01211FF007FE00230370E7
-:106FB000039B6E009E191AE073881A0B012A29D1CF
-:106FC0003A1C40321278DBB29A4220D1082A07D10B
-:106FD000B96CF86C03F038F8011C201C1DF066FD3C
-:106FE000002D08D0381C1EF0EAFB01350236059B47
-:106FF0009D42E1D310E0039B5B787F2BF2D90E9B7F
-:10700000201C591C07930E911DF08AFDEAE7002D04
-:10701000BED09DE76B1CA8E700231E1C059A934277
-:107020000CD203995A008A185288110B012903D1F6
-:10703000D2B2072A00D901260133EFE7A368049AE8
-:10704000981800230793A2686368D318984206D261
-:10705000079B0121013307931DF0FEFCF3E7039B1F
-:107060001B781F2B01D02E2B00D10126039B5978B2
-:1070700040230B40181C4342434149B25B421E402F
-:10708000002900DA01260025049B0595D0180895F3
-:10709000079B9D420FD0059A037801320592002B81
-:1070A00004D0089B013308930023059301211DF0B0
-:1070B000D3FC0135ECE7002E02D1089B012B04D054
-:1070C000201C05991FF0E6FD76E0A268049B94461B
-:1070D00063441D1C079B9E4200D11FE72B78002BA9
-:1070E00006D1A368201CE91A01221FF0E1FD04E08B
-:1070F000281C01211DF0B0FC051C0136EAE7002E1A
-:107100001FD0059B022B03D10023012D45D13FE762
-:10711000012D00D13CE701232A1C1A403CD0059ADE
-:10712000032A3AD014E73A1C08994032127809052C
-:10713000090D8A4217D1002B10D0381C1EF03FFBDE
-:1071400001350123079A039913402B405A008A18EE
-:1071500052880892120B012AE5D006E00AA8211CE9
-:107160001DF013FDECE70135CBE7049A0AA8009265
-:1071700006996B1C039A1DF0A3FC0AA80899FFF757
-:107180006BFD99E658E602006B32030080D30200E3
-:10719000C0E8020093320300131C079A691ED2074D
-:1071A00005D5039A9288120B012A00D1690801299A
-:1071B00002D1002B00D1B1E6201C0499069A039B52
-:1071C000FFF758FDAAE62B78002B00D05AE63B1CAF
-:1071D00040331E78002E00D0BAE66368002B00D141
-:1071E000B6E62B69201C591C1DF09AFCA3686B6243
-:1071F000EB69AB620FE0022B02D11448144905E0A1
-:107200000B3B14481449012B00D914491EF0EAF82D
-:107210000023061C13930D981EF03FF9002E0BD08F
-:10722000301C3968BA6B002304F0BEFD381C1EF018
-:1072300054FA301CF8F7EFFF381C1EF04EFA099A8A
-:1072400013AB13CB13C2099817B0F0BDC0E802000E
-:10725000A532030040EB0200D932030000330300E3
-:1072600070B502F0AFFE0B4C0026231CA0331E604D
-:107270002663FEF77BFB084D0121281C09F03EFC2C
-:10728000281C6E215E221FF0BCFE656025606664CE
-:1072900070BDC046882E0020BC2E002070B506248C
-:1072A000134EC3001C4373680022051C211C181DCB
-:1072B00003F008FB021E18D1706C002807D00430C0
-:1072C000211C03F0FFFA002801D040680EE00022E4
-:1072D0000848211C03F0F6FA021E06D106492A1CB2
-:1072E000064804F0F3FCF8F796FF506870BDC046FE
-:1072F000882E002044F202000F330300C4E702008E
-:107300000A4B10B5041C18685B6898420AD0062125
-:10731000E30004301943002203F0D4FA002801D01E
-:10732000406802E0201CFFF7B9FF10BD882E002046
-:1073300008B5074B586C002801D1064807E0043017
-:107340002621002203F0BEFA0028F6D0406808BDCE
-:10735000882E002070EF02000A1C062108B5034B9E
-:10736000C000014318681FF04CFE08BD882E0020A5
-:10737000062108B5034BC000014318681FF04BFEFF
-:1073800008BDC046882E00200A1C062108B5034B04
-:10739000C000014358681FF034FE08BD882E00204D
-:1073A000062108B5034BC000014358681FF033FEA7
-:1073B00008BDC046882E002038B5051C0C1C0628C8
-:1073C00006D1081CF9F778FD00284CD028484DE07C
-:1073D0000123194217D04810042D06D0052D0FD0D7
-:1073E000002D42D10028F1D03DE0C022120690428B
-:1073F00004D18020C00520F0F9FB37E0404200E0D6
-:10740000C043400013E0022813D11A4B0B40062B57
-:1074100008D08B070DD10B689A69174B9A4208D197
-:10742000486802E0C8081DF030FE01234000184300
-:107430001CE0201CF9F716FB4369002B0DD10F4B04
-:10744000AD00201CED581BF04EFB0D49031C2A1CFF
-:107450000C4804F03BFCF8F7DEFE281C211C984782
-:10746000002803D1EBE7084800E0081C38BDC046FF
-:10747000A0C30200070080FF8D35000028C0020075
-:1074800028330300C8EA02005CC30200F8B5041CFC
-:107490001D1C0F1C161CF9F7E5FA0369201C9C46FD
-:1074A000002B08D11BF01FFB0549021C054804F006
-:1074B0000DFCF8F7B0FE391C321C2B1CE047F8BD60
-:1074C0008B280300C8EA0200F8B5061C0D1C171C27
-:1074D0001C1C00290BD01868F9F7C4FA736898428D
-:1074E00005D0064906481DF07DFFF8F794FEB06808
-:1074F000291C3A1C231CFFF7C9FFF8BD46330300C3
-:10750000C8EA0200F8B5061C0F1C141C1D1C9307CA
-:1075100014D11368174A934202D163682B6028E0A4
-:10752000154A934207D1002802D0F9F79BFA071CAD
-:10753000636888C51DE0114A934201D12C6018E0B0
-:107540005B681A1CF23A012A01D9F02BF6D1002E01
-:107550000ED1201CF9F786FA094B984208D10C206D
-:107560001DF074FF074B476003608460286000E0F3
-:1075700050C5F8BDE0BF0200A4BF0200A4BE0200D7
-:1075800014F9020024D60200F8B5002313605360FA
-:10759000071C0C1C151CF9F765FA061C102C05D1EC
-:1075A000836A002B02D00F4B88C519E0F369002BCA
-:1075B00004D0381C211C2A1C984711E0B06B00280D
-:1075C0000ED00621E4001A1C0430214303F07AF99E
-:1075D000031E05D05A68381C311C2B1CFFF792FF84
-:1075E000F8BDC04634F2020070B5161C041C0D1C18
-:1075F000FFF7CAFF3368002B15D10B4EA30707D145
-:107600000A4B22689A4203D1301C0949626805E09E
-:10761000201C1BF068FA021C301C06492B1C04F0CD
-:1076200055FBF8F7F8FD70BDFCE80200A4BE0200AF
-:107630005E3303008533030073B5041C0D1C161C58
-:10764000F9F710FAC369002B09D0042201960092C1
-:10765000201C291C6A469847009B002B0AD0201C3E
-:107660001BF041FA0449021C2B1C044804F02EFBB9
-:10767000F8F7D1FD73BDC04685330300FCE8020076
-:1076800013B5041CF9F7EEF9436A002B0BD1201C4B
-:107690001A216A46FFF778FF009B002B08D0684646
-:1076A000FFF7CAFA0EE0201C984700280AD1EEE73F
-:1076B000201C1BF018FA0449021C044804F006FBC5
-:1076C000F8F7A9FD16BDC046A7330300C8EA0200BB
-:1076D00037B5041CF9F7C6F9856A201C002D01D0C6
-:1076E000A84716E010216A46FFF74EFF009B002BCB
-:1076F00005D0281C291C6A461DF070FB09E0201CDF
-:107700001BF0F1F90349021C034804F0DFFAF8F713
-:1077100082FD3EBDC3330300C8EA020030B5051C3C
-:107720008FB0FCF779FC281CF9F79CF9846A281CB7
-:10773000002C01D0A04728E010216A46FFF724FF63
-:10774000009B002B17D002A8F8F74AFD011E07D1B5
-:107750006A461DF043FB041CF8F758FD201C14E09A
-:10776000039B0B491868FAF7E7FD031C201C002B4C
-:107770000BD1039807E0281C1BF0B5F90549021C42
-:10778000054804F0A3FAF8F746FD0FB030BDC04637
-:1077900084E80200C3330300C8EA0200F0B585B0F4
-:1077A00002900E1C171C202802D1914214D1A1E195
-:1077B000029B1B2B01D01E2B10D1301C391CF9F75A
-:1077C000E9F9002803D0029B1B2B05D192E1029B13
-:1077D000BA481B2B00D099E1B94897E1029B212BB5
-:1077E0002AD1101C04F0BAFA002807D0301C391C2A
-:1077F0001DF002FE002800D07CE1EDE703243C40B0
-:1078000000D042E1AF4B3A689A4200D03DE17B683C
-:107810009C42E1D2A300FB189D68281C04F09EFA4C
-:10782000002800D130E1301C291C1DF0E5FD0028A6
-:1078300000D05FE10134EAE70123194200D1EAE018
-:107840004D101A4200D1DEE0029B54101D2B00D9CE
-:107850001BE1181C12F0C4F81E00200023002600B3
-:1078600038003F00410043004E0056006B0074009A
-:10787000A3001E0020002300260038003F00410026
-:1078800043004E0056006B007400BC00C00019019C
-:10789000C400C800254300E065402E1CA8E02C4031
-:1078A000261CA5E0002C02DA8748884902E11F2C3B
-:1078B0006FDC874B23419D426BDCC0231B062341B9
-:1078C0009D4266DBA540E8E7002CEDDB1F2C00DDC8
-:1078D0001F242541E1E72E198AE02E1B88E0281C91
-:1078E000211CFCF72FFE002853D101206C436400BB
-:1078F00020430BE1002C00D1DAE0281C211C1BF0F6
-:10790000B4FC1BE0002C00D1D2E0281C13F060F97D
-:10791000051C201C13F05CF9011C281C12F096FCBD
-:107920000323022598436B4B2843C018EEE0002C3C
-:1079300000D1BDE0281C211C1BF087FC061C57E071
-:10794000002C02DB0395012617E0281C13F040F9F8
-:107950000323022698435F4B0643F61889E0E307AA
-:107960000ED4012C44D003986410011CFCF7EAFDEE
-:1079700000280ED1039B5B430393002CEFD137E02B
-:10798000301C0399FCF7DEFD002802D1039B5E4307
-:10799000E7E7E917281C20F01AF9061C69E0002C1B
-:1079A00000D185E000210220FDF77CFD211C061C92
-:1079B000281C1BF05AFC012740003843B060211CF2
-:1079C000281C1BF042FCB8403843F060301C9DE09E
-:1079D000A54200DB00E78DE0A54200DCFCE689E083
-:1079E000A54200DDF8E685E0A54200DAF4E681E094
-:1079F00073001A1C724002D40120184386E0301C28
-:107A000020F0F4F882E003231340022B03D1324B21
-:107A10001340062B70D1029B1F2B2AD1381CF9F77B
-:107A200021F88369051C002B07D16B6A002B16D047
-:107A3000381CFFF725FE041C0BE00298391C321C91
-:107A40009847002862D1F0E7311CF9F7A3F8002825
-:107A500050D1201CFFF762FE0028F5D1BCE6381C8F
-:107A60001BF041F81D49021C1D4804F02FF9F8F7DE
-:107A7000D2FB301CF8F7F6FF8369002B05D0029883
-:107A8000311C3A1C98473FE02F1C029B301C9A0087
-:107A9000144BD5581BF027F8041C381C1BF023F896
-:107AA000114900902A1C231C0D4804F00FF9DEE751
-:107AB0000E480F491DF096FCD9E7C0465CC3020092
-:107AC000A0C3020070CF0200D8E50200E233030039
-:107AD000FFFFFF3F00008080070080FFA733030007
-:107AE000C8EA0200E0BE0200F733030034EA0200F5
-:107AF000032F0300064809E0281C13F069F83A1C1C
-:107B0000011C0298FCF788FE0028BED005B0F0BD2D
-:107B10005CC30200F0B513688DB00693002803D152
-:107B2000131D0393041C03E0131C546808330393D0
-:107B3000FF220B1C13400193090A1140019A4B00CC
-:107B400005939B18039A9B00D558D3185F6804913E
-:107B5000381E09D00020BB0706D17F4B3A689A42F5
-:107B600002D1381C1FF04AFA049BC618002D16D10A
-:107B7000019B760001339B19980000931DF066FC71
-:107B8000251C061C002C01D001250460019BA800C7
-:107B90009A003018039923F0FDFA019B30E0AB07FF
-:107BA00031D12B686D4A934202D06D4A93422AD15B
-:107BB000281C09A90AAAF9F7E1F8099B019A0133DF
-:107BC0009B1876009B19980000931DF03FFC251C24
-:107BD000061C002C01D001250460019BA8009A001E
-:107BE0000399301823F0D6FA019B0A99E818099BEB
-:107BF00080009A00301823F0CDFA019B099A9B1857
-:107C00005B19029338E0019B7600181D83199800D8
-:107C100000931DF01BFC0294061C002C02D00123D3
-:107C200004600293029B03999800019B30189A000C
-:107C300023F0B0FA019A029B9446281C63440293F5
-:107C4000FFF71EFD029B07909C000798FFF766FD5B
-:107C5000051E11D0029B009A934207D3301CD1001D
-:107C60001DF00AFC061C009B5B000093029B355133
-:107C7000013302930434E8E7029B9800049B301818
-:107C8000DA00019B9900039B591823F083FA029AAA
-:107C9000059B944663441C1C002F4ED00325381CC2
-:107CA0003D4019D12C4B3A689A4215D11FF0BCF9CE
-:107CB00041688D4241D08368EA009F58002F09D067
-:107CC000042F07D0A300F7508768F318BA1852683A
-:107CD00002345A600135ECE7C5210AAAFFF784FC9B
-:107CE00000200AAA011C1DF079F8FFF7C9FCA500C5
-:107CF00001900198FFF712FD071E1ED0009A631C29
-:107D000093420BD353000093032B01D80423009319
-:107D1000009B301C99001DF0AFFB061C09AA381C03
-:107D20000221F9F74DF8099B02341B687351099B36
-:107D30005A6873195A600835DBE7029B0698E21A05
-:107D4000191C5208331CFFF7A1FB041C301C1DF04A
-:107D5000A4FB201C0DB0F0BDC4F6020070CF0200E1
-:107D6000FCD1020073B50C1C161C83071FD10368DD
-:107D7000224A934207D0224A934218D1694601AA67
-:107D80001BF0ECFE03E0694601AA1BF039FC009BE6
-:107D9000A34227D32AD80023019DA000A3422CD0C0
-:107DA0009900421A043AAA5801337250F6E7FFF7D5
-:107DB00067FC0023051C0093009B281CA3420CD2E7
-:107DC000FFF7ACFC00280DD0009A0E49A31A5B18EF
-:107DD0009B00013298510092EEE7FFF79FFC0028CC
-:107DE0000BD003E008480949009A02E0221C06482B
-:107DF000074903F06BFFF8F70EFA73BD70CF02006E
-:107E0000FCD10200FFFFFF3FD8E502001C34030055
-:107E10003F340300F7B5141C0A0AFF230E1C151C7F
-:107E20001E401D4083073CD107683E4B9F4203D054
-:107E30003D4B9F4235D104E0694601AA1BF0E0FBAF
-:107E400009E0FF231143194201D1206068E069462F
-:107E500001AA1BF083FE009BAA19934259D39A00F2
-:107E60009446002001998200A84206D06746BF1AB6
-:107E7000043FCF590130A750F5E79B1BB500181AF6
-:107E80004919A4181BF052FE019B20605D190023C4
-:107E900001360133B34243D09A0051426958A15090
-:107EA000F7E7FFF7EDFB0023071C0093009BB342AD
-:107EB0000CD2381CFFF732FC00282AD0009AB31AE3
-:107EC0005B199B00013218510092EFE70020011C62
-:107ED0001BF02CFE061C381CFFF720FC011E03D0F3
-:107EE000301CFDF7AFFEF6E7B168A94211D3AB0035
-:107EF000E3181E6088009C4206D0C21AF768A218D8
-:107F0000D259043B1A60F6E7491B301C1BF02BFECC
-:107F100006E00649009A064803F0D8FEF8F77BF918
-:107F2000F7BDC04670CF0200FCD102001C34030034
-:107F3000D8E50200F0B587B01D1C061C0C1C019290
-:107F4000F8F790FD2F4B984206D1301C211C019A66
-:107F50002B1CF8F7A1FC53E0876A2B4B002F07D0AE
-:107F60009C4220D1301CB8472860002816D147E039
-:107F70009C4218D1301C102103AAFFF705FB039B7C
-:107F8000002B0DD1301CCD2103AAFFF72DFB0120C2
-:107F90000021059403AA1CF021FF286001202FE096
-:107FA000381C391CF6E7002CECD1019B201C002B5F
-:107FB00026D0181CF8F756FD1449FAF7BDF9002829
-:107FC0000FD0301CCC2103AAFFF7DEFA039B002B55
-:107FD00007D0201C211C03AA1CF000FF2860201CD5
-:107FE0000EE0301CCE2103AAFFF7CEFA039B002B34
-:107FF00003D00120002101AACDE70220019B2B60C4
-:1080000007B0F0BD0CBA020094BA02007CEB02008B
-:1080100010B5041C03F0A2FE002806D00021201C8D
-:108020000A1C0B1CFFF732FA0AE0201C1DF0DEF9D7
-:10803000031C201C002B03D1024803491DF0D2F978
-:1080400010BDC046C8EA0200673403007FB50623AE
-:10805000C0001843054B01900491052001A902932B
-:1080600003930592FCF7D2FF07B000BD94BA02005B
-:108070000C23F0B58BB000AFFA18051C0C1CFFF7F1
-:1080800083FA3B69002B06D02B49221C2B4803F0B6
-:108090001DFEF8F7C0F8F86800284AD1281C1BF02C
-:1080A0006DFA0028F0D00C23281CFA180D21FFF7D8
-:1080B0006BFA0823F868F918FAF778FF3860201C83
-:1080C000BD681CF0E7FF6A4601352B187B600E3354
-:1080D000DB08DB00D31A9D46BD6839682A1C684658
-:1080E00023F058F86E462E23201C73551CF0D7FF42
-:1080F0003860201C1CF0CEFF01357519021C396850
-:10810000281C23F047F87968684601F09DFF062394
-:10811000C00018430A4B0822BB61FB61094BBA1827
-:108120003B6201237B620B337861D1180520FCF799
-:108130006DFFBD460BB0F0BD9134030080E9020035
-:1081400094BA02005CC30200F0B5174C0F1C6168C2
-:1081500095B003912168061C08A804916260236011
-:10816000F8F73EF8051E06D0039B09986360049B50
-:108170002360F8F750F8336805A8311C3A1C0193C6
-:10818000FEF768FE2A1C2B1C019905A806F04CFE80
-:108190001CF015FE051CF8F739F8281C039B6360DA
-:1081A000049B236015B0F0BD882E002010B5041C80
-:1081B00001F0A8FA031E064803D006491DF012F983
-:1081C00003E00549221C03F081FDF8F724F8C046BE
-:1081D00058E60200A7340300D0340300011C08B5A0
-:1081E00002481DF0FFF8F8F716F8C04670EA0200E2
-:1081F00030B5072402784160A243053C2243027057
-:108200007F22039C05882240D400034A83602A40D1
-:108210002243028030BDC04607FCFFFF10B5072493
-:1082200003782140A34319437F23017004990488F4
-:108230000B40D900084B426023400B430380039B53
-:1082400004685B05D90A054B23400B430360029B7E
-:108250008360059BC36010BD07FCFFFFFF03E0FFC9
-:108260009F230021024A5B000248D1527047C0465A
-:10827000882E002094BA02009F230121024A5B004D
-:108280000248D1527047C046882E002094BA02009E
-:108290009F23044A5B00D35A0348002B00D10348B4
-:1082A0007047C046882E00205CC30200A0C30200B5
-:1082B00008B5F9F7B7FA014808BDC04694BA0200FC
-:1082C000F0B5151C42688FB0944606938369CA685E
-:1082D00002938B68826063445A1C42601A78041CC3
-:1082E00001929A1C4260DA1C5F7842609A7805918C
-:1082F00004921A1D4260DB7800210393031C18339B
-:10830000C360029B03339B00C31804330361029BC9
-:108310001C309B001A1C079322F059FF149AAB00E3
-:10832000D3180B93029B049ADB1B08939B1A05330B
-:108330009B00E3181E1D01220199BD420FD9114275
-:1083400003D1834883493A1C2CE01E1C149BB900BE
-:10835000E81B5918FDF7A6F83D1C706027E0114294
-:1083600002D01E1C7C4B7360069B002B1FD1019B0F
-:108370001B071CD4039BFA1A954211D3D91B8B00FF
-:108380009C462A1CBA4212D261469300581805999D
-:108390000132081807990069CB1AE3189861F1E7D0
-:1083A0006B486C492B1C03F091FCF7F734FF00225B
-:1083B000AA4208D0149907989300C958C31AE31821
-:1083C00099610132F4E7069B002B03D1019B1B0747
-:1083D00000D494E00223019A1A4000230A920793E2
-:1083E000002A04D006981EF0D3FD079030600026C6
-:1083F000A3680B9D0993069B9E4228D00022296802
-:10840000049BDB199A4215D209989300C3589942EC
-:108410000ED1029B013B9B1A9B00E318DA69002AEC
-:1084200003D0CA084A484D4966E06A68DA610BE041
-:108430000132E5E70A9B002B02D14548484963E039
-:1084400007986A681EF0DDFD01360835D3E7089B02
-:1084500003989A1D039B9200D91CA218059B043215
-:1084600089005918131C002808D01D68002D01D15F
-:108470000D681D60013804330439F4E7039B9B0049
-:10848000D318029A06329200A2180432934209D2FB
-:108490000433191F09680029F3D1D21A92102C480D
-:1084A000304929E0089B099A9D00BB00D318651943
-:1084B0000693002610E0039B059904339B0058584F
-:1084C0000699B3000430C95802F0FCF900280CD01A
-:1084D0004368AB610136043D049B9E421ED2AA69EB
-:1084E000002AF7D1019B1B07E5D4F619099BB600BA
-:1084F000F25817481C49D20803F0E8FB55E7049BE3
-:10850000002B04D0124819491CF06CFF4DE7019B69
-:108510009B0703D504981EF03BFD306065680DA8ED
-:1085200025600D951CF0E3FC2E180136731E1D7896
-:10853000FF2D09D0029B013B5D1BAD006519E86969
-:10854000FCF736FAE861F0E766600FB0F0BDC046B0
-:10855000C8EA02000D240300ACCF02006724030028
-:10856000232E0300FE340300303503006035030082
-:1085700038B50523041C094A094D106843430948CE
-:108580001B199B0018582B68146018180F231940EA
-:1085900009012860F9F720F838BDC0464C270020B3
-:1085A000702700203CD70200A839031C00B5081E24
-:1085B00006282ED811F000FA040A10151B202700F7
-:1085C0009A18E223DB00D218107826E0C432920019
-:1085D000D05C8006800E20E0C4329200D05AC004E5
-:1085E00003E0C4329200D0580003400E15E0C432BC
-:1085F00092009A1890780AE0C43292009A18D078C3
-:108600000007000F09E0C43292009A18D0780009E0
-:1086100003E00020014A024B1A6000BD4E3D0300FA
-:108620001C000020A83910B5041C081E062846D8D6
-:1086300011F0C2F9040A131E29333B00E221A218EB
-:10864000C900521813703DE03F20C4329200115D02
-:10865000034081430B43135534E07F21C432920021
-:108660000B409901105B184B03400B43135329E057
-:108670007F21C43292000B40105914495B03014022
-:108680000B4313511EE00F21C4329200A2189078C0
-:108690001B0101400B43937014E00F20C432920081
-:1086A000A218D1780340814306E00F21C432920022
-:1086B000A218D0781B0101400B43D37002E0044A9A
-:1086C000044B1A6010BDC0463FE0FFFFFF1FF0FFE4
-:1086D000593D03001C000020F0B585B0039307232B
-:1086E000D2B21340013BDBB20F1C042B02D92B4C3E
-:1086F0002B490C602B49CE5C07211B028A43019356
-:1087000008D1294BC55C2D09ED43EBB23D780093B0
-:108710002C1C1FE0D443E4B20825244B019A1B19FA
-:108720009B5C5F00FFB2DB0904D002200521FFF74C
-:108730001FFF05E00120311CFFF71AFF002EF4D0C7
-:10874000013DEDB23B1C002DEBD10134E4B2002C15
-:10875000E2D120E00826154B019A1B199B5C5A00B8
-:10876000D2B20292DB0902D003201A2101E00420D8
-:108770000621013EF6B2FFF7FBFE029B002EEED172
-:10878000009B0134E4B25B1B1B19DBB2002BE1D16F
-:10879000009BED1A3D70039805B0F0BD653D0300E8
-:1087A0001C000020784003001907000087350300F3
-:1087B0000022F0B5051CFF248BB008AB0191DA71E3
-:1087C000231CC4339B00EB189978604E0A09B05CF7
-:1087D0000F220001114001439970D9780807000F5A
-:1087E000375C9143174039430809305C0A40000167
-:1087F0000243DA70013CE3D2E223DB00EE5CB30813
-:10880000F31ADBB20693524B1B68002B0BD081236B
-:108810001B01E818C4239B00E918E223DB00EA18D7
-:10882000019B01F03FFB00244823271C0493039481
-:10883000029481222B1912019B181B7805930723A0
-:10884000059A9A4307920BD008ABD91D281C231C0C
-:10885000059AFFF741FF019B0230C4B2023B32E0B0
-:108860003C48029BC35C9C46231C6246C4339B006D
-:10887000EB189978DB7809091143374A515C039A60
-:10888000805C1A07120F1043334A1B09105C401812
-:108890003249C95D0B43D15C01234118FF2801DC3B
-:1088A0006B461B7FC9187839C9B209090020FFF748
-:1088B0005FFE049B013BDBB20493002B0AD1019BBA
-:1088C0000134E4B2013BDBB20193019B002B3BD0AE
-:1088D0002B780493013EF6B2002E0CD1E222002741
-:1088E0002B19D2009B181E780397B308F31ADBB23A
-:1088F000069302979DE7069B013BDBB20693002B94
-:1089000002D1059B002B16D1221CC4329200535D6C
-:1089100002999B069B0ECB18DBB20293535B039923
-:10892000DB045B0ECB18DBB2039353591B035B0EC6
-:10893000FB18DFB27DE708ABD91D281C231C059A64
-:10894000FFF7CAFE041CC9E70BB0F0BDD33D03001E
-:1089500048270020B4400300D73A0300343E030008
-:10896000064A125C002A05D0054A135C4B43D81115
-:10897000C0B201E0034A105C7047C046D43F030018
-:108980007D400300873A0300064A125C002A05D0A6
-:10899000054A135C4B43D811C0B201E0034A105C96
-:1089A0007047C046D43F0300773C030028400300D3
-:1089B000F0B5037A8BB07F2B00D14DE1031C071C6F
-:1089C0000025041C0933FF330837099300953E78CE
-:1089D0007F2E03D1002302930093DEE0012E02D10B
-:1089E000201C311C03E0022E05D1201CFF21009A1F
-:1089F0002B1C1CF08DFA994ABB78301CD3185B787D
-:108A00000093FB780193A178FFF7AAFF3F2318405A
-:108A10000290E178301CFFF7B7FF7F23904A18409F
-:108A2000925D03901A408F4B04929A5D0F231A4077
-:108A300005928D4A925D1A4006928C4A925D1A40C8
-:108A40008B4B07929B5D08937B78EB18DBB29C46BF
-:108A50002A1C3F21C4329200135D8B4302990B43C1
-:108A60001355105B039B83499B010140194311532C
-:108A7000049B10595903804B18400B1C03430F20D3
-:108A8000135105991E0C06400901A21831431B0E13
-:108A9000069E9170834307993343090118400843A8
-:108AA000D0706946202081220918631909781201C3
-:108AB0009A181170E222D2009B180199009A013590
-:108AC0005218EDB21A706545C2D1099B04379F4216
-:108AD00000D07CE77EE76949CD5C8E5C6849AE4298
-:108AE00064D18D5CCB5C0493039B597A009B59182D
-:108AF000CBB20093049B5B19DBB20693023B1B06CF
-:108B000047D4A826009B5D1BEBB20593A82E55D138
-:108B1000039B311C5F7A5A7B7F085208D31901935B
-:108B2000009B201C9A18D2B2DF1BFFF73DFDFFB25D
-:108B3000051C311C201C3A1CFFF736FD2D1AEDB226
-:108B40007F232A1C6DB29A43EB17E818584001990D
-:108B5000079211F0C5F8281CCBB20199089310F0C8
-:108B6000D9FF0025C3B2059F09933A1C311C201C74
-:108B7000FFF71AFD019A0599099B01375218C3188E
-:108B8000FFB2D2B2DBB2BA422BD10136F6B2AF2E6F
-:108B9000BCD1029B0133DBB20293029B9B00E31822
-:108BA00003931A7A1B7B7F2B95D133E03548AE4275
-:108BB00001D2C55C96E78D5C835C94E7049B009AC8
-:108BC000311C9A18D2B2201CFFF7EEFC311C051C98
-:108BD000059A201CFFF7E8FC069B2D1AEDB20193C5
-:108BE000AEE7089AAD18019AEDB295420CD3AD1AD2
-:108BF0006A46127FEDB252B2002A03DB002B03D08B
-:108C0000013300E0013BDBB2201C311C3A1CFFF7B2
-:108C100009FDAAE7029B02339B00E3185978009BE9
-:108C200059186368C9B2002B03D0201CFFF7C0FDA0
-:108C300012E0E222D200A0181A1CC4329200125D87
-:108C400005789206D20EAA1A0270802201330130F2
-:108C500052009342F0D1E8E70BB0F0BDC83D0300ED
-:108C6000D73B0300343F0300783D0300273C03005B
-:108C7000E43D03003FE0FFFFFF1FF0FFAE3C0300B9
-:108C8000FE3C0300843F0300002805D0012809D1E1
-:108C90008B685B00184306E08B680348002B02D109
-:108CA000024800E0002070475CC30200A0C302003D
-:108CB0007FB5041C0122081C01A9F8F77DF90022E8
-:108CC00021794020FBF7D4FF061C0298311C10F0DC
-:108CD00091FE6268051C130A834208D2A368C1187A
-:108CE0007143E0681CF0C8FB2379E06003E01B1AC5
-:108CF0001B02D2B21343321CA06863607043E36866
-:108D00006A431818019922F045FAA36802485D19D0
-:108D1000A56004B070BDC04694BA0200F7B5FF2547
-:108D20004668041C0191AE431DD10179321C4020DC
-:108D3000FBF79EFF6368071C1D408023A1681B0191
-:108D40001D43083141436560E0681CF095FB636892
-:108D5000E0601A0AA368013A01337A435F43311C89
-:108D6000C01922F034FA2079019BE168A268FCF76F
-:108D7000D9F8A36803480133A3606368013BFF3B54
-:108D80006360FEBD94BA020010B5041C10201CF0F4
-:108D90006FFB024B4460036010BDC046C8D70200A1
-:108DA00070B50A79041C0D1C002A09D119491BF061
-:108DB0005CFD201CE968AA680123F9F79DFB23E00C
-:108DC00015491BF01EFEAB68002B1DD0201C13495B
-:108DD0001BF04BFD0026AB689E4211D2002E03D043
-:108DE000201C0F491BF041FD321CE9682879FBF774
-:108DF00061FF0122011C201CF7F74EFE0136EAE755
-:108E0000201C08491BF031FD201C07491BF02DFDDB
-:108E100070BDC046B4410300C0410300CB41030014
-:108E200017280300C8AF0300CE260300F8B5071CBF
-:108E30000D1C4020391C0022FBF71AFF061E05D12D
-:108E40000C490D481CF0CEFAF7F7E5F910201CF09C
-:108E5000FDFA0A4B041C002F00D0094B281C23608C
-:108E6000FBB2A560704363601CF0F0FAE060201C68
-:108E7000F8BDC046CF410300D8E5020040D802004B
-:108E800004D80200F0B5061C8BB00D1C141C12286F
-:108E90003AD034D8052800D087E0081C012204A964
-:108EA0001CF05BF8201C07A90122F8F785F8069B47
-:108EB000002203936B464020197BFBF7D9FE061C6A
-:108EC0000898311C10F096FD069B071C03936B4617
-:108ED000A968187B7918FFF7A9FF059B041C1A1CC9
-:108EE0000499C068039322F055F9321CE368059891
-:108EF0007A431818079922F04DF9231C56E01B28D5
-:108F000039D01F2806D050E0081C111CFFF7D0FEF6
-:108F10002B1C4BE0101C07A9012219F0FAFD0322BB
-:108F2000002814D0234B154240D1234A296891428E
-:108F30003CD104A9281C01221CF00FF8012304983D
-:108F400000930599079A089B19F0F4FF28E0E307BE
-:108F50000ED4144203D1194B22689A4208D003223E
-:108F6000144B2240022A21D1154A1440062C1DD050
-:108F70001448FFF733F9081C012204A91BF0EDFF88
-:108F8000201C07A9012219F0C4FD0A4B00280DD0AE
-:108F9000089B301C00930499059A079B1AF06DFBFF
-:108FA000094B002802D1034B00E00023181C0BB032
-:108FB000F0BDC046A0C3020040D802004CB9020078
-:108FC000070080FF402F03005CC30200F0B5051CC2
-:108FD00087B00E1C002808D08B0724D10B68264AC6
-:108FE000934202D0254A93421DD1301C03A901228D
-:108FF00019F08FFD002816D00022291C4020FBF715
-:1090000037FE061C0498311C10F0F4FC071C281CC9
-:10901000391CFFF70BFF321C041C7A430399C0680C
-:1090200022F0B8F824E0301CF7F722FF071E00D02A
-:109030004710391C281CFFF7F9FE041C301CFEF7F2
-:109040001FFB002600900098FEF768FB031E0FD060
-:10905000002F04D1201C191CFFF760FEF3E7721CDF
-:109060000192281C321CE168FBF75CFF019EEAE7D5
-:10907000201C07B0F0BDC04644C2020040D8020028
-:1090800070B586B0002A44D00324161C051C0A1CA7
-:109090000C402CD1204B0968994228D1111C8068C2
-:1090A00003AAFCF717FB002802D11C48FFF796F82B
-:1090B000221C042E2DD129794020FBF7D9FD049BD9
-:1090C000061C28790093039B0193019A009B991A2F
-:1090D000FFF7ACFE041C0399049AEB68521A714323
-:1090E00072435918C06822F055F8221C11E0A96893
-:1090F00028680023F7F778FEE968021C2879042E17
-:1091000003D1FBF7D7FD021C03E0331CFBF70AFF7A
-:10911000034A101C06B070BDB0F202003B2A0300E7
-:1091200094BA020037B51D1C00230C1C0093081CC8
-:10913000111C1A1C0133FBF747FA002C04D1201C28
-:10914000211CFFF773FE1BE02968CB0705D48B07B2
-:1091500013D10C4B0A689A420FD1081CF7F76CFD2B
-:10916000051C0020291CFFF761FE041C0021C068BB
-:109170002A1C22F02CF8201C02E00020FFF726FF1A
-:109180003EBDC0464CB902000D4B73B530CB161C2A
-:10919000012804D94D682C1C022800D08C6808686E
-:1091A00001A9F9F703FF011C2C20019A0023FF30CD
-:1091B000FCF78EF8311C2A1C231CFEF7C5FF76BD78
-:1091C000882E0020F0B500270D1C85B003901E1CD2
-:1091D000081C104B111C00970222FBF7F5F9A81C84
-:1091E00080001CF033F9039B041C03606B1E3D1CC4
-:1091F0000393436033688360039B9D4207D201352C
-:10920000AF00F059FEF73CFAE719B860F4E7201C0C
-:1092100005B0F0BDFFFF000010B50B1C041C0029B9
-:1092200006D0054A096802609A6B002302F0BCFD73
-:10923000201CF6F7F0FFC04640EB0200F0B5041C1E
-:1092400087B0039202936718002A0ED0023A222AAE
-:109250000BD93D493D481CF0C5F8F6F7DCFF2078F6
-:10926000F7F778FA002803D00134BC42F7D30AE0BC
-:1092700023782B2B01D1013405E0061C2D2B03D1C3
-:109280000134012600E00026391B201C03AA1CF033
-:10929000F7FA23181D1C00240093BD4210D22B782E
-:1092A000181C0193F7F76EFA039B002806D0019A69
-:1092B0002F3A9A4202DC019B303B0DE0102B03D089
-:1092C000002E19D0644217E02023019A13431A1C80
-:1092D000613A052AF4D8573B201C03990193FBF708
-:1092E00031F900281AD1039B5C43019B1C196300D0
-:1092F000634013D40135D0E7012364001C43009B75
-:109300009D4216D0BD4206D22878F7F723FA0028EE
-:109310000FD00135F6E7BD4213D00AE0009B05A847
-:109320000593F91A321C039B1EF086FC059D041C54
-:10933000E5E707490548039A02F0C8FC0299FFF7E0
-:109340006BFF201C07B0F0BDDC410300D8E5020034
-:10935000FF410300F0B5041C8BB009934318089239
-:109360000193019B9C4200D30EE12078F7F7F2F9BC
-:10937000002801D00134F4E723782B2B02D10134EB
-:10938000049005E004902D2B0ED12C3B0134049366
-:10939000019B9C4208D3824B002706930023251C87
-:1093A00007973E1C039356E0202322781A43692A2C
-:1093B0002ED10199A21C914200D8BEE062781A43D6
-:1093C0006E2A00D0B9E0A2781A43662A00D0B4E031
-:1093D000E21DE51C914200D8A8E0E2781A43692A10
-:1093E00000D0A3E022791A436E2A00D09EE0627971
-:1093F0001A43692A00D099E0A2791A43742A00D04E
-:1094000094E0E2791343792B00D08FE005358DE0AD
-:109410006E2AC0D10199A21C914200D88DE06278D9
-:109420001A43612A00D088E0A27813436E2B00D043
-:1094300083E0E51C00265B4F7BE06B1C02932B78DE
-:109440001A1C303A0592092A30D8022E07D10A2375
-:109450007B43D718029D019B9D42EED354E0012E21
-:1094600015D1059811F0FCFB069911F0E1F8011CEB
-:10947000039810F06FFD0390069813F025FA4A4AFE
-:109480004A4B12F09BFB13F073FA0690E2E748494F
-:10949000039811F0CDF8051C059811F0E1FB011CB3
-:1094A000281C10F057FD00260390D3E7002E02D1B0
-:1094B0002E2B02D126E0022E19D020221A43652A33
-:1094C00015D1029B019A93420BD26B782B2B02D1C0
-:1094D000AB1C029305E02D2B03D1AB1C029301239F
-:1094E0000793029B019A934247D00226B2E70026D7
-:1094F000089AB24209D0202213436A2B05D1029D5B
-:10950000013602E00126A5E70026079B002B00D0CC
-:109510007F42381C11F05CFB011C254814F05CFAFA
-:10952000011C039811F084F8071C02E0FF270026B5
-:10953000FF05049B002B09D005E0049B002B1CD0E9
-:10954000251C0026002780231B06FF18A54214D0E7
-:10955000019B9D4206D22878F7F7FCF800280CD032
-:109560000135F5E7019B9D4207D1002E02D1099BF1
-:10957000002B0CD00F48104901E00E480F491BF09A
-:1095800031FF1099FFF748FE0023049303E70323FC
-:1095900002209F430A4B0743F8180BB0F0BDC046AA
-:1095A000CDCCCC3D0000C07F9A9999999999B93F4B
-:1095B00000002041D8E50200274203004442030096
-:1095C00000008080F7B52E4B2E48191CFC31CA6B69
-:1095D000824254D9043ACA63191C1268A4310F6834
-:1095E000501C84083E5D051C032425406D002E415F
-:1095F000811A34400130022CF3D0AC331B681201C5
-:109600009B180901019389080029DCD0019B1B6884
-:109610001A072FD11A48041CAC342468A34229D35A
-:10962000051CB0352D68AB4224D2051C1B1BDC1772
-:10963000240FE318A4351B112E689C0836191D1C35
-:10964000032425406D00AC46377862463D1C154129
-:109650002540012D0ED194403C433470061CFC364D
-:10966000F46B094FBC4203D2201DF063236001E07C
-:10967000B4300560019B013904330193C4E7F7BDA1
-:10968000882E0020402F0020C02F00200F23994358
-:1096900070B5061C0D1C081A412110F0ABF9104CD6
-:1096A000021C231CA8331860231C211CA4331E6039
-:1096B0008301EB1AAC310B60231C301CB03300214A
-:1096C0001D6021F084FD221C0023FC325364221C07
-:1096D000FE32D38701223F33FF33E25270BDC046D2
-:1096E000882E0020024BFE33DA8F0132DA87704772
-:1096F000882E0020024BFE33DA8F013ADA8770475A
-:10970000882E0020034BFE33D88F431E9841C0B2F1
-:109710007047C046882E0020F7B5002400900191C4
-:10972000019B9C4238D0009AA300D3581A072FD12E
-:109730001A4A111CAC3109688B4229D3101CB03075
-:109740000068834224D2101C5B1AD917090FCB186A
-:10975000A4301B11066899087618181C03210840CC
-:109760004000844637786546381C28410840012867
-:109770000ED1A94039433170161CFC36F16B084FED
-:10978000B94203D20A1DF2630B6001E0B4321060EB
-:10979000FFF718FF0134C3E7F7BDC046882E00204D
-:1097A000C02F002008B5FFF79DFF06480022031CCC
-:1097B000B4331A60031C044AFC332621DA63FFF732
-:1097C000ABFF08BD882E0020402F0020F8B52C4CA0
-:1097D0000025221CB4321368AB4221D0231C156033
-:1097E000284AFC33DA63231CA8331B689B009D4284
-:1097F000EDD2221CA4321268AB08D15C03232A1CD0
-:109800001A40520011410B40032B07D1221CFC329D
-:10981000D36B191DD1631D60FFF7D4FE0135E2E75C
-:109820001E1C221CA83212689200934221D2211CD5
-:10983000A43109689A088A18032011781F1C0D1C8E
-:1098400007407F003D410540022D05D0854209D0EB
-:10985000012D0CD12E1C01E0002E08D0B840814310
-:10986000117004E00220B8400026814311700133DA
-:10987000D7E70023FC346364FFF73CFFF8BDC04624
-:10988000882E0020402F0020274AF0B5131C111C01
-:10989000B033AC3109681B685B1A111C03600023EC
-:1098A000A8310C68191CA432156843608360C3603A
-:1098B00003614361A400A1422FD08A08AE5C032259
-:1098C00094460A405700321C66463A413240012A0B
-:1098D00012D8012B03D1C6680136C66004E0022B02
-:1098E00002D10669013606614669B34200D9436177
-:1098F000012A0CD0002A06D0022A0CD1426801337A
-:109900000132426007E083680133836002E043680C
-:1099100001334360131C0131CDE743681B014360F1
-:1099200083681B018360F0BD882E0020F7B5404D91
-:109930000F302B1CFE33DC8F0609002C01D00020D9
-:1099400075E0002EFBD09F235B00E95A4B42594142
-:109950002B1CFC335A6C2B1CA8331B6801932B1C4B
-:10996000A4331868019B9A4228D2835C9F0704D1D4
-:109970000134B44202D3920026E000240C273B427B
-:1099800005D10134B44203D3920001321CE000241B
-:1099900030273B4205D10134B44203D39200023256
-:1099A00012E000243F27BB4305D10134B44203D366
-:1099B0009200033208E000240132D3E70029BED12F
-:1099C000F7F730FF0121C3E7131B591C012C04D109
-:1099D0002E1C541CFC36A40874648C080019032443
-:1099E00001260C406400A640341C06780233344340
-:1099F000047093420FD82C1CA434246898082418AF
-:109A000003200226184040008640301C267801338F
-:109A100030432070EDE7AC352C680B010132E418BF
-:109A2000521A1201201C002121F0D1FB201CFEBD86
-:109A3000882E0020224B70B51A1CFE32D28F002ACD
-:109A40003DD102073BD11A1CAC321268904236D38A
-:109A5000191CB0310968884231D2801AC217120F1E
-:109A600010181A1CA432001112688108555C041CDD
-:109A700003221440640025412A40012A1FD11A1CE8
-:109A8000FC32546CA14200D251641D1CA4352A68DA
-:109A9000840814190322011C161C114049008E4031
-:109AA000311C267801308E4326702C688108645C56
-:109AB000011C114049000C412240022AE5D070BD32
-:109AC000882E0020031C0F2070B518402AD1164A9A
-:109AD000111CAC3109688B4225D3141CB0342468A6
-:109AE000A34220D25B1AD917090FCB18A4321B113D
-:109AF00015689A08AC5C191C0322114049000C41FE
-:109B00002240012A0FD15A1C91086E5C141C0321BB
-:109B10000C4064002641D01A314001320229F3D0B2
-:109B2000000100E0002070BD882E0020F0B55B4FE2
-:109B3000051C3B1C0020FE33DB8F85B0834200D028
-:109B4000A9E001920E1C854204D1081C291CFFF7D4
-:109B5000EDFEA0E0002900D199E00F22181C2A4058
-:109B600000D098E03B1CAC331B68101C9D4200D217
-:109B700091E0391CB03109688D4200D38BE0EB1ABB
-:109B8000D917090FC9183B1CA4331B68091100938E
-:109B900000988B08C35C0324081C2040400003414C
-:109BA000101C1C40012C76D1331C9446A837386811
-:109BB0000F3380001B0902904F1C029A97421AD261
-:109BC0000098BA08825C381C039203221040039A62
-:109BD00040000241101C03221040022801D1013430
-:109BE00007E0002807D101229444624612199A42E4
-:109BF00001D20137E1E7A3423AD01AD2CB181E1C9A
-:109C00000C192649A6420DD0A4310F68B208BF181E
-:109C10000320321C0240520090403A7801368243C1
-:109C20003A70EEE7FC314A6C9B08934220D24B64B9
-:109C30001EE06246A21893421CD86218C8188242DD
-:109C40000FD216489608A430006802278619032010
-:109C5000104040008740381C37780132384330705C
-:109C6000ECE71A1B240112012819002121F0AFFA98
-:109C7000281C10E0019800280DD0301C0021FFF7AF
-:109C800055FE061E07D02201291C21F083FA281C4C
-:109C9000FFF7D0FE301C05B0F0BDC046882E002076
-:109CA00010B58AB004A8FFF7EFFD069B094C03939B
-:109CB0000093049A059B201C07491AF0A2FE099BF9
-:109CC000201C039300930549079A089B1AF099FEFC
-:109CD0000AB010BD3CD302005E4203008142030083
-:109CE000F8B53F4D3F4E2B1CAC33301C3E491A6833
-:109CF0001AF087FE00242B1CA8331B689B009C4293
-:109D000024D2A20632D12A1CA4321268271C9446FF
-:109D10006146BA08895C03203A1C02405200114196
-:109D2000014202D101379F42F2D33A1B7F2A12D956
-:109D30009209301C2D491AF064FE3C1C3F239C43C1
-:109D40002B1CA8331B689B009C4204D3301C284961
-:109D50001AF08BFDF8BD2A1CAC3212682301D21810
-:109D60001203120B301C23491AF04BFE2A1CA4329A
-:109D70001268A308D15C0322231C13405B00194125
-:109D80000B1C13407132022B23D0073A032B20D037
-:109D90002E22012B1DD12B1CAC331B682201D35862
-:109DA000154954228B4214D01449083A8B4210D0E2
-:109DB0001349083A8B420CD0124902328B4208D028
-:109DC0001149043A8B4204D010490B328B4200D027
-:109DD0001B32301C0E491AF014FE01348BE7C046CA
-:109DE000882E00203CD30200B5420300D04203007D
-:109DF00027430300EC42030070CF0200FCD10200B5
-:109E0000C4F60200A4CD020050F90200D0CF020037
-:109E1000AA290300F7B5061C194D0C1C281C17F0C5
-:109E200067FE311C174817F091FD174817F060FEC8
-:109E3000164817F05DFEFF239B00E61821787F2966
-:109E400016D0B44214D0627850290BD8104B114868
-:109E50005F5C114B5B5C0092A27801923A1C17F098
-:109E600075FD03E0A3780D4817F070FD0434E5E7B5
-:109E7000281C17F03DFE0A4817F03AFEF7BDC04611
-:109E8000F44203002143030029430300FF4303007E
-:109E9000BD7A03004A4303000E7B03006D430300B9
-:109EA0001D440300F0B51D1C89B006901B48161C0C
-:109EB000079117F01DFE291C194817F047FD194896
-:109EC00017F016FE184817F013FE0024AC4220DAF3
-:109ED000079BA0001818C778069BBC463F073F0F9A
-:109EE000195D82780378009707889B06FF047F0E30
-:109EF000019767463F090297006812090003400E68
-:109F00000390305D9B0E0490084817F01FFD01344C
-:109F1000DCE7024817F0ECFD09B0F0BDF4420300A5
-:109F20008E430300BB430300ED4303001F440300C3
-:109F3000074BDB68002B09D05A68904204D3801A83
-:109F400004308000C05802E01B68F3E7181C70471B
-:109F5000882E002038B5114D041CEB689868DB682A
-:109F600083420FD30230C0001BF070FAEB68DA684E
-:109F7000596803609B6852185B008360002342604D
-:109F8000C360E860E968CB6848685A1C04339B00EA
-:109F90000138CA6080185C5038BDC046882E002049
-:109FA000074B4118884205D25A01D3180278013074
-:109FB0005340F7E7D8B2002800D101307047C046BF
-:109FC00005150000034B044ADA6000228C331A6046
-:109FD0007047C046882E0020E0D80200F0B585B05A
-:109FE000071C0E1CFFF7DCFF164B0290DC68002CF0
-:109FF00024D0231C10330193E368019D04339B009C
-:10A00000E3180393039B9D4216D22868029A0378B3
-:10A0100093420FD14378B3420CD10230391C321C29
-:10A0200021F0A9F8002805D1019BE81A6368851082
-:10A03000E81804E00435E5E72468D8E7201C05B0FB
-:10A04000F0BDC046882E0020F0B585B00290019189
-:10A05000FFF7C4FF021E5BD12F4C019B271C8C37DE
-:10A060003868DD1C002819D0261C2C4B90361B6844
-:10A0700031680393EB188B4210D969181BF009FA69
-:10A080000390002807D1254B386819681BF0F4F9B4
-:10A09000039B3B6002E03368EB183360231C8C3376
-:10A0A0001B68002B17D12E1E7F2E00D88026301C57
-:10A0B000271C1BF0D8F98C373860002804D1281CE5
-:10A0C0001BF0C4F92E1C3860231C90331E60231C27
-:10A0D000002294331A60221C943213688C34246852
-:10A0E000ED1801990298E4181560FFF759FF6B46C7
-:10A0F0001B79207063700299019AA01C21F04AF824
-:10A100000022019B201CE3189A70FFF723FF021C1A
-:10A11000101C05B0F0BDC046882E00201C2F00206A
-:10A12000F7B51D1C161C0023071C03600B60336071
-:10A130002B60174B0091DC68002C24D0154B9C42FF
-:10A1400021D03B6801333B60E268009B94461B686A
-:10A15000009A019363441360221CE36810320433B5
-:10A160009B00E3189A4206D23168C81C02CA49789B
-:10A1700041183160F6E7201CFFF7A4FC2B68246827
-:10A1800018182860D8E733682A68D3182B60F7BD01
-:10A19000882E0020E0D802000C4B70B5DC68002C43
-:10A1A00013D00B4B9C4210D0261CE36810361D1DAB
-:10A1B000AD006519AE4206D204CE06490232064809
-:10A1C0001AF01FFCF6E72468E9E770BD882E00202E
-:10A1D000E0D80200474403003CD30200064B01399B
-:10A1E000C9B21970411880310B78044A1370044ABF
-:10A1F000D25C044B1A707047F92D0020FA2D002014
-:10A200004C5F0300FB2D0020064B0131C9B21970D1
-:10A21000411880310B78044A1370044AD25C044B15
-:10A220001A707047F92D0020FA2D00204C5F0300B2
-:10A23000FB2D0020074B984204D9074B18184118F2
-:10A24000064B03E0064B1818064B4118C91808784E
-:10A250007047C046A4920000D25F03005B6DFFFF11
-:10A26000916103000083FFFF031C20228033F0B5BF
-:10A270001A70CB4B1F3A1A70041C002389B0591C6A
-:10A28000E05C7F23CAB203406F2B01D95F2302E059
-:10A290005F2B01D94F230340A21880321370CBB239
-:10A2A0007F2BECD1BF4A1370231C1B22FF331A7083
-:10A2B000E432171C531CDBB203936B46B8491B7B7B
-:10A2C000B94D0B70039B2E1CE31880331B782B7049
-:10A2D0005B2B06D19B227B1CDBB20B702A70E254F5
-:10A2E0002DE02E2B11D10232D2B20A70A218803288
-:10A2F0001278AC480270AD48825CD20705D47A1C53
-:10A30000D7B22B70E355039AD4E7A64A1370A74A35
-:10A31000D05C820727D4002813D120220B782A7022
-:10A32000E31880331A707B1CDFB20F70782F01D8CE
-:10A33000E255E8E79B23E3556B461B7B3370012016
-:10A3400035E27F229043984A107003D1984A994B86
-:10A350001A602CE2413B984ADBB29849D25CCB5C54
-:10A360001202134300E0964B0593059B0093009B5C
-:10A37000002101339BB2181C0093FFF75BFF03061B
-:10A38000F5D5009B05930123029300980299FFF7EE
-:10A3900051FF029B0133DBB22828F5D1029D013524
-:10A3A000EBB20098191C0193FFF744FF019D292887
-:10A3B000F5D10135EBB2191C00980693FFF73AFF6F
-:10A3C0007F23069D18403D28F3D16A46764B127BC9
-:10A3D0001870734B039E1A70029B04965D1C714BA0
-:10A3E000EDB21D70A31980331B780098291C0793C8
-:10A3F000FFF720FF079B9842B7D10135019A731CE4
-:10A40000EDB2DBB2954202D01E1C0493EAE7644B26
-:10A41000039D1E706A46029B0098013BDBB20293CB
-:10A42000127A604B02991A70FFF704FF5E4E030622
-:10A4300000D590E07F225A4B18705C4B1B5C934315
-:10A44000337009D0564B013DEDB21D706319803356
-:10A450001B788342DED088E73070202812D0232872
-:10A4600019D02E281FD0262825D0402841D05E287C
-:10A4700049D02B2852D03A285FD0524A4D4B002069
-:10A480001A6094E1201C291CFFF7A8FE7F22337874
-:10A49000934340D069E7201C291CFFF79FFE3378C7
-:10A4A0005B0638D461E7201C291CFFF797FE337840
-:10A4B0001B0730D459E7201C291CFFF78FFE102200
-:10A4C00033781340337026D1354B1B78E118803137
-:10A4D00009783170482900D047E7013B3049DBB2A9
-:10A4E0000B70E31880331B789343432B00D03CE779
-:10A4F00011E0201C291CFFF771FE04233278134061
-:10A50000337008D131E7201C291CFFF767FE337830
-:10A510009B0600D429E7224B1D787BE7204B013DA9
-:10A52000EDB21D70651980352B78452BF3D01022C4
-:10A530009343492B00D018E7EDE7291C201CFFF7B7
-:10A540004DFE2023184A11780B40137000D161E7AB
-:10A55000134B1D78F1E7049D019B124E0133DBB2D2
-:10A5600001936B461B79069A3370019B934200D18D
-:10A5700005E1191C0098FFF75DFE7F22084B0A4E8B
-:10A5800018700A4B1B5C934333701DD0044B01358C
-:10A59000EDB21D70631980331B788342DCD0E4E692
-:10A5A000F92D0020FA2D0020FB2D00204C5F030028
-:10A5B000385F03001C0000201E5F0300B85F03002B
-:10A5C000A5920000425F0300307020286ED023283F
-:10A5D00075D02E287BD0262800D180E0402800D1DD
-:10A5E0009BE05E2800D1A2E02B2800D1AAE03A2807
-:10A5F00000D1B6E0252800D03FE76B1C6D4ADBB2E6
-:10A600001370E31880331B786B490B70452B37D1DF
-:10A61000A81CC0B2231880331B78684E3370684E74
-:10A62000F65CF60900D18AE010700B70522B00D155
-:10A6300085E0532B00D182E0442B00D17FE04C2BEE
-:10A6400008D10335EDB21570651980352B78592B7B
-:10A6500075D08AE6462B00D087E6EB1CDBB2137080
-:10A66000E31880331B780B70552B00D07DE6043542
-:10A67000EDB21570651980352B784C2B5FD074E6E0
-:10A68000492B00D071E6AB1CDBB21370E3188033AA
-:10A690001B780B704E2B00D067E60335EDB21570BA
-:10A6A000651980352B78472B49D05EE6201C291C84
-:10A6B000FFF7AAFD7F223378934340D055E6201C54
-:10A6C000291CFFF7A1FD33785B0638D44DE6201C2A
-:10A6D000291CFFF799FD33781B0730D445E6201C71
-:10A6E000291CFFF791FD102233781340337026D1D7
-:10A6F000304B1B78E118803109783170482900D03F
-:10A7000033E601332B49DBB20B70E31880331B783F
-:10A710009343432B00D028E611E0201C291CFFF7AF
-:10A7200073FD042332781340337008D11DE6201CDA
-:10A73000291CFFF769FD33789B0600D415E61D4BF5
-:10A740001D7809E71B4B0135EDB21D706519803589
-:10A750002B78452BF3D010229343492B00D004E6ED
-:10A76000EDE7291C201CFFF74FFD2023124A11782A
-:10A770000B40137000D1EFE60E4B1D78F1E7019D01
-:10A780000098291CFFF756FD7F2303403D2B02D084
-:10A790007A1CD7B2E3556A1CD2B2010605D5064A27
-:10A7A00035701370049B0393ADE5151CE8E709B001
-:10A7B000F0BDC046F92D0020FB2D0020FA2D002011
-:10A7C0004C5F030010B5041C081C1AF08EFC031C1F
-:10A7D000002C04D0012C07D14000204305E00348A1
-:10A7E000002B02DC024800E0002010BD5CC3020028
-:10A7F000A0C3020070B54568C668846810201AF0CE
-:10A8000025FE034B4560C6600360846070BDC04692
-:10A81000F8E4020038B50D1C041C6A680749AB68EF
-:10A820001AF0EFF8EA68201C012A03D104491AF053
-:10A830001CF802E003491AF0E4F838BD7D7103000A
-:10A84000CE2603008A71030030B5041C87B00020B7
-:10A85000042A30D1201C0D1C1AF047FC011CAB0748
-:10A860001DD1164B2A689A4219D1291C03AAFAF75E
-:10A8700031FF10201AF0EAFD114B039A0360E368E0
-:10A8800061685A4352184260049A111C594301925C
-:10A8900062688A188260059A5343C3600BE0002304
-:10A8A00020682A1CF6F7A0FAE36858436368C018CA
-:10A8B00001234000184307B030BDC046B0F202008B
-:10A8C000BCE40200F0B5067887B0B30702D5002AD1
-:10A8D00000D0F2E0F307DB0FDBB20293002B0ED0C7
-:10A8E000774B0B40062B0AD003230B4003D1754C4A
-:10A8F0000D68A54202D0012A01D0DEE00293019248
-:10A900000D1C041C730749D503688768DE08F60030
-:10A91000BE19B74211D23868A84204D1019B022B5C
-:10A9200000D0A1E09EE0029B002B04D1291CF6F789
-:10A9300031F90028F2D10837EBE7019B012B00D059
-:10A94000BBE02368D9086368994210D10431616083
-:10A95000A068C9001AF090FD23686268DB08D21A6B
-:10A96000DB00A060D200C018002120F030FC0722DC
-:10A970002068C308591CC90002400A432260A2682B
-:10A98000DB004F49D3181D60181C0D40062D00D167
-:10A9900094E0012122788A4322708FE04368002BE3
-:10A9A00005D1019B012B00D087E000F08DF8444BCE
-:10A9B0002B400493062B04D1E8081AF066FB0390A1
-:10A9C00005E00220291CFCF7F7FC431003930398D1
-:10A9D00061680FF095F8002600910591009BDF005B
-:10A9E000A368DF19386800281AD1019B311C012B9C
-:10A9F00063D12068C3080133DA00072303401343FF
-:10AA00002360002E00D1391C00234B60049B0D6095
-:10AA1000081C062B52D001222378934323704DE06B
-:10AA2000042803D1002E21D13E1C1FE0A84203D1EF
-:10AA3000019B022B18D108E0029B002B16D1291C88
-:10AA4000F6F7A8F8002811D0F2E723686168083B00
-:10AA50002360009801300FF053F8A368C900CB5869
-:10AA6000002B00D004233B60381C27E0009861686D
-:10AA700001300FF045F8059A00919142AED1019B4B
-:10AA8000012B1AD1002E0ED0236808332360002337
-:10AA90007360049B3560062B03D02378019A93439F
-:10AAA0002370301C0AE0201C00F00EF80398616847
-:10AAB0000FF026F80091059190E7002007B0F0BD57
-:10AAC000070080FF40EC0200F7B54368041C0193C7
-:10AAD000591C0023174A9A588A4205D204335C2B2A
-:10AAE000F8D101250D4300E0151CE800A7681AF015
-:10AAF000BFFC072322686560134001223D1C00262D
-:10AB0000236013432370A060019B9E420DD02968EF
-:10AB1000002907D0042905D0201C0122FFF7D2FE0E
-:10AB20006B68436001360835EEE7381C1AF0B5FC57
-:10AB3000F7BDC04634E502000022F8B50768051CE1
-:10AB40008668781C114BD358834205D204325C2AA4
-:10AB5000F8D10123184300E0181C002428606C6021
-:10AB600080001AF085FCA860BC420BD0A300F1580D
-:10AB7000002905D0042903D0281C01221AF044FB27
-:10AB80000134F1E7301C1AF088FCF8BD34E502000E
-:10AB9000F8B50D1C061C141CF9F7DEF82B1C032756
-:10ABA00033433B420BD1BC4209D9A208301C291CBB
-:10ABB0000EF002FB231CBB43F618ED183C40002CA2
-:10ABC00004D0301C291C221C20F024F98023044AC4
-:10ABD000DB00D358002BF9D0F9F7AEF8F8BDC0462A
-:10ABE00000E001400F22114008B5031C081E032895
-:10ABF0000ED80EF0E1FE0204090D181C0BE0064809
-:10AC0000002B08D1054806E0181C1CF0EFFF02E0FD
-:10AC1000181C1DF006F808BD5CC30200A0C30200AA
-:10AC2000F0B5836999B05A1E04925A1D9200821899
-:10AC30000432079102920F21012206339B00C318B0
-:10AC4000043303930369019006A81A4009180A7097
-:10AC5000032293430A930CA8F5F7C2FA031E01D00E
-:10AC600000F08CFD019A5568D468079A002A26D016
-:10AC70002A785E2A23D00798079300F0BEFCAB78B1
-:10AC80006A781B021343B84AEB189B186360EB7891
-:10AC90000834236023685A0600D1B1E20A9A013BC6
-:10ACA0005268920700D49FE2221C08C20523636009
-:10ACB000141C0A9B1F680A9B0C3B0A933D1C019BBA
-:10ACC0006F1C5D602B78181C10385A2801D900F0D1
-:10ACD00005FD0EF07BFE5B005D0062000305640075
-:10ACE0000305730081008700030589009E00AF0003
-:10ACF000BE00CD00DB00EA00EF00F70005011901FE
-:10AD00002901380155015E01710189019601030590
-:10AD1000030503050305A301A5011A05AC01B20152
-:10AD2000BC01C401D101DE01E901030503050305EE
-:10AD3000F90126029C029C02B902CF02D302E6026C
-:10AD4000E602D4FF03050305030503050305030518
-:10AD5000030503050305F202040315032603340368
-:10AD60003D03520363037B039703A9035404800448
-:10AD7000A70495040305C003CC03D703E003F00345
-:10AD80000B0420043C04DE04EE04FE04774B00E0D8
-:10AD9000774B6360043400F0E5FC764BF9E76B78A1
-:10ADA0005B06DB177F213A78DB01114052B20B437F
-:10ADB0000137002AF6DB5B0001220BE000237F2134
-:10ADC0003A78DB01114052B2CB180137002AF6DB8A
-:10ADD0000622DB001343DCE70323FD1C9D432F1CED
-:10ADE00008CFD6E70023D4E700237F213A78DB01A0
-:10ADF000114052B2CB180137002AF6DB9B005B42B0
-:10AE0000029A9858002800D049E25B485B4900F05C
-:10AE10005CFD00237F213A78DB01114052B2CB1850
-:10AE20000137002AF6DB029A9B005B42985818F023
-:10AE30001FFBE7E700207F223B78C0011A405BB28E
-:10AE400010180137002BF6DB251DFCF759FA00F02E
-:10AE50003EFC00207F223B78C0011A405BB21018F4
-:10AE60000137002BF6DB251DFCF718FA00F02FFC4C
-:10AE700000217F223B78C9011A405BB2511801378B
-:10AE8000002BF6DB206819F0B7FF26E200217F22B5
-:10AE90003B78C9011A405BB251180137002BF6DB31
-:10AEA0002068221CFCF7A0FB74E7251DFCF740FA84
-:10AEB00000F00DFC251F286821680422F6F748F8E9
-:10AEC00000F036FC00237F213A78DB01114052B2BA
-:10AED000CB180137002AF6DB9B005B4200F012FC26
-:10AEE00000237F213A78DB01114052B2CB180137A1
-:10AEF000002AF6DB029A9B005B4298582168251FC6
-:10AF000018F0B8FA00F015FC00207F223B78C00151
-:10AF10001A405BB210180137002BF6DB2168251FA1
-:10AF2000FCF71AFA00F005FC00207F223B78C001F4
-:10AF30001A405BB210180137002BF6DB2168251F81
-:10AF4000FCF722FAF5E300217F223B78C9011A4081
-:10AF50005BB251180137002BF6DB231F20681A68FB
-:10AF6000FCF76AFB07E2C0460380FFFFA0C30200B4
-:10AF700094BA02005CC30200C4E7020090710300AF
-:10AF8000231C221F083B106821681A68F5F7E0FFB0
-:10AF90003BE100237F213A78DB01114052B2CB180C
-:10AFA0000137002AF6DB029A9B00D31A1A68002A9E
-:10AFB00000D12AE700223EE000257F223B78ED0108
-:10AFC0001A405BB255190137002BF6DB029BAD002E
-:10AFD0005D1B286818F04CFA002800D115E7286896
-:10AFE000002118F047FABDE300207F223B78C00122
-:10AFF0001A405BB210180137002BF6DBFCF7B8F9EA
-:10B00000B0E300207F223B78C0011A405BB21018E9
-:10B010000137002BF6DBFCF7C3F9A3E32368B8E69E
-:10B020002368A360231F1B68636008349AE3231F0F
-:10B030001968226821601A6094E3221F136821684E
-:10B040002360231C083B1868106019608AE3AB7802
-:10B050006A781B021343ED18D94BEF1882E3AB78E3
-:10B0600020686E780593F5F727FFEF1C251F2C1C31
-:10B07000002800D176E321E0AB7820686E78059354
-:10B08000F5F71AFFEF1C251F2C1C002800D069E3E0
-:10B0900014E0AB7820686E780593EF1CF5F70CFF91
-:10B0A000002800D131E309E0AB7820686E78059381
-:10B0B000EF1CF5F701FF002800D026E3059B1B02DB
-:10B0C0001E43C04BF618E8E0261C27681721381CE1
-:10B0D000221C0836FCF788FA381C1621321CFCF7B3
-:10B0E00083FA0020321C011C19F078FEAB786A78D4
-:10B0F0001B0213430A9A0F210C320A920A9AEF1C80
-:10B10000FB181360022206ABC9180A9D0B78134383
-:10B11000221D13436B6000230A9A0B709360A0609A
-:10B120000DE0261C2568A84B083E9D4209D16560AC
-:10B13000A56003200021321C19F050FE3560341C3C
-:10B1400010E3012129402CD06D10231F012D10D1B7
-:10B15000251C1A680C3D05929B4A03201A600021A9
-:10B16000226062602A1C19F039FE059B2B600323C4
-:10B1700015E0251C3268103D05921A6803200692DE
-:10B18000914A002132601A6022602A1C19F026FEC2
-:10B19000059B069A2B60231C0C3B1A600523336029
-:10B1A000E9E033683560251C103D23602A1C03202C
-:10B1B00019F014FEF5F780FE00280DD00122824B15
-:10B1C00006A92B600A9B5B6813400E32521813705D
-:10B1D0000A9B0C3B0A93ACE223682B60231C043CC3
-:10B1E00022680C3B1A60AAE70A9A06A85168012255
-:10B1F0000A400F2109180A700A9A0C3A0A924AE585
-:10B20000221F1768002B00D1B5E00C3CAAE2AB78F6
-:10B210006A781B0213430A9AEF1C0C320A920A9AAC
-:10B22000FB1813602B780A9A403B584258410F2173
-:10B23000430006A8091808780343234353600023FA
-:10B240000A9A0B7093608DE2206800F087FD251F3D
-:10B25000002803D0F4F7DAFF2B6817E223685A4A74
-:10B260002C1C934200D17DE25B10DBB2012B00D09D
-:10B2700010E592E12068FCF703FA2EE0AB786E78D7
-:10B280000593019BEF1CDC602068FCF721FA002885
-:10B2900005D1059B043C1B021E43BF1962E260609E
-:10B2A00078E50A9B06A95A68012313400F22521819
-:10B2B00013700A9B0C3B0A9354E200207F223B78D8
-:10B2C000C0011A405BB210180137002BF6DB830077
-:10B2D000E41A0434211CFAF7E5F8206042E2002069
-:10B2E0007F223B78C0011A405BB210180137002B57
-:10B2F000F6DB8300E41A0434211C18F017FCECE799
-:10B3000000237F213A78DB01114052B2CB1801377C
-:10B31000002AF6DB9B005B4218592168FAF792FC81
-:10B32000F3E100207F223B78C0011A405BB2101885
-:10B330000137002BF6DB251D1BF02AFEC7E1251C7B
-:10B34000231F083D286821681A681BF05AFEF0E1A7
-:10B3500000237F213A78DB01114052B2CB1801372C
-:10B36000002AF6DB01339B005B42221F185921683B
-:10B3700012681BF046FE083CF4E100207F223B7877
-:10B38000C0011A405BB210180137002BF6DB8300B6
-:10B39000E41A0434211C06F0D5FB9EE700237F212C
-:10B3A0003A78DB01114052B2CB180137002AF6DBA4
-:10B3B0009B005B42185921681CF0F7FCA5E1C046D0
-:10B3C0000380FFFF0080FFFF94BA020000237F216B
-:10B3D0003A78DB01114052B2CB180137002AF6DB74
-:10B3E000251F022B05D128682168D34A02F01AF9DB
-:10B3F0009EE1261C083E30682968226802F012F996
-:10B4000030609CE600257F223B78ED011A405BB25C
-:10B4100055190137002BF6DB291C2068221CFCF78C
-:10B42000A1FCC64BED1813E000257F223B78ED010F
-:10B430001A405BB255190137002BF6DB291C221C80
-:10B440002068FCF7E7FCFF232A0A1A401D40551923
-:10B45000AD00641986E103230021FD1C9D4328688B
-:10B460000A1C19F000FD2F1D261D606067E60323EE
-:10B47000FD1C9D43261F2868316822682F1D19F086
-:10B48000F2FCBDE70323FD1C9D4329796F1D8B0052
-:10B49000E41A04340AE00323FD1C9D4329796F1D3F
-:10B4A000CB439B00E41880235B0019432868221CCF
-:10B4B00019F0F4FC11E700237F203978DB01084004
-:10B4C00049B2C31801370029F6DBFF20FF22191CFF
-:10B4D000DD0940001140284040188000241A1B0A52
-:10B4E0001A402068231DFBF7D1FFF6E600217F22DA
-:10B4F0003B78C9011A405BB251180137002BF6DBCB
-:10B50000FF23CA095B001340CAB29B189B00E41AD0
-:10B51000083C00202FE000237F203A78DB01104018
-:10B5200052B2C3180137002AF6DBFF25181CFF2290
-:10B53000DE09284052003240411C891889001B0A4C
-:10B54000641A2B40191C221C19F048FCC5E6002186
-:10B550007F223B78C9011A405BB251180137002B9A
-:10B56000F6DBFF230120CA095B001340CAB29B1817
-:10B570009B00E41A0C3C221CFCF7CCFAADE60F222F
-:10B5800006ABD2181378002B07D00A9B5968012309
-:10B590000B4013700A9B0C3B0A930A9B039A93423D
-:10B5A00013D30A9B5B689B07F4D503220A9B21688F
-:10B5B0005B6893431C1C59609A600A9B08341F689F
-:10B5C0000A9B0C3B0A93FFF779FBF4F71FFE019BE4
-:10B5D0000020DC607DE16B78022B01D1043C0BE0A4
-:10B5E000002B09D10A9B039A934200D26BE1986821
-:10B5F000002802D10C3BF6E72068FCF709FD66E164
-:10B60000079E2168231F002E02D00021079E07916C
-:10B610001868321C0BABFCF78DFC012811D12F1CD4
-:10B620000B9B2360F4F7F2FD019B06A95F60DC60D1
-:10B630000F235B180A9A1B7801201343019A1361A8
-:10B6400047E1002806D10B9B043C002B00D13A4B6C
-:10B6500023600CE002281BD10B98394919F0CCFE6D
-:10B66000002810D00B9800F011FB043C2060002E45
-:10B6700078D0301C334919F0BFFE002872D0F4F79F
-:10B68000C5FD0D967AE0F4F7C1FD0B9B0D9375E0B7
-:10B69000043C00207F223B78C0011A405BB21018A6
-:10B6A0000137002BF6DB251F21682A68FCF7CEFC4A
-:10B6B0003EE000217F223B78C9011A405BB251185D
-:10B6C0000137002BF6DB251C01CDFCF7D1FC6060B7
-:10B6D0002FE02068251F19F09AFB2AE0AF2B05D830
-:10B6E0000120803B5B000343FFF753FBBF2B04D8D3
-:10B6F000B020C31A9B00FFF783FBCF2B07D8C020D5
-:10B70000C31A9B00029A21689950043C2AE0D62B68
-:10B7100005D8D03B181C2168FBF74EFEDDE5FA2B5F
-:10B7200012D8251FD73B181C29682268FCF736F869
-:10B7300028602C1C16E0C04694BA0200FFFFFF3FB1
-:10B7400084E802007CEB02006349644819F04AFE79
-:10B75000041CF4F75BFD049B019A06339B00D3188D
-:10B760005C60AEE05E4B1A6B002A01D1FFF7A6FACF
-:10B7700000221C6B1A63F4F749FD0D940D9B594987
-:10B780001868F6F7D9FD002825D0019B5A68002AD1
-:10B7900021D01378432B0BD19378D11C52781B0204
-:10B7A0001343019ACB185360D3680593043B7EE0A2
-:10B7B0005E2B10D1019B019ADC680D98231DD3608C
-:10B7C00000F064FA019B60605B68019A05930133A5
-:10B7D0005360FFF740FA0D9B434A93423CD0434AE3
-:10B7E000934239D0019B0BA81B6805930B9319F06A
-:10B7F0007EFB051C0BA819F07AFB041C0BA819F0A2
-:10B8000076FB019B011C5B680593019B1B680693FB
-:10B81000069A059B981A0122401B0B9D2B78002B42
-:10B8200012D0DE0904D11F361E4001355B0908E045
-:10B830000F26E0271E40FF001B011F406B780235DA
-:10B840003B430B95B04204D20D98231C00F0ACFA98
-:10B8500002E0801BD218E0E70F2306AA9B181A7893
-:10B86000002A08D00A9A516801220A401A700A9BDD
-:10B870000C3B0A93F0E70A9A03998A421AD30122F1
-:10B880001A700A9B0D991B680593059A019B0591F7
-:10B890005A6003220A9B5B6893430A9A9160144A98
-:10B8A0005A600D9A9A6012680C331A60019AD3603C
-:10B8B000FFF7D1F9049B019A06339B00D3180D9A28
-:10B8C0005A60022005E00B480B4919F08BFD041C5F
-:10B8D00051E719B0F0BDC046BC71030070EA020028
-:10B8E000882E002084E8020094E60200F4EB0200B7
-:10B8F00094BA020014E60200D6710300F8B50327DB
-:10B90000041C381C0E1C5043151C15F0D9FB0121DA
-:10B91000331CA022B140C133FF33D2059B006060CD
-:10B92000267065809F50094BD1500022AA420CDA44
-:10B9300003230021534360680132C1546068C0187A
-:10B9400041706068C3189970F0E7F8BD0C050000FD
-:10B950000122F0B50378A0219A40131C894AC90539
-:10B96000051C85B08B5032200138C046C046C04609
-:10B97000C046C046C046C046C046C046C046C04697
-:10B98000C046F1D1EFF31081019172B600206988B1
-:10B9900002910299884200DB07E1032141436C6870
-:10B9A0006118CC1C0394A024A1260F78E405FF099C
-:10B9B000F600002F0BD0A351C046C046C046C0467B
-:10B9C000C046C046C046C046C046A3500AE0A35188
-:10B9D000C046A350C046C046C046C046C046C0464A
-:10B9E000C046C0460C78A127A446A0246646E405BC
-:10B9F000FF00E35176060AD5C046C046C046C046A1
-:10BA0000C046C046C046C046C046A35009E0C04636
-:10BA1000A350C046C046C046C046C046C046C04609
-:10BA2000C0460C78A127A446A0246646E405FF0082
-:10BA3000E351B6060AD5C046C046C046C046C04619
-:10BA4000C046C046C046C046A35009E0C046A35009
-:10BA5000C046C046C046C046C046C046C046C046B6
-:10BA60000C78A127A446A0246646E405FF00E35114
-:10BA7000F6060AD5C046C046C046C046C046C046C7
-:10BA8000C046C046C046A35009E0C046A350C046C9
-:10BA9000C046C046C046C046C046C046C0460C78F8
-:10BAA000A127A446A0246646E405FF00E35136071B
-:10BAB0000AD5C046C046C046C046C046C046C0467D
-:10BAC000C046C046A35009E0C046A350C046C04689
-:10BAD000C046C046C046C046C046C0460C78A127F6
-:10BAE000A446A0246646E405FF00E35176070AD584
-:10BAF000C046C046C046C046C046C046C046C04616
-:10BB0000C046A35009E0C046A350C046C046C04648
-:10BB1000C046C046C046C046C0460C78A127A446D1
-:10BB2000A0246646E405FF00E351B6070AD5C046E7
-:10BB3000C046C046C046C046C046C046C046C046D5
-:10BB4000A35009E0C046A350C046C046C046C04608
-:10BB5000C046C046C046C0460C78A127A446A024D3
-:10BB60006646E405FF00E351F6070DD5C046C04622
-:10BB7000C046C046C046C046C046C046C046A350A8
-:10BB80000CE0C0460C050000C046A350C046C046AD
-:10BB9000C046C046C046C046C046C046039C0131B0
-:10BBA000A14200D0FFE60130F3E6019B83F3108849
-:10BBB00005B0F0BDF7B51F1C0023061C0093081C40
-:10BBC0000D1C111C1A1C0B4BF8F7FEFC102019F071
-:10BBD0004AFC041E04D1084A084B094CDA6104E00F
-:10BBE000281C391CF9F75EFCE06000232660201C4D
-:10BBF000A360FEBDFFFF0000ACCF0200882E002036
-:10BC0000982E002010B5013810C9F9F74BFCE06000
-:10BC1000004810BD94BA0200F8B57F23171C151C0C
-:10BC2000041C0E1C1F409A430AD17B1E012B07D80F
-:10BC30000B68586819F033FA011C201C18F015FE27
-:10BC4000022F04D1201C0F4918F00FFE01E0002F35
-:10BC500012D1F368002B02D05A68002A04D1201CAC
-:10BC6000094918F002FE0CE0012A05D1201C996850
-:10BC70000022F4F711FF04E0201CF1682A1CF9F7F8
-:10BC8000A5FBF8BD43280300402F0300C368034809
-:10BC90005A68002A00D098687047C04694BA0200DB
-:10BCA000136810B5002B0ED17D2902D1C368136033
-:10BCB00009E0054B04689C4205D1BA2903D1141C44
-:10BCC000FFF7E4FF206010BD84E802000EB470B5F9
-:10BCD000051C87B0102019F0C6FB041E06D11B4BB3
-:10BCE0001B4A1D619861DA611A4C29E00021056048
-:10BCF00081600120F9F7D6FB0B9B051CE060002B4F
-:10BD00001ED0181C25211FF04FFB061E08D10B98D2
-:10BD10001FF062FB321C011C0B98F6F78FFC0EE043
-:10BD200002A810211AF0E1FE0CAA02A80B990192B8
-:10BD300003F08CFC084802A9E568F6F749FCA86006
-:10BD4000201C07B070BC08BC03B01847882E002028
-:10BD5000ACCF0200982E002040EC020008B5031C76
-:10BD6000820708D1064A0168914204D1054AD96880
-:10BD70000120914203D0181C0349F6F7DDFA08BDF3
-:10BD8000A4BE0200B5BB000044E9020010B5041CCB
-:10BD9000F4F768FE034BC2689A4200D0246900237E
-:10BDA000A36010BDB5BB0000F7B5161C0193041CC1
-:10BDB0000F1CF4F757FE174BC2689A4200D0246953
-:10BDC000A568002D09D10C2019F04DFBA0600028BA
-:10BDD0001ED00323E580A38010E0E388A18802330E
-:10BDE0008B420BDB03318900281C012219F051FB27
-:10BDF00000280DD0A388A0600333A380E288A16847
-:10BE000093000332E280019ACB181F605E609A6053
-:10BE1000F7BDC046B5BB000070B5151C041C0E1C58
-:10BE2000F4F720FE064BC2689A4200D02469A3684A
-:10BE3000002B01D1336001E0E28832602B6070BDDD
-:10BE4000B5BB000010B5041C102019F0FFFA044B1C
-:10BE500084600360034B43600023C36010BDC04691
-:10BE6000D8C302001954020013B5041C081C01A910
-:10BE7000F6F722FC002C07D0012C0BD1019916F00B
-:10BE800006FE4000204306E0019B0348002B02D140
-:10BE9000024800E0002016BD5CC30200A0C30200FF
-:10BEA000F0B585B0041C081C03A9151CF6F704FCAA
-:10BEB000061C002D06D1201C3549039A331C18F0AE
-:10BEC000A0FD63E0011C0022039BC3180093009BAC
-:10BED00099420ED20B78272B04D0223B5842434183
-:10BEE000DBB201E0002301220131002BEFD0272734
-:10BEF00003E02727002A00D0053F264D201C291CDF
-:10BF00003A1C18F07EFD0195009B9E4239D2301CF0
-:10BF100016F08CFD051C301C16F0A3FD061CBD425E
-:10BF200003D1201C1C493A1C28E05C2D02D1201CA6
-:10BF30001A4914E02B1C203B5E2B02D8201C0199CF
-:10BF40001BE00A2D02D1201C154908E00D2D02D15D
-:10BF5000201C144903E0092D04D1201C124918F0BB
-:10BF600084FCD1E7FF2D02D8201C104905E0104BBE
-:10BF7000201C10499D4200D90F492A1C18F041FD90
-:10BF8000C2E7201C01993A1C18F03BFD05B0F0BD3A
-:10BF9000862A0300AA290300A9290300AD2903006A
-:10BFA000B0290300B3290300B6290300B92903000F
-:10BFB000FFFF0000F5710300FC710300F7B51F1CC3
-:10BFC00008AB0C1C161C1D78FB0702D57F100197CF
-:10BFD0000EE0381C01A9F4F76DFE002808D1381CCA
-:10BFE00016F081FD1B49021C1B48FFF76FFE0DE098
-:10BFF000019BA019002B17DA0138A04208D2019347
-:10C00000002D25D115481649FFF760FEF4F703F916
-:10C010003F21027801388A43803A511E8A419B1899
-:10C02000002BEAD1013014E0002B11D0844203D35D
-:10C030000193002D0DD1E5E73F2122788A43802A24
-:10C0400001D10134F8E7002B02D00134013BEDE7C8
-:10C05000201CFEBD03720300C8EA020034E70200A0
-:10C060002B720300F0B587B0061C0D1C171CF4F7EB
-:10C07000F9FC02A9041C301CF6F71EFB061C042F59
-:10C080004FD1AB0735D1284B2A689A4231D105AB45
-:10C09000281C03A904AA19F030FC059B234FBB42BE
-:10C0A00004D0032B02D02248FCF798F8039B351CE0
-:10C0B000BB4207D00122201C0092311C029AFFF7DC
-:10C0C0007DFF051C049BBB4208D00122201C00926E
-:10C0D000311C029AFFF772FF021C01E0029BF2186A
-:10C0E0000E20AA421ED3521B201C291C16F041FF11
-:10C0F00018E00023311C0093029A2B1C201CFFF730
-:10C100005DFF0278012153B2002B06DA40230121A2
-:10C110001A4202D001315B08FAE70122F6F78EFAE3
-:10C1200000E0002007B0F0BDB0F2020094BA0200B7
-:10C130003B2A0300F7B51F1C13780E1C0A3BD9B22B
-:10C14000051C1F480F2904D850781B02184318F00B
-:10C15000A6FF1524037801931A4B01331522121BF5
-:10C1600000921978019A91421CD1427859788A42FA
-:10C1700018D182789978914214D100290FD1009B6F
-:10C180009A00104BD45CBC4217D93B1C0E480F4997
-:10C19000321CFFF79BFDAB68002418600DE0C178EE
-:10C1A0000029ECD0013C0433002CD7D106480849C3
-:10C1B000321CFFF78BFDAB681860201CFEBDC0462B
-:10C1C000402F03004074030040EB0200AB720300F9
-:10C1D000C4720300F0B5177885B0051C0E1C992FAA
-:10C1E00047D1101C01A918F097FD019B021E9A422D
-:10C1F0003FD00378191C0A390F2908D80F23281CAF
-:10C20000311CFFF797FF01238340181C39E0AE2B48
-:10C210002FD118F07CFD041C18F074FD02900378F7
-:10C22000B22B26D1221CA33B311C281CFFF782FF16
-:10C23000012403A98440029818F06EFD039B02902C
-:10C24000984203D002A8391C18F075FD029A039B8E
-:10C250009A420CD0311C0F23281CFFF76BFF0123DF
-:10C26000834002981C4318F04DFD0290EEE7201C1D
-:10C2700007E005480549321CFFF728FDAB68186048
-:10C28000002005B0F0BDC04640EB0200DC720300A8
-:10C29000F0B585B0041C0D1C101C03A91E1C18F061
-:10C2A00017FD071E08D10E480E492A1CFFF70EFD88
-:10C2B000A36818603B1C0FE00398F4F7E9FC021C2C
-:10C2C000031CB24308D00096054807492A1CFFF713
-:10C2D000FDFCA36818600023181C05B0F0BDC04623
-:10C2E00040EB0200F77203000F73030038B51378B8
-:10C2F0000D1C0A3BD9B2041C0F2908D92A1C12486C
-:10C300001249FFF7E3FCA368002518601AE0527891
-:10C310001B021343C2680020904208D025698100A7
-:10C320004959994201D1051C0CE00130F4E72288FB
-:10C330000025042A06D11A1C03480549FFF7C6FC4C
-:10C34000A3681860281C38BD40EB02003B73030053
-:10C3500050730300F0B587B0041C0F1C081C04A91F
-:10C360001E1C019218F0A0FE019B051C002B13D18E
-:10C37000322F03D1BF2160690902EAE1482F08D0BA
-:10C38000019BBE48BE492A1CFFF7A0FCA3681860A9
-:10C39000E1E16069BB49DCE1019B012B00D08BE04E
-:10C3A000412F09D1291C201C3268FFF79FFF011C77
-:10C3B000606917F063FA0AE0422F12D1291C201C91
-:10C3C0003268FFF793FF011C606917F0AEFA00288E
-:10C3D00000D0C0E1A948AC49A46819F003F8206076
-:10C3E000B9E1432F09D1291C201C32680F23FFF724
-:10C3F000A1FE8E21C000C901A9E10378622B33D1CF
-:10C40000049B032B07D0052B2ED1C3785F2B2BD198
-:10C4100003796E2B28D101279C4A6978531C7F42EF
-:10C420002B321878884206D1A878844658788445FB
-:10C4300001D1581E077803339342F2D17B1C9FD061
-:10C440003268201C291CFFF751FF049B021C0026A8
-:10C450006069052B03D12B79773B5E425E41331C2B
-:10C46000391C17F027FAB2E7462F02D160698849D4
-:10C470006FE1472F02D1606986496AE1442F0BD1F1
-:10C48000291C201C3268FFF7A5FEFF231B02B421E4
-:10C49000184200D074E70DE0452F00D070E7201C53
-:10C4A000291C3268FFF796FEFF231B02184200D0BA
-:10C4B00066E7BC2109024AE1019B022B00D0D4E0CF
-:10C4C00073681B780A3B0F2B49D8332F12D1291CD4
-:10C4D0003268201C0F23FFF72DFE291C071C7268F1
-:10C4E000201C0F23FFF726FE391C021C606917F081
-:10C4F000B0F930E100230293342F1BD18027FF01D4
-:10C50000291C3268201C0723FFF714FE291C019008
-:10C510007268201C0723FFF70DFE391C031C019ACB
-:10C52000606917F08FF916E1029B013302930F2B1C
-:10C5300000D125E7029B281C9F00574B791C5918F6
-:10C5400003221EF050FF0028EED1EB78002BEBD138
-:10C55000514BFF5C80233F01DB011F43D0E7332FAA
-:10C5600001D1802702E0352F13D1A027291C326882
-:10C570000723201CFFF7DEFD291C0190FF23201C50
-:10C580007268FFF785FE019BBF010743190239431B
-:10C59000DEE0362F01D1C027E8E7372F01D1E027B1
-:10C5A000E4E700233D4A990050184088874258D15B
-:10C5B0008B5A201C029332680723291CFFF7BAFD0F
-:10C5C000766803903378982B28D1301C18F0DFFB65
-:10C5D000002823D1301C18F09AFB03789A2B1DD128
-:10C5E00005A918F099FB0599071C18F07FFB022894
-:10C5F00014D1381C18F086FB3A1C0723061C291C92
-:10C60000201CFFF797FD029B071CDB040ED5201CA6
-:10C61000291C321C1F23FFF73BFE17E01748204957
-:10C620002A1CFFF753FBA3681860A9E6029B201C95
-:10C63000DB0B291C321C002B04D03E23FFF728FE05
-:10C64000400803E07C23FFF723FE80080399029B48
-:10C65000FF0019430F43F8218001C9000840391C2D
-:10C6600075E00133062B9DD18AE6019B032B00D098
-:10C6700086E6382F16D1002718E0C04640EB0200AE
-:10C680006773030030BF0000C773030081720300AB
-:10C6900072B6000062B6000045720300A6230300D4
-:10C6A0009C730300392F1DD180273F01291C32685C
-:10C6B0000723201CFFF73EFD291C01907268072309
-:10C6C000201CFFF737FD291C02901F23201CB26895
-:10C6D000FFF7DEFD0199029B394380010143DB0036
-:10C6E000194335E03A2F02D180277F01DEE7362F4C
-:10C6F00001D1C02703E0372F00D041E6D027291C05
-:10C7000032680723201CFFF715FD7268019007238C
-:10C71000201C291CFFF70EFDB2687F0113780290E0
-:10C720000A3B0F2B05D8201C291C0723FFF702FD0D
-:10C7300007E08023DB001F43201C291C0723FFF791
-:10C74000A7FD029B8001D900019B19433943014396
-:10C75000606917F040F807B0F0BDC046F7B5061C99
-:10C760000D1C00240192019B9D4228D0631C009364
-:10C77000052B03D1B4681348134907E028780A3819
-:10C78000C3B20F2B07D9B4680E48104918F02AFE1F
-:10C790002060002014E06B780002184318F07FFC42
-:10C7A0000235071C1EF018FE0228ECD13B78722BD4
-:10C7B000E9D17B783034A342E5D1009CD3E7201C3B
-:10C7C000FEBDC04640EB0200DB7303000E740300A5
-:10C7D000F0B5071C443787B0041C381C01910026B3
-:10C7E0001AF0B8F92069431C18D00A2804D1201C7B
-:10C7F00018F03FFF0126F5E7F3F7ACFF002823D13F
-:10C800002369232B08D1201C18F033FF23695A1CFD
-:10C81000E8D00A2BF7D1E5E75C2B07D0E369256A5E
-:10C82000019AA363E563002A12D117E0201C18F0D7
-:10C8300020FF23690A2B07D0E369A363236AE3631C
-:10C84000042340342370F9E2201C18F012FFC9E7DA
-:10C85000012B03D10622012D00D07AE1636A002B5F
-:10C8600004DA221C0721403211702FE0002B06D081
-:10C87000221C062140321170013B6362B8E1002E98
-:10C8800039D0A36A002B36D1211C052240310A7011
-:10C890006362226BBA4B606BD3185B001B5A013D7D
-:10C8A0009D4200D1A4E113D9E16A8A4207D308313D
-:10C8B000490018F0E1FDE36A60630833E362236B2B
-:10C8C0005A1C2263626B5B009D52636A0133D4E79A
-:10C8D000236BAB4A9A185200125A954205D2013B7B
-:10C8E0002363636A013B6362F2E7954200D17FE113
-:10C8F00002230B707CE12069431C1BD1A04A236BEF
-:10C90000616B9B185B005A5A231C4033002A00D1EC
-:10C9100021E105221A7000236362994A236B9A1859
-:10C920005200525A002A00D162E1013B2363636A3C
-:10C93000013BF1E7272800D17EE1222800D17BE1ED
-:10C94000752804D01023021C9A43622A04D163691B
-:10C95000272B11D0222B0FD0722803D16369622BB1
-:10C960002ED104E062282BD16369722B28D1A369F0
-:10C97000272B01D0222B23D1752803D1201C18F09E
-:10C9800078FE59E162280ED1201C18F072FE0023B7
-:10C9900001932369722B00D048E1201C18F069FE36
-:10C9A0000123019342E100230193722800D045E165
-:10C9B000201C18F05EFE2369622BEED001233CE1BF
-:10C9C000F3F7D4FE2169002803D15F2901D07F2924
-:10C9D0001ED9231C082240331A70C9B2381C1AF021
-:10C9E00011F9201C18F045FE2069431C00D1FFE01E
-:10C9F000F3F7BCFE002801D0217CEFE720695F2817
-:10CA0000FAD07F28F8D8F3F7BDFE0028F4D1EFE084
-:10CA1000081CF3F7B7FE002808D0251C2169403513
-:10CA20002E290CD10A2300262B7035E023692E2BEA
-:10CA300052D16069F3F7A6FE0028EED14CE009233D
-:10CA400000262B70302927D1626917331343012246
-:10CA5000161C622B20D06F2B1ED0783B5E425E41AD
-:10CA60001AE02069431C00D1C2E0002E1BD1202314
-:10CA7000021C9A43131E452B15D13B3B2B7065219D
-:10CA8000381C02F08FFD201C18F0F3FD21690222F2
-:10CA90000B1C2B3B9343E4D1381C02F083FD201C7C
-:10CAA00018F0E7FDDDE7F3F761FE002803D0216908
-:10CAB0002E2909D10DE02069F3F764FE0028F6D194
-:10CAC00023692E2BF3D093E020230A1C9A434A2A91
-:10CAD000E2D10A232B70DFE721692E291FD1261C02
-:10CAE000381C02F05FFD201C18F0C3FD236940369E
-:10CAF0002E2B00D093E165692E2D00D08FE1381CDC
-:10CB0000291C02F04FFD291C381C02F04BFD201C93
-:10CB100018F0AFFD201C18F0ACFD0D2380E10026BD
-:10CB2000184D2F78002F0ED0B9420CD03B1CFD20A1
-:10CB3000633B6A1C034202D0452F01D1013E151C04
-:10CB400001360135EDE7201C18F093FD002F04D1CC
-:10CB50000122231C40331A704AE0371C01352B7820
-:10CB6000652B11D16B78226901379A4205D1201CBF
-:10CB7000013518F07EFD3E1C06E00235EFE7C046A9
-:10CB8000FFFFFF7FBF7403002B78452B0AD16B7822
-:10CB900022699A4204D1201C18F06BFD3E1C0EE065
-:10CBA00001220EE0632B0AD16B78226901379A4289
-:10CBB00005D1201C18F05DFD02353E1CCFE7A04BCF
-:10CBC0009A5D231C40331A70231C40331B780422C7
-:10CBD000191C9143422901D0442B02D1A36A01338D
-:10CBE00005E0432901D0452B02D1A36A013BA36292
-:10CBF000211C40310B78082B00D01FE10023E56C8D
-:10CC0000A66C904A9800805800228418B24205D041
-:10CC1000875CAC5CA74205D10132F6E72278002A96
-:10CC200000D1FFE00133222BEBD107E1231C0C22C2
-:10CC300040331A70012306E000230193231C0B22CA
-:10CC400040331A7000232722049323690392222B76
-:10CC500000D10393201C18F00CFD0123039A0593C7
-:10CC6000236993420AD16369934207D1201C18F0CB
-:10CC700000FD201C18F0FDFC03230593002623690A
-:10CC80000293013300D1B0E0059B012B03D1029B3D
-:10CC90000A2B00D1A9E0059B9E4200D3ACE0029B89
-:10CCA000039A934205D1381C111C013602F07AFC1C
-:10CCB00097E0029B5C2B00D08DE0201C18F0D9FC83
-:10CCC000019B2569002B02D0381C02996BE0622D74
-:10CCD00000D1A2E012D84E2D4BD007D8222D66D01D
-:10CCE000272D64D000260A2D7BD045E05C2D5ED038
-:10CCF000612D00D18FE0552D3ED11BE0742D11D058
-:10CD000007D86E2D10D0722D12D0662D34D10C257F
-:10CD100050E0762D0AD00DD30226782D16D06B1C4C
-:10CD20005ED029E0092545E00A2543E00B2541E0D6
-:10CD30000D253FE0049B002B04D0381C5C2102F041
-:10CD400031FC37E00426752D00D0B6190025013ED0
-:10CD50002BD3201C18F08DFC2369181C0293F3F7C9
-:10CD60001DFD00284DD0029815F0B5FE2D01451986
-:10CD7000EDE73548FBF732FA2B1C303B072B10D878
-:10CD80001D1C03266369303B072B0ED8013E002E85
-:10CD90000BD0201C18F06DFC2369ED00303B5D19B1
-:10CDA000F0E7381C5C2102F0FDFB6B1C18D0274B10
-:10CDB0009D420BD8049B002B04D1381C291C02F087
-:10CDC000F1FB0DE0FF2D01D8E9B206E0231C0122A2
-:10CDD00040331A7004E06B46197A381C19F012FFC0
-:10CDE0000026201C18F045FC49E7059B9E4203D213
-:10CDF000231C032240331A70381C311C19F04AFFDF
-:10CE0000F6E6231C012240331A70049B051C002BFC
-:10CE1000DAD11D1CD1E70725CCE70825CAE74A234C
-:10CE20003370E5E6212B07D1094BA0331A68102394
-:10CE3000002A02D0023B00E00E330B7007B0F0BDB9
-:10CE400094740300A4ED020001750300FFFF1000BD
-:10CE5000882E002013B5041CA068FAF75FFC01902F
-:10CE600000280ED06368074A934205D0181C0121A0
-:10CE7000002201ABFAF70AFBF4F71EF80028EBD00A
-:10CE8000019816BD94BA0200014B58687047C0461D
-:10CE9000882E0020014B18687047C046882E00205D
-:10CEA000F0B5194E87B03368051C00200C1C0193A7
-:10CEB0001AF06EF830600090206817F080FF019B38
-:10CEC000071C3360114E022D03D0A068F3F7CAFD92
-:10CED000061C211C63680831A81E0393F8F7E2FAC8
-:10CEE000009B04900593301C03AB03210022FAF74A
-:10CEF000CDFA074B041C9F4203D0381C211C16F0AE
-:10CF0000B9FA201C07B0F0BD882E0020A4BE020094
-:10CF100094BA0200F8B50326051C071C3540022D03
-:10CF200015D10E4B0340062B11D0FF23DB05C4188F
-:10CF3000B443201C00210CF02FFF00280BD08023CD
-:10CF40001B06E018B043064B2843C01804E0381C09
-:10CF500004F086FA00E0381CF8BDC046070080FFE8
-:10CF60000000808010B5FAF78BFB041C201CFAF738
-:10CF7000D5FB002805D0F3F79FFF0028F6D1024823
-:10CF800000E0024810BDC046A0C302005CC302001E
-:10CF900010B5FAF775FB041C201CFAF7BFFB00283C
-:10CFA00005D0F3F789FF0028F6D0024800E00248D8
-:10CFB00010BDC0465CC30200A0C3020007B5044B0D
-:10CFC00001906946022000220093F6F763FD0EBD32
-:10CFD0000604000008B5F3F7CBFD034B002800D191
-:10CFE000024B181C08BDC0465CC30200A0C302006F
-:10CFF00037B5F3F721FE01AB7F2802D81870012165
-:10D000003CE02149820988420AD8402149420A432A
-:10D010001A703F221040BF3A1043587042312DE041
-:10D020001A49040B88420ED8202149420C431C7037
-:10D0300080245F310A4064420840224320435A70F2
-:10D0400098703C391AE01249884211D81025810C99
-:10D050006D42294319703F21703D0C400A40084041
-:10D060002C432A4328435C709A70D8703B3905E002
-:10D070000849094818F0B6F9F3F7CDF8181C012251
-:10D08000F5F7DCFA3EBDC046FF070000FFFF0000D9
-:10D09000FFFF100072750300D8E5020008B5021CFE
-:10D0A00002490A20FAF77AFB08BDC046BE04000018
-:10D0B00008B5021C02490A20FAF770FB08BDC046F9
-:10D0C0003E050000F0B585B002900192101C0C1CCA
-:10D0D000002232490393FDF7F5FB0090002801D0B0
-:10D0E00043680093029B012B03D000252E1C019561
-:10D0F0003CE020680024FAF7C3FA271C029002984B
-:10D10000FAF70CFB051E17D0009B2E1C002B04D039
-:10D11000181C291C17F05AFE061C002C09D0039875
-:10D12000311C3A1CFAF73AFB1D4B984201D0251CE2
-:10D130003E1C2C1C371CE2E7221E2BD101981949FA
-:10D14000FDF7C0FB002801D0426823E016491748CC
-:10D1500018F048F9F3F75FF8009B002B0AD1276815
-:10D16000002E0DD12668019701350434029B9D42A3
-:10D17000F2D10EE00098216817F028FE071CEFE7B7
-:10D180000398391C019AFAF709FB054B9842EBD139
-:10D19000E8E7321C101C05B0F0BDC046D606000002
-:10D1A0005CC302001E05000093750300D8E5020071
-:10D1B00037B501A9051CF5F7F9FE1E4B041C2B40E1
-:10D1C000062B05D0AB072AD12A681B4B9A4226D1E1
-:10D1D000201C019915F05BFC0190012822D12078D8
-:10D1E00043B2002B04DB012320784000184320E0E9
-:10D1F0007F23013418403F3B184202D098435B1014
-:10D20000FAE722783F23111C9943802904D1800139
-:10D21000134001341843F4E71AF0E8FC09E0019BDD
-:10D22000012BE0D00549019A0548FEF74FFDF2F7C2
-:10D23000F2FF3EBD070080FF40EC0200AC7503002A
-:10D24000C8EA0200F0B587B0141C02900391101CCC
-:10D2500023490022FDF736FB2249051C0022201C31
-:10D26000FDF730FB0123041C049305931E4F002D92
-:10D2700007D068681D4B984203D004A9F5F796FEC5
-:10D28000071C1B4D002C07D06068184B984203D038
-:10D2900005A9F5F78BFE051C0024029B154E9C4248
-:10D2A00012D0002C07D00023301C00930193391CAE
-:10D2B000049AF9F7C9F9039AA300D158301C002247
-:10D2C000F3F7EAFB0134E8E70023301C00930193F5
-:10D2D000291C059AF9F7B8F9044807B0F0BDC04613
-:10D2E000EE050000F60500007AAA030094BA0200D9
-:10D2F000274303003CD302007FB50D4DA84214D054
-:10D30000041C0C4E0122301C211CF3F7C5FB0A49FA
-:10D31000301C17F0AAFA04230293084B0394DB692C
-:10D320000748032102AA01939847281C04B070BD46
-:10D3300094BA02003CD3020027430300D0CF02007E
-:10D3400068EE020010B5041C86B002A86A461021DF
-:10D3500002F01CF96846211C0122F3F79DFB02A98B
-:10D360000248F5F735F906B010BDC04640EC0200A2
-:10D3700070B50C68031C201CE2074AD4A20703D135
-:10D38000244A2568954244D0012B1FD94868F3F7F9
-:10D3900053FC061C201CF3F7B3FC051C301C0DF0DD
-:10D3A00017FC011C1C4810F017FB041C211C281C36
-:10D3B0000DF03EF90FF0C2FF211C0CF047FF0323D4
-:10D3C0009843013B1843154BC01822E0201CF3F78B
-:10D3D00097FC061C0FF0B2FF051C0DF0D9FB291CB1
-:10D3E000041C301C0DF056FAFC218905051C0CF0BC
-:10D3F000CDFC002801D0013406E0BF21281C09061D
-:10D400000CF0C4FC002801D001239C43201C1AF01E
-:10D41000EDFB70BD4CB9020000002041000080808F
-:10D4200013B5041C081CF5F72BF96A46011C201CD7
-:10D43000FAF7AAF8009B0248002B00D1014816BD5C
-:10D440005CC30200A0C3020037B50024022800D943
-:10D450008C6848680D68F5F713F9094B011C002C1E
-:10D4600000D0084B281C6A4698470098002805D031
-:10D470000199002903D0F3F7C5FD00E0201C3EBD53
-:10D48000E97500008975000038B5051C081C141CDE
-:10D49000F5F7F6F8221C011C281CFAF7CDF8014814
-:10D4A00038BDC04694BA020008B5FAF711F9002851
-:10D4B00004D1034817F089FFF2F7ADFE08BDC0465E
-:10D4C00084E8020030B50B1C85B0141C012805D976
-:10D4D0000A490B4817F086FFF2F79DFE0948012123
-:10D4E000C2680192019D0022A84703A90390221C53
-:10D4F0000120F8F70BFC039805B030BDE67503007A
-:10D50000C8EA0200FCD10200F8B50E1C002803D1C5
-:10D510002A4B041C1D6823E0086883070AD10368AE
-:10D52000274A934203D116F021FA051C0EE0254A42
-:10D53000934201D0F3F796FA856B002D06D02A6846
-:10D54000214BD31A594259414B421D403068F3F7E1
-:10D5500089FA1E4BC26800249A4201D1346804340F
-:10D560000020011C16F0E2FA0027061CBD4209D17A
-:10D570000025AC4216D11FE0EA68FB00995800294B
-:10D5800004D10137AB689F42F6D3F1E70429F8D004
-:10D59000301CF8F757FBF4E7A268EB009958002914
-:10D5A00004D1013563689D42F6D305E00429F8D023
-:10D5B000301CF8F747FBF4E7301CF8BD882E00203C
-:10D5C000D0CF0200A4BE0200C4F60200B91F0000C2
-:10D5D00070B5041C0D1C104917F047F96968201C30
-:10D5E0000122F3F759FA0D4E201C311C17F03DF9BA
-:10D5F000A968201C0122F3F74FFA311C201C17F0F8
-:10D6000034F9E968201C0122F3F746FA201C04498A
-:10D6100017F02BF970BDC0461176030017280300E0
-:10D62000CE26030070B5061C10200D1C141C17F02C
-:10D630000DFF034B466085600360C46070BDC0464B
-:10D64000B0F2020008B50B1C4179021C012904D17B
-:10D65000C06A191C17F0B3FF04E0006B0249D26ADC
-:10D6600017F0E9FF08BDC0467CF8020008B50B1CA6
-:10D670004179021C012904D1C06A191C17F0BFFFAF
-:10D6800004E0006B0249D26A17F0D5FF08BDC0461E
-:10D690006CF8020008B50B1C4179021C012904D169
-:10D6A000C06A191C17F0ABFF04E0006B0249D26A94
-:10D6B00017F0C1FF08BDC0468CF8020008B53F2234
-:10D6C000014B18F0A6F908BD2364020008B59122A9
-:10D6D000014B18F09EF908BD79E80000F7B5041C6D
-:10D6E000C579868A0F1CC18A00200191E071A08251
-:10D6F000E082111C201C1A1C0F4B18F08AF9A36839
-:10D70000002B18D1E18A002908D0A38A002B05D16B
-:10D71000206B19F0E0FF206B19F06FFEA38AE28AFC
-:10D72000201C391C18F025F96B1E9D416B469B8807
-:10D73000E571A682E382F7BD7DE4000038B5836819
-:10D74000002B0BD1041C0D1C0548111C17F04AFEC0
-:10D75000A060201C291C0C3018F0C0F938BDC04650
-:10D7600040EB0200F0B58DB06B4601921B79041CB2
-:10D7700043710123E16203610B780D1C012B02D080
-:10D7800000219B4A46E0019B012B07D9836B01993D
-:10D790001E68231C406B2A1C0833B047AB68181C5A
-:10D7A000049317F0AFFA63790490032B0FD109901B
-:10D7B0000C2109A817F0BFFAA36B021C9B68606BD1
-:10D7C00009999847A3686883002B00D009E1049861
-:10D7D00017F098FA04900378011C002B23D00A3B21
-:10D7E0000F2B1CD809A918F098F8099B772B14D097
-:10D7F00004D803220292312B17D008E0812B04D0E9
-:10D8000002220292992B10D001E001230CE0201C8F
-:10D810000499784AFFF792FFE8E0002304E0201C17
-:10D82000754AFFF78BFF02230293049817F06AFAF8
-:10D830005A21049004A817F07EFA049D0390039BDC
-:10D840009D4200D1C2E004952B78432B00D1B8E073
-:10D85000392B03D0201C0499684ADBE7281C05A952
-:10D8600017F05AFA0378061C912BF3D117F04AFAF5
-:10D87000059B9842EED1301C05A917F04DFA0378AC
-:10D88000071C0A3B0F2BE5D817F03CFA059B061E38
-:10D890009E42DFD00378A02BDCD117F033FA059B32
-:10D8A0009842D7D106A9381C18F037F8301C17F069
-:10D8B0002EFA9C21079007A817F03DFA011C079843
-:10D8C00017F014FA069B061C2E2B1FD1012804D139
-:10D8D000079803780A3B0F2B03D9201C0499484A68
-:10D8E00098E72669731C2361019B012B66D909A95E
-:10D8F00018F013F8A36B606BDB68311C099A98472A
-:10D9000000285BD1201C04993E4A83E72F2B15D1B8
-:10D91000012803D107980378032B03D0201C049916
-:10D92000394A77E7019B012B48D9A36B676B1E69C6
-:10D9300017F0C8F9011C381CB0473FE0302B27D145
-:10D94000012803D907980378032B03D0201C0499DE
-:10D950002E4A5FE7019B012B30D908A917F0A3F9E4
-:10D960000127079007980378032B03D0201C049904
-:10D97000274A4FE709A917F096F9A36B07905B694F
-:10D98000606B0899099A01379847B742EAD115E0C8
-:10D99000019B012B12D9032800D95BE7079B181CB8
-:10D9A000099317F0AFF90A9017F0ACF9A36B0B903D
-:10D9B0009F69606B0699321C09ABB847A368002BBE
-:10D9C0000FD1281C17F09EF9051C38E76379012B4D
-:10D9D00004D9A36B606B5B6802999847A368002B1E
-:10D9E00004D0201C04990C3018F078F80DB0F0BD6C
-:10D9F0002376030047760300547603007C76030009
-:10DA00009F760300BB760300CB760300E776030026
-:10DA10000C77030008B5024AFFF790FE08BDC04628
-:10DA20002E77030030B50B7885B04C1C002B7AD0D4
-:10DA30000C1C051C032B09D1081C03A917F033F992
-:10DA40000399041C286B19F071FC6CE0012B07D1C1
-:10DA500049780234052966D0006B03F0F9F962E0D9
-:10DA6000042B07D18978637809021943006B19F0F8
-:10DA7000A3FC16E0052B19D14379042B02D0006BCF
-:10DA80002A490CE088784B780002184303A917F064
-:10DA90000BFB03992D6BF4F7E9FD011C281C19F011
-:10DAA00097FC201C17F02EF9041C3CE01A1C0A3AC3
-:10DAB000081C0F2A08D803A917F02FFF0399041C8C
-:10DAC000281CFFF7BFFD2EE0082B0BD103A917F090
-:10DAD000E0F8039B2A6A9B00041C9958286B19F0F4
-:10DAE00077FC20E002AA03AB01A917F03CF9041C63
-:10DAF0000299286B03F062F9019B0D4A9B009B5829
-:10DB0000281C211C002B03D10A4AFFF717FE09E04D
-:10DB1000039A9847AB68002B04D0EB68002B01D127
-:10DB2000029BEB60039C201C05B030BD94BA020040
-:10DB3000ECF202004B770300F0B587B005930B1CA5
-:10DB4000141C5A1E93410091DBB2061C0599201C3F
-:10DB50000193002517F0CAF8019B0290AB4209D04F
-:10DB6000009B1B78842B05D1291C306B029A19F07D
-:10DB700030FE009D271C029B013B0493019B0393F5
-:10DB8000059B9F421CD03B78842B0ED1002D06D1E3
-:10DB9000306B0399049A19F01CFE3D1C05E0301C03
-:10DBA000391C214AFFF7CAFD3BE0381C17F0AAF8E0
-:10DBB000039B071C01330393049B013B0493DFE7A2
-:10DBC000002D07D1019A029B94466344191C306BC7
-:10DBD00019F0F3FD019B002B1CD0009BAB4205D13B
-:10DBE000281C17F094F8011C301C01E0301C00992F
-:10DBF000002200F01BF80DE0AC420FD1201C17F002
-:10DC000086F8011C301C002200F010F8201C17F0D0
-:10DC100079F8041C059B9C42EED102E0301C211CCB
-:10DC2000F1E707B0F0BDC04663770300F0B50B78AD
-:10DC3000171C1A1C0A3A85B0041C0D1C0F2A0FD899
-:10DC4000081C03A917F069FE201C0399002F01D0BE
-:10DC5000022F02D1FFF70AFDE1E0FFF7F3FCDEE05F
-:10DC6000192B01D86F4AD8E01A3B7C2B00D183E0F6
-:10DC700004D8252B76D0772B06D0CBE07E2B00D195
-:10DC800088E0912B6ED0C5E0081C02A917F044F87B
-:10DC9000061C022F03D0201C311CFFF7C3FE301CD2
-:10DCA00017F030F80299061C17F02FFE002800D05C
-:10DCB000B0E03378922B14D1301C03A917F02CF864
-:10DCC000061C301C17F01EF8039A0190904208D2EF
-:10DCD000022F01D1019EF4E7201C311CFFF7A2FEA8
-:10DCE000F8E73378A12B19D1022F04D1206B19F05A
-:10DCF00009FC206B0FE0301C17F009F8011C201CF8
-:10DD0000FFF790FE206B012F05D119F0CFFB206BA0
-:10DD100019F09FFB1DE019F0B4FB1AE0A22B79D19A
-:10DD2000301C16F0F4FF03A917F0F7FD012F07D1FF
-:10DD3000206B19F0B1FB206B039919F068FB08E028
-:10DD4000022F02D1206B19F0C6FB206B039919F04A
-:10DD50008BFB301C16F0D6FF029917F0D6FD002879
-:10DD60005DD157E0002F51D103A9281C16F0D4FF34
-:10DD7000391C021C201C3CE0081C03A916F0CCFF37
-:10DD80000399061C17F0C1FD002843D1002F3DD197
-:10DD9000351C17E0002F39D1081C03A916F0BCFF71
-:10DDA0000399051C17F0B1FD031E04D0201C391C7B
-:10DDB0003A1C3B1C27E02A789A2A03D0201C291CF5
-:10DDC0001A1C20E003A9281C16F0A6FF061C16F05A
-:10DDD00099FF03789D2B04D10022201C311C131CB9
-:10DDE00011E09E2B07D103A916F096FF311C021CEF
-:10DDF000201C039B07E0BE2B0CD016F083FF0021F4
-:10DE0000031C321C201CFFF797FE08E0201C291C75
-:10DE1000054A02E0201C291C044AFFF78FFC05B0CC
-:10DE2000F0BDC0467D770300B0770300957703000F
-:10DE3000F0B50B7891B00A3B041C019105920F2BB1
-:10DE400000D9ECE0081C16F05DFF0378912B00D0A0
-:10DE5000E5E0019816F056FF0DA916F05DFF037876
-:10DE600042780A3B1B021343AD2B00D0D7E016F0DB
-:10DE700049FF0378051CA02B00D0D0E016F087FFE7
-:10DE8000002800D0CBE0281C16F03CFF0D9B9842E8
-:10DE900000D0C4E0281C16F03AFF9C210E900EA87A
-:10DEA00016F049FF0E9B051C0293012302980F9365
-:10DEB00016F028FF061E0E90AE4210D016F022FF7C
-:10DEC0000E90A8420ED00378032B00D0A7E00FA934
-:10DED00016F0E9FE0E90A84200D0A0E002E07A4BD6
-:10DEE000029E0293029B1B784833DBB2022B00D8C0
-:10DEF00095E033784833DBB2022B00D88FE00D9BDE
-:10DF0000181C049316F0FEFE059A2769831A5A1E00
-:10DF10009341021C5B421A400F9B03920593238B93
-:10DF200027830993638B0A93E38B0B937B1C0693E4
-:10DF3000BB1C07936B461B8B6383A38BE383FB1C88
-:10DF400008933B1D23613578033D6B1E9D41EDB267
-:10DF5000002D03D0201C311CFFF764FD0299201C0A
-:10DF6000FFF760FD206B089919F0E1FA0799206B23
-:10DF700019F0A8F9206B19F08FFA0022201C0199E2
-:10DF8000FFF754FE0499201CFFF74CFD206B069907
-:10DF900019F098F9206B059919F0C8F9206B122136
-:10DFA00019F076FB206B089919F08CF9206B002D85
-:10DFB00005D019F07BFA206B19F08DFA05E019F005
-:10DFC0006BFA201C311CFFF72DFD059B206B1921DE
-:10DFD000002B00DA1A2119F05BFB206B0121079A54
-:10DFE00019F0B1FA6B469B8C23836B461B8D6383C0
-:10DFF0006B469B8DE383039B002B03D0201C191CD5
-:10E00000FFF710FD206B391C19F05CF9206B19F03B
-:10E0100057FA002D56D0206B19F052FA52E0238B9C
-:10E0200025690393638B6E1C0493E38B66830693CD
-:10E03000AB1C0293A38B0198E383244B2B432383D4
-:10E04000EB1C236116F05EFE011C201CFFF7EAFCAE
-:10E05000071C206B19F0C8FA206B311C19F032F93B
-:10E06000206B029919F0CAFA201C01990022FFF7CF
-:10E07000DDFD391C201CFFF7D5FC071C206B19F0B7
-:10E0800018F9002803D1206B311C19F050FA206BCD
-:10E09000029919F017F9206B19F0BCFA6B469B89AD
-:10E0A00023836B461B8A63836B461B8BE383059B31
-:10E0B0009F4203D0201C391CFFF7B4FC206B291CA5
-:10E0C00019F000F911B0F0BD623203000080FFFFCB
-:10E0D000F0B5171C85B0041C081C0D1C16F012FEB0
-:10E0E000391C061C17F011FC019000281CD0237964
-:10E0F000201C002B11D0E36A1E78002E0DD11321B5
-:10E10000FFF7A0FA291C201CFFF78CFC206B0121D3
-:10E11000321C331C19F09CFB02E0291CFFF782FC27
-:10E12000206B19F0CDF958E033783B2B1BD1291C1B
-:10E13000201C0122FFF77AFD301C16F0E8FD437821
-:10E14000811C4E3BDBB218260A2B01D8244AD65C30
-:10E15000201CFFF767FC206B311C19F099FA201C7A
-:10E16000291C022237E03C2B2ED1301C03A916F0CB
-:10E17000D3FD061C071C039B9F4205D0381C16F0DC
-:10E18000C1FD0197071CF6E70199201CFFF74AFC27
-:10E19000206B19F081F9201C291C0022FFF746FD95
-:10E1A000019B9E4219D0301C16F0ACFD019B051E50
-:10E1B0009D4202D0206B19F06FF9311C201C002207
-:10E1C000FFF734FD2E1CEBE7311C201CFFF72AFC67
-:10E1D000201C291C019AFFF729FD05B0F0BDC0469F
-:10E1E00018760300F0B589B0041C0D1C059104924B
-:10E1F0001F1C002924D18379002B27D0C36A0291E8
-:10E200001B78012B23D10521FFF71CFAE26A108D40
-:10E21000854211DAD16AEB00CB1801215E780E42FB
-:10E2200008D05A88206B18F0C4FF0022206B02210E
-:10E23000131C97E00135EBE7201C00214B4A22E03C
-:10E2400005A89C2116F077FD029000E002930023C0
-:10E250001E1C059D00930393019308E0281C1E4398
-:10E2600016F055FD0390281C16F04CFD051C029B72
-:10E270009D4254D02B78B82B08D1B73B1E42EDD02D
-:10E28000201C291C3A4AFFF759FA6DE0B92B0CD132
-:10E29000B73B1E4203D0201C291C364AF3E7281C3A
-:10E2A0001E4316F034FD0090DDE7BA2B2BD1281C5D
-:10E2B00016F02DFD051C16F025FD0378BE2B09D1A7
-:10E2C000201C291C062217F046FC281C013716F0DA
-:10E2D00019FDC9E72B780A3B0F2B03D9201C291CF9
-:10E2E000254AD0E7281C07A917F017FB051C07993A
-:10E2F000206B19F061F8291C201CFFF793FB019B90
-:10E30000051C0133A8E7019B201C291C002B01D010
-:10E310001A4AB8E7FFF786FB0137051CA7E7002E6E
-:10E3200015D0039B002B03D1206B19F066F803E096
-:10E33000201C0399FFF776FB009B002B03D1206B79
-:10E3400019F05BF803E0201C0099FFF76BFB049BBE
-:10E35000206B391C019A002B03D0331C19F082FA70
-:10E3600002E0331C19F074FA09B0F0BDDC77030049
-:10E37000FA77030011780300297803004A78030034
-:10E38000F0B589B0041C039103A8072116F0D3FC53
-:10E390000027E36A01905E7E0398019B98424AD071
-:10E3A00005A916F0B9FC4021039003A816F0C3FCA0
-:10E3B00006A9051C039817F0B0FA069B02902A2BB9
-:10E3C00019D1A8420DD2029816F09CFCA84208D19F
-:10E3D000029807A917F0A1FA079B2B2B07D02D2B2A
-:10E3E00007D0201C0021244AFFF7A8F920E00126CD
-:10E3F0001EE004261CE0201C0399FFF713FB0137E5
-:10E4000003900398A84208D007A917F086FA079945
-:10E410000390206B18F0FBFFF3E7281C059917F019
-:10E4200074FA002804D1A071291C201CFFF7FAFA05
-:10E43000059B0393B0E7181C16F069FC019B039041
-:10E440001B78011C321C201C242B02D117F01AFB54
-:10E4500001E017F096FD051C013F06D30022206B5A
-:10E460000121131C19F0F4F9F6E7201C291CFFF711
-:10E47000FDF809B0F0BDC0466C780300F7B50A7826
-:10E480000824131C293BA343DBB2002B02D1013328
-:10E49000C37168E0131C2A3BA343DBB2002B62D09C
-:10E4A000131C0A3B0E1C041C0F2B1DD9081C282A08
-:10E4B00013D101A916F030FC071C16F023FC019BB8
-:10E4C0000025984212D016F01DFC019B051CC31AB2
-:10E4D0005A1E93415B421D4008E016F018FC071CD1
-:10E4E00016F010FC051C01E00F1C0025381C01A9CA
-:10E4F00017F013FAE379002D02D02A78002A0AD106
-:10E50000002B30D1E38A002B2DD0201C311C164A61
-:10E51000FFF714F927E0002B1ED0A38A01339BB22A
-:10E52000A382012B0CD1E18A206B002902D019F0C3
-:10E53000D2F801E018F061FF206B002119F0F2F829
-:10E54000291C201CFFF76EFA206B019918F034FF8C
-:10E55000206B19F0F3F806E0E38A201C0133E38214
-:10E56000291CFFF75FFAF7BD8A780300F0B5041C99
-:10E570000E1C056987B003936B1C0293AB1C0361EF
-:10E58000291C006B171C19F00CF8201C17F0CDF992
-:10E59000311C201CFFF746FA206B19F041F8206B64
-:10E5A000029918F0C4FF206B291C18F08BFE206B19
-:10E5B00019F09DF92669731C2361039B9F4200D1CA
-:10E5C00091E0381C16F0A3FB002305932369051C7A
-:10E5D0000193013323610378002B0FD116F092FBD6
-:10E5E00016F090FB039B984223D0201C291C4B4A19
-:10E5F000FFF7A4F8A38B013BA3838CE0071C6A2BD5
-:10E6000007D116F084FB071C16F07CFB05A917F058
-:10E6100084F9206B18F040FF391C201CFFF702FA28
-:10E62000206B212119F034F8206B0021019A18F099
-:10E630008AFF281C16F066FB071C206B18F040FFB1
-:10E640000599002903D1206B18F03AFF02E0201C45
-:10E65000FFF70CF80025206B18F032FF059BAB424A
-:10E6600009D02569206B6B1C2361291C18F0A5FFBC
-:10E67000201C17F05AF9391C201CFFF7D3F9059B11
-:10E68000071C002B02D0206B18F0CAFF206B18F07B
-:10E69000E8FF059B002B19D0206B0F2102F0D8FB5F
-:10E6A000206B291C18F00EFE206B0F2102F0D0FB0E
-:10E6B000201C0599FEF7DAFF201C0599FEF7EAFFFA
-:10E6C000A38B206B013BA38318F083FF206B311CCD
-:10E6D00018F02DFF206B019918F0F4FD206B032139
-:10E6E00018F0ECFD69E7A38B206B013BA38318F0C6
-:10E6F00070FF206B19F0FFF8206B029918F0E2FD13
-:10E700000C9B002B03D0201C191CFFF78BF9206BEE
-:10E71000311C18F0D7FD07B0F0BDC046B878030033
-:10E72000F0B587B003914379012B42D1C36A041C31
-:10E730001B78002B03D1204AFFF700F839E0039B38
-:10E7400003A84321019316F0F6FA02900398029B66
-:10E7500098422ED005A90B2717F0DFF802AB059DD4
-:10E76000FF180390291CE06A3A1C19F0A7FB3B78BC
-:10E77000061C002B06D10378042B03D0201C019922
-:10E780000E4A0CE0E06A291C19F0C5FB002803D0F2
-:10E790000378023B022B05D9201C0199084AFEF799
-:10E7A000CDFFD3E704233370E06A291C19F0C5FBC1
-:10E7B000CCE707B0F0BDC046D7780300FC78030073
-:10E7C0001D790300F0B585B001914379012B2BD160
-:10E7D0000091041C432101A816F0ADFA071C019812
-:10E7E000B84221D003A90B2517F097F8039E6D447A
-:10E7F0000190311CE06A2A1C19F060FB2B78002B79
-:10E8000008D10378012B05D0201C0099074AFEF798
-:10E8100095FFE4E701250570E06A311C19F072FBF1
-:10E820000028DCD00570DAE705B0F0BD3B790300C5
-:10E8300010B5438B041C002B02D1054AFEF77EFF66
-:10E84000A38BE28B618B9A1A206B02F027FB10BD21
-:10E850005A79030010B5038B041C002B02D1054A22
-:10E86000FEF76CFFA38BE28B218B9A1A206B02F0D0
-:10E8700015FB10BD72790300F7B50B78041C1A1C48
-:10E880000A3A0E1C0F2A08D8081C01A917F045F8EF
-:10E89000201C0199FEF7FEFE76E0912B3FD1081C6B
-:10E8A000694616F039FA011C201CFFF7BBF8037803
-:10E8B000051C922B10D101A916F02EFA051C281C5C
-:10E8C00016F020FA019B071E9F4205D0291C201C30
-:10E8D000FFF7A8F83D1CF2E72B78A12B0BD1281CE1
-:10E8E00016F015FA011C201CFFF79CF8051C206B84
-:10E8F00018F012FE0CE0A22B41D1281C16F007FAEA
-:10E9000001A917F00AF80199051C206B18F0EDFD1C
-:10E91000281C009916F0F9FF002830D034E0962B1F
-:10E920002DD1081C16F033FA002828D1301C16F01F
-:10E93000EEF9061C16F0EBF9051C201C291CFFF74C
-:10E940009BFF281C16F0DEF90378011C9D2B1BD0C1
-:10E950009E2B0ED101A916F0DFF9019B051E9D42E9
-:10E9600012D0201C291CFFF787FF281C16F0CAF9BB
-:10E97000F3E7BE2B03D0201CFFF77EFF04E0201C32
-:10E98000311C024AFEF7DAFEF7BDC0468779030064
-:10E99000F7B502260D1CC16A041C097E314003D064
-:10E9A000201C291C334A5EE001912978081C0A3892
-:10E9B0000F2801D8281C05E01A32914212D1281CD8
-:10E9C00016F0A5F901A916F0A8FFE279E36A002A7A
-:10E9D00004D15A8B01325A83012635E09A8B0132D9
-:10E9E0009A83F9E71A33994223D1E379002BD7D1DF
-:10E9F0000127281CE77116F0CAF90326002823D145
-:10EA0000281C16F084F90278E36A0A3A0F2A04D81F
-:10EA10001A7E281C17431F7605E01A7E281C174310
-:10EA20001F7616F074F916F072F901A916F075FF49
-:10EA30000AE0281C16F06BF901A916F06EFFE26AD5
-:10EA4000137E1E43167605260199002911D06B46C8
-:10EA5000DF1CE06A3A1C19F031FA3B78002B05D133
-:10EA6000201C291C044AFEF769FE02E002234670BE
-:10EA70000370F7BD003303009F79030038B5C36A04
-:10EA8000041C1B780D1C012B04D000210B4AFEF73F
-:10EA900055FE11E0081C111C16F037FF002804D0A9
-:10EAA000206B0F2102F0D4F903E0201C291CFEF793
-:10EAB000B9FF206B18F0E1FE38BDC046B8790300FD
-:10EAC00038B5C36A041C1B780D1C013B012B04D90B
-:10EAD0000021164AFEF732FE26E0081C111C16F033
-:10EAE00014FF002804D0206B0F2102F0B1F918E0C8
-:10EAF0002B78C22B11D1281C16F009F9011C201CFF
-:10EB0000FEF790FF206B18F06FFD206B0F2102F0D5
-:10EB10009FF9206B18F0DBFE06E0201C291CFEF795
-:10EB200081FF206B18F0C4FE38BDC046D2790300C7
-:10EB3000F0B5041C85B00D1C081C111C16F0E5FE78
-:10EB4000002804D0206B002118F0ECFD80E02B7829
-:10EB5000AF2B0BD1206B012118F0E4FD201C291CE8
-:10EB6000FEF760FF206B18F0E9FD71E0AE2B67D176
-:10EB7000281C16F0CCF8051C16F0C4F80290037897
-:10EB8000B22B53D103A916F0C7F8039B0290984209
-:10EB900003D002A8992116F0CEF82B78AF2B11D113
-:10EBA00003990298266B16F0A1F8411C301C18F04E
-:10EBB000B9FD291C201CFEF735FF206B18F0BEFDA7
-:10EBC000012304E0201C291CFEF72CFF0023029FD8
-:10EBD0000193039B9F421ED03E78391CAF3E201C00
-:10EBE00073425E41FEF71EFF019BF6B2071C002B2D
-:10EBF00009D0002E03D1201C291C164A08E0206BE6
-:10EC000018F09CFDE5E7002EE3D0201C291C124AD9
-:10EC1000FEF794FD1CE0019B002B19D1391C0298D2
-:10EC2000246B16F063F8411C201C0FE02B78201C8D
-:10EC3000291C0422AF2B00D0052216F08CFF07E020
-:10EC4000291C201CFEF7EEFE0121206B18F08EFD22
-:10EC500005B0F0BDEB7903000E7A0300F0B5012397
-:10EC6000041C0D1C427187B0E1620361111C006B32
-:10EC70002A1C01F0DBFF6379012B02D100236B8496
-:10EC8000AB84AE6833781E2B07D1301C16F03FF8EA
-:10EC9000011C201CFEF7C6FEB9E02B78002B04D126
-:10ECA000201C311CFEF7BEFEA7E0012B1ED1301C3C
-:10ECB00016F028F86379051C012B07D10023201CCE
-:10ECC000E371291C0C22564B16F0A3FE281C16F0EB
-:10ECD00019F816F017F8011C201CFEF7A3FE206B94
-:10ECE00018F0E7FA002800D094E086E0022B18D153
-:10ECF0006379012B07D10023201CE371311C1422FE
-:10ED0000484B16F086FE301C15F0FCFF011C201C41
-:10ED1000FEF788FE2B7E5B0779D5206B18F0D0FBC1
-:10ED20006BE0033B032B3AD8301C15F0EBFF05A931
-:10ED300015F0F2FF15F0E6FF67790390012F09D176
-:10ED40000B2202ABD218E06A391C19F0B7F8022383
-:10ED500003706F832B78032B04D1206B002118F0F4
-:10ED6000C7FC0CE0042B04D1206B002118F0DAFC66
-:10ED700005E0052B03D1206B002118F0F7FC201CC7
-:10ED80000121FEF75FFC0023201C00930399331C34
-:10ED9000059A17F0F4FB2B78062B38D12DE0637918
-:10EDA000012B06D1281C052105AA19F087F802239A
-:10EDB000037005A9A86816F0B0FD201C0D21FEF710
-:10EDC00041FC201C0C21FEF751FC206B296918F036
-:10EDD000F3FA1121201CFEF749FCA86815F092FFF8
-:10EDE00015F090FF011C201CFEF71CFE281C0521BD
-:10EDF00019F054F80378022B04D1206B0F2102F094
-:10EE000027F804E042880521206B18F0D2F9206B26
-:10EE100018F033FD206B01F097FF07B0F0BDC0463E
-:10EE2000A76102009B610200F0B51E1C0F1C99B087
-:10EE300009AC00210590151C201C3C221CF0C7F9D0
-:10EE4000059B09975B6826712362059B186815F07E
-:10EE500059FF15F037FF6062800016F009FB0021B2
-:10EE6000059BA06200951B68201C0A1C16F067FD1C
-:10EE700018F009FA00230290206303930026331C44
-:10EE8000626A964202D3002BF8D12CE0A268002AD5
-:10EE9000F9D1A16AB2005558002D16D06A69002A2E
-:10EEA00013D115F0D5FF6B7E6861291C201C01224F
-:10EEB000042B02D1FEF756FC01E0FFF7CFFE2369D9
-:10EEC000039A9A4200D2039301230136D8E70B9AA2
-:10EED000002A00D0AEE00499139B8900CB58002B88
-:10EEE00009D1049B01330493129B0693069A049B59
-:10EEF0009342ECD39EE0197EC90723D51C8D601E7A
-:10EF0000C000002C1ED0D96A09184D78AE0711D563
-:10EF1000002A17D050880F1C844650681678069037
-:10EF2000557811CF11C262464A80069A0E704D7014
-:10EF30004A6007E0002A02D1012D00D10A1C013CE1
-:10EF40000838DEE7002119841A8D944691421CDAB4
-:10EF5000D86ACA0082181878072802D15468052C8C
-:10EF600011D00138052804D81078002801D10130CB
-:10EF700010701078022802D05078C00703D5188C82
-:10EF8000441C1C8450800131DEE7002161450ED015
-:10EF9000D86ACA0082181078032806D15078C007B2
-:10EFA00003D4188C5080013018840131EEE75E687C
-:10EFB000002E96D00024328D0792221C07998C4295
-:10EFC0001CDAF16AE0000918069109780025033976
-:10EFD000012911D865450FD0DF6AE90079180F784B
-:10EFE000042F07D106984768381E4F68B84201D1F0
-:10EFF0004A8001320135EDE70134DFE7002082422B
-:10F0000000D16EE760450DD0DC6AC10061180C7854
-:10F01000042C02D14C78E40702D54C8814194C809A
-:10F020000130EFE7598B92B251185983198C52185D
-:10F030001A8456E700260298039918F029F9351C1E
-:10F04000129B04939E4210D30B9B0393002B4FD033
-:10F05000149B0CA8996816F041FD149B0B98099914
-:10F060000C9A1B69FCF7A0FE42E00B9B0493002B5B
-:10F07000EAD1139B0493049AB3009C58002C35D01A
-:10F08000637E042B19D1002D03D1039816F079FA71
-:10F09000051C002315932D4B09A8211C032217934F
-:10F0A0001695FEF75FFB0B9B0493002B1ED109A85E
-:10F0B000211C0422FEF756FB18E0029B09A8211C24
-:10F0C00002221593FFF7CAFD0B9B0493002B04D17A
-:10F0D00009A8211C0322FFF7C1FD0B9B0493002B01
-:10F0E00004D109A8211C0422FFF7B8FD0136A7E7C7
-:10F0F000029818F0D5F8002D02D0281C16F052FA0C
-:10F100000024059815F04DFE139B1B685D69129B4A
-:10F1100002939C420AD2139B0293029AA30098582E
-:10F12000002801D018F0B1FE0134F0E7139816F072
-:10F13000B4F90B9A002A02D0101CF1F76CF8281CC5
-:10F14000111C15F090FE19B0F0BDC04688ED02000C
-:10F15000F8B5214D2E687368012B3BD9B1685C1E50
-:10F160000A5D0A2A36D1002C03DD621E885C0A285B
-:10F1700001D1221C05E0141CF5E7885C202802D18F
-:10F1800001329A42F9D3002C0BDD501C984208D171
-:10F19000601E002805D001380F5C0A2F1AD0202FDE
-:10F1A000F7D0CB18023B1B78141B3A3B594259410C
-:10F1B000A4086418013C0DD3084F301C391C0422EC
-:10F1C00017F072FC381C042104F000FD2B69043395
-:10F1D0002B61EFE7F8BDC0465027002077AA030057
-:10F1E00008B50348002120221BF0F1FF08BDC046EE
-:10F1F000D02E002008B5084B4268186000209860A7
-:10F2000018750138D860081C5A601A61996119F0A4
-:10F210003EF8FFF79DFF08BD50270020F8B50378A2
-:10F22000002B1ED00F4D041CA86C002804D0211CFC
-:10F230001CF0C8F8002814D0201C1CF0CDF8471C86
-:10F24000381C16F010F9061E0BD03A1C211C1BF0BE
-:10F25000A1FF054B054A1968043B99609342FAD116
-:10F26000AE64F8BD882E0020E82E0020CC2E0020B1
-:10F27000F0B5BD4B051C18689E68426885B00192C8
-:10F280001C1C002E00D0C5E06B1E042B1BD817F0F1
-:10F2900074FC6368984200D163E1012D00D106E15E
-:10F2A000022D0AD00FE09A60412D37D0422D2ED08A
-:10F2B000432D19D0442D00D0E8E0236962689342C1
-:10F2C00000D91CE158E1032D00D14AE1042D06D1FB
-:10F2D000206821694368994200D3E0E0FCE0052DF5
-:10F2E00000D1EFE0062D06D123685D682369AB42AB
-:10F2F000AD416D4228E10B2D07D1019B22692068A9
-:10F30000991A17F0C7FC002504E10E2D04D1E3681B
-:10F31000002B00DBA1E02FE1102D04D1E368062BC8
-:10F3200000DC8DE028E1152D0BD12369626820688F
-:10F330009A1A616817F0BCFC2369626800259E1A5E
-:10F340001DE10D2D0AD1894818F0A1FF206817F0A2
-:10F3500046FC6368C018FFF761FF14E11B2D02D162
-:10F360000123A36008E1082D01D07F2D1BD1216965
-:10F370006268914200D8FFE0131C20689D1A8B42FE
-:10F3800005D08568ED5C202D06D10133F6E7012616
-:10F39000032D02DD033600E00126891B321C17F025
-:10F3A00087FC0127ADE0092D28D1236861689868A2
-:10F3B000236940186E4A591A03ABF2F7F5FA061E94
-:10F3C00000D1D9E00025431C0BD1A06918F05FFFE4
-:10F3D00023686168986823694018591A04F0F6FB9D
-:10F3E00098E023692068E918039B01355A1C0392B1
-:10F3F0001A7817F03DFCB542F3D18BE02B1C203B73
-:10F400005E2B00D9B8E02A1C2068216917F039FC6E
-:10F4100001257FE00022012E07D14F2D03D05B2D67
-:10F420006BD1023269E0042267E0022E33D1291C3D
-:10F430003039092900D936E703221D759A609BE00F
-:10F440005A1C4C4913339B005958002900D193E0B2
-:10F4500020686368E26043600FE02068013BE3607E
-:10F4600062684368991A17F015FCE368002B06DB05
-:10F470001233404A9B002068995817F0CCFB636810
-:10F480002269D61A22685568ED1A78E0482D0ED008
-:10F49000462D71D116E0032E29D17E2D02D00025F4
-:10F4A0002F1C1EE01B7D312B01D0372B05D10025F1
-:10F4B000236962682F1C9E1A14E01A1CFB21343A3F
-:10F4C0000A4206D1002723683E1C5D682369ED1AB5
-:10F4D00008E0332BE3D1FBE6012217F0E9FB00251E
-:10F4E00001272E1C0023A3609E420BDC10E0042E9B
-:10F4F00003D1462DE6D0482DD9D09A603CE00027B4
-:10F5000001260025301C04F085FB23699E1B266123
-:10F51000002F19D02368019A5B68934204D2131C10
-:10F520002269981A04F086FB226823699168C8183A
-:10F530005168C91A04F04AFB236858682369C01A45
-:10F54000401B04F067FB08E0002D15DD2368291C33
-:10F5500098682369C01804F039FB2369ED18256108
-:10F560000AE02E1C0FE0C04650270020264303006F
-:10F570003CD30200882E00200126764203E00127BA
-:10F58000002EBFDCC6E7301C05B0F0BD38B5051C49
-:10F59000141C17F0AAFA024B2560636038BDC04600
-:10F5A000A96A020010B50C1E7F2C06D8012117F0A5
-:10F5B00004FB002844D0047042E0224B99420FD84B
-:10F5C000022117F0FAFA00283AD04022A309524249
-:10F5D000134303703F231C40BF3B1C4344702FE088
-:10F5E000194B994214D8032117F0E7FA002827D0C5
-:10F5F0002022230B52421343037080213F23A20990
-:10F6000049421A401C400A430C434270847017E080
-:10F61000042117F0D2FA002812D01022A30C524273
-:10F620001343037080213F23220B49421A400A43AF
-:10F630004270A2091A401C400A430C438270C470F5
-:10F6400010BDC046FF070000FFFF000007B5034BD9
-:10F65000009068460193F7F76BF907BDA96A0200AD
-:10F6600010B5041CF4F7BCFC074B021C9C33074983
-:10F670001B68074815F0C5F9FAF712FB012C01D1F8
-:10F68000FAF72EFB034810BD882E00202D7A0300C8
-:10F690003CD3020094BA020008B5FAF72BF80148EF
-:10F6A00008BDC04694BA020008B5FAF71BF8014835
-:10F6B00008BDC04694BA020010B586B0041C03A968
-:10F6C00002A804AA05ABFAF72BFD049B0748009398
-:10F6D000059B07490193029A039B15F092F9012CAF
-:10F6E00001D1FAF759FD034806B010BD3CD3020022
-:10F6F000427A030094BA02008023044A5B051B6926
-:10F70000107858438023DB02181A7047FE2D002022
-:10F710008023044A5B051B69107858438023DB0271
-:10F72000181A7047FD2D002038B5084DC4012B680C
-:10F730000021181915F0FBFD2868054B00197F30D2
-:10F7400000781B788342F0D238BDC0466C27002079
-:10F75000FF2D002010B5C379041C002B08D0064BE8
-:10F7600000791B68C00118180130A17915F0DFFD80
-:10F770000023237210BDC0466C27002008B5034942
-:10F78000034815F02FFEF0F746FDC0468A7A0300C5
-:10F79000D8E50200021C124B10B518685379DB0142
-:10F7A000C3181C1C7F342178FF2908D11179C901A5
-:10F7B00041184978FF2910D0907988420DD091796D
-:10F7C0005B1801315878CBB27E2B01D0937106E0E3
-:10F7D000002393712378537101E00120404210BD52
-:10F7E0006C27002038B5F8239B021A784D2A01D0E7
-:10F7F0008023DB02802580206D052C69C0026442D5
-:10F8000023402C6929691C1B001B0AF0F3F82A4BC2
-:10F810002A4A18702B69E518AD185B421D4028492B
-:10F82000284B294A5B1A9B18802252059D4202D21E
-:10F830001369ED18F3E78020C0021169401B0AF03C
-:10F84000D9F80122214B641B1870E411204BE4B25B
-:10F850001C70204B1A6000221F4B5A6059681D4AC9
-:10F860000029FBD0A123DB00D358DBB2A342F2D2A4
-:10F870001A4901330B7001235360FFF73DFF0378F2
-:10F88000051C174CFD2B09D180235B051869154B0E
-:10F89000C009C018C001281820600BE0FFF738FF2E
-:10F8A0000378803DFD2B04D0FFF732FFFD2115F0DA
-:10F8B0003EFD256038BDC046FD2D0020FF87FFFFBF
-:10F8C000000000202801002008B10300FE2D0020C8
-:10F8D000FF2D002000D00040FCD00040FC2D002077
-:10F8E0006C270020FFFFFF01F0B585B0264E274AA8
-:10F8F0003478274D201C137829680133029603922F
-:10F90000C201525CFF2A3DD00130C0B2984200D102
-:10F910000120A042F4D1802300275B051B69DB098D
-:10F920000193E3010093009A2B689E183278301CF3
-:10F9300053425341FF1815F010FD002809D0002351
-:10F94000019A934218D0DA01B25C002A01D1013346
-:10F95000F6E7039B01341B78E4B201339C4200D1EB
-:10F960000124029B1B78A342DBD1072F02D917F099
-:10F97000C0F9BBE7FF2005E02868009BC01815F020
-:10F98000E2FC201C05B0F0BDFC2D0020FF2D002066
-:10F990006C270020F7B5071C0D1C01240E4B1B78AB
-:10F9A00001930E4B1E68019B9C4211D8E101711816
-:10F9B0000B78FE2B09D18B78AB4206D10331381C72
-:10F9C0002A1C1BF0D8FB002804D00134E4B2EAE77B
-:10F9D000FF2000E0201CFEBDFF2D00206C27002032
-:10F9E00008B5054A03791268DB01D318D81C997849
-:10F9F0000022F2F723FE08BD6C270020F0B585B089
-:10FA000002900D1C171C039378294DD8FFF7C2FFF5
-:10FA1000031C041C002F2AD0254EFF2805D0326875
-:10FA2000C301D018002115F082FCFFF75DFF041E12
-:10FA3000FF2C05D11F49204815F0D4FCF0F7EBFB53
-:10FA40003368C0010190FE21181815F070FC33686E
-:10FA5000019AE9B29818023015F069FC3068019BF0
-:10FA60000299C01803302A1CFBF792F802E0381CF8
-:10FA7000FF2B1AD00C2015F0E9FC039B002B01D0C2
-:10FA80000E4B00E00E4B0360094B04711B68447180
-:10FA9000E4011C19A378C771023383710123037237
-:10FAA0006B461B7B437200E0002005B0F0BDC046F2
-:10FAB0006C270020A77A030088E7020060CE0200CE
-:10FAC000A8CE020007B501A9F3F770FA0199FFF774
-:10FAD00061FFFF2805D10549054815F083FCF0F7C3
-:10FAE0009AFBFFF721FE03480EBDC0468931030093
-:10FAF00088E7020094BA0200F7B50192027A061C68
-:10FB00000091002A01D1FFF739FEC579002D06D1F9
-:10FB1000214A17680279D201D25D002A23D1092235
-:10FB200001201A60404236E03279D201BA18527888
-:10FB3000FF2A24D0D21A944200D9141C019A521BD5
-:10FB4000944200D9141C002C24D0009AC9185019D2
-:10FB50000131221C1BF01EFBB379E318DBB27E2BB4
-:10FB60000FD0B3712D1971797E24C90179180A1C3F
-:10FB70007F32B3791278E41AFF2ADFD1D4E7002468
-:10FB8000DCE70023B3717379DB01FB187F331B784B
-:10FB90007371E7E7281CFEBD6C270020F0B585B027
-:10FBA0000393037A041C01910292002B01D1FFF709
-:10FBB000E5FDC379002B07D02B4A03791268DB01DE
-:10FBC0009B5C029F002B1CD1092341E060793368C4
-:10FBD000C0011818291C7F3015F0A9FB3368ED010E
-:10FBE0005819617915F0A3FB63793268DB01D318EA
-:10FBF0007F331B786371009A019B944663440193A1
-:10FC0000BF1A002F29D07E22A3790097D21A9742DB
-:10FC100000D90092144E60793268C0011018C018E3
-:10FC2000009A01300199FAF7B3FFA379009AD3182B
-:10FC3000DBB27E2B13D10023A371FFF755FE051E07
-:10FC4000FF2DC3D12079FFF76FFD002323721C2302
-:10FC50000120039A4042136003E0029801E0A3717F
-:10FC6000C9E705B0F0BDC0466C270020002038B5BC
-:10FC7000011C13F05BFF0124051C0C4B1B78A342F5
-:10FC800012D30B4AE3011268D3181A78FE2A08D15E
-:10FC90009978D81C0022F2F7D1FC011C281CF5F73A
-:10FCA000D1FF0134E4B2E8E7281C38BDFF2D002065
-:10FCB0006C27002013B501A9F3F778F90199FFF734
-:10FCC00069FEFF2805D10F490F4815F08BFBF0F7AF
-:10FCD000A2FA0E4B1C68C301E31859789B780233D3
-:10FCE000DAB20023C00120187F300078FF2803D04B
-:10FCF0009B1A7E330022F5E7881AC01817F076FFAA
-:10FD000016BDC0468931030088E702006C27002039
-:10FD100008B5024A024B15F0F4FC08BD95F7000047
-:10FD200055F7000000220F4B1A60031C0E4A1233D5
-:10FD3000FF33811800225A701A7004338B42F9D1B4
-:10FD4000011C031C09310833FF3100221A709A701C
-:10FD50005A70DA7004338B42F7D1C3237F329B0091
-:10FD6000C254704770270020110300000023F7B52C
-:10FD7000071C1C1CA200BA18FF32517C7F2951D0ED
-:10FD8000927C651C9B18DBB2EF2B2AD9EBB2019356
-:10FD9000C1239B00FE187D23351C0093009B019A14
-:10FDA000934209DB281D291C04221BF0F3F9009B58
-:10FDB000043D013B0093F1E7002395007D19FF35D9
-:10FDC0006B74AB74EB742B757D250234E4B2A542E1
-:10FDD0001CDB301D311C04221BF0DCF9013D043E0C
-:10FDE000F5E77D291BD8104A525CD20717D5C123ED
-:10FDF0007D269B00ECB2FD18A64207DB281D291CBE
-:10FE000004221BF0C7F9013E043DF5E77E23A20062
-:10FE1000BA18FF32537400239374D37413750134EA
-:10FE2000E4B2A7E7F7BDC046007C0300012110B58E
-:10FE30004B1EDBB29B00C318FF335A7C7F2A15D0C0
-:10FE40000B4CA25C520602D40131C9B2F0E75A7DD4
-:10FE50007F2AF9D0A25C7F2AF6D9DA7D002AF3D076
-:10FE600054B2002CF0DB0132DA74EDE710BDC0466D
-:10FE70005F7B0300031CF7B54B4A1333FF33821833
-:10FE80000021197004339342FAD10B1C5AB2002A94
-:10FE900001DA464A7DE0021CFC321769B94205D3FB
-:10FEA0007F2244339B001A5401207CE0D668755CA5
-:10FEB000602D01D9203DEDB24C1CE4B2BC4223D0F0
-:10FEC000325D0092602A02D9203AD2B20092232DEC
-:10FED0001ED1009A303A092A01D9354A59E0023137
-:10FEE000CCB2BC4204D3FF2AF7D84270211CCDE724
-:10FEF000315D0D1C303D092DF5D80A256A430134CA
-:10FF0000303A5218E4B2ECE7232DE6D000220092FA
-:10FF10000026F7B20197274FF25DAA4214D1264A74
-:10FF2000B25C94462A2A0FD0009A94450CD16C46B4
-:10FF30009A0024798218FF325474447801330231D4
-:10FF40001475DBB2CCB2D1E70136512EE1D10022DB
-:10FF5000194ED1B2965D2A2E0BD1BE5CAE4208D1AD
-:10FF60009A008218FF325174417801331175DBB267
-:10FF7000BCE70132512AEBD1493A1049895CA942C8
-:10FF800004D0002A04D0013AD2B2F6E7002A04D104
-:10FF90000B4A0C4B00201A6005E0191C4331890004
-:10FFA00041188A70A2E7FEBD120300004E7C0300D8
-:10FFB000607C0300BD7A03000E7B03002D7D0300EF
-:10FFC0006E7C03001C0000201130FF3003787F2B73
-:10FFD0000AD002228256002A01DC044A00E0044AC8
-:10FFE000D35C43700430F1E77047C046DD7C03000A
-:10FFF000B07B03000023F0B589B001900093009B13
-:020000040001F9
-:10000000019A9B00D3180393FF335E7C7F2E00D1AF
-:10001000C6E064498A5D900702D4009B0133BDE0CD
-:10002000D2074BD4009A7D25571C721CD2B2049281
-:100030005D4AFFB2921952780592DA7C1B7D0692D6
-:10004000C122920094460793019B63441C1C0293B7
-:10005000BD4207DB201D211C04221BF09BF8013D43
-:10006000043CF5E7019BBF00DF196B461B7CFF37A3
-:100070007B746B461B7DB51CBB746B461B7EEDB25F
-:10008000FB746B461B7F3B75009B9C1C464BE4B28C
-:100090009E19B7787D26039BFF33DA7C1B7D039284
-:1000A0000493A6426CDB029B0422181D191C1BF052
-:1000B00071F8029B013E043B0293F2E7009A013281
-:1000C000D2B2131C019844339B001B5C002BF6D06A
-:1000D000009A571C7F2B07D0CA5C120702D4243B1E
-:1000E000012B01D8FBB289E7731CDBB204932E4BC2
-:1000F0007D259B195B78FFB20593039BFF33DA7C68
-:100100001B7D0692C122920094460793019B634493
-:100110001C1C0293BD4207DB201D211C04221BF086
-:1001200039F8013D043CF5E7019BBF00DF196B4640
-:100130001B7CFF377B746B461B7DB51CBB746B4609
-:100140001B7EEDB2FB746B461B7F3B75009B9C1CBA
-:10015000154BE4B29E19B7787D26039BFF33DA7CFA
-:100160001B7D03920493A6420ADB029B0422181D06
-:10017000191C1BF00FF8029B013E043B0293F2E7AF
-:10018000019BA4001C196B46FF346574A7741B7B8C
-:10019000E3746B461B7C2375009B0333DBB22DE7B6
-:1001A00009B0F0BD5F7B0300DD7C0300F0B50025E6
-:1001B00087B00190019AAB00D3180293FF335A7CA9
-:1001C000002A00D12EE17F2A00D155E1AB496C1CF9
-:1001D000895CC8062AD5DA7C7D260492202211404B
-:1001E0004A424A4115218A1A0392C1221B7D92007C
-:1001F0000593019BE7B29C18BE4207DB201D211C22
-:1002000004221AF0C7FF013E043CF5E7019BBF0042
-:10021000DF196B461B7BFF377B740023BB746B4677
-:100220001B7CFB746B461B7D3B75ADE018264E2A8C
-:1002300002D04F2A23D11B26DA7C7D2702920D2281
-:100240005A74C1221B7D92000393019BE4B29D1856
-:10025000A74207DB281D291C04221AF09BFF013F3F
-:10026000043DF5E7019AA300D3180022FF339A74E6
-:100270006A46127A5E74DA746A46127BB1E0502ADA
-:1002800001D11C26D8E7C90933D0D97C002930D048
-:10029000E4B2211C019844318900095C002928D16D
-:1002A000A91CC9B20391890041180F1CFF37787C43
-:1002B0007F281ED0714E305CC0091AD0F97C00290D
-:1002C00017D0C1227D26019B92009D18039B9E4260
-:1002D00007DB281D291C04221AF05CFF013E043DA7
-:1002E000F4E71F237B740023BB74FB743B75251C50
-:1002F00060E76C1C172A12D1597B6A1ED2B24529BD
-:1003000001D11B3902E0392902D10D3959738DE031
-:100310005A4A525CD20900D1ACE01222A9E0182A54
-:1003200007D15A7B55498A5C7F2A00D8A2E0132264
-:100330009FE0202A05D15A7B3C2A00D09AE0262251
-:1003400097E0482A09D15A7D7F2A03D04B498A5C1D
-:1003500092060FD44B225A740CE03C2A0AD15A7DE3
-:100360007F2A00D186E045498A5C920600D581E06B
-:100370003F227EE05A7C4149895CC90704D5597BFC
-:1003800020294BD10C3A74E0029B6C1CFF335A7C41
-:10039000352A06D15A7B3A498A5C52076AD510221F
-:1003A00067E02A2A1FD1C1227D26DF7C1B7D9200B7
-:1003B0000293019BE4B29D18A64207DB281D291C6D
-:1003C00004221AF0E7FE013E043DF5E7019AA3007E
-:1003D000D3182B22FF335A7400229A746A46DF74B2
-:1003E000127A1A7583E72C2A18D1C1227D26DF7C68
-:1003F0001B7D92000293019BE4B29D18A64207DB8D
-:10040000281D291C04221AF0C5FE013E043DF5E713
-:10041000019AA300D318FF332D22DCE7452A04D02C
-:10042000392A02D00135ECB261E72A1C111C01986F
-:1004300043318900114B095C6C1C595C7F2919D927
-:1004400001320199D2B292008A18FF32517C002900
-:1004500006D05B5C7F2B0DD9D37C002B06D009E046
-:10046000527D7F2A06D09B5CDB0903D01E22029BB3
-:10047000FF335A74E4B23AE707B0F0BD5F7B030084
-:10048000007C0300F7B501214C1EE4B2231C443369
-:100490009B001B5C7F2B2CD0554DEB5CDB0702D403
-:1004A0000131C9B2F0E7231C013BDBB2002B21D0A4
-:1004B0001A1C44329200125C7F2A03D04D4EB25C6B
-:1004C0007F2AF1D99A008218FF32567C7F2E0BD0FA
-:1004D000AF5DBF0603D5474FBE5D760704D5967C5A
-:1004E00077080136F61996740133DBB2A342E9D1DD
-:1004F000D6E700239A008218FF32517C7F2976D0FC
-:100500003C4D6E5CF40933D04127591CC9B28C00B4
-:100510000419FF34667C0194BC467F2E01D0AF5D88
-:10052000BC464024AF5D27420FD1123E012E01D9B7
-:100530000B1CDFE70233DBB244339B001B5CEB5C3C
-:100540002342F5D0937C013B08E063465B0707D468
-:100550006346DB07ECD5937CDC081B1B9374E7E751
-:10056000019B9B7B5A1C9B08D318019A9373DFE76E
-:100570001F4C645C21070FD50133D9B28B00C3181F
-:10058000FF335A7C7F2AD3D0AA5C9207D0D50622AB
-:100590009A74013A9A73CBE702210E421BD01C1CBD
-:1005A0000134E4B2211C44318900095C0029F7D0F0
-:1005B00001337F2919D00F4D695C890715D5A40037
-:1005C0000419FF34A17C49080131A174947C6408AA
-:1005D0000134947409E0E40606D5547B2C5D0C428A
-:1005E00002D0917C023991740133D9B2A0E7F7BDF2
-:1005F000007C03005F7B030070B5041CFFF792FBD7
-:10060000201CFFF737FC231C0022FC33011EDA609C
-:100610001A61914244D0261C224D11362B68FF36B8
-:10062000934203D02048311CF9F7F4FB201CFFF75C
-:10063000BDFD201CFFF7FAFB201CFFF7C5FC201CAA
-:10064000FFF720FF201CFFF7D5FCC422331C9200CB
-:10065000A1181A78502A06D97F2A07D0134A144BBA
-:1006600000211A601CE004338B42F2D12B68002B6E
-:1006700002D0104811F03CFA201CFFF777FB2B68E2
-:10068000002B03D00C48311CF9F7C4FB201C16F0DA
-:100690009AFB074B094918681AF094FE4142414100
-:1006A000081C70BD48270020857C0300947C030053
-:1006B0001C000020BA7C0300CA7C03002F2F03001B
-:1006C000F7B5CC1CA400071C201C0E1C019214F0D2
-:1006D000BDFE221C051C054B4760866003600C3A7A
-:1006E00001990C301AF056FD281CFEBD1CF60200C4
-:1006F00010B5041C0C2014F0A9FE034B44600360E9
-:100700000223037210BDC0460CF8020010B5041C91
-:10071000102014F09BFE044B0360237A037163687E
-:1007200083600023C36010BDA4F7020010B5041C51
-:10073000102014F08BFE044B84600360034B436075
-:100740000023C36010BDC046D8C30200D56E0200AE
-:1007500008B5043014F039FD004808BD94BA020011
-:10076000F8B5041C0D1C0B7A124A9B00995814F022
-:100770007CF81149201C14F078F8281CFFF7C6FFFC
-:100780000126071C381C16F0AFFB051E0CD0002EEE
-:1007900003D1201C094914F068F8201C291C0122EF
-:1007A000F0F77AF90026EDE7201C054914F05DF812
-:1007B000F8BDC04664F60200367D0300172803002A
-:1007C000397D0300F7B50B681C4A041C0D1C9342CD
-:1007D00003D01B495A6814F014F9201C194914F06D
-:1007E00044F8002301270193281C01A916F05DFBA2
-:1007F000061E15D0002F03D1201C134914F035F824
-:100800000122201C3168F0F747F91049201C14F030
-:100810002CF8201C71680122F0F73EF90027E3E76D
-:10082000201C0B4914F021F82B68044A934203D092
-:10083000201C084914F019F8F7BDC046C4F60200A0
-:100840003C7D0300407D030017280300432803007C
-:10085000F5720300CE260300002806D001280BD134
-:100860004B68DB085B00184307E007224B6803482E
-:10087000934302D1024800E0002070475CC30200AD
-:10088000A0C3020038B5151C1A1C1C1CFAF71AF874
-:10089000002802D04368002B0ED12B1E08D1094B33
-:1008A000022C05D10849094814F09CFDEFF7B3FC70
-:1008B000012C05D1436003E0022C01D100224260EB
-:1008C000181C38BD94BA0200427D0300B8EB020048
-:1008D00030B5002585B001A9041C019516F0E5FA94
-:1008E000A84205D10A490B4814F07CFDEFF793FCB0
-:1008F000636802A9083B636003680293436803933B
-:10090000042328C00220F4F7CDFD05B030BDC04659
-:100910004A7D0300B8EB020073B50C1C151C1B28A4
-:100920000BD000231F2839D1081D111C0022F9F714
-:10093000C9FF1B4B002831D118E00323194208D10D
-:100940000A6818498A4204D12B4002D12968914291
-:1009500024D0154BAA0721D1144A296891421DD1F0
-:1009600062686B6853400722934301D00E4B15E039
-:100970000193201C01A916F098FA061E0DD0281D1F
-:1009800031680022F9F79EFF031EEFD070685968A6
-:10099000F0F700F90028ECD1E8E7014B181C76BD10
-:1009A0005CC3020088F60200A0C30200C4F6020085
-:1009B000F0B51368141C012287B00F680D1C00925B
-:1009C000D9080223061CF3F7FFFD022E22D10323D0
-:1009D0006868034016D10268D1682C4A914211D14F
-:1009E0002A68904216D00593686805A916F05DFA4A
-:1009F000061E0FD0381D31680122F9F763FF7368B6
-:100A00004360F1E7F6F73CFE03900398F6F786FEA5
-:100A1000002801D1002526E0F6F732FE051CF6F786
-:100A20007DFE0290281CF6F779FE061C281CF6F7BE
-:100A300075FE029B002B03D0002E01D0002805D0AC
-:100A40001349144814F0CEFCEFF7E5FB381D02996A
-:100A50000122F9F737FF4660D7E7A368EE009959FE
-:100A6000002904D1013563689D42F6D30AE00429C8
-:100A7000F8D0381D0122F9F725FFA3689E19736885
-:100A80004360EFE7044807B0F0BDC046510B0100DA
-:100A9000697D0300D8E5020094BA020010B5041C79
-:100AA0000C2014F0D3FC034B44600360002303725A
-:100AB00010BDC0460CF8020010B5041C0C2014F048
-:100AC000C5FC034B446003600123037210BDC046A4
-:100AD0000CF8020008B504300022F9F7F3FE0028F4
-:100AE00005D10449044814F07DFCEFF794FB4068FD
-:100AF00008BDC046427D0300B8EB020008B5024BBA
-:100B000008C014F043FB08BDC4F60200F8B5071C8A
-:100B100048680E1CF6F7B4FD041CF0F7A9F90B4D5C
-:100B2000022F00D9B568002800D0401016F030FA26
-:100B3000061C201CF6F7F2FD011E05D0301D012217
-:100B4000F9F7C0FE4560F4E7301CF8BD94BA020026
-:100B5000F0B5071C89B000201E1C0D1C019216F078
-:100B600017FA0E4B041C07609F4203D1042203793D
-:100B700013430371019B2B430DD03368AA00B218B5
-:100B800005A801990394049314F012FB681C03A9AF
-:100B900005AAFFF70DFF201C09B0F0BD88F6020082
-:100BA00008B5002A02D116F036FA11E0042A0DD158
-:100BB00004300022F9F786FE002805D105490648D1
-:100BC00014F010FCEFF727FB406802E016F019FA6A
-:100BD000024808BD427D0300B8EB020094BA02004F
-:100BE00038B5151C041C16F070FA2A1C201C02498A
-:100BF00016F01CFA38BDC046AD70020038B5437916
-:100C00000D1C0024032B06D9836A074C9200E41ABA
-:100C1000C369D358E418032116F048FA447024122B
-:100C20000570847038BDC046FD7F0000F8B5002314
-:100C3000041C617183608371E260036101330F1CE6
-:100C4000151C4361032906D80121836949429A0092
-:100C5000C0691AF0BCFA0023A36223622A8C6B8C51
-:100C6000D3180122002B00D01A1C364E201C311C38
-:100C700016F0DCF9AA8C201C311C16F0D7F9E368B9
-:100C8000201C197E16F00BFAE368201C997E16F0E2
-:100C900006FAE368201C197F16F001FAE368201CAD
-:100CA000997F16F0FCF9042F07D1636A226A201C91
-:100CB0009A1A311C16F0BAF903E0201C022116F032
-:100CC000E2F9311C201C2A6916F0B0F9311C201CF5
-:100CD000EA6816F0ABF900262B8D9E420BDAEA6A21
-:100CE000F300D3181A78032A03D19978201C16F040
-:100CF000ECF90136F0E7201CFF2116F0E6F9042F8D
-:100D00001FD10022698BAB8BC9188A4219D00020F1
-:100D10002E8DB0420CDAEF6AC300FB185F78FF0734
-:100D200004D55F88974201D15B6802E00130F0E7AB
-:100D300002230626DB003343666B900083510132A9
-:100D4000E3E7F8BD8770020013B54379012B2FD07C
-:100D50008268041C002A03D01648174913F051FE7C
-:100D6000201C002116F09BF96379032B13D1226A12
-:100D7000D01C9843A36A20626062E362C01814F03A
-:100D800077FBE3682063588B9B8BC018800014F0BE
-:100D90006FFB60630CE0042B0AD1E368616AE26ACE
-:100DA0005218197E00915869216B636BF7F720FA8E
-:100DB00013BDC0463CD30200BA7D0300224BF7B5F9
-:100DC000A0331B68022B3ED84469A1423BD9051CC5
-:100DD000836A026901919E1A0C1B331C23432ED097
-:100DE0000096062C10D81F2E01D91F230093271E12
-:100DF000032F00D90327281C012116F044F9009A7B
-:100E00007B011343037016E00F2E01D90F230093CB
-:100E10000E4B271E9F4200D91F1C0221281C16F0D2
-:100E200032F98023702200995B4219433B09134039
-:100E30000B4303704770009BE41BF61ACDE7AB6AC7
-:100E40002B61019B6B61F7BD882E0020FF0700001E
-:100E500038B5041C0D1C012116F007F9201C0F2DBC
-:100E600005D0102D05D010210E2D06D102E0112144
-:100E700000E0122116F029F90DE0172116F025F9EE
-:100E80000322A36A201C03339343A362042116F0B8
-:100E90000DF9014B036038BD38BD0200F8B5061CE2
-:100EA0000D1C141E124F11D1111C16F0DEF88023F8
-:100EB0001B021D4203D0301C322116F006F92A1CF9
-:100EC000301C3A403521FFF799FE0FE03A1C0A40EA
-:100ED0004621FFF793FE80231B021D406A1E9541A9
-:100EE000ED012C43E1B2301C16F0EFF8F8BDC0461E
-:100EF000FF7FFFFFF0B5051C89B002AF0E1CBA6082
-:100F00003B60F3F789F8AB687B611423F81813F0A2
-:100F1000EEFF14237860F81813F0E9FF0323584319
-:100F20007B68C0188300FB602C2B0AD86B46F868DE
-:100F30002A30C008C0001B1A9D46002302ACFB608B
-:100F400005E0F8681C3014F08EFA041EEED0AA6892
-:100F50007B69201C9B1A63607B68321CA3613B6821
-:100F6000291C0093BB68F7F7ABF9184E201C736877
-:100F7000002163616B687360F9F752FE6369B860C2
-:100F80007360002802D0022803D00BE0E3681D68DC
-:100F900009E07B6805339B00E3185D68FB68002B64
-:100FA0000CD005E00A4DFB68002B0AD00023BB6083
-:100FB000201C14F072FABB68002B02D0281CEFF73B
-:100FC0002AF9281CBD4607B0F0BDC046882E002077
-:100FD00094BA02000122031C30B5134085B04510BD
-:100FE000002B4ED128491D1C88424AD0274B9842DD
-:100FF00047D0274B151C984243D00323041C0340C1
-:1010000006D1244A0168914202D116F02CFE0EE06E
-:10101000214A251C2240062A05D0002B09D11F4B4E
-:1010200022689A4205D1201C01A9F1F7BFFF051CD7
-:1010300027E0201CEFF716FD194B984207D1FF233C
-:10104000DB05E0180323984309F0A2FDEFE7154BF9
-:10105000984205D1201C694601AA12F0D1FA0FE08E
-:10106000114B984205D1201C694601AA12F076FD69
-:1010700006E0201C01A9022211F04BFD002800D03F
-:10108000019D281C05B030BD94BA0200A0C3020027
-:101090005CC302004CB90200070080FF40EC020074
-:1010A000A4CD020070CF0200FCD10200F0B585B0E3
-:1010B000051C0E1C029203931F4F002804D04368A6
-:1010C0000193002903D125E0002903D00190019B61
-:1010D000581C01E0081C01910430800014F0B6F99E
-:1010E000164B041C03607B684360029B8360039B78
-:1010F000C360002D07D0291C201C019B08319A00D9
-:1011000010301AF047F8002E13D0019B04339B00D7
-:101110001E510EE0019B181D800014F097F9074B3B
-:10112000041C03607B684360029B8360039BC36075
-:10113000E1E7201C05B0F0BD882E002050F9020028
-:1011400070B5061C10200D1C141C14F07FF9034B05
-:10115000466085600360C46070BDC046D8F8020078
-:10116000F0B5051C8BB008680C1CF1F709FF049062
-:1011700004A816F088FC0027049B03900693069BA6
-:101180001978002912D0081CEFF7FCFA0126002874
-:1011900007D006A816F089FC069B1B78732B00D09D
-:1011A000061C069BBF1901330693E8E7381CF4F7C9
-:1011B00079F90122009007A96068EFF7FDFE079B0F
-:1011C000089A05939B1801920293022D0AD9A068F0
-:1011D000EFF732FD002802DA089BC01826D4059BE1
-:1011E0001818059000240DE0291CF1F73FFA059B23
-:1011F000009A5D19A31C9B00059501349850049B2F
-:1012000001330493BC4230D2049B187800282CD0C0
-:10121000EFF7B8FA0125002803D004A816F045FC22
-:10122000051C0598029A43199A4205D210491148A3
-:1012300014F0D8F8EEF7EFFF049B1B78732BD3D094
-:10124000009BA6009E190195019B0436002B0AD035
-:10125000049B0398197805AAF3F78CFD019B706035
-:10126000013B0193F0E76419C9E700980BB0F0BDAA
-:10127000E67D0300D8E50200F0B589B00391019244
-:101280001E1CF1F77DFE049004A816F0FCFB00255F
-:101290000290B5424ED2049B187800284AD0EFF74E
-:1012A00071FA0124002803D004A816F0FEFB041CE8
-:1012B000039B019A1B199A4205D21F491F4814F03B
-:1012C00091F8EEF7A8FF049B1B78732B04D02D191F
-:1012D0000E9BAF00DF191CE00E9B6F1CAD00E858A1
-:1012E00005A90122EFF768FE069B251E9D4200D945
-:1012F0001D1C2A1C0599039819F04CFF039B621BC7
-:101300005819002119F063FF039B3D1C1C1903941D
-:101310000CE0002C0AD0049B02981978A3005B42D1
-:10132000FA5803ABF3F78EFD013CF2E7049B01335F
-:101330000493AEE709B0F0BDE67D0300D8E50200F6
-:10134000F0B50E1C89B0039001CE0F1C16F0C3FB44
-:101350004410211C04A815F0DFFB069D221C281C4C
-:10136000002119F034FF039B00962A19013B3868CD
-:10137000291CFFF781FF04A90248F1F729F909B0F8
-:10138000F0BDC04644C2020030B50C1C89B0051C3B
-:101390000222486805A9EFF70FFEA068EFF74CFCA2
-:1013A000002809DA069B0393C01805D509490A48A5
-:1013B00014F018F8EEF72FFF059B069A1918201C59
-:1013C0000C309A180090EB1E2068FFF755FF034879
-:1013D00009B030BDE67D0300D8E5020094BA0200F2
-:1013E00010B5102014F032F8041C034B08C012F0A2
-:1013F000DAFC201C10BDC0464CB9020038B50528E7
-:1014000027D80D1C08F0D8FA05250D03141C081C5C
-:1014100020E0081D12F0F3FD031E0F481AD00F48FC
-:1014200018E0081D13F00AF901214000084311E0FB
-:10143000FFF7D6FF291D041C043012F016FE06E04B
-:10144000FFF7CEFF291D041C043012F01EFE201CE5
-:1014500000E0002038BDC0465CC30200A0C302000B
-:1014600038B5051C83070CD1104B02689A4208D18D
-:10147000FFF7B6FF041C291D043012F0EBFD201C01
-:1014800012E0281CEFF7D8FBC0231B06984205D1B9
-:1014900080200021C00516F09AFB05E0C317C01894
-:1014A000584001234000184338BDC0464CB90200E3
-:1014B00038B5051C0BF0B4FE012802D10F481049C5
-:1014C00003E0002805D10F480F49FAF7FFFBEEF7BC
-:1014D000A2FE281C11F07EFA002806D1281C09F073
-:1014E00057FB01244000204307E0FFF779FF041C6D
-:1014F000291C043012F0D6FC201C38BD04EB02007D
-:10150000F77D0300D8E50200107E030007B5C3078E
-:1015100001D540100DE0043001A9F5F759F8002875
-:1015200001D0019805E00349034813F05BFFEEF793
-:1015300072FE0EBD297E030004EB0200F0B58DB0F3
-:101540000190012008400D1C171C041E07D04B10F1
-:1015500003A802A9022212F065FC03AE08E00323EF
-:101560000B4065D19A4A0968914200D025E12E1DB1
-:10157000FB0707D57B1003A802A9022212F052FC38
-:1015800003AD1AE003231F4205D1914A3968914205
-:1015900001D13D1D11E03B40022B00D011E18D4BEC
-:1015A0003B40062B00D10CE1301C13F09AF83A1C9A
-:1015B000011C0198F3F730F908E1019B092B01D0D8
-:1015C000162B16D1281C12F01AFD00283DD1301C14
-:1015D00013F087F8041C281C13F083F8011C201C4E
-:1015E00008F034FE0323022498437B4B0443E018A5
-:1015F000ECE0019B182B00D9BAE0FFF7F1FE041CC8
-:10160000019808F0D9F96A706476760D10171DDC20
-:10161000478E946A706476760D10171DDC478E0035
-:10162000201D311C4FE0201D311C2A1C12F0FFFD33
-:10163000201CCBE0201D311C2A1C12F039FFF7E7DB
-:10164000281C12F0DCFC002802D06448644957E0F2
-:1016500006A8271D12F0A7FB321C2B1C381C06A95C
-:10166000F4F760FE2A7833785340DB070ED506A8DE
-:1016700012F0C5FC002809D1012109A8494212F045
-:10168000C7FB381C391C09AA12F096FD06A812F0F7
-:1016900096FBCDE7281C12F0B2FC0028D5D109A892
-:1016A000271D12F080FB321C2B1C09A8391CF4F7F3
-:1016B00039FE09A812F083FB2A7833785340DB0700
-:1016C000B6D5381C391C2A1C12F076FDB0E7201D57
-:1016D000311C2A1C12F0F3FDAAE7201D311C2A1C24
-:1016E00012F06DFEA4E7201D311C2A1CF4F7A6FDA4
-:1016F0009EE7381CFFF70AFF021E05DA39483A490F
-:1017000013F070FEEEF787FD019B201D311C032BAB
-:1017100001D0102B02D1F4F725FD89E712F0ECFC83
-:1017200086E7201D311C2A1C12F045FF80E7281C8B
-:1017300012F065FC002888D1FFF752FE271D0190AA
-:10174000321C2B1C0430391CF4F7ECFD2A7833785A
-:101750005340DB0704D5381C391C2A1C12F02CFD21
-:10176000019B09A9022009930A94F3F79BFE2DE03F
-:10177000301C291C12F048FC019A031C193A002065
-:10178000042A23D8101C08F017F90307130B0F00C5
-:101790001648002B1ADA0EE01448002B0BDC15E07B
-:1017A0001248002B12DC06E01048002B03DA0DE093
-:1017B0000E48002B0AD10E4808E0181C06E0002055
-:1017C00004E00198291C3A1CEEF78AFE0DB0F0BD2A
-:1017D0004CB90200070080FF0000808034EA02005C
-:1017E000032F0300D8E50200E2330300A0C3020088
-:1017F0005CC302000023820708D102680449013358
-:101800008A4203D0034BD31A5A425341181C7047E3
-:10181000B0FB020078FA020070B5061C0D1C012412
-:10182000B44206D2A3002868E95816F030FA013411
-:10183000F6E7014870BDC04694BA020010B5041C1A
-:10184000102013F003FE044B84600360034B4360DD
-:101850000023C36010BDC046D8C302006D7D0200E6
-:1018600038B5051C102013F0F1FD041C074B696806
-:1018700008C013F0BFFCAB68E968A3606B68E06860
-:101880009A0019F087FC201C38BDC046B0FB02004E
-:101890000023F7B5041C0D1C01938B0705D10B68C1
-:1018A000224FDF1B7A427A410192AB68002B09D1AB
-:1018B000019B002B03D0201C1D4912F0D6FF201CD9
-:1018C0001C492FE0019B002B03D0201C1A4912F069
-:1018D000CCFF201C194912F0C8FF002601236A68BA
-:1018E000964216D2B200171CEA68D259002A0ED0CE
-:1018F000042A0CD0002B03D1201C114912F0B5FF93
-:10190000EB68201CD9590122EFF7C6F800230136F5
-:10191000E5E7201C0B4912F0A8FF019B002B03D028
-:10192000201C094912F0A1FFF7BDC04678FA020059
-:10193000567E03005D7E0300637E0300407D03004E
-:1019400017280300F5720300CE26030008B5FFF741
-:1019500051FF002805D103490348FAF7B7F9EEF71C
-:101960005AFC08BD6E7E0300C8EA020038B50D1CA3
-:10197000041CFFF7EBFF281CF5F782FE051C281C52
-:10198000F5F7CCFE011E07D0201D002213F03CFC11
-:101990000028F4D0014800E0014838BDA0C302008F
-:1019A0005CC3020008B583070BD10368084A934261
-:1019B0000DD0084A934204D10749084813F012FD9C
-:1019C00003E007480749FAF781F9EEF724FC08BD60
-:1019D000B0FB020078FA0200847E0300FCE80200FB
-:1019E000C8EA02006E7E030038B50D1C041CFFF728
-:1019F000D9FF281CF5F744FE051C281CF5F78EFEC0
-:101A0000011E04D0201D032213F0FEFBF5E7014860
-:101A100038BDC04694BA020038B50D1C041CFFF74F
-:101A2000C1FF291C201D012213F0EEFB004838BD28
-:101A300094BA020038B50D1C041CFFF7B3FF291C33
-:101A4000201D022213F0E0FB004838BD94BA0200CA
-:101A500010B5041CFFF7A6FF201D13F05EFC014823
-:101A600010BDC04694BA020008B5012216F048F92C
-:101A7000004808BD94BA020038B5041C0D1CFFF7DD
-:101A800091FF201D291C022213F0BEFB002804D167
-:101A9000034813F09AFCEEF7BEFB024838BDC0467F
-:101AA000B8EB020094BA020010B5041CFFF77AFFED
-:101AB000201D13F014FC002805D10349034813F03E
-:101AC00091FCEEF7A8FB10BDA67E0300B8EB020068
-:101AD000F8B501280AD0002802D002280AD029E04F
-:101AE0008B681548002B26D1144824E08B685B00D6
-:101AF000184320E0032500200D4085421BD10C68CF
-:101B00000F4B281C9C4216D10E1C4F68BD420DD0B5
-:101B1000F268AB009958002906D0042904D00220AD
-:101B2000F5F74AFC401024180135EFE70120640066
-:101B3000204300E00020F8BD5CC30200A0C3020007
-:101B400078FA0200F7B5071C1020019113F07EFC13
-:101B5000051C0A4B061C08C5281C391C13F04AFB3F
-:101B60000024BC4208D0019AA300D158281C0122AD
-:101B700013F04AFB0134F4E7301CFEBDB0FB020059
-:101B8000F7B5051C0E1C171E05D0FFF70BFF1A4CEE
-:101B9000B54209D12EE0FFF7D9FEB54204D1281C89
-:101BA00016F086F8041C25E00020011CFFF7CAFF90
-:101BB000041C301CF5F764FD01900198F5F7AEFDAB
-:101BC000061E0BD0281D311C002213F01DFB00281F
-:101BD000F3D0201C311CFFF71FFFEEE7002F09D0C8
-:101BE000E86813F05AFC63686B60A368AB60E36855
-:101BF000014CEB60201CFEBD94BA0200F0B585B02C
-:101C0000041C0390029101920027FFF7F3FDB842F4
-:101C100007D13A1C2048012103AB16F0CCF8041C74
-:101C20000137029D0026281CFFF7E4FDB04207D1D2
-:101C3000321C1948012102AB16F0BDF8051C013613
-:101C4000019B002B05D0A368AA68934201D1002311
-:101C500010E0201CFFF7F2FD0190019816F086F8C5
-:101C6000011E06D0281D002213F0CEFA0028F4D160
-:101C7000EDE701230193002F02D0201CFFF7E8FEBF
-:101C8000002E02D0281CFFF7E3FE019B0348002B27
-:101C900000D1034805B0F0BDB0FB02005CC30200F8
-:101CA000A0C3020037B5009101921F2850D8151C1F
-:101CB0000C1C07F081FE10151A4D4D4D1F4D4D4D5A
-:101CC0004D4D4D10151A4D4D4D1F4D4D4D4D4D2443
-:101CD000272C393E4D43081C111C15F0F3FF38E04A
-:101CE000081C111C15F0FCFF33E0081C111C16F039
-:101CF00057F82EE06946022016F033F829E0081C58
-:101D0000111C00E0101C0122FFF778FF21E0081CE5
-:101D1000FFF71CFE281CFFF76DFD031E0D4818D0B1
-:101D2000A368AA68934214D1201C291C16F074F8E9
-:101D30000FE0081C111C16F067F80AE0081D111CC2
-:101D4000002213F061FA031E034802D1014800E0AB
-:101D500000203EBDA0C302005CC30200F7B500280E
-:101D600005D13A493A4A3B4812F04BFE6BE00D6808
-:101D7000281CEEF777FE4368061CEF2B04D16D6834
-:101D8000281CEEF76FFE061C00233349DA0050587A
-:101D9000854203D18A182F4851680AE00133602B2D
-:101DA000F3D12C4C2D4B201C9D4201D09E4203D1DF
-:101DB0002B4912F05AFD46E02A4912F022FE281C57
-:101DC0000021EEF783FE201C2749726812F019FEED
-:101DD000264B9E4203D1281C11F0C8FD0CE0244B79
-:101DE0009E4200D0351CA86B00282CD083072AD136
-:101DF000204B02689A4226D115F016F90025061EDE
-:101E0000AE4220D073689D421DD2B268EB00D31859
-:101E10001F68002F15D05B681749201C019312F032
-:101E2000F0FD381C0021EEF751FE1449201C12F081
-:101E3000E8FD01980021EEF749FE201C104912F040
-:101E4000E0FD0135DEE70F48FEBDC0461428030063
-:101E5000BC7E03003CD30200ECFB0200180303002D
-:101E600019830300358303003D830300D0CF0200B4
-:101E7000A4BE0200C4F6020079AA03004D83030049
-:101E80002743030094BA020008B50368186B0028C2
-:101E90000ED0CB0702D50368002B09D08B0702D5E3
-:101EA0004368002B04D04B0708D58368002B05D16D
-:101EB0000349044813F096FAEEF7ADF908BDC046A1
-:101EC000B3A4030088E70200F0B5012189B00190B6
-:101ED000FFF7DAFF8021061C490004A814F005FE74
-:101EE00080240023069D6400009303AB0198291C05
-:101EF000221C3768B847431C0ED103990B2904D123
-:101F0000009B1848002B21D12AE0012349001943E6
-:101F1000154813F060FA14E0002817D0009B1B1836
-:101F20000093A04202D2241A2D18DEE7802104A8D3
-:101F3000490014F029FE051E05D10B480B49F9F79D
-:101F4000C5FEEEF768F980246400CEE7009B0848E0
-:101F50000593337BDB0700D4064804A9F0F738FB70
-:101F600009B0F0BD94BA020088E70200D2A40300D1
-:101F700040EC020044C20200F0B589B00091041C9C
-:101F800008680121FFF780FF071C012C04D1009B8A
-:101F90001868FFF799FF98E0009B5868EEF74CFE31
-:101FA000051C431CF3D001243B7B23426DD0041C51
-:101FB000291C04A814F099FD00230193002C62D081
-:101FC000211C04A814F0F9FD011E04D14049414828
-:101FD000F9F77CFE1FE0009B3E681868221C03ABEB
-:101FE000B047031C061C013317D1211C04A814F0B0
-:101FF00051FE03990B2908D1059B0093002B42D178
-:1020000004A814F09CFD34485FE001234900194303
-:10201000324813F0E0F9EEF7FEF8A04202D3069939
-:10202000059C14E0211A04A814F034FE002EF6D109
-:1020300029E0101C1E3398431D3BC0280ED1019A85
-:102040009B18A3421BD8013DA34216D20193019BCA
-:10205000CA5C012350B20028F1DAEAE7101C0D3304
-:1020600098430C3BE028EAD004339A43131CF03B1E
-:102070005A425A4105239B1AE1E72C1C9DE7013B7C
-:102080005B191C1B9AE716481CE0291C04A814F0D5
-:1020900043FD009B2A1C1868069903AB3D68A847BE
-:1020A000431C09D104A814F04AFD03990A480B29DE
-:1020B0000BD049002143ABE73B7B05900848234206
-:1020C00000D1084804A9F0F783FA09B0F0BDC04672
-:1020D000E0A4030058E6020094BA020088E7020078
-:1020E00040EC020044C202007FB50C1C061C0868CC
-:1020F0000121FFF7C9FE0222051C01A96068EEF765
-:102100005BFF029A022E07D9A068EEF795FD029BAD
-:10211000021E9A4200D91A1C6B462D68206801994C
-:10212000A847431C0BD1009907480B290AD001236B
-:1021300049001943054813F04EF9EEF76CF80123F6
-:102140004000184304B070BD94BA020088E7020052
-:10215000F0B589B00191041C08680121FFF794FED5
-:10216000061C04A8012C08D9019B5B685C10631C49
-:1021700003D0211C14F0B9FC13E00124102114F049
-:10218000B4FC64420DE0019B391C1868012203ABCA
-:102190003568A847431C11D0002823D03B780A2B70
-:1021A0002AD0631C23D104A8012114F006FD071EC8
-:1021B000E9D116491648F9F789FD11E003990B2971
-:1021C00008D1059B0193012B0CD104A814F0B7FC96
-:1021D000104819E00123490019430F4813F0FBF898
-:1021E000EEF719F804A8012114F054FD04E0631E71
-:1021F000002C01D01C1CD6E7337B0848DB0700D439
-:10220000074804A9F0F7E4F909B0F0BDE0A4030021
-:1022100058E6020094BA020088E7020040EC02008F
-:1022200044C20200F7B50F1C0221041C161CFFF764
-:102230002BFE01AB4568391C201C321CA847431CEF
-:102240000BD1019907480B290AD0012349001943F2
-:10225000054813F0C0F8EDF7DEFF012340001843F6
-:10226000FEBDC04694BA020088E70200F0B5051C26
-:1022700000248BB01A4B1B48E15802F0C7FB03AB9C
-:10228000185104341C2CF5D1142300266B43009301
-:102290000024154F03AB1959381C15F03CFF0434CA
-:1022A000281C01F0E3FC01971C2CF2D109AC02AF11
-:1022B0002168019815F02FFF043C281C01F0D6FC82
-:1022C000BC42F5D10136082E05D0F307E0D40098C2
-:1022D00001F0CCFCDCE701F00FFB0BB0F0BDC04619
-:1022E00040FF0200240B03002400002008B5192041
-:1022F000FFF7BCFF004808BD94BA0200012200208D
-:10230000074B08495A600860A821DA60064AC900EC
-:102310005A5006495A5004315A5005495A5070478C
-:10232000009000400C9C0040FCFF000044050000B1
-:102330004C050000034B04481B78002B00D10348D8
-:102340007047C046012E00205CC30200A0C30200FB
-:10235000F7B5A827A9253248324B01681A68844688
-:102360008A1851181960304B00911C780193121192
-:1023700009112E4BFF000420ED002D4E002C15D02E
-:10238000002A03DA821AD8515A5102E00432585115
-:10239000DA5181229200002904DA2648511A1A5093
-:1023A00099510CE09A518122920005E00432D851F3
-:1023B0009A51812292005A5189181E4A995001223D
-:1023C0001D4CDA602378002B23D03F201B4A1C4B86
-:1023D0001168019D04330131DB6F2D7808401B5CCF
-:1023E000002D01D0803B5B0010600820009A801A0D
-:1023F0001C2253436246C3189B1013601F231940CD
-:1024000007D1104B1A78002A03D00F481970F1F742
-:10241000BDFD01222378042053402370FEBDC04639
-:10242000782700207C270020080100200090004031
-:10243000440500004C050000002E002074270020F9
-:10244000882E002007010020EF7F020038B5051C10
-:10245000081C0C1CEEF706FB094A0023904205D02D
-:102460000849094812F0BEFFEDF7D5FEE2181179D0
-:10247000EA1801331171202BF8D1044838BDC04649
-:10248000C4FF0200EEA40300C8EA020094BA0200EE
-:1024900038B5041C081C151CEEF7CEFB1F2802D90A
-:1024A0000E480F4903E0002D05D10E480E4912F0E9
-:1024B00099FFEDF7B0FE2418042D04D101232079F3
-:1024C0004000184309E0281CEEF7B6FBFF2802D9AC
-:1024D00002480649EBE72071054838BDD8E50200FF
-:1024E00005A50300C8EA020019A503003EA50300E4
-:1024F00094BA0200A02270B51E25A321104BD20071
-:102500009C58C900AC439C500E4C0F4E5C500F4978
-:102510000F4C8000195104341E510E4C1951A52145
-:102520000D4CC9005C5009490C4C40180C495850DE
-:1025300004315C500B49585099582943995070BD4B
-:1025400000F0014040910040449100400060004094
-:102550001C05000024050000489100404C910040FB
-:102560002C05000034050000074B8000C018A22392
-:10257000DB00C158054A0A40C250C25804490A4308
-:10258000C2500022C250704700600040FFE0ECFFE4
-:10259000001F030070B50024FFF7B0FE164B201C8F
-:1025A0000833DC67F1F7C0FCA0221E20134B14494E
-:1025B0001C70144BD2001C60134BA0261C608B585F
-:1025C000124D83438B50201C0134FFF7CDFF221C9A
-:1025D0000F4BF6051B785BB29A400E4B72511B787D
-:1025E000002B07D0201CFFF7BFFF0B4B1B785BB203
-:1025F0009C40745170BDC046882E0020012E0020E2
-:1026000000F001407C270020782700200C05000006
-:1026100009010020080100200A010020F0B53E4E0B
-:102620008DB0331C0833DB6F041C002B02D1FFF785
-:10263000B1FF6EE0002801D0F7F754F86846EDF7D7
-:10264000CFFD00280CD1331C0833D86FF5F740F8C4
-:10265000051CEDF7DBFD002C25D0F7F74BF822E049
-:10266000002C01D0F7F746F8019B2C491868EFF7CA
-:1026700063FE0025041EAC4215D1019F381CEEF705
-:10268000F1F9274B98420BD1211C0120F2F70AFFE8
-:102690001F21051CF860221C2248EFF7CFFFA8601D
-:1026A0000025019B336301271F4B1C68331D6411F8
-:1026B00001343C40DB6F64011C19002D07D1083642
-:1026C000201C291C2022F56718F081FD1FE0281C22
-:1026D000EEF7C8F9154B984209D0331C0022083395
-:1026E00013481449DA6712F07DFE306311E06B681D
-:1026F0002360AB686360EB68A3602B69E3606B6980
-:102700002361AB696361EB69A3612B6AE3610A4BE7
-:102710001F700DB0F0BDC046882E002084E8020076
-:1027200058E6020051A5030074270020C4FF0200F0
-:10273000C8EA020071A503000701002008B5FFF7F1
-:1027400029FF014808BDC04694BA02000123A02217
-:10275000834010B5134CD2051351031CC133124CE6
-:10276000FF339B009C50114B8900C918A223DB004A
-:10277000CC580F4A00022240C024CA50CA58A402B2
-:102780001443F822520110402043C8500320CA5875
-:10279000084C10432243CA50C046C046C046C850E9
-:1027A00010BDC0460C05000003030000006000409F
-:1027B000FFE0ECFF031F0000F8B50E1C15F0A4FCB1
-:1027C000194B041C194D1A4F9E420FD10123A02210
-:1027D0008340D20528700021D351FFF7B7FF0020B6
-:1027E000FFF788FE0023134A13701CE0301C15F01D
-:1027F0008BFC2C7001252A1C0F4BA2401870A023C3
-:10280000DB05DA512A1C8240061CDA51201C00210B
-:10281000FFF79CFF301C291CFFF798FF281CFFF7CF
-:1028200069FE044B1D70F8BD94BA02000901002036
-:102830000C050000080100200A010020F0B587B057
-:102840000493574B03901B780D1C161C002B01D0D2
-:10285000FFF7A0FE534B1A78002A0AD1524C4020B1
-:10286000211C0831CA6701321A7012F0EFFD0434DE
-:10287000E067802701224D4BBF004D4CDF674D4B79
-:10288000E250FFF73BFD00234B4AF021A3500432F6
-:10289000A3500832A350C22209039200A150474A14
-:1028A000E351059495423BD1AE4233D11C1C444BBD
-:1028B000A200D758381C15F027FC031CA0220321C6
-:1028C000C133FF339B00D2059950631C0193012350
-:1028D0008340019C02930426394BA200D558A123C2
-:1028E000A0220299DB00D205D150281C15F05DFB17
-:1028F000012848D1A022334B0299D205D150281C7F
-:1029000015F053FB00283ED1013E002EE7D1381CC4
-:10291000291C07E02C492D4812F064FDEDF77BFCE3
-:10292000281C311CFFF748FF0398F4F7A9FE1E4C42
-:102930000026231C01253F220833D867244B802121
-:102940001E70244B1D70244B1A60231DD86F521922
-:1029500018F03DFC301CFFF761FE204B104F1D604E
-:10296000059B301C1D601E4950223D70F1F7A8FAEE
-:10297000049BB34212D03B78002B0FD0236B002B6B
-:102980000CD120BFF7E7012C01D10224A3E7019B62
-:102990000124022B8BD113480849C3E707B0F0BDCF
-:1029A000012E0020022E0020882E002004E100E0ED
-:1029B00000900040FC0F00000405000094BA0200E3
-:1029C0009CFF02000C05000083A50300C8EA02007A
-:1029D000002E002007010020742700200C9C0040DE
-:1029E000512301007004030010B5084B86B002ACFF
-:1029F000009301940423F1F719FE02982379A1684A
-:102A0000E268FFF71BFF024806B010BD1400030088
-:102A100094BA0200014B1878C0B27047012E002012
-:102A200010B5242012F012FD041C044B802108C0B4
-:102A3000202218F0CCFB201C10BDC046C4FF0200B1
-:102A4000F8B5051C081C0C1C161CEEF70BF8314FD2
-:102A5000B8425CD1681F0F2859D806F0ADFF0808AE
-:102A6000335858585858585858585813133EFFF769
-:102A7000D7FF0023E2181179C21801331171202BFE
-:102A8000F8D1041C301CEDF7EDFFB8423FD1012016
-:102A9000052D04D0123D6B1E9D416D42284300213F
-:102AA00073181B796518803B43432A799B18FF2BC9
-:102AB00003D9FF22DB179A43131C01312B71202904
-:102AC000EED122E0FFF7ACFF0023E2181179C21823
-:102AD00001331171202BF8D1041C301CEEF710F9D2
-:102AE0000F2115F089FA211C221D24311378803B17
-:102AF0004343DB138033FF2B03D9FF25DB179D43B3
-:102B00002B1C137001328A42F0D1201C00E00020FF
-:102B1000F8BDC046C4FF020008B50430F8F718FF3E
-:102B2000004808BD94BA020008B5043012F01EFC3B
-:102B3000004808BD94BA02000B1CF0B5061CC18801
-:102B400087B0151C00681A1C0023EEF74DF9041C11
-:102B5000002D40D0042D14D103204443B1680C193A
-:102B60000121627852000A43039222788A400A4384
-:102B70000492A3788B400B4303A90593F2F792FCD0
-:102B80002AE0281C032103AAEEF71AF9039B186810
-:102B9000EEF752F8039B071C5868EEF74DF8039BBD
-:102BA000051C9868EEF748F8FF2F03D8FF2D01D8D1
-:102BB000FF2805D909490A4812F014FCEDF72BFB50
-:102BC000C0B204360090A1B2FAB2EBB2301C12F0DF
-:102BD000E2FB044800E0281C07B0F0BDA5A50300F7
-:102BE000D8E5020094BA020073B51C1C081C00232F
-:102BF000111C02220093131CF1F7E6FC206815F06B
-:102C000083FA051C6068EEF717F8041E05DC094915
-:102C1000094812F0E7FBEDF7FEFA0C2012F016FC63
-:102C2000061C064BE9B208C0A2B2F8F767FE301CDA
-:102C300076BDC046B4A50300D8E50200CC00030071
-:102C40007822044B04481A80743A5A801A715A71D7
-:102C50007047C046F800002094BA020013B5074C34
-:102C6000208814F0C3FF0090608814F0BFFF69460D
-:102C700001900220F2F716FC16BDC046F8000020B5
-:102C800008B5031E064802D0086800F061FB002169
-:102C900005F07EFD0022034B03481A7008BDC046B4
-:102CA000302B0020032E002094BA02001FB50A4BDF
-:102CB00002AC009301940223F1F7B8FC029B002BB5
-:102CC00001D0064A53806368002B01D0034A138069
-:102CD000034804B010BDC04618020300F8000020ED
-:102CE00094BA020008B5074B1A78002A09D0064AA0
-:102CF000126B002AF7D000211970044B186805F0F8
-:102D000047FD08BD032E0020882E002080270020CC
-:102D1000F0B51B4B87B002AE009301960423F1F788
-:102D200085FCB0687568029F00F012FB8021041CCE
-:102D3000367B05F02DFD391C124806F05BFE011CA8
-:102D4000201C05F08DFD002D17DB00230E4A0F49D6
-:102D500012680B70AD180E4A15600E4A13700E4AB9
-:102D600013800E4A13800E4A53670E4B1C600223D9
-:102D70000B70002E01D0FFF7B5FF0B4807B0F0BD78
-:102D8000B402030040420F00FC2C0020032E002060
-:102D900084270020042E0020E22D0020E02D0020BA
-:102DA000882E00208027002094BA020030B5224BE4
-:102DB00089B004AC009301940423F1F737FC04229A
-:102DC0001E4B04981A715A711D4B0340062B06D0F6
-:102DD000830729D103689A691A4B9A4224D10123A7
-:102DE00003940293606800F0B3FA00221649174B6F
-:102DF0000D6817491A700D60257B16490D7016492C
-:102E0000029D0D8015490A800399154A012D00D1B4
-:102E100009685167134A106001221A70237A002B47
-:102E200007D0FFF75FFF04E002A903AAEDF7A6FFB2
-:102E3000D8E70D4809B030BD54020300F800002067
-:102E4000070080FF8D350000FC2C0020032E0020A1
-:102E500084270020042E0020E22D0020E02D0020F9
-:102E6000882E00208027002094BA0200F0B5724C12
-:102E700087B02378002B00D1DBE0704D704E2A68BC
-:102E800033682F1C934200D2D3E02378022B0AD15F
-:102E90006C4B0021186805F07BFC33680A332B600B
-:102EA00001232370C5E0644B1B78012B00D0C0E0E8
-:102EB000654B1988654B1A888A4208D3644A127890
-:102EC000002A02D000221A8001E02270B1E0614A9B
-:102ED000012901D1506F03E01B88526F9B00985865
-:102EE0005D4B584C5D4D98420CD10021206805F097
-:102EF0004FFC29885A4806F00DFE01234E4A3860DF
-:102F0000137096E005A9F0F751F82768059B061C99
-:102F10008021381C009305F03BFC1F23347829885E
-:102F20004F481C4006F0F6FD698806F0F3FD009B53
-:102F3000013CE4B20290012B10D97378232B09D005
-:102F4000622B0BD1002C04D0013CE4B2012C09D03F
-:102F500000E0062402230120002206E000200123D5
-:102F6000019003E00223201CFF220192009A934269
-:102F700007D2F25C3A2A04D00F2101330A402A71A9
-:102F8000DBB2364A944612790392009A934217D2E2
-:102F9000F15C3A2914D1591CC9B2914210D2755C26
-:102FA0000F2162460D4055710233009ADBB2934205
-:102FB00006D20A22F35C5543194063466D185D71D1
-:102FC000092C1DD80399019B0439CA1852B2640018
-:102FD00000280CD0234B002A01DB195B0BE01B5BA4
-:102FE00051428B40191C381C05F03AFC0CE01E4B7A
-:102FF000195B002A01DB1141F5E752429140F2E7EB
-:10300000381C002105F0C4FB6B461A7A134B5B7920
-:1030100053430A3B092B00DC0A23094A12689B1818
-:10302000064A1360094A1388013313800222024BB7
-:103030001A7007B0F0BDC046032E00208427002080
-:10304000FC2C002080270020E22D0020E02D002015
-:10305000042E0020882E002094BA0200F8000020E0
-:1030600060EA0000CC230300BE23030073B5009088
-:10307000000C431E01910A2B1BD801231C1C844009
-:103080000C490A88224392B20A800B4A11780F2910
-:103090000FD816781178094CD94033409B009840DE
-:1030A000031C655C2B43DBB2635413780133DBB242
-:1030B000137073BDE42D0020052E0020062E002085
-:1030C000094A38B51378002B0CD1084D2C78E4B29E
-:1030D000002C07D10068013313702B7003685B6804
-:1030E00098472C7038BDC0460F2E00200E2E0020B1
-:1030F00010B5041C0430FFF7E3FF606817F060F9B7
-:10310000034B8000C0580623C000184310BDC046C2
-:10311000D803030038B50430FFF7D2FF124C134830
-:103120002378002B1FD020780021C0B2F2F7BAF923
-:1031300000232278934214D20D495A088D5C012253
-:103140001A40920015412A1C0F252A40094D920071
-:10315000525906259900D20041182A438A6001334A
-:10316000E7E70023237038BD052E0020ACCF020016
-:10317000062E0020D803030008B5EFF781FA0023DC
-:10318000074A99008A58904208D001330C2BF7D196
-:103190000449054812F026F9EDF73DF8D8B208BD0C
-:1031A000D8030300CDA50300D8E5020038B5041C00
-:1031B000081CFFF7E1FF051C201DFFF781FF606879
-:1031C00017F0FEF8024BA84200D0024B181C38BD85
-:1031D0005CC30200A0C3020038B5041C081CFFF742
-:1031E000CBFF051C201DFFF76BFF0122AA40064BF9
-:1031F00006481988114200D10548198891430022D8
-:103200001980044B1A7038BDE42D00205CC3020005
-:10321000A0C30200052E0020C02307B50348009379
-:103220001B210022024B03F051FE07BDB4290020F0
-:103230006D30010008B5406805F0F0FA024B002837
-:1032400000D1024B181C08BD5CC30200A0C30200E1
-:1032500010B5041C081CEDF7EFFC011C431005D051
-:103260000549064812F0BEF8ECF7D5FF606805F096
-:103270002DFA034810BDC046DDA50300D8E50200C5
-:1032800094BA0200032310B50B40041C081C022B47
-:1032900003D1114B0B40062B02D1EDF7CDFC09E019
-:1032A000EDF72EFD09F010FB00220C4B07F020FD7E
-:1032B00009F098FA0A4B011E994205D909490A48B2
-:1032C00012F090F8ECF7A7FF0D2063681856F2F79C
-:1032D0001BFC064810BDC046070080FF0000E03F11
-:1032E000FF030000F2A50300D8E5020094BA020033
-:1032F00008B5081CEDF7A0FCFA239B005843F2F731
-:10330000CBFB002805D00449044812F06BF8ECF719
-:1033100082FF034808BDC04613A60300D8E502009B
-:1033200094BA020008B5081CEDF786FCF2F7B4FB6E
-:10333000002805D00349044812F054F8ECF76BFF5D
-:10334000024808BD13A60300D8E5020094BA0200A3
-:1033500010B5041CEDF786FB084B98420BD0084BC8
-:10336000984208D0074B984205D00749074812F009
-:1033700039F8ECF750FF606810BDC046A80503009F
-:10338000FC0403004405030022A60300C8EA02006F
-:1033900008B5064B1A680823D16C0B43D36401F0BF
-:1033A00065FDFFF739FFEEF7D5F9FCE7EC2C0020BF
-:1033B00008B5094805F096F814F035FFFCF712FA45
-:1033C000064815F007FB0648F0F7D8FCF0F7B4FC08
-:1033D000F2F752FB08BDC046CC290020D4280020BB
-:1033E000E533010038B5114C201C15F0F5FF00281D
-:1033F00003D00F4B1B78002B14D000230D4A0E4C2A
-:1034000013700E4A0E4D13702068002802D0036816
-:103410001B6898470434AC42F6D100F02DF9FFF751
-:1034200025FD38BD201C15F053FFE6E7E02A0020FB
-:10343000542E0020532E0020742900200F2E00202F
-:103440009C2900200023FA21084A89001360084AB9
-:103450001370084A1360084A1160084A1370084A3A
-:10346000D36613670122074B1A7070478827002024
-:10347000102E00208C27002020000020122E00207B
-:10348000882E0020112E002008B5084B1A78002A3B
-:1034900008D1074B1B6B002B02D0FFF7D3FF03E0D3
-:1034A00030BFF2E700221A7008BDC046112E00207E
-:1034B000882E0020012383770048704794BA0200C9
-:1034C0000023E021A0228377024B0902D2050248A3
-:1034D000D15070470C05000094BA0200837F024867
-:1034E000002B00D1014870475CC30200A0C302005A
-:1034F00010B5A0241049E4054B7F081C5A1C002B72
-:1035000005D1498C0D4B8B430D4963500EE01033B0
-:103510005B00CB185988A123DB00E150092A05D1B3
-:103520000120F0F701FD0120404203E0054B427706
-:103530005200D05A10BDC04624000020F01F0000E9
-:103540000C050000DA23030073B51B4D041EEE6E5C
-:1035500009D11A4D2B78002B2BD01948194914F09A
-:10356000DAFD2C7027E0EDF77DFA174B984202D177
-:10357000301C211C15E0154B2340062B05D0A3075A
-:1035800012D1134B22689A420ED1201C01A9EFF7E9
-:103590000DFD019B012B0CD1007815F0A2F9011C47
-:1035A000301C14F0B8FD06E00A480B4911F01AFF70
-:1035B0002863FFF747FF73BD882E0020122E0020DE
-:1035C000240000202C0F0300400F0300070080FFA1
-:1035D00040EC0200C8EA020032A60300F7B5A123BE
-:1035E000A021214AC905DB00CA500122C37F1F4D1B
-:1035F0000D339A404A51C37F01950133DBB2032B4F
-:1036000000D10023C377011C031C36312233002272
-:103610001A8002338B42FAD1C77F15497B000133F0
-:10362000CB18591E0E78052171430126351C1C78D4
-:10363000063309190F4C6118141DA5402C1C09797B
-:103640009219490041184D8C2C434C84092AE8D129
-:103650000D37A023A122BE40DB05D2009E50828EF2
-:1036600001995A50F7BDC046F01F00000C0500003C
-:103670006FA603002400002070B5304C8CB0A37FEF
-:10368000002B59D0201CFFF7A9FF2D4A2D491368A4
-:103690000968063313608B4241D300252A4B15601D
-:1036A0001B78012B06D0022B39D1201C274914F09E
-:1036B00032FD32E0264BDA6E1E1C002A2DD01B6F25
-:1036C000002B2AD0F6F70EF86846ECF789FD0028A3
-:1036D00009D1204B1868F3F7FBFF051CECF796FDAA
-:1036E000F6F708F815E0F6F705F8019B1A4918688F
-:1036F000EEF722FE00280CD10198EDF7B3F9174B35
-:10370000984203D11648174911F07BF90025019B17
-:103710003363281CFFF718FF01E0FFF793FE002337
-:10372000228C6377FF33FF331A4205D0E122012058
-:103730000D49D200F0F7C4FB0CB070BD240000208E
-:103740008C27002020000020102E00202C0F0300CA
-:10375000882E00208827002084E8020058E6020016
-:103760003CD3020051A50300F1340100F7B5002459
-:10377000009308AB124D1B78061C081C171C019304
-:10378000EC662C67F3F77CFF6A460E4B12781860E4
-:103790000D4BEE661F600D4B28671A700C4B1C70AA
-:1037A000F3F796FFFFF7D0FE01220A4B1C600A4B8D
-:1037B0001A70019BA34201D0FFF766FEF7BDC04619
-:1037C000882E00208827002020000020122E0020B4
-:1037D000112E00208C270020102E0020F0B5002490
-:1037E0002C4B8DB0DC661C672B4B07AC40C90138F5
-:1037F000009301940523F0F719FF0798636805907B
-:103800000293237B257A0393244B277C0340062BCA
-:1038100005D0830718D1224B02689A4214D106A919
-:10382000EFF7C4FB069B002B30D0012B08D1002DF5
-:1038300006D1002F04D1007815F053F8059021E04F
-:10384000059801F0D7F90AE0EDF70CF9154B98420D
-:1038500006D1002D14D0012005A9F1F723FE059013
-:10386000237C002B03D00598F0F7A0FE0590039B66
-:10387000301C00930599029A2B1CFFF777FF05E097
-:10388000002FE8D1301C059914F045FC06480DB016
-:10389000F0BDC046882E0020C8060300070080FF48
-:1038A00040EC0200400F030094BA020030B5104B08
-:1038B00089B003AC20C90138009301940523F0F7C7
-:1038C000B5FE02A90398EFF771FB227C237B0299D6
-:1038D0000092039A01F078F9237A011C0093281CC6
-:1038E00062680023FFF742FF024809B030BDC046BE
-:1038F0009807030094BA0200002208B5064B1A701C
-:10390000064B02321A70064B064A1B68063B1360D0
-:10391000FFF7BAFD08BDC046112E0020102E002072
-:10392000200000208C27002008B5FFF7E5FF0148A4
-:1039300008BDC04694BA020010B5042901D8042A73
-:1039400002D90B480B4903E0092B05D908480A495D
-:1039500011F048FDECF75FFC052461438A188218DA
-:10396000137101229A40131C028C1343038410BD6F
-:10397000D8E5020040A6030055A60300F8B5486844
-:103980000C1C0F68EDF758F9061CA068EDF754F908
-:10399000051CE068EDF750F9311C031C2A1C381C8B
-:1039A000FFF7CAFF0048F8BD94BA020008B5042921
-:1039B00001D8042A05D90649064811F013FDECF791
-:1039C0002AFC052359438A188018007908BDC0468F
-:1039D00040A60300D8E5020008B503480349044A9D
-:1039E00011F00FF8034808BD3CD30200142803006F
-:1039F000A5A6030094BA020008B503480349044A87
-:103A000010F0FFFF034808BD3CD302001428030058
-:103A1000E9A7030094BA0200F0B5214B8DB005ACC4
-:103A200001380093043101940723F0F7FFFDA068EB
-:103A30001C4D0027A84202D0EDF7FEF8C7B260691E
-:103A40001826A84202D014F05FFB061CA0691922B8
-:103A5000A84202D014F058FB021C2069A8420DD0E5
-:103A600003AA0221EDF7ACF9039B186814F04CFB94
-:103A7000039B061C586814F047FB021C71B252B23B
-:103A800003A802F007F903A8059902F05FF903A85B
-:103A900061683A1CE36802F069F9281C0DB0F0BDBA
-:103AA000A008030094BA020008B500F06BF8034BBD
-:103AB000002800D1024B181C08BDC0465CC30200A0
-:103AC000A0C3020010B50F4815F020F8002817D049
-:103AD0000D4814F0D9FF0D4B1B68984203D10C4BD5
-:103AE0009A6E1A630CE03F220A490B880133134097
-:103AF000094A1288934203D00A88084C0B80A054CC
-:103B000010BDC0461C2900205C2900209027002001
-:103B1000882E0020E82D0020E62D0020132E002006
-:103B2000002208B5084B09481A80094B09491A8038
-:103B300014F0F1FF0122084B524208481A6011F0BC
-:103B400044FC074B986608BDE82D00201C29002086
-:103B5000E62D0020C53A01009027002090E50200E4
-:103B6000882E002010B5041C431C03D0034B986E14
-:103B7000F8F70CF9024B1C6010BDC046882E0020DF
-:103B800090270020034B044A1B881088181A431EF4
-:103B900098417047E62D0020E82D0020084B094A87
-:103BA00019881288914201D130BFF7E71A88064977
-:103BB000885C3F211A8801320A401A807047C0464B
-:103BC000E62D0020E82D0020132E002038B5041C1F
-:103BD0004518AC4205D02178024814F04AFF013460
-:103BE000F7E738BD5C29002070B5041C4518AC42CD
-:103BF0000DD02378064E0A2B03D1301C0D2114F072
-:103C000038FF2178301C14F034FF0134EFE770BD29
-:103C10005C29002010B5041C002C08D0211E0829A6
-:103C200000D908210248641AFFF7D0FFF4E710BD5D
-:103C3000C1A8030038B5051C041C002C08D0211EA7
-:103C4000082900D908210448641AFFF7BFFFF4E7E8
-:103C5000281CFFF7DFFF38BDCAA8030008B5011C08
-:103C6000014814F0B6FA08BD2400002070B5002801
-:103C700014D00B4D041C281C02F00EFF0419061C66
-:103C8000844205D230BF281C02F006FFB042F9D8AA
-:103C900030BF281C02F000FFA042F9D370BDC0461F
-:103CA000C828002008B5024815F004FA014808BDEC
-:103CB000C828002094BA020008B5C30708D48307B7
-:103CC00009D10368094A934202D0094A934202D1BA
-:103CD000ECF7B2FF03E0EDF713F806F059FF002808
-:103CE00001DDFFF7C3FF034808BDC0464CB9020021
-:103CF00064C3020094BA020008B5034802F0CCFE87
-:103D000001234000184308BDC828002008B5034817
-:103D100003F0FCFF13F06AFF08BDC0461C2B002017
-:103D200010B5031E064C02D1201C191C04E00868C3
-:103D3000ECF782FF011C201C02F0B4FE014810BD0C
-:103D4000C828002094BA0200F0B52B4D87B003902C
-:103D50002B78002B1CD05AB2002A10DA80246E1C5B
-:103D60006D785C40002D13D0631EDCB2FF2C0DD0AB
-:103D700004AB981D01210570FFF736FFF4E704AA94
-:103D8000D01D012103702E1CFFF72EFF751CDFE7ED
-:103D900005260398FFF76AFF0124B44226DA0025BE
-:103DA000164F291C381C221CFFF700FE6B460190A1
-:103DB0001B79002B14D0631E1A1C381C291C02937B
-:103DC000FFF7F4FD031E0BD1381C291C221CFFF742
-:103DD000B3FD6B46381C1B79291C029AFFF7ACFD1A
-:103DE0000135052DDCD10134E4B2D6E7013E002EC9
-:103DF000CFD107B0F0BDC046D3A8030024000020F7
-:103E000008B5C820FFF7A0FF004808BD94BA02001B
-:103E1000F0B51D4B8BB004AC20C901380093019460
-:103E20000623F0F703FC1723E068184E0393B04213
-:103E300002D014F069F9039020691527B04202D02E
-:103E400014F062F9071C60691622B04202D014F027
-:103E50005BF9021C6B4601201B7B0435404279B2A2
-:103E6000009052B2281C5BB201F02CFB281C616848
-:103E7000A268002301F0ACFA281C049901F0E0FAD2
-:103E8000301C0BB0F0BDC046D40C030094BA020045
-:103E900070B586B0061C0122081C03A9EDF78CF84A
-:103EA000039D2C1C049A631B0192934205D2217836
-:103EB000301D01F0F1FB0134F4E7014806B070BD9C
-:103EC00094BA0200F0B5141C89B00122071C081C2A
-:103ED00002A9EDF771F8201C002405A90222029D19
-:103EE000EDF76AF8059E039B01939C4206D2295D7B
-:103EF000381D01F0D1FB30550134F4E7014809B019
-:103F0000F0BDC04694BA0200F0B5051C87B0486801
-:103F10000C1C0F68ECF790FE011C02A812F0FCFDCF
-:103F20000026032D03D1A068ECF786FE061C0024B2
-:103F3000039B01939C4209D2049B381D311C1D191F
-:103F4000019301F0A9FB01342870F1E702A90248AE
-:103F5000EEF73EFB07B0F0BD44C202002022074B43
-:103F600007491A701D3A5A7004329A7000220548A7
-:103F7000DA7059601A725A727047C046982700204A
-:103F80007469627594BA020008B50349034811F0D8
-:103F900029FAECF740F9C0467DA90300D8E50200F4
-:103FA00002220A4B10B5DA6700220121084B5A6140
-:103FB000084A11615A69002AFCD0074CA06F0028FA
-:103FC00003D011F06AFA0023A36710BD04E100E0FA
-:103FD000FC10004000100040882E002008B5FFF7BC
-:103FE000DFFF014808BDC04694BA0200F8B5FFF7EC
-:103FF000D7FF334C26786578013601357543281C88
-:1040000011F024FA00222F4B451998672E4B801986
-:104010001D602E4B012118602D4B5A608022D20565
-:1040200011605A68002AFCD003212A4B61562A4AA3
-:1040300000259950A178043A9950617A0832995034
-:104040006168264A08269950217A254A254F9950B9
-:104050000121254A9D5004329950244A9E502278CD
-:104060008124A4042243A324E4001A510222204CF8
-:104070001A51204C1F51204F043C1F5118271F4C30
-:104080001F511F4C1851C120C02480001E501D48D4
-:10409000640002510260802080001A58713CFF3C8D
-:1040A00022431A50184A556059605368002BFCD0BF
-:1040B0000022154B1A61074B01329A60F8BDC046C9
-:1040C00098270020882E002094270020A427002075
-:1040D000FC000040001000400C0500001C05000022
-:1040E00024050000FFFF00002C050000140500005F
-:1040F000340500003C0500002110010054050000BB
-:104100000405000000E100E0FC10004008B5FFF7E6
-:104110006DFF014808BDC04694BA0200F0B5161CF8
-:104120008DB0002804D07149714811F05BF93CE072
-:10413000704B09AA191CB0C9B0C21A789F780592B1
-:104140005A78DD7806925A68049001921A7A5B7A5E
-:104150000392029308E0631EFA2B00D9C0E0E3B299
-:104160000593049B01330493049B726893421ED20F
-:10417000049BDB000793079AB3689B181A68002A10
-:10418000EFD0042AEDD05868ECF782FDB368079AA7
-:10419000041C9858EEF774FA574B021CC0180628F6
-:1041A0007AD956485649F7F791FDECF734F8554B54
-:1041B00009AC9B6F002B13D16B461B7DA77023703E
-:1041C0006B461B7EE5706370019B0A936B461B7BFD
-:1041D00023726B461B7A6372464B07CC07C382E09F
-:1041E0006B461B7D434E23706B461B7E637022889B
-:1041F00033889A4210D0FFF7D3FE019BA7700A9331
-:104200006B461B7BE57023726B461B7A63720ECC88
-:104210000EC6FFF7EBFE66E002223B4B3B49DA6736
-:1042200000238C464B613A4B013A1A6163465B6945
-:10423000374A002BFAD06946019809AB0A90087BEF
-:10424000DD701872087A9F7058722A486DB252CB8E
-:1042500052C0304B0298D550043BD7500833D05051
-:1042600001982D4BD05003982C4BD0500020274B59
-:1042700058600123536063465B68002BFBD000222B
-:10428000C021224B49001A61214B01329A60244B14
-:1042900001325A501A6026E005F098FB5DFF0700D6
-:1042A0000D00110016001B001D00631EFD2B17D80A
-:1042B000E3B2069355E7642C12D8E7B251E7072C16
-:1042C0000ED8184B1D5D4CE7022C09D8E3B20293BF
-:1042D00047E7019445E7FF2C02D8E3B2039340E798
-:1042E000064811495FE711480DB0F0BD92A90300DF
-:1042F000C8EA0200982700203AFDFFFFD8E5020037
-:10430000B6A90300882E002004E100E0FC10004064
-:10431000001000400C0500001C05000024050000F2
-:1043200000E100E075A90300CCA9030094BA0200E3
-:10433000F0B52B4B85B09D6F002D01D1FFF724FE0A
-:104340000222A3242749E400CA672749274E0C59B3
-:10435000274BE4B201342C1935681F1C0391A54288
-:1043600002D11A60234838E02578002804D1601C67
-:10437000291CEEF77BF90EE0022D26D96378012B7C
-:1043800023D1A278002A20D1E378012B1DD1201D52
-:10439000E91EEEF753F9691CED43336861185A1AA8
-:1043A0000190201C029316F0FEFE029B039A5D19F9
-:1043B000114B3560D5500022104B01981A61012332
-:1043C000039A9360DB183B6007E002230C493B60D3
-:1043D0000C4811F007F8EBF71EFF05B0F0BDC04622
-:1043E000882E002004E100E000100040A4270020F7
-:1043F00000E100E094BA020004050000FC10004057
-:10440000F1A90300D8E50200184B30B55A681849E5
-:10441000002A03D000225A6001328A601B69002BF7
-:1044200022D00022114B13481A61A323104ADB004B
-:104430000468D3582278DBB29A4201D91A1C23703F
-:104440008025ED004D59012D0CD10B4D02339B18E9
-:104450002D68E3189D4205D30132A2180260074B74
-:104460000348C25001238B6030BDC046FC100040A1
-:1044700000100040A427002094270020040500001D
-:10448000F7B5364D0C1CA96F844601921E1C0029FD
-:1044900001D1FFF779FDA3233148DB00C258A319EE
-:1044A000D2B2071C934204D9161B944201D9141CA2
-:1044B000002633190B70AB6F6146581C221C16F096
-:1044C00069FE002E06D0AB6F013418190199321C19
-:1044D00016F060FE0222234BDA670022224B5A615B
-:1044E00001323A615A691E49002AFBD00024A86FA4
-:1044F0001E4A88501C48446001200860111C5A68FC
-:10450000002AFCD00120164A90600020164A106153
-:104510001869134A0028FBD0154800685050002045
-:1045200011494861012111615A69002AFCD000211A
-:104530000D4A51600A4A013151605A68002AFCD084
-:104540000022C021084B49001A61054B01329A60D4
-:10455000084B01325A501A60F7BDC046882E002021
-:104560000010004004E100E0FC10004004050000E1
-:10457000A427002000E100E007B501A9EEF716FD31
-:104580000321021C019B0248FFF77AFF01480EBD80
-:1045900071A9030094BA02001FB5012201A9ECF72A
-:1045A0000BFD002201980299131CFFF769FF0148D7
-:1045B00005B000BD94BA0200031C203B5E2B00D95D
-:1045C0003F2005235843024BA0381B68181870473A
-:1045D0008C00002038B5051C081C684301304010D1
-:1045E00008300C1C10F032FF0122044B857103606F
-:1045F000037944719343037138BDC046400F0300F3
-:1046000010B5041C102010F021FF044B03606368F8
-:104610004360A368C3600023836010BDD80E03000D
-:1046200038B5051C202010F011FF0C4B041C036052
-:104630000520011CFFF7CEFF6B68EA68A0602361CC
-:1046400062602A7C201CA276AA689B1863616B7C3E
-:10465000E37613F059FE201C38BDC0469C0E0300C3
-:1046600070B5061C081C141CECF7E6FA051C201C8F
-:10467000ECF7E2FA041C002D01DB002802DA0E48F8
-:104680000E490BE0301C13F0A8FE854204DA301C02
-:1046900013F0B1FE844205DB0748094910F0A2FE81
-:1046A000EBF7B9FD301C291C221C13F089FE0123F5
-:1046B0004000184370BDC046D8E5020011AA0300AF
-:1046C0002AAA0300F8B50C680D1C2379DB0702D574
-:1046D00019481A490DE04868ECF7AEFA071CA868BB
-:1046E000ECF7AAFA061C002F01DB002805DA1448B3
-:1046F000144910F077FEEBF78EFDE868ECF79CFAB2
-:10470000051E092D02D90E480F49F2E7201C13F0AF
-:1047100064FE874204DA201C13F06DFE864202DB41
-:1047200007480A49E5E7201C391C321C2B1C13F0F2
-:1047300029FE0748F8BDC046C8EA02003AAA0300AD
-:10474000D8E5020011AA030055A603002AAA030017
-:1047500094BA0200F7B50E1C2749041C009210F011
-:1047600050F9009B002B03D1201C244910F049F97B
-:104770000025234F201C391C10F043F90197301CF1
-:1047800013F039FE854221DA0027301C13F025FE94
-:1047900087420CDA391C2A1C301C13F011FE194B0D
-:1047A00019491A5C201C10F02CF90137EDE7201C88
-:1047B000164910F026F9009B002B05D1301C13F090
-:1047C0001AFE0138854211DB0135D8E7201C01991A
-:1047D00010F017F9009B002B03D1201C0C4910F09E
-:1047E00010F9201C0B4910F00CF9F7BD201C0A49E8
-:1047F00010F007F9E8E7C0466FAA030076AA0300A5
-:1048000082AA030084AA0300AA290300CE4203005F
-:1048100027430300CE2603007CAA0300F0B51E1C2C
-:1048200000238BB00F1C0093081C111C1A1C0333AF
-:10483000EFF7CAFE032F55D8381C05F0BDF8560215
-:1048400010103068684B0340062B50D0830700D00F
-:10485000C4E0664B02689A4200D0BFE047E030688F
-:10486000ECF7EAF9051C7068ECF7E6F9029002999A
-:10487000281CFFF7AFFE0390022F02D113F095FD25
-:104880002EE0B06807A90122ECF796FB002D08DBAB
-:10489000029B002B05DB00266B43089A371C9342D2
-:1048A00017D05348534910F09DFDEBF7B4FC079B1C
-:1048B0001A5D131C092A00D90923DBB20398321CA4
-:1048C00013F060FD0134049BE11B9C42EFD17F1982
-:1048D0000136029B9E4203D07B1904933C1CF2E7F5
-:1048E00003987EE044484549DDE7454879E007A95B
-:1048F000EEF75CFB079B041C0593012B03D120788A
-:1049000013F0EFFF6DE00023221C181C1D1C059EF8
-:10491000111BB14214DA11780A2901D03A2905D1C4
-:104920009D4200DA1D1C0130002307E001332029DD
-:1049300004D0392902D92E483249B4E70132E6E7DA
-:1049400003900295002B05D0021C013203929D4278
-:1049500000DA029302980399FFF73CFE0026071C39
-:10496000351C0494049B059A1B1B934227DA049B75
-:104970001B780A2B01D03A2B0DD1029B9D4207DAFE
-:10498000291C381C321C002313F0FCFC0135F4E711
-:10499000013600250FE0202B04D1381C291C321CC5
-:1049A000002305E0392B06D8381C291C321C303B6B
-:1049B00013F0E8FC0135049B01330493D2E7039B19
-:1049C000381C9E420DDA029B381C9D4209DA291CD4
-:1049D000321C002313F0D6FC0135F4E706480A49DF
-:1049E00061E70BB0F0BDC046070080FF40EC02005D
-:1049F000D8E50200B9AA0300C8EA0200D6AA03005B
-:104A00002C0F03008FAA0300F5AA0300F0B585B0B0
-:104A10000191051C081C002105F0BEF9041E05D0FB
-:104A20002349244810F0DEFCEBF7F5FB281C13F0BB
-:104A3000D4FC061C281C13F0DEFC011C301CFFF704
-:104A4000C9FD071C281C13F0C8FC84422CDA002680
-:104A5000281C13F0C2FC864224DA321C211C281CBC
-:104A600013F0AEFC06F0B4F8019905F0E1FD07F093
-:104A70002BFF0022104B06F03BF9104B0022029056
-:104A8000039105F04FF90923002804D002980399F7
-:104A900007F0A8FE031C321C381C211C13F072FC0A
-:104AA0000136D5E70134CDE7381C05B0F0BDC0466E
-:104AB0000EAB0300D8E502000000E03F00002240FA
-:104AC000F0B587B003910592061C13F094FC041C0A
-:104AD000301C13F082FC0190039813F08CFC071E2D
-:104AE000A74205D01B491C4810F07CFCEBF793FB58
-:104AF0000198391CFFF76EFD00240290019B9C4237
-:104B000024DA0025BD421FDA211C2A1C301C13F0B8
-:104B100057FC211C04902A1C039813F051FC059BA0
-:104B2000002B05D0049BC318092B06DD092304E0E4
-:104B3000049B1B1ADA43D21713402A1C0298211C2B
-:104B400013F020FC0135DDE70134D7E7029807B008
-:104B5000F0BDC0463AAB0300D8E50200F8B5041C2E
-:104B6000081C0E1C151CEBF77DFF164FB84226D112
-:104B7000053C042C23D8201C04F01EFF1414032130
-:104B80000700281CECF7BCF807E0281CECF7B8F885
-:104B9000011CFE20800505F059FB011C301CFFF7AD
-:104BA00035FF0DE0281CEBF75DFFB84207D16242EC
-:104BB0006241301CD2B2291CFFF782FF00E00020C6
-:104BC000F8BDC046400F0300F7B5071C0193142041
-:104BD00008AB0E1C151C1C7810F038FC044B476009
-:104BE00003606B461B798660C56003744474FEBD28
-:104BF0001012030038B5051C0C2010F027FC054BE3
-:104C0000041C456003600520011CFFF7E3FCA06065
-:104C1000201C38BD7C120300802108B5C905064858
-:104C200001F0CCFEFE23FE2140029B05400A184302
-:104C3000890505F02FFE08BDC828002038B50D1CD9
-:104C4000ECF75EF8041C281CECF75AF8211C05F060
-:104C500021FE051CFFF7E0FF011C281C05F0E8FC05
-:104C6000011C201C05F076F903239843013B1843EF
-:104C7000014BC01838BDC0460000808008B5FFF762
-:104C8000CBFF03239843013B1843014BC01808BDD9
-:104C900000008080F7B5019008680E1CEBF7CCFF90
-:104CA000019B041C1B4D012B06D1002824DD281C70
-:104CB000211C01F083FE29E07068EBF7BDFF019B2A
-:104CC000071C022B06D1844216DA011B281C01F0B6
-:104CD00075FE1AE0B068EBF7AFFF061E02DDE04399
-:104CE000C01903E0002807D0381B0130311C80199F
-:104CF00004F010FF011E04DC074810F066FBEBF720
-:104D00008AFA281C01F05AFE7043001912F06EFF57
-:104D1000FEBDC046C8280020D8E5020038B5094CC1
-:104D2000094D002802D00868A04203D1281C01F0D8
-:104D30006BFE05E0EBF7ACFF011C281C14F0BDF97D
-:104D4000201C38BD94BA0200C828002010B5041CED
-:104D5000ECF7E8F8EBF770FF011E04DC074810F0F1
-:104D600034FBEBF758FA064801F028FE12F03EFF3C
-:104D70000422011C201CECF7EBF810BD34E7020004
-:104D8000C828002038B50D1CEBF756FF041C281C62
-:104D9000EBF752FF844204DD064810F016FBEBF7F8
-:104DA0003AFA0130011B044801F008FE001912F024
-:104DB0001DFF38BDD8E50200C828002010B5EBF76C
-:104DC0003BFF041E1E2C01DC002804D1094810F012
-:104DD000FCFAEBF720FA80210748C90501F0EEFD47
-:104DE000202301221B1B5242DA40104012F019FF0F
-:104DF00010BDC046D8E50200C82800200121836804
-:104E0000034A0B4200D1034A8B438360101C704756
-:104E10005CC30200A0C3020008B5406814F0A1F909
-:104E2000024B002800D1024B181C08BD5CC30200D5
-:104E3000A0C3020082B0000C012804D1034A936889
-:104E400002331843906002B07047C04670000020E3
-:104E500082B0000C012804D1034A9368023318433E
-:104E6000906002B07047C0467C00002037B5C02576
-:104E70000121074C00950A1C201C064B02F026F865
-:104E80000095201C02210122034B02F01FF837BDC0
-:104E9000B4290020354E0100514E010030B5124BAF
-:104EA0008BB003AC20C90138009301940323EFF7C2
-:104EB000BDFB06A8616811F02FFE039B089A5900FC
-:104EC000237A00936868079B01F0D8F9021E05D089
-:104ED00006490748F6F7FAFEEBF79DF906A90548DB
-:104EE000EDF776FB0BB030BDFC13030058AB0300AD
-:104EF00088E7020044C2020030B5114B89B002AC11
-:104F000020C90138009301940323EFF78FFB6068F9
-:104F100005A90122ECF750F8029B059A5900237A63
-:104F200000936868069B01F0F3F9021E05D005495D
-:104F30000548F6F7CBFEEBF76EF9044809B030BD33
-:104F4000341403007BAB030088E7020094BA02002C
-:104F500008B5406814F03CFA024B002800D1024B1F
-:104F6000181C08BD5CC30200A0C3020070B5061C7B
-:104F7000EEF7F2FE0E4B0F4A0F4C9A620022DA62F5
-:104F80000E4A5B629A630E49201C13F034FD0D4DEE
-:104F9000281C03F09DFA706802F01EF9281C03F02B
-:104FA000A1FA201C13F016FDEEF7C6FE064870BDF0
-:104FB000C8280020B5630100D42800201189020010
-:104FC00070170000CC29002094BA020008B5406890
-:104FD00014F006FA004808BD94BA0200F8B5094E6C
-:104FE0003378002B0CD1084D2C78E4B2002C07D17B
-:104FF000012700682F7003685B6898472C70377032
-:10500000F8BDC046532E0020542E002010B5041CBD
-:10501000044B0833036013F0DDFC201C00F04EF855
-:10502000201C10BDB0B502001FB5041C00F044FFE9
-:105030000B4B01A81A1C3C336360002308326361E8
-:1050400022600849221C0CF0B5FE074901A80BF0AC
-:10505000E3FE606113F0BFFD201C04B010BDC0462C
-:10506000C8B502009FAB0300A3AB0300074B10B50C
-:105070001A1C041C08323C330260436040690BF088
-:105080005BFD201C00F02CFF201C10BDC8B50200E9
-:10509000084B10B508330360002343608360C3608E
-:1050A000041C00F065F90449206113F01EFE201C69
-:1050B00010BDC04610B602009B8A020010B5041C49
-:1050C000034B0833036013F0F5FC201C10BDC046F1
-:1050D00010B6020038B50C4B041C0360002343607B
-:1050E0008360C3600362436283639623051D9B0153
-:1050F000C363281C00F0CEFD281C0449221C00F0CC
-:1051000065FE201C38BDC04630B60200C38A0200CE
-:1051100008B5054B1B68002B04D10448182119223F
-:1051200000F0B8FD08BDC046B8280020CC2F0020F4
-:10513000074B083303600023064A9958814201D186
-:10514000002199508022043352009342F4D17047D9
-:1051500038B60200A8270020F0B50F1C85B02F49F3
-:10516000051C16F02FF9041E02D1FFF7D1FF52E003
-:10517000281C2B4916F026F9002803D1FFF7C8FF99
-:10518000012448E0281C274916F01CF90024A042FD
-:1051900006D1FFF7BDFF02343DE00134402C0FD0B3
-:1051A000214BA600F2580193002AF6D10BE002A889
-:1051B000291C13F0C8FE02A813F011FF00280CD11F
-:1051C0000124644227E02B783A2BF0D1281C1749A0
-:1051D00002AA0CF011FE029818E002A813F0E9FEF2
-:1051E000002803D002A813F0EEFE0FE002A813F08F
-:1051F000D7FE051EE4D0036802A89B68009313F055
-:10520000C2FE3A1C011C009B281C98470028D7D0DE
-:10521000019B03349851201C05B0F0BDA6AB0300E0
-:10522000B5AB0300ADAB0300A82700209FAB030084
-:1052300008B5031C0020022B0DDD0749033B9B0032
-:105240005A585850824204D01368101C5B68984723
-:1052500001E00120404208BDA827002070B50C1CC9
-:10526000151C022810DC0F4B1B68002B01D1FFF727
-:105270004FFF6619B44205D021780B4800F0F6FDC7
-:105280000134F7E7281C0BE00338084B8000C058B6
-:10529000002803D003681B68984701E001204042C2
-:1052A00070BDC046B8280020CC2F0020A8270020C1
-:1052B00010B50C1C02280BDC0C4B1B68002B01D119
-:1052C000FFF726FF0A4813F017FE207001200BE0BD
-:1052D0000338084B8000C058002803D003689B683F
-:1052E000984701E00120404210BDC046B828002088
-:1052F000CC2F0020A827002008B5031C0120022B7A
-:105300000BDD033B054A9B009858002803D0036837
-:10531000DB68984701E00120404208BDA827002033
-:1053200008B5031C0020022B0BDD033B05489B0046
-:105330001858002803D003681B69984701E0012032
-:10534000404208BDA8270020074A13681818EFF349
-:105350000881884205D30C220120044B40421A6088
-:1053600001E01060181C704788000020D42F002036
-:1053700000487047C815030008B5024813F0BEFC8A
-:1053800008BDC046C81503000848026803210A4347
-:1053900002600749074A084B9B1A03DD043BC858C3
-:1053A000D050FBDC054880470548004724050040F5
-:1053B00008B103000000002028010020055F010063
-:1053C00075010000FEE7FEE7FEE7FEE7FEE7FEE709
-:1053D00070B51D1CA023041C161CDB00002D03D07F
-:1053E00000224068C25001E00268D550082902D06E
-:1053F000104813F02CFC032E0AD8301C04F0DCFA01
-:105400000B020406022307E0042305E0062303E061
-:10541000094813F01CFC0023A0220848D200002DEC
-:1054200003D061680B50022302E021680B50012376
-:105430008B5070BDBDAB0300D6AB0300540500001C
-:10544000036810B55A1C2ED0A0220020164CD200A2
-:105450009850101C154AA14202DC802189041FE0EB
-:10546000134CA14202DC8021C90419E0114CA14275
-:1054700002DC8021090513E00F4CA14202DC8021EF
-:1054800049050DE00D4CA14202DC8021890507E0B1
-:105490000B4CA14202DC8021C90501E080210906F4
-:1054A000995001221A5010BD8FD00300240500002E
-:1054B0001FA107003F420F007F841E00FF083D0030
-:1054C000FF117A00F7B5009308AB1B78051C5BB29F
-:1054D0000F1C161C0193013329D1624B1A78022A42
-:1054E00010D15978FAB291420CD19978F2B2914226
-:1054F00008D1DA786B461B789A4203D101235A4CC3
-:1055000003723BE0594A1378DBB2022B0FD150787B
-:10551000F9B288420BD19078F1B2884207D1D178A4
-:105520006A461278914202D12B72514C26E04F4BC1
-:105530001A78002A0BD10232F9B21A705970F1B2FE
-:105540009970694609782A72D970494C13E0454B25
-:105550001A78002A0CD102321A70FAB25A70F2B2DA
-:105560009A706A461278404CDA7001232B7202E07E
-:10557000404813F06CFB019B01332ED101235B42A9
-:105580006B60012000233C4A391C2C60A350A050C2
-:10559000A022C131FF31D2058900885037496750B8
-:1055A0000099C131FF3189008850A1210098C900BC
-:1055B0006050311CC131FF3189008B50A222D200D2
-:1055C000A650FC34281CE36008211A1CFFF700FFDA
-:1055D000281C2B49FFF734FF42E0012300225B42E5
-:1055E0002B60254B6C60E25001232349381C63502B
-:1055F000A021C130FF30C90580004250301CC130AD
-:10560000FF30800042500098C130FF30800042508F
-:105610000198C130FF3080004250A221C90067507C
-:105620001649009866500439605016490198605038
-:10563000211CFC318A60CA62A721C9006350103165
-:10564000635011481149605011491248605080213F
-:10565000042089006050F939281CFF39FFF7B8FE93
-:10566000F7BDC046572E0020003000405B2E0020C2
-:1056700000400040E7AB0300FC0F00000C050000F9
-:1056800040420F0014050000562E00204405000083
-:1056900034050000552E002003681A1CFC32D06827
-:1056A0000028FAD105481950D1680129FCD1002100
-:1056B000D160A322D20098587047C0461C05000054
-:1056C000084B0068C150084B021CFC32116A0029CB
-:1056D00004D1013B002BF7D1012001E00020106232
-:1056E0007047C0461C050000A186010010B5036884
-:1056F000002A03D0802202209200985001221A62D0
-:10570000084A1C1CFC34E068002804D1013A002A35
-:10571000F7D1012005E00020A322E060D2009B58D1
-:105720000B7010BDA186010010B50B4C02680B4B2D
-:10573000A14204DC0A498160CC2149040AE0094CF9
-:10574000A14203DC08498160802102E007498160B1
-:10575000CD21C904D15010BD8FD003002405000015
-:10576000A08601007F1A060090D00300801A060070
-:1057700070B5041C101CA025C026C130FF30F600F7
-:10578000ED0580004651081CC130FF3080004651B5
-:10579000A1252068ED004251054A8150191C201CAA
-:1057A000FFF7C2FFA02305212268DB00D15070BDA6
-:1057B0000C050000F8B50E1C151C041C00F0FEF8CA
-:1057C0002648F2B20378011CDBB2012B06D14778E0
-:1057D000974203D18778E8B2874211D02048EFB2D0
-:1057E0000378012B05D14378934202D18078B842E7
-:1057F00011D00878002806D101230B704A708F70F1
-:105800006373184B15E0164B1978002907D1013145
-:1058100019705A709F7002236373134B09E0134889
-:1058200013F015FA0023FC22236065712671936240
-:10583000FFDE191C0022FC312360657126718A622B
-:10584000A021C9005A500A49201C5A5001325A500E
-:10585000311C2A1C074BFFF78BFFF8BD572E002089
-:105860005B2E00200030004000400040F8AB0300F9
-:10587000FC0F0000A0860100026808B5031C101C84
-:105880000021FC308162A020C00011500648115058
-:10589000013111500421052259569A56181C9B6853
-:1058A000FFF766FF08BDC046FC0F0000036800213B
-:1058B0001A1CFC3210B5916001315961074B916897
-:1058C000002904D1013B002BF9D1012004E0002480
-:1058D0000473FFF7D1FF201C10BDC046A186010054
-:1058E000036810B5191CFC318A6A0020012A08D10E
-:1058F000044C1C5988625A610238A40701D4012063
-:10590000404210BDC4040000A023F0B5284FDB00C6
-:10591000FA5885B001920022A024FA50E023254ACB
-:10592000E405DB00E658E2507833E15801250291A6
-:10593000E250A1238022DB00D205E2500420E55092
-:1059400013F0B0FAA222D200A35803979B0F2B4268
-:1059500005D0A35813242B4202D0012018E01324B1
-:10596000013C002C13D0A0250127134BED05EF506F
-:10597000042013F097FAA123DB00EF50042013F06A
-:1059800091FAA223DB00EB585B00E9D5E5E7201C88
-:10599000A023E0220299DB05D2009E507832995074
-:1059A000A023039A0199DB00D15005B0F0BDC04699
-:1059B000004000400D0600000C050000A023E0217F
-:1059C000134ADB05C90010B55A5078315A50114BB3
-:1059D0000022191CFC31CA600A62A1211E20C900E4
-:1059E0005A500D4A0D4C9850CC200D4A4004985006
-:1059F000A2200C4AC00014500B4C0C48145001203B
-:105A00005050A0220521D2009950FFF77DFF10BD14
-:105A10000C060000004000400C050000384100402A
-:105A20002405000000F001401C4000401405000067
-:105A30000A480B4982680B4B002A08D01A680132C9
-:105A40001A6000228260D222022092008850064A08
-:105A50001B688858190A1B0618437047FC10014040
-:105A600000100140B428002004050000174B70B559
-:105A70009A68002A0AD0164902200A6801320A6090
-:105A800000229A60D2221349920088505B6C114C1C
-:105A9000002B19D0104E3378002B15D00F4B1D68FA
-:105AA000FFF7C6FF2D1A002D0EDC0021074BD22276
-:105AB0005964802392005B02A3503170C221890097
-:105AC0006350A350FFF758FC70BDC046FC10014066
-:105AD000B428002000100140602E0020B0280020D3
-:105AE00038B5124C2378002B1ED1A121C420104AB6
-:105AF000C9005350C1390233FF3953504439535010
-:105B00000C4980000D580C4B2B40C0252D022B4317
-:105B10000B508023012591389B02FF380B500B60FE
-:105B2000156013F0D6F9257038BDC0465F2E0020F1
-:105B30000010014000E100E0FF00FFFF08B5084B46
-:105B40001B78002B01D1FFF7CBFFFFF771FF054A50
-:105B5000002304F069F94904C00B084308BDC0469E
-:105B60005F2E002040420F00F8B5284B041C1B7824
-:105B7000002B01D1FFF7B4FFFFF75AFF244A00239F
-:105B800004F052F94B04C00BCF0B18430026221C23
-:105B90000023802192197B410906884205D9002CF7
-:105BA00003DB0020012112184B41D9030023540CC0
-:105BB000D003184A2143801859410023144A04F0A5
-:105BC00013F9154D041C2B78144E002B02D03368AA
-:105BD00098421AD0FFF72CFF201A022802DCFFF7A8
-:105BE00027FF841CA82122020D4B120AC9005A501B
-:105BF0002A783460002A08D101322A708022F939CB
-:105C00005202FF395A5044395A50F8BD5F2E0020D5
-:105C100040420F003F420F00602E0020B0280020BD
-:105C200000100140074B1A78002A09D08021C220B9
-:105C3000054A4902800011504030115000221A706C
-:105C40007047C046602E0020001001400022024B29
-:105C50009A605A647047C046FC100140012310B599
-:105C60000A4ADC00A458A14207DA013BDB00D31842
-:105C70005A680168064BCA5007E00133112BEFD177
-:105C800080210268024B4905D15010BDD015030098
-:105C900024050000F8B50F1C0121254BB940036015
-:105CA000A023244CDB05161C1A59051C0A4380212D
-:105CB0001A511A5909060A430121B1401A511A59B9
-:105CC0008A4396211A511A598901520052081A51D1
-:105CD000FFF7C4FF002204202B6817495A506C3983
-:105CE0005850012199601960191CFC31CA60134990
-:105CF0005A506A6014391F325A5011495F500918BE
-:105D00005A501E517B1C03D0381C032113F06CF930
-:105D1000731C03D0301C032113F066F90122094BD8
-:105D2000291C1A600848073215F034FAF8BDC0463D
-:105D300000200040140500006C0500001C05000058
-:105D40000C050000B8280020CC2F002008B59623B1
-:105D5000DB00994202DDFFF781FF04E09E2102682B
-:105D6000014BC902D15008BD240500000168034B56
-:105D7000002A00D00E22CA507047C0466C050000B1
-:105D800008B5C1230D4A9B00D158090603D50C491B
-:105D9000096A002908D1D3585B070DD5084B0021AB
-:105DA000DB68002B01D107E00121064B18680028B1
-:105DB00002D0054B1B68984708BDC0460020004034
-:105DC000FC200040BC280020C0280020034B1960A4
-:105DD000436803499B005A507047C046C0280020C2
-:105DE000BC28002000681E4B70B5C3185C4263419C
-:105DF0005B00002A1AD0002903D0012905D1802197
-:105E000000E00421C12292008150FF25C021C0245E
-:105E10005BB2DE00B540B1401248A4000259AA436B
-:105E20000A43025101229A40026018E0002908D07A
-:105E3000012914D1C22280249200845082589208F1
-:105E400006E0C22204219200815082580339D2090F
-:105E5000914304D001229A40131C034AD36770BDBA
-:105E600000E0FFBF00E100E004E100E003681A1C6D
-:105E7000FC32106A0128FAD100201062014AC9B22E
-:105E8000995070471C05000001704B1C0AD001237B
-:105E90008B404360044BC360044B0361044B43617C
-:105EA000044B83607047C046080500500C05005045
-:105EB0001005005014050050074B10B50022041CBB
-:105EC00008C000F091F8054B201C1A1C343308322E
-:105ED0002260636010BDC04640B6020068B6020092
-:105EE000074B10B51A1C041C08323433026043609F
-:105EF000043000F05FF8201CFFF71AF9201C10BDD9
-:105F000068B60200234A10B51378111C012B19D171
-:105F1000214B1B681B0715D1204BE0241A68F02386
-:105F2000101C184022420BD11D4A12681A4209D196
-:105F30001C4A1D4B1A6080221C4B12021A6001E0A1
-:105F40003028F1D00B68DBB2012B0DD1124A126858
-:105F5000120709D1F021114A12680A40402A03D1E0
-:105F60000F4A12680A420DD08022A3230021D205D5
-:105F7000DB00D1500E4B9960013191609A68002A84
-:105F8000FCD005E0C1228021D200C9058B50EBE78F
-:105F900010BDC046E00F00F0E40F00F0E80F00F085
-:105FA000EC0F00F0DFFF07C004050040186C004054
-:105FB000FC0000400A4B083303608368002B0DD0BF
-:105FC000084A1368834202D14368136006E05A68A6
-:105FD000824201D0131CFAE742685A607047C046FB
-:105FE000A8B60200C4280020064B81600833036075
-:105FF000002302734360994203D0034B1A68186070
-:1060000042607047A8B60200C4280020F8B5071CFB
-:106010000E1C0B4B1C68002C10D0A568002D0BD05B
-:10602000281C391C321C15F0DEF9002804D1281C6C
-:1060300015F0D2F9B04201D06468ECE7201CF8BD3D
-:10604000C428002037B51C4C0321201C14F01BFF72
-:106050001A49201C14F01CFF02F05CFC01F042FA0B
-:10606000174D281C00F078FD6421281C00F070FA00
-:1060700001A814F01FFD01A802F0D6FC114B026824
-:10608000041C9A4210D1436B002B05D1836B002B6B
-:1060900002D1C36B002B07D086239B00E818616BED
-:1060A000A26BE36B01F040F9201C02F06BFCFDF7E2
-:1060B0006FF901F087FBFEE7982C00201D690100B5
-:1060C000C8280020FECAFECA10B5041C054B036098
-:1060D000054B40300360054B4360FEF7C7FF201CB3
-:1060E00010BDC04660B8020078B80200ACB802002B
-:1060F00008B4024B9C46403808BC6047C9600100A8
-:1061000008B4024B9C46443808BC6047C960010093
-:1061100010B5041C044B0360044B0364044B43643C
-:10612000FFF7D2FF201C10BDC0B60200D8B6020097
-:106130000CB7020008B4024B9C46403808BC6047CC
-:106140001161010008B4024B9C46443808BC60470A
-:106150001161010010B5041CFFF7DAFF201C02F0EA
-:1061600011FC201C10BD08B4024B9C46403808BCF2
-:106170006047C0465561010008B4024B9C46443854
-:1061800008BC60475561010010B5041CFFF79CFF77
-:10619000201C02F0F7FB201C10BD08B4024B9C46EB
-:1061A000403808BC6047C0468961010008B4024B12
-:1061B0009C46443808BC60478961010038B50A4DE7
-:1061C000281C00F039F9094C281C221C084914F03D
-:1061D000D0FE084D1321281C03F056F8281C064950
-:1061E000221C14F0C6FE38BDC82800200000002084
-:1061F000FD610100982C00207192010038B5E62362
-:106200001C4A9B00C2501433041CC01813F062F9DE
-:10621000EA239B00E01813F05DF986239B00E01849
-:1062200000F0DCFE201CDD30FF3001F03BFB201CC9
-:10623000A530FF3000F04CFD201C7D30FF3000F019
-:1062400047FD601DFF3001F05FFF201CEC3000F0C7
-:1062500081FD201C251C5430FFF75AFF064B0C35DE
-:10626000281CE36012F0B6FB281CFEF727FF201C59
-:1062700038BDC04600B80200B8B50200F0B51F1C1A
-:1062800085B00AAB1B78041C039300933B1C0D1CC8
-:10629000161C14F046FE002832D0237D082B2DD882
-:1062A00023680022191CFC318A62A0211648C9000B
-:1062B0005A5084461A5005200138C046C046C04690
-:1062C000C046C046C046C046C046C046C046C0469E
-:1062D000C046F1D1012062462368985005225A50E9
-:1062E000FFF76CFB039B201C0093291C3B1C321CFA
-:1062F00014F017FE237D01332375CCE7034800E03B
-:10630000207505B0F0BDC046FC0F00000EFCFFFF7D
-:10631000F0B51F1C85B00AAB1B78041C03930093D7
-:106320003B1C0D1C161C14F0E4FD002832D0237D0C
-:10633000082B2DD823680022191CFC318A62A02169
-:106340001648C9005A5084461A5005200138C046E4
-:10635000C046C046C046C046C046C046C046C0460D
-:10636000C046C046C046F1D101206246236898501D
-:1063700005225A50FFF722FB039B201C0093291C87
-:106380003B1C321C14F0B5FD237D01332375CCE793
-:10639000034800E0207505B0F0BDC046FC0F0000CA
-:1063A0000EFCFFFF024B1B6803607E2343607047B7
-:1063B0008C000020F8B5144B051C9B68DB0701D549
-:1063C00001F0CCF82E1C2F1CD436341CEC3720687E
-:1063D000002815D003689B689847002810D0012139
-:1063E0000A4A13780B4313702C1CAC342068002825
-:1063F00002D003681B6898470434B442F6D1F8BD54
-:106400000434BC42E3D1EFE7C8280020612E00200D
-:10641000BFF34F8F024A034BDA60BFF34F8FFEE7A3
-:106420000400FA0500ED00E008B5011C014802F087
-:1064300063F808BDCC29002030B50025041C91B0BC
-:1064400085600C30FEF724FE201C404B2A1CE360C4
-:106450006562A5631E213C3012F0F3FD201C18215B
-:106460001922543002F008FA201CEC3000F082FCB3
-:106470000522601D131C0621FF3001F06DFE201C5B
-:1064800001217D300B1C00951122FF3000F030FC03
-:10649000201CA530009502211A220123FF3000F0B4
-:1064A00027FC201CCD3002231A210122FF3002F0EC
-:1064B00075FC201CDD3004213A22FF3001F09AFAED
-:1064C00086239B00E0181D22052100F053FE952332
-:1064D0009B00E0181C2101F0CBFB9A239B00E018E5
-:1064E0000A23009301330193013302930133039391
-:1064F000013304930133059301330693013307936A
-:10650000013308930133099301330A9301330B9349
-:1065100001330C9301330D9301330E9301330822A1
-:106520000F930721103B13F057FFE6239B00E01861
-:1065300002F0E0FAEC239B00E0181D2102F0F4FACF
-:10654000F323201C9B00E55011B030BDB8B502000C
-:1065500010B500290DDB012380681840041C081CBD
-:10656000002C03D001F0D6F8002003E012F0B6FBB7
-:10657000FAE7014810BDC04617FCFFFFF0B5A7B011
-:106580000490069107920C2104220BA812F0DAFF66
-:10659000DA49242219311DA814F0FCFD052108A8B0
-:1065A0000A1C13F0C1FFD64909A801F039FC049B6D
-:1065B0006E245D1DFF35281C01F0E2FED1491AA8AA
-:1065C00001F046F91AA97822281C01F05BFF1AA8ED
-:1065D00012F080FF04987D30FF3012F0C2FD0028D9
-:1065E00007D10498A530FF3012F0BBFD002800D180
-:1065F0007AE1281C01F0C4FE281C14F067F900247D
-:10660000C14F0121381C13F05CFE0121061C381C0F
-:1066100013F065FE0022BD4B03929E4210DB013257
-:106620000392321CC8320BDB04220392C822920070
-:10663000964205DC03220392C82E01DC013A039244
-:1066400000220292984210DB01230293031CC833FC
-:106650000BDB04230293C8239B00984205DC032331
-:106660000293C82801DC013B0293652708A813F0B8
-:1066700052FF04ABFF183E1C7378002B06D0731E2C
-:106680001978327808A8FF2301F060FB892304AA57
-:1066900003369B189E42EFD16B460C21595E6B4628
-:1066A00008A808229A5EFF2301F050FB00239848B7
-:1066B000009308A91A1C13F03EFF7B1E1B78039A57
-:1066C00093423AD13B78029A934236D17E78002E9B
-:1066D00033D1862292009446049B311C6344181CDB
-:1066E000059312F015FE04F073FA321C031C211CF2
-:1066F0000BA812F072FF311C059812F016FE04F080
-:1067000067FA0122031C211C0BA812F066FF311C42
-:10671000059812F017FE04F05BFA211C031C0222FC
-:106720000BA812F05AFFFE23211C9B050BA8032285
-:1067300012F053FF01237B70E418892304AA033766
-:106740009B189F42B9D173486421FFF701FF0B2CBE
-:1067500000DC55E70BA812F02CFF0122011C0EA84B
-:1067600012F0F0FE00240BA812F023FF84423EDA60
-:10677000211C00220BA812F01EFF211C061C002267
-:106780000BA812F018FF011C301C03F051FF211C54
-:10679000061C01220BA812F00EFF0122071C211C6F
-:1067A0000BA812F008FF011C381C03F041FF011C6C
-:1067B000301C03F0CFFB211C061C02220BA812F098
-:1067C000FAFE0222211C071C0BA812F0F4FE011C89
-:1067D000381C03F02DFF011C301C03F0BBFB211CF7
-:1067E000031C00220EA812F0F8FE0134BBE70BA92F
-:1067F0000A1C01231AA813F0BDFC1AA911A812F053
-:1068000006FF1AA812F0FAFE14A80BA90EAA01237B
-:1068100013F0B0FC002317A811A914AA13F0AAFCC6
-:10682000002117A80A1C12F0C6FE0121061C002236
-:1068300017A812F0C0FE0022041C022117A812F0B3
-:10684000BAFEFC21071C8905301C03F0F1FE04F0A0
-:106850009FF9FC21061C1A908905201C03F0E8FE14
-:1068600004F096F9FC21041C1B908905381C03F0E8
-:10687000DFFE04F08DF9862189008C46049A031C02
-:106880006244311C1C90101C221C00F04DFD281C81
-:1068900014F01CF809A90AA813F035FE00231E4ABB
-:1068A00000930AA90192281C1A1C01F0B9FD0AA83C
-:1068B00013F01CFE281C14F009F817A812F09EFE15
-:1068C00014A812F09BFE11A812F098FE0EA812F068
-:1068D00095FE09A813F00AFE08A813F007FE0BA8FE
-:1068E00012F08CFE27B0F0BD04986421013CFFF744
-:1068F0002FFE002C00D06DE67BE6C046E4AD030021
-:1069000021AE030066AE0300A42A0020E0FCFFFFD6
-:10691000402A0020C8280020DC050000F0B5F32440
-:10692000214DA40028598DB0002835D002F048FB35
-:10693000836D9B0730D52C5902AE0C220021301CF0
-:1069400014F045FC201C02F04BFB07AC231C174F36
-:106950000190029707CE07C3142001F0EFFF031C3C
-:10696000079746CC46C3124BC36000230361019BCB
-:10697000A4331A68002A00D002611860F3239B0038
-:10698000E85802F02DFB036813215B6A9847FA214F
-:10699000281C8900FFF7DCFDBFF34F8F054A064B2B
-:1069A000DA60BFF34F8FFEE7C828002011640100B2
-:1069B000579002000400FA0500ED00E0F0B5051C58
-:1069C00000291CDD036801390E1C0022DF0F980925
-:1069D000784058401F095C0878409B08434063405A
-:1069E000DB07234301241C405000221C760802438D
-:1069F000002EEBD18A42E7D82B60101C00E0014842
-:106A0000F0BDC04617FCFFFF38B500230360F32339
-:106A1000124A9B00D358002B08D00421041C12F00A
-:106A200018FB002819D00E4B236016E00122042128
-:106A30000C4B1A60036800240B4A54605568094CDB
-:106A4000002DFBD0A122D200A2581B020139134312
-:106A50000029F0D103600123636038BDC8280020FD
-:106A6000ED5EBC0B00D00040FCD0004038B5051CEA
-:106A7000EC30041CD4352868002802D003685B6819
-:106A800098470435A542F6D10121024A13788B4379
-:106A9000137038BD612E0020014B18687047C04646
-:106AA000FC2C002008B5024801F026FD08BDC046B8
-:106AB000CC290020F0B587B01F1C0EAB1B880190BD
-:106AC00003930D9B0D1C02920C9E0093002F39D056
-:106AD000002E01D1DB0735D5202001F02FFF041C4B
-:106AE000103000F057FC6B461B892580638018200E
-:106AF00001F024FF0496061C051C009B80C60021A3
-:106B00001022301C059314F062FB04A90822301CEB
-:106B100014F040FB0D4B00226B6102230399A5602A
-:106B20000B43E260A380E2610198211C00F066F94A
-:106B3000002808D0201C13F04FFF201C01F022FF7A
-:106B4000034800E0034807B0F0BDC0468D90020046
-:106B500013FCFFFF17FCFFFFF0B5041C89B02149AF
-:106B600012F0ADFA201C204912F0CBFA201C1F496C
-:106B700012F0C7FA1E49201C12F0C3FA201CFFF7BE
-:106B800043FF00250627201C1A4B0C30A3621A4B2A
-:106B90001A49A36367606462E56211F02CFF184A2A
-:106BA000059504926A46261C04AB03CB03C2C0239E
-:106BB000EC36029305213A1C231C301CFFF77AFFA8
-:106BC000104A079506926A4606AB03CB03C2C02360
-:106BD000301C02930C491A22231CFFF76BFF09B0EB
-:106BE000F0BDC046CC290020A42A0020E02A0020C5
-:106BF000B4290020B563010011890200701700005C
-:106C00007D65010065900200FD03000030B5C36999
-:106C1000C2681B6885B0041C451D1A424BD0EB7F2F
-:106C2000002B01D0013BEB77EB7F082B0DD9012323
-:106C3000A2791A4209D11A43A271A1881A1C02A88A
-:106C400000F0C6FB1F4B1B682362EB7F012B1DD896
-:106C50000123A2791A4219D00022A188A2716846A4
-:106C6000023200F0B5FBA31DDB7F012B0ED1154ACC
-:106C7000216A12681448521AA188824202D902A8D5
-:106C8000042201E0032202A800F0A2FB0323A27960
-:106C90001340012B14D10B49206A0968091A0B48CB
-:106CA00081420DD902210A43A271A18802A80522BE
-:106CB00000F08EFB04E0EB7F0B2BB5D80133B2E77D
-:106CC00005B030BDFC2C0020E7030000DB05000010
-:106CD00010B5041C044B211C08330360034812F058
-:106CE000FFF9201C10BDC04618B70200C8280020BC
-:106CF000F0B5071C0025161C85B002930AAB1B7863
-:106D000008370393114B041C0833036001918580FD
-:106D10008571291C381C182214F059FA381C311CB2
-:106D2000039A11F0AFFF6B466A469B88127AA380E4
-:106D3000A31DE671DA77631D2562211CDD77044807
-:106D400012F0BDF9201C05B0F0BDC04618B7020016
-:106D5000C828002010B5041C044B211C0833036014
-:106D6000034812F0DFF9201C10BDC04638B70200FE
-:106D7000C82800200023054A8380083283710260FE
-:106D80008360C3600361C3827047C04638B70200A6
-:106D9000F7B50D1C012684680192002C2AD02388A7
-:106DA0002A889A4201D0002B22D163886A889A42AD
-:106DB00001D0002B1CD1C023A2881340C03B5942F4
-:106DC0004B4101998B4212D113B2002B0FDB231CD4
-:106DD000291C103381C981C3530603D5201C12F02E
-:106DE000D1F905E0211C044800F0FCFC00E000267D
-:106DF000E469D2E7301CFEBD85910200F7B5002999
-:106E000052D00D1C061C8468002C19D0AA880023BF
-:106E1000920702D5A3889B07DB0F226829688A4264
-:106E20000CD1002B06D0A068A96813F032FE002810
-:106E30003CD103E0A368AA68934237D0E469E3E752
-:106E4000B0682A88071C031E22D01988914205D2F7
-:106E5000D9691F1C00290DD00B1CF6E7191C3B1C1F
-:106E600008E00C88944207D14F886C88A74203D26F
-:106E70000B1CC9690029F4D183420BD119888A42BD
-:106E800005D3914206D158886988884202D9EB61BE
-:106E9000B56002E0D969E961DD616846084901230E
-:106EA00000F096FA002009E0064807E0A3881AB22D
-:106EB000002A02DA5B045B0CA3800348FEBDC046D7
-:106EC000FD03000017FCFFFF16FCFFFFF0B585B0C7
-:106ED0001E1C0AAB1B88071C0D1C02920393002E7C
-:106EE0001AD0202001F02AFD6B46041C1A89039B4E
-:106EF000A9B20093331C13F058FD381C211CFFF776
-:106F00007DFF00280BD0002C08D0201C13F064FD5E
-:106F1000201C01F037FD01E0024800E0024805B006
-:106F2000F0BDC04617FCFFFF13FCFFFF70B5002942
-:106F300026D00D1C00268468002C1ED00222A988B1
-:106F4000A3884B40134216D1114203D1AB889B0753
-:106F500007D510E0A068A96813F09BFD002804D1B4
-:106F6000F4E7A368AA68934205D12B88002B09D0C7
-:106F700022889A4206D0E469DEE7201C002E0DDC50
-:106F800007480BE06B88002B02D062889A42F2D14E
-:106F9000A388044A01361343A380ECE770BDC046C2
-:106FA00017FCFFFF0080FFFF10B5041C8AB0002B08
-:106FB0000FD0102092B289B2009002A813F0F5FC15
-:106FC00002A9201CFFF7B2FF02A813F005FD002064
-:106FD00000E001480AB010BD17FCFFFF10B5041C0B
-:106FE000044B211C08330360034812F09BF8201C5B
-:106FF00010BDC04658B70200C82800201FB503AB1B
-:107000005A70002219700189009203481A1C022349
-:10701000FFF77EF905B000BD04290020F0B5151C6E
-:107020000F2285B06A44071C1C1C1170002D16D05D
-:10703000002B14DD01230B4E01890093301CFFF758
-:1070400067F9002801D008480AE039892A1C009015
-:10705000231C301CFFF712F9002801D0F3E7034886
-:1070600005B0F0BD042900200EFCFFFF17FCFFFF58
-:107070007FB5002303AC104D21700189061C0093DD
-:10708000281C221C0133FFF743F9002801D00B48CC
-:107090000FE02070607031890090221C281C0223B0
-:1070A000FFF7ECF80028F2D120786378000218434B
-:1070B00000B204B070BDC046042900200EFCFFFFE2
-:1070C00013B56B46DC1D0023221C23700133FFF730
-:1070D000A5FF002801D1207800E0014816BDC04678
-:1070E0000EFCFFFFF8B510210022041CFFF786FFFD
-:1070F0001D4E002835D1201C0821FFF7E1FFB042CA
-:107100002FD00325054027D1FA23184A61899B0017
-:107110005943131C50331E1C083A1F68181C8F4219
-:1071200003D3083B061C9342F7D1FA21306889004B
-:1071300002F060FC11216081A022201CFFF75EFF9D
-:1071400000280ED101223379201C1A431021FFF7A9
-:1071500055FF002806D004E064210548FFF7F8F940
-:10716000C9E7014D281CF8BD0EFCFFFF58160300AF
-:10717000C8280020F8B5051C0F1C0021144B24352D
-:107180000833041C161C0360182281808171C160C1
-:10719000016141618161C1610162281C14F017F82D
-:1071A000281C1D2111F069FD01256423A78026817B
-:1071B000A5716381201CFFF795FFA379054AAB43B6
-:1071C000A37108239168201C0B439360F8BDC0464F
-:1071D00058B70200C8280020F7B5837902271D1C84
-:1071E0003D4013D10126041CB3433B438371818886
-:1071F0000622331C684600F0EBF8A379281C1A1C01
-:10720000BA43A271334202D1014800E00148FEBDF9
-:1072100014FCFFFF15FCFFFFF0B5837985B09A07DA
-:1072200075D4041CDB0701D4FFF7D6FF394D281CA9
-:1072300013F0BDF8071C281C13F0B0F8A369E2682E
-:10724000061C981A03F0C4FC226A6369051C981A8C
-:1072500003F0BEFC0290381C06F0FCF80090381CCD
-:1072600005F04CFF0190301C06F0F4F8071C301CB0
-:1072700005F044FF00990390029803F0D9F90199B1
-:10728000061C281C03F0D4F9011C301C03F002FB7F
-:107290002369061CE069181A03F09AFC039903F0AD
-:1072A000C7F9391C041C281C03F0C2F9009903F02B
-:1072B000BFF9011C201C02F04DFE391C041C029871
-:1072C00003F0B6F9019903F0B3F9011C201C02F098
-:1072D00041FE011C301C06F027FA0F4903F0A8F903
-:1072E00005F0F2FA0D4A0E4B04F02AF805F040FBC7
-:1072F0000021041C02F050FD002804D0201C064987
-:1073000002F028FE041C201C03F042FC00E00548AB
-:1073100005B0F0BDA42A00200000B443EA2E445476
-:10732000FB21194015FCFFFFF0B587B001AD071C2C
-:1073300005A8161C6A60AB600093019113F0BAFBBC
-:1073400005A801F071FB019B426B041C9A4213D10A
-:10735000826BB24210D1C26B00998A420CD1201CC0
-:1073600001F010FB3B1C0C3307CD07C30122BB7996
-:107370001343BB7107B0F0BD054A6363009B2260F5
-:10738000A663E36305A8211C13F095FBE7E7C0465D
-:10739000FECAFECA002303804380024B1B68436081
-:1073A0007047C046FC2C002008B5031C012904D1FD
-:1073B000064806CB11F05FFF06E0022904D103481E
-:1073C000191C0022FFF7E4FC08BDC046B4290020C8
-:1073D00010B54280054A041C126801804260002BEF
-:1073E00002D0191CFFF7E0FF201C10BDFC2C002070
-:1073F00008B5031C024806CB11F03DFF08BDC0468E
-:10740000B4290020F0B5061C0027204B85B01C686D
-:107410000290039185B2360C002C2AD0636D1C4972
-:107420000193A36C9AB21B0C8D4211D119498A4267
-:107430000ED1002B01D0B34219D1002F17D1201C3F
-:1074400011F0F4FF201C144911F0DDFF01370EE0AC
-:10745000002A01D0AA420AD1002B01D0B34206D1A2
-:10746000201C11F0E3FF201C0B4911F0CCFF019C04
-:10747000D2E70A4BEB18012B05D90948291C321C0D
-:10748000084BFFF791FD05B0F0BDC046002D002070
-:10749000FE030000FF030000E82C002002FCFFFFB9
-:1074A000B42900200574010010B572B60B4B1C689E
-:1074B000002C03D0201C11F0B9FF08E062B65C205C
-:1074C00001F03CFA00215C22041C13F080FE002332
-:1074D000E364034B201CE36310BDC046F42C002082
-:1074E0000040002073B5FFF7DFFF124B1249186010
-:1074F00011F089FFFFF7D8FFC026104B104D186020
-:10750000104B114C4363114B1149836300220096C9
-:10751000281C231CFFF7DAFC0096281C231C0D49AD
-:107520000022FFF7D3FC01230B4A91680B439360C1
-:1075300073BDC046EC2C0020E82C0020F02C00206D
-:10754000B4290020FC3F002005740100C99402000A
-:10755000FF030000FE030000C82800200D4B70B59B
-:107560000D481C6811F0EFFD0C4B1D1C1A688018AB
-:107570001860002C0DD02B68A26C666D934206D368
-:10758000201C11F053FF201C054911F03CFF341C56
-:10759000EFE770BDF82C0020C8280020FC2C00204C
-:1075A000E82C0020F7B5002801D1002019E00029BF
-:1075B000FBD00193171C0D1C061CFFF775FF041E62
-:1075C000F3D0084B019A4363066045608760064B21
-:1075D000002A00D0054B201CA363054911F013FFBE
-:1075E000201CFEBDFC3F00209D940200B3940200CD
-:1075F000E82C0020024B1868434258417047C046AF
-:10760000E82C002010B5094C201CFFF72FFA084B7E
-:107610001B68002B08D1F3239B00E058002802D000
-:1076200001F0EEFC00E030BF10BDC046C8280020CD
-:10763000E82C00200121F8B52F4E3468351CE36C8E
-:107640000B4218D002252B43E36404232B4F3868E8
-:10765000C26C1343C364636BC36311F006FF3B68E2
-:10766000181C596C01F0F7FA3068C36C2B4241D0FA
-:1076700001F02BFB3EE0224F224E3A68002A03D055
-:1076800021480078084201D0326806E0216DB942F5
-:1076900003D1616D002900D00A1C2A602A68316874
-:1076A0008A420CD11B070AD52C60FFF7ABFF3B6861
-:1076B000002BFAD0144A1278D207F6D42B602B682C
-:1076C000A34217D03268934204D1104A5A63104A39
-:1076D0009A6305E0944203D10020191C021C06E0C5
-:1076E000201C11F0C2FE2B68201C191C626C5B6C04
-:1076F00001F070FAF8BDC046EC2C0020042D0020EB
-:10770000E82C0020F02C0020612E0020FC3F0020FF
-:10771000C994020038B50D4B051C1C68E36CDB07EF
-:1077200006D5FFF7C1FE0A4B1860002800D0041CE4
-:10773000084B18682818A064201C11F077FE201C44
-:10774000054911F060FEFFF775FF38BDEC2C0020F5
-:10775000042D0020FC2C0020F82C0020134B73B5C6
-:107760001C68051CE36C0E1CDB0706D5FFF79CFEAE
-:107770000F4B1860002800D0041C33042B43A36473
-:10778000201C11F053FE201C0A4911F03CFE0A4B4C
-:10779000EB18012B07D9C02308480093291C321C81
-:1077A000074BFFF793FBFFF745FF73BDEC2C002061
-:1077B000042D0020002D002002FCFFFFB429002032
-:1077C0000574010010B5054C206811F02FFE2068EB
-:1077D000034911F018FEFFF72DFF10BDEC2C00201F
-:1077E000F42C0020F7B5002829D00726154F041CDB
-:1077F00038680D1CC36C1E4005D0201C124A11F0C5
-:107800002CFE00261CE001F048FA02213A68D36CF5
-:107810001940019103D003218B43D36410E001266A
-:107820003343D364281CA0473A68D36C191CB14376
-:10783000D164019E5B0703D5FFF7C4FF00E0034E50
-:10784000301CFEBDEC2C0020AB94020017FCFFFFA7
-:1078500010B5041C002902D00B78002B02D1034B79
-:10786000236001E011F03DFE201C10BDB0160300A6
-:10787000014B03607047C046B016030010B50548C1
-:10788000054C206013F0E2F8201C0449044A13F070
-:1078900070FB10BDB0160300082D0020D594020027
-:1078A0000000002010B5041C044B211C08330360A9
-:1078B000034811F037FC201C10BDC04678B7020009
-:1078C000C82800201FB503AB5A7000221970018927
-:1078D000009203481A1C0223FEF71AFD05B000BDF2
-:1078E00004290020FA2370B52A4A41899B00594394
-:1078F000131C3833041C181C083A1D681E1C8D42CA
-:107900000CD2061C244B227B1D1D082A0BD8042AEE
-:1079100009D89D1C022A06D81D1C04E0083B301C17
-:107920009342EAD1EEE7FA213068890002F062F86A
-:1079300060812B78201C23732A210022FFF7C2FFCD
-:10794000002801D0154824E0201C2B211022FFF72D
-:10795000B9FF0028F6D1201C2D210122FFF7B2FF2C
-:107960000028EFD1201C2E210122FFF7ABFF0028B9
-:10797000E8D16A78201C0E21FFF7A4FF0028E1D18E
-:1079800001223379201C1A432A21FFF79BFF00288C
-:10799000D8D170BDB81603007BAE03000EFCFFFF0C
-:1079A000F0B5151C0F2285B06A44071C1C1C117011
-:1079B000002D16D0002B14DD01230B4E01890093FE
-:1079C000301CFEF7A5FC002801D008480AE03989E0
-:1079D0002A1C0090231C301CFEF750FC002801D00C
-:1079E000F3E7034805B0F0BD042900200EFCFFFFBB
-:1079F00017FCFFFFF7B5061C00251A4B1436083399
-:107A0000041C03600F1C0192858018228571C581BA
-:107A100005824582291C301C13F0D9FB301C1C2127
-:107A200011F02BF96B469B88022623811423638176
-:107A3000231C032134331A79A780B2430A40A5716D
-:107A40002673201C1D705D709D701A715D71FFF7AB
-:107A500049FFA84203D1044A936833439360201C32
-:107A6000FEBDC04678B70200C8280020F7B5041C48
-:107A700012F0EFFB251C00900E23E25E5B4F52429A
-:107A80003835BA4205DA022329780B4000D083E06A
-:107A900008E0FA21002389008A4203DD2B789B0746
-:107AA0007AD500231020215E4942B94203DA2E78AC
-:107AB00070077DD406E0FA26B600B14202DD2E78CA
-:107AC000700775D51220265EBE4203DA2F7838077C
-:107AD0007AD406E0FA27BF00BE4202DD2F783807CD
-:107AE00072D5002B13D0251C38352B789C461B09EA
-:107AF000032B0CDC0F2701333B401801019060463B
-:107B00003840071C019807432F70042B66D0231CB4
-:107B100039331B7838340133DBB2092B01D8637059
-:107B200014E00023637023789C461B090ED00F25B8
-:107B300060460F3328402B40051C1F013D43257034
-:107B4000002B03D1EBB20125AB432370012724782E
-:107B50000B233C4047D1264D0098043BA84242DD10
-:107B60009025DB192D04A8423DDC224D053BAA429D
-:107B700039DBC820DB198000824234DC023BA94299
-:107B800031DB3B1C81422EDC0433AE422BDBDB19A4
-:107B9000864228DC231C26E00123181C29784E0885
-:107BA000B043061C02209E4081433143297079E78F
-:107BB00001202E78B30898438300181C04239E43A9
-:107BC00006432E7001237DE701272B78D8088743D1
-:107BD0000820FF0083433B432B7084E701272B7869
-:107BE0003B432B7093E7181CFEBDC04618FCFFFFFB
-:107BF000FF700200E0FCFFFF7FB501216A4606230B
-:107C0000041CFFF7CDFE051E22D16B4602216846FB
-:107C1000012659561B79227B5BB2534300785143AE
-:107C200040B242439BB2DB006382A37989B2D200A7
-:107C3000B343E281CA002282A371201C12F015FB1B
-:107C4000A18802A8321C331CFFF7C2FB281C00E0ED
-:107C5000014804B070BDC0460EFCFFFF034B1A681C
-:107C6000836800209A4240417047C046FC2C0020A7
-:107C7000084B10B508330360FA23041C00229B0054
-:107C800082718180C3608260211C034811F039FA3F
-:107C9000201C10BD98B70200C82800201FB5F32390
-:107CA000154A9B00D358041C002B03D001A812F0E6
-:107CB0008AFB0EE00122114B1A60114B5A68002A10
-:107CC000FBD000225A600F4B01321B6801930B4B13
-:107CD0005A60019BA188DA17920FD3189B10238258
-:107CE000094BE2681B6802A8D3180122A360131C89
-:107CF000FFF76EFB1FBDC046C828002000C0004033
-:107D0000FCC0004008C50040FC2C0020054B8268E8
-:107D10001B6810B5041C934201D3FFF7BFFF10236B
-:107D2000E05E10BDFC2C002008B5044B82681B6887
-:107D3000934201D3FFF7B2FF08BDC046FC2C0020E0
-:107D4000014B03607047C046F816030030B5046865
-:107D50006088814206DAA588AA4203DA002901DB9D
-:107D6000002A01DA034804E05043611808188371BF
-:107D7000002030BD17FCFFFFF0B5071C85B00D1CBF
-:107D80001E1C002921DD002B1FD00468638803918D
-:107D9000994200DD0393A38802929A4200DD029388
-:107DA000002306340193019B029A93420BDA201CB4
-:107DB000311C039A13F0EEF93B6876195B88E418DE
-:107DC000019B0133EEE7002000E0014805B0F0BD63
-:107DD00017FCFFFFF8B5041C0E1C151C1F1C002906
-:107DE00001DB002A02DA0D4B236015E0101C48432A
-:107DF000063000F0A3FD206012F025FE2368201C51
-:107E00005E809D80002F05D0311C2A1C3B1CFFF793
-:107E1000B3FF01E012F07FFBF8BDC046F816030087
-:107E2000F0B5061C87B00C1E05D000200F1C051CE9
-:107E30000190011C15E0224B03603EE030225242CB
-:107E400094469C446246092A14D90A2B0DD1019B01
-:107E50002D1801330193A94200DA291C0020051CCA
-:107E600001373B78002BE9D106E00028F8D0013536
-:107E70000020F5E70120F3E76A46928809B212B2C2
-:107E8000301CFFF7A7FF33689D1D03AB1F1C227832
-:107E9000002A12D0111C3039092902D81A70013376
-:107EA00009E000221A70BB4205D9381C13F070F8A3
-:107EB0003B1C287001350134E9E7301C07B0F0BDE8
-:107EC000F8160300F0B5041C87B00F1C04A8224963
-:107ED000151C1E1C12F0FFFC23685A88954208DA14
-:107EE0009B889E4205DA1F2F03D9059B00939F4272
-:107EF00001DD1A482DE0052300217B430193049BFB
-:107F00000293019B029ACB18A03BD35C00220393FF
-:107F10008B199C465319276800937888834202DAAC
-:107F2000BB889C4507DB0132052AF3D101310529C5
-:107F3000E7D100200DE063465843009BFB18102753
-:107F400017411818039B1F407B1E9F417F4287717A
-:107F5000E9E707B0F0BDC046CC29002017FCFFFFC1
-:107F6000F7B503689E1D5B885A1A019200291CDD33
-:107F70000C1C051C0027994202DB12F0CCFA12E01F
-:107F80002B689B889F420EDA3119301C019A13F03E
-:107F900001F9019B211CF01812F0AFFA2B68013790
-:107FA0005B88F618ECE7002000E00148FEBDC04603
-:107FB00017FCFFFF10B50548054C206012F046FD88
-:107FC000201C0449044A12F0D4FF10BDF816030027
-:107FD0000C2D0020EDA4020000000020054B1A78B3
-:107FE000F0231343044A13701F22C37A1343034A36
-:107FF000137070471005005004050050050500502F
-:10800000F0B5041C85B000252A1C636FA17A0633E5
-:108010000293E37949009C465B000093637A013147
-:108020000393A37B277B0193304B59184B1E1B787E
-:108030000878012F05D16646013E361A181C331CFC
-:108040000FE0022F06D16646013EF31A267A013E62
-:10805000301A06E0032F04D1267A013EF61A031CDB
-:10806000301C009E7043C3180298C3181E780398F2
-:10807000864201D9231C09331B780198034202D0A0
-:108080000123AB401A4301350631092DCED1D2432D
-:108090000F21174B10011B78D2050B4003431549E4
-:1080A000DBB20B70E37AD20E1A43134B1A70E37BE8
-:1080B000072B18D8A27B581C5200A2730F499A00B4
-:1080C000E073022B03D8885810F0FDFD9BE70C4BA2
-:1080D000201C2363002363630A4B8958E4622364F2
-:1080E000143010F088FC05B0F0BDC04681AE03002E
-:1080F000100500500405005005050050001703004E
-:10810000018001005DA6020010B5041C0F4B211C6C
-:10811000083303600E4810F0E3FF201C743012F0A7
-:10812000E5F9201C643012F0E1F9201C5C3011F0FC
-:10813000D1F9201C543011F0CDF9201C054B14301E
-:108140006361FCF763FF201C10BDC046B8B7020096
-:10815000C8280020C0B80200F7B50025041C1F1C69
-:10816000254B85800833036085711430161C0191FE
-:10817000FCF78EFF201C214BE562636125644430CF
-:10818000FEF710F9201C5430FFF772FB201C5C3006
-:10819000FFF76EFB201C6430FFF7D2FD201C71003E
-:1081A00074303AB212F0C0F904231A1CA021032043
-:1081B000C132FF329200C90501335050112BF4D166
-:1081C00020226B46E2721F3A9B88A273FE326272D3
-:1081D000221CA38000234C32E6712772A372237302
-:1081E000E373237463731370054AE3669168043381
-:1081F0000B43201C9360FEBDB8B70200C0B802005C
-:10820000C8280020F7B5437A002B69D0436F077B5D
-:1082100006330193C3799C465B000093827A314B0D
-:10822000520001329A1800231E1C511E0C7811783E
-:10823000012F05D16546013D6D1A211C2C1C0FE054
-:10824000022F06D16546013D2C1B057A013D691AB6
-:1082500006E0032F04D1057A013D2D1B0C1C291CBF
-:10826000009D6943019D2C19615C002902D0012108
-:10827000B1400B4301360632092ED6D1DB430F2124
-:10828000041C194A18011278DB050A4002431749F9
-:10829000D2B20A70E27ADB0E1343154A1370667A83
-:1082A000B31EDBB2FC2B15D8124810F04CFF124B5A
-:1082B000051C2363002311486363114BFF21E46213
-:1082C0002364704301F026FC011C201C6943143018
-:1082D00010F091FB637A012B02D8201CFFF77EFE81
-:1082E000F7BDC04681AE03001005005004050050E4
-:1082F00005050050C8280020DD7F0100B6030000FE
-:108300005DA6020007B501228188131C6846FFF7AD
-:108310005FF86846024902220123FFF759F807BDBA
-:10832000FE030000154B10B59B685B0725D5427B0B
-:10833000041C022A02D112F0AEFA1EE0C37A5B00DE
-:10834000C372837A0133DBB2032B01D0837203E063
-:10835000002383722033C372002A02D1201CFFF74E
-:1083600051FF637B012B05D1A3730023201CE37312
-:10837000FFF746FE201C12F05BFA10BDC828002053
-:10838000031C13B54C331A78041C002A0DD00022AC
-:108390001A7001328188131C6846FFF719F8684685
-:1083A000044902220123FFF713F8201C743012F055
-:1083B000B2F813BDFF03000008B54C300378012B61
-:1083C00003D902480221FFF7C9F908BDFF030000E5
-:1083D00073B5079E041C002E1ADB051C4C3528784B
-:1083E000012817D806981BB2C0B20090201C12B208
-:1083F000743012F0A0F80023301E98420BD0221CDB
-:108400004E321680062250342380181C2A7002E057
-:10841000014800E0014876BD17FCFFFF12FCFFFF9A
-:10842000F0B587B00D9D002D22DB041C0393029252
-:108430000E1CFFF7C1FF231C4C331F78002F19D1EE
-:10844000311C05A812F05FF80C9B05A90093029A55
-:10845000039B0195201CFFF7BBFF05A812F046F80F
-:10846000281E08D006200121FFF778F9381C02E009
-:10847000024800E0024807B0F0BDC04617FCFFFF0D
-:1084800011FCFFFFF8B5041C171E19DD061C4C3645
-:108490003378012B16D8021CC3795A32013B137072
-:1084A000031C002558331D80543011F02FF8231C75
-:1084B0004E331F80022350342580281C337002E085
-:1084C000014800E00148F8BD17FCFFFF12FCFFFF68
-:1084D0000421034A93680B4201D10B439360704718
-:1084E000C82800200421034A93680B4201D08B4323
-:1084F00093607047C8280020F0B589B002900D1C29
-:1085000072B6FF2200238A425B4102985B421D4003
-:10851000FFF7E8FF029B1E7C002E00D10136434B83
-:108520001022002104A81F6812F051FE404B281CA5
-:108530006421049301F0EEFA0A2101F0D1FB052435
-:108540006143503179180591281C0A2101F0E2FAA3
-:108550000A2101F0C5FB6143503179180691281CAE
-:108560000A2101F0BDFB4C4350343F192025002463
-:10857000079700230093FA235B000193032C01D19A
-:1085800020250024009A04ABD3582A4A03936300A1
-:108590000133D3180022944619780398405C591E81
-:1085A0000F7810213941014204D0012160469140E9
-:1085B0000843844601320633092AEDD1F0231E48D0
-:1085C0001E4A0370D13B191C294311706146C943EF
-:1085D0000F01FFB20770FA2709110B402B431370EC
-:1085E000BF00174812F063FC002801D1FEF796F98E
-:1085F000013F002FF5D1019B6D000134013BEDB22D
-:10860000E4B20193002BB9D1009B04330093102BEB
-:10861000B1D1029B1B7C002BABD0013EF6B2002EE9
-:10862000A7D1FEF77BF909B0F0BDC0468C00002051
-:10863000B7AE030081AE03000405005005050050ED
-:10864000982C002030B50024034D84710560818092
-:1086500042730373846030BDE0B7020010B58379C4
-:10866000041CDB0702D5806800F08CF9A3799B0716
-:1086700002D5A06800F086F9A3795B0707D5A0238F
-:108680000021114ADB00D150A06800F07BF9A379EA
-:108690001B0709D5A06812F08DFB0D23E35683421A
-:1086A00002D1A06800F034FCA379DB0605D5A068F0
-:1086B000002802D003681B69984700237F22A3602B
-:1086C000A3799343A37110BD00700040F7B5037BFD
-:1086D000DB0728D5012928D8022385790F1C041C23
-:1086E0001D4016D1FFF7BAFF182000F027F9637B71
-:1086F0001822291C061C019312F069FD6B46042107
-:10870000301C595610F0DAFA0222A379A6601343FE
-:10871000A371A3685A68002F03D0DB681A60002099
-:1087200004E01B69FAE7024800E00248FEBDC046CB
-:1087300016FCFFFF17FCFFFFF7B50127037B3B4249
-:1087400022D08579041C3D4016D1FFF787FF182001
-:1087500000F0F4F8637B291C1822061C019312F028
-:1087600036FD6B460421301C59563A1C10F08AFA2B
-:10877000A379A6603B43A371A268536950681B6844
-:108780001840431E984100E00048FEBD16FCFFFF64
-:1087900038B5037B9B0715D50C4B994214D80D1C9B
-:1087A000041C12F09EF8031C002083420DD1281CEB
-:1087B00002F00EFA064901F049FD011CA06800F024
-:1087C000C5FB02E0034800E0034838BDFF0300009A
-:1087D00000C07F4416FCFFFF17FCFFFF70B5037B52
-:1087E0009B0716D504258379041C2B420DD1FFF776
-:1087F00035FF082000F0A2F80D21061C615600F09C
-:108800008DFDA379A6602B43A371A06800F0AEFD97
-:1088100000E0014870BDC04616FCFFFFF7B5037BC2
-:108820005B0719D510268579041C354010D1FFF758
-:1088300015FF282000F082F80D22071CA188A256FF
-:1088400001230095FEF754FAA379A7603343A3717F
-:10885000A06810F086FC00E00048FEBD16FCFFFF9B
-:1088600008B583791B0703D5806800F083FB00E01F
-:10887000004808BD16FCFFFF10B5041C002300F0E3
-:10888000D1FCE121054B201C2360054B49022364E8
-:10889000044B636410F032F9201C10BDC0B6020016
-:1088A000D8B602000CB7020070B5051C042008F011
-:1088B00007FC061C1448801B02F0D2F904F004F8EF
-:1088C000124B002203F07AF901F0F0FA03239843E7
-:1088D000041C301C08F0FEFB286800280AD1201C6C
-:1088E00008F0EEFB28600028F6D1203C002CF3D1E4
-:1088F000074807E0A408A40004196C60281C12F0C3
-:108900000BF8002070BDC046003800200000E83F92
-:1089100013FCFFFF10B572B6064C201CFFF7C4FF16
-:10892000002802D062B6044802E0A060E06062B6AF
-:1089300010BDC046102D002013FCFFFF38B5104CB1
-:10894000051C2368002B04D0211C11F0EDFF00282A
-:1089500009D1A368002B08D0211C281C083111F074
-:10896000E3FF002801D0041C07E0281C08F0A8FB46
-:10897000041E02D11420FDF757FD201C38BDC0464F
-:10898000102D002008B5002815D00B4B1A68904216
-:1089900002D95A68904208D39A68904202D9DB689B
-:1089A000984202D308F096FB05E080230438026861
-:1089B0001B061343036008BD102D002008B5084AAC
-:1089C00003880120934209D0834202D00020DB07B4
-:1089D00004D404481E21FEF765F8002008BDC046F7
-:1089E000FFFF0000C828002002200D4A0D4B30B5C3
-:1089F0009850101C8022D2009C58002CFAD0A12440
-:108A0000084DE400295199580029FCD00021054A5D
-:108A100011508022D2009A58002AFAD030BDC046A8
-:108A20000405000000E00140802370B55B05442090
-:108A30001D695E69FFF782FF00214422041C12F0C9
-:108A4000C6FB311C133944226943201C12F0A2FBDF
-:108A5000054B22689A4204D0201C0021442212F0C7
-:108A6000B6FB201C70BDC046FECAFECA30B501244C
-:108A70000A480B4B1C50041C8020C0001D58002DC0
-:108A8000FAD00A601A58002AFCD00021044A115179
-:108A90008022D2009A58002AFAD030BD0405000086
-:108AA00000E0014010B5041C054B0833036014308E
-:108AB00010F010FD201C103010F00CFD201C10BD1B
-:108AC000F8B7020038B5041C8068002808D0074BAE
-:108AD0001D8800F085FA0368291C1B6A1522984737
-:108AE000211C034810F01EFB38BDC046EA2D0020B3
-:108AF000C828002038B50025041C094B85800833A0
-:108B0000857103601030FEF7B3FE201C1430FEF7B1
-:108B1000AFFE044BA560E560201C1C6038BDC0465C
-:108B2000F8B70200202D002070B50025041C0C4B66
-:108B3000858008338571036014300E1C12F017F81D
-:108B4000201C183012F016F8064BA680A571E571AE
-:108B500025726572E5602561201C1C6070BDC046F1
-:108B600018B80200242D002013B5041C0E4811F083
-:108B7000CFFF0023226843629A4201D120600BE0BC
-:108B8000516A002902D001330A1CF9E7032B02DDE8
-:108B9000FFF7F8FE06E05062012268461D21131C13
-:108BA000FEF716FC13BDC046782C002038B5051C16
-:108BB000074811F0ADFF0123041C2B700430FEF7B1
-:108BC00017FC0023201C2B70FFF7DCFE38BDC046CD
-:108BD000782C0020002815D0006041608260C360BE
-:108BE000046145618661C761444604624C46446243
-:108BF000544684625C46C462644604636E464663BF
-:108C000074468463002A06D0C46B043C043A256889
-:108C10001560B442F9D18C6BA6464E6BB546002B5D
-:108C200006D0CC6B043C043B1D682560B442F9D1EE
-:108C30000C6BA446CC6AA3468C6AA2464C6AA14639
-:108C40000C6AA046CF698E694D690C69CB688A6849
-:108C5000086849687047006041608260C3600461D1
-:108C600045618661C761444604624C46446254468D
-:108C700084625C46C462644604636E46466374461E
-:108C80008463C46B043C043925680D60B442F9D197
-:108C9000C769866945690469704700604160826000
-:108CA000C360046145618661C761444604624C4605
-:108CB0004462544684625C46C462644604636C4603
-:108CC00044637446846304697047846BA646446BAE
-:108CD000A546046BA446C46AA346846AA246446AB5
-:108CE000A146046AA046C769866945690469C368E4
-:108CF0008268006841687047F0B587B01F1C0EABF2
-:108D00001B88019003930D9B0D1C02920C9E0093F7
-:108D1000002F39D0002E01D1DB0735D52020FFF7F9
-:108D20000DFE041C1030FEF735FB6B461B892580B9
-:108D300063801820FFF702FE0496061C051C009BAA
-:108D400080C600211022301C059312F040FA04A9BD
-:108D50000822301C12F01EFA0D4B00226B61022318
-:108D60000399A5600B43E260A380E2610198211C96
-:108D7000FEF744F8002808D0201C11F02DFE201C1E
-:108D8000FFF700FE034800E0034807B0F0BDC0460F
-:108D90007BAB020013FCFFFF17FCFFFFF0B58180E7
-:108DA000154989B000251E1C04916946134B857135
-:108DB0000360028146810573059504AB041C81CBD9
-:108DC00081C1C023111C02932A1C231C0C48FFF7ED
-:108DD00093FF094A079506926A4606AB03CB03C286
-:108DE000C023311C02932A1C231C0548FFF784FF73
-:108DF000201C09B0F0BDC0468DAC020040B8020096
-:108E0000B429002030B5051CA0240123C135FF354D
-:108E1000E405AD002B511D1C8D408340291C0B4DDA
-:108E20000002615163510A4B92001843094BD1185B
-:108E3000A223DB00C850C046C046C046064B0021F6
-:108E4000D218A823DB00D15030BDC0460C0500006D
-:108E5000030003000060004000A00040F7B52A4E68
-:108E600001913568071C2949002D08D07368002B33
-:108E700004D0B3680225002B0FD100E001250820A3
-:108E80000D70FFF75BFD391C041C00F011FC6B46F4
-:108E90001B79AD00A370745133E0002202200B78DF
-:108EA0009C460133DC0F98426241524213409C00C1
-:108EB000634516D0144A10598278151C01222A40A5
-:108EC00009D00B706B461B79391C837011F067FF5A
-:108ED0000D4B1C5915E0581C131C0228E7DC031C21
-:108EE000E5E701233059827813401C1E09D06B46F8
-:108EF0001B79391C837011F052FF044B1B789B00C7
-:108F0000F458201CFEBDC046282D00200B01002077
-:108F100070B5002403780B4A4533FF339B009C5007
-:108F2000051C00F08DFB0123AB70074EA359AB422B
-:108F300004D1281CFFF726FD0023A35104340C2C78
-:108F4000F3D170BD00600040282D002070B5061CD4
-:108F50000D1C081C002100F01FFF041E06D1301C50
-:108F6000291C00F003FB7560201C00E0004870BD68
-:108F700017FCFFFF38B5051C0C1E09DB00F06CFB6D
-:108F8000281C6968FFF7E2FF024B00201C8000E00C
-:108F9000014838BDEC2D002017FCFFFF10B5054C33
-:108FA0000121201C11F029FF201C0349034A11F064
-:108FB000E0FF10BD342D0020BBAD020000000020FA
-:108FC000436810B5041C002B02D104480FF03FFE8B
-:108FD000606803681B69984710BDC046C0AE0300B7
-:108FE000436810B5041C002B02D104480FF02FFE7B
-:108FF000606803681B69984710BDC046C0AE030097
-:10900000436810B5041C002B02D104480FF01FFE6A
-:1090100060680368DB6A984710BDC046C0AE0300B5
-:1090200080B2002807D1BFF34F8F034A034BDA60A9
-:10903000BFF34F8FFEE770470400FA0500ED00E034
-:10904000F0B5264B85B01B78002B45D0244B254E20
-:109050001D6834686A42554162425441EDB2E4B23F
-:109060000193002D36D103A811F0D0FE05280CD0B5
-:10907000002804D0291C2A1CFFF7D2FF06E0019B20
-:1090800003981B680093984700E00125002C1ED12F
-:10909000154B03A91B8801240B80144B1B68181C5B
-:1090A000009311F0B5FE071E052F0BD0002805D048
-:1090B00000210A1CFFF7B4FF002403E00098336886
-:1090C00098473C1C002DCCD0002CCAD004E0002DC9
-:1090D00002D1C6E7002CDBD005B0F0BD622E002027
-:1090E0003C2D0020402D0020EE2D0020382D0020AA
-:1090F00008B5074B1B68002B07D09847002806D0FF
-:1091000000210A1CFFF78CFF01E0FFF799FF08BD63
-:10911000442D00200120054A08B513785840044B1F
-:1091200010701B68002B00D0984708BD632E0020EC
-:10913000482D002002210D4A0D4B30B59950111CCD
-:109140008022D2009C58002CFAD0A124084DE400C3
-:10915000285198580028FCD00020054A5050802201
-:10916000D2009A58002AFAD030BDC046040500004B
-:1091700000E001400323FF2203409843DB009A40B4
-:10918000994030B504689443631801240849094A9A
-:1091900054500C1C8021C9005558002DFAD0036092
-:1091A0005358002BFCD00022024B1A5130BDC04650
-:1091B0000405000000E00140F0B5104C0125A44674
-:1091C0000F4B1D518024E4001C59002CFAD00C1CBC
-:1091D00092008A188025ED00944207D02668671A0D
-:1091E0003E505F59002FFCD00434F3E70022614663
-:1091F0005A505A59002AFCD0F0BDC0460405000060
-:1092000000E0014008B4024B9C46403808BC60476F
-:1092100033AE020008B4024B9C46403808BC60479D
-:109220003BAE020038B5041C1D1CFBF753FF201C8D
-:10923000291C4030FBF7F8FE054B201C1A1C083295
-:1092400022601A1C543320322264636438BDC04645
-:1092500058B8020010B5041C044B03600FF0BAFBB1
-:10926000201CFBF72BFF201C10BDC046B8B5020028
-:1092700010B5041C034B083303601C3000F032FBB4
-:10928000201C10BDD0B8020070B5051C041C0E4B8C
-:109290000E1C083308C5281C0021182211F097FF66
-:1092A0000023201C311CE36123626363A363E36436
-:1092B000064A231C1C3000F0E5FA281C311C0FF074
-:1092C000DCFC201C70BDC046D0B80200DDAE020040
-:1092D00070B5041C0E1C151C0021102211F077FF24
-:1092E000054B201C2361311C2A1CFCF763FA034B3D
-:1092F000201C1C6070BDC046A08601004C2D0020C3
-:1093000038B5054D2B68834204D0041C2169FCF755
-:109310000BFA2C6038BDC0464C2D002070B5104CA7
-:10932000051C0E1C081C211C00F036FB211C2860AB
-:109330000023CB565A1C05D0B34201D18B6802E002
-:109340000C31F5E70023A0210120064AC9002B714A
-:1093500050506A211B020B430349535070BDC04655
-:109360002017030000700040040500000C4B0D4A5C
-:1093700010B50D499C582140995001799C5809021B
-:109380002143995001221A608022D2009A58D207B4
-:10939000FAD4A123024ADB00D05880B210BDC046E7
-:1093A0000070004004050000FF00FFFF03780D4A35
-:1093B0009B009B18A22210B58024D2009858640309
-:1093C00020439850002902D09958074806E0985841
-:1093D0000649014080209950995840020143995014
-:1093E00010BDC0460060004003000300FFFFFCFF0B
-:1093F0000021114A114B1165114A1188114A9950E7
-:10940000114A1178002904D010490888A821C90000
-:1094100058505178002903D00C4948880C495850BD
-:109420009278002A04D0094A9188A922D200995042
-:1094300001221A607047C046FCA0004000A0004016
-:10944000FE0000204C050000642E002000010020DA
-:10945000440500000022154B10B55A6090420ED111
-:109460000121134A98509950124A053198500432FC
-:10947000985008329950104A1188104A9950104A51
-:10948000410051308A5AFF3080001A50C2200D49E5
-:1094900080000C580C4A22408024E40322430A50E6
-:1094A0008022D2000A6001221A6010BD00A0004094
-:1094B000FC0F000004050000FE0000204C05000029
-:1094C0000001002000E100E0FFFF00FF012330B5B4
-:1094D0001D1C021CA0248540C132FF32E40592000D
-:1094E00013510A4A8900A550094A0A4C8918A22238
-:1094F000D2008C50C046C046C0460B60064B0002EE
-:1095000018438850C046C046C04630BD0C05000018
-:1095100000600040031F02000300030010B5002A92
-:1095200002D0FFF743FF17E003780C4A9B009B181B
-:10953000A222D2009C580A4820409850002902D00C
-:109540009958084806E098580749014080209950EA
-:10955000995880020143995010BDC04600600040F8
-:10956000FFFFEFFF03000300FFFFFCFFF7B5002242
-:109570002D4B2E4C1A650123061C0D1C081C636024
-:10958000002100F009FC0194002809D1FE21281CCB
-:10959000890500F015FC002803D0FE25AD0500E08C
-:1095A00000253478224B6400E35A0093214B1F8836
-:1095B000381C01F00DFB011C281C01F039F800F0EB
-:1095C0005DFC1D4B1A4982B2E2526252002A04D15C
-:1095D0000121301CE152111C14E0BA4206D1013ABB
-:1095E000301C0021E252FFF7E1FE0DE0009B002B52
-:1095F00001D0BB4208D1009B301CDA1B57427A4194
-:109600000121D2B2FFF78AFF8022C1230199120300
-:109610009B00CA500199094A053BFF3BCA500123F0
-:10962000019A1360F7BDC046FCA0004000A00040B6
-:10963000F02D0020FE00002000010020080800009E
-:10964000002108B5034A0378D1540021FFF78EFFAB
-:1096500008BDC046642E00200020104ACB171065BC
-:1096600001229B0F59180E480E4B89105A600E4A62
-:10967000814202D90121494202E0042900D8052192
-:1096800011808021C1220903920099500749053AAF
-:10969000FF3A995001221A607047C046FCA0004072
-:1096A000FFFF000000A00040FE00002008080000AE
-:1096B000F8B5051C0E1C081C2B4900F06DF92B4B4E
-:1096C000C4B2C0B2195C012200290FD05978002918
-:1096D00002D15A70141C0AE09978002902D19A70BC
-:1096E000022404E022480FF0B2FA00E01A54301CC1
-:1096F0006E70211C2C70FFF7E9FE1E4A6300DBB27E
-:109700001D48A1008918DA0012181C481A4E115081
-:109710001B4811501B48A1000918A220C00011507D
-:10972000A3211948C90050500121A022081CD200D1
-:10973000B7585A1C90400A1C9A40031C1343A0229D
-:109740003B43D200B350002C02D18023DB05996744
-:10975000201CFFF77FFE281C0C49FFF77DFF281C0B
-:109760000021FFF703FFF8BD74170300642E0020EB
-:10977000E3AE03000060004000F00140140500006B
-:109780001C05000040A100404CA10040204E0000FC
-:1097900037B5A223A022DB00D205D358BE22019305
-:1097A000314B5200995800295DD0C1218900595888
-:1097B000002958DA00249C502C4BA500E8580028BA
-:1097C0004ED02B4BE35C002B30D0019B0121E340BA
-:1097D0000B4212D0231CA022C133FF339B00D205C1
-:1097E0009B589B039B0F032B07D0224B1B68E34026
-:1097F0000B4202D0204B1B6817E0019B0122E34083
-:10980000134213D1231CA021C133FF339B00C90590
-:109810005B589B039B0F032B08D1184B1B68E3403D
-:10982000134203D00221144B1B689847A023DB0589
-:10983000EA18E023C025DB00D158AD0229420FD041
-:10984000D1580F480840D0500198E040C10702D5D8
-:10985000D158294303E08020D15880020143D150E0
-:1098600001341F2CA8D137BD00600040542D0020CA
-:10987000672E0020D02D0020502D0020D42D002058
-:10988000FFFFFCFF30B5041C081C4D1C1CD00F480A
-:109890002160BE24026000200D4A640010510D4C6E
-:1098A0008D002B5101240C4B5C54C1218023890075
-:1098B0001B065350094A0A4B54582340C024240421
-:1098C000234353504023136030BDC046502D002029
-:1098D00000600040542D0020672E002000E100E0D1
-:1098E000FFFF00FF00210368014A9B009950704769
-:1098F000542D002070B5A024E0250068E405830005
-:109900001B19ED005E59214C34405C51204D01245F
-:10991000002A0ED0A14204D181402A681143296057
-:1099200015E0022913D184401A4A11680C431460CF
-:109930000DE0012904D181402A688A432A6006E0AB
-:10994000022904D1844013490A68A2430A602A68A4
-:109950000121C2400A4204D10E4A1268C2400A42A2
-:1099600012D0A222A021D200C9058A58C240101CE0
-:10997000E022D200C10702D59958C02001E0802022
-:10998000995880020143995070BDC046FFFFFCFF0B
-:10999000D02D0020D42D002010B5041C431C07D06E
-:1099A00011F0D7FA041C431C02D102480FF04FF902
-:1099B000201C10BD47AF030002B47146490849009E
-:1099C000095C49008E4402BC7047C04603B471462E
-:1099D000490840004900095E49008E4403BC7047B5
-:1099E00003B47146490840004900095A49008E44B1
-:1099F00003BC7047002243088B4274D303098B4297
-:109A00005FD3030A8B4244D3030B8B4228D3030C4E
-:109A10008B420DD3FF22090212BA030C8B4202D3F0
-:109A20001212090265D0030B8B4219D300E0090A18
-:109A3000C30B8B4201D3CB03C01A5241830B8B4221
-:109A400001D38B03C01A5241430B8B4201D34B030A
-:109A5000C01A5241030B8B4201D30B03C01A52416F
-:109A6000C30A8B4201D3CB02C01A5241830A8B42F4
-:109A700001D38B02C01A5241430A8B4201D34B02DD
-:109A8000C01A5241030A8B4201D30B02C01A524141
-:109A9000CDD2C3098B4201D3CB01C01A52418309F5
-:109AA0008B4201D38B01C01A524143098B4201D32F
-:109AB0004B01C01A524103098B4201D30B01C01A5A
-:109AC0005241C3088B4201D3CB00C01A52418308D4
-:109AD0008B4201D38B00C01A524143088B4201D301
-:109AE0004B00C01A5241411A00D201465241104661
-:109AF0007047FFE701B5002000F0FCF802BDC0464A
-:109B00000029F7D003B5FFF775FF0EBC4243891A51
-:109B10001847C04603460B437FD4002243088B42BC
-:109B200074D303098B425FD3030A8B4244D3030BE4
-:109B30008B4228D3030C8B420DD3FF22090212BAA9
-:109B4000030C8B4202D31212090265D0030B8B4225
-:109B500019D300E0090AC30B8B4201D3CB03C01A0F
-:109B60005241830B8B4201D38B03C01A5241430BEA
-:109B70008B4201D34B03C01A5241030B8B4201D3DA
-:109B80000B03C01A5241C30A8B4201D3CB02C01A45
-:109B90005241830A8B4201D38B02C01A5241430ABD
-:109BA0008B4201D34B02C01A5241030A8B4201D3AC
-:109BB0000B02C01A5241CDD2C3098B4201D3CB0153
-:109BC000C01A524183098B4201D38B01C01A524102
-:109BD00043098B4201D34B01C01A524103098B4206
-:109BE00001D30B01C01A5241C3088B4201D3CB00F1
-:109BF000C01A524183088B4201D38B00C01A5241D4
-:109C000043088B4201D34B00C01A5241411A00D283
-:109C100001465241104670475DE0CA0F00D04942EC
-:109C2000031000D34042534000229C4603098B425C
-:109C30002DD3030A8B4212D3FC22890112BA030AE4
-:109C40008B420CD3890192118B4208D38901921166
-:109C50008B4204D389013AD0921100E08909C309EB
-:109C60008B4201D3CB01C01A524183098B4201D3ED
-:109C70008B01C01A524143098B4201D34B01C01AD8
-:109C8000524103098B4201D30B01C01A5241C30850
-:109C90008B4201D3CB00C01A524183088B4201D3BF
-:109CA0008B00C01A5241D9D243088B4201D34B00DA
-:109CB000C01A5241411A00D20146634652415B101C
-:109CC000104601D34042002B00D5494270476346FD
-:109CD0005B1000D3404201B5002000F00BF802BD3C
-:109CE0000029F8D003B5FFF715FF0EBC4243891ACF
-:109CF0001847C0467047C0468446101C62468C46D2
-:109D0000191C634600E0C0461FB501F0F1FE0028B3
-:109D100001D40021C8421FBD10B501F035FE4042FC
-:109D2000013010BD10B501F0E3FE002801DB00207A
-:109D300010BD012010BDC04610B501F0D9FE0028AD
-:109D400001DD002010BD012010BDC04610B501F09E
-:109D50005FFE002801DC002010BD012010BDC046C0
-:109D600010B501F055FE002801DA002010BD0120D9
-:109D700010BDC0468446081C6146FFE71FB500F0D1
-:109D800011FC002801D40021C8421FBD10B500F00D
-:109D900095FB4042013010BD10B500F003FC0028D7
-:109DA00001DB002010BD012010BDC04610B500F041
-:109DB000F9FB002801DD002010BD012010BDC046C8
-:109DC00010B500F0A5FB002801DC002010BD01202B
-:109DD00010BDC04610B500F09BFB002801DA002042
-:109DE00010BD012010BDC046002B11D1002A0FD19B
-:109DF000002900D1002802D00021C943081C07B463
-:109E0000024802A14018029003BDC046E9FEFFFFD0
-:109E100003B4684601B5029800F082F8019B9E46A3
-:109E200002B00CBC7047C046F0B54F46464605042C
-:109E30002D0C2C1CC0B41704160C3F0C9946030CB7
-:109E40007C4375435F4373437D19260CAD199C46D3
-:109E5000AF4203D980235B029846C4444B4651432A
-:109E6000434324042E0C240C2D0466442C19591849
-:109E70008919201C0CBC90469946F0BD9E2110B556
-:109E8000C905041CFFF7A6FF002803D1201C00F021
-:109E90007FFE10BD9E21201CC90500F0FBFC00F0D8
-:109EA00077FE80231B069C466044F2E738B500220B
-:109EB0000C4B041C0D1CFFF753FF002804D1201C81
-:109EC000291C02F08FFC38BD064B0022201C291CE7
-:109ED00002F00EF902F086FC80231B069C466044CB
-:109EE000F1E7C0460000E041F0B583B0161C1F1C2E
-:109EF0000090019102F0EAFD041C0D1C221C2B1C99
-:109F0000301C391CFFF790FF009A019B121A8B41FD
-:109F10000899201C0A604B60291C03B0F0BDC046A4
-:109F2000F0B5141C83B01D1C0090019102F0C6FE18
-:109F3000221C2B1C061C0F1CFFF776FF009A019BAE
-:109F4000121A8B410899301C0A604B60391C03B00F
-:109F5000F0BDC046F8B54A00430244004E02C50FAA
-:109F6000240E281C9B09120EC90FB7098D4240D040
-:109F7000A01A002800DC84E0002A1CD1002F5CD14C
-:109F80005A0704D00F221A40042A00D0043380223A
-:109F9000D2041A40281C002A24D00134FF2C00D1FE
-:109FA0007BE09B015B0AE4B25B02E4055B0A2343AE
-:109FB000C0071843F8BDFF2CE2D08022D20417431B
-:109FC00001261B2808DC391C20223E1CC140101A27
-:109FD0008640771EBE410E439B1B5A0133D4281C7A
-:109FE0005A07CFD1DB08FF2C1ED05B025B0AE4B21C
-:109FF000DAE7A11A002957DD002A3AD0FF2CBFD09A
-:10A000008022D204174301261B2972DD9B195A01B5
-:10A01000E5D50134FF2C00D187E001218A4A19409F
-:10A0200013405B080B43ABE7002B36D08022D203F2
-:10A0300013435B025B0AFF24B6E7013800283FD1D7
-:10A04000DB1B5A01CBD59B019E09301C02F020FD81
-:10A0500005388640844223DC001B1F24321C431C2D
-:10A06000201ADA408640131C741EA6410024334394
-:10A0700086E7002F00D183E70139002950D1DB1991
-:10A08000C5E7002820D1621CD2B2012A5EDDDE1BAA
-:10A09000720128D5FE1A0D1CD7E7FF24002383E7A1
-:10A0A000694B241A33406BE7002958D1621CD1B2A6
-:10A0B00001293CDDFF2A37D0FB185B08141C5FE741
-:10A0C000FF2C00D07CE75BE7002C1ED0FF2A23D0BA
-:10A0D0008024E404404223431B285BDD0123FB1A58
-:10A0E000141C0D1CADE7002EAFD10023002000246E
-:10A0F00078E73A1CCA40944620223E1C511A8E40F2
-:10A100006246771EBE41164380E7002B3ED0C04317
-:10A110000028E4D0FF2ADFD13B1CFF240D1C2FE7D1
-:10A12000FF2C00D06FE72BE7FF2400235AE7002C19
-:10A130005AD1002B7FD0002F00D121E7DB195A0123
-:10A1400000D44CE7404A0134134019E7002C15D1E4
-:10A15000002B2FD1002F5DD03B1C0D1C10E7002CD5
-:10A1600021D1002B53D0C943002904D0FF2A4BD062
-:10A170001B2957DD0123DB19141C48E7002B22D1D2
-:10A18000002F4AD03B1C0D1CFF24F9E63B1C141C7D
-:10A190000D1CF5E61D1C2024C540201A8340581EC6
-:10A1A00083412B439BE7FF2A2ED08024E4044942BD
-:10A1B0002343DDE7002F00D1E2E6DA1B50013CD556
-:10A1C000FB1A0D1CDCE6FF24002F00D1D8E680220C
-:10A1D000DB08D203134204D0FE08164201D1331C1F
-:10A1E0000D1CDB00FF24CBE6002B0DD0FF24002F3D
-:10A1F00000D1C5E68022DB08D2031342F1D0FE086D
-:10A200001642EED1331CECE73B1CFF24B8E63B1CA6
-:10A21000141CB5E6231C0020E4E6802300209B04E8
-:10A22000FF24DFE61E1C2024CE40611A8B40591EFD
-:10A230008B4133439FE73B1CA2E6131E00D0CEE6C2
-:10A2400000230020CEE6C046FFFFFFFBF0B55646D8
-:10A250004D465F464446F0B443024500C70F83B005
-:10A260008A465C0A2E0EB94641D0FF2E26D08023A6
-:10A270001B042343DC00002398469B467F3E534645
-:10A280005B025D0A53465A00DB0F120E9A4639D024
-:10A29000FF2A33D080231B042B43DD0000237F3AA9
-:10A2A0005146B21A46467940081C01921E430F2EB1
-:10A2B00000D976E07E4AB6009659B746002C30D1D8
-:10A2C00008239846063B9B46D9E780230021DB0301
-:10A2D000FF245B02E4055B0AC90723430B43181CF8
-:10A2E00003B03CBC90469946A246AB46F0BD002C5C
-:10A2F00028D104239846033B9B46C0E7002D1FD17D
-:10A30000022302E0002D11D10123B21A5046464625
-:10A31000784001921E430F2E27D86649B60089590E
-:10A320008F460C239846093B9B46A8E7281C02F061
-:10A33000AFFB7622431F52429D40121A0023AFE723
-:10A340000323ADE7201C02F0A3FB431F9C407623B0
-:10A350005B421E1A002398469B4690E70025D14693
-:10A360009B465B464846022B6FD10121FF240140EA
-:10A370000023AEE77E23019A5B429B1A1B2B6DDD07
-:10A3800001214B46194000240023A2E78023DB0370
-:10A390001C4249D18023DB0323435B025B0A391C47
-:10A3A00096E763016D01AB4237D389461A2001213C
-:10A3B0005B1B01241E1C49005B00002E01DBAB422D
-:10A3C00001D35B1B214301380028F3D1581E834180
-:10A3D0000B431D1C019C7F34002CCBDD6B0704D08C
-:10A3E0000F232B40042B00D004352B0104D5019AF8
-:10A3F000314B8032141C1D40FE2C07DD4B460121E1
-:10A40000FF241940002364E7251CAAE701214A46DE
-:10A41000AB015B0AE4B211405BE7019A8946013A5D
-:10A4200001921B200021C4E71D4207D023435B0299
-:10A430005B0A391C4CE700256302ABD58023DB03A4
-:10A440002B435B025B0A514642E7032B25D0012BCD
-:10A45000C0D101210024014000233AE7291CD94042
-:10A460002B1C019A9E3293405D1EAB410B435A0751
-:10A4700004D00F221A40042A00D004335A0105D513
-:10A480004B46012101241940002322E701214A46BD
-:10A490009B015B0A114000241BE7802301214A46EF
-:10A4A000DB032B435B020A405B0A111C10E7C0462A
-:10A4B000DC1803001C190300FFFFFFF7430270B50F
-:10A4C00042004C005D0AC30F4802120E460A240ED9
-:10A4D000C90FFF2A05D0FF2C08D00120A2420BD0C3
-:10A4E00070BD0120002DFBD1FF2CF6D10120002EE4
-:10A4F000F6D10120A242F3D1B542F1D18B4205D071
-:10A50000002AEDD1281C431E9841E9E70020E7E727
-:10A51000F0B543024D024A0044005E0A240EC30F08
-:10A520006D0A120EC90FFF2C0DD0FF2A31D0002C5E
-:10A530000DD177427741002A23D1002D21D100206F
-:10A54000002F0BD107E0002E28D1FF2A21D0002AAE
-:10A5500005D08B4207D0584201231843F0BD002D8F
-:10A56000F9D08B42F7D19442F5DC04DBAE42F2D84D
-:10A570000020AE42F2D25842434101205B421843D0
-:10A58000ECE7002FE5D04842414101204942084311
-:10A59000E4E7002D02D1002CCBD0DAE702204042C4
-:10A5A000DCE7C0464302F0B542004C005E0AC30F30
-:10A5B0004802120E450A240EC90FFF2A0FD0FF2CA5
-:10A5C0001AD0002A10D177427741002C29D0002FD1
-:10A5D00017D0484241410120494208430BE0022084
-:10A5E000002E08D1FF2C07D0002C0AD1002D08D155
-:10A5F000584201231843F0BD0220002DFBD1002A50
-:10A60000E1D08B42F4D1A242F2DC04DBAE42EFD8BF
-:10A610000020AE42EFD25842434101205B42184332
-:10A62000E9E7002DD3D10020002FE4D1E0E7C046B8
-:10A63000F0B55F4656464D464446F0B445024600E6
-:10A64000C40F83B00F1C6D0A360EA34645D0FF2EF3
-:10A6500025D080231B041D4300239A46ED007F3E36
-:10A6600001937B025B0A98467800FB0F000E994627
-:10A6700040D0FF2838D0802342461B041343DB0020
-:10A68000984600237F384A46019F30186240411C9B
-:10A690001F430F2F69D87D4EBF00F659B746002DD6
-:10A6A00045D108230193063B9A46DAE79346534681
-:10A6B000022B2FD15B46012400251C40FF236D0295
-:10A6C000DB056D0AE4071D432543281C03B03CBC91
-:10A6D00090469946A246AB46F0BD002D2CD10423EE
-:10A6E0000193033B9A46BCE743465A425341032237
-:10A6F000D31AC8E742460123002AC4D0404602F0DC
-:10A70000C7F94246431F9A4076235B42181A904687
-:10A710000023B8E7032B00D1ADE0012B00D08CE083
-:10A720005B4654461C40E4B200230025C7E70C23D7
-:10A730000193093B9A4694E7281C02F0A9F9762672
-:10A74000431F9D4000237642361A01939A4688E7BC
-:10A7500080250024ED03FF23B1E74546CB469A460A
-:10A76000A5E7454693469A46A1E743462C041B0CB1
-:10A770009C46230C444626041C1C360C2F0C7443A8
-:10A78000351C66467D4373437743EB18260C9E19B0
-:10A79000B54203D980235B029C46674424043304FA
-:10A7A000240C1B199D016C1EA5419B0E360C2B43DE
-:10A7B000BD19AD011D432B0104D5012368081D40BF
-:10A7C0000543081C031C7F33002B2CDD690704D0D4
-:10A7D0000F212940042900D00435290103D52C4B31
-:10A7E0001D40031C8033FE2B17DD0124FF23144082
-:10A7F000002564E78020C003054209D04346034298
-:10A8000006D1454605436D026D0A4C46FF2356E7C7
-:10A8100005436D026D0AFF2351E70124AD016D0A66
-:10A82000DBB214404BE77E235B421B1A1B2B07DD78
-:10A83000012400231440002541E7081C5A46C1E7C3
-:10A840009E30291C8540D940681E85410D436B0709
-:10A8500004D00F232B40042B00D004356B0104D50A
-:10A86000012401231440002529E70124AD016D0ACC
-:10A870001440002323E78023DB031D4301245B46B0
-:10A880006D0223401C1C6D0AFF2318E75C190300AE
-:10A89000FFFFFFF7F8B54A00430244004D02C00F26
-:10A8A000240E061C9B09120EC90FAD09FF2A00D108
-:10A8B00075E001277940884250D0A01A002800DCBA
-:10A8C0008FE0002A1ED1002D00D075E05A0704D079
-:10A8D0000F221A40042A00D0043380220120D2041F
-:10A8E0001A403040002A32D00134FF2C00D184E0DD
-:10A8F0009B015B0AE4B25B02E4055B0A2343C007E9
-:10A900001843F8BDFF2CE1D08022D20415431B2848
-:10A910007ADD01255B1B5A015DD59B019F09381C1F
-:10A9200002F0B6F805388740844269DC001B1F241A
-:10A930003A1C431C201ADA408740131C7C1EA74196
-:10A9400000243B43C2E7131E45D100230020DB084F
-:10A95000FF2C28D05B025B0AE4B2CCE7A11A0029E5
-:10A960005BDD002A2ED0FF2CB0D08022D20415430C
-:10A970001B2974DC2F1C2022CF40511A8D40691EE8
-:10A980008D413D435B195A0125D50134FF2C74D00C
-:10A9900001217E4A194013405B080B4396E7002DC6
-:10A9A00000D088E785E7002B27D08022D20313430D
-:10A9B0005B025B0AFF249EE701380028AAD0FF2C27
-:10A9C000A5D183E7002D00D180E701390029D9D036
-:10A9D000FF2CCDD17AE75A0700D079E7012030402B
-:10A9E000B5E7002825D1621CD2B2012A55DD5F1BD4
-:10A9F0007A012DD5EF1A0E1C91E7FF2400237AE788
-:10AA0000624B241A3B4061E7291C2022C140101AE6
-:10AA10008540681E85410D437CE7002946D1621CB4
-:10AA2000D1B201292BDDFF2A26D0EB185B08141CBC
-:10AA30004CE7002C15D0FF2A1AD08024E4044042B1
-:10AA400023431B284DDD0123EB1A141C0E1C62E767
-:10AA5000002F00D063E700230020002477E70125C2
-:10AA600090E7002B39D0C0430028EDD0FF2AE8D171
-:10AA70002B1CFF240E1C29E7FF24002367E7002C72
-:10AA80005AD1002B7FD0002D00D11FE75B195A014E
-:10AA9000A1D53E4A0134134018E7002C15D1002BF4
-:10AAA0002FD1002D5ED02B1C0E1C0FE7002C21D1C6
-:10AAB000002B54D0C943002904D0FF2A4CD01B29B5
-:10AAC00058DD01235B19141C5DE7002B23D1002DF9
-:10AAD0004BD02B1C0E1CFF24F8E62B1C141C0E1C48
-:10AAE000F4E61E1C2024C640201A8340581E8341D1
-:10AAF0003343A9E7FF2A2FD08024E40449422343AB
-:10AB0000DDE7002D00D1E1E65A1B500100D41AE721
-:10AB1000EB1A0E1CDAE6FF24002D00D1D6E68022C7
-:10AB2000DB08D203134204D0ED08154201D12B1CDF
-:10AB30000E1CDB00FF24C9E6002B0DD0FF24002DE6
-:10AB400000D1C3E68022DB08D2031342F1D0ED0826
-:10AB50001542EED12B1CECE72B1CFF24B6E62B1C78
-:10AB6000141CB3E6231C0020F1E6802300209B0484
-:10AB7000FF24ECE61F1C2024CF40611A8B40591E95
-:10AB80008B413B439EE72B1CA0E6C046FFFFFFFB2B
-:10AB90004202510A4200C30F120E00207E2A0DDD30
-:10ABA0009D2A0CDC802000040143952A0ADC9620B3
-:10ABB000821AD1400A1C58424240D0187047034ABA
-:10ABC0009818FBE7963A91400A1CF4E7FFFFFF7FD5
-:10ABD00070B5041E39D0C50F00D04442201C01F0CE
-:10ABE00057FF9E23261C1B1A962B07DC082801DD25
-:10ABF000083884406402640AD8B21EE0992B0ADD4A
-:10AC00000522211C121AD1400A1C011C1B318E4046
-:10AC1000711E8E411643052801DD421F96400F4CE0
-:10AC20003440720704D00F221640042E00D00434A2
-:10AC300062010ED4A401640AD8B26402C005640A99
-:10AC4000ED0704432C43201C70BD00250020002488
-:10AC5000F3E7024B1C409F231B1AEBE7FFFFFFFBB0
-:10AC600010B5041E35D001F013FF9E21091A962954
-:10AC700009DC082830DD021C231C083A93405B02E3
-:10AC80005B0AC8B220E099290CDD0522231C121AA8
-:10AC9000D3401A1C031C1B339C40231C5C1EA34185
-:10ACA00013431C1C052801DD431F9C400F4B234010
-:10ACB000620704D00F221440042C00D004335A0140
-:10ACC0000ED49B015B0AC8B25B025B0AC005184345
-:10ACD00010BD00200023F7E763025B0AC8B2F3E768
-:10ACE0009F21024A091A1340EBE7C046FFFFFFFB12
-:10ACF000F0B5454657464E4694464C000A03C90FE8
-:10AD0000E0B488460E1C1903470FC500480A614687
-:10AD1000490F01436046520A1743C0005A00640DB0
-:10AD2000520DDB0F8446984500D1A7E0A01A0028F9
-:10AD300000DC01E1002A3DD163460B4300D0D4E0A2
-:10AD40006B0700D188E00F232B40042B00D183E058
-:10AD50002A1DAA42AD4180236D427F191B043B404E
-:10AD60004646151C002B00D17CE0CC4B01349C42A4
-:10AD700000D1FDE03A1CCA4BED081A4050076405AB
-:10AD800052020543120B640D002112030B0D1B052B
-:10AD90006405120B1A436308C24CF60714401C43A7
-:10ADA000640064083443281C211C1CBC904699464E
-:10ADB000A246F0BDB94B9C42C2D080231B0419436C
-:10ADC000382800DDECE01F2800DD21E120220E1CE8
-:10ADD0006346121A9640C340334366469640321C7F
-:10ADE000561EB24113430A1CC240EB1A9D42B641A3
-:10ADF0001D1CBA1A7642971B3B0200D497E07A02D8
-:10AE0000560A002E00D1B6E0301C01F041FE031CB2
-:10AE1000083B1F2B00DDB7E09E40371C28262A1C6C
-:10AE2000361AF240161C9D403E439C4200DDB2E0C3
-:10AE30001C1B621C1F2A00DDD8E01F23291C1C1BC1
-:10AE4000331CA540A340D1406C1EA541D6401943F8
-:10AE50000D43371C002473E780231B043B40464608
-:10AE600000D082E78D4BED0878070543FA089C4235
-:10AE700032D012036405120B640D85E7A31A002B70
-:10AE800000DC94E0002A3CD0844A944200D157E789
-:10AE9000802212041143382B00DC05E1634619437C
-:10AEA000481E81410022C8B24019A8429B41051C9E
-:10AEB000D2195B42D7183B0239D5784B01349C42FA
-:10AEC00000D14CE10120764A6B083A4028401843F3
-:10AED000D5070543570833E72B1C134348D080237D
-:10AEE0001B031A431203120B4EE70138002878D1D6
-:10AEF0006346EE1AB5429B417A1A5B42D71A351C5B
-:10AF00007AE7021C0A4300D11AE7013B002B00D06C
-:10AF1000F2E04019A8429B41CA195B42D718051CB0
-:10AF2000C9E7131C334300D118E1171C351C4646F2
-:10AF30006B0700D007E795E700287AD1621C52051D
-:10AF4000520D012A00DCFBE06246AA1A9542B64186
-:10AF50009146781A7242861A320200D493E0624611
-:10AF6000551BAC458041CF1B40423E1A984648E7EE
-:10AF70000022002508E7281C01F08AFD2030031C70
-:10AF8000083B1F2B00DC47E7283885402E1C002596
-:10AF90009C4200DC4CE7424AE41A1640371CCFE6DC
-:10AFA000634619434B1E99410022CBB21DE7002B8B
-:10AFB00000D0F2E0601C43055B0D012B00DCA4E037
-:10AFC000364B984200D121E163465C19AC429B416B
-:10AFD000CF195B42FA186408D50725435708041CAB
-:10AFE000AEE62E4B9C4200D0EAE6A9E6211C331CBB
-:10AFF0001F39CB40191C202A00D182E03F231C1BA3
-:10B00000A64035436E1EB54100270D4300248EE750
-:10B01000031C0E1C203BDE40202874D040231B1A4A
-:10B0200099400B1C62461343591E8B410022334347
-:10B03000DBE6002C50D0194CA24200D1A8E08024BD
-:10B04000240440422743382800DDD9E01F2800DDD2
-:10B0500039E120243E1C241AA640B0462E1CA146ED
-:10B06000C640444626434C46A5406C1EA541C740F9
-:10B0700035436046451BCF1BAC45894149427F1A89
-:10B08000141C9846B8E64B464D46334300D0B8E60C
-:10B090000026002700240025E4E6C046FF07000044
-:10B0A000FFFF7FFFFFFF0F801F2B5BDC2022081CB0
-:10B0B000D21A9040814660469246D8404A46104394
-:10B0C0008146524660469040021C501E82414846CE
-:10B0D00010430A1CDA40E7E63C1C2C4358D0C0431E
-:10B0E000002851D16046451BAC458041CF1B4042F2
-:10B0F0003F1A141C98467FE68F4A944200D0CAE655
-:10B100001EE600267DE700238CE73B1C2B43002C2A
-:10B1100000D0BDE0002B00D1F5E063460B4300D129
-:10B120000EE663465B19AB428041CA1940421718CC
-:10B130003A0200D4FCE0814A1D1C17400134FFE5AF
-:10B140003A1C2A43002C51D1002A00D085E06246E7
-:10B150000A4303D00F1C65469846F1E500260027F8
-:10B1600000257FE6181C0A1C2038C240202B00D185
-:10B17000A7E04020C01A8140081C63461843411EC6
-:10B180008841104300228FE66B4CA24200D05AE760
-:10B190000F1C6546141C9846D2E5002C3AD1381C89
-:10B1A000284371D0DB43002B18D0634882426BD018
-:10B1B000382B00DD9DE01F2B00DDA7E020203C1C8C
-:10B1C000C01A8440A1462C1C8246DC4048460443F9
-:10B1D00050468540681E8541DF40254365446545EE
-:10B1E0009B417F185B42FF18141C64E6002A19D1AA
-:10B1F00062460A4377D00F1C654698464E4C9FE541
-:10B200003D436F1EBD410027EDB232E7041C00270D
-:10B21000002527E64848824236D0802000045B4261
-:10B220000743C5E762460A4349D08024ED08780702
-:10B23000FA0824032843224209D0CE08264206D128
-:10B2400062464F07381CD20810439846321CD20081
-:10B25000470F1743C500384C72E562460A4300D1D8
-:10B260006EE56246AE1AB5429241781A5242821A8F
-:10B27000100200D455E66246551BAC458041CA1BFE
-:10B280004042171A98465BE50F1C6546141C57E5AB
-:10B29000002B34D063460B4311D08024ED0878078F
-:10B2A000FA08240328432242D1D0CB082342CED12E
-:10B2B00062464F07381CD20810431A1CC7E71E4CC1
-:10B2C0003EE5002059E7041C3E1C203CE640341CAF
-:10B2D00020282BD04026301A87403D436F1EBD41A9
-:10B2E00000272543C5E680270026FF03124C0025D2
-:10B2F000B8E53D436F1EBD410027EDB26EE70F1C60
-:10B3000065460D4C1CE50F1C654619E51C1C381CD8
-:10B31000203CE040041C202B0CD04020C31A9F404E
-:10B320003D436F1EBD410027254357E70027D4E763
-:10B330001D1CFCE50027F3E7FF070000FFFF7FFF70
-:10B34000F0B55F4656464D464446F0B40F0387B00D
-:10B3500098464D003B0BCC0F061C924681469B46FF
-:10B360006D0D01946BD0664B9D4235D080275B46B6
-:10B370007F031F43F3009946624BFF00400F9C463A
-:10B3800007430023BB46002665440093424617034B
-:10B390005000D20F53463F0B400D904600D172E053
-:10B3A000574A904267D080235B031F435346554A58
-:10B3B0005B0FFF001F43944653460021DB006044AF
-:10B3C0004246624092462D1A0E430F2E00D9A1E04C
-:10B3D0004D48B600805987465B461E4300D076E054
-:10B3E00000239B469946023308260093CEE79946F0
-:10B3F0004346BB4601930091009B022B6BD1019BFE
-:10B400009A46002153460122002789461A403C4BA8
-:10B4100000213F030C0D24053F0B27433B4C1B052C
-:10B4200027401F437F00D2077F0817434846391C37
-:10B4300007B03CBC90469946A246AB46F0BD0343DC
-:10B440003ED05B46002B00D19CE1584601F020FB2A
-:10B450002823311C1B1A021C5F46D940083A97402A
-:10B460000B1C96403B439B46B1460023284D0026CB
-:10B470002D1A00938AE7524603213A43A0D10027B0
-:10B48000002302219CE752463A4315D0002F00D1F9
-:10B4900085E1381C01F0FCFA021C28215046891A6B
-:10B4A000131CC8405146083B99409F400B1C074362
-:10B4B00017480021801A83E70027002301217FE736
-:10B4C00000239B4699460133042600935EE703233D
-:10B4D0000C2600935AE7032B00D13CE2012B00D04D
-:10B4E000BFE11A1C019B1A40002100230027894656
-:10B4F0008EE700238027994600223F03004B87E711
-:10B50000FF07000001FCFFFF9C190300FFFF0F80F5
-:10B510000DFCFFFFBB4500D951E100D14CE14A468B
-:10B52000039200225C469046013D180E3F023843CC
-:10B530001B020193030C994603041B0C4946061C8D
-:10B54000201C1F1C0093FEF755FA021C7A43029040
-:10B550004946201C171CFEF7D3FA039B09041B0C59
-:10B5600019438F420CD9029B8919013B8E4200D9A5
-:10B5700052E18F4200D84FE1029B8919023B0293AE
-:10B58000CC1B201C4946FEF735FA009F83464743F3
-:10B590004946201CFEF7B4FA039A0B041404240C49
-:10B5A00023439F420DD95A469B19013A9E4200D926
-:10B5B00030E19F4200D82DE10222524294469B196D
-:10B5C000E344029ADB1B17045A463A439346019C14
-:10B5D000170C220C101C04925A4611042204120C5F
-:10B5E000141C090C7C4305924A43414347436118AC
-:10B5F000100C09188C4203D980204002844667440D
-:10B600000C0C12040804120C3C198118A34200D23D
-:10B61000E5E000D1DFE01F1B43465C1AA0459241E4
-:10B620005242BF1AB74200D10EE1381C4946FEF71C
-:10B63000E1F9009B029043434946381C9846FEF7C7
-:10B640005FFA230C0F041F43B8450CD9029BBF19A6
-:10B65000013BBE4200D9FBE0B84500D8F8E0029BB0
-:10B66000BF19023B02934346FF1A4946381CFEF7B6
-:10B67000C1F9009B039043434946381C9846FEF7A6
-:10B680003FFA24040904240C214388450CD9039B68
-:10B690008919013B8E4200D9DCE0884500D8D9E009
-:10B6A000039B8919023B03934346C91A029B039AE1
-:10B6B0001B04059C1A43100C13049146221C049F82
-:10B6C0001B0C5A4344437B437843E318170CDB19A4
-:10B6D0009C4203D980246402A44660441C0C1204DA
-:10B6E0001B04120C00199B18814200D296E000D175
-:10B6F000FCE04A4601231A4391469B4BEB18002B72
-:10B7000000DC99E04A4652070AD00F2249460A4017
-:10B71000042A05D004314945924189465242934456
-:10B720005A46D20106D55A46904B1A40802393467A
-:10B73000DB00EB188E4A934200DD62E64A4659462A
-:10B74000D208490711435A468946570251460122F9
-:10B750005B053F0B5B0D0A405AE680205A4600030A
-:10B76000024208D0074206D107433F0399463F0BE8
-:10B770004246804B4CE65F4607433F033F0B221C8B
-:10B780007C4B45E601F084F9031C2030272800DCBF
-:10B790005EE6083B9E400023B346994665E6504668
-:10B7A00001F076F9021C2032272A00DC75E65746A4
-:10B7B0000838874000237BE6994500D2AFE65A4619
-:10B7C000594654084A46C8075208024303924A465B
-:10B7D000D2079046A9E60027884500D31CE7019FC1
-:10B7E0005A46BC46E044B845BF417F42BF19FF18E6
-:10B7F000013ABE4206D2BC425FD800D19FE03F1B57
-:10B80000934609E7B742FAD1019B4345F3D9371B69
-:10B81000934601E79346D4E60293B1E64A46891976
-:10B82000013A8E4218D99146814200D061E7019ACF
-:10B830009A4200D05DE760E74F4F7F1B382F13DD42
-:10B84000012253461A404FE601235B42994654E7D2
-:10B85000029308E7039327E788423CD874D09146C7
-:10B8600047E7019B9A4648E71F2F44DC434B4A4673
-:10B870009C465B466544FA40AB4013434A46AA40A7
-:10B88000151C6A1E95415A46FA402B43171C5A074D
-:10B8900009D00F221A40042A05D01A1D9A429B4152
-:10B8A0005B42FF18131C3A023ED553460122002189
-:10B8B0001A40002701238946AAE502235B429C46E1
-:10B8C000019AE3449446E04490459B415B429B19B6
-:10B8D000DF193F1BA0E6019F4A467C00BC42BF41E6
-:10B8E0007F42BF19023AC91901949CE7002B95D1F8
-:10B8F000002201929BE75A46214B5B1BDA40202F26
-:10B9000027D0204B9C465B466544AB4049460B43E1
-:10B91000591E8B411343072200271A4007D00F22DC
-:10B9200000271A40042AB8D17A077F023F0BDB08B0
-:10B9300013439946012253461A40002368E54145C6
-:10B94000BBD89346002767E6019C9C42C3D391462F
-:10B950006DE70023DAE780275B463F031F433F0381
-:10B960003F0B019A034B53E5FF030000FFFFFFFE6F
-:10B97000FE070000FF07000002FCFFFF1E0400009E
-:10B98000E2FBFFFF3E040000F0B55F464D46444633
-:10B990005646F0B41F035C00DB0F99461B4B0E03A9
-:10B9A0004D00C90F8446360B6D0D8B4690463F0BFC
-:10B9B000640D9D420CD0154B9C4210D00123A54232
-:10B9C00014D0181C3CBC90469946A246AB46F0BD2C
-:10B9D000311C01230143F4D10C4B9C42EED13A437C
-:10B9E0000123002AEDD10123A542EAD1BE42E8D1CC
-:10B9F000C445E6D1CB4506D0002DE2D13043031C2F
-:10BA0000581E8341DDE70023DBE7C046FF07000047
-:10BA1000F0B5574645464E46E0B40F034E00C90FF9
-:10BA20008A4632491D035C0084463F0B760D9046E2
-:10BA30002D0B640DDB0F8E420FD08C4239D0002EBF
-:10BA400010D13843414241418946002C27D12A4335
-:10BA500025D1002000290ED108E0391C01432ED148
-:10BA6000B44226D0002C0BD09A450DD053465942F3
-:10BA700001231943081C1CBC90469946A246F0BD00
-:10BA80002A43F3D09A45F1D1A642EFDC1ADA5046A8
-:10BA900041424841012341421943081CEBE74A4611
-:10BAA000002AE1D058425841012241421143081C6A
-:10BAB000E1E7291C114302D1002EC2D0D4E70220B5
-:10BAC0004042D8E7AF42D1D809D00020AF42D2D20D
-:10BAD000504641424841012340421843CBE7C44508
-:10BAE000C4D80020C445F3D3C5E7C046FF07000013
-:10BAF000F0B55F464D46444656468046F0B4061CB7
-:10BB00000803000B84462C484C001F035D00C90F3E
-:10BB1000640D8B4691463F0B6D0DDB0F844212D0B6
-:10BB2000854225D0002C14D161460E437042464117
-:10BB3000002D35D0002E21D05842584101214342DA
-:10BB40000B43181C0EE06146022031430AD1A54286
-:10BB50000ED0002D12D13A4310D15B465942012339
-:10BB60001943081C3CBC90469946A246AB46F0BD22
-:10BB7000391C02201143F5D1002CD5D09B45ECD1C6
-:10BB8000AC42EADC05DBBC45E7D80FD00020BC4561
-:10BB9000E8D2584641424841414201200843E1E78A
-:10BBA0003A43C7D10020002EDCD1D6E7C845D4D80F
-:10BBB0000020C845EDD3D5E7FF070000F0B55F468C
-:10BBC00056464D464446F0B4051C061C080387B093
-:10BBD00099464F00030BCC0F92469B467F0D019474
-:10BBE00067D06C4B9F4236D080205B4640031843A1
-:10BBF000C0006B0F1843684B83469C460023984651
-:10BC0000EE00674400934B4649461D03C90F5B0095
-:10BC100052462D0B5B0D894600D16EE05D498B428B
-:10BC200064D080205C4940038C4600210543ED0030
-:10BC3000500F0543D20063444846FF187B1C9A46C8
-:10BC4000009B604002900B430F2B00D9ACE053489F
-:10BC50009B00C3589F465B461D4300D082E00823EB
-:10BC6000009300239B46023300269846CBE7029BB5
-:10BC700001934346022B59D1012400250026019B44
-:10BC80001C40444B00212D030A0D12052D0B1543BA
-:10BC9000434A1B0515401D436D00E4076D0825430D
-:10BCA000301C291C07B03CBC90469946A246AB46C6
-:10BCB000F0BD2B434ED05B46002B00D185E15846AA
-:10BCC00000F0E6FE021C2823291C9B1A161C58466D
-:10BCD000D940083EB0400B1CB54003439B462E1C88
-:10BCE0000023304F0093BF1A98468CE751462943F2
-:10BCF0002ED10025002202219EE75146294323D060
-:10BD0000002D00D154E1281C00F0C2FE031C2821A4
-:10BD10005046C91A1A1CC8405146083A91409540ED
-:10BD20000A1C05431F480021C31A85E7032B00D1D5
-:10BD3000C2E1012B00D06DE14446019B00251C406F
-:10BD4000E4B2002300269DE700250022012173E7CD
-:10BD5000032171E70423009300239B46013300264F
-:10BD6000984650E70C230093093B98464BE7802503
-:10BD700000242D030026074B84E74B46AB46161CD8
-:10BD80000193884675E7029BAB46161C01938846D3
-:10BD90006FE7C046FF07000001FCFFFFDC1903004E
-:10BDA000FFFF0F800DFCFFFF330C3604360C9C4662
-:10BDB000331C140C1204120C53439846634653432D
-:10BDC0009946634663430193331C41466343090C20
-:10BDD0004B445B18994505D9802040028146019962
-:10BDE00049440191190C039141460904090C1B04B3
-:10BDF0005B1804932B0C9846331C2D04290C4B43E1
-:10BE0000604600934346654658435E43009B4D435E
-:10BE10001B0C9946AE194E448446B54203D9802383
-:10BE20005B029946CC44350C2B1C03986344844632
-:10BE30000593009B36041B041B0CF3189C446046BE
-:10BE4000039058460504060C280C84465043351CC4
-:10BE500081466046654344434846000C834672432E
-:10BE600014195C44A24203D98022520293465D44D5
-:10BE7000220CAD184A461204120C24044046A418A1
-:10BE800062464A43714346436046009646467043C5
-:10BE90008046100C84468844E044414505D9802101
-:10BEA00049028C46009961440091019803998446A7
-:10BEB000614499429B415B429946059843468446BA
-:10BEC0001204120C1B049B1863449C46AB4683422D
-:10BED0009B4140460A19CC44A2428941E344CC45E7
-:10BEE000B6415C46000C8046494276425B4264188B
-:10BEF000334398448C428941AB459B4149425B4264
-:10BF000019430D1C009B4544EE187602E50D2E43A7
-:10BF1000B346049B56021E43731E9E415B46D20DE0
-:10BF2000324366021643DB010AD50123334076080B
-:10BF30001E435B46DB071E435B465B089B4657463A
-:10BF4000634BFB18002B5ADD720709D00F223240D9
-:10BF5000042A05D0321DB242B6417642B344161CC3
-:10BF60005A46D20106D55A465A4B1A408023934668
-:10BF7000DB00FB18584A934234DD0124029B002564
-:10BF80001C400026554B7DE680205B4600030342A3
-:10BF900008D0054206D105432D032D0B4C46161C37
-:10BFA0004E4B6FE65D4605432D032D0B4B4B69E66B
-:10BFB000504600F06DFD031C2033272B00DCA6E665
-:10BFC0005546083885400022ACE6281C00F060FD8C
-:10BFD000021C2032272A00DC75E60838854000263E
-:10BFE000AB467DE65A46F608520716435A460124E8
-:10BFF0005502029A5B052D0B5B0D144042E6384D4D
-:10C00000ED1B382D0ADD0124029B00251C40002673
-:10C01000002337E6019B5746029391E71F2D25DC4D
-:10C02000304B321C9C466744BE405B46BB40371CCD
-:10C03000EA407E1EB74113433B431E1C5B46EB4068
-:10C040001D1C730709D00F233340042B05D0331D6B
-:10C05000B342B6417642AD191E1C2B0220D50124F5
-:10C06000029B00251C40002601230BE65A461E4B6E
-:10C07000DB1BDA40131C202D1CD01C4A94465A4668
-:10C080006744BA40171C3E43721E96411E43072365
-:10C090000025334007D00F2300253340042BD6D191
-:10C0A0006B076D022D0B0124F6081E43029B1C40FA
-:10C0B0000023E7E50027E6E780255B4601242D0302
-:10C0C0001D43019B2D0323401C1C2D0B034BD9E565
-:10C0D000FF030000FFFFFFFEFE070000FF07000058
-:10C0E00002FCFFFF1E040000E2FBFFFF3E04000015
-:10C0F000F0B54D4644465F465646F0B40E1C111C42
-:10C100003203520A470F1743C5001A035800DB0FCA
-:10C110009946520A4B0F83B01A43CB000193CF4B81
-:10C120007400F60F640DB046400D984200D1E8E06F
-:10C130000123494659400B1C9E4200D1B1E0261A0A
-:10C14000002E00DC1CE1002842D1131C01990B4396
-:10C1500000D0E6E06B0700D18EE00F232B40042BCC
-:10C1600000D189E02A1DAA42AD4180230126414623
-:10C170006D427F191B043B400E40151C002B00D163
-:10C1800083E0B64B01349C4200D116E13A1CB44B1B
-:10C19000ED081A405007640552020543120B640D66
-:10C1A000002112030B0D1B056405120B1A436308D3
-:10C1B000AC4CF60714401C43640064083443281C4C
-:10C1C000211C03B03CBC90469946A246AB46F0BD4C
-:10C1D000A24B9C42BED080231B041A43382E00DDA4
-:10C1E00003E11F2E00DD3FE12020831B9946131C35
-:10C1F00049468B409C46019B6046F34003430198AF
-:10C20000F2408840011C481E81410B43EB1A9D42BD
-:10C2100080411D1CBA1A4042171A3B0200D4A8E004
-:10C220007A02560A002E00D1CAE0301C00F030FC21
-:10C23000031C083B1F2B00DDCBE02822291C121A0F
-:10C24000D1409E400A1C9D4032439C4200DDC8E024
-:10C250001C1B671C1F2F00DDEDE01F23291C1C1B6E
-:10C26000131CA540A340F9406C1EA541FA40194398
-:10C270000D43171C00246DE78023012642461B0452
-:10C280003B401640002B00D07BE7744BED0878074D
-:10C290000543FA089C423BD012036405120B640D5F
-:10C2A0007EE7231A9A46002B00DCA5E0002844D044
-:10C2B0006A48844200D14DE780200004024353467F
-:10C2C000382B00DC1CE1019B1A43511E8A41D1B27C
-:10C2D00000224919A94280410D1CD2194042171869
-:10C2E0003B0246D55D4B01349C4200D169E10120FF
-:10C2F0005B4A6B083A4028401843D5070543570866
-:10C3000028E7131C01990B4300D111E74B4613E7B3
-:10C310002B1C134351D080231B031A431203120B0F
-:10C320003EE7013E002E00D080E0691A8D429B411D
-:10C33000BA1A5B42D71A0D1C6FE7101C019B1843F9
-:10C3400000D107E701235B429C46E2445346002BA1
-:10C3500000D002E1019BD2195919A9429B415B42CD
-:10C36000D7180D1CBCE76346034300D128E1071C26
-:10C3700065466B0700D0F0E6012643461E4084E781
-:10C38000002E00D081E0601C4005400D012800DC3B
-:10C3900007E10199681A84466545B641B81A7642A4
-:10C3A000861B300200D4A1E08C464D1BAC45894170
-:10C3B000D21B4942561A984634E700220025EFE680
-:10C3C000281C00F065FB2030031C083B1F2B00DC01
-:10C3D00033E7021C283A95402A1C00259C4200DCC9
-:10C3E00036E71F4FE41A1740B4E6019B1A43511E6B
-:10C3F0008A41D3B2002209E7002B00D001E1601C82
-:10C4000043055B0D012B00DCB0E0144B984200D1DA
-:10C410001EE1019BD2195919A9429B415B42D218D6
-:10C420004908D5070D435708041C93E60B4B9C4263
-:10C4300000D0D3E68EE6211C131C1F39CB40191CFB
-:10C44000202F00D18EE03F231C1BA24015436A1E03
-:10C45000954100270D4300248BE7C046FF070000ED
-:10C46000FFFF7FFFFFFF0F80331C101C203BD840D5
-:10C47000202E79D040239B1B9A40131C019A134312
-:10C48000591E8B4100220343C0E6002C53D0C74CF9
-:10C49000A04200D1B0E080247142894624042743A1
-:10C4A0004946382900DDCDE01F2900DD59E120246F
-:10C4B0003E1C611A8E408A46B04649462E1CCE402C
-:10C4C0005146B4468D4064464646494626436C1E56
-:10C4D000A541CF4035430199D71B8C464D1BAC4538
-:10C4E00092415242BF1A041C984696E6634665463E
-:10C4F000334300D096E60026002700240025C4E63A
-:10C500001F2B61DC2020C31A9B46131C59468B400D
-:10C5100051469946019BCB409C464B46604603439F
-:10C520009C465B46019999406346481E81411943E8
-:10C530005346DA40CDE63C1C2C435DD0F14389469E
-:10C54000002955D10199D21B8C464D1BAC45894120
-:10C550004942571A041C98465FE69448844200D02A
-:10C56000ADE6F7E5002271E7002387E73B1C2B438C
-:10C57000002C00D0DAE0002B00D113E1131C01994C
-:10C580000B4300D1E6E54919A9429B41D2195B4210
-:10C59000D7183B0200D421E1854B0D1C1F40041C21
-:10C5A000D8E5381C2843002C40D1002800D083E077
-:10C5B000101C0199084303D0171C0D1C9846C9E5AF
-:10C5C00000260027002560E65046131C2038C34093
-:10C5D000181C5346202B00D1C1E0402351465B1A62
-:10C5E0009A40019911434A1E91410022014370E68D
-:10C5F0006E4CA04200D053E7171C019D041C9846C6
-:10C60000A8E5002C28D13C1C2C4300D18AE0DB4358
-:10C610009A46002B00D082E0019BD2199C466544CB
-:10C620009D42894149425718041C59E600285BD1B4
-:10C63000101C0199084300D1A4E0171C0D1C98465A
-:10C640005A4C87E53D436F1EBD410027EDB242E7DE
-:10C65000041C0027002518E6544CA04262D0534623
-:10C6600080245B429A46240427435346382B00DD3E
-:10C670008EE01F2B00DD9DE02024E31A9B463B1C2F
-:10C6800059468B40514699462B1CCB409C464B4605
-:10C69000644623439C465B469D4063466C1EA54111
-:10C6A000CF401D43019BBF189C4665449D4292416B
-:10C6B0005242BF18041C13E6101C0199084300D114
-:10C6C00048E5681A844685428041BE1A4042301AC5
-:10C6D000060200D447E68C464D1BAC458941D21B6F
-:10C6E0004942571A984635E5101C0199084334D041
-:10C6F00080247807ED08FF0824032843274208D048
-:10C70000D608264205D1C90852070A43101C371C17
-:10C710009846FF00420F1743C500244C1AE5234CEE
-:10C72000A042A2D1171C019D041C13E5002B35D09B
-:10C73000131C01990B4310D080247807ED08FF08E3
-:10C74000240328432742E4D0D3082342E1D1C90877
-:10C7500052070A43101C1F1CDBE7144CFAE40022AA
-:10C760003FE74C463E1C203CE6404946341C20290D
-:10C7700032D04026761AB7403D436F1EBD41002798
-:10C780002543A8E680270026FF03084C00257CE50A
-:10C790003D436F1EBD410027EDB283E7171C019D8D
-:10C7A000024CD7E4171C019DD4E4C046FF070000EB
-:10C7B000FFFF7FFF54463B1C203CE3401C1C5346BC
-:10C7C000202B0DD0402351465B1A9F403D436F1EE6
-:10C7D000BD410027254365E70027CDE70D1CC8E5CF
-:10C7E0000027F3E70B0330B5134C1A0B4B00051C65
-:10C7F0005B0DC90F0020A34210DD104883420EDC00
-:10C8000080200F4C40030243E41A1F2C0ADD0D4820
-:10C81000C31ADA40131C48424340581830BD0A4B33
-:10C82000C818FBE7281CE040084CA44663449A4023
-:10C83000131C0343EFE7C046FE0300001D04000085
-:10C840003304000013040000FFFFFF7FEDFBFFFF38
-:10C8500038B5041E16D0C50F00D04442201C00F08D
-:10C8600017F9174B1B1A0A2821DC021C211C153250
-:10C8700091400A1C0B21081AC4405B052403240BB9
-:10C880005B0D03E000250023002400220021101C82
-:10C8900024030A0D1205240B14430A4A1B051440F5
-:10C8A0001C436400ED0764082C43211C38BD0B3881
-:10C8B00084405B052403240B5B0D0022E6E7C046A1
-:10C8C0001E040000FFFF0F804200120E511C38B5FD
-:10C8D000C9B243025D0AC40F012915DDE0218900B8
-:10C8E0008C466D071B0B62440021281C0D0D2D0585
-:10C8F0002B431C4D52052B40520813435B00E407A9
-:10C900005B082343191C38BD002A15D1002D1FD008
-:10C91000281C00F0BDF80A281DDC0B232A1C1B1A5A
-:10C92000DA40131C021C153295400F4A1B03121AE1
-:10C9300052051B0B520DD7E7002D06D080221B0B92
-:10C94000120313436D07094ACEE7084A0023CBE7D9
-:10C9500000220023C8E7031C0B3B9D402B1C002535
-:10C96000E3E7C046FFFF0F8089030000FF070000D8
-:10C9700070B50B034D00440F6D0D5B0A23436C1C17
-:10C980006405C90FC200640D012C2ADD3B4C2C1933
-:10C99000FE2C1ADC002C35DD8001451EA841DB0091
-:10C9A0000343520F13435A0704D00F221A40042A9C
-:10C9B00000D004338022D2041A4027D00134FF2C47
-:10C9C00003D09B015B0AE4B201E0FF2400235B0279
-:10C9D000E4055B0A23435B00C9075B080B43181C93
-:10C9E00070BD002D06D113430ED100245B025B0AFB
-:10C9F000E4B2ECE71A43E8D08020DB008004034374
-:10CA0000FF24D0E717340CDA05230024DB08FF2CC1
-:10CA1000ECD1002B2DD08022D20313435B025B0AA2
-:10CA2000D5E78024164824042343401B1F280DDC2F
-:10CA3000144CA4466544AB401C1C131CAB405D1E4B
-:10CA4000AB41C240234313430024ACE71E1C0E4CF1
-:10CA5000641BE640341C20280DD00C4884466544F5
-:10CA6000AB401D1C2A43531E9A41131C2343002430
-:10CA700099E70023ABE70025F4E7C04680FCFFFF01
-:10CA80009E03000082FCFFFF7E030000A2FCFFFF6C
-:10CA90001C2101231B04984201D3000C10391B0AEE
-:10CAA000984201D3000A08391B09984201D30009B2
-:10CAB000043902A2105C40187047C0460403020209
-:10CAC000010101010000000000000000F0B5444633
-:10CAD0005F4656464D46F0B41C1C85B0002900DA6E
-:10CAE000A9E00F1C0021061C8846101C191C002CF4
-:10CAF00000DA97E0341C3D1C82468946B94273D85F
-:10CB000070D04946504600F085F98346391C301CE8
-:10CB100000F080F95B46181A031C8346203B9C46B4
-:10CB200000D59CE000230022514600920193634609
-:10CB30009940019151468140019B0091BB4200D92F
-:10CB400083E000D17EE0009A019B341C3D1CA41AB6
-:10CB50009D416346002B00DA9AE0002600270296EA
-:10CB6000039701369E4003960126864002960028D0
-:10CB700000D171E00099019AD30799464B464E08BF
-:10CB80001E435708002301220CE0AF4201D1A64208
-:10CB90000AD8A41BBD4124196D410138A4185D4178
-:10CBA000002806D0AF42F0D9013824196D41002881
-:10CBB000F8D12022029E039F5B46524236196F41F4
-:10CBC00099185AD4281CC8402C1C5B46DC4000290C
-:10CBD00068DB041C8C40231C59468840021CB61A92
-:10CBE0009F4103E0B0428CD90026002741464B1EEE
-:10CBF0009941002300910193009A019B0025544222
-:10CC00009D41331C6340181C3B1C6B40191C009B4E
-:10CC1000019CC018614105B03CBC90469946A246B3
-:10CC2000AB46F0BD4346DB430C1C9846131C002169
-:10CC30005842A1415EE7002746428F410121494207
-:10CC4000884652E7B14200D87DE7002600270296C9
-:10CC50000397002800D08DE7029E039FC6E720219E
-:10CC60005346091ACB400022191C0023009201935D
-:10CC70004B4683400B4301935CE75A4620239B1AA3
-:10CC80002A1C9A40201C131C5A46D04018439BE78C
-:10CC900020260027331A0026029603970127DF403B
-:10CCA000039761E75B4620215D46C91A031CAC402F
-:10CCB000CB40191C231C0B438EE7C046F0B54546FC
-:10CCC0004E465746E0B4041C82B00D1C914698466F
-:10CCD0008B4262D85FD04146484600F09BF8291C41
-:10CCE000061C201C00F096F82023311A5B428A466D
-:10CCF000C81865D44B4683401F1C4B468B401E1CF6
-:10CD0000AF4258D855D0A41BBD41002800DA77E0C7
-:10CD100000220023009201930132824001920123FC
-:10CD20008B40009300293CD0FB0798464046720890
-:10CD30007B080243012600270CE0AB4201D1A2424E
-:10CD40000AD8A41A9D4124196D410139A4197D41C5
-:10CD5000002906D0AB42F0D9013924196D410029D0
-:10CD6000F8D1202200980199534652420019694196
-:10CD70009E183AD42F1CF7405346DD40002E29DB85
-:10CD80003C1CB440231C5446A7403A1C801A9941CD
-:10CD90000090019105E082429DD900230024009378
-:10CDA00001940098019902B01CBC90469946A24695
-:10CDB000F0BDA342A7D90022002300920193B1E75E
-:10CDC00020224B46521AD3401A1C43468B401F1C4C
-:10CDD000174392E7534620245646E41A3B1CB540BD
-:10CDE000E3401C1C2B1C2343CDE7524620239B1AF7
-:10CDF0002A1C9A40271C131C5246D7401F43BBE7EE
-:10CE000020230022581A0023009201930132C240CD
-:10CE1000019284E710B5002903D1FFF739FE2030D5
-:10CE200002E0081CFFF734FE10BDC046F0B54746CF
-:10CE3000754B440080B4051C071C64089C420BDD44
-:10CE4000FF23DB059C4200DD72E0002800DC9DE052
-:10CE50006E4804BC9046F0BD6D4B9C4279DC6D4B36
-:10CE60009C4269DD01267642291C281CFDF7E0FB67
-:10CE700080464146FDF7DCFB6749041CFDF7D8FB03
-:10CE80006649FDF767F8211CFDF7D2FB6449FDF701
-:10CE900061F8211CFDF7CCFB6249FDF75BF8211C12
-:10CEA000FDF7C6FB6049FDF755F8211CFDF7C0FBF7
-:10CEB0005E49FDF74FF84146FDF7BAFB5C498046F5
-:10CEC000201CFDF7B5FB5B49FDF7E4FC211CFDF7D9
-:10CED000AFFB5949FDF7DEFC211CFDF7A9FB5749C3
-:10CEE000FDF7D8FC211CFDF7A3FB5549FDF7D2FC4B
-:10CEF000211CFDF79DFB011C731C49D04046FDF72A
-:10CF000029F8291CFDF794FB4E4BB600F158FDF7AC
-:10CF1000C1FC291CFDF7BEFC4B4B011CF058FDF772
-:10CF2000B9FC002F95DA80231B069C46604490E7ED
-:10CF3000291CFDF70FF88CE74449FDF70BF8FE219B
-:10CF40008905FCF73DFF031C281C002B00D080E75F
-:10CF500088E700F013F93E4B051C9C4223DC3D4B57
-:10CF60009C423FDC291CFCF7F5FFFE218905FDF7FB
-:10CF700091FC8021041CC905281CFCF7EBFF011C57
-:10CF8000201CFDF763F90026051C6DE7324860E7B9
-:10CF90004046FCF7DFFF291CFDF74AFB011C281C5B
-:10CFA000FDF778FC55E72D4B9C4214DCFF218905E9
-:10CFB000FDF770FCFF21041C8905281CFDF738FBD8
-:10CFC000FE218905FCF7C6FF011C201CFDF73EF978
-:10CFD0000226051C48E7291C2148FDF737F90326DE
-:10CFE000051C41E7FE218905FDF754FCFE21041CC8
-:10CFF0008905281CFCF7AEFF011C201CFDF726F953
-:10D000000126051C30E7C046FFFF7F50DB0FC93FFC
-:10D01000FFFFDF3EFFFFFF30D769853C59DA4B3D0C
-:10D02000356B883D6E2EBA3D2549123EABAAAA3E0D
-:10D0300021A215BD6BF16E3D95879D3D388EE33D78
-:10D04000CDCC4C3E1C1A03002C1A0300CAF24971C5
-:10D05000FFFF973FFFFF2F3FDB0FC9BFFFFF1B40C5
-:10D06000000080BFF0B54746430080B45F081B0E48
-:10D070007F3B051C1C1E162C1DDC8046002B23DB71
-:10D080001B4F061C1F41074211D01A49FCF762FFD3
-:10D090000021FCF795FE002809D0002D04DD802337
-:10D0A0001B0423419846A8444346BB431E1C301C26
-:10D0B00004BC9046F0BD104B061C9F42F7D9291CBA
-:10D0C000FCF748FF061CF2E70A49FCF743FF002182
-:10D0D000FCF776FE002806D0002D06DB002F02D0DC
-:10D0E000FE26B605E3E72E1CE1E780263606DEE7DE
-:10D0F000FFFF7F00CAF24971FFFF7F7F00B51D4A25
-:10D10000430083B0011C5B08934217DD1A4A934227
-:10D1100003DDFDF7BFFB03B000BD694602F000FA76
-:10D1200003231840012816D002280BD000281CD059
-:10D1300000980199012203F037F8ECE7002102F092
-:10D14000D5FBE8E70098019902F0D0FB80231B068D
-:10D150009C466044DFE701990098012203F024F81F
-:10D1600080231B069C466044D5E70098019902F095
-:10D17000BDFBD0E7D80F493FFFFF7F7F400040084D
-:10D180007047C046F0B54746430080B45F081B0EA9
-:10D190007F3B051C1C1E162C18DC8046002B1EDB5A
-:10D1A0001B4F061C1F4107420CD01A49FCF7D2FE48
-:10D1B0000021FCF705FE002804D0002D1DDB4346AE
-:10D1C000BB431E1C301C04BC9046F0BD124B061C19
-:10D1D0009F42F7D9291CFCF7BDFE061CF2E70D495A
-:10D1E000FCF7B8FE0021FCF7EBFD002803D0002D72
-:10D1F00009DB0026E6E72E1CE4E780231B0423411D
-:10D200009846A844DBE7002FF5D0044EDAE7C04685
-:10D21000FFFF7F00CAF24971FFFF7F7F000080BFE0
-:10D2200043005B080220002B00D17047084A0230FF
-:10D230009918084A9142F8D9074A591E0138914273
-:10D24000F3D9064A9446634458425841EDE7C04634
-:10D25000000080FFFFFFFF7EFEFF7F000000808058
-:10D2600038B50C1C0021216010494300051C5B08E7
-:10D27000021C8B4218DC002B16D00D4900228B4279
-:10D2800008DC9821C905FDF7D3F91922051C4300D4
-:10D290005B085242DB157E3B9B18FC202A1C236056
-:10D2A000044B80051A400243101C38BDFFFF7F7FEE
-:10D2B000FFFF7F00FFFF7F8038B5041C0D1C03F0CB
-:10D2C000ABFB002805D0201C0021FCF75FFD0028E7
-:10D2D00001D0201C38BD201C291C00F055F8041C6E
-:10D2E00003F09AFB002805D0201C0021FCF74EFD1E
-:10D2F0000028EED003F0ACFB22230360E9E7C04630
-:10D3000008B543001B0E7F3B162B0DDC002B0FDBFB
-:10D31000094A1A41131C024206D0021C9A430A60B1
-:10D32000111CFDF7B7FA02E00860C00FC00708BD86
-:10D33000C30FDB070B60FAE7FFFF7F0043001B0E04
-:10D340007F3B10B5162B0DDC002B12DB0D4C011CA6
-:10D350001C41044204D08022D2031A411118A14377
-:10D36000081C10BD011C802BFAD1FCF7F3FD011C39
-:10D37000F6E7C10FC9070133F2D1FE239B0519431C
-:10D38000EEE7C046FFFF7F00430070B50D1C041C94
-:10D390005E08011C002E10D0274886420FD827496E
-:10D3A0008E4211D9211C1B0E5B19FE2B29DC002B90
-:10D3B00018DD234CDB0521401943081C70BD201CDF
-:10D3C000FCF7C8FD011CF8E79821201CC905FDF7F2
-:10D3D0002FF91C4B041C9D421CDB43001B0E011C3F
-:10D3E000193BE1E71A1C163219DA174B9D4208DC8B
-:10D3F000211C164803F00AFB1449FDF719F9011C1A
-:10D40000DBE7211C124803F001FB1149FDF710F97D
-:10D41000011CD2E70D49FDF70BF9011CCDE70848C7
-:10D4200019330140DA050A43CC21101C8905FDF7A8
-:10D43000FFF8011CC1E7C046FFFF7F7FFFFF7F00B1
-:10D44000FFFF7F80B03CFFFF50C300006042A20D91
-:10D45000CAF2497100B51E4A430083B0011C5B0843
-:10D4600093421ADD1B4A934203DDFDF713FA03B022
-:10D4700000BD694602F054F80323184001281BD070
-:10D4800002280FD000281CD00098019902F02EFA33
-:10D4900080231B069C466044E9E70021002202F03D
-:10D4A00083FEE4E700980199012202F07DFE8023CB
-:10D4B0001B069C466044DAE70199009802F016FAD0
-:10D4C000D5E700980199012202F06EFECFE7C04631
-:10D4D000D80F493FFFFF7F7F00B50F4A430083B05D
-:10D4E000011C5B08934212DD0C4A934203DDFDF7F9
-:10D4F000D1F903B000BD694602F012F801221040D4
-:10D500004000121A0199009802F0C8FEF1E70021CC
-:10D51000012202F0C3FEECE7DA0F493FFFFF7F7FF5
-:10D5200008B500F057FC08BDF0B5474680B48CB094
-:10D53000041C0D1C00F022FD274B061C98461B788E
-:10D540000F1C5BB201330DD0201C291C03F086F99F
-:10D55000002807D0201C291C00220023FCF7E2FB36
-:10D56000002805D1301C391C0CB004BC9046F0BD1D
-:10D5700001230293194B06940795039300230A9302
-:10D580004346049405951C78002C0FD100230024F9
-:10D590000893099402A803F08FF9002810D00A9B81
-:10D5A0000193002B11D1089E099FDBE70020002189
-:10D5B000021C0B1CFDF7C4FE08900991022CE9D156
-:10D5C00003F046FA21230360E9E703F041FA0A9BDE
-:10D5D00001930360E7E7C0460C0100203C1A0300FA
-:10D5E00070B58CB0051C00F0BFFD0023224E041C5A
-:10D5F000F356013304D0281CFFF712FE002802D195
-:10D60000201C0CB070BD281CFFF7B8FDFE21890559
-:10D61000FCF7D6FB0028F3D001230293174B281CFC
-:10D62000039300230A93FFF74FF9069007910490A4
-:10D630000591134803F042F90023F356089009912D
-:10D64000022B0ED002A803F037F9002809D00A9B5C
-:10D650000193002B0AD108980999FFF789F9041C56
-:10D66000CEE703F0F5F921230360F0E703F0F0F9CA
-:10D670000A9B01930360EEE70C010020441A0300AB
-:10D68000681A030070B58CB0051C00F0D5FE0023AD
-:10D69000224E041CF356013304D0281CFFF7C0FDB2
-:10D6A000002802D1201C0CB070BD281CFFF766FDBD
-:10D6B000FE218905FCF784FB0028F3D001230293A7
-:10D6C000174B281C039300230A93FFF7FDF80690DD
-:10D6D000079104900591134803F0F0F80023F356E6
-:10D6E00008900991022B0ED002A803F0E5F800285B
-:10D6F00009D00A9B0193002B0AD108980999FFF7DA
-:10D7000037F9041CCEE703F0A3F921230360F0E707
-:10D7100003F09EF90A9B01930360EEE70C010020E1
-:10D720004C1A0300681A030008B500F0DBFF08BDBF
-:10D73000F0B58BB0051C01F069F80023304E041CD5
-:10D74000F356013336D0281C03F066F9002831D097
-:10D75000281C2C49FCF734FB071E2ED1281C2A4913
-:10D76000FCF71AFB002825D004230093274B281C24
-:10D7700001930897FFF7A8F8002300220692079369
-:10D780000023F3566C460490059102900391022BFE
-:10D7900030D0201C03F090F800282BD0236A002BF7
-:10D7A00003D003F055F9236A0360A069E169FFF72C
-:10D7B000DFF8041C201C0BB0F0BD03230093134BB7
-:10D7C000281C019300230893FFF77EF833786C46FA
-:10D7D0000490059102900391002B05D1E0220C4B9F
-:10D7E000120606920793D4E700200A490690079193
-:10D7F000022BCED103F02CF922230360CEE7C046E2
-:10D800000C0100208071B142B5F1CFC2541A03005F
-:10D81000FFFFEF470000F07FF0B58DB0061C0D1C38
-:10D8200001F0F0F800232B4F041CFB56013304D009
-:10D83000281CFFF7F5FC002802D1201C0DB0F0BD1C
-:10D84000301CFFF7EDFC0028F7D0281C0021FCF766
-:10D850009DFA0028F1D0012302931F4B301C039343
-:10D8600000230A93FFF730F8031C0C1C281C0093BC
-:10D87000019404930594FFF727F83C7806900791EC
-:10D88000002C17D000200021021C0B1CFDF758FDB6
-:10D8900008900991022C11D103F0DAF821230360DA
-:10D8A0000A9B0093002B0FD108980999FFF760F8A5
-:10D8B000041CC2E7009B019C0893099402A802F093
-:10D8C000FBFF0028ECD1E7E703F0C2F80A9B0093C6
-:10D8D0000360E9E70C0100205C1A030070B58CB00E
-:10D8E000041C01F015F90023364E051CF3560133D4
-:10D8F0000ED0201CFFF794FC031C281C002B07D023
-:10D90000201C0021FCF75CFA031C281C002B01D012
-:10D910000CB070BD2C4A201C03920A93FEF7D4FF72
-:10D9200035780690079104900591002D12D1E022E0
-:10D93000264B1206201C002108920993FCF726FAB8
-:10D94000002835D10123029302A802F0B5FF002878
-:10D9500012D10DE000221E4B201C002108920993D9
-:10D96000FCF714FA002815D101230293022DEBD104
-:10D9700003F06EF821230360164802F09FFF089021
-:10D9800009910A9B0193002B15D108980999FEF77C
-:10D99000EFFFBDE702230293022D04D002A802F09C
-:10D9A0008BFF0028EDD103F053F822230360E8E752
-:10D9B00002230293F2E703F04BF80A9B0193036002
-:10D9C000E3E7C0460C010020641A0300FFFFEFC725
-:10D9D0000000F0FF681A0300F0B546464F46C0B499
-:10D9E0008BB0051C0C1C01F0FBF90023C74F8046CF
-:10D9F000FB56061C013304D0201CFFF711FC002845
-:10DA000005D1301C0BB00CBC90469946F0BD281CCB
-:10DA1000FFF706FC8146002833D1201C0021FCF7CB
-:10DA2000B5F90028EDD001230093B94B281C0193D0
-:10DA30004B460893FEF748FF02900391201CFEF727
-:10DA400043FF0022B34B6E46069207930023FB561A
-:10DA5000049005915A1C0ED0022B0CD0301C02F001
-:10DA60002BFF002800D1AEE0336A002B03D002F078
-:10DA7000EFFF336A0360B069F169FEF779FF061CB6
-:10DA8000BFE7281C0021FCF781F9002824D0201CC6
-:10DA90000021FCF77BF9804600285AD0012300932F
-:10DAA0009B4B281C019300230893FEF70DFF029067
-:10DAB0000391201CFEF708FF002300220692079323
-:10DAC0000023FB566E4604900591002BC6D0002221
-:10DAD000904B06920793CEE7404602F09DFF8146A9
-:10DAE000002875D040460021FCF750F94646002832
-:10DAF00000D186E7281C02F08FFF4646002800D19F
-:10DB00007FE7201C02F088FF002800D179E704237A
-:10DB100000937F4B281C019300230893FEF7D4FE4B
-:10DB200002900391201CFEF7CFFE002300220692F4
-:10DB300007930023FB566E4604900591022B76D086
-:10DB4000684602F0B9FE002871D0336A002B92D0EB
-:10DB50008DE7201C02F060FF002800D151E7201C57
-:10DB60000021FCF719F9002800D14AE701230093AE
-:10DB7000674B281C019343460893FEF7A5FE0290CD
-:10DB80000391201CFEF7A0FE3B786E4604900591A1
-:10DB9000002B45D10022002306920793301C02F08F
-:10DBA0008BFE0028D1D102F053FF21230360CCE784
-:10DBB00000200021021C0B1CFDF7C2FB0690079100
-:10DBC000022C00D04AE702F043FF212303604BE719
-:10DBD000281C02F021FF002884D0201C02F01CFF2A
-:10DBE000002800D17EE74046FFF71AFB6E4600286A
-:10DBF00022D101230093464B0890281C0193FEF785
-:10DC000063FE02900391201CFEF75EFE3C780490B8
-:10DC10000591002CCCD100220023069207931DE72A
-:10DC200000203D4906900791022BBCD0B6E702F0D8
-:10DC30000FFF2223036088E703230093344B281C43
-:10DC400001934B460893FEF73FFE02900391201C80
-:10DC5000FEF73AFE0023FB5604900591002B19D1E4
-:10DC6000E0222E4B1206281C002106920793FCF797
-:10DC700093F8002830D10023FB56022B05D0301C2E
-:10DC800002F01AFE002800D0EEE602F0E1FE2223A8
-:10DC90000360E9E60022224B281C0021069207932C
-:10DCA000FCF77AF80028E6D0FC21201C8905FCF757
-:10DCB000BFFCFEF709FE041C0D1C02F005FE021C51
-:10DCC0000B1C201C291CFCF727F80028D3D10022AC
-:10DCD000114B06920793CEE7FC21201C8905FCF727
-:10DCE000A7FCFEF7F1FD041C0D1C02F0EDFD021C6B
-:10DCF0000B1C201C291CFCF70FF80028BBD1E022CC
-:10DD0000084B120606920793B5E7C0460C010020A7
-:10DD10006C1A03000000F03F0000F0FFFFFFEF4728
-:10DD20000000F07FFFFFEFC770B58CB0051C01F05D
-:10DD300081FD0023254E041CF35601330AD0281C14
-:10DD4000FFF76EFA002805D0281C0021FCF724F804
-:10DD5000002802D1201C0CB070BD012302931C4B83
-:10DD6000281C039300230A93FEF7AEFD3478069037
-:10DD7000079104900591002C12D1002200230892F3
-:10DD8000099302A802F098FD002813D00A9B019382
-:10DD9000002B14D108980999FEF7EAFD041CD9E775
-:10DDA00000200021021C0B1CFDF7CAFA0890099103
-:10DDB000022CE6D102F04CFE21230360E6E702F0DC
-:10DDC00047FE0A9B01930360E4E7C0460C01002074
-:10DDD000741A0300F8B54F4646460C1C894651425A
-:10DDE000C0B4051C11435800564E4008C90F9C464C
-:10DDF0000143B1423DD8610049088846474669421F
-:10DE00002943C90F3943B14233D84F4959181143F7
-:10DE100047D0022699170E40E10F0E434146294391
-:10DE200031D0011C114336D04649884249D045497A
-:10DE3000884530D04146081A00153C283BDC614635
-:10DE400000295ADB281C211CFDF77AFA02F002FD9A
-:10DE500002F062FB012E40D0022E43D0002E0ED0E5
-:10DE60003A4A3B4BFEF744F93A4A3B4BFEF740F93E
-:10DE700005E0101C191C2A1C231CFCF739FF0CBCE4
-:10DE800090469946F8BD022E18D00FDC002EC8DB54
-:10DE9000281C211CF3E74B462E48002B1BDB2F4987
-:10DEA000EDE7281C211C02F037FBE8E7032EB8D170
-:10DEB00028482B49E3E727482849CBE72548264946
-:10DEC000DDE780451ED0012E2CD025DD022EF5D0B9
-:10DED000032EEDD0ABE72349D1E7802424060B19AC
-:10DEE000191CCCE7194A1A4BFEF702F9021C0B1C4D
-:10DEF00018481949FEF7FCF8C1E73C30A2DA0020C7
-:10DF00000021A7E7012E19D010DD022E13D0032E19
-:10DF1000C1D115481549B2E7002E00D087E700208F
-:10DF20000021ACE7802100200906A8E7002EB2D12D
-:10DF300008480F49A3E70C480E49A0E705480E49D9
-:10DF40009DE7C0460000F07F000010C0075C14335E
-:10DF500026A6A13C182D4454FB210940FB21F93F82
-:10DF6000FB2109C0FB21F9BFD221337F7CD902C03C
-:10DF7000FB21E93F7CD90240FB21E9BFF0B55646C1
-:10DF80004D4644465F46754BF0B40A1C0E1C191CE6
-:10DF900083B0051C041C3140994200D1B7E0002E2B
-:10DFA00000DC93E0311500D1A0E06D4B1203CE18D8
-:10DFB0008023120B5B031A43F30700D577E073103D
-:10DFC00052009846E30FD31880221621002700251F
-:10DFD00064009203A818984202DC85181B1ABF1827
-:10DFE000E00F5B0001391B18640052080029F1D1D1
-:10DFF000002201929446802212062020924609E0D7
-:10E00000AB4247D0E10F5B0001385B186400520857
-:10E0100000281ED0614689189D42F1DA8E18B44658
-:10E02000CE0FF607A94656452ED05B1B8C42AD415C
-:10E030006D425B1B641A01995B008B469344594601
-:10E0400001380191E10F4D465B1864005208002829
-:10E05000E0D1234330D1019B5B0842497A108C46C2
-:10E060006244F90702D5802109060B4341460E059B
-:10E07000B1181D1C0E1C281C311C03B03CBC904662
-:10E080009946A246AB46F0BD6646002ECDDB6E1C1F
-:10E09000B146CAE7A14208D88E18B446CE0FF6079B
-:10E0A000564541D099460023C4E71D1CAAE7E30F5B
-:10E0B0005200D218640082E7019B01333AD0019AE2
-:10E0C00001239446134063445B08C6E773005B0872
-:10E0D0000343D0D00021002E33D1E20A1539640564
-:10E0E000002AFAD080235B031A4226D18020002325
-:10E0F0004003520001330242FBD001252020ED1ADB
-:10E10000C01A4919251CC5409C402A434DE72A1CCA
-:10E11000331C281C311CFDF751FD2A1C331CFCF755
-:10E12000E7FD051C0E1CA6E76646002EAFDA0023AD
-:10E13000A9467FE7013700238FE720200125002330
-:10E14000DFE72A1C331C281C311CFDF7D1FF021C01
-:10E150000B1CFDF7F5F8051C0E1C8CE70000F07F8A
-:10E1600001FCFFFF0000E03FFE22F8B54300041C65
-:10E170005B089205934211D009DC9F4A934212DC5E
-:10E180008C229205934200DD81E09C4805E0211C31
-:10E19000FCF780FB011CFCF759F8F8BD0020002CAF
-:10E1A000FBDC9748F9E7002800DAC5E0FE20211CD7
-:10E1B0008005FCF76FFBFC218905FCF739FA041C8C
-:10E1C00001F038FB8F49061C050B201CFCF730FAC8
-:10E1D0008D49FBF7BFFE211CFCF72AFA8B49FCF79F
-:10E1E00059FB211CFCF724FA8949FBF7B3FE211CDB
-:10E1F000FCF71EFA8749FCF74DFB211CFCF718FAC7
-:10E200008549FBF7A7FE211CFCF712FA8349071C7E
-:10E21000201CFCF70DFA8249FCF73CFB211CFCF7A3
-:10E2200007FA8049FBF796FE211CFCF701FA7E49AC
-:10E23000FCF730FB211CFCF7FBF9FE218905FBF7FD
-:10E2400089FE011C381CFCF701F8311CFCF7F0F9C1
-:10E250002D03071C291C281CFCF7EAF9011C201CB3
-:10E26000FCF718FB291C041C301CFBF773FE011C77
-:10E27000201CFBF7EBFF011C381CFBF76BFE011C9D
-:10E28000281CFBF767FE011CFBF764FE85E7211CD9
-:10E29000FCF7CEF95B49051CFCF7CAF95A49FBF7B4
-:10E2A00059FE291CFCF7C4F95849FCF7F3FA291C5C
-:10E2B000FCF7BEF95649FBF74DFE291CFCF7B8F9EF
-:10E2C0005449FCF7E7FA291CFCF7B2F95249FBF76D
-:10E2D00041FE291CFCF7ACF95049061C281CFCF730
-:10E2E000A7F94F49FCF7D6FA291CFCF7A1F94D49CB
-:10E2F000FBF730FE291CFCF79BF94B49FCF7CAFAE7
-:10E30000291CFCF795F9FE218905FBF723FE011C6A
-:10E31000301CFBF79BFF011C201CFCF789F9011C3A
-:10E320004248FCF7B7FA011C201CFCF7B3FA011CA9
-:10E330003F48FCF7AFFA30E7FE218905FBF70AFEFC
-:10E34000FC218905FCF774F92E49041CFCF770F9CF
-:10E350002D49FBF7FFFD211CFCF76AF92B49FCF75F
-:10E3600099FA211CFCF764F92949FBF7F3FD211CFC
-:10E37000FCF75EF92749FCF78DFA211CFCF758F9E8
-:10E380002549FBF7E7FD211CFCF752F9061C201C70
-:10E3900001F050FA2149051C201CFCF749F92049DD
-:10E3A000FCF778FA211CFCF743F91E49FBF7D2FD74
-:10E3B000211CFCF73DF91C49FCF76CFA211CFCF709
-:10E3C00037F9FE218905FBF7C5FD011C301CFBF761
-:10E3D0003DFF291CFCF72CF91449FCF75BFA011CE2
-:10E3E000281CFBF7B7FD011CFBF7B4FD011C11480D
-:10E3F000FCF750FAD1E6C046FFFFFF3EDB0FC93FF6
-:10E40000DB0F494008EF1138047F4F3A4611243D95
-:10E41000A80A4E3E90B0A63EABAA2A3E2EC69D3D0F
-:10E420006133303F2D57014039D119406821A23363
-:10E43000DA0FC93FDA0F4940F0B5FE234E46454694
-:10E4400057464400E0B46408051C061C9B059C422A
-:10E4500000D1C9E000DDA6E0904B9C420FDC904B60
-:10E460009C4200DDCDE08F49FBF774FDFE2189055C
-:10E47000FBF7A6FC031C281C002B00D099E0281CED
-:10E48000FEF77CFE011CFE208005FCF703FAFC2150
-:10E490008905FCF7CDF88449051CFCF7C9F88349C8
-:10E4A000FBF758FD291CFCF7C3F88149FCF7F2F98A
-:10E4B000291CFCF7BDF87F49FBF74CFD291CFCF734
-:10E4C000B7F87D49FCF7E6F9291CFCF7B1F87B4960
-:10E4D000FBF740FD291CFCF7ABF879498046281C66
-:10E4E000FCF7A6F87749FCF7D5F9291CFCF7A0F84A
-:10E4F0007549FBF72FFD291CFCF79AF87349FCF7C7
-:10E50000C9F9291CFCF794F8FE218905FBF722FDC7
-:10E510008146281C01F08EF96D4B071C9C424DDC96
-:10E52000391C040BFBF716FD494682464046FBF7B3
-:10E530008DFE011C5046FCF77BF824038046211C0D
-:10E54000201CFCF775F8011C281CFCF7A3F9211C02
-:10E55000051C381CFBF7FEFC011C281CFBF776FE93
-:10E56000011CFBF7F7FC011C5A48FCF793F9011C4E
-:10E570004046FCF78FF9211C051C201CFBF7EAFC28
-:10E58000011C5548FCF786F9011C281CFCF782F990
-:10E59000011C5148FCF77EF9002E0ADC80231B0683
-:10E5A0009C46604405E0291CFCF774F9011CFBF74C
-:10E5B0004DFE1CBC90469946A246F0BD49464046D9
-:10E5C000FBF744FE011C381CFCF732F8391CFBF742
-:10E5D000C1FC011CFBF7BEFC4049FBF7BBFC011C66
-:10E5E0003F48FCF757F9D7E73D49FCF721F839498F
-:10E5F000041C281CFCF71CF8011C201CFBF7AAFCBF
-:10E60000D7E7291CFCF714F82749041CFCF710F87D
-:10E610002649FBF79FFC211CFCF70AF82449FCF76C
-:10E6200039F9211CFCF704F82249FBF793FC211C63
-:10E63000FBF7FEFF2049FCF72DF9211CFBF7F8FF43
-:10E640001E49FBF787FC211CFBF7F2FF1C49061C47
-:10E65000201CFBF7EDFF1B49FCF71CF9211CFBF705
-:10E66000E7FF1949FBF776FC211CFBF7E1FF17498F
-:10E67000FCF710F9211CFBF7DBFFFE218905FBF7F6
-:10E6800069FC011C301CFBF7E1FD011C281CFBF799
-:10E69000CFFF291CFBF75EFC8BE7C046FFFFFF3E68
-:10E6A000FFFFFF31CAF2497108EF1138047F4F3A7A
-:10E6B0004611243DA80A4E3E90B0A63EABAA2A3E83
-:10E6C0002EC69D3D6133303F2D57014039D1194051
-:10E6D0009999793F2EBD3BB3DB0F493F2EBD3B33AC
-:10E6E000DB0FC93FF0B54746FF254A0080B4031C45
-:10E6F0005208ED05AA4216DC804640004008A842B8
-:10E7000011DCFE24A405A1423DD002278C173C4019
-:10E71000DF0F3C4300280DD1022C32D0181C032CF3
-:10E7200005D1314803E0081C191CFBF713FC04BC9D
-:10E730009046F0BD002A1DD0AA4228D0A84219D088
-:10E74000821AD2153C2A1ADC00293BDB181CFBF785
-:10E750007DFDFEF713FDFEF769FB012C25D0022C91
-:10E7600028D0002CE3D02149FBF7F4FB2049FCF72B
-:10E7700091F8DCE74346002B15DB1E48D7E71D4820
-:10E78000EBE71B48D3E7181CFEF750FBCFE790429E
-:10E790001CD0022CF5D0032CC3D00020012CC6D1F4
-:10E7A00080200006C3E71448C1E780231B069C466F
-:10E7B0006044BCE70D49FBF7CDFB011C0C48FCF79E
-:10E7C00069F8B4E700203C32C7DBBFE7022C05D074
-:10E7D000032C07D0012C03D00848A8E70848A6E777
-:10E7E0000848A4E70848A2E7DB0F49C02EBDBB33A9
-:10E7F000DB0F4940DB0FC93FDB0FC9BFDB0F493FD0
-:10E80000E4CB1640DB0F49BFE4CB16C0F8B5FF22BE
-:10E810004F4646464300C0B4041C5B08D2059342F1
-:10E820006ED8C50F934200D171E0654A904200DD79
-:10E830008BE0002800DA81E0624A93426BD9624A99
-:10E84000934200D99BE0614BAF00F958201CFCF7C4
-:10E8500021F8814601205E4B401BFF58451B48466E
-:10E86000391CFCF717F8041C211C201CFBF7E0FEE8
-:10E870005849061CFBF7DCFE5749FCF70BF8311C26
-:10E88000FBF7D6FE5549FBF765FB311CFBF7D0FEC5
-:10E890005349FBF7FFFF311CFBF7CAFE5149FBF759
-:10E8A00059FB311CFBF7C4FE011C201CFBF7F2FFD7
-:10E8B0008046201C4146002D4CD0FBF7B9FE041CBD
-:10E8C00080204146C005FBF7E5FF011C201CFBF73B
-:10E8D000BDFC011C381CFBF7DDFF4946FBF7DAFFE6
-:10E8E000011CFE208005FBF7D5FF2B1C7D3363DA6E
-:10E8F000D8216435ED0528180905FBF799FE02E0DB
-:10E90000211CFBF727FB0CBC90469946F8BD002D57
-:10E91000F9D00020F7E7344A934214D83349201C39
-:10E92000FBF718FBFE218905FBF74AFA00280AD0FD
-:10E93000FE21201C8905FBF70DFBE4E72C4A9342DE
-:10E9400000D879E7E5E700258EE72848011CFBF7AA
-:10E950006FFED8E7FBF76CFE8021051CC905404619
-:10E96000FBF798FF011C281CFBF770FC211CFBF730
-:10E9700091FF011CFE208005FBF78CFFC3E71D49BA
-:10E98000201CFBF755FE1C4BAD00E958FBF7E2FAE3
-:10E99000FCF7FEF8051CFCF71BF91849071CFBF7F0
-:10E9A00047FE011C201CFBF775FF15498146381CEA
-:10E9B000FBF73EFE071C52E7ED052818A3E7C0460B
-:10E9C0001772B1421872B13E9115853F8C1A03003F
-:10E9D000841A03004CBB31330EEADD3555B38A3857
-:10E9E000610B363BABAA2A3EFFFF7F31CAF2497169
-:10E9F000B5F1CF423BAAB83F7C1A03008071313F8A
-:10EA0000D1F7173770B54E0076083ED0C40FE40733
-:10EA1000251C3B4B45409D4237DC01339E4234DC94
-:10EA2000B54237DB3CD0374B9D423EDC7E222B0289
-:10EA30005242002B03DD013A5B00002BFBDC314B23
-:10EA40009E4241DC7E2033024042002B02DB013833
-:10EA50005B00FCD5131C7E3331DB80236D026D0A15
-:10EA60001B041D43031C7E3323DB80234902490A18
-:10EA70001B041943131A002B0DD06A1A6D00002ACB
-:10EA800001DB0DD05500013BF5E7FBF7D1FD011C83
-:10EA9000FBF7DCFB70BD691A00D5291C002916D1D3
-:10EAA000E10F194B8900C858F4E7EB157F3B1A1C9E
-:10EAB000C5E77E23311C5B421B1A9940DAE77E23AF
-:10EAC0005B429B1A9D40CDE7F0157F38C2E70D4AA7
-:10EAD000131C914203DC490001389942FBDD031C01
-:10EAE0007E3306DB094B7F30CB182343C005184328
-:10EAF000D0E77E235B42181A0141081C2043C9E776
-:10EB0000FFFF7F7FFFFF7F00941A0300000080FF5C
-:10EB1000F8B55F4656464D464446011CF0B44B00DE
-:10EB200000D191E0002800DAB2E09E4B984200DD6F
-:10EB3000B5E09D4A0023904206DC081C9821C905D7
-:10EB4000FBF776FD19235B42C5157F3DED184002AA
-:10EB5000964B440AE01880231B040340FE20FE214C
-:10EB600080055840DA15204389055519FBF792FEB8
-:10EB7000231C0F335B02061C5B0A0F2B6FDD802109
-:10EB8000C905FBF7E7F9011C301CFBF75FFB814669
-:10EB9000281CFCF71DF8494682464846FBF748FD0D
-:10EBA0008346834B59469846FBF742FD8149071C33
-:10EBB000FBF73EFD8049FBF7CDF9391CFBF738FD2B
-:10EBC0007E49FBF7C7F9391CFBF732FD7C49FBF79F
-:10EBD000C1F95946FBF72CFD7A498346381CFBF7EF
-:10EBE00027FD7949FBF7B6F9391CFBF721FD774979
-:10EBF000FBF7B0F9391CFBF71BFD011C5846FBF76E
-:10EC0000A9F9A0444346071C7148041B1C43002C6F
-:10EC100000DC9BE0FC21301C8905FBF709FD311C61
-:10EC2000FBF706FD041C002D57D1391CFBF792F9A8
-:10EC30004946FBF7FDFC011C201CFBF72BFE011CC9
-:10EC4000301CFBF727FE04E0CC2000210006FBF778
-:10EC5000FDFA3CBC90469946A246AB46F8BD002161
-:10EC6000FBF794F800281ED00020002DF1D0281CBE
-:10EC7000FBF7AEFF5749041CFBF7DAFC5649051CAD
-:10EC8000201CFBF7D5FC011C281CFBF763F9E0E70F
-:10EC9000081CFBF7FFFD0021FBF7D8FAD9E7081C99
-:10ECA000FBF758F9D5E7311C301CFBF7C1FC4B4989
-:10ECB000041C301CFBF7BCFC011CFC208005FBF78E
-:10ECC000E9FD011C201CFBF7B3FC041C002D25D121
-:10ECD000301C211CFBF7DEFDBBE750463D49FBF72E
-:10ECE000A7FC391C051C201CFBF734F94946FBF72F
-:10ECF0009FFC3949071C5046FBF79AFC011C381C45
-:10ED0000FBF728F9011C201CFBF7C4FD311CFBF7A5
-:10ED1000C1FD011C281CFBF7BDFD9AE7281CFBF771
-:10ED200057FF2C49051CFBF783FC2B49071C281CAB
-:10ED3000FBF77EFC011C201CFBF7ACFD311CFBF734
-:10ED4000A9FD011C381CFBF7A5FD82E7002D1CD096
-:10ED500050462049FBF76CFC391C041C301CFBF7A7
-:10ED600099FD4946FBF764FC1B49051C5046FBF71F
-:10ED70005FFC011C281CFBF78DFD311CFBF78AFD95
-:10ED8000011C201CFBF786FD63E7391C301CFBF7D8
-:10ED900081FD4946FBF74CFC011C301CFBF77AFD5A
-:10EDA00057E7C046FFFF7F7FFFFF7F0020FB4A0041
-:10EDB000305CCFFF9788173E25333A3E2549923E77
-:10EDC000ABAA2A3F4FD01C3E298E633ECDCCCC3E11
-:10EDD00088C235008071313FD1F71737ABAAAA3E00
-:10EDE000F0B5444656464D465F46F0B44E0087B0F7
-:10EDF000051C0C1C8846760811D0FF23470081466D
-:10EE00007F08DB059F4204DD654801F00FFE041C0E
-:10EE100007E09E420DDDFE239B059F42F4D1FE24B8
-:10EE2000A405201C07B03CBC90469946A246AB46C0
-:10EE3000F0BD0023019300286FDBFF23DB059E421A
-:10EE400060D0FE239B059E427CD08023DB05984545
-:10EE500000D18BE0FC239B05984521D0281CFEF7B0
-:10EE60008DF9FF23011CDB059F4236D0002F34D0E3
-:10EE7000FE239B059F4230D0EB0F013B1A1C0293EF
-:10EE8000019B13437CD09A23DB059E4200DC95E076
-:10EE9000444B9F4229DC4346002B2DDB0024C0E776
-:10EEA0004B46281C002B67DAFEF768F9FF23011C8C
-:10EEB000DB059F4201D0002FDAD13B4B081C9C465A
-:10EEC000019B67441F435DD0019B0C1C012BA8D103
-:10EED00080231B069C466444A3E74346002B58DB73
-:10EEE0004B460C1C002B9CDAE7E7304B9F4200DCC2
-:10EEF000BDE24346002BD1DD2D48011CFBF798FBFA
-:10EF0000041C8EE7FE239B059F4200D187E728DD86
-:10EF10004346002B00DB84E7C0E7264B9E421DDC06
-:10EF2000254B9E428DDD9623F2159B1A321C1A4109
-:10EF3000111C9940B14284D101231A4001339B1A1C
-:10EF400001937EE743462C1C002B00DB69E7FE2083
-:10EF5000291C8005FBF77AF9041C62E70223019360
-:10EF60006BE74346002BB3DB00245AE7281C291C1F
-:10EF7000FBF75EFB041C54E700F05CFC041C50E74C
-:10EF8000281C291CFBF786FC011CFBF75FF9041CFD
-:10EF900047E7FE208005FBF759F9011CA0E7C046B2
-:10EFA000681A0300F7FF7F3F000080C00700803F22
-:10EFB000CAF24971FFFF7F4BFFFF7F3FF14B0022F9
-:10EFC0009F4207DC081C9721C905FBF731FB18227B
-:10EFD000071C5242FB157802FE277F3B9B180393C8
-:10EFE000E94B400ABF050743984200DCAEE1E74B1E
-:10EFF000984200DC7CE2039B01330393E44B9C4684
-:10F000000023674404939D00E24B381CEB58BB4639
-:10F01000191C9946FBF73EFC49468246381CFAF714
-:10F0200099FF011CFE208005FBF710F9031C191C39
-:10F0300050460593FBF7FCFA80237F109B051F4386
-:10F040008023DB029C46049B67449C46060B674476
-:10F0500036038046391C301CFBF7EAFA011C504687
-:10F06000FBF718FC49468246381CFBF713FC011CD1
-:10F070005846FBF70FFC011C301CFBF7D9FA011CAA
-:10F080005046FBF707FC0599FBF7D2FA4146834649
-:10F090004046FBF7CDFA071C391CFBF7C9FABE49FD
-:10F0A0008146381CFBF7C4FABC49FAF753FF391CF8
-:10F0B000FBF7BEFABA49FAF74DFF391CFBF7B8FA6D
-:10F0C000B849FAF747FF391CFBF7B2FAB649FAF725
-:10F0D00041FF391CFBF7ACFAB449FAF73BFF011CBE
-:10F0E0004846FBF7A5FA311C071C4046FAF732FFE9
-:10F0F0005946FBF79DFA391CFAF72CFF311C814663
-:10F10000301CFBF795FAAA498246FAF723FF4946D5
-:10F11000FAF720FF070B3F03391C301CFBF788FA76
-:10F12000391C061C5846FBF783FAA1498346381C54
-:10F13000FBF7B0FB5146FBF7ADFB011C4846FBF764
-:10F14000A9FB4146FBF774FA011C5846FAF702FF87
-:10F150008146301C4946FAF7FDFE070B3F03381C79
-:10F160009449FBF765FA94498046381CFBF760FA2E
-:10F17000311C8246381CFBF78DFB011C4846FBF70F
-:10F1800089FB8E49FBF754FA011C5046FAF7E2FE60
-:10F190008B4BE958FAF7DEFE071C0398FBF718FDC6
-:10F1A000884B8146EB5840469A46391CFAF7D2FE06
-:10F1B0005146FAF7CFFE4946FAF7CCFE060B360366
-:10F1C0004946301CFBF766FB5146FBF763FB4146A3
-:10F1D000FBF760FB011C381CFBF75CFB8046019DC4
-:10F1E000029B013D1D4300D0ADE0774F250B2D0361
-:10F1F000291C201CFBF74EFB311CFBF719FA41467A
-:10F200008146201CFBF714FA011C4846FAF7A2FEBF
-:10F21000291C8046301CFBF70BFA061C8246311C69
-:10F220004046FAF797FE44008146051C6408002812
-:10F2300000DC05E18623DB059C4200DD98E000D17F
-:10F2400087E0FC239B059C4200DDD3E000230026E1
-:10F2500099462D0B2D03281C5C49FBF7E9F9514613
-:10F260008346281CFBF716FB011C4046FBF712FBEC
-:10F270005749FBF7DDF95749041C281CFBF7D8F95F
-:10F28000011C201CFAF766FE041C211C5846FAF7E4
-:10F2900061FE5946051CFBF7FDFA011C201CFBF71B
-:10F2A000F9FA291C8046281CFBF7C2F94A49041CBC
-:10F2B000FBF7BEF94949FBF7EDFA211CFBF7B8F95A
-:10F2C0004749FAF747FE211CFBF7B2F94549FBF71E
-:10F2D000E1FA211CFBF7ACF94349FAF73BFE211C8C
-:10F2E000FBF7A6F9011C281CFBF7D4FA041C211C0F
-:10F2F000281CFBF79DF980218246C905201CFBF7DD
-:10F30000C9FA011C5046FAF7A1FF4146041C281C0B
-:10F31000FBF78EF94146FAF71DFE011C201CFBF796
-:10F32000B9FA291CFBF7B6FA011CFE208005FBF791
-:10F33000B1FA3118CB15002B00DCDEE0381CFBF7EE
-:10F3400077F9041C6DE5FE27BF054FE70023049302
-:10F3500059E626494046FAF7FDFD311C82464846EB
-:10F36000FBF798FA011C5046FAF72AFD002841D015
-:10F370001F49381CFBF75CF91D49FBF759F9041CC0
-:10F380004FE5C046FFFF7F0071C41C00D6B35D008F
-:10F39000000080FFAC1A030042F1533E55326C3E30
-:10F3A00005A38B3EABAAAA3EB76DDB3E9A99193FE7
-:10F3B000000040400038763FA0C39D364F38763F6E
-:10F3C000A41A03009C1A0300000080BF0072313FA2
-:10F3D0001872313F8CBEBF354CBB31330EEADD3580
-:10F3E00055B38A38610B363BABAA2A3E3CAA383368
-:10F3F000CAF2497180221204131CE4157E3C234199
-:10F400005C1963025B0A1A4396236100090E5B1ABA
-:10F410001A41131CED0F6A4253409946394B7F390C
-:10F420000B419C43211C301CFBF734FA8246A94453
-:10F4300040465146FAF78EFD4B46051CDE0508E7AF
-:10F44000314B9C420ADC00D0FBE6311CFBF722FA70
-:10F45000011C4046FAF7AAFC0028CBD02B49381CE7
-:10F46000FBF7E6F82949FBF7E3F8041CD9E4081C8C
-:10F47000FE218905FBF70EFA2549061CFBF7D8F893
-:10F480002449071C301CFBF7D3F8311C051C301C29
-:10F49000FBF7CEF8FA2181468905301CFBF7C8F846
-:10F4A000011C1D48FBF7F6F9311CFBF7C1F8011CE4
-:10F4B000FC208005FBF7EEF9011C4846FBF7B8F885
-:10F4C0001649FBF7B5F8011C281CFBF7E3F9051CEE
-:10F4D000291C381CFAF73EFD060B3603391C301C7C
-:10F4E000FBF7D8F9011C281CFBF7D4F9804676E617
-:10F4F00080239B030493012385E54946FDF744FFE0
-:10F50000011C1BE7FFFF7F00000016436042A20DB5
-:10F5100000AAB83F70A5EC36ABAAAA3E3BAAB83FFA
-:10F52000F0B55F46564644464D46F0B44200570893
-:10F53000B24A89B0031C0C1C061C97426FDDB04A0E
-:10F5400097421BDCAF49002B00DC0BE1FBF7A2F973
-:10F550000F233A1C9A43AC4B051C9A4200D170E031
-:10F56000AA49FBF797F9011C2060281CFBF792F9C8
-:10F57000A649FBF78FF96060012054E0A44A974246
-:10F5800000DC70E0A34A974254DC86225242914646
-:10F59000FB1599444B46DD057D1B281CFBF7F8FA4B
-:10F5A000FBF716FB011C0590281CFBF773F987215C
-:10F5B000C905FBF73DF88046FBF7EAFAFBF708FBC5
-:10F5C000051C0690291C4046FBF764F98721C905F4
-:10F5D000FBF72EF800210790FAF7D8FB002800D19E
-:10F5E000D8E0281C0021FAF7D1FB0222431E9841E3
-:10F5F000131A02220092884A05A80192211C4A4649
-:10F6000000F03EFA002E0EDA80221206944623689D
-:10F6100040426344236063686344636003E0002303
-:10F62000206000204B6009B03CBC90469946A24641
-:10F63000AB46F0BD191CFBF72DF96060206000207F
-:10F64000F1E77649FBF726F97549051CFBF722F926
-:10F65000011C2060281CFBF71DF97149FBF71AF902
-:10F6600060600120DFE7FDF789FD6E498046FAF70B
-:10F67000DFFFFC218905FAF76DFCFBF789FA051C11
-:10F68000FBF7A6FA5F498146FAF7D2FF011C404614
-:10F69000FBF700F95D4980464846FAF7C9FF824604
-:10F6A00040461F2D25DCFF233A1C5F499A436B1E01
-:10F6B0009B005B589A421CD05146FBF7EBF88346FF
-:10F6C0005B46236059464046FBF7E4F85146FBF79A
-:10F6D000E1F8031C6060281C002EA4DA80221206C8
-:10F6E0005A44226080221206944663446360684252
-:10F6F00099E75146FBF7CEF8FB15FF211A1C029340
-:10F70000C30D0B408346D31A082BD9DD4349484625
-:10F71000FAF78EFF071C391C4046FBF7BBF8031CA9
-:10F72000191C039040469846FBF7B4F8391CFBF7C8
-:10F73000B1F83B49071C4846FAF77AFF391CFBF73A
-:10F74000A9F8824640465146FBF7A4F8FF22C30DB4
-:10F750001340029A8346D31A192B30DC039B206096
-:10F760009846AFE7FAF7F6FB0F233A1C9A43264B6D
-:10F77000051C9A4210D02549FAF7ECFB011C2060C9
-:10F78000281CFBF787F82149FAF7E4FB60600120A9
-:10F79000404248E703232CE72049FAF7DBFB2049E6
-:10F7A000051CFAF7D7FB011C2060281CFBF772F838
-:10F7B0001B49FAF7CFFB60600120404233E71B4949
-:10F7C0004846FAF735FF039B071C391C181C9A465C
-:10F7D000FBF760F8804650464146FBF75BF8391C62
-:10F7E000FBF758F81249071C4846FAF721FF391C65
-:10F7F000FBF750F8824640465EE7C046D80F493FC7
-:10F80000E3CB1640800FC93FD00FC93F4344353783
-:10F81000800F4943FFFF7F7F341B030000443537CF
-:10F8200008A3852E84F9223FB41A030000A3852E75
-:10F8300032318D242B49420070B5031C041C520840
-:10F840008A423BD8011C002A36D0002840DBC11573
-:10F85000254882420AD80130204240D100225B0074
-:10F8600001320342FBD00120821A891880225B02F8
-:10F870005B0A12047F391343CA0727D48022192058
-:10F880000025002649105B005204B4189C4202DC9B
-:10F89000A6181B1BAD1801385B0052080028F4D1D4
-:10F8A000002B02D001232B405D19FC239B059C46B5
-:10F8B0006D106544C9054919081C70BD211CFAF773
-:10F8C000B7FE211CFAF746FB011CF5E75B00D5E704
-:10F8D000FAF7E0FF011CFAF7B9FC011CECE7012282
-:10F8E0008918C3E7FFFF7F7FFFFF7F00F8B54F4612
-:10F8F0004646584B4500C0B46D08061C0F1C9D427F
-:10F9000048DCFBF745F9002800D19FE0311C301C92
-:10F91000FAF78EFE5049041CFAF78AFE4F49FAF7AF
-:10F9200019FB211CFAF784FE4D49FAF7B3FF211C9D
-:10F93000FAF77EFE4B49FAF70DFB211CFAF778FE29
-:10F940004949FAF7A7FF211CFAF772FE4749FAF76F
-:10F9500001FB211CFAF76CFE8046FC21201C890566
-:10F96000FAF766FE4146051C201CFAF761FE391CB9
-:10F97000041C301CFAF75CFE011C201CFAF78AFFFD
-:10F98000011C281CFAF786FF011CFE208005FAF7EF
-:10F9900081FF53E0311CFAF74BFE2F49041CFAF7A4
-:10F9A00047FE2E49FAF7D6FA211CFAF741FE2C49F8
-:10F9B000FAF770FF211CFAF73BFE2A49FAF7CAFA58
-:10F9C000211CFAF735FE2849FAF764FF211CFAF7E3
-:10F9D0002FFE2649FAF7BEFA211CFAF729FE244B1E
-:10F9E00080469D42B9DD234B9D422BDCFF231B0645
-:10F9F0009C46FE2065448005291CFAF74BFF814692
-:10FA0000FC21201C8905FAF713FE291CFAF742FF96
-:10FA10004146051C201CFAF70BFE391C041C301C47
-:10FA2000FAF706FE011C201CFAF734FF011C281C03
-:10FA3000FAF730FF011C4846FAF72CFF0CBC904641
-:10FA40009946F8BD0C4B0D4D9946D9E7FE2080052F
-:10FA5000F4E7C046FFFFFF314ED747ADF6740F31D4
-:10FA60007CF29334010DD037610BB63AABAA2A3D34
-:10FA70009999993E0000483F0000383F0000903EB1
-:10FA8000F0B5564644465F464D46F0B4DDB00190B1
-:10FA9000181C069166990893C04B8900C958031C2D
-:10FAA000013B181C0093D31E0C1C0591D917490F5C
-:10FAB000CB18DB10191CDB43DB171940CB43DB00F1
-:10FAC0009B180A9104930E1A071919D4679A0137E3
-:10FAD0009046B300BF009844002520AC08E04346A0
-:10FAE0005859FBF775F8605104350136BD4207D00F
-:10FAF000002EF4DA0020605104350136BD42F7D102
-:10FB0000059B002B00DA3DE3059B01339B009946E2
-:10FB1000089B9B009B460023984648AB9A465B4651
-:10FB2000043B0293009B002B00DA31E2029B00258C
-:10FB300043441C1C20AB9C464346019E1F1F64444B
-:10FB40006744216801CEFAF773FD011C281CFAF7FF
-:10FB500001FA043C051CBC42F3D1534642469D5079
-:10FB600004239C46E044C845DCD18D4A059D94465B
-:10FB70002B1C63449B000CA91A1C8C46D1460433F1
-:10FB80006244634409920B93AB009A464B4652463B
-:10FB90009E58002D27DD0CAB9846824BEC1843464F
-:10FBA000A8461D1CA4004C44EE21301C8905FAF720
-:10FBB0003FFDFAF7EDFFFBF70BF88721C905071C9E
-:10FBC000FAF736FD011C301CFAF764FEFAF7E0FF85
-:10FBD000216801C5381CFAF7BDF9043C47AB061C87
-:10FBE0009C42E1D14546049B301C191C9846FDF708
-:10FBF000CBFBF8218905041CFAF71AFDFDF7C2FAC0
-:10FC00008221C905FAF714FD011C201CFAF742FEF7
-:10FC1000041CFAF7BDFF071CFAF7DAFF011C201CD1
-:10FC2000FAF738FE4446061C002C00DC92E108215D
-:10FC30006A1E92000CAB9B58081B191C01417F18CF
-:10FC400081405B1A0CA98B500722121B13410293AF
-:10FC5000029B002B34DD0137002D00DC90E2802276
-:10FC600052000CAB00210024FF20944609E0002A3A
-:10FC700003D06446A21A01241A60013104338D4274
-:10FC800009DD1A68002CF2D0821A01311A600124B1
-:10FC900004338D42F5DC049B002B0EDD012B00D1DB
-:10FCA00062E1022B09D16B1E9B000CAAD258039271
-:10FCB0003F2203990A400CA9CA50029B022B73D021
-:10FCC000301C0021FAF762F8002800D186E0059B7D
-:10FCD000691E8B420FDC0CAA94460022314B0B9814
-:10FCE000EB189B0063441C68043B22438342FAD117
-:10FCF000002A00D0AAE1059B0CAA013B9B00D35827
-:10FD0000002B00D03AE20122099B043B59680132E2
-:10FD10000029FAD0AA186B1C079293423ADC009A89
-:10FD2000D718089BFF1A20AB9C46079BBF005B1BA4
-:10FD30009B0003930A9B67449C466544AB00029377
-:10FD400000239846679A029B94464344634458684C
-:10FD5000FAF73EFF5B46F850009B002B1CDB5B462E
-:10FD60000025019EFC18216801CEFAF761FC011CF8
-:10FD7000281CFAF7EFF8043C051CBC42F3D14346BB
-:10FD800053444B445D6004239C46039BE04404378A
-:10FD90009845D7D1079DF7E60025F0E74C1E0300F4
-:10FDA000FEFFFF3FFFFFFF3FFE20311C8005FAF7FB
-:10FDB00071FD061C002C00D182E7FE20049980050D
-:10FDC000FDF7E2FA011C301CFAF764FD061C301C3A
-:10FDD0000021F9F7DBFF002800D078E75346CA4638
-:10FDE0009946049B301C594207970095FDF7CCFAC1
-:10FDF0008721C905041CF9F7EDFF002800D1C7E1F0
-:10FE0000EE21201C8905FAF713FCFAF7C1FEFAF778
-:10FE1000DFFE8721C905051CFAF70AFC011C201C1E
-:10FE2000FAF738FDFAF7B4FE4A460CAB9850009B3F
-:10FE3000049A01330832281C9C0000930492FAF7BC
-:10FE4000A7FE0CAB1851FE2004998005FDF79CFA23
-:10FE5000009A061C131E00DAB4E0013398469B009A
-:10FE60005B420CA999468C4693001A1C019363448B
-:10FE70001C1C131C53441F1C00256059FAF7A8FED4
-:10FE8000311CFAF7D5FBEE2178518905301CFAF7C1
-:10FE9000CFFB043D061C4D45EFD134AB9B46C04B18
-:10FEA000B9469A4643460393059B00279846434626
-:10FEB000002B00DA84E0002F00DA81E03B1C0026F2
-:10FEC0004F4600250024994602E004354C450CDCE1
-:10FED000534679595859FAF7ABFB011C301CFAF715
-:10FEE00039F80134061CA045EFDA4B46B9461F1C11
-:10FEF0005A46BB00D65004235B429C46039B013705
-:10FF0000E144BB42D3D1669B022B00DDD9E0002B3C
-:10FF100000DDBBE014D1019B00205B441C1C216868
-:10FF2000FAF718F8009B043C5A1E0092F7D2029B85
-:10FF3000002B03D080231B069C466044069B186060
-:10FF40000720079B18405DB03CBC90469946A246EE
-:10FF5000AB46F0BD049B002B11D16B1E9B000CAA7D
-:10FF6000D3581B12029373E66B1E9B000CAAD25847
-:10FF700003927F2203990A400CA9CA509DE6FC21F6
-:10FF80008905F9F727FF00280DD10023029397E692
-:10FF90005346424600259D5004239C46E044C845F4
-:10FFA00000D0BFE5E1E5022301370293002D00DD1B
-:10FFB00055E6FE20311C8005FAF76CFC061C7FE636
-:10FFC000002695E7669B022B27DC002B03DC002034
-:10FFD000002BACD0B4E7029B0021002B66D080231D
-:10FFE000069A1B06CB1813603498FAF753FC009B53
-:10FFF000002B0BDD012435AD02CDF9F7ABFF009BE3
-:020000040002F8
-:100000000134A342F8DA029B002B03D080231B06A5
-:100010009C466044069B586092E734AB9B46669BC7
-:10002000032B00D08CE7029B0020002B00D19CE02A
-:10003000802212069446349B069A634413605B4602
-:100040005B68604463445360906079E707970F1CD6
-:10005000049B0A1C083B00910493191C0CA8BB00CC
-:10006000C358CA46002B00D0EDE64E483B1C8446E0
-:100070000CA8634484469B006344043B5868013ADF
-:1000800008390028F9D000920491DCE6019B002198
-:100090005B441C1C33AD081C2168043CF9F75AFF73
-:1000A000AC42F9D1029B011C002B98D1069B3498DD
-:1000B0001960FAF7EFFB009B002B9BDC069B586056
-:1000C0003EE7669B032B00D03AE7009B002BAADD9E
-:1000D0005B46019A9E58334A009B944663441C1C1D
-:1000E0009D0033AB9A46A0465D442C68301C211C11
-:1000F000F9F730FF071C391C201CFAF7CBFB011C59
-:10010000301CF9F727FF043DA8606F603E1C554581
-:10011000EBD1009B4446012B85DD5B46A400A04645
-:10012000019A1D199E582C68311C201CF9F712FFEA
-:10013000071C391C201CFAF7ADFB311CF9F70AFF2C
-:10014000043DA8606F603E1CAB45ECD144460020E6
-:1001500004345C4435AD2168043CF9F7FBFEAC4245
-:10016000F9D1029B002B00D062E7069B349A98607D
-:100170001A605A46526800925A60E1E60122C9E5C7
-:10018000002488E5089B9B009B4648AB9A46ECE41C
-:10019000201CFAF7FDFC4A460CAB985053E6C046CB
-:1001A000581E0300FFFFFF3FF8B54F4646469046F6
-:1001B000334A4300C0B4041C0F1C5B08934205DCA7
-:1001C000FAF7E6FC031C201C002B46D0211C201C47
-:1001D000FAF72EFA211C051CFAF72AFA2949061CFF
-:1001E000281CFAF725FA2849FAF754FB291CFAF7D4
-:1001F0001FFA2649F9F7AEFE291CFAF719FA244925
-:10020000FAF748FB291CFAF713FA2249F9F7A2FE7C
-:1002100043468146002B24D0FC21381C8905FAF77F
-:1002200007FA49468046301CFAF702FA011C40469C
-:10023000FAF730FB291CFAF7FBF9391CFAF72AFB0D
-:100240001549051C301CFAF7F3F9011C281CF9F7B5
-:1002500081FE011C201CFAF71DFB0CBC9046994640
-:10026000F8BD4946281CFAF7E3F90B49FAF712FBE7
-:10027000311CFAF7DDF9211CF9F76CFEEDE7C046F9
-:10028000FFFFFF31D3C92E2F342FD7321BEF383663
-:10029000010D50398988083CABAA2A3EF0B5564674
-:1002A00044465F464D46F0B4894B460083B0041C7B
-:1002B00088469246834676089E4211DCFAF768FC2F
-:1002C000002823D1534601331E4300D1EEE05346AC
-:1002D000012B00D1FAE0211C7E48F9F7B7FFB1E00D
-:1002E0007D4B9E4212DD002800DAE8E0211C7B48AD
-:1002F000FAF7D0FA4146041C7948FAF7CBFA011C08
-:10030000201CF9F727FE00239846041C211C201C02
-:10031000FAF78EF9071C391CFAF78AF9211C051C1B
-:10032000381CFAF785F96F498146281CFAF780F9DD
-:100330006D49F9F70FFE291CFAF77AF96B49F9F7BD
-:1003400009FE291CFAF774F96949F9F703FE291C1B
-:10035000FAF76EF96749F9F7FDFD291CFAF768F914
-:100360006549F9F7F7FD65490190281CFAF760F92E
-:100370006349F9F7EFFD291CFAF75AF96149F9F7D2
-:10038000E9FD291CFAF754F95F49F9F7E3FD291C47
-:10039000FAF74EF95D49F9F7DDFD291CFAF748F93E
-:1003A0005B49F9F7D7FD391CFAF742F9011C0198AE
-:1003B000F9F7D0FD4946FAF73BF94146F9F7CAFD8E
-:1003C000391CFAF735F94146F9F7C4FD5149051CC6
-:1003D0004846FAF72DF9291CF9F7BCFD071C391C12
-:1003E000201CF9F7B7FD3C4B051C9E4231DC5346FF
-:1003F000012B27D0291C060B3648F9F727FF3603B7
-:10040000211C8046050B301CFAF744FA2D03011C11
-:10041000381CFAF73FFA291CFAF70AF9291C041CC0
-:10042000301CFAF705F9FE218905F9F793FD011C47
-:10043000201CF9F78FFD4146FAF7FAF8011C281C39
-:10044000F9F788FD03B03CBC90469946A246AB46FE
-:10045000F0BD5046FAF7BCFB5B46061C981702231A
-:100460001840013B181AFAF7B3FB291C8046281CD8
-:10047000FAF7DEF8311C8146281CF9F76BFD011CE8
-:100480004846F9F7E3FE391CFAF704FA011C201C70
-:10049000FAF700FA011CF9F75DFD011C301CFAF7B0
-:1004A000F9F9011C4046FAF7C3F8CBE7201CFCF72A
-:1004B00065FE011CFE208005F9F7C8FEC2E7802317
-:1004C0001B069C464344644498460FE7201CB9E74A
-:1004D000FFFF7F31000080BF3FA12C3FDA0F493F73
-:1004E000682122335FAE9BB745F4A338C8261A3A79
-:1004F00016696B3BA427B33C8988083E8453D937DF
-:100500007AC09538B937813948DEBE3A1F37113C79
-:10051000D10D5D3DABAAAA3EF8B556464D464446C0
-:100520005F46A54BF0B44E00804689468A46760861
-:100530009E420CDDA14B9E4200DDA0E000D19BE07D
-:100540005346002B00DCDEE09D4B9E4A9FE09E4B15
-:100550009E4200DDB1E09D4B9E4200DC9FE0012306
-:100560005B429B4642464B4640464946FBF726FBCC
-:10057000061C0F1C321C3B1CFBF720FB041C0D1C33
-:10058000934A944BFBF71AFB934A944BFAF7B0FB50
-:10059000221C2B1CFBF712FB914A924BFAF7A8FB8B
-:1005A000221C2B1CFBF70AFB8F4A904BFAF7A0FB8F
-:1005B000221C2B1CFBF702FB8D4A8E4BFAF798FB93
-:1005C000221C2B1CFBF7FAFA8B4A8C4BFAF790FB98
-:1005D000321C3B1CFBF7F2FA894A8A4B061C0F1CA3
-:1005E000201C291CFBF7EAFA874A884BFBF780FDA1
-:1005F000221C2B1CFBF7E2FA854A864BFBF778FDA1
-:10060000221C2B1CFBF7DAFA834A844BFBF770FDA4
-:10061000221C2B1CFBF7D2FA814A824BFBF768FDA8
-:10062000221C2B1CFBF7CAFA0B1C5946021C013179
-:1006300000D170E05946301CCC00391CFAF758FB49
-:1006400042464B46FBF7BAFA774D784B2D191C19E9
-:1006500022686368FBF74CFD42464B46FBF748FDBA
-:10066000021C0B1C28686968FBF742FD53460A1CF4
-:10067000002B4BDB031C0AE0002800D160E7424658
-:100680004B4640464946FAF733FB031C0A1C181C2C
-:10069000111C3CBC90469946A246AB46F8BD644A44
-:1006A000644BFAF725FB0022634BF9F74FFB002858
-:1006B00000D154E743464A46E9E700F0CBF85F4BE8
-:1006C000041C0D1C9E4237DC5D4B9E425DDC221CEF
-:1006D0002B1CFAF70DFB0022574BFBF709FD80237B
-:1006E000061C0F1C0022DB05201C291CFAF700FB4E
-:1006F0000B1C021C391C301CFAF722FE002380461A
-:1007000089469B462EE72E4B4E4AC0E780221206B2
-:10071000031C8A18BBE7301C391CFAF7E9FA424679
-:100720004B46FBF74BFA021C0B1C40464946FBF7B5
-:10073000DFFC031C0A1CAAE7434B9E421ADC002282
-:10074000424BFBF7D5FC0022061C0F1C3F4B201C24
-:10075000291CFBF733FA0022374BFAF7C9FA0B1CB6
-:10076000021C391C301CFAF7EBFD02238046894637
-:100770009B46F7E62B1C00203549221CFAF7E0FDCA
-:100780000323804689469B46ECE600222A4BFBF772
-:10079000AFFC0022061C0F1C274B201C291CFAF75B
-:1007A000A7FA0B1C021C391C301CFAF7C9FD0123E7
-:1007B000804689469B46D5E6FFFF0F440000F07F48
-:1007C000182D4454FB21F93FFFFFDB3FFFFF1F3E85
-:1007D00011DA22E33AAD903FEB0D76244B7BA93F33
-:1007E000513DD0A0660DB13F6E204CC5CD45B73F01
-:1007F000FF8300922449C23F0D5555555555D53FAD
-:100800002F6C6A2C44B4A2BF9AFDDE522DDEAD3FA0
-:100810006D9A74AFF2B0B33F711623FEC671BC3F40
-:10082000C4EB98999999C93F00B90200E0B8020059
-:100830009C7500883CE4377E0000F03FFFFFF23FEC
-:10084000FFFFE53FFB21F9BFFF7F03400000F83FBA
-:100850000000F0BF49004B08191C70470A1C031C1C
-:10086000024330B50220002A00D130BD802212069A
-:10087000914216D00C4A04208C180C4A9442F4D9A8
-:100880000B4C0C199442F0D90A4A4900490803203C
-:100890009142EAD9064A00209142E6D15842584195
-:1008A000E3E7002BE1D0EFE70000F0FFFFFFDF7F81
-:1008B0000000F07FFFFF0F0000207047002001497B
-:1008C0007047C0460000F87FF0B5474680B44B0043
-:1008D0004A4A5B0D9D1882B0071C0C1CCE0F132DCD
-:1008E00039DC002D59DB464F021C2F413B1C0B40CD
-:1008F00003439C46B84667460B1C002F25D0434651
-:100900005B081A1C0A4010430027002808D0132D4A
-:1009100000D16FE099438023DB022B4119430C1C6B
-:100920003849F6008E19231C346875683A1C201C5F
-:10093000291CFAF7DDF90090019100980199221C19
-:100940002B1CFBF7D5FB021C0B1C101C191C02B046
-:1009500004BC9046F0BD332D0BDD0B1C8021021C26
-:10096000C9008D42F1D1211CFAF7C2F9021C0B1CFF
-:10097000EBE7254A9D1801235B42EB409C460B1C8C
-:100980006146021C0142E0D04B080342C8D08027D8
-:10099000FF052F4198430743C2E74C006408044316
-:1009A000021C0B1C002CD0D00903090B01434A4246
-:1009B00011438022090B12035B0C11405B04021CE3
-:1009C000194310480B1CF10041180C684D68201C9D
-:1009D000291CFAF78DF90090019100980199221CC9
-:1009E0002B1CFBF785FB4B005B08F6071E43021C24
-:1009F000331CAAE780273F068CE7C04601FCFFFFB7
-:100A0000FFFF0F0020B90200EDFBFFFF4000C90F00
-:100A1000C90740080843704743000020024A5B08AA
-:100A20009A4240417047C046FFFF7F7F00487047B1
-:100A30000000C07F054B10B5041C181E05D0131C08
-:100A400002200A1C211C07F065FB10BD1581020065
-:100A5000014B18687047C046F0000020084B10B5E5
-:100A6000041C002B02D0002100E000BF054B1868D9
-:100A7000836A002B00D09847201C08F0A6F8C046D7
-:100A800000000000E41E030070B5051C0C1E01D11F
-:100A9000002049E0002804D08369002B01D100F038
-:100AA000F9F8224B9C4201D16C6808E0204B9C4233
-:100AB00001D1AC6803E01F4B9C4200D1EC680C22D2
-:100AC000A35E002BE4D0281C211C0AF067FA236BDC
-:100AD000061C002B06D0281C216A9847002801DA42
-:100AE00001267642A3891B0603D5281C216900F044
-:100AF000FBFA616B002908D0231C4433994202D0D1
-:100B0000281C00F0F1FA00236363A16C002904D0D3
-:100B1000281C00F0E9FA0023A3640AF0DEFA00239F
-:100B2000A3810AF0DBFA301C70BDC046841E0300AE
-:100B3000A41E0300C41E030008B5034B011C186863
-:100B4000FFF7A2FF08BDC046F000002038B50B69D2
-:100B5000051C0C1C002B01D100201CE0002804D037
-:100B60008369002B01D100F095F80B4B9C4201D119
-:100B70006C6808E0094B9C4201D1AC6803E0084B6B
-:100B80009C4200D1EC680C22A35E002BE4D0281C10
-:100B9000211C0AF003FA38BD841E0300A41E0300C2
-:100BA000C41E030008B5011E05D1054B0549186890
-:100BB0000AF0B5FA03E0044B1868FFF7C7FF08BD59
-:100BC000E41E03004D0B0200F000002038B5051CA8
-:100BD0000C1C002804D08369002B01D100F05AF8C6
-:100BE0000E4B9C4201D16C6808E00D4B9C4201D138
-:100BF000AC6803E00B4B9C4200D1EC686368013B9E
-:100C00006360002B04DA281C211C01F00BF803E0C0
-:100C100023685A1C2260187838BDC046841E030021
-:100C2000A41E0300C41E030008B5034B011C186872
-:100C3000FFF7CCFF08BDC046F000002008B5024910
-:100C40000AF06DFA08BDC0464D0B0200002310B536
-:100C5000041C03604360836081814366C281036139
-:100C600043618361191C08225C300AF0B0FA054B1D
-:100C700024626362044BA362044BE362044B23636C
-:100C800010BDC046491E0200711E0200A91E0200CE
-:100C90009DB30200836913B5002B28D18364C3641C
-:100CA0000365134B134A1B6882620193984201D17A
-:100CB00001238361041C00F01FF86060201C00F019
-:100CC0001BF8A060201C00F017F80421E06000224F
-:100CD0006068FFF7BBFFA06809210122FFF7B6FF9C
-:100CE000E06812210222FFF7B1FF0123A36113BDC7
-:100CF000E41E03003D0C0200F8B51D4B061C1D68E8
-:100D0000AB69002B02D1281CFFF7C4FF4835AC6843
-:100D10006B68013B05D40C22A75E002F10D068340D
-:100D2000F7E72B68002B06D1301C04210AF0BFF92D
-:100D30002860002801D02D68E9E70C23336016E015
-:100D40000123201C5B42E3810233A3816766276095
-:100D5000A760676027616761A7615C30391C082262
-:100D60000AF035FA201C6763A763A764E764F8BD3F
-:100D7000E41E030038B5074B074C1D1CE41AA410F1
-:100D8000002C04D0013CA300EB589847F8E70AF088
-:100D900009FC38BD2401002028010020F7B50F1CF4
-:100DA000111C01AA051C0AF032FB061E01D1002409
-:100DB00027E0281CFFF7A0FF041EF8D0DB23281C27
-:100DC000391C019A5B0000F0ADFD002806DA002511
-:100DD0000AF083F9A5810AF081F9E8E70A4BE0817E
-:100DE00063620A4BA681A362094B2462E362094B4A
-:100DF0002363F30505D5281C211C002202230AF0D9
-:100E00006EF9201CFEBDC046491E0200711E020084
-:100E1000A91E02009DB3020008B5031C0A1C034969
-:100E20000868191CFFF7BAFF08BDC046F000002093
-:100E300070B5051C0E1C141C002804D08369002BFF
-:100E400001D1FFF727FF0A4B9C4201D16C6808E0F3
-:100E5000084B9C4201D1AC6803E0074B9C4200D197
-:100E6000EC68281C311C221C00F08AFD70BDC046B5
-:100E7000841E0300A41E0300C41E030008B5031C47
-:100E80000A1C03490868191CFFF7D2FF08BDC046B9
-:100E9000F0000020F7B5051C0C1C01921E1C002858
-:100EA00004D08369002B01D1FFF7F4FE414B9C4233
-:100EB00001D16C6808E0404B9C4201D1AC6803E072
-:100EC0003E4B9C4200D1EC688422A389520013401F
-:100ED000934203D1281C211CFFF738FEE36A0093DC
-:100EE000002B01D11D3331E0012E05D0022E31D06F
-:100EF0001623002E2AD12DE0281C211CFFF726FEE8
-:100F00008023A2895B011A4001D0606D06E0331C8A
-:100F1000281C216A009EB047431C18D0A3895A0799
-:100F200007D56368C01A636B002B0AD0236CC01A04
-:100F300007E01B0705D52368002B02D022699B1A06
-:100F4000C018019B00261B18019303E02B600127AA
-:100F50007F422DE02369002B03D1281C211C00F0C7
-:100F600057F8281C211CFFF7F1FD071EEFD1331C99
-:100F7000281C216A019A009EB047431CE7D0616B90
-:100F8000002908D0231C4433994202D0281C00F0C9
-:100F9000ABF8002363630021201C2369A28923602E
-:100FA000074B61601340A3815C3008220AF00FF9FF
-:100FB000381CFEBD841E0300A41E0300C41E0300D3
-:100FC000DFF7FFFF0E4B70B500251E1C0D4CE41A19
-:100FD000A410A54204D0AB00F35898470135F8E7B8
-:100FE0000AF0DAFA084B00251E1C084CE41AA4107B
-:100FF000A54204D0AB00F35898470135F8E770BD1F
-:101000001001002010010020100100202401002008
-:10101000F0B58B8991B09B0706D50B1C47330B604D
-:101020000B6101234B6145E00C1C0E23C95E061CBD
-:10103000002904DA8023A5891D4010D10CE001AA03
-:1010400001F098F90028F5DBF023029D1B021D40FA
-:10105000194BED186B425D418027FF0001E0002530
-:101060004027301C391C00F085F800280CD1A389DA
-:101070009A051FD402221343A381231C4733236004
-:1010800023610123636115E080220C4BB362A389C5
-:1010900020601343A38120616761002D0AD00E23D5
-:1010A000E15E301C01F078F9002803D00122A38909
-:1010B0001343A38111B0F0BD00E0FFFF3D0C02001F
-:1010C00008B5034B011C186800F054F808BDC04671
-:1010D000F000002008B5034B011C186800F004F86C
-:1010E00008BDC046F000002030B500293ED00439CC
-:1010F0000B68002B00DAC9181D4A1368141C002B5A
-:1011000002D14B60116031E099420DD208680A1893
-:101110009A4203D11368C3180B6053684B60216077
-:1011200024E08A4203D8131C5A68002AF9D11D68AA
-:101130005C198C420BD109686918581819609042E3
-:1011400014D110685268091819605A600EE08C4278
-:1011500002D90C23036009E008680C18944203D1FB
-:1011600014685268001908604A60596030BDC04672
-:10117000DC2D0020032370B5CC1C9C430834051CD7
-:101180000C2C01D20C2405E0002C03DA0C230020E7
-:101190002B6042E08C42F9D3204A1368101C191CC2
-:1011A000002913D00A68121B0DD40B2A02D90A6039
-:1011B0008B181FE08B4202D15A6802601BE04A681C
-:1011C0005A600B1C17E00B1C4968E9E7144E3368A2
-:1011D000002B03D1281C00F055FD3060281C211C79
-:1011E00000F050FD031C421CD0D00322C61C9643C5
-:1011F00086420AD11C60181C07210B301A1D884337
-:10120000821A0AD05142995007E0311A281C00F086
-:1012100039FD431CBAD0331CECE770BDDC2D002037
-:10122000D82D0020F0B59FB0061C0F1C029205932C
-:10123000002804D08369002B01D1FFF72BFD794BE7
-:101240009F4201D1776808E0774B9F4201D1B76890
-:1012500003E0764B9F4200D1F768BB891B070AD594
-:101260003B69002B07D0002306AD6B6120336B7602
-:101270001033AB763DE0301C391C00F0F5FF002840
-:10128000F1D001204042CAE0059A111D1268059173
-:10129000002A7EDB0992013423782E2B00D189E0CD
-:1012A00021786348032209F05BFF002808D0604BD7
-:1012B0000134C01A40238340181C2B68184328604F
-:1012C0002178631C5B4806220293297609F048FFC7
-:1012D000002800D191E0584B002B00D084E0072279
-:1012E000059B07339343083305936B69039A9B1857
-:1012F0006B61029C2378002B04D1029BE31A0493B8
-:1013000011D003E0252BF8D00134F3E7049B301C07
-:10131000391C029A09F078FF431C7BD06A69049B50
-:10132000944663446B612378002B73D00122002321
-:1013300052426A6002A95432521801342B60EB60A9
-:10134000AB601370AB6521783C48052209F008FFBB
-:10135000002809D0394B0134C01A01238340181CDE
-:101360002B6818432860EEE72B68DA0604D5532271
-:10137000202102A8121811701A0704D553222B211C
-:1013800002A81218117022782A2A00D17CE7099B42
-:1013900005E05242EA60022213432B607BE7227889
-:1013A000303A092A04D80A214B4301349B18F6E746
-:1013B000099371E763782A2B09D1059B02341A1D22
-:1013C0001B680592002B0DDA01235B420AE0002323
-:1013D00001342278303A092A04D80A214B430134D7
-:1013E0009B18F6E707935BE705AB0093301C291CBD
-:1013F0003A1C134B00E000BF07E005AB0093301C24
-:10140000291C3A1C0E4B00F01DF80390039B01337E
-:1014100000D06AE7BB895B0600D532E70B981FB0A6
-:10142000F0BDC046841E0300A41E0300C41E0300BA
-:101430008BAF03008FAF03000000000085AF0300F7
-:1014400009B20200F0B58BB006920A1C4332079332
-:10145000059004920A7E0C1C109B6E2A00D1A8E015
-:1014600011D8632A22D009D8002A00D1B2E0582A24
-:1014700000D0C2E045310A707C4A4FE0642A1DD09A
-:10148000692A1BD0B9E0732A00D1A7E009D86F2AD6
-:1014900029D0702A00D0B0E0202209680A432260D7
-:1014A00037E0752A1FD0782A33D0A6E00E1C1A68C0
-:1014B0004236111D196013683370A1E021681A6863
-:1014C000080606D4490604D5111D19600023D55E0F
-:1014D00002E0111D19601568002D3BDA2D23049AD6
-:1014E0006D42137036E021681A68080606D4490672
-:1014F00004D51568111D1960ADB202E0111D196007
-:1015000015685A4B227E03930A276F2A1DD108279C
-:101510001BE0221C782145321170554A196803924C
-:10152000081D226818600D68100602D4500600D508
-:10153000ADB2D30702D520231A4322601027002D15
-:1015400003D1202322689A432260231C00224333C4
-:101550001A7002E00A27454B03936368A360002BCF
-:1015600003DB0422216891432160002D02D1049EF7
-:10157000002B0ED0049E281C391CF8F7C1FA039BDF
-:10158000013E5B5C281C3370391CF8F733FA051EEA
-:10159000F1D1082F09D12368DB0706D563682269DA
-:1015A000934202DC3023013E3370049B9B1B23617A
-:1015B0002BE009681A68080607D4490605D5111DED
-:1015C00019601368A28A1A8004E0111D196013685B
-:1015D00062691A600023049E236116E01A68111DD7
-:1015E000196016680021301C626809F0B9FD0028F6
-:1015F00001D0801B6060636803E0261C42363270B5
-:10160000012323610023049A1370079B059800931C
-:10161000211C069B09AA09F009FE431C02D10120E6
-:10162000404221E0236905980699321C079DA8478E
-:10163000431CF4D023689B0705D4099BE0689842BB
-:1016400012DA181C10E00025E368099A9B1A9D42E3
-:10165000F3DA221C0123059806991932079EB04738
-:10166000431CDCD00135EFE70BB0F0BD96AF0300B3
-:10167000A7AF0300F7B5151C8A6801900C1C002A5F
-:1016800006D18A69511E8A41012152420A43A26051
-:101690002268D20603D41A68111D19601768002643
-:1016A000A06900281DD123680136DB0603D42B680E
-:1016B0001B783B7001372A686B6801322A60A26888
-:1016C000013B013A6B60A260002A1FD0002BE7DCCF
-:1016D000C0235B00E3580198291C98470028DFD0FD
-:1016E00014E0012808D12B6862691B78D35C002BB9
-:1016F000D9D1002E19D009E0022807D12B680B4A56
-:101700001B781268D3185B781B07CCD5102322688E
-:10171000134006D1E2680132E260A269002A00D0DB
-:101720003B70002023699E192661FEBDF400002055
-:10173000F0B50C1C8BB00193744B0490161C07AAD7
-:1017400023CB23C2724B0593A369032B01D0714BAA
-:1017500005930022A36803925D32591EFF32914225
-:1017600005D95E3BFF3B03935E23FF33A360231C3D
-:101770001C330093D023002722681B0113432360EE
-:10178000009B02933268BB00117807AA9858022286
-:1017900009F0E6FC002839D0012F0DD16368002B39
-:1017A00006D1083322686360F933FF3313432360A3
-:1017B000594B226813400DE0022F0CD1C02280212A
-:1017C0002368D2001A4089008A4222D11022626026
-:1017D000F03213432360A3685A1EA260002B15D079
-:1017E000029B5D1C33685A1C32601B78029A02957A
-:1017F00013707368013B7360002B07DCC0235B0030
-:10180000E3580498311C9847002844D10137032F2E
-:10181000B8D16368002B01D10A336360102100271F
-:1018200063686069C91A3D4BC91809F079FD029DCA
-:10183000A368002B30D0326860691178405C0028C2
-:101840002AD030290BD12168090508D5039A013720
-:10185000002A0BD0013A01330392A36006E021680D
-:101860002F4B0B40236013782B7001357368013BBD
-:101870007360002B03DD33680133336007E0C0235E
-:101880005B00E3580498311C9847002804D1A368F2
-:10189000013BA360CCE700272368DB050ED5009B46
-:1018A0009D4207D9BE23013D5B002978E358049887
-:1018B000321C9847009B01209D4225D010222368AE
-:1018C0001A401AD12A70636804980099059EB0479F
-:1018D000019B22681B68910607D4D10705D50199A1
-:1018E0001A1D0A601B68188004E001991A1D0A601D
-:1018F0001B681860E3680133E3600020009BED1A69
-:101900002369ED195D1925610BB0F0BDE81E0300D8
-:10191000D51E020011200200FFFAFFFFB8AF03003E
-:10192000FFF6FFFF38B5051C0020074C2060081C9F
-:10193000111C1A1CF3F710FC431C03D12368002B65
-:1019400000D02B6038BDC046D42F00200FB40B4B05
-:1019500013B51C68002C05D0A369002B02D1201CF4
-:10196000FFF798F905AB201CA168049A0193FFF7D3
-:1019700059FC16BC08BC04B01847C046F000002053
-:1019800070B5051C0E1C141C002804D08369002BA4
-:1019900001D1FFF77FF9154B9C4201D16C6808E03B
-:1019A000134B9C4201D1AC6803E0124B9C4200D126
-:1019B000EC68A368013BA360002B10DAA269934294
-:1019C00007DB23681E70236819780A290AD1281CAE
-:1019D00001E0281C311C221C00F0DAFB05E0236822
-:1019E0001E7023685A1C2260187870BD841E030084
-:1019F000A41E0300C41E030070B5051C0E1C0028A5
-:101A000004D08369002B01D1FFF744F9AB69AC68BE
-:101A1000002B02D1281CFFF73DF9324B9C4201D12B
-:101A20006C6808E0304B9C4201D1AC6803E02F4B5E
-:101A30009C4200D1EC68A3891B0702D52369002BC7
-:101A400019D1281C211C00F00FFC002813D0012004
-:101A5000404245E03178002B1BDAA269934211DA4B
-:101A6000221C281C00F094FB013042424241D0B2BB
-:101A70000028ECD10136A3683278013BA360002A2C
-:101A8000E8D10CE023681970236819780A2903D17A
-:101A9000E6E723681970236801332360EAE7002B27
-:101AA00017DAA269934208DB0A23226813702368BD
-:101AB00019780A2911D1281C01E0281C0A21221CAE
-:101AC00000F066FB013042424241D0B2002806D00D
-:101AD000BDE70A23226813702368013323600A20BC
-:101AE00070BDC046841E0300A41E0300C41E030074
-:101AF00008B5034B011C1868FFF77EFF08BDC04600
-:101B0000F0000020F8B5051C0C1C002804D08369E7
-:101B1000002B01D1FFF7BEF83D4B9C4201D16C6810
-:101B200008E03C4B9C4201D1AC6803E03A4B9C423C
-:101B300000D1EC680023A289636093B2990663D454
-:101B400059071AD4D90605D409232B6037331A4311
-:101B5000A28159E0082633420AD0281C211CFEF736
-:101B6000F5FF002850D1A389A060B343A381A061F1
-:101B70000422A3891343A38112E0616B00290FD0D3
-:101B8000231C4433994202D0281CFFF7ADFA0020F1
-:101B9000236C60636360834202D0E36B236035E0B3
-:101BA0002369002B03D1281C211CFFF731FAA789D8
-:101BB000BEB2B3070FD00123A381184B1849186890
-:101BC00009F091FA0923A7813340092B03D1281C7E
-:101BD000211C09F0E3F92369281C1A1C2360216ADF
-:101BE0006369656AA847021C6060002082420DDCC0
-:101BF000A389824204D120221343A381013805E046
-:101C0000402213436060A38101204042F8BDC046DA
-:101C1000841E0300A41E0300C41E0300E41E030070
-:101C200009B3020038B5051C0C1C002804D08369D8
-:101C3000002B01D1FFF72EF80F4B9C4201D16C68AD
-:101C400008E00E4B9C4201D1AC6803E00C4B9C4277
-:101C500000D1EC68281C211CFFF754FF002807D195
-:101C60006368013B636023685A1C2260187801E0B6
-:101C70000120404238BDC046841E0300A41E03005C
-:101C8000C41E030038B50023064C051C081C236045
-:101C9000F3F75AFB431C03D12368002B00D02B60C1
-:101CA00038BDC046D42F0020F7B51E1C3C4B041C89
-:101CB0001D680F1C0192002D05D0AB69002B02D1CD
-:101CC000281CFEF7E7FF374B9C4201D16C6808E007
-:101CD000354B9C4201D1AC6803E0344B9C4200D1AF
-:101CE000EC68019B022B58D8002E56DB281C211CC7
-:101CF000FEF72CFF00236360A361A3891B0603D5B5
-:101D0000281C2169FFF7F0F98322A3899343A3815B
-:101D1000019B022B13D0002F25D1002E01D180264C
-:101D2000F600301CFFF7CCF9071E18D18020C00048
-:101D3000FFF7C6F9071E10D10120404200E0002045
-:101D40000222A3891343A3810023A360231C4733EA
-:101D5000236023610123636121E08026F600802255
-:101D6000A3891343A381019B012B05D1A389019A68
-:101D70001A437342A281A3610D4B0020AB62A2897A
-:101D8000276027616661130709D503231A40534270
-:101D900053415B421E40A66001E001204042FEBD6F
-:101DA000F0000020841E0300A41E0300C41E0300D4
-:101DB0003D0C02000EB410B59DB002A9029008615E
-:101DC0000B48822488604861012040421FABC881D3
-:101DD000084804CBA400006801938C8100F062FBEA
-:101DE0000023029A13701DB010BC08BC03B0184742
-:101DF000FFFFFF7FF00000200EB4812370B59DB07F
-:101E000002AC21AD9B0040CDA3810290069009F069
-:101E1000E3FA0B4B6060636200236363A364013BDE
-:101E2000E381084B6061211C1868321C2B1C019552
-:101E300000F02EFC1DB070BC08BC03B01847C046B3
-:101E400099B30200F000002038B50C1C0E25495F44
-:101E500000F096FD002803DB636D1B18636503E04B
-:101E6000A289024B1340A38138BDC046FFEFFFFF9C
-:101E7000F8B51E1C8B89051C0C1C171CDB0505D531
-:101E80000E23C95E0022022300F098FAA289054BB6
-:101E9000281C1340A3813A1C0E23E15E331C00F082
-:101EA000CFF9F8BDFFEFFFFF38B50C1C0E25495FD9
-:101EB00000F084FAA389421C03D1054A1340A38190
-:101EC00004E0802252011343A381606538BDC046FF
-:101ED000FFEFFFFFF0B51E1C444B87B01B68059059
-:101EE00002930B1C039101921C78029A5D1C12193B
-:101EF00050780822104001D02B1CF5E72D2C04D17E
-:101F00009D1C5C780123009304E000902B2C01D1F0
-:101F10005C789D1C002E02D0102E0AD160E0302C7F
-:101F20005CD120222B789343582B52D110266C7809
-:101F30000235009F311C7B1E9F412D4BFF18381C22
-:101F4000F7F7DEFD381C0491311CF7F753FD002232
-:101F5000071C131C029909194978480701D5303C20
-:101F600007E00320084017D03721012800D0203196
-:101F7000641AB44210DA511C0BD0BB4207D802D10C
-:101F8000049A944203DC73430122E31801E0012226
-:101F900052422C780135DDE7181C511C0BD10098FA
-:101FA000059A431E9841124BC01822231360019BCF
-:101FB000002B0AD117E00099002900D05842019B5C
-:101FC000002B10D0039B002A00D06B1E019A1360D7
-:101FD00009E03024002EACD10826AAE70A26A8E79B
-:101FE000302CA6D19DE707B0F0BDC046F40000201C
-:101FF000FFFFFF7F38B5051C0C1C131C034A291C6E
-:102000001068221CFFF766FF38BDC046F0000020B4
-:10201000F0B51E1C3E4B87B01B68171C02930B1CAF
-:10202000059004911C78029A5D1C121951780822BF
-:102030000A4001D02B1CF5E72D2C04D19D1C5C78A7
-:102040000123019304E001922B2C01D15C789D1CAB
-:10205000002E02D0102E0AD154E0302C50D1202274
-:102060002B789343582B46D110266C7802350120EB
-:10207000311C4042F7F7BEFC03900120311C404266
-:10208000F7F73EFD00228C46131C02990919497886
-:10209000480701D5303C07E00320084017D037211E
-:1020A000012800D02031641AB44210DA511C0BD040
-:1020B000039A934206D801D1644503DC734301229D
-:1020C000E31801E0012252422C780135DDE7181CAB
-:1020D000511C04D122230599101C0B6003E00199C7
-:1020E000002900D05842002F0FD0049B002A00D0B6
-:1020F0006B1E3B6009E03024002EB8D10826B6E7FD
-:102100000A26B4E7302CB2D1A9E707B0F0BDC0462B
-:10211000F40000200B1CF7B54D6B44330C1C9D42A2
-:102120001BD18026F600311CFFF724F8002802D1CD
-:102130000120404225E0231C6063A66346331A78E1
-:10214000104BC254231C45331A780F4BC2542A78C3
-:102150000E4BC254C018206012E08E6B291C730015
-:102160001A1C019309F08BF9051EE1D08719381C60
-:10217000291C321C09F00EF8019B27606563A363DC
-:102180000020FEBDFF030000FE030000FD03000071
-:1021900070B5051C0E1C141C002804D08369002B8C
-:1021A00001D1FEF777FD234B9C4201D16C6808E01A
-:1021B000214B9C4201D1AC6803E0204B9C4200D1F2
-:1021C000EC68A369A360A3891B070AD52369002BC8
-:1021D00007D023682269F6B2981A636998420FDB28
-:1021E00008E0281C211C00F03FF80028F1D0012055
-:1021F00040421DE0281C211CFEF7A8FC0028F6D157
-:10220000A3680130013BA36023685A1C22601E7042
-:102210006369984205D0A389301CDB0708D50A2ED4
-:1022200006D1281C211CFEF791FC0028DFD1301CB0
-:1022300070BDC046841E0300A41E0300C41E03001C
-:1022400038B5051C0020074C2060081C111C1A1C06
-:10225000F3F704F8431C03D12368002B00D02B6054
-:1022600038BDC046D42F0020354B70B51D68061C04
-:102270000C1C002D05D0AB69002B02D1281CFEF7E9
-:1022800009FD304B9C4201D16C6808E02E4B9C420A
-:1022900001D1AC6803E02D4B9C4200D1EC68A389CE
-:1022A0009AB2110723D4D10607D409220120326043
-:1022B00037321343A381404240E0530713D5616B8B
-:1022C000002908D0231C4433994202D0301CFEF769
-:1022D0000BFF002363632422A3899343A38100237C
-:1022E0006360236923600822A3891343A3812369C0
-:1022F000002B0BD1A023A2899B00134080229200C7
-:10230000934203D0301C211CFEF782FE0123A289D8
-:10231000134005D00023A36063695B42A36103E01F
-:10232000910700D46369A36000202369834205D12B
-:10233000130603D540231A43A281013870BDC0465D
-:10234000F0000020841E0300A41E0300C41E03002E
-:1023500038B50023064C051C081C2360F2F768FF03
-:10236000431C03D12368002B00D02B6038BDC0462E
-:10237000D42F002038B50023064C051C081C111C66
-:10238000236006F002FC431C03D12368002B00D01D
-:102390002B6038BDD42F002038B50023064C051C17
-:1023A000081C2360F2F7A8FF431C03D12368002B0D
-:1023B00000D02B6038BDC046D42F002038B5051C96
-:1023C0000020074C2060081C111C1A1CF2F7A8FF03
-:1023D000431C03D12368002B00D02B6038BDC046BE
-:1023E000D42F0020F0B58E6885B0071C0C1C03921A
-:1023F0000193B34245D390238A89DB001A423DD032
-:1024000003250969236801985B1A029363695D4398
-:10241000EB0F5D19029B6D1001331B189D4200D21A
-:102420001D1C381C53050FD5291CFEF7A3FE061EE4
-:1024300013D0029A216908F0ADFEA289184B13400F
-:1024400080221343A38111E02A1C09F018F8061E0C
-:102450000CD1381C2169FEF747FE0C2340220120D5
-:102460003B60A38940421343A38117E0029B26618E
-:10247000F61826606561019EED1AA560019BB342C6
-:1024800000D2019E321C2068039908F08CFE0020C7
-:10249000A3689B1BA36023689E19266005B0F0BD4E
-:1024A0007FFBFFFFF0B59FB0029005938B890E1C58
-:1024B000171C1B0610D50B69002B0DD14021FEF710
-:1024C00059FE30603061002804D10C23029A013893
-:1024D0001360D0E040237361002306AD6B612033AD
-:1024E0006B761033AB763C1C2378002B03D1E31BB7
-:1024F000049312D003E0252BF9D00134F4E7049BB8
-:102500000298311C3A1CFFF76DFF431C00D1ACE070
-:102510006A69049B944663446B612378002B00D165
-:10252000A3E00122002352426A6002A954325218E9
-:1025300001342B60EB60AB601370AB654F4F2178BB
-:10254000381C052208F00CFE002808D0C01B01270B
-:102550008740381C2B68013418432860EEE72B684D
-:10256000DA0604D55322202102A8121811701A0786
-:1025700004D553222B2102A81218117022782A2A7E
-:1025800001D0099B0EE0059A111D12680591002AE1
-:1025900001DB099204E05242EA60022213432B60FD
-:1025A000013409E02278303A092A04D80A214B4341
-:1025B00001349B18F6E7099323782E2B18D1637802
-:1025C0002A2B09D1059B02341A1D1B680592002B8A
-:1025D0000DDA01235B420AE0002301342278303A0D
-:1025E000092A04D80A214B4301349B18F6E70793C4
-:1025F000234F2178381C032208F0B2FD002807D0B1
-:10260000C01B40278740381C2B68013418432860C2
-:1026100021781C480622671C297608F0A1FD0028B5
-:1026200012D0194B002B06D10722059B0733934389
-:102630000833059314E005AB00930298291C321C63
-:10264000124B00E000BF07E005AB00930298291C85
-:10265000321C0E4BFEF7F6FE0390039B013304D0B1
-:102660006B69039A9B186B613DE7B3890B985B0616
-:1026700001D5012040421FB0F0BDC04685AF030028
-:102680008BAF03008FAF030000000000E5230200C2
-:10269000F0B5B54C071CA54403930023862048934E
-:1026A000499305AB4A93BE2340000D1C019202A939
-:1026B000AE4A5B000918CA50AD4A02A90433091892
-:1026C000CA50019B1C78002C00D144E1A94E33680C
-:1026D0001B195A780823134023D06B68002B10DD98
-:1026E0002B6831681A788A185278120715D5499ADA
-:1026F00001330292013249926A682B60013A6A60A2
-:10270000EBE78621C023490002AA52185B00D35888
-:10271000381C291C98470028E2D0019E01360196FA
-:10272000CFE7019A561C252C4FD1479345935378F8
-:102730002A2B02D11A3B45930136341C21780B1CFD
-:10274000303B092B09D8479B013401930A23019A96
-:102750005343303B59184791F0E7874E0322301C12
-:1027600008F0FEFC002808D0801B01268640301CA3
-:10277000459B0134184301934590661C2478672CCF
-:1027800010D8652C00D384E05B2C5AD005D8002CDF
-:1027900000D1E2E0252C18D07DE0632C5FD0642CC2
-:1027A00046D078E0702C34D007D86E2C5FD041D85A
-:1027B000692C70D10023469341E0752C38D0782CD9
-:1027C0002DD0732C67D1022347E06B68002B0EDD00
-:1027D0002B681A78A24200D0BDE001336A682B60F2
-:1027E000499B013A019301336A60499397E7862137
-:1027F000C023490002AA52185B00D358381C291C78
-:1028000098470028E4D04898002800D09FE001387D
-:10281000A5E0459B01932023019A13434593459BD3
-:1028200001938023019A9B0013434593102302E0F8
-:102830000A2300E00823469304236E2C0DDC0323B7
-:102840000BE0311C05A808F06BFD459B061C0193AD
-:102850004023019A1343459301234B931FE0459B6B
-:1028600001934023019A134345930023F5E74599CB
-:10287000CB0600D553E7039B499AC80704D5191D19
-:1028800003911B681A804AE7191D03911B681A609F
-:1028900045E70523E1E703234B93073346936B6832
-:1028A000002B04DD459B01935B0618D51FE08621B4
-:1028B000C023490002AA52185B00D358381C291CB7
-:1028C00098470028EED09EE7499A0192013249923A
-:1028D0006A68013A6A60002A13DD01332B602B68B5
-:1028E00024491A7809688A1852781207ECD44B9B4D
-:1028F000022B13DC381C45A92A1C03ABFEF7BAFED9
-:102900001FE08621C023490002AA52185B00D35859
-:10291000381C291C98470028E1D074E7042B06DCFA
-:10292000381C45A92A1C03ABFEF702FF09E0134B34
-:10293000002B00D1F3E6381C45A92A1C03AB00E0AC
-:1029400000BF012807D0022800D0E8E65BE7AB898A
-:102950005B0604D501E0489801E001204042A7232E
-:102960009B009D44F0BDC04664FDFFFFCBB4020058
-:1029700045B50200F40000208BAF0300000000000A
-:1029800038B5051C0020074C2060081C111C1A1CBF
-:10299000F2F78EFC431C03D12368002B00D02B6080
-:1029A00038BDC046D42F00201FB54868012201A9B8
-:1029B000DEF702FB0020029B019A013BD3189342F1
-:1029C00004D3197800020843013BF8E705F029F920
-:1029D00005B000BD002803DAFF23DB05C01801E0C5
-:1029E000C00DC0059C23DB058342804140427047F7
-:1029F000102230B58DB00692063A009200220B1CD0
-:102A0000051C01920292039206A907AA08AC05A828
-:102A10000594DDF79DFC011C281C01F026FF05989C
-:102A2000A04201D002F039FD0DB030BD10B50378E1
-:102A30007F22191C914312D013404022134202D02E
-:102A400093435208FAE7421C10783F21041C8C4340
-:102A5000802C04D19B01014001320B43F4E7181C88
-:102A600010BD3F22013003789343802BF9D070478B
-:102A7000002210B5814208D93F2401390B78A343C5
-:102A8000803B5C1EA341D218F4E7101C10BD021C51
-:102A90004118002010B58A4208D23F241378013231
-:102AA000A343803B5C1EA341C018F4E710BD10B5E2
-:102AB000041CDDF78FFE031C201C002B00D02030EF
-:102AC00010BD10B5041CDDF791FE031C201C002B6B
-:102AD00000D0203810BD3038092802D9202398436F
-:102AE00007387047704708B5DDF7BCFF406802F053
-:102AF000D6FA08BD08B5830702D005F077F807E0DD
-:102B0000002803DB01234000184301E005F089F8A9
-:102B100008BD70B5041C0E1C151CDDF7A3FFC36AAD
-:102B2000181E06D0201C311C2A1C984743425841CD
-:102B3000C0B270BD022803D149000138084300E04B
-:102B400000207047F0B585B000AF7A6052003B605E
-:102B50005318061CB960FB605D1C042B09D86A463B
-:102B6000AB000E33DB08DB00D31A9D4600256C4614
-:102B700005E0A80002F077FC041EF0D0051C201C24
-:102B8000B368396808C0FB689A0008F003FBB968AD
-:102B9000231C013170687A68E4F778FC041C002D6E
-:102BA00002D0281C02F079FC201CBD4605B0F0BD07
-:102BB00008B5DEF7A5F8F7F7EBFF05F017F808BD45
-:102BC00008B5DEF79DF8FAF7DDFAF7F7E1FF05F053
-:102BD0000DF808BD08B5DEF793F8FAF743FAF7F7F2
-:102BE000D7FF05F003F808BD73B50C1C051C01CC1C
-:102BF000161CDEF7FBFB0023691E0093221C331C0E
-:102C0000DEF738FC76BD13B50C1C411E0020131CEA
-:102C10000090221D2068DEF72DFC16BD13B50C1C9C
-:102C2000411E0120131C0090221D2068DEF722FCAB
-:102C300016BD08B5031C0A1C0B20191C0023E2F763
-:102C400047FBDEF73BFD08BD08B5011C0B20EDF787
-:102C50005FF8DEF733FD08BD10B5041C08F0BCFBBF
-:102C6000011C201CECF796FEFF38431E98414000E3
-:102C700010BD7047002310B5C25C002A06D0CC5CA2
-:102C8000002C03D0A24210D10133F5E70024CB5C25
-:102C9000A34207D10134002A04D0101CDDF78AFDBD
-:102CA0006040C4B20120204000E0002010BD136845
-:102CB00070B5002B10D14568AC1CA4002458AB4261
-:102CC0000AD09E00A6598E4204D102339B001B58A5
-:102CD000136001E00133F2E770BD08B54B680A1CD0
-:102CE00002339B005958DEF76FFF08BD10B5021C78
-:102CF0002324002388B003A801A94460C160133CC9
-:102D0000116884600374019302930392DEF78AFFD3
-:102D1000019808B010BDF0B5141C1268051C8BB0EA
-:102D20000E1CCB000430002A28D106211943019142
-:102D3000E7F7C8FD002801D043682FE005AB0790F6
-:102D400018742968181C059506960894DEF76AFF22
-:102D50002768002F23D1212E21D0281C212102AA4F
-:102D6000E4F712FC029B002B19D0019B0120391CB7
-:102D700002AA049302F032F8206010E00621656890
-:102D80001943002D05D10222E7F79CFD002806D04B
-:102D900003E00122E7F796FD4560002323600BB0B6
-:102DA000F0BD37B51D1C041C0023081C111C01229A
-:102DB0000093131CE1F708FC082002F047FB2B6886
-:102DC000436004603EBD30B5141C126887B0031C1C
-:102DD000002A0AD101A841608260191C01320193C6
-:102DE000C4600274DEF71EFF19E0806B002816D065
-:102DF00006236568C90004301943002D06D102225C
-:102E0000E7F760FD00280AD0256008E00122E7F717
-:102E100059FD002803D0636843600023236007B096
-:102E200030BDF0B5051C0F1C2C210023012489B0F6
-:102E300003A88160161C296801AA037401930293F8
-:102E40004460C2600395DEF7EDFE019B201C042B5D
-:102E500007D12869DDF706FE391CC36A321C2869D0
-:102E6000984709B0F0BD70B51923051C002488B03F
-:102E700003A8436001AE0B3329688360C660047405
-:102E8000019474600395DEF7CDFE0198A0420DD049
-:102E9000042806D12869DDF7E5FD436A28699847CB
-:102EA00004E0201C211C321C01F098FF08B070BD0A
-:102EB00008B5FFF71BFF431E9841C0B208BD13B50C
-:102EC000081C1C1C111C002302220093131CE1F798
-:102ED0007BFB03CCDFF722FA16BD10B50C1CDDF727
-:102EE000C1FD211CDFF75AFA10BD38B50D1C041CBA
-:102EF000DDF7B8FD291CDFF71FFA031E00D0236998
-:102F0000181C38BD10B5884213D20378303B092B0A
-:102F10000FD8002313600A23146863430478013038
-:102F2000303C1B191360884203D00378303B092BD7
-:102F3000F1D910BDF7B50025994218D31E1CCC1A43
-:102F4000089B019200900027AB4201DD271C2C1C3E
-:102F5000009B01991D19281C321C08F00CF900284F
-:102F600005D0BC4202D0089BE418F1E70025281CDC
-:102F7000FEBDF8B5061C1020151C0F1C02F066FAE9
-:102F8000041C06608560002F0FD0291C381CE7F751
-:102F900007F86060681C02F059FA391CE0602A1CCE
-:102FA000061C08F0F7F800237355201CF8BD13B574
-:102FB000012A0AD10C1C01A9DFF77EFB019B2060CE
-:102FC000636062230020A36005E0002301200B6002
-:102FD0004B60013B8B6016BD08B501220023DFF773
-:102FE000C9FB08BD012208B552420023DFF7C2FB2E
-:102FF00008BD012208B5131CDFF7BCFB08BD012288
-:1030000008B552420123DFF7B5FB08BD08B5031C24
-:103010000A1C0220191CDFF7EFFC08BD08B5031CD1
-:103020000A1C0020191CDFF7E7FC08BD08B5031CCB
-:103030000A1C0120191CDFF7DFFC08BDF0B50C1CD1
-:1030400095B0042803D001235B42069309E0C868C9
-:10305000DDF7F2FD0690002800D189E0069B002BE9
-:10306000F1DB2068DDF7FEFC061C6068DDF7FAFC8A
-:10307000051EB54201D0606806E0A068DDF7F2FCED
-:103080000790A84202D0A068DFF716FA0DA92068C1
-:10309000DFF712FB0EA908906068DFF70DFB0FA9A0
-:1030A0000B90A068DFF708FB0E9B0D9A0990002695
-:1030B00093425DD80E9B0D9F002B0BD1002E04D0A8
-:1030C000301C09990F9A08F065F80F9B03930123B0
-:1030D000049302E0002304930393089D049B069A43
-:1030E000934236D0002F34D00E9B281C0A93012324
-:1030F000391C00930B9A0A9BFFF71CFF05900028D0
-:1031000027D00A9B059A5F427B41D31805935F1B2A
-:10311000002E05D0039B291CF0183A1C08F03AF841
-:10312000039BFF18002E04D0F01909990F9A08F09C
-:1031300031F80E9A0F9B9446FB180393059B0D9A4A
-:1031400063441D1C089B9918049B4F1B0133049377
-:10315000C4E7002E05D0039B291CF0183A1C08F088
-:1031600019F8039BD919002E09D1049B002B01D11A
-:10317000206808E010A803F0CFFC129E9AE7079899
-:1031800010A9DFF725FA15B0F0BD08B50122DFF769
-:1031900015FD08BD012208B55242DFF70FFD08BD3D
-:1031A000F0B589B0071C0D1C081C03A9DFF784FAD1
-:1031B0000024061C039904A803F0AEFC069B0193AF
-:1031C000039B9C4205D2305DB847019B18550134E2
-:1031D000F6E7281CDDF746FC04A9DFF7F9F909B08A
-:1031E000F0BD13B5041C01A98068DFF765FAE36838
-:1031F0000199021C00208B4205D2D05C0133E360B0
-:1032000001234000184316BD01204042704700B51D
-:103210000B7905280FD8F6F7CFFB030E0505070934
-:10322000081C09E05B0003E0584200E0D84343007B
-:103230000120184300E0002000BD08B501230979F2
-:1032400049001943E4F7AAFA08BD10B50C1CF6F7BB
-:1032500047FD002902DA002C04DC04E0002902D03A
-:10326000002C00DA0919081C10BD08B5002804DB81
-:10327000002906DACB43C01803E0002901DB401A1D
-:103280000130F6F747FC08BD08B54368984708BD0C
-:1032900038B58368041C5D1C85604068DDF742FE1C
-:1032A000DDF7CAFC854201DB0023A3600121A3688E
-:1032B00060685B0019430422DDF74AFE38BD38B56B
-:1032C0000D1C041CDDF7CEFB291C036A0422201C04
-:1032D000984738BD70B50E1C151C041CDDF7C2FBE9
-:1032E000311C036A2A1C201C984770BD38B50D1C80
-:1032F000041CDDF7B7FB291C036A0022201C984739
-:1033000038BD38B50D1C041CDDF7ACFB2A1C8369E5
-:10331000211C1F20984738BD816808B5031C081E72
-:1033200009D00139181C99600123490019434068EC
-:103330000422DDF70DFE08BD7FB5061C0024081C25
-:10334000111C01221D1C0094131CE1F73DF9286893
-:10335000292102AAE4F718F9029BA34205D0201CF8
-:10336000211C02AA01F03AFD0DE00C2002F06EF8DB
-:1033700006602B68041C43602868DDF7D3FDDDF789
-:103380005BFCA060201C04B070BDF0B5071C85B0CC
-:103390000E1C00680968FAF73FFA3B68041C3568A0
-:1033A000181C211C0393F7F775FA291CF6F74EFF3A
-:1033B00000210290201CF6F7E9FC002805D000242B
-:1033C000002D24DA8024240621E001236A4600210E
-:1033D0001370201CF6F7E0FC431E9841009B40420E
-:1033E00003400021281C0093F6F7D6FC431E9841A9
-:1033F0006B461B7883420AD0201C291CF6F7AAFDD5
-:10340000FE21041C89050298F7F744FA02900298FD
-:103410000021F6F7BBFC002809D0291C0398F6F719
-:1034200015FF0025002816DA80252D0613E00298E6
-:10343000F9F7A8FE051C291C0298F7F72BFAFC21C6
-:103440008905F6F7BDFC002805D0FE21281C89055A
-:10345000F6F780FD051C3D60346005B0F0BD08B591
-:10346000FF23DB05C91803239943E1F7D5F908BD0C
-:103470004068704741607047F7B51C1C0125002A61
-:1034800002D1431EE418023D00220023002906D089
-:1034900000230027E356DE0F00237242BB410021C8
-:1034A00081420ED0160E00961E0201962678170253
-:1034B0003E43321C009F019E64193E43331C013180
-:1034C000EEE7101C191C03B0F0BD07B501930029ED
-:1034D00006D1131C01A9021C181C07F05BFE06E0B4
-:1034E000013804D301AB1B5C13700132F8E707BD50
-:1034F00038B50C1C51282AD00ED848281FD004D823
-:1035000000281AD0422818D037E04C2833D0502851
-:1035100031D0492831D12EE0682810D006D864284F
-:1035200021D0662819D0622827D106E06C2822D045
-:10353000712807D0692820D11DE0A3541DE0520056
-:1035400013531AE0D1006118D8170B604860D200FD
-:10355000A2181360DB1753600FE0181C9500F7F7F3
-:1035600037FB285109E0D200181C8C18F9F770F9C4
-:103570002060616001E09200135138BD07B512214F
-:103580006A46E4F701F80098431E9841C0B20EBDA8
-:103590008368C268934203D25A1C8260187801E0A3
-:1035A000012040427047036810B5041C002B02D074
-:1035B000406801F072FF201C01F06FFF10BD10B5D4
-:1035C0008468C3686268011C0020934205D29A1C7B
-:1035D000920012590133101CCB6010BD08B50B1CB2
-:1035E0000968021C081C49680830E2F7FDF808BDAC
-:1035F00008B5031C0A1C0830596800F078F808BDAB
-:10360000436808300B601060704708B501F045FF53
-:1036100008BD4A43F8B5071C1E1C141C0025B54202
-:1036200009D00698391C221C07F0B4FD069B013511
-:103630001B190693F3E7F8BDF7B5B0CA0020019156
-:10364000011C00F073FA061C002F0ADA013DAC429F
-:1036500011DC019AAB00301CD158E2F7F3FAED19F6
-:10366000F5E7AC4207DA019AA300301CD158E2F723
-:10367000E9FAE419F5E7301CFEBD70B5049D041CA1
-:10368000161C1B2803D10022AE422ED110E01928AF
-:1036900008D01C280CD12E1C151C0A1C1D24191C1A
-:1036A000131C05E02E1C151C0A1C1A24191C131CC3
-:1036B0002A1EB24200D9321C081C191C07F05BFDFF
-:1036C0001B2C02D14442604109E0002290420CDBF5
-:1036D0000132002809D1AE4203D0AE424041C2B20D
-:1036E00003E01A3C601E8441E2B2101C70BDF7B5C5
-:1036F0000025071C0E1C2C1C0192B54209D0AB0002
-:10370000F8580199DDF746FA431E9841013524180F
-:10371000F3E7012064002043FEBD38B5041C2420DB
-:1037200001F0A6FE051C4461A00001F08FFEA86117
-:10373000281C38BD10B5041C002902D0C06801F057
-:10374000ACFEA06901F0A9FE201C01F0A6FE10BD90
-:1037500038B5041C0D1E012D07D1012143694942D2
-:103760009A00806907F033FD07E0022905D140681F
-:1037700001F06CFE6368E060A36000232560636075
-:1037800038BD704780687047C06870470368012B78
-:1037900003D8426883698900CA50704742684B4227
-:1037A000013A511819404160704770B50568446886
-:1037B000012D02D8611841600CE00E19C368466003
-:1037C000022D07D11B1959188B4203D01A70120A07
-:1037D0000133F9E770BD026810B54368012A03D8C8
-:1037E00002334360103003E0C2689C1C4460D01870
-:1037F0000170090A417010BD016A10B5041C00294E
-:1038000004D0B0231B021943FFF7E5FFBD21E36994
-:1038100009021943201CFFF7DEFF10BD30B5046814
-:103820004368012C03D804334360103003E0C468BC
-:103830001D1D4560E01801708270090A120A41706E
-:10384000C27030BD08B51143DB001943FFF7C3FF59
-:1038500008BD08B5072A01D8D20003E04023083A82
-:10386000D2001A43072902D98023083919430A4391
-:103870008C21C9011143FFF7AEFF08BD38B583693C
-:103880008900CC584368051CE41AE023043C210558
-:103890001B02490D1943FFF79EFF2B680120022BE5
-:1038A00007D1E40AE40204D080231B01E41860423B
-:1038B000604138BDF8B5061C8069920014587268E2
-:1038C000A41A043C6510002B15D1D023FF271B023E
-:1038D000090219433D40301C2943FFF77CFF0123B7
-:1038E0003268181C022A1FD1BC431DD00134FF349A
-:1038F0006042604118E0F02389011B0219438023D4
-:10390000A212DB00134080229201194323031440CA
-:1039100080222D0512029B0E22432D0D301C1943CF
-:103920002A43FFF77BFF0120F8BD38B58369890082
-:10393000CC584368051CE41AF023043C61021B02C6
-:10394000490D1943F82362101B0292B21A43FFF784
-:1039500065FF2B680120022B07D1A40DA40504D01C
-:103960008023DB03E4186042604138BD8068704703
-:1039700070474368F7B51C1E1BD0051C0021181C9E
-:10398000E1F790FD0026041C6B689E4211D2B30043
-:103990000193EB189868E3F7C1FE071E04D1201CC1
-:1039A000FFF733FE3C1C04E0019B0136E3189860EE
-:1039B000EAE7201CFEBD08B50220E0F7B5FA08BD15
-:1039C000826810B5C3689468011C0020A34205D228
-:1039D000D268980082580133101CCB6010BDF0B53E
-:1039E00085B001900E1C171C0293E0F715FB019B9C
-:1039F000B34254D2019B1C1F002F02D133680393A2
-:103A000004E0381C316801F0E1F90390351C0434FE
-:103A1000AC420FD2002F01D1216804E02168381C8C
-:103A200001F0D4F9011C1920039AE3F7B7FE029BB9
-:103A30009842ECD0043DAC4214D2002F01D12A6848
-:103A400004E0381C296801F0C1F9021C192003990F
-:103A5000E3F7A4FE029B9842ECD023682A68226018
-:103A60002B60D4E72368326822603360019BEA1A36
-:103A7000331B9B10013B921004349A4207DA0198E1
-:103A8000291C3A1C029BFFF7AAFF0194AFE7311CE7
-:103A9000201C3A1C029BFFF7A2FF2E1CA7E705B0D3
-:103AA000F0BD08B50B1C0968021CC8688968E1F7FD
-:103AB0009BFE08BD38B5041C081CE3F7E1FD051C9E
-:103AC000281CE3F72BFE011C201C002902D0E2F782
-:103AD000B9F8F5E738BD08B5031C0A1CC068996839
-:103AE000FFF705FE08BD38B5051C102001F0AEFC3F
-:103AF000041C291CE2F7FAF9201C38BD73B5002418
-:103B00000D1C1E1C081C0094111C0123221CE0F734
-:103B10005BFDA54203D1281CFFF7E5FF05E0201C53
-:103B2000FFF7E1FF3168FFF7C5FF76BD38B5041C2C
-:103B30000D1CFFF7D8FF0023A4009D4206D0A3422E
-:103B400004D0E958C268D1500433F8E738BD08B54D
-:103B5000031C8068D968FFF7E9FF08BD83680B6024
-:103B6000C368136070478160704738B5041C0B1C34
-:103B7000151CA1681A1C00680023DDF735F9E368FD
-:103B80008000C55038BDF0B51D09002495421BD2F8
-:103B9000521B6C00061C151C0919002D0DD00C8839
-:103BA000012D02D94F883F043C430F271F40FC40A2
-:103BB000013D348002310236EFE75300C01802386D
-:103BC000048860424441141B201CF0BDF0B5059CE4
-:103BD000121B94460022271C161C002F08D08C5A5A
-:103BE0009D5A013F6519AE198652360C0232F4E730
-:103BF000059B62465C00031909191C1C002A07D0AA
-:103C00000D88013AAE1926800231360C0234F5E7F0
-:103C1000624652009A18002E02D00123138002320D
-:103C2000101A4010F0BDF7B50025089C2E1C271C6B
-:103C30000193121B002F0AD04B5B013F9C46019B56
-:103C400066445B5BF61A465336140235F2E76400AD
-:103C50000319151C1F1C0919002D07D00C88013DE4
-:103C600036193E80023136140237F5E75200023A27
-:103C70009A18824204D31388002B01D1023AF8E744
-:103C80000232101A4010FEBD0239814202D30B8865
-:103C9000002BF9D00231081A4010704710B50028E7
-:103CA00006D0041C806801F0F8FB201C01F0F5FB35
-:103CB00010BD38B5051C0C1E012C00D80224A868C4
-:103CC000002803D02B689B08A3420CD22B789B07BB
-:103CD00009D4610001F0D0FB03232A68A40013403B
-:103CE0001C43A8602C6038BD38B5051C0C2001F0C1
-:103CF000ADFB01212B78041C0B401A1C03788B436D
-:103D000013430222934303702B682168980803230E
-:103D100082000B40134323606B686360AB68002B29
-:103D200001D1A36009E0400001F090FBA0602B6886
-:103D3000A9689A08520007F02DFA201C38BD10B56A
-:103D40004B00C018D218002908D00238023A038864
-:103D500014881B1B04D406D10139F4E7081C03E0C6
-:103D60000120404200E0012010BD38B5051C0C1CAC
-:103D70000221FFF79EFF2B780122002C03DA134368
-:103D80002B70614202E0211C93432B7000236B6077
-:103D9000002907D06B685A1C6A60AA685B009952B8
-:103DA000090CF5E738BDFC230278134003700323A8
-:103DB000026813400360002343608360704708B5C6
-:103DC000002805D003789B0702D4806801F065FBCA
-:103DD00008BD38B50C1C4968051CFFF76AFF0121B6
-:103DE0002378A8680B401A1C2B788B4313432B7045
-:103DF0006368A1686B6063685A0007F0CBF938BD4F
-:103E000008B5002901D1416001E0FFF7AEFF08BD10
-:103E100038B50D1C041CFFF7C6FF291C201CFFF73A
-:103E2000EFFF38BD38B5012504788160AC436D19CA
-:103E30002C4304700324AA400568191C2C4022431B
-:103E4000026000224260FFF7DBFF38BDF8B5041CBA
-:103E50001F1C06AB1D780421161CFFF72AFF2378D0
-:103E60000122002D07D0002F05DA13432370002311
-:103E70007242BB4103E093432370321C3B1C002180
-:103E80006160111C19430CD061681D04481C6060FE
-:103E9000A06849000A52100C190C05432A1C0B1C7F
-:103EA000EFE7F8BDF7B50D1C01210378EA0F8B434E
-:103EB0001343FF220370D2012B0C061C134002D1C6
-:103EC000002373604DE09342FAD07F236C00240EF0
-:103ED0005B42E318F4D4002B02D1FFF746FF40E029
-:103EE000221C6F3AD117090F8A1880216D02121116
-:103EF0006D0A090400920D43162B05DC962300275A
-:103F00001C1BE5403C1C08E00F273B40173B963C40
-:103F10001F40E3171B0F1C192411301C0099FFF7D9
-:103F2000C8FE009B736063000193002C04D0B0684E
-:103F300000211A1C07F04BF9002F08D02B1CBB40A6
-:103F4000B2680199013453521023DF1BFD40009BDE
-:103F500064005B009C4204D0B26815532D0C0234FF
-:103F6000F8E7F7BDF7B5041C0D1C1E1C8B18D1001B
-:103F7000090901310193FFF79CFE23780122002EED
-:103F800001D0134300E0934323700023281C636097
-:103F9000019B984231D20278131C303B092B07D980
-:103FA000113B192B03D9131C613B192B25D80A335C
-:103FB000089A934221D26268A6689446311C9BB24B
-:103FC0000092009A002A0CD00A88171C089A92B214
-:103FD0007A43D318009A0B80013A1B0C00920231ED
-:103FE000EFE762465200B218002B01D01380023274
-:103FF000961B761066600130CAE7401BFEBD406824
-:1040000043425841C0B2704770B50D1C4168021C54
-:10401000002903D16B68081C002B1AD02B78147868
-:10402000DB07E007DB0FC00FDBB2C0B2181A10D1FC
-:104030006B689668AA68994206D30130994205D800
-:10404000301CFFF77CFE01E001204042E30700D571
-:10405000404270BD10B5041E8C4201D0FFF7B9FE7E
-:10406000012223789343237010BD10B5041E8C42A7
-:1040700001D0FFF7AEFE01212378DA07D20F8A1AAA
-:104080000A408B431343237010BD7FB5041E8C423E
-:1040900001D0FFF79EFE6268002A0BD1201C01218F
-:1040A000FFF707FE0122A3681A802378626013439A
-:1040B000237020E00E26012523786E442B420AD07F
-:1040C000A068AB4323703580011C0095331CFFF7BB
-:1040D000AAFD60600FE0511C201CFFF7EAFDA068FC
-:1040E0003580331C0095011C6268FFF76FFD237853
-:1040F00060601D4325707FBDF0B50D1C496887B019
-:10410000041C161C002901D0002A03D1291CFFF72A
-:1041100060FE4FE0FFF7CDFDA968331CA0686A6818
-:10412000FFF731FD6060029001202B780340191CDD
-:10413000237883430B43237003423BD00E2300219B
-:1041400002AA9B186A68300919800392039A914267
-:1041500010D081420ED04A0094466746AA68BA5AE7
-:10416000002A05D00121039A1980904205D314E05A
-:104170000131EBE7039A90421CD2A9684000405AF3
-:104180000F210E400E390D1CB5402E1C013E06427B
-:1041900000D01980198800290CD0029A0120A1684A
-:1041A000002A01D1088004E00090029A081CFFF761
-:1041B0000DFD606007B0F0BD73B5151C061C0C1C2E
-:1041C00088686B6849689268994204D306D8FFF7FB
-:1041D000B6FD002802DA231C2C1C1D1C2A7823782B
-:1041E0005340DB070DD46368301C591CFFF761FD99
-:1041F0006B68B0680093A1686268AB68FFF7E6FC83
-:104200000BE0301C6168FFF754FD6B68B0680093E9
-:10421000A1686268AB68FFF706FD01217060237832
-:104220000B401A1C33788B431343337073BDF7B5BF
-:10423000171C041C0D1C88687B68496892689942A9
-:1042400006D30026994207D8FFF779FDB04203DA7A
-:104250002B1C01263D1C1F1C3A782B785340DB0792
-:104260000DD56B68201C591CFFF723FD7B68A068E7
-:104270000093A9686A68BB68FFF7A8FC0BE0201CE4
-:104280006968FFF716FD7B68A0680093A9686A68F3
-:10429000BB68FFF7C8FC60602B782178002E08D03F
-:1042A000DA070123D20F9A1A99431A400B1C1343C1
-:1042B00003E00122134091430B432370F7BDF0B597
-:1042C0004B68141C52688BB0051C0E1C934201D223
-:1042D000261C0C1C0123327871681A4201D1227805
-:1042E00013405918281CFFF7E4FC2278B368111C0E
-:1042F00003937368A8680193A36804936368347890
-:10430000079361400023C90702D4E307DB0FDBB248
-:10431000E407E40FE1B20F1C8446D207D20FD4B2F7
-:104320005A4292B208924A4292B20992624292B2C0
-:104330000692019A02910594561E721C2AD0039A85
-:10434000099912884A40BF180199079A521A92197E
-:104350000699B24206D8049A1188069A5140049AE6
-:1043600002320492059A013E521805923A1C0599B0
-:104370003F0C0A4008994A4092B2D3186246138013
-:10438000059A1B0C120C059202229444039A0232E5
-:104390000392D2E7019A51004118002B02D0012369
-:1043A0000B800231FFF770FC029B012223401C1C92
-:1043B0002B78686093431C432C700BB0F0BDF0B5B4
-:1043C0004B68161C52688BB0051C0C1C934201D222
-:1043D000341C0E1C0123227861681A4201D1327804
-:1043E00013405918281CFFF764FCA368A8680393BE
-:1043F000636824780193B3683278049373680793F1
-:1044000001231C4200D11340E407E40FE1B20F1C6A
-:104410008446D207D20FD4B25A4292B208924A428C
-:1044200092B20992624292B20692019A0291059466
-:10443000561E721C28D0039A099912884A40BF1848
-:104440000199079A521A92190699B24206D8049A0B
-:104450001188069A5140049A02320492059A013E4C
-:104460005218089905923A434A4092B2D3186246CC
-:104470001380059A3F0C120C059202229444039A71
-:104480001B0C02320392D4E7019A51004118002B11
-:1044900002D001230B800231FFF7F6FB0122029BC1
-:1044A00068601C432B7893431C432C700BB0F0BD09
-:1044B000F0B54B6889B0041C0E1C151C002B02D0F3
-:1044C0005368002B02D10023636072E0814207D160
-:1044D000081CFFF709FC071CB5420AD1051C08E0BF
-:1044E0000027824206D1101CFFF7FEFB051C071CAB
-:1044F00000E03E1C6B687268201C9918FFF7D9FB1E
-:10450000236800219A085200A06806F060FEA368A4
-:104510000393B368039A059373680493AB6801939C
-:104520006B680293049B5B00D1185B4206930023E7
-:10453000069A02988A1800282CD0059B0020009328
-:10454000049B9C466346002B14D013881B180793CA
-:10455000009B1B88181C019B1B8843430798C018AD
-:1045600001235B429C44009B10800233000C0093AB
-:104570000232E7E70B1C002801D008808B1C039A4D
-:1045800002319B1A029A5B10013A0292019A02329E
-:104590000192CDE70122636033782978594023786E
-:1045A000114201D1934300E013432370381CFFF7FD
-:1045B00075FB09B0F0BDF8B54B68002B03D001279F
-:1045C00013783B4202D00023436036E05368151C49
-:1045D000041C002B03D1391CFFF7C7FB2DE0081C7E
-:1045E000FFF782FB061C281CFFF77EFB391C051C0D
-:1045F000201CFFF7BAFB6B68002B11D0AB681B883F
-:10460000DB0704D5201C211C321CFFF751FFA868D2
-:104610006A68011C0123FFF7B6FA6860002806D11A
-:10462000301CFFF73BFB281CFFF738FB05E0301C74
-:10463000311C321CFFF73CFFDDE7F8BD4368011C6D
-:104640005A00002310B58468A218023A901C8442D4
-:1046500003D210881B040343F7E7181C0B78DB0711
-:1046600000D5404210BDF0B59C4685B01D1C002908
-:1046700000D09D1800248368261C01934368029390
-:1046800001230393029B002B29D0019B24041B8848
-:1046900010361C43072E1BDD0778A3B2FF0706D593
-:1046A000FF279F43039BFB189BB21F0A0397002918
-:1046B00004D06F1E3B70674506D110E02B70634637
-:1046C0006F1C9B189F420AD0083E240A3D1CE1E75C
-:1046D000019B02330193029B013B0293D2E705B099
-:1046E000F0BDF8B586684368051C00205C003419ED
-:1046F000023CA31C9E420CD28F21C905F5F798FFFE
-:10470000071C2088F6F764FA011C381CF5F722FC18
-:10471000EEE72B78DB0702D580231B06C018F8BD17
-:10472000F0B58BB0099310AB1B78119E071C049158
-:10473000141C0593002E03D00B1C023B1E2B02D928
-:104740000020307089E04368002B12D1301C331CEC
-:10475000002A07D02278181C002A03D01A700134CE
-:104760000133F7E730230370002301300370801B0F
-:1047700073E05B00181C039300F068FEB968039AAD
-:10478000029006F007FD06960196039A029B944656
-:1047900063441D1C00210793029B023D9D420DD3E3
-:1047A0002B88090419430891081C0499F5F722F98C
-:1047B000049928800898F5F7A3F9EDE730313929F5
-:1047C00002D9099B3A3BC918019B5D1C1970029BD9
-:1047D000079A934204D21A88002A06D10233F7E7D7
-:1047E000059B002B13D0012303E0059B002B0CD06D
-:1047F0000023069AAA1A032A05D16946019A097D5F
-:10480000951C51700695002B01D10195BDE70298CA
-:1048100000F043FE002C0CD0201C06F0DDFD2B1C0C
-:1048200020181D1CA04204D9013802781A700133E7
-:10483000F7E73B78DB0702D52D232B700135321CBF
-:104840006B1E9A4206D211781878013B107059708D
-:104850000132F6E70023A81B2B700BB0F0BD08B5A2
-:10486000081C111CEFF7C0F908BD70B5061C081C28
-:104870000D1C06F0B1FD041E03D009CE291C221C1C
-:104880009847201C70BDF0B58BB0029312AB1B781B
-:104890000D1C03930F2302A9071C5B18002A01D1EA
-:1048A00000220EE0002D03DA2D226D421A7012E074
-:1048B000119A920701D52B2203E0119A5207EFD5E6
-:1048C00020221A70002D06D130221F2406ABDA7385
-:1048D00002ABE41818E00AAC281C0299F5F710F9AD
-:1048E0000E1C281C0299F5F785F8331C051C303383
-:1048F000092E02DD109B0A3BF318013C237006AB26
-:104900009C4201D9002DE7D140250F21119B1D406C
-:1049100002ABC9180B78002D0FD00025AB4213D085
-:104920000122039B01920093381C119BE1F78CFE3E
-:10493000139B051C013B139306E0002B04D006AA31
-:10494000944201D9013C23700AAB1A1B039B381C0B
-:104950000093139B211C0193119BE1F775FE28180E
-:104960000BB0F0BDF0B51E1C8DB012AB1B78071C50
-:104970000393151C2B23B20702D47307DB0F5B01D3
-:10498000149A04AC00920193081C2B1C211C2022B9
-:10499000DFF77CFBC343051CDB171D40F30507D580
-:1049A0006B1C1F2B04DC2522625500221D1CE254C7
-:1049B000402000233040984212D022782F2A12D86B
-:1049C0000122211C00930192381CE1F73DFE0921D0
-:1049D000139B041C013B139302AB013DC91804E077
-:1049E000211C041C01E0211C1C1C039B381C00938F
-:1049F000139B2A1C0193331CE1F726FE20180DB0EF
-:104A0000F0BD0EB403B503AA02CA0192E1F790FF0C
-:104A100002B008BC03B0184710B57F244018431EED
-:104A200014401C700C1A1C19002C05DD8024D209BE
-:104A30006442013B1443F4E710BD30B50268051C25
-:104A400000207F241178C3010C4049B2E0180132E4
-:104A50000029F6DB2A6030BD13B5421C01920278B2
-:104A60000C1C031C082A10D8101CF4F7A5FF1D10FD
-:104A70000E0508080E0E0A000533019314E00333F7
-:104A8000FBE701A8FFF7D9FF0EE0192A01D802338E
-:104A9000F3E701A8FFF7D1FF01A8FFF7CEFF002C35
-:104AA00002D0019B18180190019816BD10B50C1C7E
-:104AB000022102F082F8230A0A330370447010BD09
-:104AC000F8B50478002C2AD11E1C0D1C836841689F
-:104AD000171C041C8B420FD30C235943C068C031F0
-:104AE000012200F0D6FC002802D10123237016E039
-:104AF0006368E06010336360A368E1685A1CA260D9
-:104B00000C225343CB181A682D02290A150E2D06C4
-:104B10000D431D603A785E60DA70069A9A60F8BDBF
-:104B200010B50C1C052102F048F803230370431C48
-:104B300005301C70013324128342FAD110BD70B5C8
-:104B4000041C161C002583690135DB09FCD16B1C94
-:104B5000081C191C02F031F808230370291C0130CD
-:104B6000A269FFF759FF6569A369AB4206D308350F
-:104B7000A900E06900F080FC6561E061A369E26979
-:104B8000591C9B00A1619E5070BDF0B5046A89B0AC
-:104B9000231C403303931D78071C0E1C082D08D1DD
-:104BA000A16CE06CE5F750FA011C301CFFF77EFFAA
-:104BB00069E0092D0DD10022E06CA16C231CE4F703
-:104BC0003DFB021CC3070ED54110301CFFF7A8FFA8
-:104BD00059E00A2D0CD100940122E06CA16C002355
-:104BE000E4F7B8FB021C381C311CFFF7A8FF4AE0B1
-:104BF0002B1C0B3B012B3FD804A8A16C01F075FFC7
-:104C000004A8E16CA26C01F04FFF201C00F0D7FD5E
-:104C1000039B1B78AB42F3D00B3B0020012B36D912
-:104C2000059906980A2902D8E5F70EFA01E0E5F79A
-:104C3000D5F9041E0DD00B3D6B425D410523301CA0
-:104C400003215D1B01F0B9FF4470240A05708470D4
-:104C50000EE0069805990B2D03D1221CDDF7EEFC22
-:104C600001E0DDF703FD021C311C381CFFF767FF74
-:104C700004A801F064FF09E0081C022101F09DFF77
-:104C8000012345700370201C00F099FD012009B03C
-:104C9000F0BD13B50130019001A80C1CFFF7CDFE4B
-:104CA0002060019816BD002310B50B60C218527821
-:104CB000DC00A2400C68013322430A60042BF5D1CA
-:104CC000053010BD07B501A9FFF7EDFF01980EBD36
-:104CD00010B502780023032A06D10C1CFFF7F2FF5F
-:104CE0000123400018432060181C10BD38B50D1C6E
-:104CF0000024A84204D201210134FFF7ADFEF8E7F9
-:104D0000201C38BD08B50121FFF7A6FE08BD08B577
-:104D10000021FFF7A1FE08BD13B50130019001A8E5
-:104D20000C1CFFF78AFE01A8FFF787FE019B1818ED
-:104D30002060181C16BD13B5041C00680378002BF6
-:104D400002D1013020600DE0192B02D91A318B42BB
-:104D500003D00121FFF780FE04E001A9FFF7DCFF8B
-:104D60002060019816BD37B51C1C431C01930378C5
-:104D700001A81A3B0B60151CFFF75FFE286001A815
-:104D8000FFF75BFE019B18182060181C3EBD07B59D
-:104D900001A9FFF7C1FF019BC01A43425841C0B2AD
-:104DA0000EBD10B58068002804D0446800F075FB83
-:104DB000201CF8E710BD08B5FEF7DAFD08BD00219C
-:104DC00008B50A1C0B1CE2F761FB08BD07B5002201
-:104DD000019101AB0121E2F759FB0EBD536810B5FB
-:104DE0000C1C591E8B4119189B00D31A08331068EC
-:104DF000221CE2F74BFB10BD07B56A46E2F7F4FB55
-:104E000001990098002901D0DCF7FCF80EBDF8B537
-:104E1000FEF7ACFD02F008F90025071C7B689D42F7
-:104E200015D2BB68EE009C59002C0ED0042C0CD07F
-:104E3000E408201C00F033F903785F2B05D0BB6831
-:104E4000201C9E197168E2F787FA0135E6E7F8BD84
-:104E500008B5102000F00CFB072203789343063AB4
-:104E60001343037008BD037810B55B07041C5B0F88
-:104E7000052B06D0081CA368111C6268ECF716F914
-:104E800006E003686168D802400DE268ECF758F963
-:104E900023889B0601D5DBF7F3FC10BD38B5141C45
-:104EA000802252000A400D1C111E01D02168626848
-:104EB000FFF7D9FF0223EA091A409A40E9B2A21883
-:104EC000EBF7FEFB38BD7FB56846E4F7DDFC012358
-:104ED00002984000184307B000BD7FB56846E4F76C
-:104EE000D3FC012301984000184307B000BD30B542
-:104EF0000268051C00207F240132531E1978C3016B
-:104F00000C40201C49B218430029F4DB2A6030BD54
-:104F100070B500221E2B02DD1A1C1E3A07E0E225A6
-:104F20008418ED00641924787F2C0DD10132D2B29F
-:104F3000F5E70132D2B29A420ED0E2268518F60089
-:104F4000AD192D78FF2DF4D0E22664188518F600EF
-:104F5000E4B2AD192C70ECE770BD38B5041C0D1C23
-:104F6000002201794020DFF783FEE3682B60A3680D
-:104F70005843686023790020AB6038BD416838B57C
-:104F8000C2688C68031C0020A24207D29C68551C92
-:104F90000879A218C968DD60DFF78CFE38BD7FB5DF
-:104FA00000251C1C081C02230E1C0095111C01224C
-:104FB000DFF70AFB206803A9DDF7F8FF0078012E70
-:104FC00003D1291CE3F732FF02E06168E3F7FEFF3B
-:104FD00004B070BD08B50222E4F7D6F808BD08B5E4
-:104FE0000122E4F7D1F808BD4368F7B5051C980025
-:104FF00000F02CFA0026071C69688E4210D2B3001C
-:105000000193EB18D868E2F789FB041E04D1381C21
-:1050100000F043FA201C08E0019B0136F850EBE752
-:10502000A86800223B1CE2F731FAFEBD10B5041C53
-:1050300006F0D2F9011C201CE5F706F810BD38B5C2
-:10504000051C03300C1C00F001FA2060457020683C
-:10505000023038BDF8B54578871C041C291C381C63
-:10506000E4F7BCFF061E0BD1291C381CE4F798FF9F
-:1050700065192070AE70201CE4F76CFF061C02E07E
-:10508000201C00F00AFA301CF8BD08B5E4F750FF08
-:10509000007808BD08B5E4F74BFF407808BD08B5B7
-:1050A000E4F746FF023008BD10B50C1CE4F740FFE2
-:1050B00043780230236010BDC168031C002905DD60
-:1050C00042688068824209DB00200DE000208142B6
-:1050D0000AD05A6894469A68944505DD586842009B
-:1050E00041180120596010437047426808B5836831
-:1050F000C1689B1A5B18581C002900DD581EF4F784
-:1051000009FDC343DB17184008BDF0B5002785B083
-:1051100003901D1C081C03230E1C0097111C012268
-:10512000DFF752FA102000F091F9039B041C036092
-:1051300001234760C36028689E4203D1DBF77CFDF2
-:10514000A0600CE0DBF778FD60606868DBF774FD59
-:10515000A060032E03D1A868DBF76EFDE060201C81
-:1051600005B0F0BD136810B5002B0ED1141CEE294C
-:1051700001D1406806E0C02901D1806802E0BF2962
-:1051800003D1C06802F032FD206010BD10B5041CD0
-:105190004160002901D1816003E0C80000F068F996
-:1051A000A06007232268134023600123237010BDF1
-:1051B000072310B5046841602340C9001943072341
-:1051C000016019430170826010BD037810B5041CA2
-:1051D0009B0702D4806800F060F907232168002251
-:1051E0000B40012123600B4349188B4362602370FD
-:1051F000A26010BD002310B5041C0160436088004C
-:1052000000F036F9A06010BDF0B5036887B0041C4B
-:105210000E1C0292002B04D1131CDB075CD5E5F7B2
-:105220008BFC311C0220E2F7C7F84310181C2168E0
-:105230000593F4F765FC00270D1C0491AB00039364
-:10524000039AA3689B181A680192002A06D1029A51
-:10525000D20741D5002F2FD11F1C2DE0019A042A1F
-:1052600003D1002F1BD11F1C19E00198311CDBF763
-:1052700091FC002813D0029B9B070ED56368681C25
-:10528000013B63602168F4F73BFCA66889008B59F9
-:10529000002B00D00423039AB35001981DE0681C32
-:1052A0002168F4F72DFC049B0D1E9D42C6D1029B84
-:1052B000DB0711D5002F05D06368301C0133636014
-:1052C0003E600AE0201CE5F737FC05982168F4F7FA
-:1052D00017FC0D1C0491B1E7002007B0F0BD0023BE
-:1052E00070B501688B4216D086689D0075192C68D0
-:1052F0000133002CF6D0042CF4D04268013A42600D
-:10530000181CF4F7FDFB89008B59002B00D00423F7
-:105310002B60201C00E0002070BD10B5041C8068CC
-:1053200000F0BBF8002323606360A36010BD38B5B4
-:10533000051C0C1CDEF710FD281C211CF3F71AFFBE
-:10534000DEF7FAFC38BD10B5041CDEF705FD201CA5
-:10535000F3F7F0FEDEF7F0FC10BD80235B051B6960
-:10536000013B184043425841C0B27047002210B57B
-:1053700043889A420CDA03230021534344680132E4
-:10538000E1544468E41861704468E3189970EFE7E9
-:10539000E6F7DEFA10BD70B5468804AC2578012426
-:1053A0008E420AD902346143446864186270002452
-:1053B00042685354436859188D70201C70BD10B555
-:1053C000131CC4680022A04710BD002108B50A1CA8
-:1053D000FFF7F5FF08BD07B5019101AA0121FFF70D
-:1053E000EEFF0EBD08B5E6F771FC08BD08B5DBF7AA
-:1053F00039FBE6F7B3FC08BD38B5041C0D1CFFF7FC
-:10540000F5FF002803D0201CDBF72CFB041C291C13
-:10541000201CDCF791FF38BD73B5051C01A980681D
-:10542000DDF74AF9EB68019A061C002093420CD282
-:10543000F618301CFDF715FB841B211C301C0122C3
-:10544000DDF7FCF8EB681C19EC6076BD10B50021A7
-:10545000041CE4F76BFA002804D1002C02D0201CB5
-:10546000E2F7A4FE10BD08B50021E4F75FFA08BD1D
-:1054700008B5FFF7EBFF08BD10B501220C1CE4F7DF
-:1054800055FB002804D1002C02D0201CE2F78EFE30
-:1054900010BD08B5E4F74AFB08BD08B5E4F7CAFA41
-:1054A00008BD002313B5041C0093081C111C1A1C12
-:1054B000DFF78AF80420FFF7C9FF046016BD08B5BE
-:1054C0004069FEF772F908BD08B54069FEF766F954
-:1054D00008BD038870B50469032B09D10023C56892
-:1054E000AB4205D09E00A659964208D00133F7E79B
-:1054F0008B004069E250FEF749F9012000E00020EE
-:1055000070BD38B50C1C89B2051C018042608360F7
-:10551000032905D1C36800219A00006905F057FEF0
-:10552000211F4B424B416869591CFEF711F968690C
-:105530000021E0F793F938BDF0B5041C85B040694F
-:105540000F1CFEF759F96069FEF71BF92388042B3D
-:1055500015D16069FEF718F96368051C60695E691A
-:10556000FEF710F9002261680092498B031C01913B
-:1055700002920397301C05212A1CE2F74FFE05B06A
-:10558000F0BD38B5051C1820FFF760FF041CC5608E
-:10559000A800FFF75BFF2061281CFEF7BEF86061E2
-:1055A000201C38BD10B5041C0069FFF776FF606948
-:1055B0000021FEF7BFF8201CFFF76FFF10BDF7B505
-:1055C0006B46DF1D3A1C051C0C1C02F077FC3B7877
-:1055D000061C002B12D0281C211C02F09CFC002869
-:1055E0000AD00378023B022B06D80423281C337010
-:1055F000211C02F0A2FC01E000233370F7BD37B597
-:105600006B46041CDD1D2A1C02F058FC2A78237806
-:10561000002A07D0002B01D0072B01D1002308E07E
-:10562000022306E0013B052B04D80378002B01D1AF
-:105630000233037037BD70B5051C0E1C101C191CFD
-:105640001C1C02F02BFC0378002B01D1B36802E094
-:10565000012B04D1F368281C211C984708E04288DC
-:10566000022B01D1336800E07368281C211C984785
-:1056700070BD026910B5531C2ED00A2A04D1C3692B
-:105680000133C361012306E0036A092A02D107330B
-:10569000DB08DB000133041C036243690361836997
-:1056A0004361A368406898472369A0610D2B09D125
-:1056B000033B236163690A2B04D16061A3686068BE
-:1056C0009847A061A369013306D163695A1C03D0CE
-:1056D0000A2B01D00A23A36110BD10B500280FD0FA
-:1056E000C368041C002B01D040689847201C44303C
-:1056F00001F025FA606BFFF7D0FE201CFFF7CDFE0E
-:1057000010BDF7B5071C54200E1C01921D1CFFF79D
-:10571000AAFE041E04D1281E50D0301CA8474CE01D
-:10572000019B00228360C56001230A25C3610362D7
-:1057300003630760426282624660C562271C1420D0
-:10574000FFF791FE443760632021381C01F0CDF94A
-:10575000636B002B04D1201CFFF7BFFF00202DE05E
-:10576000381C01F0FEF90028F5D1636B1880019B0D
-:10577000301C9847019B2061301C9847019B606159
-:10578000301C98472269A061531C04D06369591CDE
-:1057900006D10D2A01D125610BE00A2A04D108E0C7
-:1057A000421C06D10D2B01D1656102E00A2B00D00D
-:1057B000A561201C0121E7F70BF8201CFEBD08B5F0
-:1057C0000021E7F705F808BD73B51D1C061C002372
-:1057D000081C111C02220093131CDEF7F5FE0C209E
-:1057E000FFF734FE06602B68041C43606868E1F72D
-:1057F00047FFA060201C76BD08B5E1F741FF08BD5A
-:1058000008B5031C0A1C0C20191CE1F7C7FF08BDD2
-:1058100038B50124A04200D04C680868E1F730FF99
-:10582000051C281CE1F77AFF021E05D0211C05206B
-:10583000E1F7B4FF041CF4E7201C38BD08B5011CD7
-:105840000220E1F7B9FD08BD08B51A23E7F73AFCD5
-:1058500008BD08B51923E7F735FC08BD10B50C1CC9
-:10586000022802D106CC093007E0096862680B20E3
-:10587000E1F794FF011C0A20A268E1F78FFF10BD39
-:1058800070B5146801291DD91025211C0378A9437E
-:1058900016D0082C08D1302B1BD1202243781A4374
-:1058A000031C6F2A27D109E0022C0BD1302B10D119
-:1058B000202243781A43031C622A1CD1831C1AE05D
-:1058C000302B08D0002C04D10A23136001E0002CF7
-:1058D00009D0031C0FE020264178831C314378292E
-:1058E000F5D1156007E06F2901D1673902E062291F
-:1058F000EAD160391160181A70BD10B544680C60A7
-:1059000081681160C2681A6010BD0123884202D00C
-:10591000037858424341181C7047037842780A3B89
-:105920001B02134302300B607047838BC26A013342
-:105930009BB28383918C994200D29384704738B58F
-:10594000051C0C1C101C191C2A68049B02F069FA27
-:10595000EB6AA4004360AB6AE05038BD13B5041C89
-:10596000081C01A9FFF7D9FF206B019901F04FFD39
-:1059700013BDF0B587B0051C0C1C04920593002BD9
-:1059800003DD08220B7E13430B766B461B8AE383F1
-:10599000EB6A1B78002B06D1286B211C049A059B0F
-:1059A00001F025FF33E00026371CEA6A138D9E4282
-:1059B00023DAD26AF300D31803931B78033B012B3D
-:1059C00019D800230293029A238D9A4213DA029B7C
-:1059D000E26ADB00D3181A78042A09D1039A5B68BB
-:1059E0005168994204D15288286B01F0E2FB0137DB
-:1059F000029B0133E6E70136D7E7002FCCD0059BA9
-:105A0000286B0093211C3A1C049B01F005FF07B092
-:105A1000F0BD73B51D1C0B781A32061C93420ED1D3
-:105A2000081C01A9FFF778F9019B041E9C4209D0CC
-:105A3000301C211CA847201CFFF764F9F4E7002B59
-:105A400000D0A84773BD30B5041C85B0081C03A95D
-:105A5000FFF729F96379051C012B08D1E36A201CA3
-:105A60005B7E0399009302222B1CFFF768FF039BC8
-:105A7000A26A9B009958201C2A1C1423E7F72EFECB
-:105A800005B030BD7FB5041C081C03A9161CFFF728
-:105A90000AF96279051C012A05D10096201C039998
-:105AA0002B1CFFF74CFF281CFFF72CF9039BA16A66
-:105AB0009B005D58021C291C201C0C23E7F70EFEDE
-:105AC000286904B070BD10B5C36A041C5A7EFFF784
-:105AD000D9FF011C201CE7F7C9FD10BD1FB50368E5
-:105AE000002B0DD100290BD00B78192B08D9041CE1
-:105AF00003AB081C02AA01A9FFF735F9029B23603A
-:105B00001FBD38B5051C081C0C1CFFF7FBF8011C59
-:105B1000281CE7F787FF281C211CE7F783FF38BD07
-:105B200010B5041CE7F77EFF206B01F092FC10BD5E
-:105B300010B5041CE7F776FF206B01F0C1FC10BD27
-:105B400038B5051C141CA14204D0281CE7F76AFFD5
-:105B5000011CF8E738BDF0B5041C85B0081C0D1C0D
-:105B6000171CFFF7CFF8FFF7D2F803A9FFF79BF850
-:105B70006379061C012B08D1E36A201C5B7E039924
-:105B800000933A1C2B1CFFF7DAFE039BA26A9B00D2
-:105B900099580022201C131CFFF7EBFE301CFFF766
-:105BA000B1F8011C201CE7F73DFF206B01F01CFD44
-:105BB0000022206B0121131C01F04AFE05B0F0BD4C
-:105BC00038B5041C0D1E954204D1006B0F21EBF774
-:105BD0003FF925E00B78A82B0DD1006B0F21EBF7D7
-:105BE00037F9281CFFF7D3F8002819D1281CFFF734
-:105BF0008EF8011C0CE0A92B10D1081CFFF787F8C8
-:105C0000011C201CE7F70EFF0378011CAA2B07D00C
-:105C1000201CE7F707FF206B032103E0E7F702FFF3
-:105C20000221206B01F0BCFD38BD70B50E1C151CA7
-:105C3000041C0F21006BEBF70BF9311C2A1C201CF4
-:105C4000FFF7BEFF70BD38B5151C041CE7F7EAFE70
-:105C5000FFF75DF82A1C011C201CFFF7B1FF38BDBF
-:105C6000F8B5051C161C1F1C0C1E02D0E7F7DAFE47
-:105C70000124BE4206D0311C281CE7F7D3FE0134B4
-:105C8000061CF6E7286B211C01F025FDF8BD10B5B8
-:105C90000C1C131C0021221CFFF7E2FF10BDF8B5FD
-:105CA000041C171CE7F7BEFE051CBD4213D0A91C3F
-:105CB000201C6E78E7F7B6FE0721051C206B312EFD
-:105CC00006D00821342E03D00921332E00D00A211A
-:105CD00001F0DEFCE9E7F8BDF8B5051C161CE7F796
-:105CE000A1FE041CB4420DD0A11C281C6778E7F764
-:105CF00099FE0521041C286B2F2F00D0062101F0EE
-:105D0000C7FCEFE7F8BDF8B5051C161CE7F78AFEDF
-:105D1000041CB4420DD0A11C281C6778E7F782FE52
-:105D20000321041C286B372F00D0042101F0B0FCA4
-:105D3000EFE7F8BDF8B5051C161C1F1CE7F772FE4F
-:105D4000041CB44209D0211C281CE7F76BFE391C47
-:105D5000041C286B01F09CFCF3E7F8BD08B5022396
-:105D6000FFF7E8FF08BD08B50123FFF7E3FF08BD13
-:105D700008B50023FFF7DEFF08BD10B5041CE7F7E8
-:105D800051FE206B062101F076FC10BDF7B5041C16
-:105D90000D1C171C06690193731C0361BD420CD0D6
-:105DA000291C201CE7F73EFE051EBD42F6D0206BE5
-:105DB0000199321C01F0D8FBF0E7311C206B01F097
-:105DC00081FAF7BD08B50023FFF7E0FF08BD08B56D
-:105DD0000123FFF7DBFF08BDF0B5041C85B00D1CE7
-:105DE000081C111CFEF782FF291C0290201CE7F7FB
-:105DF00019FE029B061C032B06DD01230393236976
-:105E000001930133236102E00023039301930127EF
-:105E1000029A7B1C934246DA3378012B18D17078B2
-:105E2000B11C36380B2811D8F3F7C6FD2110061027
-:105E3000101010100A0C080E1A2519E01B2517E087
-:105E40001C2515E01D2513E01E2511E01F250FE080
-:105E50002225812B06D0301CFEF799FF023D002839
-:105E600000D10335301CFEF74DFF011C00E0192561
-:105E7000201CE7F7D7FD029B0237061C9F4205DA7C
-:105E8000206B01F009FB206B01F03CFB206B291C0F
-:105E900001F0FEFB029B9F42BADA206B0021019ABF
-:105EA00001F062FBB4E7039B002B18D02569206B3F
-:105EB0006B1C2361291C01F03AFB206B019901F056
-:105EC00001FA0121206B01F0F9F9206B01F003FBCD
-:105ED000206B01F0F5FA206B291C01F0F3F905B0F5
-:105EE000F0BDF7B5041C0D1C171C914203D3111C07
-:105EF000E7F798FD37E00669731C03610B78702B98
-:105F000015D1081CFEF703FF011C201CE7F78AFDD2
-:105F1000311C0190206B01F038FB201C01990022FC
-:105F2000E7F784FE281CFEF7EDFE051C09E0E7F705
-:105F300079FD311C051C206B01F027FB206B01F063
-:105F4000BFFA201CFFF7F1FC201C291C3A1CFFF7AC
-:105F5000C8FF206B311C01F06DFBA38B206B013B54
-:105F6000A38301F036FBF7BD13B5041C019101A812
-:105F70005521FEF7E0FE0199021C201CFFF7B1FF3E
-:105F800013BD7FB5041C081C03A9151CFEF78BFE6E
-:105F90006379061C012B06D10095201C039907226A
-:105FA000331CFFF7CCFC206B01F049FA039BA26A7B
-:105FB0009B009D580022201C131C291CFFF7D9FCB4
-:105FC0002969206B01F0F8F9301CFEF79BFE03787D
-:105FD000011CB53B581E834100225B421940201C26
-:105FE000A2710223E8F7FEF8286904B070BD10B56D
-:105FF000C36A041C5A7EFFF7C4FF011C201CE7F78C
-:1060000035FB10BD914292411140002208B5131C8E
-:10601000E8F7E8F808BDF0B5051C0E1C171C85B0A4
-:10602000BE4233D0301CFEF76DFE041EBC4225D0AC
-:106030003378A22B22D10378A02B1FD1301CFEF77E
-:1060400066FE0190201CFEF7A2FE0026B04203D19E
-:10605000201CFEF75CFE061C03A90198FFF75DFCFF
-:10606000286B039901F0DFF9281C311C0122002361
-:10607000E8F7B8F8201CFEF745FE03E0281C311CA9
-:10608000E7F7D0FC0023061CAB71C9E705B0F0BDF3
-:10609000F0B5041C056985B003936B1C03610F1CEC
-:1060A000006B291C161C01F088FA201CFFF73DFC30
-:1060B000002E0DD1206B032101F000F9391C201CAA
-:1060C000E7F7B0FC0321206B494201F0F7F807E045
-:1060D0000A9B201C0093391C321C039BE8F746FAEC
-:1060E000206B01F09DFA206B0F21EAF7B1FE206BC7
-:1060F000291C01F0E7F80B99201CE7F793FCA38B10
-:10610000206B013BA38301F064FA05B0F0BDF0B54C
-:10611000061C87B0081C0D1CFEF7F4FD03900378E5
-:106120000222191C914369290AD1512103A8FEF7C3
-:1061300002FE0022031C0092301C291C039A14E06A
-:10614000682B20D104A9FEF7E7FD5121059005A891
-:10615000FEF7F1FD041CFEF7D5FD049B984207D124
-:10616000301C291C231C059A0094E8F7FFF912E063
-:10617000201C059FFEF7C6FD00940190291C301CD1
-:106180003A1C231C05E000230190291C301C1A1C1A
-:106190000093FFF77DFF07B0F0BD08B51622172367
-:1061A000E8F7F6FB08BD08B50E220F23E8F7F0FB71
-:1061B00008BDF8B5041C0D1C081C111C161CFFF7AB
-:1061C000A4FB002802D0206B002139E02B789A2B09
-:1061D00030D1281CFEF79BFD051CFEF793FD0278CD
-:1061E000131C6333DBB2012B13D8FEF790FD071CA1
-:1061F000291C201CE7F716FC201C391C321CFFF759
-:106200009FFC311C381C246BFEF770FD411C201CC8
-:1062100016E0201C291CBE2A03D1BB3AFFF79BFCC9
-:1062200010E0E7F7FFFB011C201CE7F7FBFB206BEE
-:10623000022105E0291C201CE7F7F4FB0121206B5B
-:1062400001F056FAF8BDF8B5051C0C1C081C111C11
-:10625000161CFFF75AFB071E04D00021281C0A1C3D
-:106260000B1C1CE0201CFEF752FD041CFEF74AFD2F
-:106270000278131C6333DBB2012B05D8FEF747FD10
-:10628000211C021C281C09E0281CBE2A04D1211C48
-:10629000B83AFFF760FC04E0391C221C331CFFF7FE
-:1062A000DFFCF8BD38B5041C4D780231E7F7BAFBC6
-:1062B000206B03212F2D03D00421302D00D0052188
-:1062C00001F0D9F938BD38B5041C0D1C081C111C8F
-:1062D000FFF71BFB002802D0206B002116E02B7873
-:1062E0004A2B0DD1281CFEF712FD011C201CE7F7DC
-:1062F00099FB011C201CE7F795FB206B022105E0B0
-:10630000291C201CE7F78EFB0121206B01F0C2FA4B
-:1063100038BDF0B5061C87B00D1C141C002903D134
-:1063200001213068216022E000220B780192562B77
-:106330000CD1081CFEF7EBFC051CFEF7E3FC211C4E
-:10634000FFF7EBFA002DEBD0012301932B78002B04
-:10635000E6D00A3B281C0F2B0CD805A9FFF7DDFA65
-:10636000019B002B01D1059B23603068059900F04B
-:10637000B9FF54E002A9FEF7CFFC019B051C002BDE
-:1063800002D1211CFFF7C9FA01242F1C6442029B91
-:106390009F420AD0381C05A9FFF7BFFA071C0598D1
-:1063A000FEF778FE01342418F1E7201C03A9FEF75C
-:1063B00046FE2F1C041C029B9F4215D0AF4202D9FF
-:1063C0002E2323700134381C04A9FFF7A6FA05A96F
-:1063D000071C0498FEF768FE059A011C201C04F0B7
-:1063E000D9FE059BE418E6E70398FEF733FE011C8F
-:1063F000306800F077FF019B002B10D0281CFEF7BF
-:1064000081FC041C029B9C4209D005A9201CFFF7BB
-:1064100084FA0599041C306800F0F9FFF2E707B030
-:10642000F0BD37B5041C0D1C006B002100F07EFF91
-:10643000206B0F21EAF70CFD201C291C01AA30302B
-:10644000FFF767FF201C0199E7F710F937BD08B582
-:106450000378012B04D1407810384342584107E0BB
-:10646000032B04D1FEF72EFC431E984100E00020D0
-:1064700008BD08B50378012B02D140780E3803E03F
-:10648000032B04D1FEF71EFC4342584100E00020DC
-:1064900008BDF0B5041C85B0081C0E1C151C01932A
-:1064A000FFF7E7FF002850D1301CFFF7D0FF00288E
-:1064B00052D13378192B55D9301C03A9FEF72CFC87
-:1064C0003378071C7B2B20D1002D22D12669731C29
-:1064D0002361381CFEF716FC039B984208D001226A
-:1064E000391C6A40201C331CFFF7D3FF071CF0E760
-:1064F0002A1C391C019B201CFFF7CBFF051C311CFB
-:10650000206B00F0DFFE281C37E07C2B0CD1002D27
-:10651000DCD10398874230D0391C201C2A1C019BF7
-:10652000FFF7B7FF071CF4E77E2B07D10122201CE1
-:106530006A40391C019BFFF7ACFF1EE0962B11D17E
-:10654000301CFEF724FC002806D0002D06D1206B5D
-:10655000019900F0ECFF01E0002DF8D1301CFEF7AE
-:10656000D1FB0AE0311C201CE7F75CFA061C291C51
-:10657000206B019A00F0E7FF301C05B0F0BDF0B5CC
-:10658000041C0D1C066989B01F1C731C0493B31CEA
-:106590000361311C006B059200F094FE206B04999E
-:1065A00001F02CF8201C291C0022E7F73FFB281CD7
-:1065B000FEF7A8FBFEF7A6FB059B984224D1201C02
-:1065C000391CE7F72FFAE36A1B78032B05D10E9BE2
-:1065D000206B991C01F099F83BE0042B05D10E9B30
-:1065E000206B991C01F0B5F833E0052B05D10E9B0B
-:1065F000206B991C01F0C7F82BE0206B01F058F9D3
-:10660000206B00F05DFF24E00378BF2B09D105A9C2
-:10661000FEF782FB0022011C331C201CFFF739FF10
-:10662000CAE707A9FEF778FBFEF76CFB0390FEF7BD
-:1066300069FB011C201CE7F7F5F9206B00F0D4FF83
-:106640000E9B201C5D1C00950399079A3B1CFFF7CD
-:1066500096FF206B311C00F06AFF206B049900F05C
-:1066600031FE206B00F0D6FF09B0F0BDF7B5041C79
-:10667000081C0F1CFEF746FBFEF749FB25690022AC
-:10668000AB1C011C2361201C2B1CFFF702FF6E1C9E
-:10669000391C0190201CE7F7C5F9311C206B00F074
-:1066A00046FF291C206B00F00DFE0121206B4942A2
-:1066B00000F004FE0199201CE7F7B4F9311C206BAF
-:1066C00000F000FEF7BDF8B50569161C6B1C012231
-:1066D00003612B1C041CFFF7DCFE071C5821206BF8
-:1066E00000F012FD311C381CFFF70FF9061E09D10E
-:1066F000391C201CE7F796F9206B0121321C331C52
-:1067000001F0A6F8206B012101F0C4F8291C206BD0
-:1067100000F0D8FDF8BDF0B589B00792038B07698A
-:106720000493438B7E1C0593C38B07830693BB1C8A
-:106730000361838B4683C383041C081C0D1CFEF776
-:10674000E1FA0290FEF7DEFA0390281CFFF791FEB3
-:1067500000281ED12369281C019301332361FFF710
-:1067600076FE002803D1206B311C00F0E0FE206B88
-:10677000019900F0A7FD0299201CE7F753F9206B5F
-:10678000311C00F09FFD201C291C0122019BFFF7FA
-:1067900080FE6B461B8A079A23836B469B8A638322
-:1067A0006B461B8BE383039B934203D0201C191C75
-:1067B000E7F738F9206B391C00F084FD09B0F0BD13
-:1067C000F0B5041C236985B000930133081C2361D4
-:1067D00003910192FFF74DFE061E07D00398FEF7C6
-:1067E00091FA0390FEF78EFA039030E02569039842
-:1067F0006B1C2361FFF72BFE321C03992B1C071C1B
-:10680000201CFFF746FE011C0390201CE7F70AF945
-:10681000061C0390002F60D10199FFF776F800283D
-:1068200009D1206B00F045FD00280CD1206B0099A8
-:1068300000F07DFE07E0301CFEF764FA0199FFF7D7
-:1068400064F80028EDD0206B291C00F03BFD039B71
-:10685000019A934241D003A84821FEF76CFA071C25
-:106860000398B84232D0FEF752FA0390FFF701FEC8
-:10687000051E07D00398FEF745FA0390FEF742FA8B
-:106880000390EDE726690398731C2361FFF7DFFD92
-:10689000331C029003992A1C201CFFF7FAFD011CEF
-:1068A0000390201CE7F7BEF8029B0390002B14D145
-:1068B000206B00F0FEFC002803D1206B009900F053
-:1068C00036FE206B311C00F0FDFCC9E7019B9F42A6
-:1068D00003D0201C391CE7F7A5F8206B009900F0C5
-:1068E000F1FC05B0F0BD70B50B78161C0A3B4A7878
-:1068F0001B021343B53B5A4253410C1C8371321C9B
-:10690000051CFFF71DF9201C311CFEF7EFF90328C9
-:1069100003D1286B0B2100F0BBFE70BDF0B587B032
-:1069200001910B78041C0D1C012B01D0532B02D1BB
-:106930000595002509E00026502B1AD1081CFEF70A
-:10694000E6F90590FEF7DEF9051C05A83921FEF7EA
-:10695000F2F90026071C0598B8420AD00378012BEB
-:1069600027D143784A2B24D10136FEF7CBF9059085
-:10697000F1E70198FEF7C6F901900778012F1AD1C7
-:106980004378312B17D1206B311C00F0CFFC206BEA
-:10699000022100F011FD206B391C00F09CFE201C30
-:1069A000291C303005AAFFF7B4FC206B00F0B3FCC3
-:1069B0004CE00336D9E7311C206B00F0B7FC01A88E
-:1069C0003E21FEF7B8F90027019E0090009B9E42F1
-:1069D0000FD2301CFEF79BF905A9FEF79EFF206B36
-:1069E000059900F0E9FC301CFEF78CF90137061C14
-:1069F000ECE7206B391C00F06EFE201C291C3030A7
-:106A000002AAFFF786FC019D009B9D421BD2281C19
-:106A100003A9FEF781F904A9FEF77FFF0499051C7D
-:106A2000206B00F06CFC039B9D4202D1201C04995A
-:106A300006E0281C05A9FEF770FF051C201C05991F
-:106A4000E6F714FEE0E7206B00F03AFD07B0F0BD7A
-:106A500008B5E8F7CFFBEDF7A1F8E8F709FC002847
-:106A6000F9DB08BD436870B5CC18036801269C4269
-:106A700018D9067BB607F60F13D1072340349C4381
-:106A80000834051C211C8068FEF7F6FC0122002852
-:106A900003D12B7B13432B7304E02C60A860161CDE
-:106AA00000E00026301C70BD037B70B5041C0E1C7A
-:106AB000151CDB0703D5237B9B0706D414E0111CB0
-:106AC000FFF7D0FF002805D1F5E763682568AB42E2
-:106AD0000AD2ED1AA3686268311C98182A1C04F0C7
-:106AE00062FB63685D19656070BD10B5041C002908
-:106AF00000D10131002321606360081CFEF7A6FC71
-:106B00000122A060237B002801D1134302E09343BC
-:106B100002229343237310BD38B50D1C041C0131B0
-:106B2000FFF7E3FF656038BD002382600122436008
-:106B3000037B016093439218134303737047037BF5
-:106B400010B5041C9B0702D48068FEF7A6FC002346
-:106B5000A36010BD002301224360037B93430373B2
-:106B60007047007BC007C00FC0B27047027B002394
-:106B7000D20700D48368181C7047027B0023D20719
-:106B800000D44368181C704738B5037B041C0020F0
-:106B90009B0711D423680D1CA068C918FEF76CFC74
-:106BA000002804D10122237B1343237304E02368CC
-:106BB000A060ED182560C01838BD38B5037BDB0731
-:106BC00001D500200AE00D1C041CFFF74BFF002834
-:106BD000F7D06368A068E9186160C01838BD38B59F
-:106BE000037BDB07DD0F002B01D0002009E0012132
-:106BF000041CFFF737FF0028F7D0A36862689D5494
-:106C0000A06838BD10B50C1C0121FFF7D6FF002885
-:106C100000D0047010BD38B5051C081C0C1C04F015
-:106C2000DBFB211C021C281CFFF73EFF38BDF8B51A
-:106C3000037BDB0701D5002019E047680C1EBC422E
-:106C400000D93C1C161C051C002A0ED0111CFFF795
-:106C500009FF0028EFD0A968A01908183A1B0919E4
-:106C600004F0A1FA6B689E196E60A8680019F8BD5F
-:106C700010B5141C0122FFF7DAFF002800D00470C1
-:106C800010BD10B5141C0122FFF7D1FF002800D061
-:106C9000047010BD037BDB07DB0FDBB2002B06D1DA
-:106CA0004268914201D9436001E0521A4260704744
-:106CB000037B70B5DB0714D44368994211D28E1858
-:106CC0009E4201D341600CE0151C0A1C041C816823
-:106CD00088189A1A521B891904F065FA63685D1BBB
-:106CE000656070BD08B5DDF77BF9012340001843EE
-:106CF00008BD8023F0B55B0587B01D69E8F7FCFC93
-:106D0000037805AFFD2B0BD1E8F7F6FC03783B7059
-:106D1000E8F7F2FC041CE8F7FBFC019500901BE08F
-:106D2000E8F7F6FC03783B70E8F7F2FC041CE8F7A0
-:106D3000E3FC6B42009001930EE03378002B05D00A
-:106D4000E8012018311C8022E3F722FF013580364C
-:106D5000039B9D42F1D1029C009B9C4210D0019B61
-:106D6000201CE3180293FEF7EEFA201CFEF7EBFA64
-:106D700080235B051B69029EDB0903930025E7E77F
-:106D8000201CFEF7E0FA201C391C0122E3F700FF6B
-:106D9000E8F728FD07B0F0BD38B5051C04F01CFB72
-:106DA0000022011C131C281CE8F728FE041E05D035
-:106DB000281CFEF73BF9211CE8F7AAFF38BDFC3080
-:106DC000C1600261704738B5041C012500236A1EAA
-:106DD000D2B29200A218FF32507C7F2806D1023333
-:106DE0009B001855201CE1F7E3FD38BD7E280AD131
-:106DF0007F2202339B001A55201CE1F7D9FD0023A6
-:106E00000135EDB2E3E70028FAD099006118087265
-:106E1000907C01334872D07CDBB28872127DCA72DA
-:106E2000EEE7F0B585688BB0161C029352004B1943
-:106E3000041C0193981853180F1C0393052814D8A9
-:106E4000211CAD002A1C0C3105A804F0A3F905ABE8
-:106E50005819039B02999A0004F09CF96068019903
-:106E6000321C05ABE0F712FB1DE08000FEF7EEFAE6
-:106E7000211C051CA3680C319A0004F08BF9A3684F
-:106E800002999800039B28189A0004F083F9A368DC
-:106E90006068F918321C2B1CE0F7F8FA041C281C57
-:106EA000FEF7FBFA201C0BB0F0BD0B6870B58668CE
-:106EB000DC00B34209D2C268013312191568002DF3
-:106EC00001D0042D03D10834F3E7002200E00B6069
-:106ED000101C70BD011C08B50C318068FFF7E5FF80
-:106EE000031E00D0186808BD1FB5011C041C0C311E
-:106EF0008068FFF7DAFF031E11D02279012A0BD038
-:106F0000022A0BD01A6802A902925B680220019340
-:106F10000393DEF7C7FA02E0186800E0586804B08F
-:106F200010BD0B6810B504334C680022032800D153
-:106F30008A68181C211C0123E9F7A4FC10BD0B680A
-:106F400010B504334C680022032800D18A68181C4D
-:106F5000211C0223E9F796FC10BD0B6810B5043321
-:106F60004C680022032800D18A68181C211C0023C9
-:106F7000E9F788FC10BD10B50C7A031C0020012C29
-:106F800005D11F2B03D1181C4968E9F7C5FC10BDBA
-:106F900038B5051C1020FEF759FA041C291CE9F726
-:106FA000ADFD201C38BD38B5051C8068FFF7F0FF2B
-:106FB0002B68416803606B68041CDB08DA00072358
-:106FC0000B401343436001232A791A40111C0279B4
-:106FD0009A430A4302218A4302712A79CA40134024
-:106FE0009A00037949188B4313430371AB68E9682E
-:106FF000DA00C06804F0CEF8201C38BD4068C00834
-:10700000704738B5151C041C01220430E3F75AFC04
-:107010004560201C38BD10B5041C0022022304303A
-:10702000E9F730FC201C10BD0430704773B5141C08
-:107030006A46551D0B1C291C7F22013D22402A70E7
-:10704000E409F9D16E46491B9847731B04339C42EF
-:1070500006D080212A5D49420A4302550134F6E7F1
-:10706000327901AB5D1B425573BD4379012B09D0C9
-:107070008368C918C36881605A8C914200DD5984C5
-:107080000023837170474279036A032A02D8591892
-:10709000016203E0026BC9180162D018704710B595
-:1070A0000C1C0121FFF7EFFF047010BD10B54279F1
-:1070B000836A032A02D85B18836205E0426A046B84
-:1070C0009A18CB188362A01810BD10B50C1C0121B2
-:1070D000FFF7ECFF047010BD38B5151C041C01212E
-:1070E000FFF7C3FF2A1C201C1B21E9F779FD38BDDF
-:1070F00038B50D1C041C0121FFF7B7FF2A1C201C0A
-:107100001C21E9F76DFD38BD38B50D1C041C0121AB
-:10711000FFF7ABFF2A1C201C1D21E9F761FD38BDDC
-:10712000012138B5151C041C4942FFF79EFF2A1C9B
-:10713000201C2321E9F754FD38BD38B50D1C012171
-:10714000041C4942FFF791FF2A1C201C2421E9F767
-:1071500047FD38BD38B50D1C0121041C4942FFF71D
-:1071600084FF2A1C201C2521E9F73AFD38BD08B50B
-:107170002821E9F735FD08BD08B52921E9F730FDDB
-:1071800008BD38B50D1C041C0021FFF76EFF2A1C3A
-:10719000201C2A21E9F724FD38BD38B50D1C041C3C
-:1071A0000021FFF762FF2A1C201C2B21E9F718FDA4
-:1071B00038BD38B50121141C051CFFF756FF0F2CF4
-:1071C00006D8211C5039C9B2281CFFF77EFF04E005
-:1071D000281C1A21221CE9F703FD38BD012138B50E
-:1071E0004942141C051CFFF740FF0F2C06D8211C38
-:1071F0004039C9B2281CFFF768FF04E0281C22218F
-:10720000221CE9F7EDFC38BD38B5041C151CFFF74E
-:107210005CFF0322A36A201C03339343A36204216F
-:10722000FFF744FF056038BD38B543790D1C0024D5
-:10723000032B06D9836A033CE41AC3699200D3582E
-:10724000E4180321FFF732FF4470240A05708470AC
-:1072500038BDF8B5069C151C079AC91A1F1C630097
-:10726000061C2402C91A002A04D00239FFF7FDFEC9
-:10727000013501E0FFF7F9FE3A1CE9B2301C224368
-:10728000E9F7AEFCF8BD08B53820FEF7F1F808BD07
-:1072900010B5041C81618800FEF7D8F8E06110BDCC
-:1072A00010B5041CC069FEF7F8F8201CFEF7F5F8CD
-:1072B00010BD8079431E9841C0B270478368591849
-:1072C0008160704738B5041C0D1C0021FFF7CDFE0E
-:1072D0006379012B05D0032B03D8A26AE369AD00C3
-:1072E000EA5038BD38B50D1C0121041C4942FFF796
-:1072F000BCFE2A1C201C6821E9F772FC38BD38B599
-:107300000D1C041C0121FFF7B0FE2A1C201C692162
-:10731000E9F766FC38BD012110B5041C4942FFF7AE
-:10732000A4FE201C6A21FFF7D0FE10BDF7B50D1C8E
-:107330000121061CFFF799FE2B1C10333F2B06D8AA
-:10734000291C8039C9B2301CFFF7BFFE33E014217D
-:10735000301CFFF7BAFE6B465C1D211C2A1C7F27E0
-:10736000ED11013C3A406B1C2270012BF6D8231C16
-:107370004020013504D1024208D1013C277005E0CC
-:10738000024203D00022013B013C1A706D46091BEA
-:10739000301CFFF78BFE00232A1B0432934206D0D9
-:1073A0008026E15C76423143C1540133F6E72A7905
-:1073B00001AB1C1B0255F7BD38B50D1C041C012187
-:1073C000FFF753FE2A1C201C1621E9F709FC38BDE3
-:1073D00038B5041C0D1C0121FFF747FE201C1721A6
-:1073E000FFF773FE0322A36A201C03339343A362B7
-:1073F0000421FFF75BFE056038BD10B5041C0121B8
-:10740000FFF733FE201C1821FFF75FFE10BD38B5D3
-:107410000D1C041C0021FFF728FE2A1C201C1E2125
-:10742000E9F7DEFB38BD38B50D1C041C0121FFF760
-:107430001CFE2A1C201C1F21E9F7D2FB38BD10B509
-:10744000041C0121FFF711FE201C2021FFF73DFE47
-:1074500010BD012110B5041C4942FFF706FE201C97
-:107460002121FFF732FE10BD38B50D1C0221041C8E
-:107470004942FFF7FAFD2A1C201C2621E9F7B0FB40
-:1074800038BD032110B5041C4942FFF7EEFD201C56
-:107490002721FFF71AFE10BD10B5041C0121FFF7CC
-:1074A000E4FD201C3021FFF710FE10BD10B5041CB8
-:1074B0000221FFF7DAFD201C3121FFF706FE10BD87
-:1074C000012110B5041C4942FFF7CFFD201C3221D9
-:1074D000FFF7FBFD10BD10B5041C0021FFF7C5FD33
-:1074E000201C3321FFF7F1FD10BD38B5041C0D1C25
-:1074F000FFF783FF201CFFF7EEFF291C201CFFF77E
-:10750000B3FF38BD10B5041C0021FFF7AEFD201CF1
-:107510003421FFF7DAFD10BD10B5041CFFF76DFF35
-:10752000201CFFF7EFFF201CFFF7ABFF10BD38B5A5
-:107530000D1C041C0021FFF798FD2A1C201C35217E
-:10754000E9F75CFB38BD70B50E1C0121041C4942F3
-:10755000151CFFF78AFD201C3621002E00D1372193
-:107560002A1CE9F74BFB70BD70B50E1C0121041CF1
-:107570004942151CFFF779FD201C3821002E00D14F
-:1075800039212A1CE9F73AFB70BD38B50D1C041CE3
-:107590000421FFF76AFD2A1C201C3D21FFF744FE51
-:1075A00038BD38B50D1C041C0021FFF75EFD2A1CF8
-:1075B000201C3F21FFF738FE38BD38B50D1C041CD8
-:1075C0000021FFF752FD2A1C201C4021FFF72CFE52
-:1075D00038BD012110B5041C4942FFF746FD201CAF
-:1075E0004121FFF772FD10BD10B5041C0021FFF70B
-:1075F0003CFD201C4221FFF768FD10BD38B50D1C75
-:10760000041C0121FFF731FD2A1C201C4321FFF738
-:107610000BFE38BD012108B54942FFF726FD08BD24
-:1076200010B5041C0021FFF720FD201C4421FFF7AA
-:107630004CFD10BD38B5041C0D1CFFF7F1FF201CDC
-:107640000F21E9F705FC291C201CFFF73BFE042154
-:10765000201C4942FFF709FD201C3E21FFF735FDA4
-:1076600038BD10B5041C0021FFF7FFFC201C45218C
-:10767000FFF72BFD10BD38B50C1C0021051CFFF7D2
-:10768000F4FC211C3039281CC9B2FFF71EFD38BD9F
-:1076900070B5051C0C1E222C05D00026232904D110
-:1076A0000136033C01E001261F240121281C494228
-:1076B000FFF7DBFC211C2939C9B2281CFFF705FDA7
-:1076C000002E07D0281C0021FFF7CFFC281CD62154
-:1076D000FFF7FBFC70BD38B50C1C0121051C091B14
-:1076E000FFF7C3FC281C5021221CE9F779FA38BDAA
-:1076F00038B50C1C0121051C091BFFF7B6FC281C22
-:107700005121221CE9F76CFA38BD38B50D1C012156
-:10771000041C4942FFF7A9FC2A1C201C5221E9F74E
-:107720005FFA38BD38B50D1C041C0121FFF79DFC24
-:107730002A1C201C5321E9F753FA38BD022110B549
-:10774000041C4942FFF791FC201C5421FFF7BDFCAB
-:1077500010BD38B50D1C0221041C4942FFF785FC01
-:107760002A1C201C5521E9F73BFA38BD38B50C1C02
-:107770000121051C091BFFF778FC281C5621221C3F
-:10778000E9F72EFA38BD38B50D1C0121041C494219
-:10779000FFF76BFC2A1C201C5721E9F721FA38BDA2
-:1077A00038B50C1C0121051C091BFFF75EFC281CC9
-:1077B0005821221CE9F714FA38BD38B5051C0C1CF9
-:1077C0000139FFF752FC281C5921221CE9F708FA5D
-:1077D00038BD70B5151C061C0C1C8918FFF745FC3C
-:1077E0002A02301C22435A21E9F7FAF970BD38B554
-:1077F0000D1C041C13430121002B04D1FFF735FCA1
-:10780000201C602104E04942FFF72FFC201C61216D
-:107810006A69FFF7F9FC38BD70B50E1C0499041CA9
-:107820000B43D5B2002B06D10121891AFFF71DFCAD
-:10783000201C622104E0D143FFF717FC201C6321C8
-:107840007269FFF7E1FC291C201CFFF73EFC70BDAC
-:1078500013B50C1C0092019300216422231CFFF736
-:10786000F8FC13BD13B50C1C012100920193494291
-:107870006622231CFFF7EDFC13BD012110B5494220
-:10788000041CFFF7F2FB0123201CA3715B21FFF70F
-:107890001CFC10BD38B5051C0C1C4942FFF7E5FB6C
-:1078A000281C0221FFF702FC5C234470037038BDE2
-:1078B00010B5041C0021FFF7D8FB0421E268201C4E
-:1078C000137E0B4313765931FFF7FFFB10BD0121E7
-:1078D00010B5041C4942FFF7C8FB0421E268201CD4
-:1078E000137E0B4313765A31FFF7EFFB10BD83680D
-:1078F0000633836070478368053B8360704713B528
-:10790000041C4068DFF70AFF021E0BD0A3680220A8
-:10791000591CA16001215B000B4369460093019251
-:10792000DDF7C0FD16BDF8B5071C0C201D1C0E1C94
-:10793000FDF78CFD0760041C2868DFF7A1FE60607E
-:107940000020012E02D96868D9F776F9A060201CC2
-:10795000F8BDF0B50E1C171C041C01798288C907FC
-:10796000C90F87B0C9B21D1C5208C3880091301CD2
-:10797000391CDCF729FE2379DB070AD5B200AA18E7
-:1079800003A8391CFDF714FCA368301C291C03AAAA
-:1079900018E0A3885B08032B16DCE288934213D11E
-:1079A000012B06D0022B08D0002B09D1A3689847E1
-:1079B0000EE0A368286898470AE0A36803CD06E0B4
-:1079C000A36807CD984703E0301C291CA36898479B
-:1079D00007B0F0BDF0B5061C1C1C00230125081CD7
-:1079E0000F1C111C726885B00093131CDCF7ECFDB2
-:1079F000B3681D43002F01D1A84736E02068012F4E
-:107A000003D1E9F7E7FAA8472FE0022F09D1E9F7F8
-:107A1000E1FA071C6068E9F7DDFA011C381CA84789
-:107A200023E0032F0ED1E9F7D5FA071C6068E9F7C8
-:107A3000D1FA0290A068E9F7CDFA0299021C381C2D
-:107A4000A84712E0E9F7C6FA071C6068E9F7C2FA2E
-:107A50000290A068E9F7BEFA0390E068E9F7BAFA85
-:107A60000299031C039A381CA847F168E3F7BAF897
-:107A700005B0F0BD07B5019001A8FDF738FA01A8DF
-:107A8000FDF735FA0EBD026813783E2B05D83C2B66
-:107A900005D2212B07D13E2301E0402B03D1013237
-:107AA0000260181C00E040207047F7B5051C06680E
-:107AB000741C20780194D8F765FEA71B031C0134C1
-:107AC0000028F6D12868391C0A22E1F7B7FB019B90
-:107AD00040102B60FEBD73B5DBF752FA009068468C
-:107AE000FFF7D1FF0025061C009B01241A78002A0D
-:107AF00028D001941878D8F745FE002803D06846AE
-:107B0000FFF7D3FF041C009B1A780023732A13D1BC
-:107B1000231C012410E0002B06D1009B301C197897
-:107B200001AADDF7A5F8031C019A013C501E451976
-:107B3000524215405D190023002CECD1009B01330B
-:107B40000093D1E76800204376BDF0B587B004927A
-:107B50000EAA12780F1C05920FAA12781C1D039210
-:107B6000039B061C0C99201C0D9ADEF74DFD3B680B
-:107B7000051E9D4203D9FDF769FC30603D60356804
-:107B8000039B01950093201C059B0C990D9AFCF713
-:107B9000C7FD049B1860281C07B0F0BD08B5043071
-:107BA000FCF761FD08BD0122031C104004D05810F1
-:107BB0000AD4431E984109E09968002906D0187933
-:107BC00010404042104301E0012040427047D3B5CD
-:107BD0000F1C061CE9F704FC0123041C0093321C53
-:107BE0003B1C0430FCF732F9201CD6BD08B543001D
-:107BF0001A1C424002D40120184302E0C117FFF7CB
-:107C0000E6FF08BDD3B50F1C061CE9F7E9FB00230E
-:107C1000041C0093321C3B1C0430FCF717F9201C99
-:107C2000D6BD08B5830F03D140000133184302E0ED
-:107C30000021FFF7E7FF08BDF0B585B0041C0F1C5D
-:107C4000161C0393E9F7CCFB039B051C00932168EA
-:107C5000331C3A1C0430FCF785F92368181820609F
-:107C6000281C05B0F0BD08B5C30701D5401002E0DF
-:107C70000430FCF7E3FC08BD08B5C30703D540108A
-:107C8000F2F7A6FF02E00430FCF72BFD08BD38B583
-:107C9000051C081CDFF7F4FC041C201CDFF73EFD6C
-:107CA000011E04D0281D0122FDF7AEFAF5E738BD0C
-:107CB00010B5041CE9F74AFE201CE9F7D1FD236842
-:107CC000036010BD38B5041C0D1CE9F73FFE201CF5
-:107CD000FFF7EEFF041C291CFFF7D9FF201C38BD5D
-:107CE00070B5051C0E1CE9F731FE281CE9F7B8FD3C
-:107CF000041C311CE9F778FE2B68201C236070BD42
-:107D0000F7B50D1C0190002A04D00868E9F74AFE77
-:107D10002C6807E00C68201CE9F718FE201CE9F726
-:107D20009FFD041C0126019B9E4215D2B300E8581A
-:107D3000844203D1201CE9F78BFE0BE0DFF7A0FCA7
-:107D4000071C381CDFF7EAFC011E03D0201CE9F7F2
-:107D500071FEF6E70136E6E72B68201C1B682360FE
-:107D6000FEBD08B50022FFF7CBFF08BD30B5846823
-:107D7000C36865689900AB420AD2E2680133525881
-:107D8000002A03D0042A01D0C36002E00431F2E7E4
-:107D90000022101C30BD08B50122E9F7F1FE08BD34
-:107DA00008B50022E9F7ECFE08BD08B50430012251
-:107DB000FDF72AFA08BDF7B500240F1C051C1E1C90
-:107DC000081C0094111C0123221CDCF7FDFBA742B8
-:107DD00005D1381C391CE9F7B5FE056013E0211CFC
-:107DE000201CE9F7AFFE041C3068DFF749FC061CD5
-:107DF000301CDFF793FC011E03D0201CFFF7D5FFDA
-:107E0000F6E7201C2560FEBD08B5031C0022081CF7
-:107E1000191CE9F7F3FE08BD08B50022E9F7EEFEEC
-:107E200008BDF7B5061C30200D1C171C0193FDF78B
-:107E30001FFB041C06708560C760072E1AD8301C13
-:107E4000F1F7BAFD04060C0E1012150626230CE0FD
-:107E50002B786A780A3B1B0213430AE0932307E05E
-:107E6000282302E0942303E02A23FF3301E0952333
-:107E70005B0023616B461B79202063760423E38437
-:107E8000FDF7E4FAE062201CFEBD10B5041CC06AD8
-:107E9000FDF703FB201CFDF700FB10BD30B50022F1
-:107EA000041C058DAA4207D2E06AD300C0184368BB
-:107EB0008B4202D00132F5E7002030BD70B5061CC0
-:107EC0000D1C141CFFF7EAFF0023002818D1F18CC9
-:107ED000338D8B4208D30631C900F06AFDF7CCFA26
-:107EE000F38CF0620633F384308DF36A421CC000D9
-:107EF00018180023328503704370438045600133B6
-:107F0000237070BD08B54368002B01D0181CFAE738
-:107F1000FFF7C4FF08BD38B543680C1C181E0BD012
-:107F20005D68002D07D0181C211CFFF7B7FF2B1C24
-:107F30000028F5D000E0281C38BD73B50E1C44683D
-:107F40006368002B12D06B46DD1D201C311C2A1CDF
-:107F5000FFF7B4FF2B78002B03D004230370646871
-:107F6000EEE70378022B01D10133037073BD1FB517
-:107F7000041C0122081C01A9D9F71EF8201C019934
-:107F8000029AEAF74FF904B010BD031C013B5A42B4
-:107F9000534141205B4218407047202304304B601E
-:107FA000423308608B600020704710B500F0ACF8D9
-:107FB000021CA0240023C132FF32E40592001351B9
-:107FC0000133011C181C0138C046C046C046C046DB
-:107FD000C046C046C046C046C046C046C046C04671
-:107FE000F1D1A222D200A058C840184010BD08B557
-:107FF0000120EAF713FB08BD022310B584171C40CB
-:10800000013B1C1B802342021B04520AC0151A4369
-:10801000C3B2963B5918002901DD8A4005E00B1CCC
-:1080200000201F3303DB49420A41101C604310BD8E
-:10803000002307B5081C0093111C1A1CDCF7C4FAB6
-:10804000EAF7EEFC0EBD012803D1CB885B00184394
-:1080500000E00020704710B5041C0430EBF730F846
-:108060000121606802F02DF9FFF7C0FD10BD10B5C9
-:10807000041C0430EBF724F80121606802F02FF9AA
-:10808000FFF7B4FD10BD10B5041C0430EBF718F871
-:108090000121606802F031F9FFF7A8FD10BD38B585
-:1080A0000021051C0320DDF7FDF9041C281DEBF75A
-:1080B00007F86868012102F004F9FFF797FD012134
-:1080C000A060686802F00BF9FFF790FD0121E06005
-:1080D000686802F012F9FFF789FD2061201C38BDA5
-:1080E00008B54068F0F728FBFFF780FD08BD08B52C
-:1080F0004068F0F773FBFFF779FD08BD08B5DDF7C1
-:10810000FDFCFFF773FD08BD08B5EBF721F9407BD7
-:1081100040B208BD7047F0B585B00390081C0D1C37
-:1081200000F05BF90526042803DC281C00F055F953
-:10813000061C281C00F05FF90527042803DC281C16
-:1081400000F059F9071C039B02930023019300934D
-:10815000009BB34224DA0024BC420FDA221C281C04
-:10816000009900F02DF9029B1B191871012383401F
-:10817000181C019B013403430193EDE7FB43DB171C
-:108180003B40042B05DC0021029AD2181171013307
-:10819000F7E7009B01330093029B05330293D7E777
-:1081A000F343DB171E4005237343039A0433D318AC
-:1081B000042E08DC002201361A705A709A70DA70A8
-:1081C0001A710533F4E76A46039B92881A8405B056
-:1081D000F0BD73B5061C081C0D1C002403F0FCF850
-:1081E000221C011C231C281C0094ECF7EDFC01232D
-:1081F000011C0093301C9622231CEBF7B7FA73BDC9
-:1082000070B5051C081C161CD8F716FD041C301C84
-:10821000D8F712FD211C021C281CEBF7C7FB012319
-:108220004000184370BD04231A1CA0210320C13252
-:10823000FF329200C90501335050112BF4D1704721
-:1082400010B5141C081C111CEBF7C0FC201C10BD41
-:108250000020F8B5824219D01C1C151C0E1CEBF72F
-:1082600091FC002803D10B23013823600EE0771C1A
-:108270007519EBF793FC7B1E3C1E1870AC4204D0C2
-:10828000EBF780FC01370028F3D1A01BF8BD10B537
-:10829000041C03F0A1F8011C201CEBF797FC10BD97
-:1082A00008B50120ECF744F808BD08B50020ECF74C
-:1082B0003FF808BD0423591A033B8B40191C031CCB
-:1082C000421D1878084003D101339342F9D100E0F0
-:1082D0000120704708B5012803D14868D8F722FE6D
-:1082E00000E0002008BD10B50421041CFFF7E2FFE8
-:1082F000031C0420002B06D1201C0321FFF7DAFF0A
-:10830000431E9841023010BD002210B50369027669
-:108310004269C36093420FD21B78827E0377002AA2
-:1083200001D005230BE0041C181CECF745F9FFF7FE
-:10833000DAFF0130607603E0202303771B3B4376AE
-:1083400010BD05235A435218182A03D1007900079B
-:10835000C00F08E0D308C01843790720024013413A
-:10836000181C01231840704783795A435218530848
-:10837000C018C3790420920002401341181C0F2337
-:108380001840704730B51C1C83795A430423521897
-:108390009500F02152088018221C1D402941AA4056
-:1083A000C3790B401343C37130BD08B5427983795B
-:1083B00000215A4301325210073002F008FF08BD75
-:1083C00008B50379DB0705D5FFF7BBFF0923584341
-:1083D000C0B201E0FFF7C8FF08BD02790523D2074C
-:1083E00000D48379181C704708B5FFF7F6FF012306
-:1083F0004000184308BD02790523D20700D4437911
-:10840000181C704708B5FFF7F6FF0123400018431A
-:1084100008BDF0B50B6887B048680C1C0293D8F70C
-:108420000BFC0090A068D8F707FC0190E068D8F733
-:1084300003FC071C2069D8F7FFFBFE43C543F61772
-:10844000ED1737400540291C381C0497ECF7C2F89B
-:10845000009B019ADC43E4171C40019B0390DB4323
-:10846000DB171A4002980592FFF7B7FF049B009AAA
-:108470009F18874200DD071C0298FFF7BCFF019B95
-:10848000EE18864200DD061C049A3B1B9A4203DC70
-:10849000059BF31A9D4204DD0398FFF786FF00E079
-:1084A0000134BC4211DA059DB542F9DA2A1C029862
-:1084B000211CFFF785FF009A031CA11A019A03985B
-:1084C000AA1AFFF75FFF0135EEE7039807B0F0BD8A
-:1084D000F7B5061CFFF781FF071C301CFFF78BFF69
-:1084E00000900099381CECF775F800240190009B6F
-:1084F0009C4211DA0025BD420CDA291C221C301CDA
-:10850000FFF75EFF291C031C221C0198FFF73AFFAE
-:108510000135F0E70134EAE70198FEBD08B5FFF741
-:10852000D7FF08BDF7B5061CFFF757FF0090301CBA
-:10853000FFF761FF019001990098ECF74BF80024D8
-:10854000071C019B9C4213DA0025009B9D420DDA1B
-:10855000291C221C301CFFF733FF0923291C1B1A7E
-:10856000221C381CFFF70EFF0135EEE70134E8E767
-:10857000381CFEBD08B5FFF7D5FF08BDF7B5051CD3
-:108580000C1C0E1C8379009343790193009B9E423F
-:1085900012DA0027019B9F420CDA3A1C311C281C7E
-:1085A000FFF7E2FE3A1C031C311B281CFFF7EAFE12
-:1085B0000137EFE70136E9E71C1B009B9C420DDA0F
-:1085C0000026019B9E4207DA321C281C211C002336
-:1085D000FFF7D8FE0136F4E70134EEE7F7BDC368D4
-:1085E000426970B5041C93420BD1037E052B08D160
-:1085F000C37E181E4DD0201CFFF786FEA068FFF733
-:10860000D4FEA0680121FFF7B9FF227E637E9A4263
-:1086100016D2207FEBF7D0FF0025061C0421237E15
-:10862000725DCB1A1A41131C0122134008325343C6
-:10863000A0682A1C0135FFF7A5FE052DEED124E028
-:108640009A4222D1E36861695A1CE2608A4206D1EB
-:10865000202323771B3B63760023237615E058788D
-:108660002077EBF7A9FFA17E051C002904D0FF238A
-:108670002376FA3B637608E0FFF71CFE4042207643
-:10868000281CFFF730FE01306076237EA06801339E
-:10869000237670BDF7B5002929DB0E1C041C437935
-:1086A00001938579013DB54210DB0027019B9F4274
-:1086B000F8DA3A1CA91B201CFFF756FE3A1C031CD3
-:1086C000291C201CFFF75EFE0137EFE70025B542AD
-:1086D0000DD00027019B9F4207DA3A1C201C291C61
-:1086E0000023FFF74FFE0137F4E70135EFE7F7BD51
-:1086F00070B5041C0D1CFFF770FE4342061C201CC5
-:108700009D4201DDB54206DBFFF775FE011C301C02
-:10871000EBF760FF0CE0FFF7DBFE041C002D03DB32
-:10872000291CFFF72BFF02E06942FFF7B3FF201C73
-:1087300070BD10B5041C081CD8F77EFA011C201C63
-:10874000FFF7D6FF10BD10B5041C081CD8F774FA4B
-:108750004142201CFFF7CCFF10BDF0B587B00D1CC7
-:108760000490FFF73AFE01900498FFF744FE43425D
-:10877000041CAB4200DA2B1CA34200DD231CDA43AD
-:10878000D2171A4005921A190392A24200DD0394EF
-:108790005B420093DB43009ADB171A400198211CCF
-:1087A0000092EBF717FF00250290009B9D420DD031
-:1087B0000026019B9E4207DA311C02982A1C0023E6
-:1087C000FFF7E0FD0136F4E70135EEE7059D009B7C
-:1087D000059A9B1A5F19039B9D4213DA0026019BA1
-:1087E0009E420CDA311C04982A1CFFF7E9FD311C6B
-:1087F000031C3A1C0298FFF7C5FD0136EFE701356F
-:10880000E5E70137A7420BDA0025019B9D42F8DA24
-:10881000291C02983A1C0023FFF7B4FD0135F4E748
-:10882000029807B0F0BD10B5041C081CD8F704FA74
-:10883000011C201CFFF791FF10BD10B5041C081C83
-:10884000D8F7FAF94142201CFFF787FF10BDF8B5B1
-:10885000071C081CEBF7B0FE0025061C00240423AF
-:10886000325D5B1B1A41131C012213400832534333
-:10887000381C221C291C0134FFF784FD052CEED185
-:108880000135052DEAD1F8BD13B5041C01A94068D6
-:10889000DAF78CFBA268019900238A4207D2815C37
-:1088A000E068FFF7D4FFA3680133A360E368181CF6
-:1088B00016BDF7B50025042A11D1041C0E1C406812
-:1088C00001A9DAF773FB2B1C071C0199321C2068E5
-:1088D000D8F78AFA395CA068FFF7B9FFA568281CA9
-:1088E000FEBD38B5051C0520011CEBF773FE041C0A
-:1088F000291CFFF7ACFF201C38BD836810B5041C91
-:108900005808FFF773F90123A2681340A36010BD54
-:1089100010B518C96210E10701D58158CB588018ED
-:10892000984710BD10B5041C0430ECF757FB01212B
-:10893000606800F0EDFCFFF759F910BD10B5041C9C
-:108940000430ECF74BFB0121606800F0EEFCFFF710
-:108950004DF910BD10B5041C0430ECF73FFB0121AC
-:10896000606800F0EFFCFFF741F910BD10B5041C82
-:108970000430ECF733FB606800F0ECFCFFF736F9ED
-:1089800010BD10B5041C406800F022FD002802D183
-:10899000201CECF7EBFA201DECF720FB6068EEF7EB
-:1089A0003BFCFFF723F910BD10B5041C4369426876
-:1089B000991800F077F8E36A002B04D1A369002B23
-:1089C00007D0984705E0A069002802D0211C1C317F
-:1089D000984710BD10B5041C00F06CF80023A3618B
-:1089E000E36210BD10B5041CECF710FB201C02F074
-:1089F000BCFA201C10BD38B5051C0C1C00F05AF840
-:108A00006C61286900F0D5F90119281C00F04AF8BA
-:108A100038BD00207047F8B5071C0E1C0D1C8C18C3
-:108A2000A54209D001353B686A1E5B6A1178381C83
-:108A30009847431CF4D12C1CA01BF8BDF8B5071CAB
-:108A40000E1C0D1C8C18AC4209D03B68381C9B6A6C
-:108A50009847431C02D028700135F4E72C1CA01B5A
-:108A6000F8BD0020704700207047002070470020AC
-:108A7000704738B50D1C041C4069F8F793F8281CA2
-:108A80006169F8F7FBF938BD10B5041C4069F8F7C7
-:108A900089F8606900F0A4F810BD08B503689B6808
-:108AA000984708BD08B50A1C031C011D006900F0A9
-:108AB00048F908BD08B5011D006900F05EF908BD60
-:108AC000704718234A1C5A438218926810B55943BC
-:108AD000002A05D14118CB68002B08D0984706E042
-:108AE0004318D868002802D0191C1031904710BDD7
-:108AF00010B5041C02F039FA201C10BD38B50D1C4D
-:108B0000041C0430EDF722F9E56338BD08B50430E4
-:108B100000F0FFF908BD38B50C1C051C111C043011
-:108B2000221E0AD018231A1C4A43AA18D4604A1CD1
-:108B300053430022EB189A600132EDF753F938BD28
-:108B400008B5043000F0D8F908BD10B50C1C04308D
-:108B5000EDF78CF9201C10BD036870B51B6900216E
-:108B60000122041C9847061C731C0DD023680021A9
-:108B70001B690222201C9847051C2368201C1B69C6
-:108B8000311C00229847281C70BD08B5431E012BDC
-:108B900001D9002804D180239B014B60002005E00F
-:108BA000F7F756FF092303600120404208BD08B5CE
-:108BB0000120F7F753FF7047704708B5FFF7FCFF38
-:108BC000FFF7F9FFEDF73EFA08BD08B5002801D020
-:108BD00000F00AF8FEE708B5002102F0D4FB08BD5A
-:108BE00008B5F8F721F808BD00B59BB002A803212D
-:108BF00000F064F808A8022100F060F80EA8012136
-:108C000000F05CF814A8102100F058F8059B039AB6
-:108C100096201A60099A0C9B1A600F9A129B1A6090
-:108C2000159A179B01921A6000F058F8069B039A58
-:108C300096201A60099A0B9B1A600F9A119B019259
-:108C40001A60159A189B1A6000F048F8DEE70FB416
-:108C5000012008B5F7F702FF70B50D1C041C161CA7
-:108C6000EDF712F96B1C07D0201C002100F05EF913
-:108C7000201C311C00F054F970BD08B50322FFF729
-:108C8000EBFF08BD08B5FFF7E7FF08BD70B50D1C89
-:108C9000041C161CEDF7F8F86B1C0ED06368002E50
-:108CA00001D0E26800E02269201C0121136000F07D
-:108CB0003DF9201C002100F033F970BD08B50022F9
-:108CC000FFF7E4FF08BD38B5041CECF737FF051CBF
-:108CD000ECF734FF401BA042FAD338BD08B5FA23A5
-:108CE0009B005843FFF7EFFF08BD38B5041C0D1C6F
-:108CF00003681B68984763681D6038BD38B5036812
-:108D0000041CDB68984763685A682368002A02D10C
-:108D10009B68984714E05B681568984763682D1A4C
-:108D2000002D08DC5A68916859601B68002BEAD056
-:108D300050689847E7E75A68216810680B699847B8
-:108D400038BD70B50D1C72B64B60002346680A60D2
-:108D50007468002C05D02168511A02D4231CA46821
-:108D6000F7E7002B05D1036875601B69101C984755
-:108D700000E09D60AC6062B670BD08B572B6426836
-:108D800053688B420CD19B6853600268002B02D160
-:108D9000936898470BE012691868904707E0131C26
-:108DA000002B04D09A688A42F9D18A689A6062B628
-:108DB00008BD08B503685B68984708BDF7B5019220
-:108DC000B1221F1C03684910D20099508021012252
-:108DD00089005A50191C0024061CFC31CC601A6012
-:108DE0007D1E019BAC4213DA1919301C0022ECF7EE
-:108DF0007DFC00280AD0301CECF772FD071C301CEB
-:108E0000ECF73AFD251C002F1ADA18E00134E7E7E9
-:108E10005919301C0122ECF769FC002803D0301CE2
-:108E2000ECF72AFD0CE0089B3D1C002B08D03168B4
-:108E30000B1CFC339A68002AFAD000229A603D1C71
-:108E4000281CFEBDF8B5171CB1221D1C0368D200FA
-:108E5000491099508022002492009C500122061C47
-:108E60009A60AC4211DA395D301CECF729FC00281D
-:108E700009D0301CECF700FD301CECF731FD002868
-:108E80000EDA041C0CE00134EBE7069B2C1C002BD3
-:108E900006D0301CECF70AFD002801D00124644202
-:108EA000201CF8BD82B00190C046C046C046C046F6
-:108EB000C046C046C046C046C046C046C046C04682
-:108EC000C046C046019B013B0193002BECD102B090
-:108ED00070472F23C046C046C046C046C046C04665
-:108EE000C046C046C046C046C046C046C046C04652
-:108EF000013B002BEED1704703681A1CFC32D1688D
-:108F00000129FAD10021D160A322D2009858C0B221
-:108F100070470368FC33D8680138434258417047B2
-:108F200008B5007840B200F05FF808BD002901D014
-:108F3000012907D10023A022C356D205C133FF3334
-:108F40009B0099507047002310B5036043600A7876
-:108F5000041C2F2A15D14A789A4212D0481C191C99
-:108F6000206023681A782F2A02D10133236005E09C
-:108F7000002A03D0013301312360F2E7EDF746F810
-:108F80006060201C10BD0068704708B54368181E5B
-:108F900005D000F042F8013843425841C0B208BD44
-:108FA00010B5041CFFF7F1FF031E00D06368181C06
-:108FB00010BD08B54368181E04D000F02EF84342D7
-:108FC0005841C0B208BD10B5041CFFF7F2FF031EE4
-:108FD00003D06268131E00D0131F181C10BD406818
-:108FE000431E9841C0B27047A0238000DB05C01823
-:108FF000E02310B50C24DB00C2588900A243C25004
-:10900000C2581143C15010BD10B5041CECF7D2FF7B
-:10901000201C01F0AAFF201C10BD007B7047704788
-:109020007047002070477047704710B5041CEFF779
-:10903000A9FC201C10BD10B5041CEFF7A3FC201CDC
-:1090400010BD10B5041CF0F743F90023201C237554
-:1090500010BD3ADF704708B50368002B01D0081C2B
-:10906000984708BD13B5041C7D30FF30002100F087
-:1090700075F8201CA530FF30002100F06FF8201C8F
-:10908000CD30FF30012101F088FE13BD1FB5041C57
-:10909000009202A80822019302F07CF8039A029B36
-:1090A0005010D20701D52258D35820180099019AA0
-:1090B00098471FBD08B5EDF731FC01607047021CF1
-:1090C000002310B5AC320432141F2468002C01D0E8
-:1090D0000133F8E72A339B00C3185960201C10BDE8
-:1090E000021C002310B5AC320432141F24688C42D9
-:1090F00001D00133F8E72A339B00C31800205860E1
-:1091000010BD021C002310B5D4320432141F246891
-:10911000002C01D00133F8E734339B00C3185960A9
-:10912000201C10BD021C002310B5D4320432141FC1
-:1091300024688C4201D00133F8E734339B00C31814
-:109140000020586010BD4068704710B5041CEDF752
-:10915000BFFD201CEFF716FC201C10BD0630C177A8
-:1091600070470123807918407047C068431E9841BA
-:10917000704710B5041CEDF7EDFD201CEFF702FC65
-:10918000201C10BD38B58388041C5A0708D59A06E0
-:1091900031D4DA0604D52169626901F027FC2AE09E
-:1091A00004221343A380A3889A0705D5A0682169E8
-:1091B000626901F065FC09E020696169DB0703D59C
-:1091C000E268A368984701E0A3689847A388DA0695
-:1091D0000ED5A06900280BD0231C021C103322CA14
-:1091E00022C38368A361EFF7CDFBEEF723FADAE73A
-:1091F00004229343A38038BD031C72B6C0680028C4
-:1092000007D08268DA60002A00D11A61DA8A013A4E
-:10921000DA8262B670478068002801D0C069FBE737
-:109220007047F7B50122041C0D1C0769EDF7B0FD6E
-:1092300000281FD1E38A092B1CD86B460C3006CDC1
-:1092400006C3EFF77BFB0099019A051C00F0CDF8EF
-:1092500072B6002F03D1E368AB60E56002E0BB6843
-:10926000AB60BD60AB68002B00D12561E38A0133A0
-:10927000E38262B6F7BD07B5009169460192FFF738
-:10928000D0FF07BD38B5051CFFF7C5FF281CFFF749
-:10929000B3FF041E0BD0211C0022281CEDF778FD23
-:1092A000201CEFF76FFBEEF7A5F90028EED138BDD3
-:1092B00010B5041CEDF792FE201CEFF763FB201C99
-:1092C00010BD836B806A1B681840431E984170472D
-:1092D000836B37B51B68826A1A4218D00121041CBF
-:1092E0006425EDF7C5FE68430321A061201CEDF75E
-:1092F000BFFE68430521E061201CEDF7B9FE454340
-:10930000A1882562684604220123EEF761F837BD83
-:10931000012904D0022906D10369C06901E08369EB
-:10932000C068181A00E080697047012904D002293A
-:1093300006D18369C06801E00369C069181A00E0BA
-:10934000C06970470139036A012901D84269D31AFB
-:10935000181C7047F7B58369C268041C981AF3F7A4
-:1093600077FAE2692369061C981A0F1CF3F770FA62
-:10937000636900900191206A181AF3F769FA321CA8
-:109380000D1C041C3B1C301C391CF2F717FC061C7E
-:109390000F1C00980199021C0B1CF2F70FFC021C19
-:1093A0000B1C301C391CF1F7A3FC2B1C061C0F1CDA
-:1093B000221C291C201CF2F701FC021C0B1C301C77
-:1093C000391CF1F795FCF4F7AFF8F3F70BFAFEBD93
-:1093D0000123807918407047022380791840704734
-:1093E0000122837993438371704737B5041C009140
-:1093F00001926D46EDF7CEFF231C06CD06C3002378
-:10940000201CA3603EBD72B601650B68002B03D122
-:1094100043658365086007E05A6D002A01D0131C7C
-:10942000FAE758658365426562B67047036D002BA5
-:1094300012D072B6826D436D002A01D0536501E0EF
-:10944000026D1360436D002B01D0826D9A6500237D
-:1094500043658365036562B6704708B50B1C111C34
-:109460001A1C0123EEF79EF808BD38B5051CEFF372
-:109470000884C36B006C1C1B6B6C1B1AA3420CD2C0
-:109480001F2320349C43002801D0EFF77BFA201CD7
-:10949000EFF754FA041928646C6438BD10B50C1C3D
-:1094A0008047A047EEF78EF910BD08B5EEF78AF9B0
-:1094B00008BD38B5141C031C101C0D1C9847201C3B
-:1094C000A847EEF77FF938BD08B5EEF79BF8EEF741
-:1094D000B1F8FAE710B5041C006801F0C1FA201CCD
-:1094E00010BD70B5061C081C0D1C01F075FF041C96
-:1094F0000530EFF723FA306001F0A5FA3068291C37
-:109500004480621C043001F045FE70BD38B5041C77
-:109510000B6800680D1C984205D001F0A1FA28687C
-:10952000206001F093FA201C38BD0023994207DB2C
-:1095300002680223D05E0023884201DD51180B79B6
-:10954000181C704710B582604A43041C4160002A11
-:109550000ADDFE2390005B059A4201DD01204042B6
-:10956000EFF7ECF9206001E000230360201C10BD40
-:109570004B688A6870B543605343041C0D1C8260BD
-:10958000002B12DDFE229E005205301C934201DDAD
-:1095900001204042EFF7D2F9002320602A68D15819
-:1095A000C1500433B342FAD101E000230360201C10
-:1095B00070BD4068704700290DDB002A0BDB436853
-:1095C000994208DA83689A4205DA4B439A1803688D
-:1095D0009200D05800E00020704710B500290CDB45
-:1095E000002A0ADB4468A14207DA8468A24204DA4E
-:1095F0004C430168A2189200535010BD10B5041CD2
-:109600000068002801D0EFF7BDF9201C10BDF0B5AF
-:109610008A684B6893B001900C1C9A4201D000F00C
-:10962000A1FD042A01D000F09DFD111C0FA8FFF739
-:1096300089FF24680F9FA36A66690293E36AE56B5A
-:109640000393A36B02990493636A301C0593A36987
-:109650000693E3690793636B0893F0F7E9FF291C0E
-:10966000F0F7E6FF03990990301CF0F7E1FF049949
-:10967000F0F7DEFF011C0998F1F70CF90699061CBA
-:109680000598F0F7D5FF291CF0F7D2FF011C301C1C
-:10969000F1F700F90799051C0598F0F7C9FF04993F
-:1096A000F0F7C6FF011C281CF0F754FC0699051CB6
-:1096B0000898F0F7BDFF0399F0F7BAFF011C281CCA
-:1096C000F0F748FC0799051C0898F0F7B1FF0299DC
-:1096D000F0F7AEFF011C281CF1F7DCF83860A36A34
-:1096E00066680293E36AE56B0393A36B02990493A4
-:1096F000636A09900593A3680693E3680793636B15
-:10970000089380231B06F018F0F792FF291CF0F74E
-:109710008FFF03990A90301CF0F78AFF0499F0F745
-:1097200087FF011C0A98F0F715FC0699061C05989E
-:10973000F0F77EFF291CF0F77BFF011C301CF0F7CF
-:1097400009FC051C05980799F0F772FF0499F0F7DA
-:109750006FFF011C281CF1F79DF80699051C08985D
-:10976000F0F766FF0399F0F763FF011C281CF1F77F
-:1097700091F80799051C0898F0F75AFF0299F0F73D
-:1097800057FF011C281CF0F7E5FB7860A3696668A9
-:109790000293E369E56B0393A36B301C0493636945
-:1097A0000593A3680693E3680793636B0299089394
-:1097B000F0F73EFF291CF0F73BFF03990A90301C9D
-:1097C000F0F736FF0499F0F733FF011C0A98F1F720
-:1097D00061F80699061C0598F0F72AFF291CF0F796
-:1097E00027FF011C301CF1F755F80799051C059857
-:1097F000F0F71EFF0499F0F71BFF011C281CF0F77F
-:10980000A9FB0699051C0898F0F712FF0399F0F7D9
-:109810000FFF011C281CF0F79DFB0799051C0898F9
-:10982000F0F706FF0299F0F703FF011C281CF1F77F
-:1098300031F8B860A36966680293E369E56A039347
-:10984000A36A0299049363690593A3680693E36886
-:109850000793636A089380231B06F018F0F7E8FE6D
-:10986000291CF0F7E5FE03990A90301CF0F7E0FEA2
-:109870000499F0F7DDFE011C0A98F0F76BFB0699DE
-:10988000061C0598F0F7D4FE291CF0F7D1FE011C48
-:10989000301CF0F75FFB0799051C0598F0F7C8FE30
-:1098A0000499F0F7C5FE011C281CF0F7F3FF069998
-:1098B000051C0898F0F7BCFE0399F0F7B9FE011CEF
-:1098C000281CF0F7E7FF0799051C0898F0F7B0FE91
-:1098D0000299F0F7ADFE011C281CF0F73BFBF86085
-:1098E000A36A26690293E36AE56B0393A36B02996B
-:1098F0000493236A0593A3690693E3690793236B93
-:10990000089380231B06F018F0F792FE291CF0F74D
-:109910008FFE03990A90301CF0F78AFE0499F0F745
-:1099200087FE011C0A98F0F715FB0699061C05989E
-:10993000F0F77EFE291CF0F77BFE011C301CF0F7CF
-:1099400009FB0799051C0598F0F772FE0499F0F7DA
-:109950006FFE011C281CF0F79DFF0699051C089856
-:10996000F0F766FE0399F0F763FE011C281CF0F780
-:1099700091FF0799051C0898F0F75AFE0299F0F735
-:1099800057FE011C281CF0F7E5FA3861A36A266827
-:109990000293E36AE56B0393A36B0A900493236A33
-:1099A000301C0593A3680693E3680793236B089321
-:1099B0000299F0F73DFE291CF0F73AFE03990B904F
-:1099C000301CF0F735FE0499F0F732FE011C0B98BD
-:1099D000F0F760FF0699061C0598F0F729FE291C90
-:1099E000F0F726FE011C301CF0F754FF0799051C08
-:1099F0000598F0F71DFE0499F0F71AFE011C281CCB
-:109A0000F0F7A8FA0699051C0898F0F711FE0399DB
-:109A1000F0F70EFE011C281CF0F79CFA0799051CB4
-:109A20000898F0F705FE0299F0F702FE011C281CC9
-:109A3000F0F730FF78612668A369E56B0293E3696C
-:109A400002990393A36B049323690593A368069378
-:109A5000E3680793236B089380231B06F018F0F745
-:109A6000E7FD291CF0F7E4FD03990B90301CF0F79B
-:109A7000DFFD0499F0F7DCFD011C0B98F0F76AFAA2
-:109A80000699061C0598F0F7D3FD291CF0F7D0FDC8
-:109A9000011C301CF0F75EFA0799051C0598F0F7D9
-:109AA000C7FD0499F0F7C4FD011C281CF0F7F2FE75
-:109AB0000699051C0898F0F7BBFD0399F0F7B8FD6F
-:109AC000011C281CF0F7E6FE0799051C0898F0F722
-:109AD000AFFD0299F0F7ACFD011C281CF0F73AFA33
-:109AE000B861A36926680293E369E56A0393A36AF0
-:109AF000029904932369301C0593A3680693E368D5
-:109B00000793236A0893F0F793FD291CF0F790FD63
-:109B100003990B90301CF0F78BFD0499F0F788FD4A
-:109B2000011C0B98F0F7B6FE0699061C0598F0F795
-:109B30007FFD291CF0F77CFD011C301CF0F7AAFE0C
-:109B40000799051C0598F0F773FD0499F0F770FD6F
-:109B5000011C281CF0F7FEF90699051C0898F0F77F
-:109B600067FD0399F0F764FD011C281CF0F7F2F97A
-:109B70000799051C0898F0F75BFD0299F0F758FD6E
-:109B8000011C281CF0F786FEF861636A26690293BF
-:109B9000E36AE56B0393636B301C0493236A0593BC
-:109BA00063690693E3690793236B08930299F0F7BF
-:109BB0003FFD291CF0F73CFD03990B90301CF0F79A
-:109BC00037FD0499F0F734FD011C0B98F0F762FEA5
-:109BD0000699061C0598F0F72BFD291CF0F728FDC7
-:109BE000011C301CF0F756FE0799051C0598F0F78C
-:109BF0001FFD0499F0F71CFD011C281CF0F7AAF9C1
-:109C00000699051C0898F0F713FD0399F0F710FD6D
-:109C1000011C281CF0F79EF90799051C0898F0F71D
-:109C200007FD0299F0F704FD011C281CF0F732FE35
-:109C30000B903862636A26680293E36AE56B0393CC
-:109C4000636B02990493236A059363680693E36840
-:109C50000793236B089380231B06F018F0F7E8FCAA
-:109C6000291CF0F7E5FC03990C90301CF0F7E0FCA0
-:109C70000499F0F7DDFC011C0C98F0F76BF90699DC
-:109C8000061C0598F0F7D4FC291CF0F7D1FC011C48
-:109C9000301CF0F75FF90799051C0598F0F7C8FC30
-:109CA0000499F0F7C5FC011C281CF0F7F3FD069998
-:109CB000051C0898F0F7BCFC0399F0F7B9FC011CEF
-:109CC000281CF0F7E7FD0799051C0898F0F7B0FC91
-:109CD0000299F0F7ADFC011C281CF0F73BF9786203
-:109CE000636926680293E369E56B0393636B0299EA
-:109CF00004932369301C059363680693E368079314
-:109D0000236B0893F0F794FC291CF0F791FC03995E
-:109D10000C90301CF0F78CFC0499F0F789FC011CC6
-:109D20000C98F0F7B7FD0699061C0598F0F780FC33
-:109D3000291CF0F77DFC011C301CF0F7ABFD0799E6
-:109D4000051C0598F0F774FC0499F0F771FC011CF0
-:109D5000281CF0F7FFF80699051C0898F0F768FC36
-:109D60000399F0F765FC011C281CF0F7F3F807993C
-:109D7000051C0898F0F75CFC0299F0F759FC011CEF
-:109D8000281CF0F787FDB862636926680293E369CF
-:109D9000E56A0393636A04932369059363680693F2
-:109DA000E3680793236A089380231B06F01802993F
-:109DB000F0F73EFC291CF0F73BFC03990C90301C9B
-:109DC000F0F736FC0499F0F733FC011C0C98F0F71F
-:109DD000C1F80699061C0598F0F72AFC291CF0F733
-:109DE00027FC011C301CF0F7B5F80799051C0598F5
-:109DF000F0F71EFC0499F0F71BFC011C281CF0F77F
-:109E000049FD0699051C0898F0F712FC0399F0F734
-:109E10000FFC011C281CF0F73DFD0799051C089854
-:109E2000F0F706FC0299F0F703FC011C281CF0F780
-:109E300091F8F8622669636AA56B0293A36A029996
-:109E40000393636B0493236A059363690693A36981
-:109E50000793236B089380231B06F018F0F7E8FBA9
-:109E6000291CF0F7E5FB03990C90301CF0F7E0FBA0
-:109E70000499F0F7DDFB011C0C98F0F76BF80699DC
-:109E8000061C0598F0F7D4FB291CF0F7D1FB011C48
-:109E9000301CF0F75FF80799051C0598F0F7C8FB30
-:109EA0000499F0F7C5FB011C281CF0F7F3FC069998
-:109EB000051C0898F0F7BCFB0399F0F7B9FB011CEF
-:109EC000281CF0F7E7FC0799051C0898F0F7B0FB91
-:109ED0000299F0F7ADFB011C281CF0F73BF8386342
-:109EE000636A26680293A36AA56B0393636B029966
-:109EF0000493236A0C9005936368301C0693A3684F
-:109F00000793236B0893F0F793FB291CF0F790FB62
-:109F100003990D90301CF0F78BFB0499F0F788FB48
-:109F2000011C0D98F0F7B6FC0699061C0598F0F791
-:109F30007FFB291CF0F77CFB011C301CF0F7AAFC0E
-:109F40000799051C0598F0F773FB0499F0F770FB6F
-:109F5000011C281CEFF7FEFF0699051C0898F0F776
-:109F600067FB0399F0F764FB011C281CEFF7F2FF75
-:109F70000799051C0898F0F75BFB0299F0F758FB6E
-:109F8000011C281CF0F786FC78636369266802933D
-:109F9000A369A56B0393636B0493236905936368BB
-:109FA0000693A3680793236B089380231B06F0187E
-:109FB0000299F0F73DFB291CF0F73AFB03990D904D
-:109FC000301CF0F735FB0499F0F732FB011C0D98BB
-:109FD000EFF7C0FF0699061C0598F0F729FB291C2E
-:109FE000F0F726FB011C301CEFF7B4FF0799051CA6
-:109FF0000598F0F71DFB0499F0F71AFB011C281CCB
-:10A00000F0F748FC0699051C0898F0F711FB039936
-:10A01000F0F70EFB011C281CF0F73CFC0799051C0F
-:10A020000898F0F705FB0299F0F702FB011C281CC9
-:10A03000EFF790FFB86326686369A56A0293A36986
-:10A0400002990393636A301C049323690593636840
-:10A050000693A3680793236A0893F0F7E9FA291C8B
-:10A06000F0F7E6FA03990D90301CF0F7E1FA049945
-:10A07000F0F7DEFA011C0D98F0F70CFC0699061CAF
-:10A080000598F0F7D5FA291CF0F7D2FA011C301C1C
-:10A09000F0F700FC0799051C0598F0F7C9FA049938
-:10A0A000F0F7C6FA011C281CEFF754FF0699051CAF
-:10A0B0000898F0F7BDFA0399F0F7BAFA011C281CCA
-:10A0C000EFF748FF0799051C0898F0F7B1FA0299D5
-:10A0D000F0F7AEFA011C281CF0F7DCFBF8632168EE
-:10A0E0000998F0F7A5FA6168051C0A98F0F7A0FA3C
-:10A0F000011C281CEFF72EFFA168051C0B98F0F738
-:10A1000097FA011C281CEFF725FFE168051C0C9845
-:10A11000F0F78EFA011C281CEFF71CFF0021041C2D
-:10A12000EFF734FE002805D0002101980A1CFFF744
-:10A1300009FA13E0FE20211C8005F0F787F83E1C89
-:10A140003C1C051C40362068291CF0F771FA01C43C
-:10A15000B442F8D101980FA9FFF70AFA0FA8FFF748
-:10A160004DFA04E0002101980A1CFFF7EBF9019871
-:10A1700013B0F0BDF0B58BB00593161C059A0D1CFD
-:10A180004B6803908968002A01D0029301E0029194
-:10A19000191C029B7268934205D0002103980A1C87
-:10A1A000FFF7D0F942E007A8B268FFF7CBF9002724
-:10A1B000089B00939F4232DA00230093009B099A88
-:10A1C00093422ADA002300240193029B9C421BDA6B
-:10A1D000059B281C002B02D0211C3A1C01E0391CD5
-:10A1E000221CFFF7E8F9211C009A0490301CFFF7AD
-:10A1F000E2F9011C0498F0F71BFA011C0198EFF733
-:10A20000A9FE01340190E0E7019B07A8391C009AE0
-:10A21000FFF7E3F9009B0133CFE70137C8E7039865
-:10A2200007A9FFF7A5F907A8FFF7E8F903980BB00E
-:10A23000F0BD10B5041CEDF735FB201CEEF7A2FBBA
-:10A24000201C10BD836A80691B6818404342584136
-:10A2500070470E23C25E1023C15E1223C35E4943C2
-:10A2600052435B438818C018704713B5041CEDF7C0
-:10A27000FDFB211C231C36310A783433824204D181
-:10A280001A78092A04D8013201E0002208701A70F5
-:10A2900035340A782178914209D01B78092B06D9E8
-:10A2A0002270684692B21B210123EDF791F813BD8D
-:10A2B00008B5836A82691B681A4201D1EDF79CFCDC
-:10A2C00008BD012904D0022906D11023C05E05E093
-:10A2D0000E23C05E404201E00E23C05E704701299C
-:10A2E00004D0022906D10E23C05E01E01023C05E17
-:10A2F000404201E01023C05E70471222835E584244
-:10A30000022900D0181C7047F7B5041C1023C05E4A
-:10A31000F0F75EFC0E23E55E1222A35E6D425B4207
-:10A320000190281C0093F2F793FA061C00980F1C6A
-:10A33000F2F78EFA021C0B1C301C391CF3F7F0F8F4
-:10A34000F2F716FB2063061CF3F784F8071C301C99
-:10A35000F2F7D4FE802212069446019B061C634449
-:10A36000281C0193F0F734FC391CF0F761F9051C47
-:10A370000098F0F72DFC311CF0F75AF9011C281C4D
-:10A38000EFF7E8FD011C0198EFF760FFF2F74EFDD3
-:10A390000122A379E0621343A371F7BD10B583795D
-:10A3A000041CDB0701D4FFF7AFFFE06A10BD10B556
-:10A3B0008379041CDB0701D4FFF7A6FF206B10BDD7
-:10A3C00035300078704752DF7047704710B5041C75
-:10A3D000EEF7D8FA201C10BD70B5041C161C1D1C0D
-:10A3E00003220723EEF72EF9201C311C022207233B
-:10A3F0001030EEF727F9201C291C012207232030FA
-:10A40000EEF720F9201C0499042203233030EEF7E4
-:10A4100019F9201C0599052203234030EEF712F9A3
-:10A42000201C0699112201235030EEF70BF9201C55
-:10A4300007990C2201236030EEF704F9201C0899DB
-:10A440000B2201237030EEF7FDF8201C099912222F
-:10A4500001238030EEF7F6F8201C0A990A22012326
-:10A460009030EEF7EFF8201C0B9906220323A03062
-:10A47000EEF7E8F8201C0C991A220123B030EEF711
-:10A48000E1F8201C0D9914220123C030EEF7DAF810
-:10A49000201C0E9917220123D030EEF7D3F8201C90
-:10A4A0000F9916220123E030EEF7CCF8201C10990A
-:10A4B00015220123F030EEF7C5F8601C1199102227
-:10A4C0000123FF30EEF7BEF8201C11301299002254
-:10A4D0000123FF30EEF7B6F8201C213013991E221D
-:10A4E0000123FF30EEF7AEF8201C70BD10B5041C40
-:10A4F000006800F0B5FA201C10BD08B50A1C002148
-:10A5000000F065FE08BD10B5041C0868206000F06E
-:10A510009DFA201C10BD08B503689988981D5B88BA
-:10A520005943FFF7EAFF08BD10B5041C0023EDF7FF
-:10A5300051FC201C10BDF0B5071C89B00EA8007896
-:10A54000059107903868049046880020B24200DBED
-:10A5500082E0049CA488A34200DB7DE00D680395A3
-:10A560006D88AC46151C65440195854274DD039DDC
-:10A57000AD885919069181426EDD002A05DA0199EC
-:10A580000291B14207DD029605E0B11A02916145E0
-:10A5900001DD61460291002B05DA06990191A14285
-:10A5A00006DD019404E0E11A0191A94200DD019564
-:10A5B0005542D01728400025039C0634AB4202DAEE
-:10A5C00061464D425D4328182118D443E4172240C8
-:10A5D0000024049803910630A34201DD341C5C433F
-:10A5E000079BA2188418002B02D1059D1E1C1BE09E
-:10A5F0000022101C019B9A422EDA002302998B4202
-:10A6000007DA0399CD5C002D01D0E5540130013308
-:10A61000F4E7059B03991B6801325B88CB18039311
-:10A620003B685B88E418E5E7019B9E420EDA201C3C
-:10A63000029A039900F0AEFD2B68039A5B880136FD
-:10A64000D31803933B685B88E418EDE7D843C01741
-:10A650001840029B4343181C09B0F0BD10B518C93F
-:10A660006210E10701D58158CB588018984710BD7A
-:10A6700010B5041CEDF748FD201CEEF783F9201CF3
-:10A6800010BD70B5051C041C74350121281CEDF7A4
-:10A6900067FC221C5A3213780133DBB21370E17964
-:10A6A00001318B4225D10023261C1370626D583670
-:10A6B0000221525E33882021934205DA201C19B210
-:10A6C0005430FEF732FF011CE2790023281CEDF71D
-:10A6D000F9FB626D33880221525E934207DD231C31
-:10A6E00000224C331A70201CEDF70CFE01E0013300
-:10A6F000338070BD70B5051C061CC26D603502212B
-:10A70000525E2B88041C74362021934204DA19B25D
-:10A710005C30FEF70AFF011C0022301C131CEDF711
-:10A72000D1FBE26D2B880221525E934207DD231C90
-:10A7300000224C331A70201CEDF7E4FD01E00133D8
-:10A740002B8070BD73B5041C061C251C7436301C90
-:10A750006835FFF7E0FE0023EA5E211C0023643128
-:10A760000093301CFFF7E7FE002804D1231C703350
-:10A770001B78002B04D1231C6A331B78002B07D1D4
-:10A78000231C00224C331A70201CEDF7BBFD06E0A1
-:10A790002A885BB29B182B8001237034237073BD11
-:10A7A000F0B5071C0021051C041C6A37406E795661
-:10A7B000408868350023EA5E4B1D1B1A201C261CAE
-:10A7C00085B07030039074369A4202DC0378002B17
-:10A7D00022D1002A04DD494209B2301CEDF7C0FB4A
-:10A7E0000023EA5E211C0023301C00936431FFF734
-:10A7F000A2FE0023FB56002B05D1221C4C32137005
-:10A80000201CEDF77FFD0123039A137000222B8893
-:10A81000BA56D3182B8009E0231C00224C33301C7D
-:10A820001A70FFF778FE201CEDF76CFD05B0F0BD47
-:10A8300038B5051C4C35297800292BD0021C041C86
-:10A84000503213884E3406339BB2138024889C42C6
-:10A8500020D80023041C1380022901D1FFF711FF27
-:10A860002B78032B02D1201CFFF744FF2B78042BFD
-:10A8700002D1201CFFF766FF2B78052B02D1201C8C
-:10A88000FFF78EFF2B78062B04D10023201C2B70A2
-:10A89000EDF738FD38BD13B5827A041C042A09D1BE
-:10A8A000818801236846ECF793FD0023A3722033CF
-:10A8B000E3720AE0EDF7A6FC201CFFF7B9FFE37A8C
-:10A8C0005B00E372A37A0133A37213BD08B5743041
-:10A8D000FFF721FE08BD031C10B5443114C914C391
-:10A8E00010BD10B58379041C1B0706D5806800F0E5
-:10A8F00061FA0D23E35683420CD0201CEDF7AEFE27
-:10A900000D2001212056EEF7A9FA0822A379A060B4
-:10A910001343A371002010BD80210CC89B1A0906A7
-:10A920009B080B4313607047031C70B5820898079F
-:10A9300002D1181E01D137E00132541C72B621C970
-:10A94000A84219D20368002B13DA5B005B08990058
-:10A9500041180E68002E01DAA94202D3A34208D39F
-:10A960000DE08021760076089B19090619430160E5
-:10A97000EDE79B00C018E3E762B6002014E0023266
-:10A98000934203D992008218954204D803685B0071
-:10A990005B08036006E080211B1B0906043A0B4399
-:10A9A0001360046062B6043070BDF7B51D1C08ABBF
-:10A9B0001B88041C1030161C0F1C0193ECF7EAFCDA
-:10A9C0006A460023928827806680A560201CE36089
-:10A9D000A280E361A361FEBD10B58388041C9B07C0
-:10A9E00002D58068EDF7CEFF201C10BD7FB58469CD
-:10A9F0000192051C6B4600910122002C0DD102AC86
-:10AA0000221C03CB03C20C20EDF798FF061C029911
-:10AA10006268FEF7EAFCAE6114E0A168002902D08A
-:10AA200001320C1CF9E7092A0CDC02AD2A1C03CB0D
-:10AA300003C20C20EDF782FF061C02996A68FEF73C
-:10AA4000D4FCA6607FBD03230380704710B5041CAF
-:10AA5000EDF7B4FF002802D123880233238010BD14
-:10AA600010B5041CEDF7AAFF002808D12388023B8B
-:10AA70009BB22380012B02D1201CEDF783FF10BD78
-:10AA800037B50D1C131C011D44692A1C0068A04722
-:10AA900037BD026808B594460A680023944507D17B
-:10AAA00004300431102200F066FB43424341DBB224
-:10AAB000181C08BD704780235B05F7B51A695B69F0
-:10AAC0000F1C133B1C1C5443211C061CEDF78CFF70
-:10AAD000231C251C483301933B1BEA58291C301CBE
-:10AAE000EDF7C4FF019B04359D42F5D10020FEBD6A
-:10AAF00010B5041CEDF7D6FF201CEDF743FF201C1A
-:10AB000010BD704710B5041CEDF73CFF201C10BDB4
-:10AB1000031CC068002804D0426ADA601A7A013A3D
-:10AB20001A72704737B5041CE568002D1ED0EA780C
-:10AB3000012A06D0022A09D1201C1830EEF736F877
-:10AB40000AE0201C1430EEF70FF805E092B26846D8
-:10AB50001E210123ECF73CFCE3689D42E4D1201C5C
-:10AB6000FFF7D6FF281CEDF70DFFDDE737BD00230B
-:10AB7000036070470023037070471FB5041C0092E8
-:10AB800002A80822019300F005FB039A029B5010D3
-:10AB9000D20701D52258D35820180099019A984716
-:10ABA0001FBD0289031C8A4202D18079012305E07E
-:10ABB000428900208A4202D19879022318407047C6
-:10ABC0000289031C8A4202D18079042305E042896C
-:10ABD00000208A4202D198790823184070470289E0
-:10ABE000031C8A4202D18079102305E042890020AB
-:10ABF0008A4202D19879202318407047038910B502
-:10AC00008B4207D183790124002A01D0234300E03D
-:10AC1000A343837143898B4207D183790221002AA0
-:10AC200001D00B4300E08B43837110BD038910B545
-:10AC30008B4207D183790424002A01D0234300E00A
-:10AC4000A343837143898B4207D183790821002A6A
-:10AC500001D00B4300E08B43837110BD038910B515
-:10AC60008B4207D183791024002A01D0234300E0CE
-:10AC7000A343837143898B4207D183792021002A22
-:10AC800001D00B4300E08B43837110BDF0B587B05A
-:10AC9000009107898DB2041CBD4200D147896B46E3
-:10ACA0005E88022E25D0052E11D0012E73D1201CD6
-:10ACB000291C321CFFF7A2FF201C391CFFF771FF73
-:10ACC000002868D0A18804A8321C331C0EE0201C88
-:10ACD000291C0122FFF7AAFF201C391CFFF770FF77
-:10ACE000002858D0321C0123A18804A8ECF770FB7F
-:10ACF00051E0201C391CFFF754FF002816D0321CED
-:10AD0000A188012302A8ECF763FB201C291CFFF794
-:10AD100057FFA68800282ED0201C391CFFF750FFB3
-:10AD2000002828D004A8311C042227E0201C291C5C
-:10AD3000FFF755FF00280ED1267B012E0BD1201CDA
-:10AD4000291CFFF73DFF002821D0291C042204A85C
-:10AD5000331CECF73DFB201C291C0022FFF74EFFA3
-:10AD6000201C291C0022FFF761FF201C291C002247
-:10AD7000FFF774FF0FE0311C032204A80123ECF756
-:10AD800027FB201C391C0122FFF768FFE3E704A81A
-:10AD9000291C0322DCE707B0F0BD0173704738B50A
-:10ADA0000D1C0121041C41560278281CEEF72AF8DC
-:10ADB000657038BD407840B2704710B5041C00681B
-:10ADC000FFF74EFE201C10BDF8B5D443E417144025
-:10ADD000071CA01D1E1C0D1CEDF7B0FD3860FFF711
-:10ADE00032FE3B681C7138684680002D04D0053067
-:10ADF000291C221C00F0CEF9F8BD0A1C002110B558
-:10AE0000041C0B1CFFF7E0FF201C10BD51DF704736
-:10AE100061DF7047F8B5061C0F1C041C1518AC4206
-:10AE200006D0BB1B195D201CEEF7A4F90134F6E730
-:10AE3000F8BD08B5FDF784FE08BD08B5FDF785FE31
-:10AE400008BD08B5C36A011C002B04D18369002B1F
-:10AE500006D0984704E08069002801D01C3198474B
-:10AE600008BD10B5041CEEF7F5F9201C00F07DF8C4
-:10AE7000201C10BD10B5041CEEF7FAF9201C00F0E0
-:10AE800074F8201C10BD08B50430FEF749F808BD61
-:10AE900008B50A1C031C02211C30002A04D09A6346
-:10AEA00000220221DA640132EEF724FD08BD836935
-:10AEB00080681B681840431E9841704708B5436975
-:10AEC000011C002B04D10368002B06D0984704E036
-:10AED0000068002801D00431984708BD08B5012951
-:10AEE00003D0022904D1383000E02030FFF7E6FF1C
-:10AEF00008BDF0B585B01C1C0AAB061C0F1C0392E4
-:10AF00001D78EEF7FDF901235D400095231C301CF0
-:10AF1000391C039AFDF796FF201A441EA04105B084
-:10AF2000F0BDF0B585B01C1C0AAB061C0F1C0392CB
-:10AF30001D78EEF7E5F901235D400095231C301CD8
-:10AF4000391C039AFDF73AFF201A441EA04105B0B0
-:10AF5000F0BD0023CB565A1C05D0834201D148686E
-:10AF600002E00C31F5E7181C704708B5F6F7B2F8A7
-:10AF700008BD08B5031C081C191CF5F75BFD08BDCE
-:10AF8000011C002008B5021C031CFDF7C3F808BD16
-:10AF900008B500210A22F7F72DF808BDF7B58A8910
-:10AFA000051C0C1C13075ED44B68002B02DC0B6CD9
-:10AFB000002B1ADDE76A002F17D000232E682B60C4
-:10AFC00080235B011A4001D0626D15E0281C216AC4
-:10AFD0000123B847021C431C0ED12B68002B0BD059
-:10AFE0001D2B01D0162B02D12E6000205EE04021E7
-:10AFF000A3890B43A38159E0A3895B0706D5636846
-:10B00000D21A636B002B01D0236CD21A0023281CA8
-:10B01000216AE76AB847A389421C06D12A68002A38
-:10B0200003D01D2A01D0162A19D10022626022699C
-:10B030002260DB0405D5431C02D12B68002B00D114
-:10B040006065616B2E600029CFD0231C4433994288
-:10B0500002D0281CF6F748F80020606326E0402262
-:10B060001343A38122E00F69002FBED00B680F604D
-:10B07000DB1B01930023920700D14B69A360019B66
-:10B08000002BB2DD281C216A3A1C019BA66AB0473E
-:10B09000002806DC40220120A38940421343A381FB
-:10B0A00004E0019B3F181B1A0193E8E7FEBD70B551
-:10B0B00068254B1E5D430E1C291C7431F6F75AF8A7
-:10B0C000041E08D000212A1C016046600C30A060DC
-:10B0D000683200F07CF8201C70BD7047704708B5DE
-:10B0E000F5F7D8FE08BDF7B54830041C00260191DD
-:10B0F000002C12D0A5686768013F0CD4AB89012BE6
-:10B1000007D90E22AB5E013303D0281C019B984760
-:10B1100006436835F0E72468EAE7301CFEBDF7B562
-:10B12000041C071C002601914834002C16D06368CB
-:10B13000A5680093009B013B00930DD4AB89012BC4
-:10B1400008D90E22AB5E013304D0381C291C019BA8
-:10B15000984706436835EDE72468E6E7301CFEBDF6
-:10B16000C9B28218904204D003788B4202D00130D9
-:10B17000F8E70020704730B50024944208D0035D02
-:10B18000651C0C5DA34201D0181B02E02C1CF4E7E7
-:10B19000002030BD002310B5934203D0CC5CC454D2
-:10B1A0000133F9E710BD10B5814208D28B189842DF
-:10B1B00005D29B1A013A09D3995C8154FAE700231E
-:10B1C000934203D0CC5CC4540133F9E710BD031C97
-:10B1D0008218934202D019700133FAE770479368DE
-:10B1E00010B5013B9360002B05DA9469A34208DB9C
-:10B1F000CBB20A2B05D01368581C10601970C8B266
-:10B2000001E0F6F7C5FF10BDF8B5061C0F1C141CB5
-:10B21000D518AC4208D02178301C3A1CFFF7DFFF6C
-:10B220000134431CF5D100E00020F8BDF7B5171C30
-:10B2300001930A698B6800900C1C934200DA131C7E
-:10B24000221C3B6043321278002A01D001333B605C
-:10B2500023689B0602D53B6802333B6006252368C2
-:10B260001D401ED0231C43331B785A1E9341226875
-:10B2700092061CD53020E1184031C870211C5A1CA0
-:10B2800045310978A21840320233D1700FE0221CF8
-:10B290000123009801991932089EB047431C0ED033
-:10B2A0000135E3683A689B1A9D42F0DBDAE7221C1D
-:10B2B000009801994332089DA847431C02D1012000
-:10B2C000404220E006232068E1683A6803400025F8
-:10B2D000042B03D18D1AEB43DB171D40A3682269B1
-:10B2E000934201DD9B1AED180027AF420ADA221CB7
-:10B2F0000123009801991A32089EB047431CDED002
-:10B300000137F2E70020FEBD092208B58189031C40
-:10B310000A400020092A02D1181CF5F743FC08BD99
-:10B32000F0B50A785E2A02D04B1C002402E001240A
-:10B330004A788B1C011C451CFF350C700131A94259
-:10B34000FBD1002A01D1581E1CE001210C1BE7B2E1
-:10B35000875419785E1C2D2906D05D290FD000294D
-:10B360000FD00A1C331CF2E75D785D2DF9D09542B1
-:10B37000F7DB023301328754AA42FBDBE9E7301CDA
-:10B3800000E0181CF0BD08B54A424A418023520033
-:10B39000DB00F6F789FC08BD0020704708B50E23D6
-:10B3A000C95EF6F7D5FF08BD021CC9B21378002BA1
-:10B3B00003D08B4204D00132F8E7181C002900D1D9
-:10B3C000101C704702780B78002A03D0013001313D
-:10B3D0009A42F7D0D01A70470023C25C0133002A8A
-:10B3E000FBD1581E7047002330B59A420DD0013A68
-:10B3F000C45CCD5CAC4202D1934202D1251C631BDC
-:10B4000003E00133002CF3D1F8E7181C30BD0B78B2
-:10B4100030B5722B0ED0772B07D0612B0ED1822541
-:10B420008420AD00012340001BE0C0250123ED0076
-:10B43000082016E0002504202B1C12E016230360D0
-:10B4400000201BE0622C11D0782C12D02B2C08D1BC
-:10B450000F3CA0430C3C20430D3CA3431C1C022387
-:10B46000234301310C78002CECD105E080246402E8
-:10B47000F6E780242401F3E72B43136030BDF8B5D1
-:10B48000061C0C1C151C002904D1111CF5F772FEBA
-:10B49000041C18E0002A03D1F5F726FE2C1C12E04C
-:10B4A00000F06FF8A8420ED2301C291CF5F762FE9E
-:10B4B000071E07D0211C2A1CFFF76CFE301C211C24
-:10B4C000F5F712FE3C1C201CF8BD38B5141C4B1CB3
-:10B4D00002D10120404234E0938920229343626BE1
-:10B4E000A381CDB26368002A0FD0A26B934206DA23
-:10B4F0002368013B23601D70636801331FE0211C3A
-:10B50000F6F708FE0028F3D0E3E721692268002956
-:10B5100009D08A4207D9511E0878A84203D10133C5
-:10B52000216063600DE02364231C443363630323C1
-:10B53000A363231C4633E2631D7023600123281C90
-:10B54000636038BD10B50C1C496B00290ED0231C5C
-:10B550004433994201D0F5F7C7FD0020236C6063A6
-:10B560006360834202D0E36B236009E023692022F9
-:10B570002360002301206360A38940421343A38119
-:10B5800010BD0B1F1A68101F002A04DA891804392D
-:10B590000B68D01804387047F8B5C046F8BC08BC32
-:10B5A0009E467047F8B5C046F8BC08BC9E4670473A
-:10B5B00000000000000000000D500100E5890200BD
-:10B5C000A989020000000000000000000000000047
-:10B5D000178A0200138A02003D8A0200678A02006D
-:10B5E000638A02006B8A02006F8A0200000000007A
-:10B5F00000000000AF8B0200AF8B0200FCFFFFFFDA
-:10B60000000000000000000000000000000000003A
-:10B61000000000000000000000000000000000002A
-:10B62000AF8B0200000000000000000000000000DE
-:10B63000C18A0200F18A0200000000000000000040
-:10B64000AF8B0200AF8B0200AF8B0200AF8B02000A
-:10B65000AF8B0200AF8B0200598B0200000000008C
-:10B6600000000000000000000000000000000000DA
-:10B67000AF8B0200AF8B0200AF8B0200AF8B0200DA
-:10B68000AF8B0200AF8B0200598B0200000000005C
-:10B6900000000000FCFFFFFF0000000000000000B1
-:10B6A000000000000000000000000000000000009A
-:10B6B000B55F0100099002000000000000000000DA
-:10B6C000116101005561010033AE02003BAE020082
-:10B6D000C0FFFFFF00000000178A0200138A02006B
-:10B6E0003D8A0200678A0200638A02006B8A0200B8
-:10B6F0006F8A020035610100676101001592010047
-:10B7000005920100BCFFFFFF000000004561010041
-:10B71000796101000000000000000000000000004E
-:10B720000D6C01002190020023900200D16C0100F9
-:10B730004B9102000000000000000000000000002B
-:10B740001F900200859202006B910200556D01006E
-:10B7500073910200000000000000000000000000E3
-:10B760001F900200D1920200C3920200DD6F01001F
-:10B77000B192020000000000000000000000000084
-:10B780001F900200B1A2020045A20200A5780100AC
-:10B7900033A20200000000000000000000000000D2
-:10B7A0001F900200297D01005D7C0100CBA30200F7
-:10B7B000CDA3020000000000000000000000000017
-:10B7C00025830100219002002390020009810100DD
-:10B7D00071A6020000000000000000000000000050
-:10B7E0001F90020021900200239002002990020085
-:10B7F0002B9002000000000000000000000000008C
-:10B800001F900200C58A010023900200A58A010052
-:10B81000F1AA02000000000000000000000000008B
-:10B820001F90020025AB02002390020003AB020030
-:10B8300005AB020000000000000000000000000056
-:10B840001F90020021900200239002002790020026
-:10B85000379002000000000000000000000000001F
-:10B86000C96001008961010033AE02003BAE0200F5
-:10B87000C0FFFFFF00000000178A0200138A0200C9
-:10B880003D8A0200678A0200638A02006B8A020016
-:10B890006F8A0200F16001009B61010015920100B6
-:10B8A00005920100BCFFFFFF0000000001610100E4
-:10B8B000AD61010000000000000000000000000079
-:10B8C0005592010063AE020043AE0200000000008A
-:10B8D00000000000000000007192010075AE02003F
-:10B8E000E2652F227F2B7A3C075C143326A6813C2D
-:10B8F000BDCBF07A8807703C075C143326A6913CD8
-:10B900004FBB610567ACDD3F182D4454FB21E93F77
-:10B910009BF681D20B73EF3F182D4454FB21F93F66
-:10B92000000000000000304300000000000030C3B1
-:10B9300014F902000400040051020000C4F60200E1
-:10B9400017000000020000009CB90200A4BE020023
-:10B9500099000000F1290200A1020000000000008F
-:10B96000FD1301003D150100000000000000000073
-:10B9700000000000000000000000000000000000C7
-:10B98000000000003CB9020014F9020004000300AA
-:10B99000A9290200A4BF020088B9020086040000A1
-:10B9A00094B90200BE05000030B9020070CF020059
-:10B9B0000100000070CF020014F902000400020030
-:10B9C00051060000A4BE0200F300000000000000C9
-:10B9D000000000000508000000000000000000005A
-:10B9E0000000000000000000000000000000000057
-:10B9F0000000000000000000000000000000000047
-:10BA000014F9020004000200D5090000A4BE0200DF
-:10BA1000F3000000610800000000000000000000CA
-:10BA20000000000000000000000000000000000016
-:10BA3000E52A0200F10900000000000000000000FB
-:10BA40000000000054BA020014F9020002000100D4
-:10BA5000010A0000C4F602001F00000003000000FD
-:10BA600070BA020014F9020004000400A1090000E9
-:10BA70006606000048BA02006E06000000BA020026
-:10BA80007606000064BA020014F902000200010008
-:10BA9000E52A020098BA0200A4BE02007800000065
-:10BAA000F50F00000000000000000000D90F0000AA
-:10BAB0000000000000000000000000000000000086
-:10BAC0000000000000000000000000000000000076
-:10BAD00000000000A4BE0200EF0000000000000013
-:10BAE00000000000452B02000000000000000000E4
-:10BAF0000000000000000000000000000000000046
-:10BB00000000000000000000000000000000000035
-:10BB100014F9020002000100D510000014F902001F
-:10BB2000020001005512000014F902000200010099
-:10BB30002110000014F90200040002000D120000A0
-:10BB400014F90200020001005D10000014F9020067
-:10BB500002000100A913000014F902000400020011
-:10BB60007D13000014F9020002000100C12B020045
-:10BB700014F902000200010039120000C4F60200AC
-:10BB8000E70000001C0000004CBC020014F9020099
-:10BB9000020001008D12000014F9020002000100F1
-:10BBA000A912000014F9020002000100F5100000C3
-:10BBB00014F9020002000100B12B020014F9020086
-:10BBC00004000200B511000014F902000200010097
-:10BBD0007112000014F9020002000100D52B0200CE
-:10BBE000D0CF0200040100007CBB020014F9020067
-:10BBF000020001001511000014F902000200020009
-:10BC0000F912000014F902000200010061130000A3
-:10BC100014F9020002000100B510000014F902003E
-:10BC2000020001007D11000014F902000200010071
-:10BC30009910000014F9020004000200E111000054
-:10BC400014F90200040002004D1100006E00000013
-:10BC5000260800002E08000056F8ADC03608000087
-:10BC6000DA0FC9C03E0800004CBB02005E050000B0
-:10BC700058BB02004608000004BC02004E08000049
-:10BC8000F8BB0200560800002CBD02005E08000050
-:10BC900098BB0200660800008CBB02006E08000022
-:10BCA000C8BB0200760800001CBB02007E08000032
-:10BCB00070BB02008608000034BB02008E08000042
-:10BCC000D4BB02009608000034BC02009E080000AD
-:10BCD00028BC0200AE08000064BB0200A6080000F9
-:10BCE000BCBB0200DE0800001CBC0200E60800002D
-:10BCF00040BC0200D6080000ECBB0200B608000001
-:10BD0000A4BB0200BE08000010BB0200C608000071
-:10BD100010BC0200CE080000B0BB0200F608000014
-:10BD200040BB0200EE08000028BB020014F902002C
-:10BD300002000100C512000040BD020054000000D6
-:10BD4000A4BE020001000000D913000000000000A2
-:10BD500000000000000000000000000000000000E3
-:10BD600000000000000000000000000000000000D3
-:10BD700000000000000000000000000014F90200B4
-:10BD80000300FFFF1D2C020014F902000200010055
-:10BD9000ED1300000002000002020000400000005D
-:10BDA000BE0200000202000048000000BD020000C8
-:10BDB0000202000080000000BC020000020200003D
-:10BDC00080000000BF02000001020000000000002F
-:10BDD000A4BE0200F400000000000000000000000B
-:10BDE0000000000000000000000000000000000053
-:10BDF00000000000E52A02008D1500000000000090
-:10BE00000000000000000000000000006E000000C4
-:10BE1000C6150000CE1500005CBE0200DE15000055
-:10BE20007CBD0200D615000034BE020006160000DC
-:10BE300088BD020014F902000300FFFF072C020076
-:10BE4000C4F602002F000000050000000CBE020036
-:10BE5000D0CF0200B802000040BE020014F9020078
-:10BE60000300FFFFE92B0200A4BE0200B80000009F
-:10BE7000DB2C020000000000000000002554000040
-:10BE8000E9540000AF2C0200E1550000815400008D
-:10BE900000000000000000000000000000000000A2
-:10BEA00000000000A4BE0200B9000000611D0000F7
-:10BEB000D122000019210000352B020000000000F3
-:10BEC000C72D02000000000000000000000000007C
-:10BED0000000000000000000000000000000000062
-:10BEE0000000000000000000000000000000000052
-:10BEF000000000001D0000001E0000000000000007
-:10BF00000000000000000000000000000000000031
-:10BF10000000000000000000000000000000000021
-:10BF20000000000000000000000000000000000011
-:10BF30000000000000000000000000000000000001
-:10BF40000000000024000000250000002600000082
-:10BF5000270000002800000000000000150000007D
-:10BF60000000000001000000A4BE0200B5000000B7
-:10BF7000311F0000BF2E0200000000000000000082
-:10BF8000000000000D1D0000000000000000000087
-:10BF900000000000000000000000000000000000A1
-:10BFA00000000000A4BE02008600000000000000A7
-:10BFB000A32D0200000000000000000000000000AF
-:10BFC0000000000000000000000000000000000071
-:10BFD0000000000000000000000000000000000061
-:10BFE000A4BE0200B300000000000000A32D020068
-:10BFF0000000000000000000000000000000000041
-:10C000000000000000000000000000000000000030
-:10C0100000000000000000000000000014F9020011
-:10C020000400020021240000140000001800000099
-:10C030000F000000000000000000000000000000F1
-:10C040000100000014F9020004000200DB2E0200CF
-:10C0500044C20200000000000000000000000000D8
-:10C0600014F9020004000400E52F0200C4F60200E7
-:10C07000C7000000180000000CC1020014F9020003
-:10C08000040002008B31020014F9020002000200D9
-:10C090002D30020014F90200020002001D300200DF
-:10C0A00014F9020004000400F52A000014F902004B
-:10C0B00002000100812C000014F9020006000400B7
-:10C0C0003D30020014F9020004000400F32F0200C6
-:10C0D00014F9020002000100492D000014F90200C9
-:10C0E000040003004929000014F902000300FFFFC7
-:10C0F000953A000014F90200040002004D280000E7
-:10C1000014F9020002000100192D0000E6060000EB
-:10C11000D8C10200EE06000060C002008E060000DA
-:10C12000C4C00200F6060000F0C10200AE06000026
-:10C13000F4C00200FE06000020C202000607000054
-:10C1400008C202000E070000DCC002001607000053
-:10C15000CCC10200B606000038C20200BE060000D4
-:10C1600094C00200C606000088C00200CE0600008F
-:10C17000E8C002001E070000B8C002007E060000F2
-:10C18000A0C00200260700007CC002002E070000AD
-:10C190002CC2020036070000FCC102003E0700006E
-:10C1A000ACC0020046070000E4C102004E070000D8
-:10C1B00000C102005607000014C202005E07000022
-:10C1C00080C2020066070000D0C0020014F902001D
-:10C1D00004000300AD29000014F90200040004006B
-:10C1E000D92F020014F9020002000100092D0000FD
-:10C1F00014F9020004000400FF2F020014F90200E9
-:10C2000002000100712C000014F90200020003007A
-:10C21000153C000014F9020002000100292D000065
-:10C2200014F9020002000300D13A000014F90200E0
-:10C23000040002009531020014F90200020002001D
-:10C240000D300200A4BE020083000000CD2E0000CD
-:10C25000CD2D000000000000000000008D35000022
-:10C2600000000000592D0000D5240000000000004F
-:10C27000AF2F020000000000000000006CC00200B0
-:10C2800014F9020002000100392D00000000010035
-:10C29000000002000000040014F902000200020085
-:10C2A000B53F000040EC0200000000000800000064
-:10C2B0001A51030068BE020002000000560100008F
-:10C2C000C8C2020048C3020070CF02000300000091
-:10C2D000030000000F000000010000006E000000DD
-:10C2E000B6050000B609000028C30200BE09000020
-:10C2F00014C30200CE090000B4C202009609000077
-:10C30000A4C20200760900008E090000D6090000D0
-:10C3100098C2020070CF0200030000000700000076
-:10C32000090000000100000040EC020000000000D5
-:10C33000050000001D2E0300C4F602003F000000AF
-:10C3400007000000DCC202003801000036010000D6
-:10C35000D0CF0200B600000038C3020064C3020060
-:10C3600001000000A4BE020081000000394000006E
-:10C3700055400000000000000F3202003B32020076
-:10C3800000000000000000000000000000000000AD
-:10C39000000000000000000000000000000000009D
-:10C3A00064C3020000000000AEC59D74CA1B0E5A93
-:10C3B00020BCBE4C00401C460000C842000020418A
-:10C3C0001FB14F0A9595E62477CC2B3217B7D13899
-:10C3D0000AD7233CCDCCCC3DA4BE0200F400000023
-:10C3E000000000000000000000000000000000004D
-:10C3F000000000000000000000000000E52A02002C
-:10C40000893202000000000000000000000000006F
-:10C4100000000000A4BE0200F400000000000000C4
-:10C42000000000000000000000000000000000000C
-:10C430000000000000000000E52A02009132020026
-:10C4400000000000000000000000000000000000EC
-:10C4500070CF020012000000C61100008E11000013
-:10C460005E1200002E120000961300002E12000033
-:10C470009613000056130000B61300008E11000042
-:10C480008E110000B61300002E120000761300007B
-:10C490002E120000761300004E1300005E12000002
-:10C4A00070CF020019000000F61100002E120000EB
-:10C4B000C6120000461200004E1300003E1300009A
-:10C4C0003E1200002E120000C612000046120000AC
-:10C4D000B6130000AE1300003E1200002E12000042
-:10C4E000261200000E1100004E1300002E0800005E
-:10C4F00056120000FE100000F61000003611000079
-:10C500004E130000B6130000AE13000070CF0200FF
-:10C510001E000000EE1200002E0800004E13000066
-:10C52000B6130000B61300004E1300002E080000E2
-:10C53000561200008E1100008E11000056120000ED
-:10C540002E08000036130000B6120000DE120000B4
-:10C55000261300002E0800004E130000B613000042
-:10C56000B61300004E1300002E0800005612000003
-:10C570008E1100008E110000561200002E080000DF
-:10C58000D6120000361200004E12000070CF0200DA
-:10C5900012000000FE1100009E1300008E13000028
-:10C5A000AE13000046120000161400000E13000027
-:10C5B000AE130000461200009E130000261100007A
-:10C5C000261200001E1100008E130000A6130000AA
-:10C5D0001E1300008E1300001E14000070CF020016
-:10C5E0004F0000009E1200005611000026140000AB
-:10C5F0000E0200000E020000EE1000000E0200000D
-:10C60000F613000026140000561200005612000017
-:10C610002614000056110000061200002614000027
-:10C620008E1100008E11000026140000561200002A
-:10C630002E1300002E1200000E1100002614000020
-:10C64000E6100000E6100000BE130000E610000037
-:10C650005E130000261400002E0800002E080000C3
-:10C66000261400008E110000561100002614000050
-:10C670000E0200000E020000261400000612000048
-:10C68000CE120000AE120000561100002614000069
-:10C690000E0200000E020000EE1000000E0200006C
-:10C6A0006E11000026140000B6130000B61300003F
-:10C6B00026140000561200009611000026140000F7
-:10C6C000E6100000E610000026140000E61000004E
-:10C6D0003E11000006140000761300002611000031
-:10C6E000E6100000BE130000E61000001613000064
-:10C6F00026110000E6100000BE130000E610000046
-:10C700005612000026140000961100005612000078
-:10C710002614000096110000B61200004614000016
-:10C7200070CF020002000000761100000613000026
-:10C7300070CF02000A0000002E140000B6130000A3
-:10C74000B6130000B6130000461300003E140000AC
-:10C750004E1300004E1300004E130000DE120000C6
-:10C7600070CF02006A00000066130000BE130000D4
-:10C77000B61100006E1200005E1100009E12000053
-:10C7800096110000661100000E0200009E110000CC
-:10C7900056120000AE120000961100005E1100005B
-:10C7A000A61100005E12000056130000BE13000028
-:10C7B0005E12000056130000961100005612000091
-:10C7C000561100009E110000561100006612000074
-:10C7D00056130000C61300005E120000561300003E
-:10C7E000961100005E120000561100009612000023
-:10C7F0005E12000056120000961100005611000053
-:10C800009E110000B61200005E1100009E11000093
-:10C810005E12000056130000961100005612000030
-:10C820009611000056110000AE11000056110000D4
-:10C830009E110000561100006E130000BE13000090
-:10C84000861100006E130000BE1300000E020000EF
-:10C850009E1100005E12000056110000FE12000042
-:10C860005E1200002E080000561300006611000042
-:10C870000E0200006E130000BE1300000E02000046
-:10C8800056130000FE1200005E1200009611000018
-:10C8900056110000561300005E1200002E08000022
-:10C8A00056130000861100006E130000BE13000036
-:10C8B000861100006E130000BE1300000E0200007F
-:10C8C0000E0200009E1100005E12000056110000D2
-:10C8D00056130000BE13000056130000861100001E
-:10C8E0007E110000EE1000000E0200005613000042
-:10C8F000BE1300000E020000FE1200005E120000D7
-:10C900002E08000056130000661100009E11000062
-:10C9100070CF020006000000FE1300005E1200004F
-:10C920008E110000EE1300007E1100001E120000A8
-:10C9300070CF020030000000C61100002E08000079
-:10C94000B6130000E6100000EE100000E610000034
-:10C95000B61300002E080000C61100002E080000CB
-:10C96000B6130000E6100000EE100000E610000014
-:10C97000B61300002E0800004E130000E610000061
-:10C98000CE110000561200005E1200005612000088
-:10C990008E11000006110000C61100002E080000D4
-:10C9A000B6130000E6100000EE100000E6100000D4
-:10C9B000B61300002E080000B61300000E0200009F
-:10C9C0007E1200004E13000086130000E6100000E7
-:10C9D000CE1100005E120000C61100002E080000FB
-:10C9E000B61300002E080000B61300004E1300001E
-:10C9F0002E0800005612000070CF02000500000053
-:10CA0000FE1300004E1300002E0800005612000016
-:10CA10008E11000070CF02000B000000DE1100003C
-:10CA20003E1200002E120000461200007612000096
-:10CA3000AE120000BE1200002E1200003E120000D6
-:10CA400046110000DE11000070CF02002800000037
-:10CA5000161100000E020000061200005611000020
-:10CA60002E11000026140000261100000E02000006
-:10CA700006120000561100002E11000026140000BE
-:10CA80002E110000FE1200005E1200002E080000B1
-:10CA90004E1300002E0800005E1200002E08000059
-:10CAA0005E11000006120000561200008E110000F8
-:10CAB00066110000261400007E110000061200001E
-:10CAC000561200008E1100006611000026140000AE
-:10CAD00086110000FE1200005E1200002E08000009
-:10CAE0004E1300002E0800005E1200002E08000009
-:10CAF00070CF020006000000E613000006120000DE
-:10CB00002E0800000E1400000E1300001614000082
-:10CB100070CF0200120000008E1200005E120000B2
-:10CB20002E08000016120000F61200001612000077
-:10CB3000F61200001E1200002E1200005612000015
-:10CB40005E1200002E0800008E1100005612000038
-:10CB5000161300005E110000A6120000461200002D
-:10CB600070CF020008000000D6110000261400005B
-:10CB7000B61200005E120000261400008E110000A4
-:10CB8000261400007E13000070CF02000900000090
-:10CB9000F6110000D613000056130000B613000073
-:10CBA000CE130000B6130000261400000E02000091
-:10CBB000E611000070CF020040000000EE110000FE
-:10CBC0002E080000B6130000061200002E08000018
-:10CBD000DE130000061200002E080000E61100001F
-:10CBE0002E080000B6130000061200002E080000F8
-:10CBF000DE130000061200002E080000E6110000FF
-:10CC000056120000B6130000961200004E130000EA
-:10CC1000DE130000961200004E130000E611000023
-:10CC200056120000B6130000961200004E130000CA
-:10CC3000DE130000961200004E1300004E1100009B
-:10CC400086120000B6130000961200004E1300007A
-:10CC5000DE130000961200004E1300004E1100007B
-:10CC600086120000B6130000961200004E1300005A
-:10CC7000DE130000961200004E130000E6110000C3
-:10CC80002E080000B6130000061200002E08000057
-:10CC9000DE130000061200002E080000E61100005E
-:10CCA0002E080000B6130000061200002E08000037
-:10CCB000DE130000061200002E08000070CF0200F4
-:10CCC0000D000000EE1100005612000016130000C7
-:10CCD000B6130000AE1200002E08000096130000EC
-:10CCE000E61000000E1300004E1300000E140000AA
-:10CCF0000E0200002612000070CF020005000000A6
-:10CD00000E120000561200002E0800004E13000004
-:10CD1000B613000070CF020007000000E61200000A
-:10CD2000361400007612000036140000C61200000F
-:10CD300036140000BE11000014F9020004000200C5
-:10CD4000BF32020014F9020006000300D5320200CF
-:10CD500014F9020004000200ED32020014F902008E
-:10CD60000400020003330200A4BE0200B000000071
-:10CD70000000000039330200000000000000000045
-:10CD8000000000000000000000000000E52A020092
-:10CD90001933020000000000000000000000000045
-:10CDA00000000000A4BE02008F0000004147000008
-:10CDB000A147000000000000F54600005F340200BB
-:10CDC0000000000000000000000000000000000063
-:10CDD0000000000000000000000000000000000053
-:10CDE000A4BE0200010000000000000000000000DE
-:10CDF0000000000000000000000000000000000033
-:10CE00000000000000000000000000000000000022
-:10CE100000000000000000000000000014F9020003
-:10CE2000020005000D50000014F90200020001008C
-:10CE3000E1F90000F9FA00009DFB0000000000008D
-:10CE400000000000C4F602004F00000009000000CE
-:10CE5000FCCE020014F9020002000100055300009C
-:10CE6000A4BE0200B10200000000000000000000AB
-:10CE700000000000000000000000000000000000B2
-:10CE800000000000000000000000000000000000A2
-:10CE900034CE02000000000044CE020014F902006B
-:10CEA0000200020039530000A4BE0200B2020000DA
-:10CEB0000000000000000000000000000000000072
-:10CEC0000000000000000000000000000000000062
-:10CED000000000000000000044CF0200000000003D
-:10CEE00044CE020014F90200080004002953000097
-:10CEF00014F9020002000100195300006606000048
-:10CF0000F0CE0200C609000028CE0200B6000000E4
-:10CF100088BA0200BE000000E4CE02009E150000A8
-:10CF200054CE02007605000028FF0200A61400007F
-:10CF3000F8FE02009E1400001CFF0200DE05000047
-:10CF400004FF0200F9FA00009DFB00000000000051
-:10CF50000100000014F9020004000400DD350200A5
-:10CF6000C4F602001700000002000000B4CF020067
-:10CF7000A4BE0200B8000000CD53000055560000CA
-:10CF80000000000025540000E954000000000000EB
-:10CF9000E155000081540000000000000000000086
-:10CFA000000000000000000060CF020070CF02000F
-:10CFB000000000007E060000C4CF02008E060000C4
-:10CFC00054CF020014F9020004000200F1350200FF
-:10CFD000A4BE0200F5000000A958000000000000F7
-:10CFE000000000000000000000000000BD5800002C
-:10CFF0000000000000000000000000000000000031
-:10D00000000000000000000000000000B700000069
-:10D010001600000018D002005E00000060D602007A
-:10D020009E02000068EE020056010000A0F502001A
-:10D03000F603000030E402003E0400006CD602005B
-:10D04000E6090000E0F9020026080000E0BB02004B
-:10D05000B605000050C30200160A000024D70200E3
-:10D060005E0A000054090300EE0F00008402030072
-:10D070008E0A0000200803009E0A0000A40A030094
-:10D08000A60A000034FF0200F6140000C0000300EE
-:10D09000061500005013030066150000C8D00200FA
-:10D0A0000E160000780E03003E150000B8FF0200C7
-:10D0B000C615000050BE0200560A00006CD60200E1
-:10D0C000DE090000E0F90200D0CF0200AC0200004F
-:10D0D000E8D00200AE020000AF020000B002000083
-:10D0E00036010000B5020000C4F602002F00000067
-:10D0F0000500000028D1020040EC02000000000002
-:10D1000017000000BF31030068BE020005000000E8
-:10D11000A4D1020094D102006CD102005CD10200C3
-:10D12000F8D00200D4D002006E00000066150000A6
-:10D130009606000088D10200A615000050D102001A
-:10D14000B6150000B4D102006E1500007CD10200BB
-:10D1500014F90200000000006DFC000040EC020029
-:10D16000000000001D000000D731030040EC020069
-:10D170000000000003000000F531030014F9020074
-:10D1800000000000ED59000014F902000200010047
-:10D19000C5FA000040EC020000000000080000009A
-:10D1A0001A51030040EC02000000000008000000DB
-:10D1B0001A51030014F9020002000100B5FC00003E
-:10D1C000A4BE0200BC00000000000000F5590000F1
-:10D1D000000000000000000000000000000000004F
-:10D1E00000000000E52A0200733902000000000080
-:10D1F000000000000000000000000000A4BE0200CB
-:10D200009E0000000D5E0000FD3A020000000000DC
-:10D21000E55B0000215F000000000000FD5F0000F2
-:10D22000C95E0000000000000000000000000000D7
-:10D2300000000000CCD20200DA000000030200006F
-:10D2400094BA0200DB0000000102000000000000B0
-:10D250005E060000E8D202000E060000A8D202001E
-:10D260001606000000D302007E06000018D302005C
-:10D2700086060000DCD202008E06000024D30200E5
-:10D280009E060000F4D202002E020000B4D202007A
-:10D2900096060000C0D20200DE06000030D3020075
-:10D2A000A60600000CD3020014F9020002000100DF
-:10D2B000E55C000014F90200020002006D5D000050
-:10D2C00014F9020004000200ED5D0000C4F6020043
-:10D2D0005F0000000B00000050D2020014F90200B1
-:10D2E00004000200555E000014F902000400020070
-:10D2F000455C000014F9020006000300915C000088
-:10D3000014F90200020001004F3B020014F9020070
-:10D310000300FFFF0D5D000014F90200040002008D
-:10D32000D73A020014F9020004000400A33A0200F4
-:10D3300014F90200020001000D5C00000000000072
-:10D340005F480200A4BE0200F400000000000000DC
-:10D3500000000000000000000000000000000000CD
-:10D360000000000000000000E52A0200E56B00005C
-:10D3700000000000000000000000000000000000AD
-:10D380009E22030046200300C81F0300AC220300B6
-:10D390006E1F03002C210300362103008C210300A3
-:10D3A0004E1F0300081F0300C621030016210300BF
-:10D3B000E021030034220300602003007A220300EE
-:10D3C000F41E030058230300C8200300FE210300BD
-:10D3D000021F0300D821030018220300AC1F030022
-:10D3E00030210300F222030060220300541F0300D7
-:10D3F000CC1F03003423030008230300481F03004D
-:10D400009C200300A0230300762203004A2003008F
-:10D41000BE2203008E20030024220300902103007B
-:10D420002C20030088210300D21F0300301F0300BB
-:10D430002A220300C21F03000021030078210300F9
-:10D44000EC2203000E200300FC1E03005422030004
-:10D450005020030040210300EC2103003220030090
-:10D4600006200300F620030086220300BA210300F1
-:10D47000522303004C230300981F0300921F030054
-:10D48000DE1F0300861F0300341F03006820030013
-:10D49000CA2203002E2203008C2203001E1F030059
-:10D4A00028210300B21F03008C2303007620030011
-:10D4B000EA1F03005A200300002303004C2103004D
-:10D4C0003A200300DA200300982303006A230300B4
-:10D4D000AA210300601F0300B82203005A1F0300A3
-:10D4E000B2220300E6200300E82203001222030018
-:10D4F0003A2303005621030072210300D2220300C5
-:10D50000F41F030080220300142003000422030000
-:10D51000C42203006C21030078230300F8210300D8
-:10D52000222103007E2103008221030070220300D8
-:10D5300042220300A82003001E2203003C22030015
-:10D54000602103005A220300BC200300141F0300C3
-:10D55000C0210300CE200300FE1F03000A220300A7
-:10D560002C1F0300A62203001A230300F22103004C
-:10D57000661F03001A200300AE2003003A1F0300B9
-:10D580008C1F0300F0200300B6200300402303009B
-:10D59000462303006E20030094200300DE200300D6
-:10D5A000BC1F03000E1F03000421030048220300D8
-:10D5B0004E220300741F03007A1F0300801F030024
-:10D5C00066210300B4210300FA200300E6210300D2
-:10D5D000D4200300C2200300DC220300A2200300A9
-:10D5E000421F0300642203000A210300F822030003
-:10D5F000722303008620030040200300E41F030081
-:10D600001C2103005E230300642303004621030062
-:10D61000202003009E1F0300A61F0300E222030038
-:10D620006A220300A4BE0200F20000000000000015
-:10D6300000000000C97400000000000000000000AD
-:10D6400000000000000000000000000000000000DA
-:10D6500000000000000000000000000000000000CA
-:10D66000D0CF02000B000000BC2E0020D0CF020063
-:10D670008700000078D60200C4F602001F000000F8
-:10D680000300000088D602006E0000003E04000087
-:10D6900026050000B8B90200CE03000088F602009B
-:10D6A000C4F602003F00000007000000E0D60200C0
-:10D6B00014F90200000000006182000014F9020069
-:10D6C00000000000DB4E020014F902000000000020
-:10D6D0007982000014F9020000000000918200002D
-:10D6E0006E000000160A00001E0A000030D702007B
-:10D6F000260A0000B0D602002E0A0000C8D602009A
-:10D70000360A0000D4D602003E0A000018D70200F4
-:10D71000460A0000BCD6020014F902000000000016
-:10D72000C74E0200D0CF020042010000A0D6020086
-:10D7300014F9020000000000B1820000A200000005
-:10D74000A7000000A70000007F000000800000008C
-:10D75000E20000003C0000003C000000000000006F
-:10D7600000000000E10000003C0000003B00000061
-:10D770000000000000000000C800000000000000E1
-:10D78000000000003600000037000000C700000065
-:10D79000000000000000000036000000360000001D
-:10D7A000C4F6020017000000020000007CD802004E
-:10D7B00014F90200040002001D8D000014F902009B
-:10D7C00004000200B18C0000A4BE0200F4000000BE
-:10D7D0000000000000000000000000000000000049
-:10D7E000000000000000000000000000E52A020028
-:10D7F0007D4F02000000000000000000000000005B
-:10D8000000000000A4BE02007E000000A18D000008
-:10D810009F4F020000000000898C0000858E0000F0
-:10D820000000000081900000898D000000000000D1
-:10D830005B4F02000000000000000000A0D70200C3
-:10D84000A4BE020082000000A18D0000259100000E
-:10D8500000000000898C0000858E000000000000A0
-:10D8600081900000898D0000000000005B4F0200E5
-:10D870000000000000000000A0D702005E060000CB
-:10D88000B0D7020086060000BCD7020014F90200DF
-:10D8900002000300D54F020014F902000200030049
-:10D8A000DF4F0200A4BE0200A00000000000000044
-:10D8B000C591000000000000000000000000000012
-:10D8C0000000000000000000E52A0200E94F02000D
-:10D8D0000000000000000000000000000000000048
-:10D8E00000000000000000000A000000D00200005C
-:10D8F00041440300444403004E44030052440300E7
-:10D900005644030068440300744403007E4403004B
-:10D910008B44030096440300A0440300AD4403007D
-:10D92000B8440300C5440300D0440300DB440300B3
-:10D93000E6440300F1440300004503000B450300E7
-:10D940001C450300274503003645030042450300FC
-:10D950004D45030057450300624503007045030031
-:10D960007E4503008C45030096450300A045030057
-:10D97000AB450300B5450300C3450300CD45030097
-:10D98000D8450300E1450300EA450300F3450300E1
-:10D99000FC4503000546030014460300224603002D
-:10D9A0002D46030035460300414603004946030067
-:10D9B00051460300584603005F46030065460300D6
-:10D9C0006B46030072460300784603007E46030060
-:10D9D000844603008A4603009046030096460300EF
-:10D9E0009C460300A3460300AA460300B04603007A
-:10D9F000B7460300BE460300C2460300C746030005
-:10DA0000CC460300D3460300D9460300E146030099
-:10DA1000E9460300EF460300F5460300FC46030019
-:10DA2000034703000A470300124703001847030097
-:10DA30001F470300264703002E4703003647030015
-:10DA4000414703004C4703005C4703006C47030059
-:10DA50007E4703008F470300A0470300AE47030043
-:10DA6000B9470300C5470300D7470300EB4703004E
-:10DA700000480300104803001E480300314803001B
-:10DA80003E480300524803005D4803006B48030012
-:10DA900079480300854803009B480300A54803001C
-:10DAA000B5480300C4480300D2480300DF48030020
-:10DAB000EB480300FF4803000C4903002049030022
-:10DAC0002F490300364903003E490300454903003E
-:10DAD0004E49030059490300674903006D4903009B
-:10DAE0007349030079490300804903008849030012
-:10DAF0008E490300964903009D490300A94903008C
-:10DB0000B1490300BC490300C2490300D0490300E6
-:10DB1000DF490300E6490300EC490300F54903002F
-:10DB2000014A0300084A03000F4A0300184A030091
-:10DB3000204A03002D4A0300374A0300414A0300EC
-:10DB40004B4A0300554A03005C4A0300624A030043
-:10DB5000684A03006D4A0300734A0300804A0300C9
-:10DB60008D4A0300944A03009A4A0300A14A030025
-:10DB7000AA4A0300B04A0300B64A0300BC4A0300A5
-:10DB8000C64A0300D34A0300DA4A0300E04A03000E
-:10DB9000E64A0300ED4A0300F34A0300FA4A030091
-:10DBA000004B0300084B0300104B0300174B03000E
-:10DBB0001E4B0300294B0300314B03003A4B03007B
-:10DBC000494B03004F4B0300574B03005D4B0300D1
-:10DBD000684B0300704B0300774B03007F4B03003F
-:10DBE000874B03008D4B0300934B0300994B0300BD
-:10DBF000A04B0300A74B0300AF4B0300B64B030041
-:10DC0000C14B0300C74B0300CF4B0300D64B0300AF
-:10DC1000E04B0300ED4B0300F64B0300FF4B03000A
-:10DC2000084C0300104C0300174C03001F4C03006A
-:10DC3000274C0300304C0300384C0300414C0300D8
-:10DC40004A4C0300514C0300584C0300604C030045
-:10DC5000694C0300724C03007B4C0300814C0300B1
-:10DC60008B4C0300924C03009A4C0300A34C03001E
-:10DC7000AB4C0300B44C0300C14C0300CC4C03007C
-:10DC8000D64C0300E24C0300EF4C0300F74C0300BA
-:10DC9000FF4C0300094D0300134D03001D4D03000D
-:10DCA000274D0300314D03003C4D0300444D03005C
-:10DCB000534D03005D4D0300694D0300744D030097
-:10DCC000804D03008B4D0300944D03009C4D0300D9
-:10DCD000A64D0300B34D0300C74D0300D64D03000E
-:10DCE000EC4D0300F94D0300044E0300114E0300F8
-:10DCF000174E03002E4E03004C4E0300544E0300FB
-:10DD0000604E0300674E03006B4E0300704E03002D
-:10DD1000774E03007D4E0300834E0300894E0300BF
-:10DD20008F4E0300954E03009C4E0300A34E03004C
-:10DD3000AA4E0300B24E0300B94E0300C44E0300C6
-:10DD4000CB4E0300D24E0300DA4E0300E54E030033
-:10DD5000ED4E0300F54E0300FD4E0300044F03009B
-:10DD60000C4F0300144F03001E4F0300284F030005
-:10DD7000334F03003F4F03004B4F0300574F030047
-:10DD8000654F0300884F0300934F03009E4F03002D
-:10DD9000AB4F0300B84F0300C44F0300D04F030044
-:10DDA000DB4F0300E54F0300EC4F0300F84F030087
-:10DDB000FE4F0300055003000E50030019500300EE
-:10DDC000215003002A500300335003003D5003004C
-:10DDD0004C5003005350030064500300765003007E
-:10DDE0007F50030089500300905003009C500300B3
-:10DDF000A5500300B3500300BE500300C3500300FE
-:10DE0000CD500300D7500300E0500300EC50030056
-:10DE1000F7500300035103000A5103001851030097
-:10DE2000235103002B5103003351030042510300DF
-:10DE30004A510300585103005F5103006951030028
-:10DE4000775103007E510300895103009E51030066
-:10DE5000B9510300CC510300DB510300EB51030027
-:10DE6000F9510300085203001C5203003D52030005
-:10DE70005E5203006B520300785203007F5203008E
-:10DE8000865203008D520300945203009B520300FC
-:10DE9000A2520300A9520300B0520300B75203007C
-:10DEA000BE520300C6520300CE520300D6520300F6
-:10DEB000DE520300E6520300EE520300F652030066
-:10DEC000FE52030006530300165303001E530300C3
-:10DED000265303002E53030037530300405303001F
-:10DEE0004C5303005853030065530300735303005E
-:10DEF0007E5303008B530300975303009F5303008B
-:10DF0000AD530300B5530300BB530300C3530300D9
-:10DF1000CE530300D6530300DF530300EB5303003B
-:10DF2000F3530300FE530300045403000A54030098
-:10DF30000F54030019540300225403002B54030010
-:10DF4000345403003D540300465403004F5403006F
-:10DF500058540300615403006A54030074540300CE
-:10DF60007E54030088540300935403009D5403001F
-:10DF7000A8540300B2540300BD540300C754030067
-:10DF8000D2540300DD540300ED540300FA5403009F
-:10DF900004550300145503001D5503002C550300C0
-:10DFA000355503003B5503004C5503005B550300FA
-:10DFB0006B550300775503007E550300875503001A
-:10DFC0009055030099550300A7550300AE55030073
-:10DFD000B6550300C1550300CD550300DB550300C2
-:10DFE000E3550300EB550300F5550300FD55030011
-:10DFF00008560300105603001D5603002A5603005E
-:10E000003C5603004D560300605603006A56030059
-:10E01000715603007A560300825603008B560300A4
-:10E020009256030099560300A0560300A75603001A
-:10E03000B5560300C7560300CC560300D256030062
-:10E04000DA560300E3560300F4560300FF560300BC
-:10E050000A570300175703002557030033570300DF
-:10E060004B5703005B570300635703006B570300D4
-:10E070007357030080570300925703009F57030014
-:10E08000AD570300BC570300C1570300C857030036
-:10E09000CF570300D7570300E1570300ED570300A4
-:10E0A000F8570300FD570300025803000758030008
-:10E0B0000F580300215803002B5803003558030064
-:10E0C0004558030051580300655803007A5803006F
-:10E0D000885803008E580300955803009958030090
-:10E0E0009F580300A8580300B0580300BC58030011
-:10E0F000C7580300CF580300D5580300DC5803006D
-:10E10000E8580300F4580300FA58030002590300CA
-:10E110000A590300145903001F590300275903002B
-:10E120002F5903003B590300495903005359030079
-:10E130005A590300665903007059030077590300C8
-:10E140007D5903008A590300955903009F59030024
-:10E15000AB590300B4590300BF590300CB59030066
-:10E16000D5590300D9590300DE590300E5590300CE
-:10E17000EC590300F1590300F6590300FD5903005F
-:10E18000045A03000A5A0300105A0300165A0300E7
-:10E190001C5A0300235A0300285A03002D5A030077
-:10E1A000345A03003B5A0300405A0300475A030005
-:10E1B0004D5A0300535A0300575A03005C5A030098
-:10E1C000625A03006A5A0300725A0300795A030024
-:10E1D000805A0300875A03008C5A0300935A0300A5
-:10E1E0009A5A03009F5A0300A65A0300AD5A03002F
-:10E1F000B45A0300B95A0300C05A0300C75A0300B7
-:10E20000CE5A0300D55A0300DB5A0300E15A03003B
-:10E21000E75A0300ED5A0300F35A0300F75A0300CC
-:10E22000FC5A0300045B03000B5B0300125B03005A
-:10E23000175B03001C5B0300235B0300285B0300E8
-:10E240002F5B0300365B03003C5B0300425B030073
-:10E25000485B03004E5B0300545B03005A5B030002
-:10E26000605B0300675B03006C5B0300735B030090
-:10E27000785B03007F5B0300855B03008B5B03001F
-:10E28000915B0300975B03009D5B0300A35B0300AE
-:10E29000A95B0300B05B0300B45B0300B95B030040
-:10E2A000BF5B0300C75B0300CE5B0300D55B0300CD
-:10E2B000DC5B0300E15B0300E75B0300ED5B030055
-:10E2C000F35B0300F95B0300FF5B0300035C0300E7
-:10E2D000085C03000F5C0300165C03001D5C030078
-:10E2E000225C0300295C0300305C0300355C030002
-:10E2F0003C5C0300425C0300485C03004E5C03008E
-:10E30000545C0300585C03005F5C0300655C030021
-:10E310006B5C0300715C0300805C0300875C03009E
-:10E320008E5C0300995C0300A05C0300A95C030001
-:10E33000B05C0300B55C0300BA5C0300C45C03007E
-:10E34000CF5C0300DA5C0300E05C0300E75C0300E1
-:10E35000F55C0300FB5C0300025D0300095D030044
-:10E36000105D0300175D0300285D0300335D0300AB
-:10E370003E5D0300475D0300555D03005C5D0300E7
-:10E38000685D0300725D03007B5D0300855D030033
-:10E390008D5D03009A5D0300A75D0300B05D03007F
-:10E3A000BB5D0300C05D0300C85D0300D25D0300D8
-:10E3B000DD5D0300E75D0300F15D0300FA5D03002E
-:10E3C000055E03000F5E0300195E0300205E03007C
-:10E3D0002D5E0300365E03003C5E0300485E0300D2
-:10E3E0004F5E0300585E0300605E0300685E03003A
-:10E3F000705E03007C5E0300845E03008D5E03009C
-:10E400009A5E0300AA5E0300B45E0300BD5E0300D3
-:10E41000C55E0300CF5E0300D75E0300E35E03002A
-:10E42000ED5E0300F55E0300045F0300115F03006F
-:10E43000D0CF02007E0000003CE40200C4F60200DF
-:10E4400017000000020000004CE402006E00000013
-:10E45000F6030000F603000004D8020070CF0200AB
-:10E4600008000000DC0B03003C0C03009C0B0300C5
-:10E47000640B03005C0C0300F40B0300040C0300AA
-:10E48000EC0A030070CF02000C0000001C0C03001B
-:10E49000A40C03001C0B0300540C0300140C030019
-:10E4A0009C0C03000C0B0300A40B0300FC0B0300EB
-:10E4B000940C0300BC0B0300B40B0300A4BE0200C9
-:10E4C000AD00000015A800000B5102000000000084
-:10E4D000C5A70000000000006551020049A8000027
-:10E4E000F5A7000000000000000000000000000090
-:10E4F0000000000000000000A4BE0200F4000000C4
-:10E50000000000000000000000000000000000000B
-:10E51000000000000000000000000000E52A0200EA
-:10E52000B9500200000000000000000000000000E0
-:10E5300000000000000000000700000013000000C1
-:10E540002B00000059000000B30000005B01000038
-:10E5500087020000CD040000F908000093100000BD
-:10E56000951E00000B380000A16500002DB80000CA
-:10E57000D34B01007B530200652B0400CF730700CF
-:10E5800027460D00A59B170021E32900A72E4A006E
-:10E59000A4BE02006400000019BC0000B5BB00006E
-:10E5A000000000000000000000000000A1BC00000E
-:10E5B000000000000000000000000000000000005B
-:10E5C000000000007CE702000000000070CF0200A5
-:10E5D0000100000014E60200A4BE02007100000069
-:10E5E00019BC0000B5BB00000000000000000000E6
-:10E5F00000000000A1BC00000000000000000000BE
-:10E60000000000000000000000000000ECE6020036
-:10E6100000000000A4BE02006C00000019BC000055
-:10E62000B5BB00000000000000000000000000007A
-:10E63000A1BC00000000000000000000000000007D
-:10E640000000000000000000ECE6020000000000F6
-:10E65000460000003CE80200A4BE02006700000083
-:10E6600019BC0000B5BB0000000000000000000065
-:10E6700000000000A1BC000000000000000000003D
-:10E68000000000000000000000000000ECE60200B6
-:10E69000000000007CEB0200000000000000000011
-:10E6A000ACCF020070CF02000100000048E8020079
-:10E6B000A4BE02007300000019BC0000B5BB00003E
-:10E6C000000000000000000000000000A1BC0000ED
-:10E6D000000000000000000000000000000000003A
-:10E6E00000000000ACEA02000000000070CF020051
-:10E6F0000100000004EC0200A4BE02006E00000055
-:10E7000019BC0000B5BB00000000000000000000C4
-:10E7100000000000A1BC000000000000000000009C
-:10E720000000000000000000000000007CE7020084
-:10E7300000000000A4BE02006300000019BC00003D
-:10E74000B5BB000000000000000000000000000059
-:10E75000A1BC00000000000000000000000000005C
-:10E760000000000000000000A4E60200000000001D
-:10E7700070CF02000100000000E8020070CF02002C
-:10E780000100000044E90200A4BE02006A0000008B
-:10E7900019BC0000B5BB0000000000000000000034
-:10E7A00000000000A1BC000000000000000000000C
-:10E7B000000000000000000000000000ECE6020085
-:10E7C00000000000A4BE02006800000019BC0000A8
-:10E7D000B5BB0000000000000000000000000000C9
-:10E7E000A1BC0000000000000000000000000000CC
-:10E7F0000000000000000000ECE602000000000045
-:10E80000A4BE02005700000019BC0000B5BB000008
-:10E81000000000000000000000000000A1BC00009B
-:10E8200000000000000000000000000000000000E8
-:10E8300000000000ECE602000000000014F90200F5
-:10E840000200FFFF05BC0000A4BE0200660000003D
-:10E8500019BC0000B5BB0000000000000000000073
-:10E8600000000000A1BC000000000000000000004B
-:10E87000000000000000000000000000ECE60200C4
-:10E8800000000000A4BE02005500000019BC0000FA
-:10E89000B5BB000000000000000000000000000008
-:10E8A000A1BC00000000000000000000000000000B
-:10E8B0000000000000000000ECE602000000000084
-:10E8C000A4BE02006200000019BC0000B5BB00003D
-:10E8D000000000000000000000000000A1BC0000DB
-:10E8E0000000000000000000000000000000000028
-:10E8F0000000000038E9020000000000A4BE020091
-:10E900005900000019BC0000B5BB00000000000069
-:10E910000000000000000000A1BC0000000000009A
-:10E9200000000000000000000000000000000000E7
-:10E93000ECE602000000000070CF020001000000C1
-:10E9400040EB0200A4BE02005600000019BC00000B
-:10E95000B5BB000000000000000000000000000047
-:10E96000A1BC00000000000000000000000000004A
-:10E97000000000000000000000000000B8EA0200F3
-:10E98000A4BE02006100000019BC0000B5BB00007D
-:10E99000000000000000000000000000A1BC00001A
-:10E9A0000000000000000000000000000000000067
-:10E9B00000000000ECE6020000000000A4BE02001F
-:10E9C0005800000019BC0000B5BB000000000000AA
-:10E9D0000000000000000000A1BC000000000000DA
-:10E9E0000000000000000000000000000000000027
-:10E9F000ECE6020000000000A4BE02005B00000084
-:10EA000019BC0000B5BB00000000000000000000C1
-:10EA100000000000A1BC0000000000000000000099
-:10EA2000000000000000000000000000ECE6020012
-:10EA300000000000A4BE02007200000019BC00002B
-:10EA4000B5BB000000000000000000000000000056
-:10EA5000A1BC000000000000000000000000000059
-:10EA6000000000000000000070E70200000000004D
-:10EA7000A4BE02006900000019BC0000B5BB000084
-:10EA8000000000000000000000000000A1BC000029
-:10EA90000000000000000000000000000000000076
-:10EAA00000000000CCE502000000000070CF020072
-:10EAB00001000000D8E50200C4F602000F000000CB
-:10EAC0000100000050E60200A4BE02006F0000003A
-:10EAD00019BC0000B5BB00000000000000000000F1
-:10EAE00000000000A1BC00000000000000000000C9
-:10EAF000000000000000000000000000ECE6020042
-:10EB000000000000A4BE02006B00000019BC000061
-:10EB1000B5BB000000000000000000000000000085
-:10EB2000A1BC000000000000000000000000000088
-:10EB3000000000000000000070E70200000000007C
-:10EB4000A4BE02006D00000019BC0000B5BB0000AF
-:10EB5000000000000000000000000000A1BC000058
-:10EB600000000000000000000000000000000000A5
-:10EB700000000000ECE6020000000000A4BE02005D
-:10EB80006000000019BC0000B5BB000000000000E0
-:10EB90000000000000000000A1BC00000000000018
-:10EBA0000000000000000000000000000000000065
-:10EBB0007CE7020000000000A4BE02006500000027
-:10EBC00019BC0000B5BB0000000000000000000000
-:10EBD00000000000A1BC00000000000000000000D8
-:10EBE000000000000000000000000000A4E6020099
-:10EBF0000000000058E602000000000000000000D5
-:10EC0000ACCF0200A4BE02005C00000019BC0000F2
-:10EC1000B5BB000000000000000000000000000084
-:10EC2000A1BC000000000000000000000000000087
-:10EC300000000000000000007CE70200000000006F
-:10EC4000A4BE02003E000000A1BE0000D9260000C4
-:10EC50000000000069BE00008D35000000000000CB
-:10EC600065C0000045BE000000000000AF2F02009C
-:10EC700000000000000000003CED0200E60600007D
-:10EC8000D8C10200EE06000060C002008E0600003F
-:10EC9000C4C00200F6060000F0C10200AE0600008B
-:10ECA000F4C00200FE06000020C2020006070000B9
-:10ECB00008C202000E070000DCC0020016070000B8
-:10ECC000CCC10200B606000038C20200BE06000039
-:10ECD00094C00200C606000088C00200CE060000F4
-:10ECE000E8C002001E070000B8C002007E06000057
-:10ECF000A0C00200260700007CC002002E07000012
-:10ED00002CC2020036070000FCC102003E070000D2
-:10ED1000ACC0020046070000E4C102004E0700003C
-:10ED200000C102005607000014C202005E07000086
-:10ED300080C2020066070000D0C00200C4F60200D4
-:10ED4000C7000000180000007CEC0200A4BE020016
-:10ED50007700000000000000A35402000000000043
-:10ED600000000000000000000000000000000000A3
-:10ED70000000000000000000000000000000000093
-:10ED80000000000000000000035502003955020099
-:10ED90005DC70000D3540200C9540200BF540200F2
-:10EDA00055C30000384903003149030040490300BE
-:10EDB000167503001A7503001D7503002475030002
-:10EDC000702903002A750300B4AF030033750300F4
-:10EDD000377503003C750300417503004875030057
-:10EDE0000B280300AE50030053790300397503006C
-:10EDF00054310300C95103005C51030050750300F6
-:10EE000014790300577503000C2803001C580300F5
-:10EE1000EF7103005B7503000F2803000528030052
-:10EE2000C74C03006275030068750300A4BE0200AE
-:10EE30008E00000000000000C95702000000000022
-:10EE400000000000000000000000000000000000C2
-:10EE5000E52A020055CE000000000000000000007E
-:10EE60000000000000000000D0CF020053000000AE
-:10EE700040F2020014F9020002000100250F000018
-:10EE800014F90200020001003D58020014F90200CA
-:10EE90000400030049D4000014F902000400030038
-:10EEA0005D58020014F902000400020021D40000A1
-:10EEB00014F90200040002000158020014F90200D3
-:10EEC0000200010091CF000014F9020002000100CD
-:10EED000B1D0000014F9020002000100BDCF000013
-:10EEE00014F902000300FFFF5358020014F9020056
-:10EEF0000300FFFFC5D4000014F902000000000069
-:10EF000089CE000014F9020002000200115802002C
-:10EF100014F9020002000100F1CF000014F9020010
-:10EF20000200010065CF000014F902000200010098
-:10EF3000F9D2000014F902000200010045D30000DC
-:10EF400014F9020002000100F52A020014F902007F
-:10EF500002000100D5CF000014F9020000000100FA
-:10EF600009D5000014F90200020001009DD0000044
-:10EF700014F902000400FFFFA1CE000026000000EB
-:10EF800070EF02003E0000001CCE02009E00000058
-:10EF900028EF02000E04000064C302001E040000FB
-:10EFA00044C202001604000040D8020046040000DB
-:10EFB000C4F602005E0400009CF802007604000023
-:10EFC0002CEE02007E040000A4CD02001E0800000A
-:10EFD00078FA0200CE0400004CB90200F6040000EA
-:10EFE000FCD1020006050000A4D80200BE03000008
-:10EFF0004CED02006E050000BCE402008605000036
-:10F0000068CD0200FE070000B0FB0200F601000020
-:10F0100040EC0200AE05000068BF0200C60500001B
-:10F0200070CF0200CE050000A4BE0200E60500007D
-:10F03000C0D1020036040000A4BF02009E050000FB
-:10F04000E0BF0200A602000038BD0200D6030000A7
-:10F0500098F20200DE0300001CEF0200E60300004D
-:10F06000BCEE0200FE030000D4EE02002604000005
-:10F070004CEF02002E04000010EF02004E040000CE
-:10F0800058EF020056040000B0EE020066040000D3
-:10F090008CD802006E04000098D802008E04000094
-:10F0A0008CEE02009604000068F202009E0400004C
-:10F0B000F8EE0200A6040000A4EE0200AE04000078
-:10F0C00080EE0200B604000064EF0200C6040000F7
-:10F0D00040EF0200D604000044C00200DE0400003D
-:10F0E0001CC00200E604000080F20200EE040000F2
-:10F0F00074EE0200FE0400008CF202000E05000017
-:10F100005CF2020016050000E0EE02002E05000091
-:10F1100034F2020036050000C8EE02004E05000081
-:10F1200050F202005E05000098EE02006605000045
-:10F13000A4F202007E05000034EF02008E050000FC
-:10F1400074F2020096050000ECEE0200A605000035
-:10F1500004EF0200B602000044E90200BE02000013
-:10F1600000E80200C6020000BCE90200CE02000076
-:10F17000FCE80200DE020000F8E90200E6020000FE
-:10F1800004EC0200060300007CEB02000E0300000A
-:10F1900080E9020016030000C0E802001E03000020
-:10F1A00034E702002603000090E502002E03000071
-:10F1B000B8EB02003603000048E802003E030000FE
-:10F1C00058E6020046030000C4E702004E030000B8
-:10F1D00070EA02005603000088E702005E030000A8
-:10F1E00004EB02006603000014E60200AE02000019
-:10F1F00084E802006E03000040EB0200760300008A
-:10F20000F8E602007E030000C8EA02009E03000048
-:10F21000B0E602008E030000D8E50200960300006D
-:10F2200034EA02004E0A0000ECFE0200460500002F
-:10F230009CCE020014F9020002000100A9D40000D3
-:10F24000C4F60200BF020000570000007CEF02007D
-:10F2500014F9020002000100B1D1000014F902000B
-:10F260000300FFFF4958020014F9020006000300E2
-:10F2700089D4000014F902000200020071D30000DA
-:10F2800014F9020002000100F957020014F902000B
-:10F290000000000095CE000014F9020002000100F9
-:10F2A00015CF000014F902000100FFFF45D2000055
-:10F2B000A4BE0200F6000000D1D50000000000004E
-:10F2C000000000000000000000000000000000003E
-:10F2D000000000000000000000000000000000002E
-:10F2E000000000000000000000000000000000001E
-:10F2F000415B0200415B02000000000000000000D2
-:10F3000000000000000000000000000081E3000099
-:10F3100000000000C75A02000000000000000000CA
-:10F3200000000000000000000000000000000000DD
-:10F3300000000000000000000000000000000000CD
-:10F3400000000000000000000000000000000000BD
-:10F3500000000000000000000000000000000000AD
-:10F36000415B020000000000D1E00000000000004E
-:10F37000000000000000000000000000000000008D
-:10F380008F5C02000000000000000000CDD60000ED
-:10F39000415B02000000000055E8000031E8000079
-:10F3A0007DEA0000315B0200C7620200000000003D
-:10F3B0000000000000000000BDD600001D69020032
-:10F3C000000000000000000000000000000000003D
-:10F3D000000000000000000000000000000000002D
-:10F3E000000000000000000000000000000000001D
-:10F3F000C5E7000021E7000000000000C76602002A
-:10F400000000000000000000C167020000000000D2
-:10F41000000000001767020031DE00000F610200EB
-:10F4200000000000000000000000000000000000DC
-:10F43000000000000000000000000000695F020002
-:10F4400000000000000000000000000000000000BC
-:10F4500000000000415B0200000000006D66020039
-:10F460000000000000000000475A0200475A020056
-:10F47000CF5D0200C55D0200000000007B5D020060
-:10F48000D95D020000000000000000000000000044
-:10F490000000000015DA0000715D0200675D0200E7
-:10F4A0005D5D0200075D020000000000D95C020003
-:10F4B000000000009F5C020000000000000000004F
-:10F4C000A562020000000000E76802001760020069
-:10F4D0000000000000000000000000004762020081
-:10F4E00000000000B361020031EB000000000000EA
-:10F4F000000000000000000000000000000000000C
-:10F500000000000005600200215B02005D5902005E
-:10F510008F5C020000000000475C02002B5C0200D0
-:10F5200000000000000000000000000000000000DB
-:10F5300000000000000000008F5C020000000000DE
-:10F54000035B02000000000000000000000000005B
-:10F5500000000000EF5F020000000000000000005B
-:10F56000000000000000000000000000000000009B
-:10F57000000000000000000000000000000000008B
-:10F5800000000000C1EA00000000000000000000D0
-:10F590000000000014F9020000000000A9F60000BD
-:10F5A000D0CF02002A000000ACF50200C4F6020031
-:10F5B0003700000006000000C8F5020014F9020040
-:10F5C0000000010061F600006E000000560100001E
-:10F5D000FE080000BCF502000609000010F602005B
-:10F5E0000E090000F8F502001609000094F502006B
-:10F5F0001E09000004F6020014F9020000000000D9
-:10F60000E56C020014F902000000000099F6000009
-:10F6100014F9020000000100B9F60000A4BE0200C7
-:10F62000F00000000000000000000000236E020057
-:10F6300000000000000000000000000000000000CA
-:10F6400000000000000000000000000000000000BA
-:10F65000000000000000000014F902000400030094
-:10F66000236F0200997D0300A47D0300AE7D03009B
-:10F6700070CF020001000000C4F6020014F902007D
-:10F6800002000100A76F0200A4BE02007900000082
-:10F69000C5070100510B01000000000059080100DE
-:10F6A0001909010000000000A10B01002D07010055
-:10F6B00000000000000000000000000070F60200E2
-:10F6C00094F70200A4BE020088000000C5070100F4
-:10F6D000510B010000000000590801001909010048
-:10F6E00000000000A10B01002D0701000000000038
-:10F6F00000000000000000000000000094F702007D
-:10F7000014F9020002000100B90A010014F9020014
-:10F7100002000100D10801000E06000000F80200FE
-:10F72000160600007CF602001E060000ECF7020040
-:10F730002606000060F802002E06000088F702008E
-:10F740003606000000F702002E02000048F8020012
-:10F750003E0600000CF702004606000058F60200C4
-:10F760004E06000054F8020056060000F4F70200AE
-:10F77000D600000038CD0200DE00000044CD0200BB
-:10F78000E600000050CD020014F902000200010062
-:10F790009D0A0100C4F60200770000000E00000080
-:10F7A00018F70200A4BE0200F400000000000000F0
-:10F7B0000000000000000000000000000000000049
-:10F7C0000000000000000000E52A0200E96E0200CF
-:10F7D0000000000000000000000000000000000029
-:10F7E00014F90200040003000D0B0100A4BF020085
-:10F7F000E0F7020014F9020002000100F106010026
-:10F8000014F902000200010051070100A4BE020029
-:10F81000F10000006107010000000000000000008E
-:10F8200000000000776F02000000000000000000F0
-:10F830000D070100000000000000000000000000B3
-:10F84000000000000000000014F9020004000300A2
-:10F850003F6F020014F902000300FFFFB10901002D
-:10F8600014F90200040003005B6F0200DD71020066
-:10F87000217102003B71020055710200B371020058
-:10F88000D9700200F1700200097102006F7102006C
-:10F8900079710200837102009B710200A4BE020014
-:10F8A0008B0000000000000027790200000000002B
-:10F8B0000000000000000000000000000000000048
-:10F8C000E52A0200FF7802000000000000000000AE
-:10F8D0000000000000000000A4BE0200F2000000D2
-:10F8E0000000000000000000D5790200352B020066
-:10F8F0000000000000000000000000000000000008
-:10F9000000000000000000000000000000000000F7
-:10F9100000000000A4BE0200F20000000000000091
-:10F920000000000053790200352B020000000000A7
-:10F9300000000000000000000000000000000000C7
-:10F9400000000000000000000000000000000000B7
-:10F95000A4BE0200F2000000000000000000000051
-:10F96000F50E0100352B0200000000000000000031
-:10F970000000000000000000000000000000000087
-:10F980000000000000000000000000006E00000009
-:10F99000E60900000E0A0000ECF90200EE09000082
-:10F9A000D4F90200F6090000BCF90200FE090000CB
-:10F9B000C8F90200060A0000C8F9020014F90200A2
-:10F9C0000600FFFF8913010014F902000400030080
-:10F9D0006111010014F902000200FFFF4113010050
-:10F9E000D0CF02003C010000F8F9020014F9020037
-:10F9F00002000100D77A0200C4F6020037000000BE
-:10FA0000060000008CF9020014F902000200FFFF5A
-:10FA10001918010014F9020002000100B17C020073
-:10FA200014F902000200FFFF637D0200C4F6020029
-:10FA30009700000012000000B4FA020014F902005E
-:10FA4000040002006D19010014F902000200010017
-:10FA5000511A010014F9020004000200191A0100F1
-:10FA600014F902000200FFFF691A010014F90200F4
-:10FA700004000200E9190100A4BE02000301000015
-:10FA800091180100B77D020000000000D11A0100AA
-:10FA9000A51C010000000000000000003D1801004E
-:10FAA0000000000000000000000000000000000056
-:10FAB0002CFA0200B601000054FA02000E06000003
-:10FAC00048FA02001606000014FA0200BE07000001
-:10FAD00044FB0200C607000020FA0200CE07000027
-:10FAE00060FA0200D607000068FB0200DE07000093
-:10FAF00050FB0200E60700003CFA0200EE0700009F
-:10FB00008CFB0200F607000098FB02002E020000AA
-:10FB1000A4FB0200960600005CFB02000608000041
-:10FB200080FB02000E0800006CFA020016080000BC
-:10FB300074FB02004E06000008FA0200AE0000004E
-:10FB40005CCD020014F9020004000200351A010025
-:10FB500014F9020004000200977D020014F902006B
-:10FB600004000200791A010014F9020004000200E6
-:10FB7000A17D020014F9020004000200C57C02000D
-:10FB800014F9020004000200E17C020014F90200F2
-:10FB900004000200197E020014F9020004000200B1
-:10FBA000097E020014F9020002000100A91A0100F6
-:10FBB000A4BE0200FF00000091180100B77D020002
-:10FBC00000000000D11A0100A51C01000000000087
-:10FBD000000000003D1801000000000000000000CF
-:10FBE00000000000000000002CFA0200540903008D
-:10FBF000528303007C090300838303003C09030054
-:10FC0000E8830300980A0300668403006009030088
-:10FC1000AB840300B8030300DF8403000C0303007C
-:10FC200036850300000303006E850300CC03030048
-:10FC3000A685030070000020348603007C000020AD
-:10FC400080860300E4130300CC860300B013030096
-:10FC50000E870300F013030089870300D814030004
-:10FC6000ED870300FC14030025880300A81503009A
-:10FC7000C8880300C014030054890300F014030073
-:10FC8000E9890300E41403004C8A03008015030093
-:10FC9000F88A03009C150300A48B0300CC14030016
-:10FCA000508C030024000020858C03008C07030087
-:10FCB000A38C030098060300508D03000407030083
-:10FCC000E98D0300BC060300148E0300B006030098
-:10FCD000A58E0300D40703002E8F0300A4060300A3
-:10FCE000508F03007C060300748F03007004030030
-:10FCF000C28F030014060300F18F03000804030001
-:10FD000020900300D80403004F90030088050300EF
-:10FD10007E9003000C060300AD9003007406030000
-:10FD2000DC900300D00403000B9103008005030066
-:10FD30003A9103000406030069910300E8040300FC
-:10FD400098910300A0050300C89103002406030056
-:10FD5000F89103001004030028920300E00403005C
-:10FD6000589203009805030088920300E4050300FD
-:10FD7000B892030090050300E89203001C060300FC
-:10FD80001893030088040300489303003805030018
-:10FD9000A6930300F0040300F0930300F8050300AA
-:10FDA00046940300C4040300BA9403002C14030017
-:10FDB0001895030020140300B6950300681403008F
-:10FDC00001960300400F03005796030064120300DE
-:10FDD0004B970300B81203007597030058120300F5
-:10FDE000A0970300140F03002F980300200F0300B7
-:10FDF000BA9803004C1203000B9903007C0F030018
-:10FE00005E990300F8110300A49903007012030027
-:10FE1000EE99030004120300219A0300340F03003B
-:10FE2000D69A03005C000020619B03008408030055
-:10FE3000A69B0300680803003B9C030028FF020008
-:10FE4000A39C030010FF0200F49C03001CFF0200AF
-:10FE5000259D0300F8FE0200689D030004FF0200D8
-:10FE6000E89D030060000020349E03001C0D030089
-:10FE7000959E0300380D0300489F0300800D03008A
-:10FE8000909F03008C0D0300B89F030084020300C1
-:10FE900085A003009C020300D4A00300900203008D
-:10FEA00043A1030030020300E3A10300A802030002
-:10FEB00074A203003C020300CDA203004802030029
-:10FEC000F7A20300A40A030037A3030020080300DD
-:10FED00052A3030014080300D6A3030034FF02005A
-:10FEE00022A4030074FF02005BA4030014F90200C3
-:10FEF000000001005D1D010014F902000400030070
-:10FF0000E920010014F90200040002006F7F0200E2
-:10FF100014F9020002000100C91E010014F90200D8
-:10FF2000020002005121010014F902000200020047
-:10FF3000791F0100D0CF0200540100008CFF0200A5
-:10FF400000000000398EE33D398E633E398EE33E7A
-:10FF5000ABAA2A3F721C473F0000803F6E000000A2
-:10FF6000A60A00004600000080FF0200AE0A000062
-:10FF700074FF020014F9020000000000ED220100ED
-:10FF800014F9020000000000ED220100C4F6020096
-:10FF90001F000000030000005CFF0200700403006B
-:10FFA0001406030008040300C4F602002F0000003A
-:10FFB0000500000068000300D0CF0200A702000087
-:10FFC000A8FF0200A4BE0200A8020000000000007A
-:10FFD00031800200000000008B7F0200412A0100F6
-:10FFE000000000009124010000000000000000005B
-:10FFF0009B7F020000000000000000000C000300D6
-:020000040003F7
-:1000000014F90200000000003D2701005E15000009
-:1000100050000300AA0200000301000000000000DD
-:10002000CB010000010000000100000001020000FF
-:100030000300000094BA0200A902000003000000BF
-:1000400094BA020014F902000000000035230100F8
-:1000500014F90200040002004D24010014F902000A
-:100060000100FFFFE92901006E0000003E150000BD
-:100070000606000000000300161000005C000300EC
-:10008000BE1500004400030046150000C4FF020036
-:100090006E000000F6140000FE140000CC00030007
-:1000A000C4F60200170000000200000090000300E8
-:1000B000C4F6020017000000020000001401030053
-:1000C000D0CF02009E020000A0000300A4BE0200E8
-:1000D0009F02000000000000E92B0100000000006A
-:1000E000478002000000000000000000392B0100E2
-:1000F0000000000000000000000000000000000000
-:1001000000000000B000030014F90200020001002A
-:10011000292B01000E060000080103003E0E00001E
-:100120002401030014F9020002000100192B010050
-:10013000C4F60200DF0000001B00000040010300C5
-:10014000660A0000480203001E1000009C02030023
-:1001500026100000A8020300161000003002030061
-:100160000610000090020300060600003C02030097
-:100170006610000030C702006E10000010CB0200B5
-:10018000B6100000B4CB02009E1000000CC50200A7
-:100190009610000060C70200CE100000BCCC020028
-:1001A0007E10000050C402005610000030C902004A
-:1001B0004E100000A0C40200DE1000008CC502003A
-:1001C0007610000014CA0200BE10000088CB0200A6
-:1001D000C6100000DCC502003E10000060CB02002B
-:1001E0005E10000048CA02004610000020C702004E
-:1001F000D610000014CD02008E100000F8CC0200D2
-:1002000086100000F8C90200AE100000F0CA02001B
-:10021000A610000010C90200060200000202000041
-:1002200000000000050200000202000000000000C3
-:1002300014F902000100FFFFAD2D010014F90200C6
-:1002400000000100812C010014F9020000000000F0
-:10025000412C0100FD01000003010000000000002E
-:10026000010200000300000070040300CB01000045
-:100270000100000001000000CC01000001000000AE
-:1002800000000000D0CF0200FD010000300103009B
-:1002900014F902000100FFFF112D010014F9020002
-:1002A0000100FFFFAD2C010014F902000000000066
-:1002B0005D2C0100FE0100000201000000000000B2
-:1002C000FF01000002000000FFFFFFFF010200002D
-:1002D0000300000070040300CB01000001000000D7
-:1002E0000100000014F9020002000100F1300100D9
-:1002F000C4F6020047000000080000005403030099
-:1003000014F90200020001006F80020014F90200DB
-:100310000200010057800200A4BE0200DB010000C1
-:1003200000000000000000000000000000000000CD
-:1003300000000000000000000000000000000000BD
-:1003400000000000000000000000000000000000AD
-:10035000F0020300EE0E00000C030300F60E000096
-:1003600000030300FE0E0000CC030300060F000094
-:10037000AC0303000E0F0000E4020300160F0000A0
-:10038000C00303001E0F000094030300260F0000AB
-:10039000A003030014F9020004000200D931010097
-:1003A00014F90200020001001531010014F90200E5
-:1003B000020001009F80020018030300A42A00200D
-:1003C00014F9020004000200AD31010014F902002A
-:1003D000020001008780020000000000E50100002B
-:1003E000E6010000E7010000E8010000E90100006B
-:1003F000EA010000EB010000EC010000ED0100004B
-:10040000EE010000EF010000A8050300502B0020C2
-:1004100044050300002C0020C4F602003700000051
-:100420000600000044060300D60A0000880403000A
-:10043000CE0A000038050300E60A0000F0040300BD
-:10044000DE0A0000F8050300EE0A00002C06030097
-:10045000F60A000038060300060B0000C40403007F
-:10046000C4F602003F00000007000000280403005B
-:10047000A8050300302B0020C4F60200370000005E
-:10048000060000009404030014F9020004000200B6
-:1004900051320100D60A000088040300CE0A000091
-:1004A00038050300E60A0000F0040300EE0A00002D
-:1004B0002C060300F60A000038060300FE0A0000BE
-:1004C000EC05030014F902000200010035320100BE
-:1004D00044050300A02B0020FC040300602B002037
-:1004E00044050300102C0020FC040300D02B002046
-:1004F00014F902000400020085320100A4BE0200CB
-:100500005701000000000000000000000000000093
-:1005100000000000000000000000000000000000DB
-:1005200000000000000000000000000000000000CB
-:10053000000000001804030014F90200020001008A
-:10054000E1800200A4BE020056010000000000008D
-:10055000000000000000000000000000000000009B
-:10056000000000000000000000000000000000008B
-:1005700000000000000000000000000078040300FC
-:1005800044050300B02B0020FC040300702B002066
-:1005900044050300402C002044050300202C0020CB
-:1005A00044050300E02B0020A4BE02005801000017
-:1005B000000000000000000000000000000000003B
-:1005C000000000000000000000000000000000002B
-:1005D000000000000000000000000000000000001B
-:1005E0006004030044050300302C002014F90200CD
-:1005F00002000100FD80020014F902000200010067
-:10060000EF80020044050300C02B002044050300D6
-:10061000802B0020A8050300402B00204405030088
-:10062000502C002044050300F02B002014F9020098
-:1006300004000200F132010014F90200040002007B
-:1006400025330100D60A000088040300CE0A00000A
-:1006500038050300E60A0000F0040300DE0A00008B
-:10066000F8050300EE0A00002C060300F60A00005D
-:100670003806030044050300902B002014F9020003
-:1006800002000100DD340100C4F602004700000052
-:10069000080000004C07030014F902000300FFFFEC
-:1006A000AD38010014F9020002000100C13401005C
-:1006B00014F90200080004007D39010014F9020059
-:1006C0000600030001820200770100000301000020
-:1006D00000000000C90100000200000090010000BD
-:1006E000C10000000102000000000000CB0100007A
-:1006F0000102000001000000CC0100000102000026
-:100700000000000014F90200020001002939010074
-:10071000A4BE0200C30100000000000000000000B1
-:1007200000000000000000000000000000000000C9
-:1007300000000000000000000000000000000000B9
-:10074000000000000000000088060300E60B000027
-:10075000BC060300DE0B0000B00603003E0E0000E6
-:100760008C070300460E0000980603000E060000EA
-:10077000040703008E0E0000D4070300960E00004D
-:10078000A40603009E0E00007C06030014F902007C
-:100790000300FFFFDD370100CE0100000301000070
-:1007A00000000000C90100000200000096000000E7
-:1007B000CB010000010200000100000081010000E7
-:1007C0000102000000000000CC0100000102000056
-:1007D0000000000014F9020002000100B53401001D
-:1007E0006E0000008E0A00004600000008080300AA
-:1007F000960A000014080300C4F602001F0000005F
-:1008000003000000E007030014F9020000000000EC
-:10081000F939010014F9020000000000D939010083
-:10082000D0CF020051010000F8070300A4BE02006F
-:10083000890200000000000000000000000000002D
-:1008400000000000000000000000000000000000A8
-:100850000000000000000000000000007408030019
-:10086000000000009008030014F9020002000100DB
-:10087000A93A0100518202004182020000000000FA
-:100880000000000014F902000300FFFF193A010004
-:10089000C4F602004F00000009000000F408030045
-:1008A0008C02000002000000802500008D02000084
-:1008B00002000000080000008E020000030000009B
-:1008C00094BA0200C0000000020000000100000015
-:1008D0008F0200000302000094BA020090020000A0
-:1008E0000302000094BA020091020000030200001B
-:1008F00094BA02005E14000084080300E6030000BE
-:10090000680803007605000028FF02009614000026
-:1009100010FF02009E1400001CFF0200A61400003D
-:10092000F8FE0200DE05000004FF0200AE14000025
-:1009300003000000B61400000500000014F90200D6
-:1009400002000100B93C010014F90200000000009F
-:10095000A53C0100D0CF02004B0100006C09030050
-:1009600014F90200000000000D3D0100C4F6020071
-:1009700017010000220000008809030014F902009A
-:1009800000000100213D01006E0000005E0A000031
-:10099000B60B0000400F0300360E000024000020BC
-:1009A000B60E000070000020BE0E00007C0000208B
-:1009B000E60E0000B80303008E0F0000FC140300D5
-:1009C000C60F00002C140300561400005C00002029
-:1009D000C614000060000020660A000048090300F9
-:1009E0006E0A00003C090300760A0000980A030022
-:1009F0007E0A00007C090300860A000060090300EB
-:100A0000160B0000700403001E0B00001406030008
-:100A1000260B0000080403002E0B0000D80403007E
-:100A2000360B0000880503003E0B00000C06030097
-:100A3000460B0000740603004E0B0000D0040300B8
-:100A4000560B0000800503005E0B00000406030047
-:100A5000660B0000E80403006E0B0000A005030015
-:100A6000760B0000240603007E0B00001004030038
-:100A7000860B0000E00403008E0B000098050300C5
-:100A8000960B0000E40503009E0B00009005030098
-:100A9000A60B00001C06030014F902000000000071
-:100AA000F93C0100D0CF020053010000C00A03004E
-:100AB0006E0000009E0A000046000000D00A0300FD
-:100AC000C4F602001700000002000000B00A030094
-:100AD00014F9020000000000013E0100400F030075
-:100AE00009117CCA400F0300014308A7400F03000F
-:100AF00009671404400F03000951815F400F030090
-:100B000009400155400F030001600307400F030037
-:100B100001001042400F0300010080E8400F030075
-:100B200001001300400F030001EA7F47400F03005C
-:100B3000097E9DE7400F030001849073400F03007E
-:100B400001AAAAAA400F030001AE7EE7400F0300EE
-:100B5000095ECABD400F030009400117400F0300A2
-:100B600001444545400F0300094150CC400F0300AC
-:100B7000093FC6F8400F030001403902400F03004F
-:100B80000184D173400F030009E41315400F0300E3
-:100B900001EE9362400F030001841047400F0300F1
-:100BA00001047D44400F030001001021400F0300A9
-:100BB00001A5BCF5400F030001421000400F0300E7
-:100BC00001601000400F030001317E47400F030019
-:100BD000096194F4400F030001C02907400F03008E
-:100BE00001C45542400F030001E67807400F03009F
-:100BF00001C46D47400F030001109571400F0300C1
-:100C000001009001400F030001447C41400F0300AC
-:100C10000100A222400F03000100100C400F03004E
-:100C200001841000400F0300010A2022400F03003E
-:100C30000180A80F400F030001FB3BE7400F0300BA
-:100C4000011C5311400F030009FB93BF400F030029
-:100C500009511115400F030001007000400F0300FF
-:100C600001845447400F030001C47DA7400F0300D7
-:100C7000014081E8400F03000118FFAF400F03005F
-:100C800009BFFE5F400F0300017F03E5400F030033
-:100C900001632B07400F030001001C00400F0300FD
-:100CA00001001084400F030001081100400F0300F1
-:100CB00001B57E42400F030009C411F7400F030045
-:100CC00001C07D05400F030001802802400F030092
-:100CD000010A10458C0200000200000040420F0093
-:100CE0008D020000020000000800000099020000D0
-:100CF00002000000000000009A0200000302000051
-:100D000094BA02009B0200000302000094BA0200A1
-:100D10009C0200000302000094BA020014F90200D1
-:100D20000300FFFF113E0100C4F60200270000008F
-:100D300004000000980D030014F9020004000200F2
-:100D4000913E0100A4BE02009702000000000000D6
-:100D50000000000000000000000000000000000093
-:100D60000000000000000000000000000000000083
-:100D7000000000000000000000000000280D03003B
-:100D800014F9020004000300093F010014F90200F5
-:100D900006000300C53E01005E1400001C0D0300A8
-:100DA000DE050000380D030076050000800D03000D
-:100DB000EE1400008C0D030014F902000000000086
-:100DC000DD3F010014F90200020001007945010035
-:100DD0006E0000000E16000046000000500E0300DA
-:100DE000660A0000500E030016160000900E030065
-:100DF0008E0E0000380E0300960E0000B80D0300A2
-:100E00001E160000840E0300261600006C0E030060
-:100E10006E060000C40D03002E160000440E0300F1
-:100E20006E160000050000007616000001000000AC
-:100E30007E1600000300000014F90200000000000C
-:100E40000D41010014F9020000000000A18202001F
-:100E500014F90200000000005D3F0100C4F602002A
-:100E60006F0000000D000000D00D030014F9020017
-:100E700000000000AB820200D0CF0200C1020000DF
-:100E80005C0E030014F90200020001009945010004
-:100E900014F902000100FFFF1D410100A4BE020081
-:100EA000F40000000000000000000000000000004E
-:100EB0000000000000000000000000000000000032
-:100EC000E52A0200DF8502000000000000000000AB
-:100ED0000000000000000000A4BE0200F4000000BA
-:100EE0000000000000000000000000000000000002
-:100EF000000000000000000000000000E52A0200E1
-:100F000089880200000000000000000000000000CE
-:100F10000000000014F9020008000400C5460100AA
-:100F200014F902000400020033870200400F03009E
-:100F30000100000014F902000200010075850200A2
-:100F4000A4BE020075010000554701001D480100C4
-:100F500000000000000000005D4B010000000000E8
-:100F60000000000000000000000000000000000081
-:100F70000000000000000000E811030014F9020066
-:100F80000400020027880200C60B00006412030060
-:100F9000CE0B0000B8120300E60B0000581203004D
-:100FA000DE0B0000140F0300EE0B0000200F030007
-:100FB000F60B00004C120300FE0B00007C0F030038
-:100FC000060C0000F8110300160600007012030062
-:100FD0006E0E000004120300D60B0000340F030055
-:100FE000160C0000240B03001E0C0000740B030001
-:100FF000260C00006C0C0300360C0000140B0300E0
-:101000002E0C0000540B03003E0C0000FC0A0300F1
-:10101000460C0000F40A03004E0C0000040B030011
-:10102000560C0000CC0C03005E0C0000DC0A030030
-:10103000660C0000840C03006E0C0000240C0300FE
-:10104000760C00000C0C03007E0C00004C0C03001E
-:10105000860C00001C0C03008E0C0000A40C030086
-:10106000960C00001C0B03009E0C0000540C0300A7
-:10107000A60C0000140C0300AE0C00009C0C030036
-:10108000B60C00000C0B0300BE0C0000A40B030008
-:10109000C60C0000FC0B0300CE0C0000940C0300F7
-:1010A000D60C0000BC0B0300DE0C0000B40B0300E8
-:1010B000E60C0000DC0B0300EE0C00003C0C03000F
-:1010C000F60C00009C0B0300FE0C0000640B0300F8
-:1010D000060D00005C0C03000E0D0000F40B030075
-:1010E000160D0000040C03001E0D0000EC0A0300A6
-:1010F000260D00002C0C03002E0D0000CC0B03006D
-:10110000360D00003C0B03003E0D00005C0B03009D
-:10111000460D0000C40C03004E0D00006C0B0300D4
-:10112000560D0000D40B03005E0D0000AC0B030055
-:10113000660D0000C40B03006E0D0000340B0300AD
-:10114000760D00007C0B03007E0D00004C0B0300AD
-:10115000860D0000AC0C03008E0D0000B40C0300E3
-:10116000960D00002C0B03009E0D0000EC0B0300FD
-:10117000160E000084E402000E0E00005CE4020083
-:10118000A60D0000340C0300AE0D0000740C03002B
-:10119000B60D0000E40B0300BE0D0000640C03005C
-:1011A000C60D0000BC0C0300CE0D0000440C030073
-:1011B000D60D0000840B0300DE0D00007C0C030044
-:1011C000E60D0000940B0300EE0D0000E40A03009E
-:1011D000F60D0000440B0300FE0D00008C0B030015
-:1011E000060E00008C0C0300C4F60200670200002B
-:1011F0004C000000880F030014F9020004000200F4
-:101200003B88020014F902000A0005001384020062
-:10121000A4BE0200D0010000000000000000000099
-:1012200000000000000000000000000000000000BE
-:101230000000000021460100000000000000000046
-:1012400000000000000000000000000014F902008F
-:10125000040002004787020014F9020006000300A0
-:101260006146010014F9020002000100E983020056
-:1012700014F90200020001001D850200A4BE020054
-:10128000D401000000000000000000000000000089
-:10129000D58202000000000000000000B3880200B8
-:1012A00001460100000000000000000000000000F6
-:1012B000000000000000000014F90200020001001C
-:1012C0000584020014F9020002000100BD4D010076
-:1012D00014F90200020001004D4D010014F9020052
-:1012E000000001001D4D01006E0000000615000009
-:1012F0000E150000C412030016150000DC120300D6
-:101300001E150000681303002615000034130300A7
-:101310002E150000D012030006150000281303004C
-:10132000361500005C13030014F9020000000000F1
-:101330007D4C010014F9020004000200854D0100FB
-:10134000C4F602004700000008000000E812030095
-:10135000D0CF0200A00200004013030014F90200E5
-:10136000040002003D4C010014F9020002000300D9
-:10137000954C0100A4BE0200D50100000000000051
-:10138000000000000000000000000000000000005D
-:10139000000000000000000000000000000000004D
-:1013A000000000000000000000000000BC1303006B
-:1013B00014F9020002000100FD4D0100C4F6020014
-:1013C0001F00000003000000CC130300C60E000045
-:1013D000E4130300CE0E0000B0130300D60E00008D
-:1013E000F013030014F9020002000100194E01007D
-:1013F00014F9020002000100FB880200F90100005C
-:101400000201000000000000FA01000002010000DB
-:1014100000000000FC0100000100000000000000CE
-:1014200014F902000300FFFF9D4E01008414030025
-:1014300004290020F9010000020100000000000062
-:10144000FB0100000301000000000000FC0100009F
-:1014500001000000000000007605000020140300D9
-:10146000DE0500006814030014F902000300FFFF0A
-:10147000F94E0100C4F6020017000000020000004F
-:1014800058140300A4BE0200F70100000000000091
-:10149000000000000000000000000000000000004C
-:1014A000000000000000000000000000000000003C
-:1014B00000000000000000000000000074140300A1
-:1014C00014F90200020001006D4F010014F902003E
-:1014D000020001006D89020014F9020002000100FF
-:1014E0008389020014F9020002000100258902002C
-:1014F00014F9020002000100CD4F01004415030061
-:10150000E02A0020960F0000D81403009E0F000070
-:10151000A8150300A60F0000C0140300AE0F0000C2
-:10152000F0140300EE0E0000E4140300F60E0000B9
-:1015300080150300FE0E00009C150300B60F00008E
-:10154000CC140300A4BE0200F00100000000000063
-:10155000000000000000000000000000000000008B
-:10156000000000000000000000000000000000007B
-:101570000000000000000000000000008C150300C7
-:1015800014F90200020001003D890200C4F60200C5
-:1015900047000000080000000415030014F90200D1
-:1015A000020001005589020014F902000200010046
-:1015B000514F0100E15A01003D5B0100255C010033
-:1015C0004D5C0100695B0100B4150300A8280020F0
-:1015D000B004000000F004006009000000D0090021
-:1015E000C012000000B0130080250000005027004A
-:1015F0004038000000003B00004B000000A04E00FF
-:101600008070000000F07500127A00000000800079
-:101610000096000000509D0000E1000000F0EB008B
-:10162000002C010000903A0100C2010000E0D70147
-:101630000084030000B0AF0390D00300000000045A
-:101640000008070000705F0700100E00A4DFBE0E48
-:1016500040420F0000000010D430000000000000E5
-:10166000A86100002000000050C3000040000000FE
-:10167000A086010060000000400D03008000000013
-:10168000801A06008800000000350C009000000061
-:10169000006A1800B000000000D43000D000000044
-:1016A00000A86100F00000000050C300F800000036
-:1016B000FFFF000000000000E20400000000000046
-:1016C000C40900000800000088130000100000009A
-:1016D0001027000018000000204E0000200000002D
-:1016E0008038010028000000007102003000000076
-:1016F00000C4090038000000FFFF010001000000E5
-:10170000010000001700000046000000A3000000D8
-:101710005F010000D6020000C4050000A00B00001D
-:101720000100000000700040040000000200000002
-:10173000007000400800000003000000007000403E
-:1017400010000000040000000070004020000000B5
-:10175000050000000070004040000000060000008E
-:101760000070004080000000FF000000FFFFFFFF4E
-:101770000000000000000000000000000100000068
-:101780000100000000000000010000000200000055
-:101790000000000001000000030000000000000045
-:1017A0000100000004000000000000000100000033
-:1017B000050000000000000001000000060000001D
-:1017C0000000000001000000070000000000000011
-:1017D00001000000080000000000000001000000FF
-:1017E0000900000000000000010000000A000000E5
-:1017F00000000000010000000B00000000000000DD
-:10180000010000000C0000000000000001000000CA
-:101810000D00000000000000010000000E000000AC
-:1018200000000000010000000F00000000000000A8
-:101830000100000010000000000000000100000096
-:101840001100000000000000010000001200000074
-:101850000000000001000000130000000000000074
-:101860000100000014000000000000000100000062
-:10187000150000000000000001000000160000003C
-:101880000000000001000000170000000000000040
-:10189000010000001800000000000000010000002E
-:1018A0001900000000000000010000001C00000002
-:1018B00000000000010000001D000000000000000A
-:1018C000010000001E0000000000000001000000F8
-:1018D000FF000000FFFFFFFF00000000A2A30100C7
-:1018E0006AA3010086A301005EA3010086A3010094
-:1018F000CAA2010086A301005EA301006AA3010041
-:101900006AA30100CAA201005EA3010008A40100AD
-:1019100008A4010008A401008CA301006AA301002F
-:101920006AA3010052A401005CA3010052A40100BB
-:10193000CAA2010052A401005CA301006AA3010035
-:101940006AA30100CAA201005CA3010008A401006F
-:1019500008A4010008A4010036A401006AA7010040
-:1019600062A7010062A701005AA70100ACA601000E
-:10197000ACA6010050A701005AA70100ACA60100C7
-:1019800050A70100ACA601005AA70100AEA60100B5
-:10199000AEA60100AEA60100F4A7010014B5010037
-:1019A00002B40100E8B40100EEB30100E8B40100A4
-:1019B000F2B40100E8B40100EEB3010002B401008A
-:1019C00002B40100F2B40100EEB30100F8B301006B
-:1019D000F8B30100F8B301005AB70100A8BD010037
-:1019E00086BD010086BD01007ABD01006EBC01000C
-:1019F0006EBC01006EBD01007ABD01006EBC01002D
-:101A00006EBD01006EBC01007ABD010072BC010018
-:101A100072BC010072BC010088BF01006937AC31A3
-:101A200068212233B40F14336821A2333863ED3EAA
-:101A3000DA0F493F5E987B3FDA0FC93F73717274CA
-:101A40000000000061636F73660000006173696EDF
-:101A5000660000006578706600000000666D6F64C7
-:101A6000660000006C6F676600000000706F7766AC
-:101A70000000000073717274660000000000003FF7
-:101A8000000000BFD1F71737D1F717B78071313F8A
-:101A9000807131BF000000000000008000000000E5
-:101AA00000C0153F00000000DCCFD1350000803FB2
-:101AB0000000C03F000FC93F000F494000CB9640D7
-:101AC000000FC9400053FB4000CB164100ED2F41F1
-:101AD000000F49410031624100537B41003A8A4185
-:101AE00000CB9641005CA34100EDAF41007EBC41BC
-:101AF000000FC94100A0D5410031E24100C2EE41D2
-:101B00000053FB4100F20342003A0A4200831042B4
-:101B100000CB164200141D42005C234200A529425E
-:101B200000ED2F4200363642007E3C4200C7424262
-:101B3000000F4942A2000000F900000083000000ED
-:101B40006E0000004E000000440000001500000080
-:101B500029000000FC0000002700000057000000E2
-:101B6000D1000000F500000034000000DD0000009E
-:101B7000C0000000DB0000006200000095000000D3
-:101B8000990000003C0000004300000090000000AD
-:101B900041000000FE000000510000006300000052
-:101BA000AB000000DE000000BB000000C50000002C
-:101BB00061000000B7000000240000006E0000007B
-:101BC0003A000000420000004D000000D20000007A
-:101BD000E000000006000000490000002E000000A8
-:101BE000EA00000009000000D1000000920000009F
-:101BF0001C000000FE0000001D000000EB000000C3
-:101C00001C000000B100000029000000A700000037
-:101C10003E000000E80000008200000035000000E7
-:101C2000F50000002E000000BB0000004400000092
-:101C300084000000E90000009C000000700000002B
-:101C400026000000B40000005F0000007E000000DD
-:101C5000410000003900000091000000D6000000A3
-:101C6000390000008300000053000000390000002C
-:101C7000F40000009C000000840000005F000000F1
-:101C80008B000000BD000000F900000028000000EB
-:101C90003B0000001F000000F8000000970000005B
-:101CA000FF000000DE0000000500000098000000BA
-:101CB0000F000000EF0000002F00000011000000E6
-:101CC0008B0000005A0000000A0000006D000000B8
-:101CD0001F0000006D000000360000007E000000C4
-:101CE000CF00000027000000CB000000090000002A
-:101CF000B70000004F000000460000003F00000059
-:101D0000660000009E0000005F000000EA00000086
-:101D10002D0000007500000027000000BA00000040
-:101D2000C7000000EB000000E5000000F10000002B
-:101D30007B0000003D0000000700000039000000AB
-:101D4000F70000008A00000052000000920000002E
-:101D5000EA0000006B000000FB0000005F000000D4
-:101D6000B10000001F0000008D0000005D000000B9
-:101D700008000000560000000300000030000000D2
-:101D800046000000FC0000007B0000006B0000002B
-:101D9000AB000000F0000000CF000000BC0000001D
-:101DA000200000009A000000F4000000360000004F
-:101DB0001D000000A9000000E300000091000000E9
-:101DC000610000005E000000E60000001B00000053
-:101DD0000800000065000000990000008500000078
-:101DE0005F00000014000000A00000006800000078
-:101DF000400000008D000000FF000000D80000003F
-:101E0000800000004D00000073000000270000006B
-:101E10003100000006000000060000001500000070
-:101E200056000000CA00000073000000A800000077
-:101E3000C900000060000000E20000007B0000001C
-:101E4000C00000008C0000006B00000004000000D7
-:101E500007000000090000000000C93F0000F03941
-:101E60000000DA370000A2330000842E0000502B5F
-:101E70000000C2270000D0220000C41F0000C61BC3
-:101E800000004417000000000000000000000000F7
-:101E90000000000000000000000000000000000042
-:101EA0000000000000000000000000000000000032
-:101EB0000000000000000000000000000000000022
-:101EC0000000000000000000000000000000000012
-:101ED0000000000000000000000000000000000002
-:101EE0000000000090000020CAAF0300CDAF030047
-:101EF000D0AF0300102332100810113032123320FB
-:101F0000342014331520481009129A200A208933EE
-:101F10008A204810731431103310351034104726BE
-:101F200020105B20491058204830533078328520EB
-:101F30002B2114104222251043207F234610943079
-:101F400047109822481099301F222520203008225F
-:101F5000072009201B1246201C20576212106B20FC
-:101F60005531562048107C2342107D304310042206
-:101F7000932005308D128E208F208E2249105B30E9
-:101F80008F225B20903041221F104320802281202D
-:101F900082303F313C2048103E333B204810A5237F
-:101FA00020105E20A330A6222E10A7301722311059
-:101FB0001A30492419105B204910582088224A10F1
-:101FC00008102D222A109330023203201C221D20DB
-:101FD00005102A152B202C202D202F202E204031BB
-:101FE00008104A109F2232105B204C242B104910FD
-:101FF00058204D2060A42410143049105E20761320
-:102000002F1030103D10386342103E2043103162D3
-:102010001E105B206231632011107D12A6208020EB
-:10202000A4A51D10912022106120A3302822181091
-:1020300091203713311038203E2050225B203D3054
-:102040009E2231105B200121023023624D1024209A
-:1020500034241E103520211037204D124E205220DE
-:102060000E630810113012304331081048108513E8
-:102070008620872088204B271D1091202210932036
-:102080004910582053309D139E209F20A0202533B7
-:1020900026204810862342109C3043102012212015
-:1020A00022209712A42098206D316E203A107E23B2
-:1020B0004410803045108212A42083207231742095
-:1020C000732095225B20963012624D105B207522A2
-:1020D0007620742094229520973051324F20872308
-:1020E0004410892045105924051006105A20071065
-:1020F00081126A205B2039323A2092126A206B20CA
-:102100002E21A6208A128C208B209AA5151008104B
-:102110009B30491058200B625A105B20A0225B2094
-:10212000A13068222310693048324920052105106A
-:1021300018223210081006244C104020863005105A
-:10214000351240203620A312A420A5204F241B10B6
-:102150005030491058205D24201061201A105B2057
-:10216000703172207120906249105B3065316B20B4
-:1021700066205E12602061202F22291030306921F4
-:1021800026106A2231106B202921281007320620E0
-:10219000271C4E104F105010511053105410551052
-:1021A0005610581057105910521054242D10552005
-:1021B000491058209133922048103B2208103D309E
-:1021C0007412752077200AA81710081042100C30DE
-:1021D00043100B30491058201513162017201820D3
-:1021E0000C330D20481093335B20481036223920E1
-:1021F00040307B120B100C10672226102210132285
-:102200000810113063126420652077237A2078301B
-:1022100079305B125F205C201662081019306E3135
-:1022200070206F2026126A205B202C211610456238
-:1022300048105B200D130E200F2010206F12371056
-:1022400039106C316D203C108B225B208C308C223D
-:1022500049108D30332221103F2071122F10301081
-:102260001A610810993395204810A8221E105B208F
-:102270006B316C203B10223223200F22311013309F
-:102280006131622027103A124A100D10461847207B
-:102290004A204B204C2054200A209A20082000136A
-:1022A00005101C204620796232107420031205109C
-:1022B0001B20581259201C2056225B205730241214
-:1022C000A6202520642226106320442313105B20BF
-:1022D00045305FA42410143049105B2096624910E9
-:1022E0005B20A712A82093205A321B2030225B20AB
-:1022F000313019624D105B209B6342109C304310BB
-:102300004E235120533052301E18282029202A20D5
-:1023100032204120422044201F207A1C081009103E
-:102320000A100B100C100D100F1010100E107C2046
-:102330007E207F201D331E204B105C2261205D30EB
-:102340008362481084308433812048103D6212102B
-:1023500008103C2240203D30116249105B20A11240
-:10236000A420A220A2624D105B2053631A104910D2
-:1023700058209C339D2048106619361038104010A4
-:102380003E103F1041102210672068204A252C1073
-:102390005B2049105820533052631C1049105820BC
-:1023A00021222720242000683B0000783C00008880
-:1023B0003D0000603E0000703F0000804000E108EA
-:1023C000E907EE0E4D0DDA0B2F0BF709610800003F
-:1023D000180E8E0C00008F0A68090000020002002F
-:1023E000040007000D001900310061000000010128
-:1023F00002020202030303030303030304040404AD
-:102400000404040404040404040404040566756E4E
-:102410006374696F6E2074616B657320256420702E
-:102420006F736974696F6E616C20617267756D6539
-:102430006E74732062757420256420776572652040
-:10244000676976656E00756E65787065637465643E
-:10245000206B6579776F726420617267756D656E48
-:102460007420272571270066756E6374696F6E206E
-:10247000676F74206D756C7469706C652076616C23
-:1024800075657320666F7220617267756D656E7415
-:102490002027257127006C69737420726571756936
-:1024A0007265640063616E277420736574206174C3
-:1024B000747269627574650000000000000000001D
-:1024C00000030303030300000000000000000000FD
-:1024D00000000000000000000301010101010101F2
-:1024E00001010101010101014545454545454545BC
-:1024F000454501010101010101595959595959191C
-:10250000191919191919191919191919191919193B
-:1025100019191901010101010169696969696929CB
-:10252000292929292929292929292929292929291B
-:1025300029292901010101003C67656E65726174FA
-:102540006F72206F626A656374202725712720618E
-:10255000742025703E0063616E27742073656E647D
-:10256000206E6F6E2D4E6F6E652076616C756520E6
-:10257000746F2061206A7573742D73746172746551
-:10258000642067656E657261746F720067656E6561
-:102590007261746F722069676E6F7265642047653F
-:1025A0006E657261746F7245786974003C25713E86
-:1025B0000054726163656261636B20286D6F737490
-:1025C00020726563656E742063616C6C206C61734E
-:1025D00074293A0A00202046696C65202225712260
-:1025E0002C206C696E65202564002C20696E2025E6
-:1025F000710A0063616E277420636F6E7665727472
-:1026000020257320746F20696E740063616E2774D7
-:1026100020636F6E7665727420257320746F206658
-:102620006C6F6174006F626A65637420272573277D
-:10263000206973206E6F742061207475706C652042
-:102640006F72206C6973740072657175657374655F
-:1026500064206C656E677468202564206275742040
-:102660006F626A65637420686173206C656E67745D
-:102670006820256400257120696E64696365732094
-:102680006D75737420626520696E74656765727319
-:102690002C206E6F7420257300257120696E64658F
-:1026A00078206F7574206F662072616E6765006FA9
-:1026B000626A656374206F662074797065202725CF
-:1026C000732720686173206E6F206C656E28290067
-:1026D00027257327206F626A65637420646F6573B2
-:1026E000206E6F7420737570706F727420697465DA
-:1026F0006D2064656C6574696F6E002725732720F3
-:102700006F626A656374206973206E6F74207375DD
-:102710006273637269707461626C65002725732748
-:10272000206F626A65637420646F6573206E6F74D6
-:1027300020737570706F7274206974656D20617399
-:102740007369676E6D656E74006F626A656374208D
-:1027500077697468206275666665722070726F743E
-:102760006F636F6C207265717569726564006D616D
-:10277000746820646F6D61696E206572726F72009B
-:102780007465787420746F6F206C6F6E672E0063B1
-:102790006F756C64206E6F74207061727365206950
-:1027A0006E7075742E00476C6974636865733A20A7
-:1027B00025640D0A006C696E652025752000257161
-:1027C00020004D656D6F72794572726F723A206CA0
-:1027D0006578657220636F756C64206E6F7420611C
-:1027E0006C6C6F63617465206D656D6F7279006DDF
-:1027F00061696E2E707900736F6674207265626F06
-:102800006F740D0A007768696C6500666F720074FA
-:102810007279000A2573002C200025713D003C636D
-:102820006C61737320272571273E003C2573206F50
-:10283000626A6563742061742025703E003C737584
-:102840007065723A20005F5F696E69745F5F282966
-:102850002073686F756C642072657475726E204E9B
-:102860006F6E652C206E6F742027257327006361BF
-:102870006E6E6F7420637265617465202725712701
-:1028800020696E7374616E6365730027257327205A
-:102890006F626A656374206973206E6F7420636170
-:1028A0006C6C61626C6500747970652027257127F6
-:1028B000206973206E6F7420616E206163636570A0
-:1028C0007461626C65206261736520747970650063
-:1028D0006D756C7469706C652062617365732068D6
-:1028E00061766520696E7374616E6365206C6179D1
-:1028F0002D6F757420636F6E666C696374007479F4
-:1029000070652074616B65732031206F72203320F5
-:10291000617267756D656E74730069737375626358
-:102920006C6173732829206172672032206D757382
-:1029300074206265206120636C617373206F722064
-:1029400061207475706C65206F6620636C617373B1
-:102950006573006973737562636C617373282920F2
-:102960006172672031206D7573742062652061206B
-:10297000636C6173730020090A0D0B0C0063616EB8
-:10298000277420636F6E7665727420272573272065
-:102990006F626A65637420746F2073747220696D4E
-:1029A000706C696369746C79005C2563005C5C0021
-:1029B0005C6E005C72005C74005C782530327800DC
-:1029C000737562737472696E67206E6F7420666FC0
-:1029D000756E64006A6F696E2065787065637473E4
-:1029E0002061206C697374206F66207374722F628B
-:1029F00079746573206F626A6563747320636F6EA8
-:102A000073697374656E7420776974682073656C7C
-:102A100066206F626A6563740073746172742F65F7
-:102A20006E6420696E646963657300656D707479A6
-:102A300020736570617261746F72006F6E6C7920C3
-:102A4000736C69636573207769746820737465704B
-:102A50003D312028616B61204E6F6E6529206172C7
-:102A60006520737570706F727465640077726F6E35
-:102A700067206E756D626572206F66206172677582
-:102A80006D656E747300252E2A730073696E676C12
-:102A90006520277D2720656E636F756E746572658E
-:102AA0006420696E20666F726D6174207374726940
-:102AB0006E670062616420636F6E76657273696F22
-:102AC0006E2073706563696669657200756E6D610D
-:102AD000746368656420277B2720696E20666F72A7
-:102AE0006D617400657870656374656420273A27AA
-:102AF00020616674657220666F726D6174207370F8
-:102B0000656369666965720063616E277420737717
-:102B1000697463682066726F6D206175746F6D6192
-:102B2000746963206669656C64206E756D62657298
-:102B3000696E6720746F206D616E75616C206669C7
-:102B4000656C642073706563696669636174696F3D
-:102B50006E007475706C6520696E646578206F75A1
-:102B600074206F662072616E6765006174747269AB
-:102B70006275746573206E6F7420737570706F72F8
-:102B8000746564207965740063616E2774207377BF
-:102B9000697463682066726F6D206D616E75616C1B
-:102BA000206669656C64207370656369666963613A
-:102BB00074696F6E20746F206175746F6D617469D4
-:102BC00063206669656C64206E756D626572696EFE
-:102BD00067003C3E3D5E006263646545664667474C
-:102BE0006E6F7378582500696E76616C6964206633
-:102BF0006F726D61742073706563696669657200D8
-:102C00007369676E206E6F7420616C6C6F7765649A
-:102C100020696E20737472696E6720666F726D61D1
-:102C20007420737065636966696572007369676EA5
-:102C3000206E6F7420616C6C6F77656420776974A7
-:102C40006820696E746567657220666F726D617465
-:102C50002073706563696669657220276327007554
-:102C60006E6B6E6F776E20666F726D617420636F2E
-:102C70006465202725632720666F72206F626A656E
-:102C80006374206F66207479706520272573270090
-:102C9000756E6B6E6F776E20666F726D61742063F8
-:102CA0006F6465202725632720666F72206F626A34
-:102CB000656374206F6620747970652027666C6F79
-:102CC00061742700273D2720616C69676E6D656E12
-:102CD00074206E6F7420616C6C6F77656420696E10
-:102CE00020737472696E6720666F726D61742073F1
-:102CF000706563696669657200756E6B6E6F776E7D
-:102D000020666F726D617420636F64652027256390
-:102D10002720666F72206F626A656374206F662079
-:102D20007479706520277374722700696E636F6D04
-:102D3000706C65746520666F726D617400696E6396
-:102D40006F6D706C65746520666F726D6174206B59
-:102D50006579006E6F7420656E6F756768206172AB
-:102D600067756D656E747320666F7220666F726D25
-:102D7000617420737472696E670025256320726523
-:102D800071756972657320696E74206F7220636853
-:102D9000617200696E74656765722072657175692C
-:102DA00072656400756E737570706F7274656420FF
-:102DB000666F726D617420636861726163746572BD
-:102DC0002027256327202830782578292061742042
-:102DD000696E646578202564006E6F7420616C6C88
-:102DE00020617267756D656E747320636F6E7665B2
-:102DF0007274656420647572696E67207374726999
-:102E00006E6720666F726D617474696E67007273AD
-:102E1000706C6974284E6F6E652C6E2900332E34E9
-:102E20002E300066756E6374696F6E20646F657313
-:102E3000206E6F742074616B65206B6579776F729B
-:102E40006420617267756D656E74730066756E637C
-:102E500074696F6E206D697373696E6720256420D5
-:102E6000726571756972656420706F736974696FDA
-:102E70006E616C20617267756D656E747300667546
-:102E80006E6374696F6E2065787065637465642025
-:102E90006174206D6F737420256420617267756D95
-:102EA000656E74732C20676F74202564002725716C
-:102EB0002720617267756D656E7420726571756922
-:102EC00072656400657874726120706F73697469EB
-:102ED0006F6E616C20617267756D656E74732067CB
-:102EE0006976656E006578747261206B6579776FBD
-:102EF000726420617267756D656E747320676976A0
-:102F0000656E006469766973696F6E206279207AF4
-:102F100065726F00726177205245504C3B204354DC
-:102F2000524C2D4220746F20657869740D0A004F51
-:102F30004B00044D656D6F72794572726F720A04B1
-:102F4000004D6963726F507974686F6E2076312E10
-:102F5000372D392D6762653032306562206F6E2003
-:102F6000323031362D30342D31383B206D6963726B
-:102F70006F3A6269742077697468206E5246353101
-:102F80003832320D0A0054797065202268656C7001
-:102F900028292220666F72206D6F726520696E6627
-:102FA0006F726D6174696F6E2E0D0A003E3E3E2099
-:102FB000000D0A7061737465206D6F64653B20437A
-:102FC00074726C2D4320746F2063616E63656C2C8A
-:102FD000204374726C2D4420746F2066696E69738F
-:102FE000680D0A3D3D3D20002E2E2E2000636F759A
-:102FF0006C64206E6F74206F70656E2066696C65FE
-:10300000202725732720666F722072656164696EC0
-:10301000670A00010000000000000000000000003E
-:1030200000000000000000000000000000000000A0
-:103030000000000000000000000000000000000090
-:103040000000000000000000000000000000000080
-:103050000000000000010000000000020400000465
-:10306000000004040800040000000000000000004C
-:103070000000000000010008000400020400000439
-:10308000000000000801010101010101010101012D
-:103090000101010101010101010101010101010120
-:1030A0000101010101010101010101010101010110
-:1030B0000101010101010101010101010101010100
-:1030C00001010101010101010101010101020401EC
-:1030D00001040101040408010401010101010101CD
-:1030E00001010101010101010108010401020401C2
-:1030F00001040101010108010000000000020400B8
-:1031000000040000040408000400000000000000A7
-:10311000000000000000000100080004000204009C
-:10312000000400000000086E6F206D6F64756C6510
-:10313000206E616D656420272573270063616E6EC4
-:103140006F7420706572666F726D2072656C617449
-:1031500069766520696D706F7274006E6F206D6F97
-:1031600064756C65206E616D65642027257127008C
-:103170005F5F696E69745F5F2E707900696C6C6562
-:1031800067616C206D6F64650066696C65206E6FA9
-:103190007420666F756E64002C006F626A656374DC
-:1031A000206E6F7420696E2073657175656E63653E
-:1031B000003C6D6F64756C6520272571273E006D9E
-:1031C0006963726F3A6269742077697468206E521D
-:1031D0004635313832320076312E372D392D67623F
-:1031E000653032306562206F6E20323031362D30DE
-:1031F000342D313800312E3000706F702066726FC0
-:103200006D20656D707479206C6973740000000125
-:103210000102020202030303030303030304040481
-:10322000040404040404040404040404040574727F
-:1032300075650066616C736500286E756C6C29009D
-:10324000303030303030303030303030303030307E
-:10325000002020202020202020202020202020208E
-:103260002000030000000000000000706172736520
-:103270007220636F756C64206E6F7420616C6C6F6C
-:103280006361746520656E6F756768206D656D6F2D
-:10329000727900756E657870656374656420696E17
-:1032A00064656E7400756E696E64656E7420646F1B
-:1032B0006573206E6F74206D6174636820616E7930
-:1032C000206F7574657220696E64656E74617469CF
-:1032D0006F6E206C6576656C0063616E6E6F742036
-:1032E0006D697820627974657320616E64206E6FF9
-:1032F0006E6279746573206C69746572616C7300B9
-:10330000696E76616C69642073796E746178006EA1
-:10331000616D652027257127206973206E6F7420E9
-:10332000646566696E656400756E737570706F7242
-:10333000746564207479706520666F722025713A17
-:10334000202725732700617267756D656E7420688C
-:1033500061732077726F6E6720747970650074797D
-:103360007065206F626A6563742027257127206865
-:103370006173206E6F206174747269627574652068
-:10338000272571270027257327206F626A656374DC
-:1033900020686173206E6F20617474726962757445
-:1033A0006520272571270027257327206F626A650E
-:1033B0006374206973206E6F742069746572616232
-:1033C0006C650027257327206F626A656374206926
-:1033D00073206E6F7420616E206974657261746F02
-:1033E00072006E65676174697665207368696674DA
-:1033F00020636F756E7400756E737570706F727484
-:10340000656420747970657320666F722025713A47
-:1034100020272573272C2027257327006E656564D8
-:10342000206D6F7265207468616E2025642076615E
-:103430006C75657320746F20756E7061636B0074BA
-:103440006F6F206D616E792076616C756573207485
-:103450006F20756E7061636B20286578706563748A
-:1034600065642025642900657863657074696F6EF2
-:1034700073206D7573742064657269766520667259
-:103480006F6D2042617365457863657074696F6E16
-:103490000063616E6E6F7420696D706F7274206E60
-:1034A000616D65202571006D656D6F727920616CAD
-:1034B0006C6F636174696F6E206661696C65642C02
-:1034C0002068656170206973206C6F636B656400B0
-:1034D0006D656D6F727920616C6C6F636174696F7B
-:1034E0006E206661696C65642C20616C6C6F636131
-:1034F00074696E672025752062797465730066753E
-:103500006E6374696F6E206D697373696E67207284
-:103510006571756972656420706F736974696F6E27
-:10352000616C20617267756D656E7420232564007F
-:1035300066756E6374696F6E206D697373696E670B
-:10354000207265717569726564206B6579776F7239
-:103550006420617267756D656E7420272571270080
-:1035600066756E6374696F6E206D697373696E67DB
-:10357000206B6579776F72642D6F6E6C7920617244
-:1035800067756D656E740038846B19C66318867331
-:1035900098C6B11CCA318CC73188C23098463118E0
-:1035A000C6350CCA310CC62110246912C23114C4AC
-:1035B00071084A2249AB6AA8AC495132D552889366
-:1035C0006C94221554D22596D450A5462108856BBB
-:1035D00018C46310CE6B188C71198C63350CC6330C
-:1035E00099CC6CB54EA29946212882952EE3309C49
-:1035F000C5309CA2B19C67318866592C53188467EA
-:1036000050CAE30AACAB30AC62308C63109462B148
-:103610008C8228963398D6B54C6229A54AB59CC6AB
-:103620003114D6389C4BB4866518AE671CA6631956
-:10363000962319841308A652ACCA22896EAB198C42
-:103640006234C46219866318C42358D6A350425406
-:103650004AAD4A25116B64894A63398A23312AEAC3
-:10366000A2A944C512CD42348C62188C63114866FD
-:10367000319D44331D46319CC6B10CCD3288C47394
-:1036800018867308D663580781E0F03C0787903CA2
-:103690007C0FC7C0C0F07C1E078080001C7870F1D2
-:1036A000C71FC00CFE1C1F1F0E0A7AC071F2838F49
-:1036B000030F0F0C0079F861E0430F83E718F9C19D
-:1036C00013DAE9638F0F838387C31F3C70F0E1E156
-:1036D000E387B8710E20E38D48781C938730E1C1F1
-:1036E000C1E478218383C3870639E5C387070E1CAD
-:1036F0001C70F4719C603632C31E3CF38F0E3C701C
-:10370000E3C78F0F0F0E3C78F0E38706F0E307C1A5
-:1037100099870F18787070FCF310B18C8C317C7025
-:10372000E1863C646CB0E1E30F238F0F1E3E383C12
-:10373000387B8F070E3CF4171E3C78F29E7249E3EB
-:103740002536385839E2DE3C7878E1C761E1E1B0EE
-:10375000F0F0C3C70E38C0F0CE73731834B0E1C7B1
-:103760008E1C3CF838F0E1C18B868F1C7870F078A5
-:10377000ACB18F3931DB3861C30E0E387873171E48
-:10378000391E3864E1F1C14E0F40A202C58F81A1FC
-:10379000FC120864E03C22E045078E0C3290F01FDA
-:1037A0002049E0F80C60F0171A41AAA4D08D1282CB
-:1037B0001E1E03F83E030C73807044260324E13E72
-:1037C000044E041CC109CC9E902107904364C00F95
-:1037D000C6909CC15B03E21D81E05E1D0384B82C92
-:1037E0000F80B183E030411E43898350FC242E13A7
-:1037F00083F17C4C2CC90D83B0B582E4E8069C07AC
-:10380000A0991D073E828F70307440CA10E4E80F03
-:1038100092143F06F8848843810A343941C6E31C78
-:103820004703B0B8130AC264F818F960B3C0652042
-:1038300060A68CC3812030261E1C38D301B02640E0
-:10384000F40BC3421F8532266040C9CB01EC11281E
-:1038500040FA0434E0704C8C1D07690316C8042339
-:10386000E8C69A0B1A03E0760605CF1EBC583171E4
-:103870006600F83F04FC0C74278A8071C23A260661
-:10388000C01F050F9840AE017FC007FF000EFE006D
-:1038900003DF8003EF801BF1C200E7E018FCE021AA
-:1038A000FC803CFC400E7E003F3E000FFE001FFFF0
-:1038B000003EF007FC007E103FFF003F380E7C0109
-:1038C000870CFCC7003E040F3E1F0F0F1F0F028323
-:1038D00087CF03870F3FC0079E603FC003FE003FB6
-:1038E000E077E1C0FEE0C3E001DFF80307007E708F
-:1038F000007C3818FE0C1E781C7C3E0E1F1E1E3EDF
-:10390000007F8307DB878307C7071071FF003FE253
-:1039100001E0C1C3E1007FC005F020F8F070FE783F
-:1039200079F8023F0C8F030F9FE0C1C78703C3C321
-:10393000B0E1E1C1E3E071F000FC707C0C3E380EB8
-:103940001C70C3C70381C1C7E7000FC7871909EF00
-:10395000C433E0C1FCF870F078F8F061C7001FF8DC
-:10396000017CF8F078703C7CCE0E2183CF08078F65
-:1039700008C1878F80C7E30007F8E0EF0039F780C0
-:103980000EF8E1E3F8219FC0FF03F807C01FF8C459
-:1039900004FCC4C1BC87F00FC07F05E025ECC03E2D
-:1039A0008447F08E03F803FBC019F8079C0C17F846
-:1039B00007E01FA1FC0FFC01F03F00FE03F01F0019
-:1039C000FD00FF880DF901FF007007C03E42F30DB6
-:1039D000C47F80FC07F05EC03F00783F81FF01F8A4
-:1039E00001C3E80CE4648FE40FF007F0C21F007F0E
-:1039F000C06F807E03F807F03FC0780F8207FE2279
-:103A00007770027603FE00FE67007CC7F18EC63B2E
-:103A1000E03F84F319D80399FC09B80FF8009D24FE
-:103A200061F90D00FD03F01F903F01F81FD00FF862
-:103A30003701F807F00FC03F00FE03F80FC03F004A
-:103A4000FA03F00F80FF01B807F001FC01BC8013FE
-:103A50001E007FE1407FA07FB0003FC01FC0380F35
-:103A6000F01F80FF01FC03F17E01FE01F0FF007FEB
-:103A7000C01D07F00FC07E06E007E00FF806C1FE8C
-:103A800001FC03E00F00FC00131313130A0E1218BD
-:103A90001A161410140E120E1212100C0E0A120E18
-:103AA0000A080606060611060606060E10090A088A
-:103AB0000A060606050600121A141A120C06060655
-:103AC0000606060606060606060606060606060696
-:103AD0000A0A0606062C1300000000000000000081
-:103AE00000000000000000000001010202030304C6
-:103AF000040505060607070001020304050607087A
-:103B0000090A0B0C0D0E0F000103040607090A0C2D
-:103B10000D0F101213151600020406080A0C0E10E1
-:103B2000121416181A1C1E000205070A0C0F111495
-:103B300016191B1E202325000306090C0F12151849
-:103B40001B1E2124272A2D0003070A0E1115181CFD
-:103B50001F23262A2D313400FCF8F4F0ECE8E4E0D1
-:103B6000DCD8D4D0CCC8C400FCF9F5F2EEEBE7E425
-:103B7000E0DDD9D6D2CFCB00FDFAF7F4F1EEEBE8D9
-:103B8000E5E2DFDCD9D6D300FDFBF8F6F3F1EEEC8D
-:103B9000E9E7E4E2DFDDDA00FEFCFAF8F6F4F2F041
-:103BA000EEECEAE8E6E4E200FEFDFBFAF8F7F5F4F5
-:103BB000F2F1EFEEECEBE900FFFEFDFCFBFAF9F8A9
-:103BC000F7F6F5F4F3F2F100FFFFFEFEFDFDFCFC5D
-:103BD000FBFBFAFAF9F9F8005B5B5B5B6E5D5B5827
-:103BE00059575852595D3E52583E6E505D5A3C6E80
-:103BF0005A6E517965795B636A51795D525D674CA4
-:103C00005D6565796579005A585858585251515137
-:103C1000797979706E6E5E5E5E5151517979796510
-:103C200065705E5E5E08010000000000080708087D
-:103C30000101000100070501000601000700050160
-:103C40000008000003000000000000000000010068
-:103C500000000000010E0109010001000000000049
-:103C60000000000000000000000000000000000054
-:103C70000700000500131000000000005449433FF6
-:103C8000282C1F252D4931241E33251D4518321E91
-:103C900018532E36560000000000000000000000FF
-:103CA0000000000000000048271F2B1E2200001FFC
-:103CB0001F1F1F0202020202020202020505020A7F
-:103CC000020805050B0A090808A00808171F1212A8
-:103CD00012121E1E1414141417171A1A1D1D020294
-:103CE000020202021A1D1B1A1D1B1A1D1B1A1D1B84
-:103CF000171D17171D17171D17171D171717000268
-:103D00000202020404040404040404040404040479
-:103D10000302040402020202020101010101010185
-:103D20000101010102020201000100010005050577
-:103D30000505040402000102000102000102000165
-:103D4000020002020001030002030002A0A052656B
-:103D50006164206572726F720057726974652065C4
-:103D600072726F72004F75742D6F662D6275666684
-:103D7000657220726561640000000000000A0B0D8E
-:103D80000E0D0C0C0B090B0B0C0C0C08080C080A84
-:103D900008080A03090600000000000000000305EF
-:103DA0000304000000050A020E0D0C0D0C080001B2
-:103DB0000000010000010000010000000000000000
-:103DC000000A00000A0000000000E0E6ECF3F90041
-:103DD000060C06000102020203030404050608099A
-:103DE0000B0D0F00000000000000000000000000AC
-:103DF00000000000000000000000000000000000C3
-:103E000000000000F1E2D3BB7C95010203030072C5
-:103E100000020000000000000000000000000000A0
-:103E2000000000000000001B00001900000000005E
-:103E300000000000909090909090909090909090C2
-:103E40009090909090909090909090909090909072
-:103E50009090909090909090909090909090909062
-:103E60009090909090909090909090909090909052
-:103E70009090909090909090909090909090909042
-:103E80009090909090909090909090909090909032
-:103E90009090909090909090909090909090909022
-:103EA0009090909090909090909090909090909012
-:103EB0009090909070707070707070707070707082
-:103EC00070707070707070707070707070707070F2
-:103ED00070707070707070707070707070707070E2
-:103EE00070707070707070707070707070707070D2
-:103EF00070707070707070707070707070707070C2
-:103F000070707070707070707070707070707070B1
-:103F100070707070707070707070707070707070A1
-:103F20007070707070707070707070707070707091
-:103F30007070707000000000000D0D0E0F0F0F0F5D
-:103F40000F0C0D0C0F0F0D0D0D0E0D0C0D0D0D0C9E
-:103F5000090900000000000000000B0B0B0B000023
-:103F6000010B00020E0F0F0F0F0D020400020400E0
-:103F7000010400010400000000000000000C00002B
-:103F800000000F0F000202020204040404040404EF
-:103F900004040404040403030404030303030301EB
-:103FA00002030201030303030101030303020203EB
-:103FB00002030000050505050404020002020003D7
-:103FC00002000402000302000202000203000303D5
-:103FD0000003B0A000000000000101010101010187
-:103FE00001010101010101010101010101010101C1
-:103FF00001010000000000000000000000000000BF
-:1040000000000000010101010100000000000000AB
-:1040100000000000000000000000000000000000A0
-:1040200000000000000000000043434343544842A6
-:104030003E282C1E242C4830241E32241C441832C6
-:104040001E18522E36563643494F1A4249253342DE
-:10405000282F4F4F424F6E0048261E2A1E221A1A42
-:104060001A4242426E6E6E5454541A1A1A42424216
-:104070006D566D5454547F7F181A1717170000009F
-:1040800000000A0E13181B171510140E120E121230
-:10409000100D0F0B120E0B090606060000000000A3
-:1040A00000000000000000000000000000131B15CD
-:1040B0001B120D0000000010101010101020202006
-:1040C00020202030303030303030404040404040C0
-:1040D0004050505050505050506060606060606080
-:1040E0006060606060707070707070707070707020
-:1040F00070707070707070707070707070707070C0
-:10410000707070706060606060606060606060606F
-:10411000505050505050505040404040404040302F
-:10412000303030303030202020202020101010106F
-:1041300010100000000000F0F0F0F0F0F0E0E0E01F
-:10414000E0E0E0D0D0D0D0D0D0D0C0C0C0C0C0C09F
-:10415000C0B0B0B0B0B0B0B0B0A0A0A0A0A0A0A0BF
-:10416000A0A0A0A0A09090909090909090909090FF
-:10417000909090909090909090909090909090903F
-:1041800090909090A0A0A0A0A0A0A0A0A0A0A0A06F
-:10419000B0B0B0B0B0B0B0B0C0C0C0C0C0C0C0D08F
-:1041A000D0D0D0D0D0D0E0E0E0E0E0E0F0F0F0F02F
-:1041B000F0F00000627974656172726179286200C2
-:1041C00061727261792827256327002C205B0062C9
-:1041D00061642074797065636F646500696E74282A
-:1041E00029206172672032206D757374206265200A
-:1041F0003E3D203220616E64203C3D203336006914
-:104200006E76616C69642073796E74617820666F74
-:104210007220696E746567657220776974682062C0
-:1042200061736520256400636F6D706C657820761E
-:10423000616C756573206E6F7420737570706F722A
-:1042400074656400696E76616C69642073796E745C
-:10425000617820666F72206E756D626572004743EB
-:104260003A20746F74616C3A2025752C2075736543
-:10427000643A2025752C20667265653A2025750AFA
-:1042800000204E6F2E206F6620312D626C6F636BA5
-:10429000733A2025752C20322D626C6F636B733A54
-:1042A0002025752C206D617820626C6B20737A3A22
-:1042B0002025750A004743206D656D6F7279206C6B
-:1042C00061796F75743B2066726F6D2025703A00BE
-:1042D0000A20202020202020282575206C696E656A
-:1042E0007320616C6C206672656529000A25303583
-:1042F000783A20003D3D3D3D3D3D3D3D3D3D3D3D10
-:104300003D3D3D3D3D3D3D3D3D3D3D3D3D3D3D3DDD
-:104310003D3D3D3D3D3D3D3D3D3D3D3D3D3D3D0DFD
-:104320000025733A0D0A0D0A0020696478202020C8
-:104330002070686F6E656D6520206C656E677468AF
-:1043400020207374726573730D002025336920205B
-:1043500020202020256325632020202020202533B5
-:10436000692020202020202025690D0A00202533E7
-:10437000692020202020203F3F20202020202025B1
-:1043800033692020202020202025690D0A0046695D
-:104390006E616C206461746120666F722073706559
-:1043A000656368206F75747075742E2025692066AA
-:1043B00072616D65733A0D0A0D0A0020666C6167C3
-:1043C0007320616D706C3120667265713120616D92
-:1043D000706C3220667265713220616D706C3320B2
-:1043E00066726571332070697463680D002D2D2D20
-:1043F0002D2D2D2D2D2D2D2D2D2D2D2D2D2D2D2DED
-:104400002D2D2D2D2D2D2D2D2D2D2D2D2D2D2D2DDC
-:104410002D2D2D2D2D2D2D2D2D2D2D2D2D0D002521
-:104420003569202535692025356920253569202500
-:1044300035692025356920253569202535690D0A1E
-:104440000000000005000051282573290A008F0193
-:104450002A00FA015F00420F5F5F6275696C645F5A
-:10446000636C6173735F5F002B095F5F636C6173E3
-:10447000735F5F002D075F5F646F635F5F00380AE3
-:104480005F5F696D706F72745F5F005F085F5F6987
-:104490006E69745F5F0079075F5F6E65775F5F00CD
-:1044A0007B0A5F5F6C6F63616C735F5F008E085F98
-:1044B0005F6D61696E5F5F00FF0A5F5F6D6F6475BE
-:1044C0006C655F5F00E2085F5F6E616D655F5F0056
-:1044D0007F085F5F646963745F5F00F7085F5F6810
-:1044E0006173685F5F0002085F5F6E6578745F5F8D
-:1044F000006B0C5F5F7175616C6E616D655F5F0075
-:10450000C8085F5F706174685F5F00010E5F5F7273
-:1045100065706C5F7072696E745F5F002B085F5F1F
-:10452000626F6F6C5F5F00C60C5F5F636F6E74617C
-:10453000696E735F5F006D095F5F656E7465725FC2
-:104540005F0045085F5F657869745F5F00E2075F41
-:104550005F6C656E5F5F00CF085F5F697465725F57
-:104560005F00260B5F5F6765746974656D5F5F0050
-:10457000320B5F5F7365746974656D5F5F00FD0B7F
-:104580005F5F64656C6974656D5F5F00C4075F5F42
-:104590006164645F5F0021075F5F7375625F5F0046
-:1045A00010085F5F726570725F5F00D0075F5F73B6
-:1045B00074725F5F00400B5F5F6765746174747253
-:1045C0005F5F0068075F5F64656C5F5F00A7085FFF
-:1045D0005F63616C6C5F5F005D065F5F6C745F5F63
-:1045E00000B6065F5F67745F5F0071065F5F6571AD
-:1045F0005F5F00CC065F5F6C655F5F00A7065F5F73
-:1046000067655F5F00610C5F5F72657665727365F9
-:10461000645F5F000B0B6D6963726F707974686F14
-:104620006E00220862797465636F646500C005637B
-:104630006F6E737400430961736D5F7468756D62AA
-:104640000043056C6162656C00A805616C69676E6A
-:104650000015046461746100E30475696E7400B44C
-:10466000036E6F7000F1036D6F76009104616E64EC
-:104670005F003B03636D70004403616464002103C9
-:1046800073756200B6036C736C00A8036C737200E0
-:104690006503617372005F036C6472005D046C6497
-:1046A00072620057046C6472680050037374720085
-:1046B0003204737472620038047374726800C70144
-:1046C0006200CB02626C00DF02627800BB0470758E
-:1046D0007368002A03706F7000E805637073696483
-:1046E00000E9056370736965009D03776669005092
-:1046F00003636C7A00E804726269740066046D6F8B
-:1047000076770065046D6F76740052056D6F76776D
-:10471000740089036D727300CD0473646976008B35
-:10472000047564697600E2056C6472657800AD0515
-:10473000737472657800F7086275696C74696E73DA
-:1047400000F008456C6C697073697300EA0D53746E
-:104750006F70497465726174696F6E00070D426114
-:104760007365457863657074696F6E002D0F4172D3
-:104770006974686D657469634572726F7200970E33
-:10478000417373657274696F6E4572726F72002146
-:104790000E4174747269627574654572726F72004D
-:1047A0001D0B4275666665724572726F72009108E4
-:1047B000454F464572726F7200F209457863657025
-:1047C00074696F6E005B0F46696C65457869737438
-:1047D000734572726F7200781146696C654E6F7422
-:1047E000466F756E644572726F72000112466C6F8F
-:1047F0006174696E67506F696E744572726F720092
-:10480000160D47656E657261746F72457869740044
-:10481000200B496D706F72744572726F72005C107C
-:10482000496E64656E746174696F6E4572726F7201
-:1048300000830A496E6465784572726F7200AF1129
-:104840004B6579626F617264496E746572727570DE
-:104850007400EA084B65794572726F7200FF0B4C69
-:104860006F6F6B75704572726F7200DC0B4D656D0A
-:104870006F72794572726F7200BA094E616D65454B
-:1048800072726F7200C6134E6F74496D706C656DF5
-:10489000656E7465644572726F7200A1074F53456F
-:1048A00072726F7200810D4F766572666C6F77451C
-:1048B00072726F7200610C52756E74696D6545722B
-:1048C000726F7200940B53796E7461784572726FD7
-:1048D0007200200A53797374656D457869740025F8
-:1048E00009547970654572726F72009911556E6244
-:1048F0006F756E644C6F63616C4572726F72009677
-:104900000A56616C75654572726F7200B6115A6510
-:10491000726F4469766973696F6E4572726F720067
-:10492000220C556E69636F64654572726F72006F19
-:10493000044E6F6E6500380546616C7365001304A4
-:10494000547275650090066F626A6563740017089B
-:104950004E6F6E655479706500F00B4F726465722E
-:104960006564446963740095036162730044036184
-:104970006C6C001303616E7900C20461726773008E
-:104980007C05617272617900E00362696E0058050E
-:104990007B3A23627D00EB04626F6F6C00760962E4
-:1049A0007974656172726179005C0562797465730E
-:1049B000000D0863616C6C61626C6500DC03636808
-:1049C0007200B40B636C6173736D6574686F64001F
-:1049D0003F0C5F636F6C6C656374696F6E73003F4F
-:1049E000046469637400FA0364697200B806646958
-:1049F000766D6F64007109656E756D6572617465C1
-:104A0000009B046576616C001E0465786563002573
-:104A10000666696C746572003505666C6F617400BA
-:104A2000350A66726F6D5F627974657300C00767DF
-:104A300065746174747200D4077365746174747200
-:104A4000009D07676C6F62616C73008C076861730F
-:104A50006174747200B704686173680070036865FC
-:104A600078007B0325237800280269640016036917
-:104A70006E7400B60A6973696E7374616E63650063
-:104A8000B50A6973737562636C617373008F04692F
-:104A90007465720062036C656E0027046C69737440
-:104AA000003B066C6F63616C7300B9036D6170004D
-:104AB000B1036D617800AF036D696E00CE07646568
-:104AC0006661756C74001E0A6E616D656474757044
-:104AD0006C650042046E65787400FD036F637400BA
-:104AE0006C0325236F00D1046F70656E001C036F8B
-:104AF000726400880470617468002D03706F770021
-:104B000054057072696E74001A0572616E676500F3
-:104B1000B7047265616400D0047265707200A10808
-:104B2000726576657273656400E705726F756E6411
-:104B3000005E06736F7274656400620C7374617456
-:104B400069636D6574686F64002E0373756D00C4CE
-:104B500005737570657200BC0373797300D80874AF
-:104B60006F5F627974657300FD057475706C650024
-:104B70009D0474797065004E0576616C75650098CA
-:104B800005777269746500E6037A69700023037320
-:104B90006570000A03656E640057047374657000E5
-:104BA0009D0473746F70007C05636C65617200E036
-:104BB00004636F707900370866726F6D6B65797387
-:104BC00000330367657400E3056974656D73000164
-:104BD000046B65797300BF07706F706974656D0051
-:104BE0006C0A73657464656661756C7400B40675EF
-:104BF0007064617465007D0676616C756573006B29
-:104C000006617070656E64003305636C6F736500D8
-:104C1000B90473656E6400B3057468726F7700A69B
-:104C200005636F756E74006306657874656E640065
-:104C30007B05696E64657800630672656D6F7665E5
-:104C4000001206696E7365727400BF04736F72742C
-:104C500000A7046A6F696E00290573747269700099
-:104C6000E5066C7374726970003B06727374726946
-:104C700070002606666F726D61740032036B657991
-:104C80000025077265766572736500010466696EBA
-:104C90006400D2057266696E6400E90672696E642A
-:104CA000657800B70573706C697400A5067273703F
-:104CB0006C697400740A73746172747377697468D0
-:104CC000001B08656E647377697468004907726534
-:104CD000706C616365008709706172746974696FD3
-:104CE0006E00150A72706172746974696F6E00C625
-:104CF000056C6F7765720027057570706572005BD3
-:104D0000076973737061636500EB076973616C70A9
-:104D1000686100A8076973646967697400DD0769E1
-:104D200073757070657200FC0769736C6F776572DC
-:104D30000025086974657261626C6500850573748D
-:104D400061727400970C626F756E645F6D65746854
-:104D50006F64007407636C6F73757265002D09646E
-:104D60006963745F7669657700270866756E63749A
-:104D7000696F6E00960967656E657261746F720087
-:104D800047086974657261746F7200BF066D6F6465
-:104D9000756C6500B505736C696365000F07646920
-:104DA000736361726400720A646966666572656E37
-:104DB0006365009C11646966666572656E63655F14
-:104DC00075706461746500280C696E746572736532
-:104DD0006374696F6E000613696E74657273656340
-:104DE00074696F6E5F75706461746500F70A69734A
-:104DF0006469736A6F696E7400B908697373756268
-:104E000073657400FC0A69737375706572736574F9
-:104E100000270373657400CE1473796D6D65747229
-:104E200069635F646966666572656E636500601BD1
-:104E300073796D6D65747269635F646966666572C6
-:104E4000656E63655F75706461746500F605756E07
-:104E5000696F6E00ED0966726F7A656E7365740036
-:104E600035046D61746800C00165001C0270690042
-:104E700021047371727400C8036578700021036C9B
-:104E80006F67007A03636F7300B10373696E00FE8E
-:104E90000374616E001B0461636F730050046173DF
-:104EA000696E001F046174616E00CD056174616EEE
-:104EB000320006046365696C003308636F707973B0
-:104EC00069676E0093046661627300E504666D6F46
-:104ED00064007D05666C6F6F7200A6086973666971
-:104EE0006E697465003E056973696E66009E0569AA
-:104EF000736E616E005B057472756E630025046DE0
-:104F00006F6466001C0566726578700040056C640D
-:104F100065787000020764656772656573008707CE
-:104F200072616469616E7300D1086D656D5F696E51
-:104F3000666F00B009717374725F696E666F009777
-:104F400009737461636B5F75736500AD09686561B2
-:104F5000705F6C6F636B00560B686561705F756E98
-:104F60006C6F636B0073206D6178696D756D207275
-:104F70006563757273696F6E20646570746820650F
-:104F80007863656564656400BD083C6D6F64756C2D
-:104F9000653E0080083C6C616D6264613E00D40A2D
-:104FA0003C6C697374636F6D703E00CC0A3C64693D
-:104FB0006374636F6D703E0054093C736574636F76
-:104FC0006D703E0034093C67656E657870723E0016
-:104FD00052083C737472696E673E00E3073C737459
-:104FE00064696E3E00C70461726776006109627988
-:104FF00074656F7264657200E90362696700850415
-:10500000657869740089066C6974746C65003A0887
-:10501000706C6174666F726D002105737464696EE3
-:105020000008067374646F757400A3067374646576
-:10503000727200BF0776657273696F6E006E0C76D0
-:10504000657273696F6E5F696E666F00A2046E6150
-:105050006D6500170E696D706C656D656E746174B9
-:10506000696F6E001C0F7072696E745F657863659E
-:105070007074696F6E001206737472756374004702
-:10508000077573747275637400BC047061636B00A0
-:105090001F097061636B5F696E746F000706756E40
-:1050A0007061636B000E0B756E7061636B5F66728F
-:1050B0006F6D004D0863616C6373697A650061020E
-:1050C0006763009B07636F6C6C6563740091076492
-:1050D000697361626C65000406656E61626C6500EF
-:1050E0009A096973656E61626C656400CB086D65D1
-:1050F0006D5F667265650052096D656D5F616C6C10
-:105100006F6300940468656C7000E00B636F6C6CF7
-:10511000656374696F6E7300C0086D6963726F6256
-:105120006974001005726573657400EA05736C6537
-:10513000657000C80C72756E6E696E675F74696D1C
-:105140006500D00570616E696300E90B74656D7070
-:105150006572617475726500A30474686973006395
-:1051600007617574686F727300F10B616E74696723
-:105170007261766974790055046C6F7665002C084D
-:1051800062616461626F6F6D00CD124D6963726F11
-:105190004269744469676974616C50696E000718EC
-:1051A0004D6963726F426974416E616C6F674469E7
-:1051B000676974616C50696E0052104D6963726F5B
-:1051C000426974546F75636850696E00920C726521
-:1051D00061645F6469676974616C00FD0D77726971
-:1051E00074655F6469676974616C00620B72656104
-:1051F000645F616E616C6F67002D0C777269746516
-:105200005F616E616C6F670008117365745F616E3A
-:10521000616C6F675F706572696F6400EE1E736525
-:10522000745F616E616C6F675F706572696F645FF8
-:105230006D6963726F7365636F6E6473007A1E6766
-:1052400065745F616E616C6F675F706572696F64D2
-:105250005F6D6963726F7365636F6E647300040AD8
-:1052600069735F746F756368656400E60A4D69630E
-:10527000726F426974494F00020470696E30000316
-:105280000470696E3100010470696E3200010470AF
-:10529000696E3300060470696E3400070470696E2D
-:1052A0003500040470696E3600050470696E3700BD
-:1052B0000A0470696E38000B0470696E390053057A
-:1052C00070696E313000520570696E3131005105E0
-:1052D00070696E313200500570696E3133005705C8
-:1052E00070696E313400560570696E3135005505B0
-:1052F00070696E3136005A0570696E3139003005BB
-:1053000070696E323000870D4D6963726F42697447
-:10531000496D616765006205496D61676500420519
-:10532000696D616765002305776964746800FA0632
-:1053300068656967687400B706696E76657274009F
-:10534000B0097365745F706978656C00A40967655E
-:10535000745F706978656C00A10A73686966745F30
-:105360006C65667400BA0B73686966745F7269670E
-:10537000687400DF0873686966745F757000480AB6
-:1053800073686966745F646F776E00E2096D6F6EB3
-:105390006F7370616365000F05484541525400CF3B
-:1053A0000B48454152545F534D414C4C0015054844
-:1053B00041505059009303534144009B05534D49BC
-:1053C0004C4500A608434F4E46555345440026051C
-:1053D000414E475259000B0641534C4545500088F9
-:1053E0000953555250524953454400C60553494C40
-:1053F0004C59003008464142554C4F555300050367
-:105400004D4548000A035945530004024E4F006EB3
-:1054100007434C4F434B313200DC06434C4F434B68
-:105420003100DF06434C4F434B3200DE06434C4F06
-:10543000434B3300D906434C4F434B3400D806430B
-:105440004C4F434B3500DB06434C4F434B3600DAA1
-:1054500006434C4F434B3700D506434C4F434B3824
-:1054600000D406434C4F434B39006C07434C4F4329
-:105470004B3130006D07434C4F434B313100ED074A
-:105480004152524F575F4E00C8084152524F575F2A
-:105490004E4500E6074152524F575F4500B508415F
-:1054A00052524F575F534500F0074152524F575FDA
-:1054B0005300A7084152524F575F535700F407411A
-:1054C00052524F575F5700DA084152524F575F4EC2
-:1054D0005700EB08545249414E474C45008F0D543C
-:1054E0005249414E474C455F4C45465400510A4392
-:1054F00048455353424F41524400A1074449414D4E
-:105500004F4E4400610D4449414D4F4E445F534D51
-:10551000414C4C00840653515541524500840C5374
-:1055200051554152455F534D414C4C00EB065241A1
-:1055300042424954005E03434F5700AB0E4D555352
-:1055400049435F43524F5443484554005F0C4D5507
-:105550005349435F515541564552006C0D4D5553CB
-:1055600049435F5155415645525300330950495400
-:105570004348464F524B00E204584D4153005506F4
-:105580005041434D414E00B40654415247455400EA
-:10559000450654534849525400270B524F4C4C4532
-:1055A00052534B415445003C044455434B00A10524
-:1055B000484F55534500C808544F52544F4953451E
-:1055C000005609425554544552464C5900E90B5374
-:1055D0005449434B46494755524500C20547484F39
-:1055E000535400980553574F5244007D0747495282
-:1055F00041464645004805534B554C4C00C908559B
-:105600004D4252454C4C41009705534E414B45008D
-:10561000F10A414C4C5F4152524F575300C00A416E
-:105620004C4C5F434C4F434B53005A0F4D696372D0
-:105630006F426974446973706C617900910E73658F
-:10564000745F6272696768746E657373009E10732D
-:1056500065745F646973706C61795F6D6F64650018
-:105660001F07646973706C617900860473686F77D3
-:105670000028067363726F6C6C00500564656C6182
-:105680007900B806737472696465008E0477616985
-:10569000740039046C6F6F70000B0463726F7000DC
-:1056A00098047465787400F60B536C6963656449FB
-:1056B0006D61676500BD0F5363726F6C6C696E67D7
-:1056C000537472696E670064026F6E008A036F66BE
-:1056D0006600610569735F6F6E00C10646616361B4
-:1056E000646500160E4D6963726F42697442757489
-:1056F000746F6E00ED08627574746F6E5F6100EE1A
-:1057000008627574746F6E5F6200E60A69735F7099
-:1057100072657373656400F90B7761735F7072650E
-:105720007373656400FD0B6765745F7072657373F6
-:105730006573005B154D6963726F42697441636301
-:10574000656C65726F6D65746572001E0D616363D3
-:10575000656C65726F6D657465720034056765749C
-:105760005F780035056765745F7900360567657495
-:105770005F7A00F40A6765745F76616C7565730023
-:10578000D40F63757272656E745F6765737475723A
-:105790006500070A69735F6765737475726500D881
-:1057A0000B7761735F6765737475726500180C67BA
-:1057B00065745F676573747572657300A0027570B8
-:1057C000003704646F776E00DE046C65667400E574
-:1057D00005726967687400210766616365207570EA
-:1057E0000036096661636520646F776E00B60866EF
-:1057F00072656566616C6C00310233670094023635
-:1058000067005A0238670031057368616B650010E4
-:105810000F4D6963726F426974436F6D706173738A
-:10582000005507636F6D70617373002D07686561C4
-:1058300064696E6700230D69735F63616C696272EE
-:105840006174656400020963616C69627261746508
-:10585000004911636C6561725F63616C69627261BA
-:1058600074696F6E00F4126765745F6669656C64D5
-:105870005F737472656E67746800B80B4D6963720C
-:105880006F426974493243005D0369326300B604B4
-:105890006164647200CB016E00740362756600F28D
-:1058A000067265706561740004056D757369630047
-:1058B000A1096672657175656E6379007B08647510
-:1058C000726174696F6E008305706974636800F2B9
-:1058D0000370696E002104706C6179009B09736527
-:1058E000745F74656D706F008F096765745F7465B0
-:1058F0006D706F00DA0362706D0043057469636B4D
-:1059000073009F054241444459009D0742415F4452
-:10591000494E4700FC08424952544844415900C886
-:1059200005424C554553005905434841534500FC39
-:105930000944414441444144554D00480B454E54AF
-:1059400045525441494E455200420746554E455234
-:10595000414C00D30446554E4B00AA094A554D50C0
-:105960005F444F574E00FD074A554D505F5550005C
-:105970003D044E59414E006B034F444500970A5079
-:105980004F5745525F444F574E000108504F5745FF
-:10599000525F5550003A075052454C55444500EB74
-:1059A0000950554E43484C494E4500B10650595494
-:1059B000484F4E00C70852494E47544F4E45006469
-:1059C000095741574157415741410017075745442F
-:1059D00044494E4700C401610067026123002C0462
-:1059E00061233A31002E0461233A3300760261329A
-:1059F000007002613400BB0461343A3100B90461C3
-:105A0000343A33000F03613A31000C03613A32003B
-:105A10000A03613A34000B03613A3500DE04623256
-:105A20003A310094026233009302623400D8046277
-:105A3000343A3100DB0462343A32009202623500BB
-:105A4000D90462353A31000C03623A31000F036227
-:105A50003A3200C6016300A502632300700363238A
-:105A60003500BB056323353A3100B8056323353A69
-:105A700032006E0463233A3100670463233A38002E
-:105A8000FC0463323A3200B5026333007C046333B2
-:105A90003A33007B0463333A3400B202633400F9D2
-:105AA0000463343A3100FB0463343A3300FC04638A
-:105AB000343A3400B302633500780463353A310078
-:105AC0007B0463353A32007A0463353A33007D044F
-:105AD00063353A34000D03633A31000E03633A3202
-:105AE000000F03633A33000803633A34000403638E
-:105AF0003A3800C1016400C202642300FF05642338
-:105B0000353A32000A0464233A32000B0464233A23
-:105B10003300D202643300D5026434001E046434BE
-:105B20003A3100D4026435001F0464353A31001C58
-:105B30000464353A32000A03643A31000903643AD6
-:105B400032000803643A33000F03643A34000E0352
-:105B5000643A35000D03643A36000303643A3800B2
-:105B6000BA0465333A3300F4026534003F04653407
-:105B70003A3100F5026535003F0465363A33000BD3
-:105B800003653A31000803653A32000903653A3388
-:105B9000000E03653A34000F03653A35000C0365C7
-:105BA0003A36000203653A3800E00465623A38008C
-:105BB000C30166000102662300350366233500FD3C
-:105BC000056623353A32004B0466233A3100480417
-:105BD00066233A3200420466233A380011026632E4
-:105BE000000803663A31000B03663A32000A036686
-:105BF0003A33000D03663A34000103663A3800C2B6
-:105C00000167002102672300EA0467233A3100E8B4
-:105C10000467233A3300FA0467333A3100360267E7
-:105C200034007D0467343A31007E0467343A320030
-:105C30003702673500FC0467353A31000903673ADB
-:105C400031000A03673A32000B03673A330001035D
-:105C5000673A3800D7017200CB0472343A32001C24
-:105C600003723A31001F03723A32001E03723A3354
-:105C700000320C4D6963726F426974554152540091
-:105C8000770475617274001F04696E697400F50809
-:105C900062617564726174650049046269747300BD
-:105CA000420670617269747900410470696E730014
-:105CB0008902747800CF0272780076077265616499
-:105CC000616C6C00F908726561646C696E65004B0B
-:105CD0000872656164696E746F006A034F44440022
-:105CE000DD044556454E004A0B4D6963726F4269AB
-:105CF0007453504900CF037370690026046D6F64BC
-:105D00006500720473636C6B001D046D6F73690032
-:105D10009D046D69736F00890E77726974655F7297
-:105D2000656164696E746F0069086E656F7069788B
-:105D3000656C0069084E656F506978656C00BE0639
-:105D400072616E646F6D00660B67657472616E647C
-:105D5000626974730092047365656400A3097261DB
-:105D60006E6472616E676500AF0772616E64696E22
-:105D700074002E0663686F696365000107756E69BC
-:105D8000666F726D005305617564696F00AE0A41FC
-:105D90007564696F4672616D6500270A7265747576
-:105DA000726E5F70696E00B806736F75726365001E
-:105DB0005608636F707966726F6D0079026F7300B9
-:105DC000B705756E616D65009B077379736E616DC4
-:105DD000650062086E6F64656E616D6500EC077248
-:105DE000656C65617365001A074279746573494F84
-:105DF000001E0654657874494F00F708777269747D
-:105E000061626C650098076C697374646972006004
-:105E1000076D616368696E6500200473697A6500C7
-:105E2000040A69735F706C6179696E67006D06734F
-:105E3000706565636800AE037361790094097072E0
-:105E40006F6E6F756E636500B60473696E670031BF
-:105E5000067468726F6174006E056D6F757468000A
-:105E60006205737065656400D405646562756700DA
-:105E700043097472616E736C61746500D40572615C
-:105E800064696F004F06636F6E66696700BF0A73CF
-:105E9000656E645F627974657300880D7265636511
-:105EA0006976655F6279746573004E077265636534
-:105EB0006976650059066C656E67746800940571B3
-:105EC000756575650026076368616E6E656C00DA3E
-:105ED00005706F77657200A809646174615F726113
-:105EE00074650073076164647265737300BA056753
-:105EF000726F7570007B0C524154455F3235304BE8
-:105F000042495400DB0A524154455F314D424954E5
-:105F100000580A524154455F324D424954007D7E3B
-:105F20007E7F80818282828484848484858787883E
-:105F300088898A8B8B8C8C8C4572722033363638EC
-:105F400033004572722033363839340000000000C7
-:105F50000000000000000000000000000000000041
-:105F6000000000000000000000000000000202022B
-:105F70000202028200000202020202020303030381
-:105F800003030303030302020202020202C0A8B0D9
-:105F9000ACC0A0B8A0C0BCA0ACA8ACC0A0A0ACB421
-:105FA000A4C0A8A8B0C0BC000000020020209B2014
-:105FB000C0B920CDA34C8A8E0095F7A239C5067EC4
-:105FC000C726374E91F155A1FE24452DA736532EF5
-:105FD00047DA284129BD2821293DAE282229203D24
-:105FE0002D4148354E4B574F5754AD2822293D4B34
-:105FF000574F573454AD2823293D204E4148344D46
-:106000004245D22824293D20444141344C45D228E0
-:1060100025293D20504552534548344ED428262941
-:106020003D2041454EC4282729BD282A293D20412D
-:10603000453453544552494853CB282B293D2050D1
-:106040004C414834D3282C293DAC20282D29203D13
-:10605000AD282D29BD282E293D20504F594ED4283A
-:106060002F293D20534C41453453C82830293D2029
-:106070005A495934524FD72028315354293D464567
-:10608000523453D4202831305448293D54454834A3
-:106090004E54C82831293D2057414834CE2028325B
-:1060A0004E44293D534548344B554EC42832293D72
-:1060B00020545557B42028335244293D5448455262
-:1060C00034C42833293D205448524959B42834292E
-:1060D0003D20464F4834D22028355448293D464972
-:1060E00048344654C82835293D2046415934D620E5
-:1060F00028363429203D534948344B5354495920BC
-:10610000464F48D22836293D20534948344BD3289E
-:1061100037293D20534548345655CE202838544819
-:10612000293D45593454C82838293D20455934D48F
-:106130002839293D204E415934CE283A293DAE28F0
-:106140003B293DAE283C293D204C45483453204452
-:10615000484145CE283D293D204959344B57554C9F
-:10616000DA283E293D2047524559345445522044AF
-:10617000484145CE283F293DBF2840293D20414583
-:1061800036D4285E293D204B414534524958D45DD0
-:10619000C15DC12028412E293D454834592EA028F3
-:1061A0004129203D41C8202841524529203D4141F7
-:1061B000D220284152294F3D4158D228415229230B
-:1061C0003D454834D2205E28415329233D4559346A
-:1061D000D328412957413D41D8284157293D414FB6
-:1061E000B5203A28414E59293D4548344E49D928D1
-:1061F00041295E2B233D4559B5233A28414C4C5942
-:10620000293D554C49D92028414C29233D55CC28BE
-:10621000414741494E293D415847454834CE233AEC
-:1062200028414729453D4948CA2841295E253D4521
-:10623000D92841295E2B3A233D41C5203A284129DE
-:106240005E2B203D4559B42028415252293D4158EA
-:10625000D228415252293D414534D2205E28415234
-:1062600029203D414135D2284152293D414135D275
-:1062700028414952293D454834D2284149293D45C4
-:1062800059B4284159293D4559B5284155293D4121
-:106290004FB4233A28414C29203D55CC233A28417C
-:1062A0004C5329203D554CDA28414C4B293D414F58
-:1062B00034CB28414C295E3D414FCC203A28414205
-:1062C0004C45293D4559344255CC2841424C45293D
-:1062D0003D41584255CC284129564F3D4559B42897
-:1062E000414E47292B3D4559344ECA28415441520D
-:1062F00049293D4148544141345249D92841295402
-:106300004F4D3D41C52841295454493D41C52028A0
-:10631000415429203D4145D420284129543D41C8BC
-:106320002841293D41C55DC220284229203D4249DE
-:1063300059B420284245295E233D4249C828424598
-:10634000494E47293D4249593449484ED8202842B0
-:106350004F544829203D424F573454C820284255B5
-:106360005329233D42494834DA28425245414B29BA
-:106370003D4252455935CB284255494C293D424969
-:106380004834CC2842293DC25DC320284329203D02
-:10639000534959B420284348295E3DCB5E452843E4
-:1063A00048293DCB284348412952233D4B4548B518
-:1063B000284348293D43C8205328434929233D53B6
-:1063C0004159B428434929413D53C8284349294FDD
-:1063D0003D53C828434929454E3D53C82843495495
-:1063E00059293D5349485449D92843292B3DD3289D
-:1063F000434B293DCB28434F4D4D4F444F524529E8
-:106400003D4B4141344D4148444F48D228434F4DC4
-:10641000293D4B4148CD2843554954293D4B4948D6
-:10642000D42843524541293D4B52495945D9284327
-:10643000293DCB5DC420284429203D444959B4203E
-:106440002844522E29203D444141344B5445D22307
-:106450003A2844454429203D444948C42E4528440F
-:1064600029203DC4233A5E45284429203DD42028D4
-:106470004445295E233D4449C82028444F29203DF6
-:106480004455D72028444F4553293D444148DA28F4
-:10649000444F4E4529203D44414835CE28444F497C
-:1064A0004E47293D4455573449484ED82028444F3B
-:1064B00057293D4441D72328445529413D4A55D7C2
-:1064C00023284455295E233D4A41D82844293DC408
-:1064D0005DC520284529203D49594959B4233A280A
-:1064E000452920BD273A5E28452920BD203A284568
-:1064F00029203D49D92328454429203DC4233A2851
-:1065000045294420BD2845562945523D454834D6A5
-:106510002845295E253D4959B42845524929233D3E
-:106520004959345249D928455249293D45483452A0
-:1065300049C8233A28455229233D45D2284552527D
-:106540004F52293D454834524F48D2284552415375
-:1065500045293D494852455935D328455229233DBF
-:106560004548D2284552293D45D220284556454E1A
-:10657000293D4959564548CE233A28452957BD401B
-:10658000284557293D55D7284557293D5955D728DE
-:1065900045294F3D49D9233A2628455329203D49CD
-:1065A00048DA233A2845295320BD233A28454C5937
-:1065B00029203D4C49D9233A28454D454E54293D83
-:1065C0004D45484ED4284546554C293D465548CC66
-:1065D000284545293D4959B4284541524E293D4554
-:1065E0005235CE2028454152295E3D4552B52845B9
-:1065F0004144293D4548C4233A28454129203D4985
-:106600005941D82845412953553D4548B52845416C
-:10661000293D4959B52845494748293D4559B42898
-:106620004549293D4959B42028455945293D4159F5
-:10663000B4284559293D49D9284555293D5955572B
-:10664000B528455155414C293D4959344B5755CCF6
-:106650002845293D45C85DC620284629203D454896
-:1066600034C62846554C293D465548CC2846524903
-:10667000454E44293D46524548354EC4284641546E
-:10668000484552293D46414134444845D22846298F
-:1066900046BD2846293DC65DC720284729203D4ADA
-:1066A0004959B428474956293D47494835D62028F5
-:1066B0004729495E3DC728474529543D474548B5C8
-:1066C00053552847474553293D474A454834D32821
-:1066D0004747293DC72042232847293DC728472946
-:1066E0002B3DCA284752454154293D47524559340C
-:1066F000D428474F4E29453D47414F35CE232847A3
-:106700004829BD2028474E293DCE2847293DC75D51
-:10671000C820284829203D45593443C820284841ED
-:1067200056293D2F48414536D6202848455245290F
-:106730003D2F484959D22028484F5552293D4157AD
-:106740003545D228484F57293D2F4841D728482959
-:10675000233D2FC8284829BD5DC92028494E293D21
-:106760004948CE20284929203D4159B428492920AB
-:106770003D41D928494E29443D415935CE53454DD7
-:106780002849293D49D920414E542849293D41D91C
-:1067900028494552293D495945D2233A522849456D
-:1067A0004429203D4959C42849454429203D41599F
-:1067B00035C42849454E293D49594548CE284945C3
-:1067C00029543D41593445C8284927293D4159B5E7
-:1067D000203A2849295E253D4159B5203A284945A6
-:1067E00029203D4159B4284929253D49D928494501
-:1067F000293D4959B4202849444541293D4159443E
-:1068000049593541C82849295E2B3A233D49C828B2
-:10681000495229233D4159D228495A29253D4159F8
-:10682000DA28495329253D4159DA495E2849295E2C
-:10683000233D49C82B5E2849295E2B3D41D9233A87
-:106840005E2849295E2B3D49C82849295E2B3D41D8
-:10685000D9284952293D45D228494748293D41591F
-:10686000B428494C44293D4159354CC42028494756
-:106870004E293D494847CE2849474E29203D415998
-:1068800034CE2849474E295E3D415934CE284947E8
-:106890004E29253D415934CE284943524F293D4187
-:1068A00059344B524FC82849515545293D4959340F
-:1068B000CB2849293D49C85DCA20284A29203D4A9C
-:1068C0004559B4284A293DCA5DCB20284B29203D93
-:1068D0004B4559B420284B294EBD284B293DCB5D53
-:1068E000CC20284C29203D454834CC284C4F294306
-:1068F000233D4C4FD74C284C29BD233A5E284C29C8
-:10690000253D55CC284C454144293D4C4959C4208E
-:10691000284C41554748293D4C414534C6284C290F
-:106920003DCC5DCD20284D29203D454834CD202843
-:106930004D522E29203D4D494834535445D22028EC
-:106940004D532E293D4D494835DA20284D52532EBE
-:1069500029203D4D494834534958DA284D4F56298E
-:106960003D4D555734D6284D414348494E293D4D5C
-:1069700041485348495935CE4D284D29BD284D2908
-:106980003DCD5DCE20284E29203D454834CE4528BA
-:106990004E47292B3D4ECA284E4729523D4E58C7D7
-:1069A000284E4729233D4E58C7284E474C29253DA0
-:1069B0004E584755CC284E47293D4ED8284E4B2996
-:1069C0003D4E58CB20284E4F5729203D4E4157B4BD
-:1069D0004E284E29BD284E4F4E29453D4E41483444
-:1069E000CE284E293DCE5DCF20284F29203D4F484F
-:1069F00034D7284F4629203D4148D620284F4829E2
-:106A0000203D4F57B5284F524F554748293D4552D5
-:106A1000344FD7233A284F5229203D45D2233A28D4
-:106A20004F525329203D4552DA284F52293D414FBC
-:106A3000D220284F4E45293D574148CE23284F4E5E
-:106A40004529203D574148CE284F57293D4FD72053
-:106A5000284F564552293D4F57355645D25052285A
-:106A60004F29563D5557B4284F56293D414834D6F5
-:106A7000284F295E253D4F57B5284F295E454E3D8D
-:106A80004FD7284F295E49233D4F57B5284F4C29F2
-:106A9000443D4F5734CC284F55474854293D414F2A
-:106AA00035D4284F554748293D414835C620284F01
-:106AB00055293D41D748284F552953233D4157B4C7
-:106AC000284F5553293D4158D3284F5552293D4F02
-:106AD00048D2284F554C44293D554835C4284F5578
-:106AE000295E4C3D4148B5284F5550293D555735F5
-:106AF000D0284F55293D41D7284F59293D4FD928F6
-:106B00004F494E47293D4F573449484ED8284F49A1
-:106B1000293D4F59B5284F4F52293D4F4835D2286E
-:106B20004F4F4B293D554835CB46284F4F44293DC3
-:106B3000555735C44C284F4F44293D414835C44D25
-:106B4000284F4F44293D555735C4284F4F44293DC0
-:106B5000554835C446284F4F54293D554835D4280B
-:106B60004F4F293D5557B5284F27293D4FC8284F2E
-:106B700029453D4FD7284F29203D4FD7284F412940
-:106B80003D4F57B420284F4E4C59293D4F57344E56
-:106B90004C49D920284F4E4345293D574148344E52
-:106BA000D3284F4E2754293D4F57344ED443284FB6
-:106BB000294E3D41C1284F294E473D41CF203A5EE5
-:106BC000284F294E3D41C849284F4E293D55CE23D7
-:106BD0003A284F4E293D55CE235E284F4E293D552C
-:106BE000CE284F2953543D4FD7284F46295E3D416B
-:106BF0004F34C6284F54484552293D4148354448F2
-:106C000045D252284F29423D5241C15E52284F2958
-:106C10003A233D4F57B5284F535329203D414F3517
-:106C2000D3233A5E284F4D293D4148CD284F293D79
-:106C300041C15DD020285029203D504959B42850E9
-:106C400048293DC62850454F504C293D504959359B
-:106C50005055CC28504F57293D504157B4285055D6
-:106C60005429203D505548D428502950BD2850293A
-:106C700053BD2850294EBD2850524F462E293D5015
-:106C8000524F48464548345345D22850293DD05D9F
-:106C9000D120285129203D4B595557B428515541F1
-:106CA00052293D4B574F4835D2285155293D4BD796
-:106CB0002851293DCB5DD220285229203D41413524
-:106CC000D220285245295E233D5249D928522952C3
-:106CD000BD2852293DD25DD320285329203D454867
-:106CE00034D3285348293D53C8232853494F4E29AC
-:106CF0003D5A4855CE28534F4D45293D534148CD27
-:106D0000232853555229233D5A4845D228535552DA
-:106D100029233D534845D22328535529233D5A481A
-:106D200055D7232853535529233D534855D7232856
-:106D3000534544293D5AC423285329233DDA285377
-:106D4000414944293D534548C45E2853494F4E2983
-:106D50003D534855CE28532953BD2E285329203D55
-:106D6000DA233A2E45285329203DDA233A5E232898
-:106D70005329203DD355285329203DD3203A232899
-:106D80005329203DDA2323285329203DDA20285394
-:106D90004348293D53CB285329432BBD2328534D2A
-:106DA000293D5A55CD2328534E29273D5A55CD28E4
-:106DB00053544C45293D5355CC2853293DD35DD4DC
-:106DC00020285429203D544959B4202854484529A5
-:106DD00020233D444849D9202854484529203D4492
-:106DE0004841D828544F29203D5455D8202854488C
-:106DF0004154293D44484145D42028544849532909
-:106E0000203D44484948D3202854484559293D4409
-:106E10004845D920285448455245293D44484548CD
-:106E2000D22854484552293D444845D22854484523
-:106E30004952293D44484548D220285448414E29CA
-:106E4000203D44484145CE20285448454D29203D09
-:106E500044484145CE28544845534529203D44489F
-:106E60004959DA20285448454E293D44484548CEE2
-:106E7000285448524F554748293D5448525557B415
-:106E80002854484F5345293D44484F48DA28544830
-:106E90004F55474829203D44484FD728544F444137
-:106EA00059293D5455584445D928544F4D4F2952DE
-:106EB000524F573D54554D4141B528544F295441E7
-:106EC0004C3D544F57B5202854485553293D44480C
-:106ED000414834D3285448293D54C8233A285445BE
-:106EE00044293D544958C45328544929234E3D430D
-:106EF000C8285449294F3D53C828544929413D5376
-:106F0000C8285449454E293D534855CE285455521A
-:106F100029233D434845D228545529413D434855EE
-:106F2000D7202854574F293D5455D7262854294552
-:106F30004E20BD2854293DD45DD520285529203D1B
-:106F4000595557B42028554E29493D595557CE20FB
-:106F500028554E293D4148CE202855504F4E293DB9
-:106F6000415850414FCE4028555229233D55483471
-:106F7000D228555229233D59554834D228555229F3
-:106F80003D45D22855295E203D41C82855295E5EE1
-:106F90003D4148B5285559293D4159B52047285507
-:106FA0002923BD4728552925BD47285529233DD7E5
-:106FB000234E2855293D5955D7402855293D55D7A9
-:106FC0002855293D5955D75DD620285629203D56AC
-:106FD0004959B42856494557293D56595557B5285A
-:106FE00056293DD65DD720285729203D44414834B5
-:106FF00042554C5955D7202857455245293D5745AC
-:10700000D22857412953483D5741C1285741295358
-:10701000543D5745D928574129533D5741C8285712
-:107020004129543D5741C1285748455245293D57AC
-:10703000484548D22857484154293D57484148D4EB
-:107040002857484F4C293D2F484F57CC2857484F79
-:10705000293D2F4855D7285748293D57C82857411B
-:107060005229233D574548D228574152293D57417F
-:107070004FD228574F52295E3D5745D228575229A3
-:107080003DD228574F4D29413D575548CD28574FA0
-:107090004D29453D574948CD2857454129523D572F
-:1070A00045C82857414E54293D574141354ED4419A
-:1070B0004E5328574552293D45D22857293DD75D83
-:1070C000D820285829203D4548344BD2202858291B
-:1070D0003DDA2858293D4BD35DD920285929203D38
-:1070E000574159B428594F554E47293D5941484EAB
-:1070F000D82028594F5552293D594F48D220285958
-:107100004F55293D5955D72028594553293D5945B3
-:1071100048D3202859293DD9462859293D41D950DD
-:107120005328594348293D4159CB233A5E285929D0
-:107130003D49D9233A5E285929493D49D9203A2861
-:107140005929203D41D9203A285929233D41D920A8
-:107150003A2859295E2B3A233D49C8203A28592913
-:107160005E233D41D92859293D49C85DDA20285A76
-:1071700029203D5A4959B4285A293DDAEA72616EEC
-:1071800067652825642C202564002C2025642900AF
-:107190006C6F63616C207661726961626C652072EC
-:1071A00065666572656E636564206265666F7265AB
-:1071B0002061737369676E6D656E740062797465C2
-:1071C00020636F6465206E6F7420696D706C656DEF
-:1071D000656E746564004E6F206163746976652026
-:1071E000657863657074696F6E20746F2072657264
-:1071F00061697365005C7525303478005C55253015
-:10720000387800737472696E6720696E64696365AB
-:1072100073206D75737420626520696E746567658F
-:1072200072732C206E6F7420257300737472696EF4
-:107230006720696E646578206F7574206F662072B0
-:10724000616E67650004656F72086C736C0C6C731B
-:10725000721061737214616463187362631C726FDD
-:107260007220747374246E656728636D702C636D6F
-:107270006E306F7272346D756C386269633C6D7616
-:107280006E006571016E65026373036363046D696B
-:1072900005706C067673077663086869096C730A73
-:1072A00067650B6C740C67740D6C6527257327205C
-:1072B00065787065637473206174206D6F737420DA
-:1072C00072256400272573272065787065637473C1
-:1072D00020612072656769737465720027257327C2
-:1072E0002065787065637473207B72302C20723156
-:1072F0002C202E2E2E7D0027257327206578706583
-:1073000063747320616E20696E746567657200270F
-:1073100025732720696E746567657220307825783B
-:1073200020646F6573206E6F742066697420696EC7
-:10733000206D61736B203078257800272573272016
-:10734000657870656374732061206C6162656C00A0
-:107350006C6162656C2027257127206E6F74206434
-:107360006566696E656400756E737570706F7274B2
-:107370006564205468756D6220696E7374727563FC
-:1073800074696F6E2027257327207769746820251C
-:107390006420617267756D656E74730027257327AD
-:1073A000206578706563747320616E206164647217
-:1073B000657373206F662074686520666F726D2038
-:1073C0005B612C20625D006272616E6368206E6F8B
-:1073D0007420696E2072616E67650063616E206F54
-:1073E0006E6C79206861766520757020746F20342A
-:1073F00020706172616D657465727320746F2054C2
-:1074000068756D6220617373656D626C790070617F
-:1074100072616D6574657273206D75737420626539
-:107420002072656769737465727320696E20736575
-:107430007175656E636520723020746F2072330041
-:1074400000723000017231000272320003723300A8
-:107450000472340005723500067236000772370078
-:1074600008723800097239000A7231300B723131FA
-:107470000C7231320D7231330E7231340F7231357C
-:107480000A736C000B6670000D7370000E6C720056
-:107490000F70630042434445464748494B4C3D36D4
-:1074A0003E3758383F3957315032592F4E304F5AA6
-:1074B0003A543B553351345235533C564D40412894
-:1074C000295B5D7B7D2C3A3B407E3C653D633C65A2
-:1074D0003D3E653D633E653D2A653D632A653D2B26
-:1074E000653D2D653D653E26653D7C653D2F653DD1
-:1074F000632F653D25653D5E653D3D653D21453D0F
-:1075000000756E69636F6465206E616D65206573DB
-:10751000636170657300616E640061730061737311
-:1075200065727400627265616B00636F6E74696E80
-:1075300075650064656C00656C696600656C7365F3
-:10754000006578636570740066696E616C6C7900C3
-:107550006C616D626461006E6F7400726574757247
-:107560006E007969656C64005F5F64656275675F72
-:107570005F00636872282920617267206E6F742033
-:10758000696E2072616E6765283078313130303035
-:1075900030290061726720697320616E20656D700B
-:1075A00074792073657175656E6365006F72642808
-:1075B0002920657870656374656420612063686163
-:1075C0007261637465722C206275742073747269C1
-:1075D0006E67206F66206C656E6774682025642076
-:1075E000666F756E64006D75737420757365206BBE
-:1075F0006579776F726420617267756D656E74204E
-:10760000666F72206B65792066756E6374696F6E44
-:1076100000736C69636528001213141615170F0D9B
-:107620000E1110696E6C696E6520617373656D6211
-:107630006C6572206D7573742062652061206675BB
-:107640006E6374696F6E00756E6B6E6F776E20740B
-:107650007970650072657475726E20616E6E6F74FC
-:107660006174696F6E206D75737420626520616E40
-:10767000206964656E746966696572006578706515
-:107680006374696E6720616E20617373656D626CEF
-:10769000657220696E737472756374696F6E00270A
-:1076A0006C6162656C272072657175697265732003
-:1076B0003120617267756D656E74006C6162656C16
-:1076C000207265646566696E65640027616C696730
-:1076D0006E27207265717569726573203120617241
-:1076E00067756D656E74002764617461272072652B
-:1076F000717569726573206174206C6561737420A3
-:107700003220617267756D656E74730027646174F1
-:10771000612720726571756972657320696E746581
-:1077200067657220617267756D656E7473002A7883
-:10773000206D7573742062652061737369676E6D67
-:10774000656E742074617267657400696E74657229
-:107750006E616C20636F6D70696C6572206572720A
-:107760006F72006D756C7469706C65202A78206981
-:107770006E2061737369676E6D656E740063616E10
-:1077800027742061737369676E20746F206C69744D
-:107790006572616C0063616E277420617373696741
-:1077A0006E20746F2065787072657373696F6E00F8
-:1077B000696C6C6567616C2065787072657373695C
-:1077C0006F6E20666F72206175676D656E7465649B
-:1077D0002061737369676E6D656E74007375706593
-:1077E0007228292063616C6C2063616E6E6F742057
-:1077F00066696E642073656C660063616E27742031
-:1078000068617665206D756C7469706C65202A7886
-:107810000063616E27742068617665206D756C74F5
-:1078200069706C65202A2A78004C4853206F6620C6
-:107830006B6579776F726420617267206D75737400
-:1078400020626520616E206964006E6F6E2D6B652D
-:1078500079776F7264206172672061667465722047
-:107860006B6579776F72642061726700696E76610B
-:107870006C6964206D6963726F707974686F6E20D3
-:107880006465636F7261746F72006E6F6E2D6465F4
-:107890006661756C7420617267756D656E742066C3
-:1078A0006F6C6C6F77732064656661756C742061B2
-:1078B0007267756D656E740064656661756C7420C1
-:1078C000276578636570743A27206D75737420623C
-:1078D00065206C6173740063616E27742064656356
-:1078E0006C617265206E6F6E6C6F63616C20696E87
-:1078F000206F7574657220636F6465006964656EDE
-:10790000746966696572207265646566696E65642E
-:10791000206173206E6F6E6C6F63616C006E6F2000
-:1079200062696E64696E6720666F72206E6F6E6C3E
-:107930006F63616C20666F756E64006964656E7458
-:107940006966696572207265646566696E65642042
-:10795000617320676C6F62616C0027636F6E74697E
-:107960006E756527206F757473696465206C6F6F21
-:10797000700027627265616B27206F75747369648C
-:1079800065206C6F6F700063616E27742064656C96
-:107990006574652065787072657373696F6E006ECB
-:1079A000616D652072657573656420666F72206114
-:1079B0007267756D656E74002772657475726E27D7
-:1079C000206F7574736964652066756E6374696F82
-:1079D0006E00277969656C6427206F75747369641C
-:1079E000652066756E6374696F6E00657870656397
-:1079F00074696E67206B65793A76616C756520668F
-:107A00006F722064696374696F6E61727900657862
-:107A100070656374696E67206A757374206120767F
-:107A2000616C756520666F72207365740073746194
-:107A3000636B3A202575206F7574206F662025646E
-:107A40000A007173747220706F6F6C3A206E5F70F1
-:107A50006F6F6C3D25752C206E5F717374723D25C0
-:107A6000752C206E5F7374725F646174615F6279FC
-:107A70007465733D25752C206E5F746F74616C5F47
-:107A800062797465733D25750A00492F4F206F7028
-:107A900065726174696F6E206F6E20636C6F7365C1
-:107AA000642066696C65004E6F206D6F726520738F
-:107AB000746F7261676520737061636500202E3F8B
-:107AC0002C2D4949454141414155414945554F5268
-:107AD0004C575957524C57594D4E4E44515353469B
-:107AE000542F2F5A5A5644432A4A2A2A2A45414F8C
-:107AF000414F55422A2A442A2A472A2A472A2A50ED
-:107B00002A2A542A2A4B2A2A4B2A2A5555552A2AE8
-:107B10002A2A2A5948484541484F485858525848F7
-:107B200058585858482A2A2A2A2A2A58582A2A4865
-:107B30002A4848582A482A48482A2A2A2A2A595983
-:107B4000595757572A2A2A2A2A2A2A2A2A582A2AB1
-:107B50002A2A2A2A2A2A2A2A2A582A2A4C4D4E0018
-:107B600000000000A4A4A4A4A4A48484A4A48484E5
-:107B7000848484848444444444444C4C4C484C4065
-:107B800040404040404444444448404C440000B4D9
-:107B9000B4B49494944E4E4E4E4E4E4E4E4E4E4E67
-:107BA0004E4B4B4B4B4B4B4B4B4B4B4B4B80C1C101
-:107BB00000121212080B090B0E0F0B100C06060E0A
-:107BC0000C0E0C0B08080B0A090808080808030526
-:107BD0000202020202020606080606020904020167
-:107BE0000E0F0F0F0E0E0802020702010702020716
-:107BF0000202080202060202070204070104050548
-:107C000080C1C1C1C10000000000000000000000F0
-:107C10000000000000000010101010080C080440C4
-:107C200024202024000024202024202000200000E4
-:107C30000000000000000000000404040000000038
-:107C40000000000000040404000000000000506870
-:107C50006F6E656D657320746F6F206C6F6E67005B
-:107C6000496C6C6567616C2070697463680050686A
-:107C70006F6E656D65206E6F7420756E64657273CE
-:107C8000746F6F6400496E7075742070686F6E65F4
-:107C90006D657300494E5445524E414C2045525239
-:107CA0004F523A20496C6C6567616C2070686F6E4A
-:107CB000656D6520696E64657800496E73657274E0
-:107CC00020427265616474680D0050726F63657361
-:107CD0007365642070686F6E656D657300001212C5
-:107CE0001208080808080B060C0A05050B0A0A0A00
-:107CF0000908070907060806070707020502020226
-:107D00000202020606070606020803011E0D0C0CFD
-:107D10000C0E090601020501010601020601020816
-:107D20000202040202060104060104C7FF2A3132DE
-:107D3000333435363738285B005D2900257128003B
-:107D40007B003C76616C75653E00706F7069746590
-:107D50006D28293A2064696374696F6E61727920B5
-:107D6000697320656D7074790064696374696F6EFE
-:107D700061727920757064617465207365717565D1
-:107D80006E636520686173207468652077726F6E1A
-:107D900067206C656E67746800646963745F6974FA
-:107DA000656D7300646963745F6B65797300646902
-:107DB00063745F76616C756573004552524F523A39
-:107DC00020737461636B2073697A65206E6F742011
-:107DD0006261636B20746F207A65726F3B20676FFE
-:107DE000742025640A0062756666657220746F6F80
-:107DF00020736D616C6C0063616E277420636F6E1D
-:107E00007665727420696E6620746F20696E7400E6
-:107E100063616E277420636F6E76657274204E61A5
-:107E20004E20746F20696E74006F766572666C6F99
-:107E30007720636F6E76657274696E67206C6F6E03
-:107E40006720696E7420746F206D616368696E6568
-:107E500020776F72640066726F7A656E0073657466
-:107E600028290066726F7A656E736574280027731F
-:107E7000657427206F626A65637420726571756925
-:107E8000726564002766726F7A656E736574272069
-:107E9000686173206E6F20737563682061747472FB
-:107EA000696275746500706F702066726F6D206115
-:107EB0006E20656D707479207365740057656C630E
-:107EC0006F6D6520746F204D6963726F50797468AF
-:107ED0006F6E206F6E20746865206D6963726F3AF3
-:107EE000626974210A0A5472792074686573652086
-:107EF000636F6D6D616E64733A0A202064697370FC
-:107F00006C61792E7363726F6C6C282748656C6C9A
-:107F10006F27290A202072756E6E696E675F74691B
-:107F20006D6528290A2020736C6565702831303012
-:107F300030290A2020627574746F6E5F612E697338
-:107F40005F7072657373656428290A5768617420CD
-:107F5000646F20746865736520636F6D6D616E6416
-:107F60007320646F3F2043616E20796F7520696DC7
-:107F700070726F7665207468656D3F2048494E5475
-:107F80003A207573652074686520757020616E6491
-:107F900020646F776E0A6172726F77206B657973F8
-:107FA00020746F2067657420796F757220636F6D20
-:107FB0006D616E6420686973746F72792E205072DF
-:107FC0006573732074686520544142206B65792085
-:107FD000746F206175746F2D636F6D706C6574655F
-:107FE0000A756E66696E697368656420776F72647E
-:107FF000732028736F2027646927206265636F6D83
-:1080000065732027646973706C61792720616674D9
-:10801000657220796F7520707265737320544142C8
-:10802000292E2054686573650A747269636B732026
-:10803000736176652061206C6F74206F662074799F
-:1080400070696E6720616E64206C6F6F6B20636F68
-:108050006F6C210A0A4578706C6F72653A0A547920
-:108060007065202768656C7028736F6D657468692A
-:108070006E67292720746F2066696E64206F75749F
-:108080002061626F75742069742E205479706520A8
-:108090002764697228736F6D657468696E67292734
-:1080A00020746F2073656520776861740A69742095
-:1080B00063616E20646F2E20547970652027646997
-:1080C0007228292720746F20736565207768617492
-:1080D00020737475666620697320617661696C61CE
-:1080E000626C652E20466F7220676F6F646E6573D9
-:1080F000732073616B652C0A646F6E27742074792A
-:1081000070652027696D706F7274207468697327B9
-:108110002E0A0A436F6E74726F6C20636F6D6D610F
-:108120006E64733A0A20204354524C2D4320202081
-:1081300020202020202D2D2073746F70206120724C
-:10814000756E6E696E672070726F6772616D0A205E
-:10815000204354524C2D4420202020202020202D2C
-:108160002D206F6E206120626C616E6B206C696ED9
-:10817000652C20646F206120736F667420726573B4
-:108180006574206F6620746865206D6963726F3A4C
-:108190006269740A20204354524C2D45202020202F
-:1081A000202020202D2D20656E7465722070617353
-:1081B0007465206D6F64652C207475726E696E67CE
-:1081C000206F6666206175746F2D696E64656E74CC
-:1081D0000A0A417661696C61626C65206D6F647535
-:1081E0006C65733A20616E7469677261766974793F
-:1081F0002C2061727261792C20636F6C6C656374E2
-:10820000696F6E732C2067632C206C6F76652C2051
-:108210006D6174682C0A6D6963726F707974686F30
-:108220006E2C206D757369632C206E656F70697894
-:10823000656C2C2072616E646F6D2C207374727586
-:1082400063742C207379732C20746869730A0A464E
-:108250006F72206D6F726520696E666F726D6174EA
-:10826000696F6E2061626F757420507974686F6EEB
-:108270002C2076697369743A20687474703A2F2FD1
-:10828000707974686F6E2E6F72672F0A546F206654
-:10829000696E64206F75742061626F7574204D691A
-:1082A00063726F507974686F6E2C2076697369748D
-:1082B0003A20687474703A2F2F6D6963726F707909
-:1082C00074686F6E2E6F72672F0A507974686F6EC4
-:1082D0002F6D6963726F3A62697420646F63756DA4
-:1082E000656E746174696F6E20697320686572656C
-:1082F0003A20687474703A2F2F6D6963726F6269E7
-:10830000742D6D6963726F707974686F6E2E7274FC
-:1083100066642E6F72672F0A004D6963726F42693F
-:1083200074416363656C65726F6D6574657220740A
-:108330007970650A006F626A656374200020697352
-:10834000206F6620747970652025710A00202D2D1C
-:10835000200055736566756C2073747566662074AD
-:108360006F20636F6E74726F6C20746865206D6926
-:1083700063726F3A626974206861726477617265D2
-:108380002E0A00507574206D6963726F3A626974C9
-:1083900020696E2070616E69632829206D6F6465A5
-:1083A00020616E6420646973706C617920616E2055
-:1083B000756E686170707920666163652E0A50720F
-:1083C00065737320726573657420627574746F6E63
-:1083D00020746F20657869742070616E6963282944
-:1083E000206D6F64652E0A00507574206D6963728C
-:1083F0006F3A62697420746F20736C6565702874BD
-:10840000696D652920666F7220736F6D65206D69D7
-:108410006C6C697365636F6E6473202831207365BB
-:10842000636F6E64203D2031303030206D73292021
-:108430006F662074696D652E0A736C6565702832ED
-:1084400030303029206769766573206D6963726FFB
-:108450003A62697420612032207365636F6E642014
-:108460006E61702E0A0052657475726E2072756EA0
-:108470006E696E675F74696D65282920696E206D6D
-:10848000696C6C697365636F6E64732073696E6386
-:1084900065206D6963726F3A6269742773206C613D
-:1084A00073742072657365742E0A00526574757258
-:1084B0006E206D6963726F3A626974277320746508
-:1084C0006D706572617475726520696E2064656790
-:1084D000726565732043656C636975732E0A004489
-:1084E0006574656374206D6963726F3A626974279D
-:1084F00073206D6F76656D656E7420696E203344F0
-:108500002E0A4974206D65617375726573207469F4
-:108510006C7420285820616E6420592920616E6493
-:108520002075702D646F776E20285A29206D6F7426
-:10853000696F6E2E0A0052657475726E206D6963E4
-:10854000726F3A62697427732074696C74202858BA
-:1085500020616363656C65726174696F6E2920695F
-:108560006E206D696C6C692D6727732E0A00526549
-:108570007475726E206D6963726F3A6269742773E5
-:108580002074696C7420285920616363656C65727E
-:108590006174696F6E2920696E206D696C6C692D3C
-:1085A0006727732E0A0052657475726E206D6963B9
-:1085B000726F3A62697427732075702D646F776EDD
-:1085C000206D6F74696F6E20285A20616363656C3B
-:1085D00065726174696F6E2920696E206D696C6CBB
-:1085E000692D6727732E0A5A206973206120706FE6
-:1085F000736974697665206E756D6265722077683F
-:10860000656E206D6F76696E672075702E204D6FD8
-:1086100076696E6720646F776E2C205A206973200C
-:1086200061206E65676174697665206E756D62653F
-:10863000722E0A006D6963726F3A62697427732043
-:1086400027412720627574746F6E2E205768656EFF
-:1086500020627574746F6E20697320707265737315
-:10866000656420646F776E2C2069735F7072657328
-:10867000736564282920697320547275652E0A0079
-:108680006D6963726F3A62697427732027422720ED
-:10869000627574746F6E2E205768656E20627574F3
-:1086A000746F6E20697320707265737365642064E3
-:1086B0006F776E2C2069735F7072657373656428C1
-:1086C0002920697320547275652E0A00496620744A
-:1086D000686520627574746F6E20697320707265AE
-:1086E0007373656420646F776E2C2069735F70729A
-:1086F0006573736564282920697320547275652C2D
-:1087000020656C73652046616C73652E0A00557395
-:1087100065207761735F70726573736564282920C3
-:10872000746F206C6561726E2069662074686520C4
-:10873000627574746F6E20776173207072657373E5
-:1087400065642073696E636520746865206C61736D
-:10875000742074696D650A7761735F7072657373F5
-:1087600065642829207761732063616C6C65642ED1
-:108770002052657475726E732054727565206F7225
-:108780002046616C73652E0A005573652067657419
-:108790005F70726573736573282920746F20676535
-:1087A00074207468652072756E6E696E6720746FD0
-:1087B00074616C206F6620627574746F6E207072C5
-:1087C00065737365732C20616E6420616C736F0A2E
-:1087D0007265736574207468697320636F756E7455
-:1087E000657220746F207A65726F2E0A0047697671
-:1087F0006573206120636F6D7061737320686561BC
-:1088000064696E67206265747765656E20302D330C
-:10881000363020776974682030206173206E6F7263
-:1088200074682E0A00557365206D6963726F3A6231
-:108830006974277320636F6D7061737320746F2088
-:108840006465746563742074686520646972656327
-:1088500074696F6E2069742069732068656164694A
-:108860006E6720696E2E0A54686520636F6D7061B3
-:1088700073732063616E20646574656374206D6139
-:10888000676E65746963206669656C64732E0A4956
-:10889000742075736573207468652045617274680F
-:1088A0002773206D61676E65746963206669656C06
-:1088B0006420746F206465746563742064697265F4
-:1088C0006374696F6E2E0A004966206D6963726F6A
-:1088D0003A626974277320636F6D706173732069E6
-:1088E000735F63616C6962726174656428292061D9
-:1088F0006E642061646A757374656420666F7220AB
-:1089000061636375726163792C2072657475726E30
-:1089100020547275652E0A496620636F6D7061730D
-:1089200073206861736E2774206265656E206164D0
-:108930006A757374656420666F7220616363757213
-:108940006163792C2072657475726E2046616C7358
-:10895000652E0A004966206D6963726F3A62697418
-:1089600020697320636F6E66757365642C20636184
-:108970006C69627261746528292074686520636F70
-:108980006D7061737320746F2061646A75737420F5
-:1089900074686520697473206163637572616379BB
-:1089A0002E0A49742077696C6C2061736B20796F93
-:1089B0007520746F20726F7461746520746865200F
-:1089C00064657669636520746F20647261772061E5
-:1089D00020636972636C65206F6E20746865206423
-:1089E0006973706C61792E0A005265736574206D2D
-:1089F0006963726F3A626974277320636F6D706187
-:108A00007373207573696E6720636C6561725F6351
-:108A1000616C6962726174696F6E282920636F6D81
-:108A20006D616E642E0A52756E2063616C696272AC
-:108A3000617465282920746F20696D70726F766586
-:108A40002061636375726163792E0A0052657475E3
-:108A5000726E206D61676E65746963206669656C0E
-:108A60006420646574656374656420616C6F6E670F
-:108A7000206D6963726F3A626974277320582061B0
-:108A80007869732E0A557375616C6C792C20746843
-:108A90006520636F6D706173732072657475726E9B
-:108AA00073207468652065617274682773206D6136
-:108AB000676E65746963206669656C6420696E2001
-:108AC0006D6963726F2D5465736C6120756E697486
-:108AD000732E0A556E6C6573732E2E2E612073747F
-:108AE000726F6E67206D61676E6574206973206EAA
-:108AF0006561726279210A0052657475726E206D2B
-:108B000061676E65746963206669656C642064657D
-:108B100074656374656420616C6F6E67206D696352
-:108B2000726F3A6269742773205920617869732ED5
-:108B30000A557375616C6C792C2074686520636FBD
-:108B40006D706173732072657475726E73207468D2
-:108B5000652065617274682773206D61676E657446
-:108B60006963206669656C6420696E206D69637253
-:108B70006F2D5465736C6120756E6974732E0A5580
-:108B80006E6C6573732E2E2E61207374726F6E6718
-:108B9000206D61676E6574206973206E6561726215
-:108BA00079210A0052657475726E206D61676E6579
-:108BB000746963206669656C6420646574656374B8
-:108BC000656420616C6F6E67206D6963726F3A62D5
-:108BD00069742773205A20617869732E0A5573755A
-:108BE000616C6C792C2074686520636F6D706173A3
-:108BF000732072657475726E732074686520656188
-:108C00007274682773206D61676E6574696320668E
-:108C100069656C6420696E206D6963726F2D54659F
-:108C2000736C6120756E6974732E0A556E6C657372
-:108C3000732E2E2E61207374726F6E67206D6167C4
-:108C40006E6574206973206E6561726279210A0015
-:108C500052657475726E20737472656E67746820E5
-:108C60006F66206D61676E65746963206669656C07
-:108C7000642061726F756E64206D6963726F3A6211
-:108C800069742E0A006D6963726F3A6269742773A2
-:108C900020357835204C454420646973706C6179C7
-:108CA0002E0A005573652073686F77287829207421
-:108CB0006F207072696E74207468652073747269B5
-:108CC0006E67206F7220696D616765732027782752
-:108CD00020746F2074686520646973706C61792EEC
-:108CE000205472792073686F7728274869212729D3
-:108CF0002E0A5573652073686F7728732C206929B5
-:108D000020746F2073686F7720737472696E6720A8
-:108D10002773272C206F6E6520636861726163740E
-:108D2000657220617420612074696D6520776974B3
-:108D30006820612064656C6179206F660A27692765
-:108D4000206D696C6C697365636F6E64732E0A00C5
-:108D5000557365207363726F6C6C28732920746F70
-:108D6000207363726F6C6C20746865207374726911
-:108D70006E6720277327206163726F737320746896
-:108D80006520646973706C61792E0A557365207370
-:108D900063726F6C6C28732C20692920746F2073A8
-:108DA00063726F6C6C20737472696E67202773270F
-:108DB000207769746820612064656C6179206F6632
-:108DC00020276927206D696C6C697365636F6E6419
-:108DD000732061667465720A656163682063686107
-:108DE0007261637465722E0A0055736520636C6549
-:108DF0006172282920746F20636C656172206D692F
-:108E000063726F3A626974277320646973706C616E
-:108E1000792E0A00557365206765745F70697865FF
-:108E20006C28782C20792920746F207265747572F3
-:108E30006E2074686520646973706C617927732093
-:108E40006272696768746E657373206174204C4543
-:108E50004420706978656C2028782C79292E0A4284
-:108E600072696768746E6573732063616E206265F2
-:108E70002066726F6D203020284C45442069732095
-:108E80006F66662920746F203920286D6178696DBE
-:108E9000756D204C4544206272696768746E657315
-:108EA00073292E0A00557365207365745F706978A5
-:108EB000656C28782C20792C20622920746F20730F
-:108EC00065742074686520646973706C61792061D1
-:108ED00074204C454420706978656C2028782C7982
-:108EE0002920746F206272696768746E65737320DD
-:108EF0002762270A77686963682063616E2062656C
-:108F000020736574206265747765656E2030202853
-:108F10006F66662920746F2039202866756C6C2076
-:108F20006272696768746E657373292E0A005573DF
-:108F300065206F6E282920746F207475726E206F03
-:108F40006E2074686520646973706C61792E0A0004
-:108F5000557365206F6666282920746F20747572BA
-:108F60006E206F66662074686520646973706C613A
-:108F7000792E0A005573652069735F6F6E2829206A
-:108F8000746F207175657279206966207468652038
-:108F90006D6963726F3A62697427732064697370D4
-:108FA0006C6179206973206F6E2028547275652971
-:108FB000206F72206F6666202846616C7365292ECB
-:108FC0000A006D6963726F3A626974277320706971
-:108FD0006E2030206F6E2074686520676F6C64208F
-:108FE0006564676520636F6E6E6563746F722E0AC9
-:108FF000006D6963726F3A62697427732070696EDD
-:109000002031206F6E2074686520676F6C64206566
-:1090100064676520636F6E6E6563746F722E0A00FD
-:109020006D6963726F3A62697427732070696E208C
-:1090300032206F6E2074686520676F6C64206564F1
-:10904000676520636F6E6E6563746F722E0A006DC4
-:109050006963726F3A62697427732070696E203396
-:10906000206F6E2074686520676F6C64206564678C
-:109070006520636F6E6E6563746F722E0A006D6992
-:1090800063726F3A62697427732070696E203420AE
-:109090006F6E2074686520676F6C64206564676517
-:1090A00020636F6E6E6563746F722E0A006D696364
-:1090B000726F3A62697427732070696E2035206F71
-:1090C0006E2074686520676F6C6420656467652036
-:1090D000636F6E6E6563746F722E0A006D696372E2
-:1090E0006F3A62697427732070696E2036206F6E44
-:1090F0002074686520676F6C642065646765206311
-:109100006F6E6E6563746F722E0A006D6963726FA5
-:109110003A62697427732070696E2037206F6E2061
-:1091200074686520676F6C64206564676520636F91
-:109130006E6E6563746F722E0A006D6963726F3AAA
-:1091400062697427732070696E2038206F6E2074F6
-:10915000686520676F6C64206564676520636F6E67
-:109160006E6563746F722E0A006D6963726F3A6286
-:10917000697427732070696E2039206F6E207468BF
-:109180006520676F6C64206564676520636F6E6E31
-:109190006563746F722E0A006D6963726F3A62695B
-:1091A0007427732070696E203130206F6E207468D0
-:1091B0006520676F6C64206564676520636F6E6E01
-:1091C0006563746F722E0A006D6963726F3A62692B
-:1091D0007427732070696E203131206F6E2074689F
-:1091E0006520676F6C64206564676520636F6E6ED1
-:1091F0006563746F722E0A006D6963726F3A6269FB
-:109200007427732070696E203132206F6E2074686D
-:109210006520676F6C64206564676520636F6E6EA0
-:109220006563746F722E0A006D6963726F3A6269CA
-:109230007427732070696E203133206F6E2074683C
-:109240006520676F6C64206564676520636F6E6E70
-:109250006563746F722E0A006D6963726F3A62699A
-:109260007427732070696E203134206F6E2074680B
-:109270006520676F6C64206564676520636F6E6E40
-:109280006563746F722E0A006D6963726F3A62696A
-:109290007427732070696E203135206F6E207468DA
-:1092A0006520676F6C64206564676520636F6E6E10
-:1092B0006563746F722E0A006D6963726F3A62693A
-:1092C0007427732070696E203136206F6E207468A9
-:1092D0006520676F6C64206564676520636F6E6EE0
-:1092E0006563746F722E0A006D6963726F3A62690A
-:1092F0007427732070696E203139206F6E20746876
-:109300006520676F6C64206564676520636F6E6EAF
-:109310006563746F722E0A006D6963726F3A6269D9
-:109320007427732070696E203230206F6E2074684D
-:109330006520676F6C64206564676520636F6E6E7F
-:109340006563746F722E0A006D6963726F3A6269A9
-:10935000742C2077726974655F6469676974616CE5
-:109360002863686F6963652920746F2074686520BD
-:1093700070696E2E20596F7520686176652074774C
-:109380006F202763686F696365272076616C756558
-:10939000732C0A3020286C6F29206F72203120280E
-:1093A0006869292E0A006D6963726F3A6269742CCC
-:1093B00020726561645F6469676974616C28292043
-:1093C00076616C75652066726F6D207468652070BB
-:1093D000696E206173206569746865722030202889
-:1093E0006C6F29206F72203120286869292E0A00AD
-:1093F0006D6963726F3A6269742C20777269746563
-:109400005F616E616C6F672876616C756529207489
-:109410006F207468652070696E2E20596F75206307
-:10942000616E2075736520616E792076616C75655B
-:10943000206265747765656E0A3020616E64203144
-:109440003032332E0A006D6963726F3A6269742C90
-:1094500020726561645F616E616C6F672829207698
-:10946000616C75652066726F6D2074686520706927
-:109470006E2E20576F772C20616E616C6F672068AD
-:109480006173206C6F7473206F662076616C7565F4
-:10949000730A2830202D203635353335292E2044C7
-:1094A00069676974616C20686173206F6E6C7920E4
-:1094B0003020616E6420312E0A0049662070696E8A
-:1094C0002069735F746F75636865642829206F6E07
-:1094D000206D6963726F3A6269742C2072657475CD
-:1094E000726E20547275652E204966206E6F746806
-:1094F000696E6720697320746F756368696E672091
-:109500007468652070696E2C0A72657475726E20BD
-:1095100046616C73652E0A00436F6D6D756E6963ED
-:109520006174652077697468206F6E65206F7220A2
-:109530006D6F7265206E616D656420646576696328
-:10954000657320636F6E6E656374656420746F204D
-:109550006D6963726F3A6269742E20456163682099
-:109560006E616D65640A6465766963652068617320
-:1095700020616E202761646472657373272C2063F9
-:109580006F6D6D756E696361746573207573696E57
-:1095900067204932432C20616E6420636F6E6E65D4
-:1095A00063747320746F2074686520492F4F207096
-:1095B000696E732E0A0055736520726561642861B7
-:1095C0006464726573732C206E2920746F20726539
-:1095D000616420276E272062797465732066726F3C
-:1095E0006D207468652064657669636520776974A9
-:1095F00068207468697320616464726573732E0AED
-:1096000000557365207772697465286164647265BA
-:1096100073732C206275666665722920746F2077DB
-:109620007269746520746F2074686520276275669E
-:1096300066657227206F66207468652064657669A8
-:1096400063652061742074686973202761646472A3
-:10965000657373272E0A0043726561746520616E1D
-:109660006420757365206275696C742D696E20497C
-:109670004D4147455320746F2073686F77206F6E9C
-:109680002074686520646973706C61792E2055734D
-:10969000653A0A496D616765280A2020273039300C
-:1096A00039303A270A20202739393939393A270AF7
-:1096B00020202739393939393A270A2020273039EB
-:1096C0003939303A270A20202730303930303A27CC
-:1096D000290A2E2E2E746F206D616B652061206E1D
-:1096E00065772035783520686561727420696D6111
-:1096F00067652E204E756D6265727320676F2066F8
-:10970000726F6D203020286F66662920746F2039B3
-:109710002028627269676874657374292E204E6F01
-:1097200074650A74686520636F6C6F6E20273A2732
-:1097300020746F207365742074686520656E6420E2
-:109740006F66206120726F772E0A00526574757201
-:109750006E20746865207769647468206F66207471
-:10976000686520696D61676520696E20706978653C
-:109770006C732E0A0052657475726E2074686520D1
-:10978000686569676874206F662074686520696D14
-:1097900061676520696E20706978656C732E0A00B8
-:1097A000557365206765745F706978656C28782CDF
-:1097B00020792920746F2072657475726E20746828
-:1097C0006520696D616765277320627269676874D7
-:1097D0006E657373206174204C4544207069786510
-:1097E0006C2028782C79292E0A4272696768746E79
-:1097F0006573732063616E2062652066726F6D20F1
-:109800003020284C4544206973206F6666292074F7
-:109810006F203920286D6178696D756D204C454445
-:10982000206272696768746E657373292E0A005529
-:109830007365207365745F706978656C28782C2077
-:10984000792C20622920746F2073657420746865F8
-:10985000204C454420706978656C2028782C792943
-:1098600020696E2074686520696D61676520746F7A
-:10987000206272696768746E6573730A27622720B5
-:1098800077686963682063616E2062652073657420
-:10989000206265747765656E203020286F666629C2
-:1098A00020746F2039202866756C6C20627269679D
-:1098B00068746E657373292E0A005573652073688A
-:1098C0006966745F6C65667428692920746F206D01
-:1098D000616B65206120636F7079206F662074680A
-:1098E0006520696D61676520627574206D6F7665AE
-:1098F000642027692720706978656C7320746F2055
-:10990000746865206C6566742E0A00557365207353
-:10991000686966745F726967687428692920746F62
-:10992000206D616B65206120636F7079206F662008
-:1099300074686520696D61676520627574206D6F5C
-:109940007665642027692720706978656C732074B8
-:109950006F0A7468652072696768742E0A0055730F
-:10996000652073686966745F757028692920746F53
-:10997000206D616B65206120636F7079206F6620B8
-:1099800074686520696D61676520627574206D6F0C
-:109990007665642027692720706978656C73207567
-:1099A000702E0A005573652073686966745F646F72
-:1099B000776E28692920746F206D616B65206120A6
-:1099C000636F7079206F662074686520696D6167C8
-:1099D0006520627574206D6F766564202769272085
-:1099E000706978656C7320646F776E2E0A0055730A
-:1099F0006520636F7079282920746F206D616B6515
-:109A00002061206E657720657861637420636F70D4
-:109A100079206F662074686520696D6167652E0A1C
-:109A2000005573652063726F702878312C2079316E
-:109A30002C2078322C2079322920746F206D616BB4
-:109A4000652061206375742D6F757420636F707964
-:109A5000206F662074686520696D6167652077688E
-:109A600065726520636F6F7264696E6174650A2840
-:109A700078312C7931292069732074686520746FDE
-:109A800070206C65667420636F726E6572206F66FD
-:109A900020746865206375742D6F7574206172651C
-:109AA0006120616E6420636F6F7264696E617465BA
-:109AB000202878322C793229206973207468650A4D
-:109AC000626F74746F6D20726967687420636F725F
-:109AD0006E65722E0A0055736520696E7665727424
-:109AE000282920746F206D616B652061206E656789
-:109AF000617469766520636F7079206F6620746881
-:109B00006520696D6167652E205768657265206103
-:109B100020706978656C207761732062726967686C
-:109B200074206F720A6F6E20696E20746865206FF2
-:109B3000726967696E616C2C206974206973206496
-:109B4000696D206F72206F666620696E207468658B
-:109B5000206E6567617469766520636F70792E0A7F
-:109B600000436F6D6D756E6963617465207769740C
-:109B70006820612073657269616C20646576696331
-:109B80006520636F6E6E656374656420746F206D0D
-:109B90006963726F3A626974277320492F4F20708E
-:109BA000696E732E0A0055736520696E69742829E1
-:109BB00020746F2073657420757020636F6D6D75F0
-:109BC0006E69636174696F6E2E20557365207069CC
-:109BD0006E732030202854582920616E6420312073
-:109BE0002852582920776974682061206261756461
-:109BF0000A72617465206F6620393630302E0A4F44
-:109C00007665727269646520746865206465666152
-:109C1000756C747320666F7220276261756472615F
-:109C20007465272C20277061726974792720616E12
-:109C300064202770696E73272E0A004966207468B5
-:109C40006572652061726520696E636F6D696E670C
-:109C500020636861726163746572732077616974EF
-:109C6000696E6720746F20626520726561642C20C4
-:109C7000616E7928292077696C6C20726574757221
-:109C80006E20547275652E0A4F7468657277697319
-:109C9000652C2072657475726E732046616C7365F5
-:109CA0002E0A005573652072656164282920746F3F
-:109CB00020726561642063686172616374657273A8
-:109CC0002E0A5573652072656164286E2920746FB1
-:109CD00020726561642C206174206D6F73742C2078
-:109CE000276E27206279746573206F662064617423
-:109CF000612E0A005573652072656164616C6C2881
-:109D00002920746F2072656164206173206D756312
-:109D100068206461746120617320706F737369627D
-:109D20006C652E0A0055736520726561646C696EFE
-:109D300065282920746F20726561642061206C6938
-:109D40006E65207468617420656E64732077697431
-:109D5000682061206E65776C696E6520636861724A
-:109D600061637465722E0A005573652072656164C3
-:109D7000696E746F286275662920746F2072656140
-:109D80006420627974657320696E746F20746865ED
-:109D9000206275666665722027627566272E0A55F1
-:109DA00073652072656164696E746F28627566669A
-:109DB0002C206E2920746F20726561642C206174E0
-:109DC000206D6F73742C20276E27206E756D626571
-:109DD00072206F6620627974657320696E746F20DB
-:109DE00027627566272E0A0055736520777269749D
-:109DF00065286275662920746F2077726974652002
-:109E000074686520627974657320696E2062756676
-:109E100066657220276275662720746F20746865F6
-:109E200020636F6E6E656374656420646576696334
-:109E3000652E0A00436F6D6D756E696361746520F0
-:109E40007573696E6720612073657269616C20703B
-:109E500065726970686572616C20696E746572669E
-:109E600061636520285350492920646576696365DC
-:109E700020636F6E6E656374656420746F0A6D692C
-:109E800063726F3A626974277320492F4F2070699B
-:109E90006E732E0A0055736520696E697428292037
-:109EA000746F2073657420757020636F6D6D756EAF
-:109EB00069636174696F6E2E204F76657272696492
-:109EC00065207468652064656661756C74732066CE
-:109ED0006F722062617564726174652C206D6F64AD
-:109EE000652C0A53434C4B2C204D4F534920616E37
-:109EF00064204D49534F2E20546865206465666187
-:109F0000756C7420636F6E6E656374696F6E732019
-:109F10006172652070696E313320666F7220534321
-:109F20004C4B2C2070696E313520666F720A4D4F94
-:109F3000534920616E642070696E313420666F72FF
-:109F4000204D49534F2E0A0055736520777269746E
-:109F500065286275662920746F20777269746520A0
-:109F6000627974657320696E206275666665722019
-:109F7000276275662720746F2074686520636F6E92
-:109F80006E6563746564206465766963652E0A0096
-:109F90005573652072656164286E2920746F207284
-:109FA00065616420276E27206279746573206F666F
-:109FB00020646174612E0A0055736520777269749C
-:109FC000655F72656164696E746F286F75742C20AB
-:109FD000696E2920746F20777269746520746865D2
-:109FE00020276F7574272062756666657220746F0E
-:109FF0002074686520636F6E6E65637465642064A9
-:10A0000065766963650A616E6420726561642061CA
-:10A010006E7920726573706F6E736520696E746FF0
-:10A02000207468652027696E2720627566666572F0
-:10A030002E20546865206C656E677468206F6620FA
-:10A0400074686520627566666572732073686F75E3
-:10A050006C640A6265207468652073616D652E20EA
-:10A0600054686520627566666572732063616E2050
-:10A070006265207468652073616D65206F626A6532
-:10A0800063742E0A00506C756720696E206120731E
-:10A090007065616B657220776974682063726F63A5
-:10A0A0006F64696C6520636C69707320616E6420F5
-:10A0B0006D616B65206D6963726F3A6269742067C8
-:10A0C0006F20626C65657020616E6420626C6F6FDA
-:10A0D000702E0A00557365207365745F74656D702A
-:10A0E0006F286E756D6265722C2062706D29207408
-:10A0F0006F206D616B6520612062656174206C6109
-:10A100007374206120276E756D62657227206F66FB
-:10A11000207469636B73206C6F6E6720616E640AD4
-:10A12000706C61796564206174202762706D2720EE
-:10A13000626561747320706572206D696E757465F7
-:10A140002E0A00557365207069746368286672650D
-:10A15000712C206C656E6774682920746F206D61A6
-:10A160006B65206D6963726F3A62697420706C610F
-:10A17000792061206E6F7465206174202766726596
-:10A180007127206672657175656E637920666F72DE
-:10A190000A276C656E67746827206D696C6C69733B
-:10A1A00065636F6E64732E20452E672E2070697470
-:10A1B0006368283434302C203130303029207769DE
-:10A1C0006C6C20706C617920636F6E6365727420B3
-:10A1D00027412720666F722031207365636F6E649C
-:10A1E0002E0A0055736520706C6179286D7573694E
-:10A1F000632920746F206D616B65206D6963726FD8
-:10A200003A62697420706C617920276D7573696397
-:10A2100027206C697374206F66206E6F7465732ECF
-:10A2200020547279206F7574207468650A627569AC
-:10A230006C7420696E206D7573696320746F207370
-:10A24000656520686F7720697420776F726B732E55
-:10A2500020452E672E206D757369632E706C6179B1
-:10A26000286D757369632E50554E43484C494E45D1
-:10A27000292E0A00557365206765745F74656D70DB
-:10A280006F282920746F2072657475726E2074684F
-:10A2900065206E756D626572206F66207469636BF0
-:10A2A0007320696E2061206265617420616E642094
-:10A2B0006E756D626572206F662062656174730AE7
-:10A2C000706572206D696E7574652E0A0055736530
-:10A2D00020746F2073746F70282920746865206D56
-:10A2E00075736963207468617420697320706C6190
-:10A2F00079696E672E0A004966207468696E677313
-:10A3000020676F2077726F6E672C2072657365749B
-:10A31000282920746865206D7573696320746F2027
-:10A320006974732064656661756C742073657474F8
-:10A33000696E67732E0A005365653A2068747470FD
-:10A340003A2F2F786B63642E636F6D2F3335332F65
-:10A350000A00546865205A656E206F662050797433
-:10A36000686F6E20646566696E65732077686174D6
-:10A3700020697420697320746F206265205079749D
-:10A38000686F6E69632E20497420776F756C646EF8
-:10A39000277420666974206F6E20746869730A647C
-:10A3A000657669636520736F20776527766520770A
-:10A3B00072697474656E2061205A656E206F662024
-:10A3C0004D6963726F507974686F6E20696E737433
-:10A3D0006561642E0A0055736520617574686F723B
-:10A3E00073282920746F2072657665616C2074680B
-:10A3F00065206E616D6573206F66207468652070DE
-:10A40000656F706C652077686F2063726561746535
-:10A4100064207468697320736F6674776172652E47
-:10A420000A00416C6C20796F75206E6565642E2082
-:10A43000557365206C6F76652E62616461626F6F23
-:10A440006D282920746F20726570656174207468AE
-:10A4500065206566666563742E0A00486561722032
-:10A460006D7920736F756C20737065616B3A0A5457
-:10A470006865207665727920696E7374616E7420E8
-:10A480007468617420492073617720796F752C207E
-:10A490006469640A4D7920686561727420666C791C
-:10A4A00020746F20796F75722073657276696365A9
-:10A4B0002E0A0073747265616D206F70657261742D
-:10A4C000696F6E206E6F7420737570706F72746533
-:10A4D00064004F7574206F66206D656D6F72790032
-:10A4E0006F7574206F66206D656D6F7279004D75A4
-:10A4F000737420626520616E20417564696F4275D6
-:10A500006666657200696E646578206F7574206F89
-:10A510006620626F756E64730043616E6E6F7420A7
-:10A5200064656C65746520656C656D656E7473201B
-:10A530006F6620417564696F4672616D6500766172
-:10A540006C7565206F7574206F662072616E67652B
-:10A5500000416C6C6F636174696F6E20696E206975
-:10A560006E746572727570742068616E646C657269
-:10A57000006E6F7420616E20417564696F46726170
-:10A580006D650043616E6E6F742073657420726533
-:10A590007475726E5F70696E20776974686F757418
-:10A5A0002070696E00696E76616C696420636F6CFF
-:10A5B0006F757200696E76616C6964206E756D628C
-:10A5C0006572206F6620706978656C7300696E76BD
-:10A5D000616C696420676573747572650076616C7F
-:10A5E0007565206D7573742062652030206F722050
-:10A5F000310076616C7565206D757374206265201D
-:10A600006265747765656E203020616E642031303C
-:10A61000323300696E76616C696420706572696FAF
-:10A620006400657870656374696E67206120706985
-:10A630006E006E6F7420616E20696D6167652E001B
-:10A64000696E646578206F7574206F6620626F751F
-:10A650006E64732E006272696768746E657373202E
-:10A660006F7574206F6620626F756E64732E0000C4
-:10A6700000040202040200000204040400020200BA
-:10A6800004040301000001030303000101020303AA
-:10A69000040201010301040301000300000401019D
-:10A6A00002000003024D6963726F507974686F6E27
-:10A6B000206F6E20746865206D6963726F3A6269FD
-:10A6C000742069732062726F7567687420746F20DC
-:10A6D000796F752062793A0A44616D69656E205020
-:10A6E0002E2047656F7267652C204D61726B205379
-:10A6F00068616E6E6F6E2C205261646F6D6972209E
-:10A70000446F70696572616C736B692C204D617464
-:10A710007468657720456C73652C0A4361726F6CB1
-:10A720002057696C6C696E672C20546F6D205669D8
-:10A730006E65722C20416C616E204A61636B736F91
-:10A740006E2C204E69636B20436F67686C616E2CC2
-:10A75000204A6F7365706820486169672C0A416CF4
-:10A760006578204368616E2C20416E6472656120BB
-:10A770004772616E64692C205061756C2045676179
-:10A780006E2C2050696F7472204B617370727A79ED
-:10A790006B2C20416E64726577204D756C686F6C10
-:10A7A0006C616E642C0A4D61747420576865656C29
-:10A7B00065722C204A6F6520476C616E63792C208E
-:10A7C00041626269652042726F6F6B7320616E64D3
-:10A7D000204E6963686F6C617320482E20546F6C43
-:10A7E0006C65727665792E0A00546865205A656E2C
-:10A7F000206F66204D6963726F507974686F6E2C9C
-:10A80000206279204E6963686F6C617320482E2046
-:10A81000546F6C6C65727665790A0A436F64652CB7
-:10A820000A4861636B2069742C0A4C657373206954
-:10A8300073206D6F72652C0A4B65657020697420FA
-:10A8400073696D706C652C0A536D616C6C20697353
-:10A850002062656175746966756C2C0A0A42652010
-:10A8600062726176652120427265616B207468694D
-:10A870006E677321204C6561726E20616E64206882
-:10A880006176652066756E210A457870726573730E
-:10A8900020796F757273656C662077697468204DD6
-:10A8A0006963726F507974686F6E2E0A0A4861701E
-:10A8B0007079206861636B696E6721203A2D290ADF
-:10A8C0000008080808080808080020202020202088
-:10A8D0002020002B2D786B63642E636F6D2F333532
-:10A8E00033B32D2B0A7CC0207C0A7CB4205C302F33
-:10A8F00089207C0A7CB2202F83205C89207C0A7C02
-:10A900008820596F7527726520666C79696E67219A
-:10A9100092204D6963726F507974686F6E212020A8
-:10A920002F7C88207C0A7C8C20486F773FA6205C97
-:10A93000205C87207C0A7C8C202FB3207C0A7C8AB8
-:10A940002030B5207C0A7C89202F7C5CB4207C0AD6
-:10A950007C8A207CB5207C0A7C852D845F2F5F5CFF
-:10A960009E5F962D7C0A7CC0207C0A2BC02D2B0A72
-:10A970000001000100E2ECF0F4F8FC0004726164F4
-:10A98000696F206973206E6F7420656E61626C65FB
-:10A990006400617267756D656E7473206D75737494
-:10A9A000206265206B6579776F72642061726775CC
-:10A9B0006D656E747300756E6B6E6F776E2061726D
-:10A9C00067756D656E7420272571270076616C753B
-:10A9D00065206F7574206F662072616E67652066F2
-:10A9E0006F7220617267756D656E742027257127FF
-:10A9F000007265636569766564207061636B657478
-:10AA0000206973206E6F74206120737472696E67A1
-:10AA100000696E6465782063616E6E6F7420626594
-:10AA2000206E6567617469766500696E646578207B
-:10AA3000746F6F206C617267650054686973206978
-:10AA40006D6167652063616E6E6F74206265206D55
-:10AA50006F6469666965642E2054727920636F7033
-:10AA600079696E672069742066697273742E004973
-:10AA70006D61676528000A2020202000270A202019
-:10AA800020202700303132333435363738390055FD
-:10AA90006E65787065637465642063686172616374
-:10AAA00074657220696E20496D6167652064656612
-:10AAB000696E6974696F6E2E00696D6167652064E7
-:10AAC00061746120697320696E636F72726563746B
-:10AAD0002073697A6500496D616765282920746172
-:10AAE0006B6573203020746F203320617267756D41
-:10AAF000656E747300496D61676528732920746100
-:10AB00006B6573206120737472696E672E004272E8
-:10AB1000696768746E657373206D756C7469706CA9
-:10AB2000696572206D757374206E6F742062652084
-:10AB30006E656761746976652E00496D616765733E
-:10AB4000206D757374206265207468652073616D73
-:10AB5000652073697A652E0049324320726561640D
-:10AB6000206661696C65642077697468206572721B
-:10AB70006F7220636F64652025640049324320773B
-:10AB800072697465206661696C65642077697468B0
-:10AB9000206572726F7220636F6465202564003ACD
-:10ABA000257000772B002F737464696E002F737407
-:10ABB00064657272002F7374646F7574004F6E6CED
-:10ABC000792038626974732053504920737570700E
-:10ABD0006F727465640053504920666F726D6174C2
-:10ABE000206572726F72004E6F20617661696C61D0
-:10ABF000626C6520535049004E6F20617661696C2C
-:10AC000061626C65204932430000000000000808C2
-:10AC10000800080A4A4000000A5FEA5FEA0ED92EDF
-:10AC2000D36E19324489330C924C924D08080000BF
-:10AC30000004880808040804848488000A448A40C0
-:10AC400000048EC480000000048800000EC00000D4
-:10AC50000000080001224488100C9252524C048CCF
-:10AC600084848E1C824C901E1EC244924C06CA5292
-:10AC70005FE21FF01EC13E02448ED12E1FE24488C7
-:10AC8000100ED12ED12E0ED12EC48800080008003F
-:10AC900000048004880244880482000EC00EC008AC
-:10ACA000048244880ED126C0040ED135B36C0C92B8
-:10ACB0005ED2521C925C925C0ED010100E1C92520E
-:10ACC000525C1ED01C901E1ED01C90100ED0137112
-:10ACD0002E12525ED2521C8808081C1FE242524CAF
-:10ACE0001254981492101010101E113B75B13111AE
-:10ACF0003935B3710C9252524C1C925C90100C92EC
-:10AD0000524C861C925C92510ED00C825C1FE484E3
-:10AD10008484125252524C1131312A44113135BBC4
-:10AD20007112524C9252112A4484841EC488101EFF
-:10AD30000EC808080E10080482410EC242424E049A
-:10AD40008A400000000000001F0804800000000E80
-:10AD5000D2524F10101C925C000ED0100E02424EC8
-:10AD6000D24E0C925C900E06C81C88080ED24EC2C1
-:10AD70004C10101C92520800080808024002424C75
-:10AD800010149814920808080806001B75B13100C9
-:10AD90001C925252000C92524C001C925C90000E7D
-:10ADA000D24EC2000ED010100006C8049808080E3B
-:10ADB000C807001252524F0011312A440011313598
-:10ADC000BB00124C8C9200112A4498001EC4881EAD
-:10ADD00006C48C8486080808080818080C8818001F
-:10ADE000000C83607A76677074756F6965617A7636
-:10ADF000677074756F6965617A76677074010000B9
-:10AE00000200000300000401000402000403000328
-:10AE1000040002040001040000030000020000011D
-:10AE200000302C3235352C302C3235352C300A3070
-:10AE30002C3235352C302C3235352C300A302C3034
-:10AE40002C302C302C300A3235352C302C302C3034
-:10AE50002C3235350A302C3235352C3235352C3202
-:10AE600035352C300A004452415720412043495285
-:10AE7000434C4500312E342E3139000200040108C4
-:10AE800002000004020204020000020404040002A2
-:10AE90000200040403010000010303030001010296
-:10AEA0000303040201010301040301000300000481
-:10AEB000010102000003021B1B000E110000000034
-:10AEC0006261642068616E646C6520746F20756EC9
-:10AED0006465726C79696E67207472616E73706FED
-:10AEE00072740050776D4F75742070696E206D61BB
-:10AEF0007070696E67206661696C65642E20416CB4
-:10AF00006C20617661696C61626C652050574D20E0
-:10AF10006368616E6E656C732061726520696E2076
-:10AF20007573652E00636F756C64206E6F7420708E
-:10AF3000696E6F75740070696E6D6170206D6973F4
-:10AF40002D6D617463680070696E6D6170206E6F45
-:10AF50007420666F756E6420666F7220706572690A
-:10AF600070686572616C0070696E6D6170206E6FE3
-:10AF70007420666F756E6420666F722066756E63EE
-:10AF800074696F6E00232D302B2000686C4C0065B7
-:10AF90006667454647003031323334353637383905
-:10AFA0004142434445460030313233343536373838
-:10AFB0003961626364656600412D46612D663839EA
-:10AFC00030313233343536375D002B2D00303000D0
-:10AFD0007858000020202020202020202028282809
-:10AFE0002828202020202020202020202020202051
-:10AFF0002020202088101010101010101010101099
-:10B0000010101010040404040404040404041010B8
-:10B010001010101010414141414141010101010155
-:10B020000101010101010101010101010101011001
-:10B03000101010101042424242424202020202022A
-:10B0400002020202020202020202020202020210D2
-:10B0500010101020000000000000000000000000A0
-:10B0600000000000000000000000000000000000E0
-:10B0700000000000000000000000000000000000D0
-:10B0800000000000000000000000000000000000C0
-:10B0900000000000000000000000000000000000B0
-:10B0A00000000000000000000000000000000000A0
-:10B0B0000000000000000000000000000000000090
-:10B0C0000000000000000000000000000000000080
-:10B0D000000000001000000000000000017A520093
-:10B0E000027C0E011B0C0D00100000001800000077
-:10B0F000D402FFFF14000000000000000000000068
-:10B100007450FC7F010000000000000009320200C2
-:10B110000932020009320200000000001000002085
-:10B12000E20400002F2F0300E803000010070300D3
-:10B13000000000000000000000000000000000000F
-:10B1400000000000000000000000010000000000FE
-:10B1500000000000000000000000000000000000EF
-:10B16000000000002C080300440D03000000000054
-:10B17000000000000000000074130300442A0020B7
-:10B1800000000000741303006C2A0020000000007F
-:10B19000D82F002009AC030000000000841E03002B
-:10B1A000A41E0300C41E03000000000000000000F5
-:10B1B000000000000000000007AC030000000000D9
-:10B1C000000000000000000000000000000000007F
-:10B1D000000000000000000000000000000000006F
-:10B1E000000000000000000000000000000000005F
-:10B1F000000000000000000090000020D3AF03001A
-:10B20000780004000404881301000100010001011A
-:10B21000010302040100000039010000BD610100CA
-:10B220007D780100B57F01009D8F01000D010000B8
-:04000005000153891A
-:00000001FF
-"""
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains a microbenchmark for uflash's conversion of scripts to
+and from Intel HEX records, comparing hexlify and unhexlify with the record at
+a time versions they replaced (kept here as hexlify_records and
+unhexlify_records). For example::
+
+    from mu.contrib import uflashbench
+
+    print(uflashbench.report(uflashbench.run()))
+
+It's also available from the command line as
+'python -m mu.contrib.uflashbench'.
+"""
+from __future__ import print_function
+import binascii
+import struct
+import timeit
+from collections import namedtuple
+from mu.contrib import uflash
+
+
+__all__ = ['run', 'report', 'Result']
+
+
+#: The sizes, in bytes, of the scripts converted.
+DEFAULT_SIZES = (128, 1024, 8000)
+
+
+#: How many times each conversion is repeated.
+DEFAULT_REPEAT = 200
+
+
+#: A single measurement: the average seconds per call of the record at a
+#: time and batched versions of the operation.
+Result = namedtuple('Result', ['operation', 'size', 'records_seconds',
+                               'batched_seconds'])
+
+
+def hexlify_records(script):
+    """
+    The record at a time version of uflash.hexlify.
+    """
+    if not script:
+        return ''
+    script = script.replace(b'\r\n', b'\n')
+    script = script.replace(b'\r', b'\n')
+    data = b'MP' + struct.pack('<H', len(script)) + script
+    data = data + (b'\x00' * (16 - len(data) % 16))
+    output = [':020000040003F7']
+    addr = uflash._SCRIPT_ADDR
+    for i in range(0, len(data), 16):
+        chunk = data[i:min(i + 16, len(data))]
+        chunk = struct.pack('>BHB', len(chunk), addr & 0xffff, 0) + chunk
+        checksum = (-(sum(bytearray(chunk)))) & 0xff
+        hexline = ':%s%02X' % (uflash.strfunc(binascii.hexlify(chunk)).upper(),
+                               checksum)
+        output.append(hexline)
+        addr += 16
+    return '\n'.join(output)
+
+
+def unhexlify_records(blob):
+    """
+    The record at a time version of uflash.unhexlify.
+    """
+    lines = blob.split('\n')[1:]
+    output = []
+    for line in lines:
+        output.append(binascii.unhexlify(line[9:-2]))
+    output[0] = output[0][4:]
+    output[-1] = output[-1].strip(b'\x00')
+    return b''.join(output).decode('utf-8')
+
+
+def script_of(size):
+    """
+    Returns a script of the given size in bytes (bar its header and padding).
+    """
+    line = b'display.scroll("Hello, World!")\n'
+    return (line * (size // len(line) + 1))[:size]
+
+
+def run(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT):
+    """
+    Times both versions of hexlify and unhexlify on scripts of each size,
+    checking they agree. Returns a list of Results.
+    """
+    results = []
+    for size in sizes:
+        script = script_of(size)
+        blob = uflash.hexlify(script)
+        assert blob == hexlify_records(script)
+        assert uflash.unhexlify(blob) == unhexlify_records(blob)
+        for name, old, new, argument in (
+                ('hexlify', hexlify_records, uflash.hexlify, script),
+                ('unhexlify', unhexlify_records, uflash.unhexlify, blob)):
+            old_seconds = timeit.timeit(lambda: old(argument), number=repeat)
+            new_seconds = timeit.timeit(lambda: new(argument), number=repeat)
+            results.append(Result(name, size, old_seconds / repeat,
+                                  new_seconds / repeat))
+    return results
+
+
+def report(results):
+    """
+    Returns a table of the results, as text.
+    """
+    lines = ['{:<10} {:>6} {:>12} {:>12} {:>8}'.format(
+        'operation', 'size', 'records (us)', 'batched (us)', 'speedup')]
+    for result in results:
+        lines.append('{:<10} {:>6} {:>12.1f} {:>12.1f} {:>7.1f}x'.format(
+            result.operation, result.size, result.records_seconds * 1e6,
+            result.batched_seconds * 1e6,
+            result.records_seconds / result.batched_seconds))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    print(report(run()))
@@ -21,15 +21,15 @@ import keyword
 import os
 import re
 import logging
-from PyQt5.QtCore import QSize, Qt, pyqtSignal, QIODevice
+from PyQt5.QtCore import QSize, Qt, pyqtSignal
 from PyQt5.QtWidgets import (QToolBar, QAction, QStackedWidget, QDesktopWidget,
                              QWidget, QVBoxLayout, QShortcut, QSplitter,
                              QTabWidget, QFileDialog, QMessageBox, QTextEdit,
-                             QFrame, QListWidget, QGridLayout, QLabel, QMenu)
+                             QFrame, QListWidget, QGridLayout, QLabel, QMenu,
+                             QListWidgetItem)
 from PyQt5.QtGui import QKeySequence, QColor, QTextCursor, QFontDatabase
 from PyQt5.Qsci import QsciScintilla, QsciLexerPython, QsciAPIs
-from PyQt5.QtSerialPort import QSerialPort
-from mu.contrib import microfs
+from mu.contrib import broker, microfs, transports
 from mu.resources import load_icon, load_stylesheet, load_font_data
 
 
@@ -39,6 +39,8 @@ DEFAULT_FONT_SIZE = 14
 FONT_NAME = "Source Code Pro"
 FONT_FILENAME_PATTERN = "SourceCodePro-{variant}.otf"
 FONT_VARIANTS = ("Bold", "BoldIt", "It", "Regular", "Semibold", "SemiboldIt")
+#: Seconds a file system operation on the device may take before giving up.
+FS_TIMEOUT = 30
 
 # Load the two themes from resources/css/[night|day].css
 #: NIGHT_STYLE is a dark high contrast theme.
@@ -430,6 +432,8 @@ class Window(QStackedWidget):
 
     title = "Mu"
     icon = "icon"
+    _fs_session = None
+    baudrate = transports.BAUDRATE
 
     _zoom_in = pyqtSignal(int)
     _zoom_out = pyqtSignal(int)
@@ -536,11 +540,35 @@ class Window(QStackedWidget):
                 return True
         return False
 
+    @property
+    def fs_session(self):
+        """
+        The broker that owns the connection to the device, shared by the REPL
+        and everything to do with the device's file system. It lives as long
+        as the window so moving between the panes never reconnects, and the
+        device's file listing stays cached between uses of the file system
+        pane. An unresponsive device is given up on after FS_TIMEOUT seconds
+        rather than freezing the editor.
+        """
+        if self._fs_session is None:
+            self._fs_session = broker.SerialBroker(
+                timeout=FS_TIMEOUT, baudrate=self.baudrate)
+        return self._fs_session
+
+    def set_baudrate(self, baudrate):
+        """
+        Sets the baud rate the REPL and file system panes talk to the device
+        at.
+        """
+        self.baudrate = baudrate
+        if self._fs_session is not None:
+            self._fs_session.baudrate = baudrate
+
     def add_filesystem(self, home):
         """
         Adds the file system pane to the application.
         """
-        self.fs = FileSystemPane(self.splitter, home)
+        self.fs = FileSystemPane(self.splitter, home, self.fs_session)
         self.splitter.addWidget(self.fs)
         self.splitter.setSizes([66, 33])
         self.fs.setFocus()
@@ -549,8 +577,13 @@ class Window(QStackedWidget):
     def add_repl(self, repl):
         """
         Adds the REPL pane to the application.
+
+        Code run in the REPL may change the files on the device, so the
+        cached file listing is forgotten.
         """
-        self.repl = REPLPane(port=repl.port, clipboard=self.clipboard, theme=self.theme)
+        self.fs_session.invalidate()
+        self.repl = REPLPane(self.fs_session, clipboard=self.clipboard,
+                             theme=self.theme)
         self.splitter.addWidget(self.repl)
         self.splitter.setSizes([66, 33])
         self.repl.setFocus()
@@ -558,7 +591,8 @@ class Window(QStackedWidget):
 
     def remove_filesystem(self):
         """
-        Removes the file system pane from the application.
+        Removes the file system pane from the application. The connection to
+        the device stays open for the REPL.
         """
         self.fs.setParent(None)
         self.fs.deleteLater()
@@ -566,8 +600,10 @@ class Window(QStackedWidget):
 
     def remove_repl(self):
         """
-        Removes the REPL pane from the application.
+        Removes the REPL pane from the application. The connection to the
+        device stays open for the file system pane.
         """
+        self.repl.broker.unlisten()
         self.repl.setParent(None)
         self.repl.deleteLater()
         self.repl = None
@@ -720,30 +756,30 @@ class REPLPane(QTextEdit):
     REPL = Read, Evaluate, Print, Loop.
 
     This widget represents a REPL client connected to a BBC micro:bit running
-    MicroPython.
+    MicroPython, through the broker that owns the connection to it.
 
     The device MUST be flashed with MicroPython for this to work.
     """
 
-    def __init__(self, port, clipboard, theme='day', parent=None):
+    #: Emitted (in the main thread) with the bytes the device sends.
+    data_received = pyqtSignal(bytes)
+
+    def __init__(self, broker, clipboard, theme='day', parent=None):
         super().__init__(parent)
         self.clipboard = clipboard
         self.setFont(Font().load())
         self.setAcceptRichText(False)
         self.setReadOnly(False)
         self.setObjectName('replpane')
-        # open the serial port
-        self.serial = QSerialPort(self)
-        self.serial.setPortName(port)
-        if self.serial.open(QIODevice.ReadWrite):
-            self.serial.setBaudRate(115200)
-            self.serial.readyRead.connect(self.on_serial_read)
-            # clear the text
-            self.clear()
-            # Send a Control-C
-            self.serial.write(b'\x03')
-        else:
-            raise IOError("Cannot connect to device on port {}".format(port))
+        self.broker = broker
+        self.data_received.connect(self.process_bytes)
+        # clear the text
+        self.clear()
+        # The broker calls back from its own thread, so hand the data over
+        # with a signal.
+        self.broker.listen(self.data_received.emit)
+        # Send a Control-C
+        self.broker.write(b'\x03')
         self.set_theme(theme)
 
     def set_theme(self, theme):
@@ -755,12 +791,6 @@ class REPLPane(QTextEdit):
         else:
             self.setStyleSheet(NIGHT_STYLE)
 
-    def on_serial_read(self):
-        """
-        Called when the application gets data from the connected device.
-        """
-        self.process_bytes(bytes(self.serial.readAll()))
-
     def keyPressEvent(self, data):
         """
         Called when the user types something in the REPL.
@@ -787,11 +817,11 @@ class REPLPane(QTextEdit):
         #     # that it's different on other platforms.
         #     # see http://doc.qt.io/qt-5/qt.html#KeyboardModifier-enum
             if key == Qt.Key_V:
-                msg = self.clipboard.text()
+                msg = bytes(self.clipboard.text(), 'utf8')
             elif Qt.Key_A <= key <= Qt.Key_Z:
         #         # The microbit treats an input of \x01 as Ctrl+A, etc.
                  msg = bytes([1 + key - Qt.Key_A])
-        self.serial.write(msg)
+        self.broker.write(msg)
 
     def process_bytes(self, bs):
         """
@@ -884,9 +914,10 @@ class MicrobitFileList(MuFileList):
     Represents a list of files on the micro:bit.
     """
 
-    def __init__(self, home):
+    def __init__(self, home, session=None):
         super().__init__()
         self.home = home
+        self.session = session or microfs.MicroFSSession()
         self.setDragDropMode(QListWidget.DragDrop)
 
     def dropEvent(self, event):
@@ -897,9 +928,7 @@ class MicrobitFileList(MuFileList):
                                           source.currentItem().text())
             logger.info("Putting {}".format(local_filename))
             try:
-                with microfs.get_serial() as serial:
-                    logger.info(serial.port)
-                    microfs.put(serial, local_filename)
+                self.session.put(local_filename)
                 super().dropEvent(event)
             except Exception as ex:
                 logger.error(ex)
@@ -915,9 +944,7 @@ class MicrobitFileList(MuFileList):
             microbit_filename = self.currentItem().text()
             logger.info("Deleting {}".format(microbit_filename))
             try:
-                with microfs.get_serial() as serial:
-                    logger.info(serial.port)
-                    microfs.rm(serial, microbit_filename)
+                self.session.rm(microbit_filename)
                 self.takeItem(self.currentRow())
             except Exception as ex:
                 logger.error(ex)
@@ -930,9 +957,10 @@ class LocalFileList(MuFileList):
     Represents a list of files in the Mu directory on the local machine.
     """
 
-    def __init__(self, home):
+    def __init__(self, home, session=None):
         super().__init__()
         self.home = home
+        self.session = session or microfs.MicroFSSession()
         self.setDragDropMode(QListWidget.DragDrop)
 
     def dropEvent(self, event):
@@ -945,9 +973,7 @@ class LocalFileList(MuFileList):
             logger.debug("Getting {} to {}".format(microbit_filename,
                                                    local_filename))
             try:
-                with microfs.get_serial() as serial:
-                    logger.info(serial.port)
-                    microfs.get(serial, microbit_filename, local_filename)
+                self.session.get(microbit_filename, local_filename)
                 super().dropEvent(event)
             except Exception as ex:
                 logger.error(ex)
@@ -959,14 +985,18 @@ class FileSystemPane(QFrame):
     Contains two QListWidgets representing the micro:bit and the user's code
     directory. Users transfer files by dragging and dropping. Highlighted files
     can be selected for deletion.
+
+    Both lists share a single connection to the device (and its cached file
+    listing) for the lifetime of the pane.
     """
 
-    def __init__(self, parent, home):
+    def __init__(self, parent, home, session=None):
         super().__init__(parent)
         self.home = home
         self.font = Font().load()
-        microbit_fs = MicrobitFileList(home)
-        local_fs = LocalFileList(home)
+        self.session = session or microfs.MicroFSSession()
+        microbit_fs = MicrobitFileList(home, self.session)
+        local_fs = LocalFileList(home, self.session)
         layout = QGridLayout()
         self.setLayout(layout)
         microbit_label = QLabel()
@@ -986,15 +1016,22 @@ class FileSystemPane(QFrame):
 
     def ls(self):
         """
-        Gets a list of the files on the micro:bit.
-
-        Naive implementation for simplicity's sake.
+        Gets a list of the files on the micro:bit, along with their sizes and
+        the free space. These come from the session's cached listing, so the
+        device is only asked if nothing is cached.
         """
         self.microbit_fs.clear()
         self.local_fs.clear()
-        microbit_files = microfs.ls(microfs.get_serial())
-        for f in microbit_files:
-            self.microbit_fs.addItem(f)
+        microbit_files, free = self.session.details()
+        if free is None:
+            self.microbit_label.setText('Files on your micro:bit:')
+        else:
+            self.microbit_label.setText(
+                'Files on your micro:bit ({} bytes free):'.format(free))
+        for f in sorted(microbit_files):
+            item = QListWidgetItem(f)
+            item.setToolTip('{} bytes'.format(microbit_files[f]))
+            self.microbit_fs.addItem(item)
         local_files = [f for f in os.listdir(self.home)
                        if os.path.isfile(os.path.join(self.home, f))]
         local_files.sort()
@@ -27,18 +27,17 @@ import logging
 import tempfile
 import webbrowser
 from PyQt5.QtWidgets import QMessageBox
-from PyQt5.QtSerialPort import QSerialPortInfo
 from pyflakes.api import check
 from pycodestyle import StyleGuide, Checker
-from mu.contrib import uflash, appdirs, microfs
+from mu.contrib import uflash, appdirs, discovery, microfs, transports
 from mu import __version__
 import time
 
 
 #: USB product ID.
-MICROBIT_PID = 516
+MICROBIT_PID = discovery.MICROBIT_PID
 #: USB vendor ID.
-MICROBIT_VID = 3368
+MICROBIT_VID = discovery.MICROBIT_VID
 #: The user's home directory.
 HOME_DIRECTORY = os.path.expanduser('~')
 #: The default directory for Python scripts.
@@ -49,6 +48,8 @@ DATA_DIR = appdirs.user_data_dir('mu', 'python')
 LOG_DIR = appdirs.user_log_dir('mu', 'python')
 #: The path to the JSON file containing application settings.
 SETTINGS_FILE = os.path.join(DATA_DIR, 'settings.json')
+#: The baud rate setting that asks for the fastest one the device answers at.
+AUTO_BAUDRATE = 'auto'
 #: The path to the log file for the application.
 LOG_FILE = os.path.join(LOG_DIR, 'mu.log')
 #: Regex to match pycodestyle (PEP8) output.
@@ -62,16 +63,14 @@ logger = logging.getLogger(__name__)
 
 def find_upython_device():
     """
-    TODO - allow option to select which serial port to use.
-    For now, this just returns the first serial port found
+    Returns the port of the connected micro:bit (the one used last time if
+    there are several) or None.
     """
-    available_ports = QSerialPortInfo.availablePorts()
-    try:
-        port = available_ports[0]
-        logger.info('Using port {}'.format(port.portName()))
-        return port.portName()
-    except IndexError:
-        return None
+    port = discovery.find_device()
+    if port:
+        logger.info('Using port {}'.format(port))
+    return port
+
 
 def check_flake(filename, code):
     """
@@ -202,15 +201,11 @@ class REPL:
     """
 
     def __init__(self, port):
-        if os.name == 'posix':
-            # If we're on Linux or OSX reference the port is like this...
-            self.port = "/dev/{}".format(port)
-        elif os.name == 'nt':
-            # On Windows simply return the port (e.g. COM0).
-            self.port = port
-        else:
+        if os.name not in ('posix', 'nt'):
             # No idea how to deal with other OS's so fail.
             raise NotImplementedError('OS not supported.')
+        # Discovery gives the device's full name (e.g. /dev/ttyACM0 or COM0).
+        self.port = port
         logger.info('Created new REPL object with port: {}'.format(self.port))
 
 
@@ -225,6 +220,9 @@ class Editor:
         self.repl = None
         self.fs = None
         self.theme = 'day'
+        self.baudrate = transports.BAUDRATE
+        self.probed = {}
+        self.checked = set()
         self.user_defined_microbit_path = None
         if not os.path.exists(PYTHON_DIRECTORY):
             logger.debug('Creating directory: {}'.format(PYTHON_DIRECTORY))
@@ -245,6 +243,10 @@ class Editor:
                 logger.debug(old_session)
                 if 'theme' in old_session:
                     self.theme = old_session['theme']
+                if 'baudrate' in old_session:
+                    self.baudrate = old_session['baudrate']
+                if 'probed_baudrates' in old_session:
+                    self.probed = old_session['probed_baudrates']
                 if 'paths' in old_session:
                     for path in old_session['paths']:
                         try:
@@ -259,6 +261,35 @@ class Editor:
             self._view.add_tab(None, py)
         self._view.set_theme(self.theme)
 
+    def negotiate_baudrate(self, port):
+        """
+        Works out the baud rate to talk to the device on the port at (and
+        tells the view). If the setting is AUTO_BAUDRATE the fastest rate the
+        device answers at is used, trying the rate found for the port last
+        time first. Unsupported rates, or a device that can't be probed, fall
+        back to the default. Each port is only probed once, since the
+        connection to it is kept open afterwards.
+
+        The probe opens the port itself, so the view's connection to the
+        device is closed first (it's opened again when next used).
+        """
+        if self.baudrate == AUTO_BAUDRATE:
+            if port not in self.checked:
+                self.checked.add(port)
+                self._view.fs_session.close()
+                baudrate = microfs.probe_baudrate(
+                    port, preferred=self.probed.get(port))
+                if baudrate:
+                    self.probed[port] = baudrate
+                else:
+                    self.probed.pop(port, None)
+            baudrate = self.probed.get(port, transports.BAUDRATE)
+        else:
+            baudrate = transports.check_baudrate(self.baudrate)
+        logger.info('Baud rate: {}'.format(baudrate))
+        self._view.set_baudrate(baudrate)
+        return baudrate
+
     def flash(self):
         """
         Takes the currently active tab, compiles the Python script therein into
@@ -273,7 +304,8 @@ class Editor:
         self.save()  # save current script to disk
         logger.debug('Python script file:')
         logger.debug(tab.path)
-        microfs.put(microfs.get_serial(), tab.path)
+        # The session is shared with the REPL, so it mustn't be closed.
+        self._view.fs_session.put(tab.path)
 
     def add_fs(self):
         """
@@ -281,11 +313,12 @@ class Editor:
         """
         if self.repl is None:
             if self.fs is None:
-                try:
-                    microfs.get_serial()
+                mb_port = find_upython_device()
+                if mb_port:
+                    self.negotiate_baudrate(mb_port)
                     self._view.add_filesystem(home=PYTHON_DIRECTORY)
                     self.fs = True
-                except IOError:
+                else:
                     message = 'Could not find an attached BBC micro:bit.'
                     information = ("Please make sure the device is plugged "
                                    "into this computer.\n\nThe device must "
@@ -308,16 +341,16 @@ class Editor:
 
     def toggle_fs(self):
         """
-        If the file system navigator is active enable it. Otherwise hide it.
-        If the REPL is active, display a message.
+        If the file system navigator is active hide it. Otherwise show it,
+        switching from the REPL if that's active (the connection to the device
+        is shared, so there's no need to reconnect).
         """
-        if self.repl is not None:
-            self.remove_repl()
+        if self.fs is None:
+            if self.repl is not None:
+                self.remove_repl()
+            self.add_fs()
         else:
-            if self.fs is None:
-                self.add_fs()
-            else:
-                self.remove_fs()
+            self.remove_fs()
 
     def add_repl(self):
         """
@@ -332,6 +365,7 @@ class Editor:
         mb_port = find_upython_device()
         if mb_port:
             try:
+                self.negotiate_baudrate(mb_port)
                 self.repl = REPL(port=mb_port)
                 self._view.add_repl(self.repl)
                 logger.info('REPL on port: {}'.format(mb_port))
@@ -363,15 +397,15 @@ class Editor:
 
     def toggle_repl(self):
         """
-        If the REPL is active, close it; otherwise open the REPL.
+        If the REPL is active, close it; otherwise open the REPL, switching
+        from the file system navigator if that's active.
         """
-        if self.fs is not None:
-            self.remove_fs()
+        if self.repl is None:
+            if self.fs is not None:
+                self.remove_fs()
+            self.add_repl()
         else:
-            if self.repl is None:
-                self.add_repl()
-            else:
-                self.remove_repl()
+            self.remove_repl()
 
     def toggle_theme(self):
         """
@@ -506,6 +540,8 @@ class Editor:
                 paths.append(widget.path)
         session = {
             'theme': self.theme,
+            'baudrate': self.baudrate,
+            'probed_baudrates': self.probed,
             'paths': paths
         }
         logger.debug(session)
@@ -9,6 +9,8 @@ block_cipher = None
 data_files_glob = glob(os.path.join('mu','resources', 'css', '*.css'))
 data_files_glob += glob(os.path.join('mu', 'resources', 'images', '*.*'))
 data_files_glob += glob(os.path.join('mu', 'resources', 'fonts', '*.*'))
+# The MicroPython runtime used by uflash.
+data_files_glob += glob(os.path.join('mu', 'contrib', '*.gz'))
 data_files = []
 # Paths are a bit tricky: glob works on cwd (project root), pyinstaller relative
 # starts on spec file location, and packed application relative starts on
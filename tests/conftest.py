@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration for the test suite.
+"""
+import sys
+
+
+#: Test modules that can't even be compiled by older versions of Python.
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # async and await need Python 3.5.
+    collect_ignore.append('test_aiomicrofs.py')
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the asyncio file system operations, against a simulated device.
+"""
+import asyncio
+import pytest
+from mu.contrib import aiomicrofs, microfs
+from mu.contrib.microsim import SimulatedDevice
+
+
+def run(coroutine):
+    """
+    Runs the coroutine to completion on a new event loop. (asyncio.run needs
+    Python 3.7.)
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_ls_hides_the_helper_module():
+    """
+    The helper module microfs installs isn't listed as one of the user's
+    files.
+    """
+    device = SimulatedDevice(files={'a.py': b'x = 1\n',
+                                    microfs.HELPER_NAME: b''})
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            return await fs.ls(timeout=5)
+    assert run(main()) == ['a.py']
+
+
+@pytest.mark.parametrize('raw_paste', [True, False])
+def test_put_get_and_rm(tmpdir, raw_paste):
+    """
+    A file is copied onto the device and back intact, with or without
+    raw-paste mode, and then removed.
+    """
+    device = SimulatedDevice(raw_paste=raw_paste)
+    local = tmpdir.join('data.bin')
+    content = bytes(bytearray(range(256))) * 4
+    local.write_binary(content)
+    copy = tmpdir.join('copy.bin')
+    progress = []
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            assert await fs.put(str(local), timeout=10)
+            assert await fs.ls() == ['data.bin']
+            assert await fs.get('data.bin', str(copy),
+                                lambda name, size: progress.append(size))
+            assert fs.raw_paste is raw_paste
+            assert await fs.rm('data.bin')
+            with pytest.raises(IOError):
+                await fs.rm('data.bin')
+    run(main())
+    assert copy.read_binary() == content
+    assert progress[-1] == len(content)
+    assert device.files == {}
+
+
+def test_module_functions(tmpdir):
+    """
+    The module level functions work on a serial object for just the one
+    call.
+    """
+    device = SimulatedDevice()
+    local = tmpdir.join('a.py')
+    local.write_binary(b'x = 1\n')
+
+    async def main():
+        assert await aiomicrofs.put(device, str(local))
+        assert await aiomicrofs.ls(device) == ['a.py']
+        assert await aiomicrofs.execute(['print(1 + 1)'], device) == (
+            b'2\r\n', b'')
+        assert await aiomicrofs.get(device, 'a.py', str(tmpdir.join('b.py')))
+        assert await aiomicrofs.rm(device, 'a.py')
+    run(main())
+    assert tmpdir.join('b.py').read_binary() == b'x = 1\n'
+    assert device.files == {}
+
+
+def test_without_ubinascii(tmpdir):
+    """
+    Firmware without ubinascii falls back to the 'repr' encoding, which is
+    used straight away once the lack of ubinascii is known.
+    """
+    device = SimulatedDevice(ubinascii=False)
+    local = tmpdir.join('data.bin')
+    local.write_binary(b'\x00\xffbinary')
+    copy = tmpdir.join('copy.bin')
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            assert await fs.put(str(local))
+            assert fs.ubinascii is False
+            before = device.commands
+            assert await fs.get('data.bin', str(copy))
+            assert device.commands == before + 1
+    run(main())
+    assert device.files['data.bin'] == b'\x00\xffbinary'
+    assert copy.read_binary() == b'\x00\xffbinary'
+
+
+def test_get_missing_file(tmpdir):
+    """
+    Getting a file that isn't on the device raises an IOError, and leaves
+    no partial copy behind.
+    """
+    target = tmpdir.join('missing.py')
+
+    async def main():
+        await aiomicrofs.get(SimulatedDevice(), 'missing.py', str(target))
+    with pytest.raises(IOError):
+        run(main())
+    assert not target.exists()
+
+
+def test_get_keeps_an_existing_file(tmpdir):
+    """
+    A failed get leaves an existing local file as it was, and a successful
+    one replaces it.
+    """
+    target = tmpdir.join('a.py')
+    target.write_binary(b'precious')
+    device = SimulatedDevice(files={'a.py': b'x = 1\n'})
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            with pytest.raises(IOError):
+                await fs.get('missing.py', str(target), timeout=5)
+            assert target.read_binary() == b'precious'
+            return await fs.get('a.py', str(target), timeout=5)
+    assert run(main())
+    assert target.read_binary() == b'x = 1\n'
+    assert tmpdir.listdir() == [target]
+
+
+def test_timeout(tmpdir):
+    """
+    An operation that runs past its timeout raises asyncio.TimeoutError,
+    the device is interrupted, and the next operation starts afresh.
+    """
+    device = SimulatedDevice(uart_buffer=10 ** 6, char_time=0.001)
+    local = tmpdir.join('big.bin')
+    local.write_binary(b'x' * 4000)
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            with pytest.raises(asyncio.TimeoutError):
+                await fs.put(str(local), timeout=0.2)
+            assert not fs.raw
+            return await fs.execute(['print(1)'], timeout=30)
+    assert run(main()) == (b'1\r\n', b'')
+
+
+def test_operations_are_queued():
+    """
+    Operations on the same device run one after the other.
+    """
+    device = SimulatedDevice(files={'a.py': b''})
+
+    async def main():
+        async with aiomicrofs.AsyncMicroFS(device) as fs:
+            return await asyncio.gather(fs.ls(), fs.ls(), fs.ls())
+    assert run(main()) == [['a.py']] * 3
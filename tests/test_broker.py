@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the broker that shares a device between the REPL and file system
+operations, against a simulated device.
+"""
+import time
+import pytest
+from unittest import mock
+from mu.contrib.broker import SerialBroker
+from mu.contrib.microsim import SimulatedDevice
+from mu.contrib.transports import LoopbackTransport
+
+
+def wait_for(received, expected):
+    """
+    Waits (for up to a second) for the listener to have received the
+    expected bytes.
+    """
+    for _ in range(100):
+        if expected in b''.join(received):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_broker_reconnects_after_the_link_fails():
+    """
+    If the port fails while the REPL is listening, the listener is kept and
+    the next write opens the port again and carries on reading from it.
+    """
+    device = SimulatedDevice()
+    links = []
+
+    def get_serial(port=None, baudrate=None):
+        links.append(LoopbackTransport(device))
+        return links[-1]
+    with mock.patch('mu.contrib.microfs.get_serial', get_serial):
+        broker = SerialBroker()
+        received = []
+        broker.listen(received.append)
+        try:
+            with broker.lock:
+                links[0].receive = mock.MagicMock(side_effect=IOError('Gone.'))
+            for _ in range(100):
+                if broker.serial is None:
+                    break
+                time.sleep(0.01)
+            assert broker.serial is None
+            assert broker.listener == received.append
+            broker.write(b'\x03')
+            assert len(links) == 2
+            assert wait_for(received, b'>>> ')
+        finally:
+            broker.close()
+
+
+def test_broker_write_reconnects_after_the_link_fails():
+    """
+    A write to a port that failed raises the error, and the next one
+    reconnects.
+    """
+    device = SimulatedDevice()
+    links = []
+
+    def get_serial(port=None, baudrate=None):
+        links.append(LoopbackTransport(device))
+        return links[-1]
+    with mock.patch('mu.contrib.microfs.get_serial', get_serial):
+        broker = SerialBroker()
+        broker.connect()
+        links[0].send = mock.MagicMock(side_effect=IOError('Gone.'))
+        with pytest.raises(IOError):
+            broker.write(b'\x03')
+        assert broker.serial is None
+        assert broker.ls() == []
+        assert len(links) == 2
+        broker.close()
+
+
+def test_broker_shares_the_device(tmpdir):
+    """
+    The REPL's listener gets what the device says at the REPL (here, the
+    echo of what's typed), but not the responses to file system operations
+    run in between, and the REPL carries on afterwards.
+    """
+    device = SimulatedDevice()
+    local = tmpdir.join('foo.py')
+    local.write('x = 1\n')
+    broker = SerialBroker(LoopbackTransport(device), timeout=10)
+    received = []
+    broker.listen(received.append)
+    try:
+        broker.write(b'hello')
+        assert wait_for(received, b'hello')
+        assert broker.put(str(local))
+        assert broker.ls() == ['foo.py']
+        assert not broker.raw
+        broker.write(b'\x03')
+        assert wait_for(received, b'>>> \r\n>>> ')
+        assert b'raw REPL' not in b''.join(received)
+        assert b'\x04' not in b''.join(received)
+    finally:
+        broker.close()
+    assert device.files['foo.py'] == b'x = 1\n'
+
+
+def test_broker_write_forgets_the_listing():
+    """
+    Whatever is typed at the REPL may change the files, so the cached
+    listing is forgotten.
+    """
+    device = SimulatedDevice(files={'a.py': b''})
+    broker = SerialBroker(LoopbackTransport(device))
+    try:
+        assert broker.ls() == ['a.py']
+        broker.write(b'import os\r')
+        assert broker.files is None
+    finally:
+        broker.close()
+
+
+def test_broker_unlisten():
+    """
+    Once the listener is removed the reading thread stops and the port is
+    left open.
+    """
+    broker = SerialBroker(LoopbackTransport(SimulatedDevice()))
+    received = []
+    broker.listen(received.append)
+    reader = broker.reader
+    broker.unlisten()
+    reader.join(1)
+    assert not reader.is_alive()
+    assert broker.reader is None
+    assert broker.serial is not None
+    broker.write(b'\x03')
+    assert broker.serial.in_waiting
+    assert b'>>> ' not in b''.join(received)
+    broker.close()
+
+
+def test_broker_baudrate():
+    """
+    Changing the broker's baud rate changes that of the port it opened.
+    """
+    device = SimulatedDevice(baudrate=115200)
+    with mock.patch('mu.contrib.microfs.get_serial',
+                    return_value=LoopbackTransport(device)):
+        broker = SerialBroker()
+        broker.connect()
+        broker.baudrate = 230400
+        assert device.baudrate == 230400
+        broker.close()
+
+
+def test_broker_recovers_from_a_reset_device():
+    """
+    Once the device is reset (as the user is told to do when it's stuck),
+    the broker's file system operations carry on working.
+    """
+    device = SimulatedDevice(files={'a.py': b'x = 1\n'})
+    broker = SerialBroker(LoopbackTransport(device))
+    try:
+        assert broker.ls(refresh=True) == ['a.py']
+        device.reset()
+        for _ in range(3):
+            assert broker.ls(refresh=True) == ['a.py']
+    finally:
+        broker.close()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for finding the serial ports of connected micro:bits.
+"""
+import time
+from unittest import mock
+from mu.contrib import discovery
+
+
+def port(device, serial_number, vid=discovery.MICROBIT_VID,
+         pid=discovery.MICROBIT_PID):
+    """
+    Returns a stand-in for one of the ports pyserial lists.
+    """
+    return mock.MagicMock(device=device, serial_number=serial_number, vid=vid,
+                          pid=pid, description='micro:bit')
+
+
+def test_devices_only_lists_micro_bits():
+    """
+    Only ports with the micro:bit's vendor and product IDs are found.
+    """
+    found = discovery.DeviceDiscovery()
+    ports = [port('/dev/ttyACM0', 'A'), port('/dev/ttyUSB0', 'B', 1, 2)]
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=ports):
+        devices = found.devices()
+    assert [device.port for device in devices] == ['/dev/ttyACM0']
+    assert devices[0] == discovery.Device('/dev/ttyACM0', 'A',
+                                          discovery.MICROBIT_VID,
+                                          discovery.MICROBIT_PID,
+                                          'micro:bit')
+
+
+def test_devices_are_cached_until_something_changes():
+    """
+    The ports are only enumerated again once the stamp changes, or when
+    asked to refresh.
+    """
+    found = discovery.DeviceDiscovery()
+    stamps = [1, 1, 1, 2]
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=[port('COM3', 'A')]) as enumerate_ports, \
+            mock.patch.object(found, 'get_stamp', side_effect=stamps):
+        found.devices()
+        found.devices()
+        assert enumerate_ports.call_count == 1
+        found.devices(refresh=True)
+        assert enumerate_ports.call_count == 2
+        found.devices()
+        assert enumerate_ports.call_count == 3
+
+
+def test_get_stamp_without_dev():
+    """
+    Where there's no /dev to watch the stamp changes every cache_timeout
+    seconds.
+    """
+    found = discovery.DeviceDiscovery(cache_timeout=10)
+    with mock.patch('sys.platform', 'win32'), \
+            mock.patch('time.time', return_value=125):
+        assert found.get_stamp() == 12
+
+
+def test_find_remembers_the_device():
+    """
+    The device found last is found again, even at a new port, rather than
+    the first one connected.
+    """
+    found = discovery.DeviceDiscovery()
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=[port('COM3', 'A'), port('COM4', 'B')]):
+        assert found.find() == 'COM3'
+        assert found.find('B') == 'COM4'
+        assert found.find('C') is None
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=[port('COM5', 'B'), port('COM6', 'A')]):
+        found.devices(refresh=True)
+        assert found.find() == 'COM6'
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=[]):
+        found.devices(refresh=True)
+        assert found.find() is None
+
+
+def test_listeners_are_told_about_changes():
+    """
+    Listeners are told about devices added and removed, until they're
+    removed themselves.
+    """
+    found = discovery.DeviceDiscovery()
+    events = []
+
+    def listener(event, device):
+        events.append((event, device.port))
+    found.add_listener(listener)
+    a, b = port('COM3', 'A'), port('COM4', 'B')
+    for ports in ([a], [a, b], [b]):
+        with mock.patch('mu.contrib.discovery.list_serial_ports',
+                        return_value=ports):
+            found.devices(refresh=True)
+    assert events == [('added', 'COM3'), ('added', 'COM4'),
+                      ('removed', 'COM3')]
+    found.remove_listener(listener)
+    with mock.patch('mu.contrib.discovery.list_serial_ports',
+                    return_value=[]):
+        found.devices(refresh=True)
+    assert len(events) == 3
+
+
+def test_start_and_stop_watching():
+    """
+    The watching thread enumerates the devices every interval until it's
+    stopped.
+    """
+    found = discovery.DeviceDiscovery()
+    with mock.patch.object(found, 'devices') as devices:
+        found.start(interval=0.01)
+        watcher = found.watcher
+        found.start(interval=0.01)
+        assert found.watcher is watcher
+        for _ in range(100):
+            if devices.call_count:
+                break
+            time.sleep(0.01)
+        found.stop()
+        assert devices.call_count > 0
+        assert found.watcher is None
+        assert not watcher.is_alive()
+        found.stop()
+
+
+def test_find_devices_and_find_device():
+    """
+    The module level functions use the shared discovery service.
+    """
+    with mock.patch.object(discovery.default, 'devices',
+                           return_value=[discovery.Device('COM3', 'A', 1, 2,
+                                                          '')]) as devices:
+        assert discovery.find_devices(refresh=True) == ['COM3']
+    devices.assert_called_once_with(True)
+    with mock.patch.object(discovery.default, 'find',
+                           return_value='COM3') as find:
+        assert discovery.find_device('A') == 'COM3'
+    find.assert_called_once_with('A')
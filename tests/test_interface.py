@@ -4,8 +4,9 @@ Tests for the user interface elements of Mu.
 """
 from PyQt5.QtWidgets import (QApplication, QAction, QWidget, QFileDialog,
                              QMessageBox, QLabel, QListWidget)
-from PyQt5.QtCore import QIODevice, Qt, QSize
+from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QTextCursor, QIcon
+from collections import OrderedDict
 from unittest import mock
 import os
 import mu.interface
@@ -615,7 +616,8 @@ def test_Window_add_filesystem():
     mock_fs_class = mock.MagicMock(return_value=mock_fs)
     with mock.patch('mu.interface.FileSystemPane', mock_fs_class):
         w.add_filesystem('path/to/home')
-    mock_fs_class.assert_called_once_with(w.splitter, 'path/to/home')
+    mock_fs_class.assert_called_once_with(w.splitter, 'path/to/home',
+                                          w.fs_session)
     assert w.fs == mock_fs
     w.splitter.addWidget.assert_called_once_with(mock_fs)
     w.splitter.setSizes.assert_called_once_with([66, 33])
@@ -629,6 +631,7 @@ def test_Window_add_repl():
     """
     w = mu.interface.Window()
     w.theme = mock.MagicMock()
+    w.clipboard = mock.MagicMock()
     w.splitter = mock.MagicMock()
     w.splitter.addWidget = mock.MagicMock(return_value=None)
     w.splitter.setSizes = mock.MagicMock(return_value=None)
@@ -640,7 +643,8 @@ def test_Window_add_repl():
     mock_repl_arg.port = mock.MagicMock('COM0')
     with mock.patch('mu.interface.REPLPane', mock_repl_class):
         w.add_repl(mock_repl_arg)
-    mock_repl_class.assert_called_once_with(port=mock_repl_arg.port,
+    mock_repl_class.assert_called_once_with(w.fs_session,
+                                            clipboard=w.clipboard,
                                             theme=w.theme)
     assert w.repl == mock_repl
     w.splitter.addWidget.assert_called_once_with(mock_repl)
@@ -649,6 +653,34 @@ def test_Window_add_repl():
     w.connect_zoom.assert_called_once_with(mock_repl)
 
 
+def test_Window_fs_session():
+    """
+    Ensure the window creates a single microfs session on first use and then
+    keeps reusing it.
+    """
+    w = mu.interface.Window()
+    session = w.fs_session
+    assert isinstance(session, mu.interface.broker.SerialBroker)
+    assert session.timeout == mu.interface.FS_TIMEOUT
+    assert w.fs_session is session
+
+
+def test_Window_add_repl_invalidates_fs_listing():
+    """
+    Code run in the REPL may change the device's files, so adding the REPL
+    forgets the cached file listing.
+    """
+    w = mu.interface.Window()
+    w.clipboard = mock.MagicMock()
+    w.theme = 'day'
+    w.splitter = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock(return_value=None)
+    w._fs_session = mock.MagicMock()
+    with mock.patch('mu.interface.REPLPane'):
+        w.add_repl(mock.MagicMock())
+    w._fs_session.invalidate.assert_called_once_with()
+
+
 def test_Window_remove_filesystem():
     """
     Check all the necessary calls to remove / reset the file system pane are
@@ -660,6 +692,7 @@ def test_Window_remove_filesystem():
     mock_fs.deleteLater = mock.MagicMock(return_value=None)
     w.fs = mock_fs
     w.remove_filesystem()
+    assert mock_fs.session.close.call_count == 0
     mock_fs.setParent.assert_called_once_with(None)
     mock_fs.deleteLater.assert_called_once_with()
     assert w.fs is None
@@ -675,6 +708,7 @@ def test_Window_remove_repl():
     mock_repl.deleteLater = mock.MagicMock(return_value=None)
     w.repl = mock_repl
     w.remove_repl()
+    mock_repl.broker.unlisten.assert_called_once_with()
     mock_repl.setParent.assert_called_once_with(None)
     mock_repl.deleteLater.assert_called_once_with()
     assert w.repl is None
@@ -950,222 +984,161 @@ def test_Window_setup():
 
 def test_REPLPane_init_default_args():
     """
-    Ensure the REPLPane object is instantiated as expected.
-    """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.readyRead = mock.MagicMock()
-    mock_serial.readyRead.connect = mock.MagicMock(return_value=None)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-    assert mock_serial_class.call_count == 1
-    mock_serial.setPortName.assert_called_once_with('COM0')
-    mock_serial.setBaudRate.assert_called_once_with(115200)
-    mock_serial.open.assert_called_once_with(QIODevice.ReadWrite)
-    mock_serial.readyRead.connect.assert_called_once_with(rp.on_serial_read)
-    mock_serial.write.assert_called_once_with(b'\x03')
+    Ensure the REPLPane object is instantiated as expected: it listens to the
+    device through the broker and interrupts whatever is running.
+    """
+    mock_broker = mock.MagicMock()
+    mock_process = mock.MagicMock()
+    with mock.patch('mu.interface.REPLPane.process_bytes', mock_process):
+        rp = mu.interface.REPLPane(mock_broker, None)
+    assert rp.broker == mock_broker
+    assert mock_broker.listen.call_count == 1
+    mock_broker.write.assert_called_once_with(b'\x03')
+    # The listener hands the device's output to the pane via the signal.
+    listener = mock_broker.listen.call_args[0][0]
+    listener(b'hello')
+    mock_process.assert_called_once_with(b'hello')
 
 
 def test_REPLPane_init_cannot_open():
     """
-    If serial.open fails raise an IOError.
+    If the broker can't connect to the device, the IOError is raised.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=False)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        with pytest.raises(IOError):
-            mu.interface.REPLPane('COM0')
+    mock_broker = mock.MagicMock()
+    mock_broker.listen = mock.MagicMock(side_effect=IOError('boom'))
+    with pytest.raises(IOError):
+        mu.interface.REPLPane(mock_broker, None)
 
 
 def test_REPLPane_set_theme():
     """
     Ensure the set_theme toggles as expected.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        rp.setStyleSheet = mock.MagicMock(return_value=None)
-        rp.set_theme('day')
-        rp.setStyleSheet.assert_called_once_with(mu.interface.DAY_STYLE)
-        rp.setStyleSheet.reset_mock()
-        rp.set_theme('night')
-        rp.setStyleSheet.assert_called_once_with(mu.interface.NIGHT_STYLE)
-
-
-def test_REPLPane_on_serial_read():
-    """
-    Ensure the method calls process_bytes.
-    """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.readAll = mock.MagicMock(return_value='abc'.encode('utf-8'))
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        rp.process_bytes = mock.MagicMock()
-        rp.on_serial_read()
-        rp.process_bytes.assert_called_once_with(bytes('abc'.encode('utf-8')))
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    rp.setStyleSheet = mock.MagicMock(return_value=None)
+    rp.set_theme('day')
+    rp.setStyleSheet.assert_called_once_with(mu.interface.DAY_STYLE)
+    rp.setStyleSheet.reset_mock()
+    rp.set_theme('night')
+    rp.setStyleSheet.assert_called_once_with(mu.interface.NIGHT_STYLE)
+
+
+def test_REPLPane_data_received():
+    """
+    Ensure data from the device is passed on to process_bytes.
+    """
+    mock_broker = mock.MagicMock()
+    with mock.patch('mu.interface.REPLPane.process_bytes') as process_bytes:
+        rp = mu.interface.REPLPane(mock_broker, None)
+        rp.data_received.emit(b'abc')
+    process_bytes.assert_called_once_with(b'abc')
 
 
 def test_REPLPane_keyPressEvent():
     """
     Ensure key presses in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_A)
-        data.text = mock.MagicMock(return_value='a')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(bytes('a', 'utf-8'))
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_A)
+    data.text = mock.MagicMock(return_value='a')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(bytes('a', 'utf-8'))
 
 
 def test_REPLPane_keyPressEvent_backspace():
     """
     Ensure backspaces in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_Backspace)
-        data.text = mock.MagicMock(return_value='\b')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(b'\b')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_Backspace)
+    data.text = mock.MagicMock(return_value='\b')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(b'\b')
 
 
 def test_REPLPane_keyPressEvent_up():
     """
     Ensure up arrows in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_Up)
-        data.text = mock.MagicMock(return_value='1b')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(b'\x1B[A')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_Up)
+    data.text = mock.MagicMock(return_value='1b')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(b'\x1B[A')
 
 
 def test_REPLPane_keyPressEvent_down():
     """
     Ensure down arrows in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_Down)
-        data.text = mock.MagicMock(return_value='1b')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(b'\x1B[B')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_Down)
+    data.text = mock.MagicMock(return_value='1b')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(b'\x1B[B')
 
 
 def test_REPLPane_keyPressEvent_right():
     """
     Ensure right arrows in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_Right)
-        data.text = mock.MagicMock(return_value='1b')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(b'\x1B[C')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_Right)
+    data.text = mock.MagicMock(return_value='1b')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(b'\x1B[C')
 
 
 def test_REPLPane_keyPressEvent_left():
     """
     Ensure left arrows in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_Left)
-        data.text = mock.MagicMock(return_value='1b')
-        data.modifiers = mock.MagicMock(return_value=None)
-        rp.keyPressEvent(data)
-        mock_serial.write.assert_called_once_with(b'\x1B[D')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_Left)
+    data.text = mock.MagicMock(return_value='1b')
+    data.modifiers = mock.MagicMock(return_value=None)
+    rp.keyPressEvent(data)
+    mock_broker.write.assert_called_once_with(b'\x1B[D')
 
 
 def test_REPLPane_keyPressEvent_meta():
     """
     Ensure backspaces in the REPL are handled correctly.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial.write = mock.MagicMock(return_value=None)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        mock_serial.write.reset_mock()  # write is called during __init__()
-        data = mock.MagicMock
-        data.key = mock.MagicMock(return_value=Qt.Key_M)
-        data.text = mock.MagicMock(return_value='a')
-        data.modifiers = mock.MagicMock(return_value=Qt.MetaModifier)
-        rp.keyPressEvent(data)
-        expected = 1 + Qt.Key_M - Qt.Key_A
-        mock_serial.write.assert_called_once_with(bytes([expected]))
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    mock_broker.write.reset_mock()  # write is called during __init__()
+    data = mock.MagicMock
+    data.key = mock.MagicMock(return_value=Qt.Key_M)
+    data.text = mock.MagicMock(return_value='a')
+    data.modifiers = mock.MagicMock(return_value=Qt.MetaModifier)
+    rp.keyPressEvent(data)
+    expected = 1 + Qt.Key_M - Qt.Key_A
+    mock_broker.write.assert_called_once_with(bytes([expected]))
 
 
 def test_REPLPane_process_bytes():
@@ -1174,48 +1147,38 @@ def test_REPLPane_process_bytes():
     expected. Backspace is enacted, carriage-return is ignored and all others
     are simply inserted.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
+    mock_broker = mock.MagicMock()
     mock_tc = mock.MagicMock()
     mock_tc.movePosition = mock.MagicMock(side_effect=[True, False, True])
     mock_tc.deleteChar = mock.MagicMock(return_value=None)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        rp.textCursor = mock.MagicMock(return_value=mock_tc)
-        rp.setTextCursor = mock.MagicMock(return_value=None)
-        rp.insertPlainText = mock.MagicMock(return_value=None)
-        rp.ensureCursorVisible = mock.MagicMock(return_value=None)
-        bs = [8, 13, 65]  # \b, \r, 'A'
-        rp.process_bytes(bs)
-        rp.textCursor.assert_called_once_with()
-        assert mock_tc.movePosition.call_count == 3
-        assert mock_tc.movePosition.call_args_list[0][0][0] == QTextCursor.Down
-        assert mock_tc.movePosition.call_args_list[1][0][0] == QTextCursor.Down
-        assert mock_tc.movePosition.call_args_list[2][0][0] == QTextCursor.Left
-        assert rp.setTextCursor.call_count == 2
-        assert rp.setTextCursor.call_args_list[0][0][0] == mock_tc
-        assert rp.setTextCursor.call_args_list[1][0][0] == mock_tc
-        rp.insertPlainText.assert_called_once_with(chr(65))
-        rp.ensureCursorVisible.assert_called_once_with()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    rp.textCursor = mock.MagicMock(return_value=mock_tc)
+    rp.setTextCursor = mock.MagicMock(return_value=None)
+    rp.insertPlainText = mock.MagicMock(return_value=None)
+    rp.ensureCursorVisible = mock.MagicMock(return_value=None)
+    bs = [8, 13, 65]  # \b, \r, 'A'
+    rp.process_bytes(bs)
+    rp.textCursor.assert_called_once_with()
+    assert mock_tc.movePosition.call_count == 3
+    assert mock_tc.movePosition.call_args_list[0][0][0] == QTextCursor.Down
+    assert mock_tc.movePosition.call_args_list[1][0][0] == QTextCursor.Down
+    assert mock_tc.movePosition.call_args_list[2][0][0] == QTextCursor.Left
+    assert rp.setTextCursor.call_count == 2
+    assert rp.setTextCursor.call_args_list[0][0][0] == mock_tc
+    assert rp.setTextCursor.call_args_list[1][0][0] == mock_tc
+    rp.insertPlainText.assert_called_once_with(chr(65))
+    rp.ensureCursorVisible.assert_called_once_with()
 
 
 def test_REPLPane_clear():
     """
     Ensure setText is called with an empty string.
     """
-    mock_serial = mock.MagicMock()
-    mock_serial.setPortName = mock.MagicMock(return_value=None)
-    mock_serial.setBaudRate = mock.MagicMock(return_value=None)
-    mock_serial.open = mock.MagicMock(return_value=True)
-    mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.QSerialPort', mock_serial_class):
-        rp = mu.interface.REPLPane('COM0')
-        rp.setText = mock.MagicMock(return_value=None)
-        rp.clear()
-        rp.setText.assert_called_once_with('')
+    mock_broker = mock.MagicMock()
+    rp = mu.interface.REPLPane(mock_broker, None)
+    rp.setText = mock.MagicMock(return_value=None)
+    rp.clear()
+    rp.setText.assert_called_once_with('')
 
 
 def test_MuFileList_disable():
@@ -1267,23 +1230,16 @@ def test_MicrobitFileList_dropEvent():
     mock_item.text.return_value = 'foo.py'
     source.currentItem = mock.MagicMock(return_value=mock_item)
     mock_event.source.return_value = source
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
     mfs = mu.interface.MicrobitFileList('homepath')
+    mfs.session = mock.MagicMock()
     mfs.disable = mock.MagicMock()
     mfs.enable = mock.MagicMock()
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.MuFileList.dropEvent',
-                       return_value=None) as mock_dropEvent, \
-            mock.patch('mu.interface.microfs.put',
-                       return_value=True) as mock_put:
+    with mock.patch('mu.interface.MuFileList.dropEvent',
+                    return_value=None) as mock_dropEvent:
         mfs.dropEvent(mock_event)
         mfs.disable.assert_called_once_with(source)
         home = os.path.join('homepath', 'foo.py')
-        mock_put.assert_called_once_with(mock_serial, home)
+        mfs.session.put.assert_called_once_with(home)
         mock_dropEvent.assert_called_once_with(mock_event)
         mfs.enable.assert_called_once_with(source)
 
@@ -1298,18 +1254,13 @@ def test_MicrobitFileList_dropEvent_error():
     mock_item.text.return_value = 'foo.py'
     source.currentItem = mock.MagicMock(return_value=mock_item)
     mock_event.source.return_value = source
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
     mfs = mu.interface.MicrobitFileList('homepath')
+    mfs.session = mock.MagicMock()
+    ex = IOError('BANG')
+    mfs.session.put.side_effect = ex
     mfs.disable = mock.MagicMock()
     mfs.enable = mock.MagicMock()
-    ex = IOError('BANG')
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.microfs.put', side_effect=ex), \
-            mock.patch('mu.interface.logger.error', return_value=None) as l:
+    with mock.patch('mu.interface.logger.error', return_value=None) as l:
         mfs.dropEvent(mock_event)
         l.assert_called_once_with(ex)
         mfs.disable.assert_called_once_with(source)
@@ -1350,18 +1301,11 @@ def test_MicrobitFileList_contextMenuEvent():
     mfs.mapToGlobal = mock.MagicMock(return_value=None)
     mfs.setDisabled = mock.MagicMock(return_value=None)
     mfs.setAcceptDrops = mock.MagicMock(return_value=None)
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
+    mfs.session = mock.MagicMock()
     mock_event = mock.MagicMock()
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.microfs.rm',
-                       return_value=None) as mock_rm, \
-            mock.patch('mu.interface.QMenu', return_value=mock_menu):
+    with mock.patch('mu.interface.QMenu', return_value=mock_menu):
         mfs.contextMenuEvent(mock_event)
-        mock_rm.assert_called_once_with(mock_serial, 'foo.py')
+        mfs.session.rm.assert_called_once_with('foo.py')
         assert mfs.setDisabled.call_count == 2
         assert mfs.setAcceptDrops.call_count == 2
 
@@ -1383,16 +1327,11 @@ def test_MicrobitFileList_contextMenuEvent_error():
     mfs.setDisabled = mock.MagicMock(return_value=None)
     mfs.setAcceptDrops = mock.MagicMock(return_value=None)
     mfs.takeItem = mock.MagicMock(return_value=None)
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
+    mfs.session = mock.MagicMock()
     mock_event = mock.MagicMock()
     ex = IOError('BANG')
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.microfs.rm', side_effect=ex), \
-            mock.patch('mu.interface.logger.error', return_value=None) as l, \
+    mfs.session.rm.side_effect = ex
+    with mock.patch('mu.interface.logger.error', return_value=None) as l, \
             mock.patch('mu.interface.QMenu', return_value=mock_menu):
         mfs.contextMenuEvent(mock_event)
         l.assert_called_once_with(ex)
@@ -1420,23 +1359,16 @@ def test_LocalFileList_dropEvent():
     mock_item.text.return_value = 'foo.py'
     source.currentItem = mock.MagicMock(return_value=mock_item)
     mock_event.source.return_value = source
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
     lfs = mu.interface.LocalFileList('homepath')
+    lfs.session = mock.MagicMock()
     lfs.disable = mock.MagicMock()
     lfs.enable = mock.MagicMock()
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.MuFileList.dropEvent',
-                       return_value=None) as mock_dropEvent, \
-            mock.patch('mu.interface.microfs.get',
-                       return_value=True) as mock_get:
+    with mock.patch('mu.interface.MuFileList.dropEvent',
+                    return_value=None) as mock_dropEvent:
         lfs.dropEvent(mock_event)
         lfs.disable.assert_called_once_with(source)
         home = os.path.join('homepath', 'foo.py')
-        mock_get.assert_called_once_with(mock_serial, 'foo.py', home)
+        lfs.session.get.assert_called_once_with('foo.py', home)
         mock_dropEvent.assert_called_once_with(mock_event)
         lfs.enable.assert_called_once_with(source)
 
@@ -1451,18 +1383,13 @@ def test_LocalFileList_dropEvent_error():
     mock_item.text.return_value = 'foo.py'
     source.currentItem = mock.MagicMock(return_value=mock_item)
     mock_event.source.return_value = source
-    mock_context = mock.MagicMock()
-    mock_serial = mock.MagicMock()
-    mock_serial.port = 'COM0'
-    mock_context.__enter__.return_value = mock_serial
     lfs = mu.interface.LocalFileList('homepath')
+    lfs.session = mock.MagicMock()
+    ex = IOError('BANG')
+    lfs.session.get.side_effect = ex
     lfs.disable = mock.MagicMock()
     lfs.enable = mock.MagicMock()
-    ex = IOError('BANG')
-    with mock.patch('mu.interface.microfs.get_serial',
-                    return_value=mock_context), \
-            mock.patch('mu.interface.microfs.get', side_effect=ex), \
-            mock.patch('mu.interface.logger.error', return_value=None) as l:
+    with mock.patch('mu.interface.logger.error', return_value=None) as l:
         lfs.dropEvent(mock_event)
         l.assert_called_once_with(ex)
         lfs.disable.assert_called_once_with(source)
@@ -1499,22 +1426,24 @@ def test_FileSystemPane_init():
     assert isinstance(fsp.local_label, QLabel)
     assert isinstance(fsp.microbit_fs, QListWidget)
     assert isinstance(fsp.local_fs, QListWidget)
+    assert fsp.microbit_fs.session is fsp.session
+    assert fsp.local_fs.session is fsp.session
 
 
 def test_FileSystemPane_ls():
     """
     Ensure the ls method works as expected.
     """
-    microbit_files = ['foo.py', 'bar.py', 'baz.py']
+    microbit_files = OrderedDict([('foo.py', 10), ('bar.py', 20),
+                                  ('baz.py', 30)])
     local_files = ['spam.py', 'eggs.py']
     # MOCK ALL TEH THIGNS!
     with mock.patch('mu.interface.MicrobitFileList.clear',
                     return_value=None) as mfs_clear, \
             mock.patch('mu.interface.LocalFileList.clear',
                        return_value=None) as lfs_clear, \
-            mock.patch('mu.interface.microfs.ls',
-                       return_value=microbit_files), \
-            mock.patch('mu.interface.microfs.get_serial', return_value=None), \
+            mock.patch('mu.interface.microfs.MicroFSSession.details',
+                       return_value=(microbit_files, 1234)), \
             mock.patch('mu.interface.os.listdir', return_value=local_files), \
             mock.patch('mu.interface.os.path.isfile', return_value=True), \
             mock.patch('mu.interface.os.path.join', return_value=None):
@@ -1522,9 +1451,25 @@ def test_FileSystemPane_ls():
         mfs_clear.assert_called_once_with()
         lfs_clear.assert_called_once_with()
         assert fsp.microbit_fs.count() == 3
+        assert fsp.microbit_fs.item(0).text() == 'bar.py'
+        assert fsp.microbit_fs.item(0).toolTip() == '20 bytes'
+        assert '1234 bytes free' in fsp.microbit_label.text()
         assert fsp.local_fs.count() == 2
 
 
+def test_FileSystemPane_ls_unknown_free_space():
+    """
+    If the device can't report its free space the label says nothing about
+    it.
+    """
+    with mock.patch('mu.interface.microfs.MicroFSSession.details',
+                    return_value=(OrderedDict(), None)), \
+            mock.patch('mu.interface.os.listdir', return_value=[]):
+        fsp = mu.interface.FileSystemPane(None, 'homepath')
+    assert fsp.microbit_label.text() == 'Files on your micro:bit:'
+    assert fsp.microbit_fs.count() == 0
+
+
 def test_FileSystemPane_set_theme_day():
     """
     Ensures the day theme is set.
@@ -4,8 +4,12 @@ Tests for the Editor and REPL logic.
 """
 import os.path
 import json
+import time
 import pytest
 import mu.logic
+from mu.contrib.broker import SerialBroker
+from mu.contrib.microsim import SimulatedDevice
+from mu.contrib.transports import LoopbackTransport
 from PyQt5.QtWidgets import QMessageBox
 from unittest import mock
 from mu import __version__
@@ -13,6 +17,10 @@ from mu import __version__
 
 SESSION = json.dumps({
     'theme': 'night',
+    'baudrate': 'auto',
+    'probed_baudrates': {
+        'COM0': 921600,
+    },
     'paths': [
         'path/foo.py',
         'path/bar.py',
@@ -33,41 +41,47 @@ def test_CONSTANTS():
     assert mu.logic.MICROBIT_VID == 3368
 
 
-def test_find_microbit_no_ports():
+def test_find_upython_device_no_ports():
     """
     There are no connected devices so return None.
     """
-    with mock.patch('mu.logic.QSerialPortInfo.availablePorts',
-                    return_value=[]):
-        assert mu.logic.find_microbit() is None
+    discovery = mu.logic.discovery.DeviceDiscovery()
+    with mock.patch('mu.logic.discovery.default', discovery), \
+            mock.patch('mu.contrib.discovery.list_serial_ports',
+                       return_value=[]):
+        assert mu.logic.find_upython_device() is None
 
 
-def test_find_microbit_no_device():
+def test_find_upython_device_no_device():
     """
     None of the connected devices is a micro:bit so return None.
     """
     mock_port = mock.MagicMock()
-    mock_port.productIdentifier = mock.MagicMock(return_value=666)
-    mock_port.vendorIdentifier = mock.MagicMock(return_value=999)
-    with mock.patch('mu.logic.QSerialPortInfo.availablePorts',
-                    return_value=[mock_port, ]):
-        assert mu.logic.find_microbit() is None
+    mock_port.pid = 666
+    mock_port.vid = 999
+    discovery = mu.logic.discovery.DeviceDiscovery()
+    with mock.patch('mu.logic.discovery.default', discovery), \
+            mock.patch('mu.contrib.discovery.list_serial_ports',
+                       return_value=[mock_port, ]):
+        assert mu.logic.find_upython_device() is None
 
 
-def test_find_microbit_with_device():
+def test_find_upython_device_with_device():
     """
     If a device is found, return the port name.
     """
+    other_port = mock.MagicMock()
+    other_port.pid = 666
+    other_port.vid = 999
     mock_port = mock.MagicMock()
+    mock_port.pid = mu.logic.MICROBIT_PID
     mock_port.vid = mu.logic.MICROBIT_VID
-    mock_port.productIdentifier = mock.MagicMock()
-    mock_port.productIdentifier.return_value = mu.logic.MICROBIT_PID
-    mock_port.vendorIdentifier = mock.MagicMock()
-    mock_port.vendorIdentifier.return_value = mu.logic.MICROBIT_VID
-    mock_port.portName = mock.MagicMock(return_value='COM0')
-    with mock.patch('mu.logic.QSerialPortInfo.availablePorts',
-                    return_value=[mock_port, ]):
-        assert mu.logic.find_microbit() == 'COM0'
+    mock_port.device = 'COM0'
+    discovery = mu.logic.discovery.DeviceDiscovery()
+    with mock.patch('mu.logic.discovery.default', discovery), \
+            mock.patch('mu.contrib.discovery.list_serial_ports',
+                       return_value=[other_port, mock_port, ]):
+        assert mu.logic.find_upython_device() == 'COM0'
 
 
 def test_check_flake():
@@ -165,10 +179,11 @@ def test_MuFlakeCodeReporter_flake_un_matched():
 
 def test_REPL_posix():
     """
-    The port is set correctly in a posix environment.
+    The port is set correctly in a posix environment: it's already the
+    device's full path, so isn't prefixed again.
     """
     with mock.patch('os.name', 'posix'):
-        r = mu.logic.REPL('ttyACM0')
+        r = mu.logic.REPL('/dev/ttyACM0')
         assert r.port == '/dev/ttyACM0'
 
 
@@ -225,6 +240,8 @@ def test_editor_restore_session():
             mock.patch('os.path.exists', return_value=True):
         ed.restore_session()
     assert ed.theme == 'night'
+    assert ed.baudrate == 'auto'
+    assert ed.probed == {'COM0': 921600}
     assert mock_open.return_value.read.call_count == 3
     assert ed._view.add_tab.call_count == 2
     view.set_theme.assert_called_once_with('night')
@@ -270,6 +287,51 @@ def test_flash_no_tab():
     assert ed.flash() is None
 
 
+def test_flash_puts_script_with_session():
+    """
+    Ensure the current script is saved and then copied onto the device via
+    the view's microfs session (so its cached file listing is kept current).
+    """
+    view = mock.MagicMock()
+    view.current_tab.path = 'foo.py'
+    ed = mu.logic.Editor(view)
+    ed.save = mock.MagicMock()
+    ed.flash()
+    ed.save.assert_called_once_with()
+    view.fs_session.put.assert_called_once_with('foo.py')
+    assert view.fs_session.close.call_count == 0
+
+
+def test_flash_keeps_repl_listening(tmpdir):
+    """
+    Flashing while the REPL is open doesn't cut the REPL off from the device.
+    """
+    script = tmpdir.join('foo.py')
+    script.write('print(1)\n')
+    device = SimulatedDevice()
+    session = SerialBroker(LoopbackTransport(device))
+    received = []
+    session.listen(received.append)
+    view = mock.MagicMock()
+    view.current_tab.path = str(script)
+    view.fs_session = session
+    ed = mu.logic.Editor(view)
+    ed.save = mock.MagicMock()
+    try:
+        ed.flash()
+        assert device.files['foo.py'] == b'print(1)\n'
+        assert session.listener == received.append
+        assert session.serial is not None
+        session.write(b'\x03')
+        for _ in range(100):
+            if b'>>> ' in b''.join(received):
+                break
+            time.sleep(0.01)
+        assert b'>>> ' in b''.join(received)
+    finally:
+        session.close()
+
+
 def test_flash_with_attached_device():
     """
     Ensure the expected calls are made to uFlash and a helpful status message
@@ -403,7 +465,7 @@ def test_add_fs_no_repl():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.microfs.get_serial', return_value=True):
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'):
         ed.add_fs()
     view.add_filesystem.assert_called_once_with(home=mu.logic.PYTHON_DIRECTORY)
     assert ed.fs
@@ -416,7 +478,7 @@ def test_add_fs_with_repl():
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
     ed.repl = True
-    with mock.patch('mu.logic.microfs.get_serial', return_value=True):
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'):
         ed.add_fs()
     assert view.add_filesystem.call_count == 0
 
@@ -427,9 +489,8 @@ def test_add_fs_no_device():
     """
     view = mock.MagicMock()
     view.show_message = mock.MagicMock()
-    ex = IOError('BOOM')
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.microfs.get_serial', side_effect=ex):
+    with mock.patch('mu.logic.find_upython_device', return_value=None):
         ed.add_fs()
     assert view.show_message.call_count == 1
 
@@ -486,15 +547,17 @@ def test_toggle_fs_off():
 
 def test_toggle_fs_with_repl():
     """
-    If the REPL is active, ensure a helpful message is displayed.
+    If the REPL is active, switch straight from it to the file system.
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    ed.add_repl = mock.MagicMock()
+    ed.remove_repl = mock.MagicMock()
+    ed.add_fs = mock.MagicMock()
     ed.repl = True
     ed.fs = None
     ed.toggle_fs()
-    assert view.show_message.call_count == 1
+    assert ed.remove_repl.call_count == 1
+    assert ed.add_fs.call_count == 1
 
 
 def test_add_repl_with_fs():
@@ -527,7 +590,7 @@ def test_add_repl_no_port():
     view = mock.MagicMock()
     view.show_message = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.find_microbit', return_value=False):
+    with mock.patch('mu.logic.find_upython_device', return_value=False):
         ed.add_repl()
     assert view.show_message.call_count == 1
     message = 'Could not find an attached BBC micro:bit.'
@@ -545,7 +608,7 @@ def test_add_repl_ioerror():
     ex = IOError('BOOM')
     view.add_repl = mock.MagicMock(side_effect=ex)
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.find_microbit', return_value='COM0'):
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'):
         ed.add_repl()
     assert view.show_message.call_count == 1
     assert view.show_message.call_args[0][0] == str(ex)
@@ -559,7 +622,7 @@ def test_add_repl_exception():
     ex = Exception('BOOM')
     view.add_repl = mock.MagicMock(side_effect=ex)
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.find_microbit', return_value='COM0'), \
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'), \
             mock.patch('mu.logic.logger', return_value=None) as logger:
         ed.add_repl()
         logger.error.assert_called_once_with(ex)
@@ -573,13 +636,99 @@ def test_add_repl():
     view.show_message = mock.MagicMock()
     view.add_repl = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.find_microbit', return_value='COM0'), \
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'), \
             mock.patch('os.name', 'nt'):
         ed.add_repl()
     assert view.show_message.call_count == 0
     assert view.add_repl.call_args[0][0].port == 'COM0'
 
 
+def test_add_repl_baudrate():
+    """
+    The view is given the baud rate from the settings.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = 230400
+    with mock.patch('mu.logic.find_upython_device', return_value='COM0'), \
+            mock.patch('os.name', 'nt'):
+        ed.add_repl()
+    assert view.add_repl.call_args[0][0].port == 'COM0'
+    view.set_baudrate.assert_called_once_with(230400)
+
+
+def test_negotiate_baudrate_unsupported():
+    """
+    A baud rate serial ports can't be set to falls back to the default.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = 12345
+    assert ed.negotiate_baudrate('COM0') == 115200
+    view.set_baudrate.assert_called_once_with(115200)
+
+
+def test_negotiate_baudrate_auto():
+    """
+    The 'auto' setting uses the fastest baud rate the device answers at.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = mu.logic.AUTO_BAUDRATE
+    with mock.patch('mu.logic.microfs.probe_baudrate',
+                    return_value=921600) as probe:
+        assert ed.negotiate_baudrate('COM0') == 921600
+        assert ed.negotiate_baudrate('COM0') == 921600
+    probe.assert_called_once_with('COM0', preferred=None)
+    assert ed.baudrate == 'auto'
+    assert ed.probed == {'COM0': 921600}
+
+
+def test_negotiate_baudrate_auto_closes_the_connection_first():
+    """
+    The view's connection to the device is closed before the port is probed,
+    so the probe doesn't open a second handle on it.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = mu.logic.AUTO_BAUDRATE
+
+    def probe(port, preferred):
+        assert view.fs_session.close.call_count == 1
+        return 921600
+
+    with mock.patch('mu.logic.microfs.probe_baudrate', side_effect=probe):
+        ed.negotiate_baudrate('COM0')
+    assert view.fs_session.close.call_count == 1
+
+
+def test_negotiate_baudrate_auto_prefers_the_last_rate():
+    """
+    The rate found for the port last time is tried first.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = mu.logic.AUTO_BAUDRATE
+    ed.probed = {'COM0': 230400}
+    with mock.patch('mu.logic.microfs.probe_baudrate',
+                    return_value=230400) as probe:
+        assert ed.negotiate_baudrate('COM0') == 230400
+    probe.assert_called_once_with('COM0', preferred=230400)
+
+
+def test_negotiate_baudrate_auto_no_answer():
+    """
+    If the device doesn't answer at any baud rate, use the default.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.baudrate = mu.logic.AUTO_BAUDRATE
+    ed.probed = {'COM0': 921600}
+    with mock.patch('mu.logic.microfs.probe_baudrate', return_value=None):
+        assert ed.negotiate_baudrate('COM0') == 115200
+    assert ed.probed == {}
+
+
 def test_remove_repl_is_none():
     """
     If there's no repl to remove raise a RuntimeError.
@@ -631,15 +780,17 @@ def test_toggle_repl_off():
 
 def test_toggle_repl_with_fs():
     """
-    If the file system is active, show a helpful message instead.
+    If the file system is active, switch straight from it to the REPL.
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    ed.remove_repl = mock.MagicMock()
+    ed.remove_fs = mock.MagicMock()
+    ed.add_repl = mock.MagicMock()
     ed.repl = None
     ed.fs = True
     ed.toggle_repl()
-    assert view.show_message.call_count == 1
+    assert ed.remove_fs.call_count == 1
+    assert ed.add_repl.call_count == 1
 
 
 def test_toggle_theme_to_night():
@@ -1030,6 +1181,29 @@ def test_quit_save_theme():
     assert session['theme'] == 'night'
 
 
+def test_quit_save_probed_baudrates():
+    """
+    When saving the session, the baud rates found for each port are kept
+    so they're tried first next time.
+    """
+    view = mock.MagicMock()
+    view.modified = False
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.probed = {'COM0': 921600}
+    mock_open = mock.MagicMock()
+    mock_open.return_value.__enter__ = lambda s: s
+    mock_open.return_value.__exit__ = mock.Mock()
+    mock_open.return_value.write = mock.MagicMock()
+    with mock.patch('sys.exit', return_value=None), \
+            mock.patch('builtins.open', mock_open):
+        ed.quit()
+    recovered = ''.join([i[0][0] for i
+                        in mock_open.return_value.write.call_args_list])
+    session = json.loads(recovered)
+    assert session['probed_baudrates'] == {'COM0': 921600}
+
+
 def test_quit_calls_sys_exit():
     """
     Ensure that sys.exit(0) is called.
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the file system microbenchmark, against a simulated device.
+"""
+import pytest
+from unittest import mock
+from mu.contrib import microbench, microfs
+from mu.contrib.microsim import SimulatedDevice
+
+
+def test_run():
+    """
+    Every operation is measured, each transfer once per file size and chunk
+    size, and the benchmark file is removed from the device afterwards.
+    """
+    device = SimulatedDevice()
+    results = microbench.run(device, sizes=(100, 300), chunk_sizes=(64, ),
+                             repeat=2)
+    assert [result.operation for result in results] == [
+        'handshake', 'execute', 'ls',
+        'put', 'get', 'rm',
+        'put', 'get', 'rm',
+    ]
+    put = results[3]
+    assert (put.size, put.chunk_size) == (100, 64)
+    assert put.bytes_per_second == 100 / put.seconds
+    assert results[0].size is results[0].bytes_per_second is None
+    assert microbench.BENCH_FILENAME not in device.files
+
+
+def test_run_installs_the_helper_before_timing():
+    """
+    The helper is already on the device when the first operation through the
+    session is timed.
+    """
+    device = SimulatedDevice()
+    installed = []
+
+    def timed(operation, *args, **kwargs):
+        installed.append(microfs.HELPER_NAME in device.files)
+        return microbench.Result(operation.__name__, None, None, 0, None, 0)
+
+    with mock.patch('mu.contrib.microbench.timed', side_effect=timed):
+        microbench.run(device, sizes=(), repeat=1)
+    assert installed == [False, True, True]
+
+
+def test_run_leaves_the_chunk_sizes_alone():
+    """
+    Each chunk size is passed to put, rather than set globally, and every
+    operation is measured.
+    """
+    defaults = dict(microfs.CHUNK_SIZES)
+    results = microbench.run(SimulatedDevice(), sizes=(100, ),
+                             chunk_sizes=(32, 64), repeat=1)
+    assert microfs.CHUNK_SIZES == defaults
+    puts = [result for result in results if result.operation == 'put']
+    assert [result.chunk_size for result in puts] == [32, 64]
+    assert microbench.report(results)
+
+
+def test_run_round_trip_fails():
+    """
+    A file that comes back different from the one sent raises an IOError.
+    """
+    with mock.patch('mu.contrib.microfs.MicroFSSession.get_iter',
+                    return_value=iter([b'garbled'])):
+        with pytest.raises(IOError):
+            microbench.run(SimulatedDevice(), sizes=(100, ),
+                           chunk_sizes=(64, ), repeat=1)
+
+
+def test_report():
+    """
+    The results are laid out as a table, with blanks for what wasn't
+    measured.
+    """
+    results = [
+        microbench.Result('ls', None, None, 0.01, None, 0.002),
+        microbench.Result('put', 1024, 64, 0.5, 2048.0, 0.1),
+    ]
+    assert microbench.report(results).splitlines() == [
+        'operation  size  chunk     ms  bytes/s  cpu ms',
+        '       ls                10.0              2.0',
+        '      put  1024     64  500.0     2048   100.0',
+    ]
+
+
+def test_main_bench():
+    """
+    'ufs bench --simulate' benchmarks a simulated device.
+    """
+    with mock.patch('mu.contrib.microbench.run',
+                    return_value=[]) as run, \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['bench', '--simulate'])
+    assert isinstance(run.call_args[0][0], SimulatedDevice)
+    assert mock_print.call_count == 1
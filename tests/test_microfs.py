@@ -0,0 +1,1564 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the micro:bit file system module.
+"""
+import binascii
+import errno
+import struct
+import threading
+import time
+import zlib
+import pytest
+from collections import OrderedDict
+from unittest import mock
+from mu.contrib import microfs, transports
+from mu.contrib.microsim import SimulatedDevice
+from mu.contrib.transports import LoopbackTransport
+
+
+#: What a device without the ubinascii module reports on stderr.
+NO_UBINASCII = (b"Traceback (most recent call last):\r\n"
+                b"  File \"<stdin>\", line 1, in <module>\r\n"
+                b"ImportError: no module named 'ubinascii'\r\n")
+
+
+def written_by(commands, encoding):
+    """
+    Runs the chunk commands from encode_chunks as the device would, and
+    returns the bytes they write. Each chunk's checksum is checked too.
+    """
+    written = []
+    namespace = {'f': written.append}
+    exec(microfs.WRITER.format(0), namespace)
+    if encoding == 'base64':
+        namespace['u'] = binascii.a2b_base64
+    elif encoding == 'hex':
+        namespace['u'] = binascii.unhexlify
+    for command in commands:
+        exec(command, namespace)
+    return b''.join(written)
+
+
+class PasteDevice(object):
+    """
+    A stand-in for the serial connection to a device in raw mode, which
+    answers a request for raw-paste mode with reply and then acknowledges
+    each window of data it receives.
+    """
+
+    def __init__(self, reply=b'R\x01', window=8):
+        self.output = bytearray(reply)
+        self.pasting = reply == b'R\x01'
+        if self.pasting:
+            self.output.extend(struct.pack('<H', window))
+        self.window = window
+        self.received = bytearray()
+        self.writes = []
+
+    @property
+    def in_waiting(self):
+        return len(self.output)
+
+    def read(self, size=1):
+        data = bytes(self.output[:size])
+        del self.output[:size]
+        return data
+
+    def read_until(self, expected=b'\n'):
+        end = self.output.find(expected)
+        return self.read(len(self.output) if end < 0 else end + len(expected))
+
+    def write(self, data):
+        if data == b'\x05A\x01':
+            return
+        self.writes.append(data)
+        for byte in bytearray(data):
+            if byte == 4:
+                self.output.extend(b'\x04')
+                continue
+            self.received.append(byte)
+            if self.pasting and len(self.received) % self.window == 0:
+                self.output.extend(b'\x01')
+
+
+@pytest.mark.parametrize('encoding', ['repr', 'hex', 'base64'])
+def test_encode_chunks(encoding):
+    """
+    The content is split into chunks of the encoding's size, each of which
+    writes its part of the content once decoded on the device.
+    """
+    content = bytes(bytearray(range(256))) * 4
+    commands = list(microfs.encode_chunks(content, encoding))
+    size = microfs.CHUNK_SIZES[encoding]
+    assert len(commands) == (len(content) + size - 1) // size
+    assert written_by(commands, encoding) == content
+
+
+def test_encode_chunks_is_compact():
+    """
+    Binary content takes fewer bytes on the wire with base64 than with repr.
+    """
+    content = bytes(bytearray(range(256))) * 4
+    base64 = sum(len(c) for c in microfs.encode_chunks(content, 'base64'))
+    plain = sum(len(c) for c in microfs.encode_chunks(content, 'repr'))
+    assert base64 < plain / 2
+
+
+def test_encode_chunks_unknown_encoding():
+    """
+    An encoding that isn't understood raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        list(microfs.encode_chunks(b'x = 1\n', 'rot13'))
+
+
+def test_put_header():
+    """
+    The decoder for the encoding and the chunk writer are set up on the
+    device before the file is opened, for appending if there's an offset.
+    """
+    assert microfs.put_header('foo.py') == [
+        microfs.ENCODINGS['base64'],
+        microfs.WRITER.format(0),
+        "fd = open('foo.py', 'wb')",
+        "f = fd.write",
+    ]
+    assert microfs.put_header('foo.py', 'repr', 10) == [
+        microfs.WRITER.format(10),
+        "fd = open('foo.py', 'ab')",
+        "f = fd.write",
+    ]
+
+
+def test_put_commands():
+    """
+    The commands built by put_commands write the content and close the file.
+    """
+    commands = microfs.put_commands('foo.py', b'x = 1\n')
+    assert commands[:4] == microfs.put_header('foo.py')
+    assert written_by(commands[4:-1], 'base64') == b'x = 1\n'
+    assert commands[-1] == 'fd.close()'
+
+
+def test_put(tmpdir):
+    """
+    The file is written to the device a checksummed chunk at a time.
+    """
+    local = tmpdir.join('foo.py')
+    local.write_binary(bytes(range(256)) * 4)
+    device = SimulatedDevice()
+    assert microfs.put(device, str(local))
+    assert device.files['foo.py'] == bytes(range(256)) * 4
+
+
+def test_put_falls_back_to_repr(tmpdir):
+    """
+    If the device has no ubinascii module the file is sent again with the
+    'repr' encoding, which needs no decoder.
+    """
+    local = tmpdir.join('foo.py')
+    local.write_binary(b'x = 1\n')
+    device = SimulatedDevice(ubinascii=False)
+    with mock.patch('mu.contrib.microfs.write_file',
+                    wraps=microfs.write_file) as write_file:
+        with microfs.MicroFSSession(device, helper=False) as session:
+            assert microfs.put(session, str(local))
+    assert [c[0][3] for c in write_file.call_args_list] == ['base64', 'repr']
+    assert device.files == {'foo.py': b'x = 1\n'}
+
+
+def test_put_error(tmpdir):
+    """
+    Any other error on the device, such as running out of space, raises an
+    IOError.
+    """
+    local = tmpdir.join('foo.py')
+    local.write_binary(b'x' * 2048)
+    with pytest.raises(IOError) as ex:
+        microfs.put(SimulatedDevice(capacity=1024), str(local))
+    assert 'OSError' in str(ex.value)
+
+
+def test_put_resends_a_rejected_chunk(tmpdir):
+    """
+    A chunk that fails its checksum on the device is sent again, in smaller
+    pieces, from where the device got to.
+    """
+    local = tmpdir.join('foo.py')
+    local.write_binary(bytes(range(256)) * 4)
+    encode_chunk = microfs.encode_chunk
+    sizes = []
+
+    def garbled(chunk, *args):
+        command = encode_chunk(chunk, *args)
+        sizes.append(len(chunk))
+        if len(sizes) == 2:
+            return command.rsplit(',', 2)[0] + ', 0, 0)'
+        return command
+
+    device = SimulatedDevice()
+    with mock.patch('mu.contrib.microfs.encode_chunk', side_effect=garbled):
+        with microfs.MicroFSSession(device, helper=False) as session:
+            assert microfs.put(session, str(local))
+    assert device.files == {'foo.py': bytes(range(256)) * 4}
+    size = microfs.CHUNK_SIZES['base64']
+    # The rejected chunk is resent at half the size.
+    assert sizes[3] == size // 2
+
+
+def test_put_gives_up_after_retries(tmpdir):
+    """
+    A chunk that's rejected too many times in a row raises an IOError.
+    """
+    local = tmpdir.join('foo.py')
+    local.write_binary(b'x = 1\n')
+    encode_chunk = microfs.encode_chunk
+
+    def garbled(chunk, *args):
+        return encode_chunk(chunk, *args).rsplit(',', 2)[0] + ', 0, 0)'
+
+    with mock.patch('mu.contrib.microfs.encode_chunk', side_effect=garbled):
+        with pytest.raises(IOError) as ex:
+            microfs.put(SimulatedDevice(), str(local))
+    assert 'bad chunk' in str(ex.value)
+
+
+def test_put_missing_file(tmpdir):
+    """
+    Putting a local file that doesn't exist raises an IOError.
+    """
+    with pytest.raises(IOError):
+        microfs.put(mock.MagicMock(), str(tmpdir.join('missing.py')))
+
+
+def test_read_response():
+    """
+    The response is read in whatever pieces arrive, even with the
+    terminating prompt split between them, and split into stdout and
+    stderr.
+    """
+    mock_serial = mock.MagicMock()
+    mock_serial.in_waiting = 0
+    mock_serial.read.side_effect = [b'OKhel', b'', b'lo\r\n\x04',
+                                    b'oops\x04', b'>']
+    assert microfs.read_response(mock_serial) == (b'hello\r\n', b'oops')
+    assert mock_serial.read.call_count == 5
+    assert mock_serial.read_all.call_count == 0
+
+
+def test_read_response_takes_what_is_waiting():
+    """
+    Each read takes everything that's already waiting, rather than a byte
+    at a time.
+    """
+    mock_serial = mock.MagicMock()
+    mock_serial.in_waiting = 11
+    mock_serial.read.return_value = b'OK[]\r\n\x04\x04>'
+    assert microfs.read_response(mock_serial) == (b'[]\r\n', b'')
+    mock_serial.read.assert_called_once_with(11)
+
+
+def test_raw_paste_write():
+    """
+    In raw-paste mode no more than a window of data is sent before the
+    device acknowledges it, and the end of the data is acknowledged too.
+    """
+    device = PasteDevice(window=8)
+    command = b'print(' + b'1 + ' * 10 + b'1)'
+    assert microfs.raw_paste_write(device, command)
+    assert bytes(device.received) == command
+    assert all(len(data) <= 8 for data in device.writes)
+    assert device.writes[-1] == b'\x04'
+    assert not device.in_waiting
+
+
+def test_raw_paste_write_unsupported():
+    """
+    Firmware without raw-paste mode re-prints the raw prompt, which is
+    consumed, and nothing is sent.
+    """
+    device = PasteDevice(reply=b'raw REPL; CTRL-B to exit\r\n>')
+    assert microfs.raw_paste_write(device, b'print(1)') is False
+    assert not device.received
+    assert not device.in_waiting
+
+
+def test_raw_paste_write_refused():
+    """
+    A device that refuses raw-paste mode is sent nothing.
+    """
+    device = PasteDevice(reply=b'R\x00')
+    assert microfs.raw_paste_write(device, b'print(1)') is False
+    assert not device.received
+
+
+def test_run_commands_falls_back_to_paced_writes():
+    """
+    Without raw-paste mode each command is written in short bursts, with a
+    pause between each, and that raw-paste mode is unavailable is learned.
+    """
+    mock_serial = mock.MagicMock()
+    mock_serial.in_waiting = 0
+    mock_serial.read.side_effect = [
+        b'raw REPL; CTRL-B to exit\r\n>'[:2], b'OK\x04\x04>']
+    mock_serial.read_until.return_value = b'w REPL; CTRL-B to exit\r\n>'
+    command = 'x = ' + '1' * 70
+    with mock.patch('time.sleep') as sleep:
+        assert microfs.run_commands([command], mock_serial) == (b'', b'',
+                                                                False, None)
+    writes = [call[0][0] for call in mock_serial.write.call_args_list]
+    assert writes[0] == b'\x05A\x01'
+    assert b''.join(writes[1:-1]) == command.encode('utf-8')
+    assert all(len(data) <= microfs.WRITE_CHUNK_SIZE for data in writes[1:])
+    assert writes[-1] == b'\x04'
+    assert sleep.call_count == 3
+
+
+def test_run_commands_raw_paste():
+    """
+    Once raw-paste mode is known to work every submission is sent with it,
+    and the response has no "OK" header.
+    """
+    mock_serial = mock.MagicMock()
+    mock_serial.in_waiting = 0
+    with mock.patch('mu.contrib.microfs.raw_paste_write',
+                    return_value=True) as raw_paste_write:
+        mock_serial.read.side_effect = [b'1\r\n\x04\x04>',
+                                        b'2\r\n\x04\x04>']
+        result = microfs.run_commands(['print(1)', 'print(2)'], mock_serial,
+                                      True, budget=0)
+    assert result == (b'1\r\n2\r\n', b'', True, None)
+    assert raw_paste_write.call_count == 2
+
+
+def test_coalesce():
+    """
+    Consecutive commands are grouped up to the budget (counting the newline
+    that joins them), and a command bigger than the budget goes on its own.
+    """
+    assert list(microfs.coalesce(['ab', 'cd', 'efgh'], 6)) == [
+        ['ab', 'cd'], ['efgh']]
+    assert list(microfs.coalesce(['x' * 10, 'y'], 4)) == [['x' * 10], ['y']]
+    assert list(microfs.coalesce(['a', 'b'], 0)) == [['a'], ['b']]
+
+
+def test_attribute():
+    """
+    An error from joined commands is traced to the command that caused it,
+    with line numbers relative to that command.
+    """
+    commands = ['a = 1', 'def f():\n    1/0', 'f()']
+    err = (b'Traceback (most recent call last):\r\n'
+           b'  File "<stdin>", line 4, in <module>\r\n'
+           b'  File "<stdin>", line 3, in f\r\n'
+           b'ZeroDivisionError: division by zero\r\n')
+    assert microfs.attribute(err, commands) == (2, (
+        b'Traceback (most recent call last):\r\n'
+        b'  File "<stdin>", line 1, in <module>\r\n'
+        b'  File "<stdin>", line 2, in f\r\n'
+        b'ZeroDivisionError: division by zero\r\n'))
+    assert microfs.attribute(b'OSError: 28\r\n', commands) == (
+        0, b'OSError: 28\r\n')
+
+
+def test_run_commands_coalesces():
+    """
+    Consecutive commands are sent to the device as a single submission.
+    """
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=False) as session:
+        session.execute(['pass'])
+        before = device.commands
+        assert session.run(['x = 1', 'print(x)', 'print(2)']) == (
+            b'1\r\n2\r\n', b'', None)
+        assert device.commands == before + 1
+        session.budget = 0
+        assert session.run(['print(x)', 'print(3)']) == (
+            b'1\r\n3\r\n', b'', None)
+        assert device.commands == before + 3
+
+
+def test_run_commands_attributes_errors():
+    """
+    An error in joined commands reads exactly as it would if the command
+    that caused it had been sent on its own, and later commands don't run.
+    """
+    failing = 'def g():\n    1/0\n\ng()'
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=False) as session:
+        alone = session.execute([failing])
+        out, err, failed = session.run(['x = 1', 'y = 2\nprint(x)', failing,
+                                        'z = 3'])
+        assert (b'', err, failed) == (b'', alone[1], 2)
+        assert b'line 2, in g' in err
+        assert session.execute(['print(x)', "print('z' in globals())"]) == (
+            b'1\r\nFalse\r\n', b'')
+
+
+def test_run_commands_resends_after_a_compile_error():
+    """
+    If joined commands fail to compile nothing ran, so they're sent again
+    one at a time to find the one at fault.
+    """
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=False) as session:
+        alone = session.execute(['y = ('])
+        out, err, failed = session.run(['x = 1', 'y = (', 'print(3)'])
+        assert (err, failed) == (alone[1], 1)
+        assert session.execute(['print(x)']) == (b'1\r\n', b'')
+
+
+def printed(blocks, encoding):
+    """
+    Returns the output of the device side get command for the blocks of a
+    file: one encoded bytes literal per line.
+    """
+    encoder = {
+        'base64': binascii.b2a_base64,
+        'hex': binascii.hexlify,
+        'repr': bytes,
+    }[encoding]
+    return b''.join(repr(encoder(block)).encode('ascii') + b'\r\n'
+                    for block in blocks)
+
+
+@pytest.mark.parametrize('encoding', ['repr', 'hex', 'base64'])
+def test_get_iter(encoding):
+    """
+    Each line of output is decoded into a block of the file, however the
+    output is split as it arrives.
+    """
+    blocks = [bytes(bytearray(range(256))), b'\x04\r\n\x04>']
+    output = printed(blocks, encoding)
+    pieces = [output[i:i + 7] for i in range(0, len(output), 7)]
+    with mock.patch('mu.contrib.microfs.execute_iter',
+                    return_value=iter(pieces)) as execute_iter:
+        assert list(microfs.get_iter(mock.MagicMock(), 'a.bin',
+                                     encoding)) == blocks
+    command = execute_iter.call_args[0][0]
+    assert microfs.GET_ENCODERS[encoding] in command
+    assert "open('a.bin', 'rb')" in command
+
+
+def test_get_iter_falls_back_to_repr():
+    """
+    If the device has no ubinascii module the file is read again with the
+    'repr' encoding.
+    """
+    def execute_iter(command, serial):
+        if 'ubinascii' in command:
+            raise IOError(microfs.clean_error(NO_UBINASCII))
+        yield printed([b'x = 1\n'], 'repr')
+    with mock.patch('mu.contrib.microfs.execute_iter', execute_iter):
+        assert list(microfs.get_iter(mock.MagicMock(), 'a.py')) == [
+            b'x = 1\n']
+
+
+def test_get(tmpdir):
+    """
+    The file is written to the target as it arrives, and the callback is
+    told how much has been received.
+    """
+    target = tmpdir.join('copy.bin')
+    progress = []
+    with mock.patch('mu.contrib.microfs.get_iter',
+                    return_value=iter([b'abc', b'de'])):
+        assert microfs.get(mock.MagicMock(), 'a.bin', str(target),
+                           lambda name, size: progress.append((name, size)))
+    assert target.read_binary() == b'abcde'
+    assert progress == [('a.bin', 3), ('a.bin', 5)]
+
+
+def test_get_error(tmpdir):
+    """
+    If the file can't be read an IOError is raised, and no partial copy is
+    left behind.
+    """
+    target = tmpdir.join('copy.bin')
+
+    def get_iter(serial, filename, encoding):
+        yield b'abc'
+        raise IOError('Gone.')
+    with mock.patch('mu.contrib.microfs.get_iter', get_iter):
+        with pytest.raises(IOError):
+            microfs.get(mock.MagicMock(), 'a.bin', str(target))
+    assert tmpdir.listdir() == []
+
+
+def test_iter_response():
+    """
+    The stdout of a command is generated as it arrives, without its header.
+    Anything on stderr raises an IOError.
+    """
+    mock_serial = mock.MagicMock()
+    mock_serial.in_waiting = 0
+    mock_serial.read.side_effect = [b'O', b'K', b'one', b'two\x04\x04>']
+    assert list(microfs.iter_response(mock_serial)) == [b'one', b'two']
+    mock_serial.read.side_effect = [b'one\x04Trace', b'back\r\n',
+                                    b'OSError: 2\r\n\x04>']
+    with pytest.raises(IOError) as ex:
+        list(microfs.iter_response(mock_serial, b''))
+    assert str(ex.value) == 'OSError: 2'
+
+
+def test_rm_many():
+    """
+    All the files are removed with a single command, and each file the
+    device couldn't remove is reported.
+    """
+    with mock.patch('mu.contrib.microfs.execute',
+                    return_value=(b"['b.py']\r\n", b'')) as execute:
+        results = microfs.rm_many(mock.MagicMock(), ['a.py', 'b.py'])
+    assert execute.call_count == 1
+    assert "for n in ['a.py', 'b.py']:" in '\n'.join(execute.call_args[0][0])
+    assert results['a.py'] is True
+    assert str(results['b.py']) == 'Could not remove b.py.'
+
+
+def test_put_many_packs_small_files(tmpdir):
+    """
+    Small files are packed into a single submission, while a big (or
+    missing) file is put on its own.
+    """
+    paths = []
+    for name, size in (('a.py', 10), ('b.py', 10), ('big.py', 2000),
+                       ('missing.py', 0)):
+        local = tmpdir.join(name)
+        if size:
+            local.write_binary(b'#' * size)
+        paths.append(str(local))
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=False) as session:
+        with mock.patch.object(session, 'execute',
+                               wraps=session.execute) as execute, \
+                mock.patch('mu.contrib.microfs.put',
+                           wraps=microfs.put) as put:
+            results = microfs.put_many(session, paths)
+    assert execute.call_args_list[0] == mock.call(['import ubinascii'])
+    packed = execute.call_args_list[1][0][0][0]
+    assert "open('a.py', 'wb')" in packed
+    assert "open('b.py', 'wb')" in packed
+    assert [call[0][1] for call in put.call_args_list] == paths[2:]
+    assert list(results) == paths
+    assert results[paths[0]] is results[paths[1]] is results[paths[2]] is True
+    assert isinstance(results[paths[3]], IOError)
+    assert device.files == {'a.py': b'#' * 10, 'b.py': b'#' * 10,
+                            'big.py': b'#' * 2000}
+
+
+def test_put_many_retries_a_failed_group(tmpdir):
+    """
+    If a packed group fails, its files are put one at a time so the problem
+    is reported for the right file.
+    """
+    paths = []
+    for name in ('a.py', 'b.py'):
+        local = tmpdir.join(name)
+        local.write_binary(b'x = 1\n')
+        paths.append(str(local))
+    device = SimulatedDevice()
+    store = device.store
+
+    def full_for_b(name, content):
+        if name == 'b.py':
+            raise OSError(errno.ENOSPC, 'ENOSPC')
+        store(name, content)
+
+    device.store = full_for_b
+    with mock.patch('mu.contrib.microfs.put', wraps=microfs.put) as put:
+        results = microfs.put_many(device, paths)
+    assert put.call_count == 2
+    assert results[paths[0]] is True
+    assert 'ENOSPC' in str(results[paths[1]])
+    assert device.files['a.py'] == b'x = 1\n'
+    assert 'b.py' not in device.files
+
+
+def test_get_many(tmpdir):
+    """
+    Each file is copied into the target directory in the same session, and
+    a problem with one file doesn't stop the others.
+    """
+    serial = mock.MagicMock()
+    with mock.patch('mu.contrib.microfs.get',
+                    side_effect=[True, IOError('Gone.')]) as get:
+        results = microfs.get_many(serial, ['a.py', 'b.py'], str(tmpdir))
+    session = get.call_args_list[0][0][0]
+    assert isinstance(session, microfs.MicroFSSession)
+    assert session.serial is serial
+    assert get.call_args_list[1][0][0] is session
+    assert get.call_args_list[0][0][2] == str(tmpdir.join('a.py'))
+    assert results['a.py'] is True
+    assert str(results['b.py']) == 'Gone.'
+
+
+def test_main_handles_several_files():
+    """
+    The rm, put and get commands take several files, which are handled by
+    the batch operations. Only problems are printed.
+    """
+    results = OrderedDict([('a.py', True), ('b.py', IOError('Oops.'))])
+    for command in ('rm', 'put', 'get'):
+        with mock.patch('mu.contrib.microfs.get_serial'), \
+                mock.patch('mu.contrib.microfs.{}_many'.format(command),
+                           return_value=results) as operation, \
+                mock.patch('builtins.print') as mock_print:
+            microfs.main([command, 'a.py', 'b.py'])
+        assert operation.call_args[0][1] == ['a.py', 'b.py']
+        mock_print.assert_called_once_with('b.py: Oops.')
+
+
+def test_pack(tmpdir):
+    """
+    Consecutive small files share a group of commands, while big or missing
+    files get a group of their own, without commands.
+    """
+    paths = []
+    for name, size in (('a.py', 10), ('big.py', 2000), ('b.py', 10),
+                       ('c.py', 10), ('missing.py', 0)):
+        local = tmpdir.join(name)
+        if size:
+            local.write_binary(b'#' * size)
+        paths.append(str(local))
+    groups, checksums = microfs.pack(paths)
+    assert [names for names, commands in groups] == [
+        paths[:1], paths[1:2], paths[2:4], paths[4:]]
+    assert groups[1][1] is groups[3][1] is None
+    joined = '\n'.join(groups[2][1])
+    assert "open('b.py', 'wb')" in joined
+    assert "open('c.py', 'wb')" in joined
+    assert len(joined) < microfs.PACK_SIZE
+    assert checksums[paths[0]] == (10, zlib.adler32(b'#' * 10) & 0xffffffff)
+    assert paths[4] not in checksums
+
+
+@pytest.mark.parametrize('helper', [True, False])
+def test_many_on_a_device(tmpdir, helper):
+    """
+    put_many sends small files in a single submission, get_many copies
+    files back, and rm_many removes them with a single command. A problem
+    with one file is reported for that file and doesn't stop the others.
+    """
+    paths = []
+    for name in ('a.py', 'b.py'):
+        local = tmpdir.join(name)
+        local.write_binary(name.encode('ascii') * 10)
+        paths.append(str(local))
+    copies = tmpdir.mkdir('copies')
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=helper) as session:
+        assert session.ls() == []
+        before = device.commands
+        results = microfs.put_many(session, paths)
+        # Checking for ubinascii, then the packed files.
+        assert device.commands == before + 2
+        assert list(results.values()) == [True, True]
+        results = microfs.get_many(session, ['a.py', 'missing.py', 'b.py'],
+                                   str(copies))
+        assert results['a.py'] is results['b.py'] is True
+        assert isinstance(results['missing.py'], IOError)
+        before = device.commands
+        results = microfs.rm_many(session, ['a.py', 'missing.py'])
+        assert device.commands == before + 1
+        assert session.ls() == ['b.py']
+    assert results['a.py'] is True
+    assert str(results['missing.py']) == 'Could not remove missing.py.'
+    assert sorted(copies.listdir()) == [copies.join('a.py'),
+                                        copies.join('b.py')]
+    assert copies.join('a.py').read_binary() == b'a.py' * 10
+    assert device.files['b.py'] == b'b.py' * 10
+
+
+def test_main_handles_several_files_on_a_device(tmpdir):
+    """
+    'ufs put', 'get' and 'rm' with several paths copy or remove each of
+    them on the device, and print only the problems.
+    """
+    device = SimulatedDevice()
+    tmpdir.join('a.py').write_binary(b'a = 1\n')
+    tmpdir.join('b.py').write_binary(b'b = 1\n')
+    with tmpdir.as_cwd(), \
+            mock.patch('mu.contrib.transports.connect',
+                       return_value=device), \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['put', 'a.py', 'b.py', 'missing.py', '--port', 'sim'])
+        assert device.files['a.py'] == b'a = 1\n'
+        assert device.files['b.py'] == b'b = 1\n'
+        mock_print.assert_called_once_with('missing.py: No such file.')
+        tmpdir.join('a.py').remove()
+        tmpdir.join('b.py').remove()
+        microfs.main(['get', 'a.py', 'b.py', '--port', 'sim'])
+        assert tmpdir.join('a.py').read_binary() == b'a = 1\n'
+        assert tmpdir.join('b.py').read_binary() == b'b = 1\n'
+        microfs.main(['rm', 'a.py', 'b.py', '--port', 'sim'])
+    assert 'a.py' not in device.files
+    assert 'b.py' not in device.files
+    assert mock_print.call_count == 1
+
+
+def test_hashes():
+    """
+    The checksum of each file is computed on the device.
+    """
+    out = b"[('a.py', 1, 2, 10), ('b.py', 3, 4, 20)]\r\n"
+    with mock.patch('mu.contrib.microfs.execute',
+                    return_value=(out, b'')) as execute:
+        assert microfs.hashes(mock.MagicMock()) == {
+            'a.py': 0x10002,
+            'b.py': 0x30004,
+        }
+    assert execute.call_args[0][0] == [microfs.HASH_COMMAND]
+
+
+def test_sync(tmpdir):
+    """
+    Only new and changed files are put on the device and, with delete,
+    files that aren't in the directory are removed from it.
+    """
+    for name in ('same.py', 'changed.py', 'new.py'):
+        tmpdir.join(name).write_binary(name.encode('ascii'))
+    tmpdir.mkdir('subdirectory')
+    remote = {
+        'same.py': zlib.adler32(b'same.py') & 0xffffffff,
+        'changed.py': 1,
+        'old.py': 1,
+    }
+    put_results = OrderedDict([('changed.py', True), ('new.py', True)])
+    rm_results = OrderedDict([('old.py', True)])
+    for delete in (False, True):
+        with mock.patch('mu.contrib.microfs.hashes', return_value=remote), \
+                mock.patch('mu.contrib.microfs.put_many',
+                           return_value=put_results) as put_many, \
+                mock.patch('mu.contrib.microfs.rm_many',
+                           return_value=rm_results) as rm_many:
+            results = microfs.sync(mock.MagicMock(), str(tmpdir), delete)
+        assert put_many.call_args[0][1] == [str(tmpdir.join('changed.py')),
+                                            str(tmpdir.join('new.py'))]
+        expected = ['changed.py', 'new.py']
+        if delete:
+            rm_many.assert_called_once_with(put_many.call_args[0][0],
+                                            ['old.py'])
+            expected.append('old.py')
+        else:
+            assert rm_many.call_count == 0
+        assert list(results) == expected
+
+
+def test_main_sync():
+    """
+    The sync command syncs the current directory, or the one given, and
+    prints the files it copied or removed along with any problems.
+    """
+    results = OrderedDict([('a.py', True), ('b.py', IOError('Oops.'))])
+    with mock.patch('mu.contrib.microfs.get_serial'), \
+            mock.patch('mu.contrib.microfs.sync',
+                       return_value=results) as sync, \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['sync'])
+        assert sync.call_args[0][1:] == ('.', False)
+        microfs.main(['sync', 'foo', '--delete'])
+        assert sync.call_args[0][1:] == ('foo', True)
+    assert mock_print.call_args_list[:2] == [mock.call('a.py'),
+                                             mock.call('b.py: Oops.')]
+
+
+@pytest.mark.parametrize('helper', [True, False])
+def test_sync_on_a_device(tmpdir, helper):
+    """
+    Only new and changed files are copied, and with delete the device's
+    other files are removed, but never the helper module. Once the device
+    matches, syncing again takes a single command.
+    """
+    for name in ('same.py', 'changed.py', 'new.py'):
+        tmpdir.join(name).write_binary(name.encode('ascii'))
+    tmpdir.mkdir('subdirectory')
+    device = SimulatedDevice(files={'same.py': b'same.py',
+                                    'changed.py': b'old',
+                                    'old.py': b'old'})
+    with microfs.MicroFSSession(device, helper=helper) as session:
+        results = microfs.sync(session, str(tmpdir))
+        assert results == {'changed.py': True, 'new.py': True}
+        assert 'old.py' in device.files
+        assert microfs.sync(session, str(tmpdir), delete=True) == {
+            'old.py': True}
+        before = device.commands
+        assert microfs.sync(session, str(tmpdir), delete=True) == {}
+        assert device.commands == before + 1
+    assert (microfs.HELPER_NAME in device.files) is helper
+    assert dict((name, content) for name, content in device.files.items()
+                if name != microfs.HELPER_NAME) == {
+        'same.py': b'same.py',
+        'changed.py': b'changed.py',
+        'new.py': b'new.py',
+    }
+
+
+def test_main_sync_on_a_device(tmpdir):
+    """
+    'ufs sync --delete' makes the device match the directory and prints
+    what was copied or removed.
+    """
+    tmpdir.join('main.py').write_binary(b'x = 1\n')
+    device = SimulatedDevice(files={'old.py': b''})
+    with mock.patch('mu.contrib.transports.connect', return_value=device), \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['sync', str(tmpdir), '--delete', '--port', 'sim'])
+    assert mock_print.call_args_list == [mock.call('main.py'),
+                                         mock.call('old.py')]
+    assert device.files['main.py'] == b'x = 1\n'
+    assert 'old.py' not in device.files
+
+
+@pytest.mark.parametrize('raw_paste', [True, False])
+@pytest.mark.parametrize('helper', [True, False])
+def test_put_and_get_round_trip(tmpdir, raw_paste, helper):
+    """
+    A file is copied onto a simulated device and back intact, with or
+    without raw-paste mode and the helper module.
+    """
+    device = SimulatedDevice(raw_paste=raw_paste)
+    local = tmpdir.join('data.bin')
+    content = bytes(bytearray(range(256))) * 6
+    local.write_binary(content)
+    copy = tmpdir.join('copy.bin')
+    progress = []
+    with microfs.MicroFSSession(device, helper=helper) as session:
+        assert session.put(str(local))
+        assert session.ls() == ['data.bin']
+        assert session.get('data.bin', str(copy),
+                           lambda name, size: progress.append(size))
+        assert session.raw_paste is raw_paste
+    assert device.files['data.bin'] == content
+    assert copy.read_binary() == content
+    assert progress[-1] == len(content)
+    assert (microfs.HELPER_NAME in device.files) is helper
+
+
+@pytest.mark.parametrize('encoding', ['repr', 'hex', 'base64'])
+def test_put_and_get_encodings(tmpdir, encoding):
+    """
+    Each of the encodings carries binary content intact.
+    """
+    device = SimulatedDevice()
+    local = tmpdir.join('data.bin')
+    content = bytes(bytearray(range(256)))
+    local.write_binary(content)
+    assert microfs.put(device, str(local), encoding)
+    assert device.files['data.bin'] == content
+    copy = tmpdir.join('copy.bin')
+    assert microfs.get(device, 'data.bin', str(copy), encoding=encoding)
+    assert copy.read_binary() == content
+
+
+def test_put_and_get_without_ubinascii(tmpdir):
+    """
+    Firmware without ubinascii falls back to the 'repr' encoding.
+    """
+    device = SimulatedDevice(ubinascii=False)
+    local = tmpdir.join('data.bin')
+    content = b'\x00\x01binary\xff'
+    local.write_binary(content)
+    copy = tmpdir.join('copy.bin')
+    with microfs.MicroFSSession(device) as session:
+        assert session.put(str(local))
+        assert session.get('data.bin', str(copy))
+    assert device.files['data.bin'] == content
+    assert copy.read_binary() == content
+
+
+@pytest.mark.parametrize('helper', [True, False])
+def test_session_remembers_the_lack_of_ubinascii(tmpdir, helper):
+    """
+    Once a session has found the device has no ubinascii, later transfers
+    use 'repr' straight away rather than failing first.
+    """
+    device = SimulatedDevice(ubinascii=False)
+    paths = []
+    for name in ('a.py', 'b.py', 'c.py'):
+        local = tmpdir.join(name)
+        local.write_binary(name.encode('ascii') * 10)
+        paths.append(str(local))
+    with microfs.MicroFSSession(device, helper=helper) as session:
+        assert session.put(paths[0])
+        assert session.ubinascii is False
+        before = device.commands
+        assert session.put(paths[1])
+        assert session.put(paths[2])
+        assert device.commands == before + 2
+        before = device.commands
+        assert session.get('a.py', str(tmpdir.join('copy.py')))
+        assert device.commands == before + 1
+        before = device.commands
+        assert list(microfs.put_many(session, paths).values()) == [True] * 3
+        assert device.commands == before + 1
+    assert tmpdir.join('copy.py').read_binary() == b'a.py' * 10
+
+
+def test_put_many_checks_for_ubinascii_first(tmpdir):
+    """
+    put_many finds out whether the device has ubinascii before packing the
+    files, so on a device without it they're packed in 'repr' at once.
+    """
+    device = SimulatedDevice(ubinascii=False)
+    paths = []
+    for name in ('a.py', 'b.py'):
+        local = tmpdir.join(name)
+        local.write_binary(b'x = 1\n')
+        paths.append(str(local))
+    with microfs.MicroFSSession(device, helper=False) as session:
+        session.ls()
+        before = device.commands
+        results = microfs.put_many(session, paths)
+        assert device.commands == before + 2
+        assert session.has_ubinascii() is False
+    assert list(results.values()) == [True, True]
+    assert device.files == {'a.py': b'x = 1\n', 'b.py': b'x = 1\n'}
+
+
+def test_get_missing_file(tmpdir):
+    """
+    Getting a file that isn't on the device raises an IOError, and leaves
+    no partial copy behind.
+    """
+    target = tmpdir.join('missing.py')
+    with pytest.raises(IOError):
+        microfs.get(SimulatedDevice(), 'missing.py', str(target))
+    assert not target.exists()
+
+
+def test_get_keeps_an_existing_file(tmpdir):
+    """
+    A local file is only replaced once the whole of its new content has
+    arrived, so a failed get leaves it as it was.
+    """
+    target = tmpdir.join('a.py')
+    target.write_binary(b'precious')
+    device = SimulatedDevice(files={'a.py': b'x = 1\n'})
+    with pytest.raises(IOError):
+        microfs.get(device, 'missing.py', str(target))
+    assert target.read_binary() == b'precious'
+
+    def get_iter(serial, filename, encoding):
+        yield b'abc'
+        raise IOError('Gone.')
+    with mock.patch('mu.contrib.microfs.get_iter', get_iter):
+        with pytest.raises(IOError):
+            microfs.get(device, 'a.py', str(target))
+    assert target.read_binary() == b'precious'
+    assert tmpdir.listdir() == [target]
+    assert microfs.get(device, 'a.py', str(target))
+    assert target.read_binary() == b'x = 1\n'
+    assert tmpdir.listdir() == [target]
+
+
+def test_put_verify(tmpdir):
+    """
+    With verify, the checksum of the file written is checked on the device,
+    and a mismatch raises an IOError.
+    """
+    device = SimulatedDevice()
+    local = tmpdir.join('a.py')
+    local.write_binary(b'x = 1\n')
+    with microfs.MicroFSSession(device) as session:
+        assert session.put(str(local), verify=True)
+        with mock.patch('mu.contrib.microfs.file_checksum',
+                        return_value=(6, 0)):
+            with pytest.raises(IOError) as ex:
+                session.put(str(local), verify=True)
+    assert 'Verification of a.py failed.' in str(ex.value)
+
+
+def test_put_resume(tmpdir):
+    """
+    With resume, only the part of the file the device doesn't already have
+    is sent. A file on the device that starts differently is replaced.
+    """
+    content = bytes(bytearray(range(256))) * 4
+    local = tmpdir.join('data.bin')
+    local.write_binary(content)
+    device = SimulatedDevice(files={'data.bin': content[:600]}, append=True)
+    with mock.patch('mu.contrib.microfs.write_file',
+                    wraps=microfs.write_file) as write_file:
+        with microfs.MicroFSSession(device) as session:
+            assert session.put(str(local), resume=True)
+            assert write_file.call_args[0][4] == 600
+            assert device.files['data.bin'] == content
+            device.files['data.bin'] = b'something else'
+            assert session.put(str(local), resume=True)
+            assert write_file.call_args[0][4] == 0
+    assert device.files['data.bin'] == content
+
+
+@pytest.mark.parametrize('helper', [True, False])
+def test_put_resume_without_append(tmpdir, helper):
+    """
+    On a device that can't append to files (such as the micro:bit), a resumed
+    put writes the whole file afresh.
+    """
+    content = bytes(bytearray(range(256))) * 4
+    local = tmpdir.join('data.bin')
+    local.write_binary(content)
+    device = SimulatedDevice(files={'data.bin': content[:600]})
+    with mock.patch('mu.contrib.microfs.write_file',
+                    wraps=microfs.write_file) as write_file:
+        with microfs.MicroFSSession(device, helper=helper) as session:
+            assert session.put(str(local), resume=True)
+    offsets = [call[0][4] if len(call[0]) > 4 else 0
+               for call in write_file.call_args_list
+               if call[0][1] == 'data.bin']
+    assert offsets == [600, 0]
+    assert device.files['data.bin'] == content
+
+
+def test_rm():
+    """
+    Files are removed from the device, and removing a missing one raises an
+    IOError.
+    """
+    device = SimulatedDevice(files={'a.py': b'', 'b.py': b''})
+    with microfs.MicroFSSession(device) as session:
+        assert session.rm('a.py')
+        assert session.ls() == ['b.py']
+        with pytest.raises(IOError):
+            session.rm('a.py')
+    assert sorted(device.files) == [microfs.HELPER_NAME, 'b.py']
+
+
+def slow_device(**kwargs):
+    """
+    Returns a simulated device that takes a millisecond to consume each
+    byte, so anything sizeable takes a while to answer.
+    """
+    return SimulatedDevice(uart_buffer=10 ** 6, char_time=0.001,
+                           timeout=0.05, **kwargs)
+
+
+def test_session_timeout(tmpdir):
+    """
+    An operation that runs past the session's timeout raises
+    OperationTimeout, and the session recovers for the next one.
+    """
+    local = tmpdir.join('big.bin')
+    local.write_binary(b'x' * 4000)
+    session = microfs.MicroFSSession(slow_device(), timeout=0.3)
+    start = time.time()
+    with pytest.raises(microfs.OperationTimeout):
+        session.put(str(local))
+    assert time.time() - start < 2
+    assert not session.raw
+    # The device answers (to whatever it's asked next) once it catches up.
+    session.timeout = 30
+    assert session.execute(['print(1)']) == (b'1\r\n', b'')
+    session.close()
+
+
+def test_session_cancel(tmpdir):
+    """
+    An operation under way can be cancelled from another thread.
+    """
+    local = tmpdir.join('big.bin')
+    local.write_binary(b'x' * 4000)
+    session = microfs.MicroFSSession(slow_device())
+    timer = threading.Timer(0.2, session.cancel)
+    timer.start()
+    try:
+        with pytest.raises(microfs.OperationCancelled):
+            session.put(str(local))
+    finally:
+        timer.cancel()
+    session.close()
+
+
+def test_execute_deadline():
+    """
+    A command that takes too long to answer raises OperationTimeout.
+    """
+    with pytest.raises(microfs.OperationTimeout):
+        microfs.execute(['print({!r})'.format('x' * 500)], slow_device(),
+                        microfs.Deadline(0.1))
+
+
+def test_details():
+    """
+    The size of each file and the free space are listed, and updated as
+    files are removed until the device is asked again.
+    """
+    device = SimulatedDevice(files={'a.py': b'x' * 200}, capacity=1024)
+    with microfs.MicroFSSession(device, helper=False) as session:
+        files, free = session.details()
+        assert files == {'a.py': 200}
+        assert free == 1024 - 256
+        session.rm('a.py')
+        assert session.details() == ({}, 1024 - 256 + 200)
+        assert session.details(refresh=True) == ({}, 1024)
+
+
+def test_simulated_device_overflows():
+    """
+    Bytes that arrive faster than the simulated device can consume them are
+    lost once its UART buffer is full, unless they're paced.
+    """
+    device = SimulatedDevice(uart_buffer=16, char_time=0.001)
+    device.write(b'\x01' * 100)
+    assert device.overflows > 0
+    device = SimulatedDevice(uart_buffer=64, char_time=0.0001)
+    with mock.patch('mu.contrib.microfs.WRITE_DELAY', 0.01):
+        microfs.paced_write(device, b'#' * 200)
+    assert device.overflows == 0
+
+
+def test_main_probe():
+    """
+    'ufs probe' prints the baud rate found for each device.
+    """
+    with mock.patch('mu.contrib.microfs.probe_baudrate',
+                    return_value=230400), \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['probe', '--port', 'COM1'])
+    mock_print.assert_called_once_with('COM1: 230400')
+
+
+def devices_at(*ports):
+    """
+    Returns a dict mapping each of the ports to a simulated device with a
+    file named after the port.
+    """
+    return dict((port, SimulatedDevice(files={port + '.py': b''}, port=port))
+                for port in ports)
+
+
+def test_fleet():
+    """
+    The operation runs on every device at once, each with its own session,
+    and the result and time taken are returned for each port in order.
+    """
+    devices = devices_at('COM1', 'COM2', 'COM3')
+    barrier = threading.Barrier(3, timeout=5)
+
+    def operation(session):
+        barrier.wait()
+        return session.ls()
+    with mock.patch('mu.contrib.microfs.find_upython_devices',
+                    return_value=['COM1', 'COM2', 'COM3']):
+        results = microfs.fleet(operation, connect=devices.get)
+    assert list(results) == ['COM1', 'COM2', 'COM3']
+    for port, (result, seconds) in results.items():
+        assert result == [port + '.py']
+        assert seconds >= 0
+        assert not devices[port].is_open
+
+
+def test_fleet_reports_errors_per_device():
+    """
+    A device that fails has its error as its result, and the rest carry on.
+    """
+    devices = devices_at('COM1')
+
+    def connect(port):
+        if port not in devices:
+            raise IOError('No such port.')
+        return devices[port]
+    results = microfs.fleet(microfs.ls, ['COM1', 'COM2'], workers=1,
+                            connect=connect)
+    assert results['COM1'].result == ['COM1.py']
+    assert str(results['COM2'].result) == 'No such port.'
+
+
+def test_fleet_reports_any_exception_per_device():
+    """
+    Any exception, not just an IOError, is kept as the result of the device
+    it happened on, whether it's raised by connect or by the operation.
+    """
+    devices = devices_at('COM1', 'COM2')
+
+    def connect(port):
+        if port in devices:
+            return devices[port]
+        return transports.connect(port)
+
+    def operation(session):
+        files = session.ls()
+        if files == ['COM2.py']:
+            raise KeyError('COM2.py')
+        return files
+    results = microfs.fleet(operation, ['COM1', 'COM2', 'carrier-pigeon://'],
+                            connect=connect)
+    assert results['COM1'].result == ['COM1.py']
+    assert isinstance(results['COM2'].result, KeyError)
+    assert isinstance(results['carrier-pigeon://'].result, ValueError)
+    assert not devices['COM2'].is_open
+
+
+def test_fleet_without_devices():
+    """
+    If no devices are connected an IOError is raised.
+    """
+    with mock.patch('mu.contrib.microfs.find_upython_devices',
+                    return_value=[]):
+        with pytest.raises(IOError):
+            microfs.fleet(microfs.ls)
+
+
+def test_main_all(tmpdir):
+    """
+    With --all the command runs on every connected device, and the outcome
+    is printed for each. Files got from each device are kept apart.
+    """
+    devices = devices_at('COM1', 'COM2')
+    with tmpdir.as_cwd(), \
+            mock.patch('mu.contrib.microfs.find_upython_devices',
+                       return_value=['COM1', 'COM2']), \
+            mock.patch('mu.contrib.transports.connect',
+                       side_effect=lambda port, *args, **kwargs:
+                       devices[port]), \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['ls', '--all'])
+        printed = [call[0][0] for call in mock_print.call_args_list]
+        assert printed[0].startswith('COM1 (')
+        assert printed[1] == 'COM1.py'
+        assert printed[2].startswith('COM2 (')
+        assert printed[3] == 'COM2.py'
+        microfs.main(['get', 'COM1.py', '--all'])
+    assert tmpdir.join('COM1', 'COM1.py').exists()
+    assert not tmpdir.join('COM2', 'COM1.py').exists()
+
+
+def test_main_several_ports():
+    """
+    Given --port more than once, the command runs on each of those devices,
+    and a device that fails is reported without stopping the others.
+    """
+    devices = devices_at('COM1', 'COM2')
+
+    def connect(port, *args, **kwargs):
+        if port not in devices:
+            raise IOError('No such port.')
+        return devices[port]
+    with mock.patch('mu.contrib.transports.connect', side_effect=connect), \
+            mock.patch('builtins.print') as mock_print:
+        microfs.main(['rm', 'COM2.py', '--port', 'COM2', '--port', 'COM3',
+                      '--port', 'COM1'])
+    printed = [call[0][0] for call in mock_print.call_args_list]
+    assert printed[0].startswith('COM2 (')
+    assert printed[1].startswith('COM3 (')
+    assert str(printed[2]) == 'No such port.'
+    assert printed[3].startswith('COM1 (')
+    assert printed[4] == 'COM2.py: Could not remove COM2.py.'
+    assert 'COM2.py' not in devices['COM2'].files
+    assert 'COM1.py' in devices['COM1'].files
+
+
+def connector(device):
+    """
+    Returns a stand-in for microfs.get_serial that opens a new link to the
+    device each time, and the list of the links it opened.
+    """
+    links = []
+
+    def get_serial(port=None, baudrate=None):
+        links.append(LoopbackTransport(device))
+        return links[-1]
+    return get_serial, links
+
+
+def test_session_reconnects_after_the_link_fails():
+    """
+    Once the port fails the session releases it and forgets what it knew, so
+    the next operation connects again.
+    """
+    device = SimulatedDevice(files={'a.py': b'x = 1\n'})
+    get_serial, links = connector(device)
+    with mock.patch('mu.contrib.microfs.get_serial', get_serial):
+        session = microfs.MicroFSSession()
+        assert session.ls() == ['a.py']
+        links[0].send = mock.MagicMock(side_effect=IOError('Gone.'))
+        with pytest.raises(IOError):
+            session.ls(refresh=True)
+        assert session.serial is None
+        assert session.files is None
+        assert not session.raw
+        assert session.ls() == ['a.py']
+        assert len(links) == 2
+        session.close()
+
+
+def test_session_keeps_the_link_after_a_device_error():
+    """
+    An error reported by the device leaves the port open.
+    """
+    device = SimulatedDevice()
+    get_serial, links = connector(device)
+    with mock.patch('mu.contrib.microfs.get_serial', get_serial):
+        with microfs.MicroFSSession() as session:
+            with pytest.raises(IOError):
+                session.rm('missing.py')
+            with pytest.raises(microfs.DeviceError):
+                list(session.execute_iter('import missing'))
+            assert session.serial is links[0]
+            assert session.ls() == []
+    assert len(links) == 1
+
+
+def test_session_recovers_from_a_reset_device(tmpdir):
+    """
+    If the device is reset while the session is in raw mode, the helper
+    module is loaded again and the command retried, and the cached listing
+    is forgotten.
+    """
+    device = SimulatedDevice(files={'a.py': b'x = 1\n'})
+    with microfs.MicroFSSession(device) as session:
+        assert session.ls() == ['a.py']
+        assert session.has_helper()
+        device.reset()
+        device.files['b.py'] = b'y = 2\n'
+        assert session.files is not None
+        assert session.ls(refresh=True) == ['a.py', 'b.py']
+        device.reset()
+        target = str(tmpdir.join('b.py'))
+        assert session.get('b.py', target)
+        assert tmpdir.join('b.py').read_binary() == b'y = 2\n'
+        device.reset()
+        session.ls()
+        assert session.rm('a.py')
+        assert session.ls(refresh=True) == ['b.py']
+
+
+def test_session_restart_after_a_reboot_message():
+    """
+    Output that shows the device rebooted makes the session enter raw mode
+    again and forget the cached listing.
+    """
+    device = SimulatedDevice()
+    with microfs.MicroFSSession(device, helper=False) as session:
+        session.ls()
+        with mock.patch.object(session, 'restart',
+                               wraps=session.restart) as restart:
+            out, err = session.execute(["print('MPY: soft reboot')"])
+        assert restart.call_count == 1
+        assert out == b'MPY: soft reboot\r\n'
+        assert session.files is None
+
+
+def test_DeadlineSerial_read_until_without_a_time_limit():
+    """
+    With no time limit, read_until returns what arrived once the serial
+    object's read times out, rather than waiting for ever.
+    """
+    device = SimulatedDevice(timeout=0.01)
+    device.output.extend(b'partial')
+    serial = microfs.DeadlineSerial(device, microfs.Deadline())
+    assert serial.read_until(b'\x04>') == b'partial'
+    assert serial.received == b'partial'
+
+
+def test_DeadlineSerial_read_until_times_out():
+    """
+    With a time limit, read_until keeps waiting for the expected bytes until
+    the deadline passes.
+    """
+    device = SimulatedDevice(timeout=0.01)
+    device.output.extend(b'partial')
+    serial = microfs.DeadlineSerial(device, microfs.Deadline(0.05))
+    with pytest.raises(microfs.OperationTimeout) as ex:
+        serial.read_until(b'\x04>')
+    assert ex.value.output == b'partial'
+
+
+def test_DeadlineSerial_keeps_only_the_last_of_the_output():
+    """
+    However much is read, only the last of it is kept for the output of an
+    OperationTimeout.
+    """
+    device = SimulatedDevice(timeout=0.01)
+    device.output.extend(b'x' * 10000 + b'tail')
+    deadline = microfs.Deadline(10)
+    serial = microfs.DeadlineSerial(device, deadline)
+    while serial.read(100):
+        assert len(serial.received) <= 2 * microfs.OUTPUT_SIZE
+    assert serial.received.endswith(b'tail')
+    deadline.cancel()
+    with pytest.raises(microfs.OperationCancelled) as ex:
+        serial.read(1)
+    assert len(ex.value.output) == microfs.OUTPUT_SIZE
+    assert ex.value.output.endswith(b'tail')
+
+
+class TimeoutDevice(SimulatedDevice):
+    """
+    A simulated device that records every timeout it's set to.
+    """
+
+    timeouts = None
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        if self.timeouts is None:
+            self.timeouts = []
+        else:
+            self.timeouts.append(timeout)
+        self._timeout = timeout
+
+
+def test_DeadlineSerial_read_leaves_a_short_enough_timeout_alone():
+    """
+    The serial object's timeout is only changed for a read that would
+    otherwise outlast the deadline, and is then put back.
+    """
+    device = TimeoutDevice(timeout=0.01)
+    serial = microfs.DeadlineSerial(device, microfs.Deadline(10))
+    assert serial.read(1) == b''
+    assert serial.read(1) == b''
+    assert device.timeouts == []
+    device.timeout = 1
+    serial = microfs.DeadlineSerial(device, microfs.Deadline(0.01))
+    assert serial.read(1) == b''
+    assert len(device.timeouts) == 3
+    assert device.timeouts[1] <= 0.01
+    assert device.timeout == 1
+
+
+class GarblingDevice(SimulatedDevice):
+    """
+    A simulated device on which the first few commands (or all of them, if
+    times is None) that contain target and are longer than longer_than bytes
+    arrive garbled, with target replaced, as if the UART buffer overflowed.
+    """
+
+    def __init__(self, target, replacement, times=None, longer_than=0,
+                 **kwargs):
+        super(GarblingDevice, self).__init__(**kwargs)
+        self.target = target
+        self.replacement = replacement
+        self.times = times
+        self.longer_than = longer_than
+
+    def run(self, header=b'OK'):
+        line = bytes(self.line)
+        garble = self.times != 0 and len(line) > self.longer_than
+        if garble and self.target in line:
+            self.line = bytearray(line.replace(self.target, self.replacement))
+            if self.times is not None:
+                self.times -= 1
+        super(GarblingDevice, self).run(header)
+
+
+def test_put_retries_a_garbled_header(tmpdir):
+    """
+    A header that keeps arriving garbled in a long submission, failing with
+    a NameError, is sent again on its own and the file is written.
+    """
+    device = GarblingDevice(b'open(', b'pen(', longer_than=200,
+                            raw_paste=False, uart_buffer=40)
+    local = tmpdir.join('big.py')
+    content = bytes(bytearray(range(256))) * 8
+    local.write_binary(content)
+    with microfs.MicroFSSession(LoopbackTransport(device),
+                                helper=False) as session:
+        assert session.put(str(local))
+    assert device.files['big.py'] == content
+
+
+def test_write_file_retries_a_garbled_import():
+    """
+    An ImportError that isn't about ubinascii itself being missing is taken
+    to be garbling, so the header is sent again rather than giving up.
+    """
+    device = GarblingDevice(b'ubinascii', b'ubinasci', times=1,
+                            raw_paste=False)
+    with microfs.MicroFSSession(LoopbackTransport(device),
+                                helper=False) as session:
+        assert microfs.write_file(session, 'a.py', b'x = 1\n',
+                                  'base64') is None
+    assert device.files['a.py'] == b'x = 1\n'
+
+
+def test_write_file_gives_up_after_retries():
+    """
+    A header that's garbled every time is given up on after RETRIES tries.
+    """
+    device = GarblingDevice(b'open(', b'pen(', raw_paste=False)
+    with microfs.MicroFSSession(LoopbackTransport(device),
+                                helper=False) as session:
+        err = microfs.write_file(session, 'a.py', b'x = 1\n')
+    assert b'NameError' in err
+
+
+def test_probe_baudrate_finds_the_device_rate():
+    """
+    The port is opened once and the first rate the device answers at is
+    returned.
+    """
+    device = SimulatedDevice(baudrate=115200, uart_baudrate=230400)
+    connect = mock.MagicMock(return_value=LoopbackTransport(device))
+    assert microfs.probe_baudrate('loop://', connect=connect) == 230400
+    assert connect.call_count == 1
+
+
+def test_probe_baudrate_tries_the_preferred_rate_first():
+    """
+    The preferred rate is tried before the rest, so nothing else is tried
+    when the device answers at it.
+    """
+    device = SimulatedDevice(baudrate=115200, uart_baudrate=57600)
+    link = LoopbackTransport(device)
+    rates = []
+    original = device.write
+
+    def write(data):
+        rates.append(device.baudrate)
+        return original(data)
+    device.write = write
+    connect = mock.MagicMock(return_value=link)
+    assert microfs.probe_baudrate('loop://', connect=connect,
+                                  preferred=57600) == 57600
+    assert set(rates) == {57600}
+
+
+def test_probe_baudrate_no_answer():
+    """
+    If the device doesn't answer at any of the rates, None is returned.
+    """
+    device = SimulatedDevice(baudrate=115200, uart_baudrate=9600)
+    connect = mock.MagicMock(return_value=LoopbackTransport(device))
+    assert microfs.probe_baudrate('loop://', rates=(230400, 115200),
+                                  connect=connect) is None
+
+
+def test_probe_baudrate_link_without_a_baud_rate():
+    """
+    Links with no baud rate to set (such as loop:// or a socket) aren't
+    probed. The rate they were opened at is returned.
+    """
+    assert microfs.probe_baudrate('loop://') == 115200
+    assert microfs.probe_baudrate('loop://', preferred=230400) == 230400
+    socket = mock.MagicMock(spec=['write', 'read', 'close'])
+    connect = mock.MagicMock(return_value=socket)
+    assert microfs.probe_baudrate('socket://localhost:2217',
+                                  connect=connect) == 115200
+    assert socket.write.call_count == 0
+    socket.close.assert_called_once_with()
+
+
+def test_put_chunk_size(tmpdir):
+    """
+    The chunk size given to put is used instead of the encoding's default,
+    which is left alone.
+    """
+    device = SimulatedDevice()
+    local = tmpdir.join('a.bin')
+    content = bytes(bytearray(range(200)))
+    local.write_binary(content)
+    defaults = dict(microfs.CHUNK_SIZES)
+    with mock.patch('mu.contrib.microfs.encode_chunk',
+                    wraps=microfs.encode_chunk) as encode:
+        with microfs.MicroFSSession(LoopbackTransport(device),
+                                    helper=False) as session:
+            assert session.put(str(local), chunk_size=64)
+    assert [len(call[0][0]) for call in encode.call_args_list] == [
+        64, 64, 64, 8]
+    assert device.files['a.bin'] == content
+    assert microfs.CHUNK_SIZES == defaults
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the transports microfs uses to reach a device.
+"""
+import os
+import socket
+import sys
+import threading
+import time
+import pytest
+from unittest import mock
+from mu.contrib import microfs, transports
+from mu.contrib.microsim import SimulatedDevice
+
+
+def test_check_baudrate():
+    """
+    Supported baud rates are kept, others fall back to the default.
+    """
+    assert transports.check_baudrate(921600) == 921600
+    assert transports.check_baudrate(12345) == transports.BAUDRATE
+    assert transports.check_baudrate('auto') == transports.BAUDRATE
+
+
+def test_connect_loop():
+    """
+    A loop:// URL gives a link to a new simulated device, which microfs can
+    use like a serial port.
+    """
+    with transports.connect('loop://', timeout=0.5) as link:
+        assert isinstance(link, transports.LoopbackTransport)
+        assert link.url == 'loop://'
+        assert link.port == 'sim'
+        assert microfs.ls(link) == []
+    assert not link.is_open
+
+
+def test_connect_serial():
+    """
+    A URL without a scheme, or with serial://, is a serial port.
+    """
+    with mock.patch('serial.Serial') as mock_serial:
+        link = transports.connect('/dev/ttyACM0', baudrate=921600)
+        assert isinstance(link, transports.SerialTransport)
+        mock_serial.assert_called_once_with('/dev/ttyACM0', 921600,
+                                            timeout=transports.POLL_INTERVAL,
+                                            parity='N')
+        link = transports.connect('serial:///dev/ttyACM0')
+        assert link.url == 'serial:///dev/ttyACM0'
+        assert link.port == '/dev/ttyACM0'
+
+
+def test_connect_serial_unsupported_baudrate():
+    """
+    If the port won't take the baud rate, the default is used instead.
+    """
+    stream = mock.MagicMock()
+    with mock.patch('serial.Serial',
+                    side_effect=[ValueError('No.'), stream]) as mock_serial:
+        link = transports.SerialTransport('COM3', 1000000)
+    assert link.stream is stream
+    assert mock_serial.call_args[0] == ('COM3', transports.BAUDRATE)
+
+
+def test_connect_serial_default_baudrate_fails():
+    """
+    If the port can't even be opened at the default rate, the error is
+    raised.
+    """
+    with mock.patch('serial.Serial', side_effect=IOError('No port.')):
+        with pytest.raises(IOError):
+            transports.SerialTransport('COM3')
+
+
+def test_connect_bad_urls():
+    """
+    A ValueError is raised for URLs that aren't understood.
+    """
+    with pytest.raises(ValueError):
+        transports.connect('carrier-pigeon://home')
+    with pytest.raises(ValueError):
+        transports.connect('socket://localhost')
+    with pytest.raises(ValueError):
+        transports.connect('socket://:23')
+
+
+def test_read_and_read_until():
+    """
+    Reads are served from what's buffered, and stop once the timeout passes.
+    """
+    device = SimulatedDevice(timeout=0)
+    link = transports.LoopbackTransport(device, timeout=0.05)
+    device.output.extend(b'one\r\ntwo\r\nthree')
+    assert link.in_waiting == 15
+    assert link.read(2) == b'on'
+    assert link.read_until(b'\r\n') == b'e\r\n'
+    assert link.read_until(b'\r\n', size=2) == b'tw'
+    assert link.read_until(b'\r\n') == b'o\r\n'
+    assert link.read_until(b'\r\n') == b'three'
+    assert link.read(1) == b''
+    device.output.extend(b'stale')
+    link.reset_input_buffer()
+    assert link.in_waiting == 0
+
+
+def test_stream_timeout_is_set_once():
+    """
+    The stream's timeout (which reconfigures a serial port when it's set) is
+    set to the poll interval once, and the transport's own timeout is
+    enforced by reading the stream again until it passes.
+    """
+    stream = mock.MagicMock(in_waiting=0)
+    stream.read.return_value = b''
+    timeout = mock.PropertyMock(return_value=None)
+    type(stream).timeout = timeout
+    link = transports.StreamTransport('loop://', stream, timeout=0.2)
+    timeout.assert_called_with(transports.POLL_INTERVAL)
+    timeout.return_value = transports.POLL_INTERVAL
+    start = time.time()
+    assert link.read(1) == b''
+    assert link.read_until(b'>') == b''
+    assert time.time() - start >= 0.4
+    assert stream.read.call_count > 2
+    assert len([c for c in timeout.call_args_list if c[0]]) == 1
+
+
+def test_baudrate():
+    """
+    The baud rate is that of the underlying stream (None if it has none) and
+    can be changed.
+    """
+    device = SimulatedDevice(baudrate=115200)
+    link = transports.LoopbackTransport(device)
+    assert link.baudrate == 115200
+    link.baudrate = 230400
+    assert device.baudrate == 230400
+    assert transports.LoopbackTransport().baudrate is None
+
+
+@pytest.fixture
+def server():
+    """
+    A TCP server on localhost that echoes whatever a single client sends,
+    until the client sends b'bye'.
+    """
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(1)
+
+    def serve():
+        connection, _ = listener.accept()
+        while True:
+            data = connection.recv(1024)
+            if not data or data == b'bye':
+                break
+            connection.sendall(data)
+        connection.close()
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    yield listener.getsockname()[1]
+    listener.close()
+    thread.join(1)
+
+
+def test_socket_transport(server):
+    """
+    A socket:// URL connects over TCP, and the end of the connection is an
+    IOError.
+    """
+    url = 'socket://127.0.0.1:{}'.format(server)
+    link = transports.connect(url, timeout=1)
+    assert isinstance(link, transports.SocketTransport)
+    assert link.url == url
+    assert link.port == '127.0.0.1:{}'.format(server)
+    link.write(b'hello\r\n')
+    assert link.read_until(b'\r\n') == b'hello\r\n'
+    link.write(b'bye')
+    with pytest.raises(IOError):
+        link.read(1)
+    link.close()
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX only')
+def test_pty_transport():
+    """
+    A pty: URL runs the command attached to a pseudo terminal, such as a
+    simulated device.
+    """
+    command = 'pty:{} -m mu.contrib.microsim'.format(sys.executable)
+    link = transports.connect(command, timeout=2)
+    assert isinstance(link, transports.PtyTransport)
+    try:
+        assert microfs.ls(link) == []
+    finally:
+        link.close()
+    assert link.process.poll() is not None
+
+
+def test_transport_pool():
+    """
+    A transport from a pool goes back to it when closed and is reused, until
+    the pool is cleared.
+    """
+    pool = transports.TransportPool()
+    link = pool.connect('loop://', timeout=0.5)
+    assert link.pool is pool
+    link.close()
+    assert not link.is_open
+    again = pool.connect('loop://')
+    assert again is link
+    assert again.is_open
+    other = pool.connect('loop://')
+    assert other is not link
+    again.close()
+    other.close()
+    with mock.patch.object(transports.LoopbackTransport,
+                           'disconnect') as disconnect:
+        pool.clear()
+    assert disconnect.call_count == 2
+    assert pool.connect('loop://') not in (link, other)
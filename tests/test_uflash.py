@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for uflash's handling of Intel HEX, of the MicroPython runtime and
+of its cache of built hex files.
+"""
+import gzip
+import os
+import sys
+import pytest
+from unittest import mock
+from mu.contrib import uflash, uflashbench
+
+
+SCRIPT = b'from microbit import *\ndisplay.scroll("Hello, World!")\n'
+
+
+def test_get_runtime():
+    """
+    The runtime is read from the gzipped file the first time it's asked for,
+    and remembered after that.
+    """
+    with mock.patch('mu.contrib.uflash._runtime', None), \
+            mock.patch('gzip.open', wraps=gzip.open) as gzip_open:
+        runtime = uflash.get_runtime()
+        assert uflash.get_runtime() is runtime
+    gzip_open.assert_called_once_with(uflash._RUNTIME_FILE, 'rb')
+    assert runtime.startswith(':020000040000FA\n')
+    assert runtime.endswith('\n')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='Module __getattr__ needs Python 3.7.')
+def test_runtime_attribute():
+    """
+    The old _RUNTIME attribute is still the runtime, and other missing
+    attributes still raise an AttributeError.
+    """
+    assert uflash._RUNTIME == uflash.get_runtime()
+    assert not hasattr(uflash, '_NO_SUCH_THING')
+
+
+def test_hexlify_leaves_the_runtime_unloaded():
+    """
+    Turning a script into hex doesn't need the runtime.
+    """
+    with mock.patch('mu.contrib.uflash._runtime', None):
+        assert uflash.hexlify(SCRIPT)
+        assert uflash._runtime is None
+
+
+def test_hexlify_unhexlify_round_trip():
+    """
+    A script survives being turned into hex records and back.
+    """
+    blob = uflash.hexlify(SCRIPT)
+    assert blob.startswith(':020000040003F7\n:10E00000')
+    assert uflash.unhexlify(blob) == SCRIPT.decode('utf-8')
+    assert uflash.hexlify(b'') == ''
+
+
+@pytest.mark.parametrize('size', [1, 15, 16, 17, 1000, 8000])
+def test_hexlify_matches_the_record_at_a_time_version(size):
+    """
+    Converting all of a script at once gives exactly the records (and the
+    script back) that converting a record at a time did.
+    """
+    script = uflashbench.script_of(size)
+    blob = uflash.hexlify(script)
+    assert blob == uflashbench.hexlify_records(script)
+    assert uflash.unhexlify(blob) == uflashbench.unhexlify_records(blob)
+
+
+def test_uflashbench():
+    """
+    Both versions of each conversion are timed for each script size.
+    """
+    results = uflashbench.run(sizes=(100, ), repeat=1)
+    assert [(r.operation, r.size) for r in results] == [
+        ('hexlify', 100), ('unhexlify', 100)]
+    assert len(uflashbench.report(results).splitlines()) == 3
+
+
+def test_embed_hex():
+    """
+    The script's records go two records from the end of the runtime.
+    """
+    runtime = ':01\n:02\n:03\n:04\n'
+    assert uflash.embed_hex(runtime, ':AA\n:BB') == (
+        ':01\n:02\n:AA\n:BB\n:03\n:04\n')
+    assert uflash.embed_hex(runtime) == runtime
+
+
+def test_parse_runtime_remembers_recent_runtimes():
+    """
+    A runtime is only split once, and only the last few are remembered.
+    """
+    with mock.patch.dict('mu.contrib.uflash._parsed_runtimes', clear=True):
+        parsed = uflash.parse_runtime(':01\n:02\n:03\n')
+        assert parsed == (':01\n', ':02\n:03\n')
+        assert uflash.parse_runtime(':01\n:02\n:03\n') is parsed
+        for i in range(uflash._PARSED_RUNTIMES_SIZE):
+            uflash.parse_runtime(':0{}\n:02\n:03\n'.format(i + 4))
+        assert ':01\n:02\n:03\n' not in uflash._parsed_runtimes
+        assert len(uflash._parsed_runtimes) == uflash._PARSED_RUNTIMES_SIZE
+
+
+def test_read_runtime(tmpdir):
+    """
+    A runtime file is only read again once it's been modified.
+    """
+    path = tmpdir.join('runtime.hex')
+    path.write(':01\n')
+    with mock.patch.dict('mu.contrib.uflash._runtime_files', clear=True):
+        runtime = uflash.read_runtime(str(path))
+        assert runtime == ':01\n'
+        assert uflash.read_runtime(str(path)) is runtime
+        path.write(':02\n')
+        path.setmtime(path.mtime() + 10)
+        assert uflash.read_runtime(str(path)) == ':02\n'
+
+
+def test_parse_records():
+    """
+    Each record is parsed with its absolute address, taking into account
+    the extended address records before it.
+    """
+    lines = [
+        ':020000040003F7',
+        '',
+        ':0400100001020304E2',
+        ':020000021000EC',
+        ':02000000AABB99',
+    ]
+    records = list(uflash.parse_records(lines))
+    assert records == [
+        uflash.HexRecord(4, 0x30000, b'\x00\x03'),
+        uflash.HexRecord(0, 0x30010, b'\x01\x02\x03\x04'),
+        uflash.HexRecord(2, 0x10000, b'\x10\x00'),
+        uflash.HexRecord(0, 0x10000, b'\xaa\xbb'),
+    ]
+
+
+def test_parse_records_malformed():
+    """
+    Lines that aren't records, or whose checksum is wrong, raise a
+    ValueError.
+    """
+    with pytest.raises(ValueError):
+        list(uflash.parse_records(['hello']))
+    with pytest.raises(ValueError):
+        list(uflash.parse_records([':0400100001020304E3']))
+    with pytest.raises(ValueError):
+        list(uflash.parse_records([':0400100001020304']))
+
+
+def test_index_hex_and_read_range():
+    """
+    The data records are indexed by address, and a range is read up to the
+    first gap.
+    """
+    address_map = uflash.index_hex(uflash.hexlify(SCRIPT).splitlines())
+    assert min(address_map) == uflash._SCRIPT_ADDR
+    assert all(len(data) == 16 for data in address_map.values())
+    data = uflash.read_range(address_map, uflash._SCRIPT_ADDR,
+                             uflash._SCRIPT_ADDR + 6)
+    assert data == b'MP' + bytes(bytearray([len(SCRIPT), 0])) + b'fr'
+    del address_map[uflash._SCRIPT_ADDR + 16]
+    data = uflash.read_range(address_map, uflash._SCRIPT_ADDR,
+                             uflash._SCRIPT_ADDR + 64)
+    assert len(data) == 16
+
+
+def test_extract_script():
+    """
+    The script embedded in a runtime is found by its address, and there's
+    no script to find in the runtime on its own or in a malformed hex.
+    """
+    runtime = uflash.get_runtime()
+    embedded = uflash.embed_hex(runtime, uflash.hexlify(SCRIPT))
+    assert uflash.extract_script(embedded) == SCRIPT.decode('utf-8')
+    assert uflash.extract_script(runtime) == ''
+    assert uflash.extract_script(':020000040003F7\nnonsense\n') == ''
+
+
+def test_HexCache_put_and_get(tmpdir):
+    """
+    A hex file put in the cache is found again by its key, which depends on
+    both the script and the runtime.
+    """
+    cache = uflash.HexCache(str(tmpdir.join('cache')))
+    key = cache.key(SCRIPT)
+    assert key != cache.key(SCRIPT + b'\n')
+    runtime = tmpdir.join('runtime.hex')
+    runtime.write(':00000001FF\n')
+    assert key != cache.key(SCRIPT, str(runtime))
+    assert cache.get(key) is None
+    cache.put(key, ':00000001FF\n')
+    path = cache.get(key)
+    assert path == cache.path(key)
+    with open(path) as cached:
+        assert cached.read() == ':00000001FF\n'
+
+
+def test_HexCache_evicts_least_recently_used(tmpdir):
+    """
+    Once the cache is too big the least recently used files are removed.
+    """
+    cache = uflash.HexCache(str(tmpdir), max_size=250)
+    cache.put('a', 'x' * 100)
+    cache.put('b', 'x' * 100)
+    # Make the order of use clear, whatever the file system's clock.
+    os.utime(cache.path('a'), (1, 1))
+    os.utime(cache.path('b'), (2, 2))
+    assert cache.get('a') is not None
+    cache.put('c', 'x' * 100)
+    assert sorted(os.listdir(str(tmpdir))) == ['a.hex', 'c.hex']
+
+
+def test_flash_uses_the_cache(tmpdir):
+    """
+    The hex built for a script is cached and, next time, copied from the
+    cache without being built again.
+    """
+    script = tmpdir.join('foo.py')
+    script.write_binary(SCRIPT)
+    microbit = tmpdir.mkdir('MICROBIT')
+    cache = uflash.HexCache(str(tmpdir.join('cache')))
+    uflash.flash(str(script), str(microbit), cache=cache)
+    flashed = microbit.join('micropython.hex').read()
+    assert uflash.extract_script(flashed) == SCRIPT.decode('utf-8')
+    assert cache.get(cache.key(SCRIPT)) is not None
+    microbit.join('micropython.hex').remove()
+    with mock.patch('mu.contrib.uflash.embed_hex') as embed_hex:
+        uflash.flash(str(script), str(microbit), cache=cache)
+    assert embed_hex.call_count == 0
+    assert microbit.join('micropython.hex').read() == flashed
+
+
+def test_flash_saves_before_caching(tmpdir):
+    """
+    The hex file is flashed before it's cached, and a cache that can't be
+    written to doesn't stop it being flashed.
+    """
+    script = tmpdir.join('foo.py')
+    script.write_binary(SCRIPT)
+    microbit = tmpdir.mkdir('MICROBIT')
+    cache = uflash.HexCache(str(tmpdir.join('cache')))
+
+    def put(key, hex_file):
+        assert microbit.join('micropython.hex').check()
+        raise OSError(28, 'No space left on device')
+
+    with mock.patch.object(cache, 'put', side_effect=put) as cache_put, \
+            mock.patch('mu.contrib.uflash.logger') as logger:
+        uflash.flash(str(script), str(microbit), cache=cache)
+    assert cache_put.call_count == 1
+    assert logger.warning.call_count == 1
+    flashed = microbit.join('micropython.hex').read()
+    assert uflash.extract_script(flashed) == SCRIPT.decode('utf-8')
+
+
+def test_HexCache_put_removes_the_temporary_file(tmpdir):
+    """
+    If a hex file can't be cached, no temporary file is left behind.
+    """
+    cache = uflash.HexCache(str(tmpdir))
+    with mock.patch('os.replace', side_effect=OSError(13, 'Denied')):
+        with pytest.raises(OSError):
+            cache.put('a', ':00000001FF\n')
+    assert tmpdir.listdir() == []